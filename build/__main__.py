@@ -35,6 +35,11 @@ build_group.add_argument(
     action='append', dest='metadata', default=[],
     help='Absolute or relative path to metadata package. Multiple allowed. ' +
     'Will build in order added to command line.')
+build_group.add_argument(
+    "--no-docstrings",
+    action="store_false", dest="docstrings", default=True,
+    help="Leave the documentation of functions, attributes and enums out of the generated Python modules. " +
+    "It is still in the generated rst documentation. Makes the modules smaller and faster to import.")
 utility_group = parser.add_argument_group("Utility")
 utility_group.add_argument(
     "--template",
@@ -70,6 +75,7 @@ for m in args.metadata:
 
     template_params = {}
     template_params['metadata'] = metadata
+    template_params['docstrings'] = args.docstrings
 
     logging.debug(pp.pformat(template_params))
 
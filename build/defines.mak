@@ -34,7 +34,7 @@ VPATH = $(TEMPLATE_DIR)
 
 PYTHON_CMD ?= python3
 define GENERATE_SCRIPT
-$(PYTHON_CMD) -m build --template $1 --dest-dir $2 --metadata $3 $(if $(PRINT),-v,)
+$(PYTHON_CMD) -m build --template $1 --dest-dir $2 --metadata $3 $(if $(PRINT),-v,) $(if $(NO_DOCSTRINGS),--no-docstrings,)
 endef
 
 ifeq (,$(PRINT))
@@ -55,12 +55,17 @@ DEFAULT_PY_FILES_TO_GENERATE := \
     library.py \
     library_singleton.py \
     session.py \
+    simulator.py \
     errors.py \
     tests/mock_helper.py \
     tests/matchers.py \
     __init__.py \
 
 DEFAULT_PY_FILES_TO_COPY := \
+    _converters.py \
+    _simulation.py \
+    call_stats.py \
+    state_transitions.py \
     visatype.py \
 
 DEFAULT_RST_FILES_TO_GENERATE := \
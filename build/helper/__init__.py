@@ -1,8 +1,12 @@
+from build.helper.codegen_helper import get_array_type_default  # noqa: F401
 from build.helper.codegen_helper import get_ctype_variable_declaration_snippet  # noqa: F401
 from build.helper.codegen_helper import get_dictionary_snippet  # noqa: F401
 from build.helper.codegen_helper import get_enum_type_check_snippet  # noqa: F401
 from build.helper.codegen_helper import get_method_return_snippet  # noqa: F401
+from build.helper.codegen_helper import get_into_method_function  # noqa: F401
 from build.helper.codegen_helper import get_params_snippet  # noqa: F401
+from build.helper.codegen_helper import get_python_implementation_call_snippet  # noqa: F401
+from build.helper.codegen_helper import has_into_method  # noqa: F401
 
 from build.helper.parameter_usage_options import ParameterUsageOptions  # noqa: F401
 
@@ -24,6 +28,7 @@ from build.helper.metadata_filters import filter_codegen_attributes  # noqa: F40
 from build.helper.metadata_filters import filter_codegen_functions  # noqa: F401
 from build.helper.metadata_filters import filter_ivi_dance_parameter  # noqa: F401
 from build.helper.metadata_filters import filter_len_parameter  # noqa: F401
+from build.helper.metadata_filters import filter_library_functions  # noqa: F401
 from build.helper.metadata_filters import filter_parameters  # noqa: F401
 
 from build.helper.metadata_find import find_custom_type  # noqa: F401
@@ -2,6 +2,7 @@ from .metadata_filters import filter_parameters
 from .metadata_find import find_custom_type
 from .metadata_find import find_size_parameter
 from .parameter_usage_options import ParameterUsageOptions
+import copy
 import pprint
 
 pp = pprint.PrettyPrinter(indent=4)
@@ -11,30 +12,37 @@ _parameterUsageOptionsSnippet = {}
 _parameterUsageOptionsSnippet[ParameterUsageOptions.SESSION_METHOD_DECLARATION] = {
     'skip_self': False,
     'name_to_use': 'python_name_with_default',
+    'include_array_type': True,
 }
 _parameterUsageOptionsSnippet[ParameterUsageOptions.SESSION_METHOD_CALL] = {
     'skip_self': True,
     'name_to_use': 'python_name',
+    'include_array_type': False,
 }
 _parameterUsageOptionsSnippet[ParameterUsageOptions.DOCUMENTATION_SESSION_METHOD] = {
     'skip_self': True,
     'name_to_use': 'python_name_with_doc_default',
+    'include_array_type': True,
 }
 _parameterUsageOptionsSnippet[ParameterUsageOptions.CTYPES_CALL] = {
     'skip_self': True,
     'name_to_use': 'python_name',
+    'include_array_type': False,
 }
 _parameterUsageOptionsSnippet[ParameterUsageOptions.LIBRARY_METHOD_CALL] = {
     'skip_self': True,
     'name_to_use': 'library_method_call_snippet',
+    'include_array_type': False,
 }
 _parameterUsageOptionsSnippet[ParameterUsageOptions.CTYPES_ARGTYPES] = {
     'skip_self': True,
     'name_to_use': 'ctypes_type_library_call',
+    'include_array_type': False,
 }
 _parameterUsageOptionsSnippet[ParameterUsageOptions.LIBRARY_METHOD_DECLARATION] = {
     'skip_self': False,
     'name_to_use': 'python_name',
+    'include_array_type': False,
 }
 # Only used for filtering
 #   ParameterUsageOptions.INPUT_PARAMETERS
@@ -64,6 +72,12 @@ def get_params_snippet(function, parameter_usage_options):
     # Render based on options
     for p in parameters_to_use:
             snippets.append(p[options_to_use['name_to_use']])
+
+    # array_type is a Python-only keyword argument, it doesn't correspond to any parameter of the C function
+    if options_to_use['include_array_type']:
+        array_type = get_array_type_default(function)
+        if array_type is not None:
+            snippets.append('array_type=\'{0}\''.format(array_type))
     return ', '.join(snippets)
 
 
@@ -81,7 +95,7 @@ def _get_output_param_return_snippet(output_parameter, parameters, config):
         module_name = c['file_name'] + '.'
 
     if output_parameter['enum'] is not None:
-        return_type_snippet = 'enums.' + output_parameter['enum'] + '('
+        return_type_snippet = 'enums._get_member(enums.' + output_parameter['enum'] + ', '
     else:
         return_type_snippet = module_name + output_parameter['python_type'] + '('
 
@@ -92,11 +106,22 @@ def _get_output_param_return_snippet(output_parameter, parameters, config):
         else:
             if output_parameter['size']['mechanism'] == 'fixed':
                 size = str(output_parameter['size']['value'])
+            elif output_parameter['size']['mechanism'] == 'python-code':
+                size = 'len(' + output_parameter['ctypes_variable_name'] + ')'
             else:
                 size_parameter = find_size_parameter(output_parameter, parameters)
                 size = size_parameter['ctypes_variable_name'] + val_suffix
 
-            snippet = '[' + return_type_snippet + output_parameter['ctypes_variable_name'] + '[i]) for i in range(' + size + ')]'
+            if output_parameter['array_type'] is not None:
+                # 'array_type' is a keyword argument of the Session method
+                snippet = '_converters.convert_from_ctypes_array(' + output_parameter['ctypes_variable_name'] + ', ' + size + ', ' + output_parameter['python_type'] + ', array_type)'
+            elif output_parameter['enum'] is not None:
+                # The numbers are copied once, and only become enum members when they are used
+                enum_type = 'enums.' + output_parameter['enum']
+                values = '_converters.convert_from_ctypes_array(' + output_parameter['ctypes_variable_name'] + ', ' + size + ', None, \'array\')'
+                snippet = '_converters.EnumArray(' + values + ', ' + enum_type + ', enums._members_by_value[' + enum_type + '])'
+            else:
+                snippet = '[' + return_type_snippet + output_parameter['ctypes_variable_name'] + '[i]) for i in range(' + size + ')]'
     else:
         snippet = return_type_snippet + output_parameter['ctypes_variable_name'] + val_suffix + ')'
 
@@ -129,14 +154,14 @@ def _get_buffer_parameter_for_size_parameter(parameter, parameters):
     return None
 
 
-def get_ctype_variable_declaration_snippet(parameter, parameters, config):
+def get_ctype_variable_declaration_snippet(parameter, parameters, config, indent=8):
     '''Returns python snippet that declares and initializes a ctypes variable for the parameter that can be passed to the Library.
 
     We've identified many different cases on how these need to be initialized based on the parameter:
-        1. Input session handle:                                        visatype.ViSession(self._vi)
-        2. Input repeated capability:                                   ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))
-        3. Input string:                                                ctypes.create_string_buffer(parameter_name.encode(self._encoding))
-        4. Input buffer (not string):                                   (visatype.ViInt32 * len(list))(*list)
+        1. Input session handle:                                        self._vi_ctype
+        2. Input repeated capability:                                   self._repeated_capability_ctype
+        3. Input string:                                                parameter_name.encode(self._encoding)
+        4. Input buffer (not string):                                   _converters.convert_to_ctypes_array(list, visatype.ViInt32)
         5. Input is size of input buffer:                               visatype.ViInt32(len(list))
         6. Input is size of output buffer with mechanism ivi-dance:     visatype.ViInt32()
         7. Input is size of output buffer with mechanism passed-in:     visatype.ViInt32(buffer_size)
@@ -146,6 +171,11 @@ def get_ctype_variable_declaration_snippet(parameter, parameters, config):
        11. Output buffer with mechanism ivi-dance:                      None
        12. Output buffer with mechanism passed-in:                      (visatype.ViInt32 * buffer_size)()
        13. Output scalar or enum:                                       visatype.ViInt32()
+       14. Input buffer filled in place (_into methods):                _converters.get_ctypes_array_for_buffer(buffer, visatype.ViInt32, 'buffer')
+       15. Output buffer with mechanism python-code:                    (visatype.ViInt32 * (python_code))()
+
+    Scalars with a 'reused_ctype' (cases 8, 9 and 13) get the ctypes object of the current thread from _scalar_ctypes instead,
+    and inputs then set its value.
     '''
 
     # First we need to determine the module. If it is a custom type then the module is the file associated with that type, otherwise 'visatype'
@@ -159,13 +189,28 @@ def get_ctype_variable_declaration_snippet(parameter, parameters, config):
     # Note that we append "# case x". It's ugly in the generated code but it's sooo useful for debugging code generation problems.
     if parameter['direction'] == 'in':
         if parameter['is_session_handle'] is True:
-            definition = '{0}.{1}(self._{2})  # case 1'.format(module_name, parameter['ctypes_type'], parameter['python_name'])
+            # Created when the session gets its handle
+            definition = 'self._{0}  # case 1'.format(parameter['ctypes_variable_name'])
         elif parameter['is_repeated_capability'] is True:
-            definition = 'ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2'
+            # Encoded once, when the session or repeated capability view is created
+            definition = 'self._repeated_capability_ctype  # case 2'
         elif parameter['type'] == 'ViChar':
-            definition = 'ctypes.create_string_buffer({0}.encode(self._encoding))  # case 3'.format(parameter['python_name'])
+            # The driver doesn't modify input strings, so it gets the NUL-terminated bytes object itself instead of a copy
+            definition = '{0}.encode(self._encoding)  # case 3'.format(parameter['python_name'])
+        elif parameter['is_buffer'] is True and parameter['into_method'] is True:
+            if parameter['size']['mechanism'] == 'python-code':
+                # Nothing tells the driver how big the buffer is, so make sure it can hold what the driver will write
+                definition = '_converters.get_ctypes_array_for_buffer({2}, {0}.{1}, \'{2}\', {3})  # case 14'.format(module_name, parameter['ctypes_type'], parameter['python_name'], parameter['size']['value'])
+            else:
+                # When buffers share a size parameter, it is the length of the first one, so the others must be at least as long
+                size_parameter = find_size_parameter(parameter, parameters)
+                sized_buffer_parameter = None if size_parameter is None else _get_buffer_parameter_for_size_parameter(size_parameter, parameters)
+                if sized_buffer_parameter is not None and sized_buffer_parameter is not parameter:
+                    definition = '_converters.get_ctypes_array_for_buffer({2}, {0}.{1}, \'{2}\', len({3}))  # case 14'.format(module_name, parameter['ctypes_type'], parameter['python_name'], sized_buffer_parameter['python_name'])
+                else:
+                    definition = '_converters.get_ctypes_array_for_buffer({2}, {0}.{1}, \'{2}\')  # case 14'.format(module_name, parameter['ctypes_type'], parameter['python_name'])
         elif parameter['is_buffer'] is True:
-            definition = '({0}.{1} * len({2}))(*{2})  # case 4'.format(module_name, parameter['ctypes_type'], parameter['python_name'], parameter['python_name'])
+            definition = '_converters.convert_to_ctypes_array({2}, {0}.{1})  # case 4'.format(module_name, parameter['ctypes_type'], parameter['python_name'])
         else:
             corresponding_buffer_parameter = _get_buffer_parameter_for_size_parameter(parameter, parameters)
             if corresponding_buffer_parameter is not None:
@@ -178,6 +223,10 @@ def get_ctype_variable_declaration_snippet(parameter, parameters, config):
                     else:
                         assert corresponding_buffer_parameter['size']['mechanism'] == 'passed-in', 'mechanism fixed-size makes no sense here! Check metadata'
                         definition = '{0}.{1}({2})  # case 7'.format(module_name, parameter['ctypes_type'], parameter['python_name'])
+            elif parameter['reused_ctype'] is not None:
+                value = parameter['python_name'] if parameter['enum'] is None else parameter['python_name'] + '.value'
+                case = 8 if parameter['enum'] is None else 9
+                definition = '_scalar_ctypes.{0}\n{1}{2}.value = {3}  # case {4}'.format(parameter['reused_ctype'], ' ' * indent, parameter['ctypes_variable_name'], value, case)
             elif parameter['enum'] is None:
                 definition = '{0}.{1}({2})  # case 8'.format(module_name, parameter['ctypes_type'], parameter['python_name'])
             else:
@@ -193,14 +242,65 @@ def get_ctype_variable_declaration_snippet(parameter, parameters, config):
             elif parameter['size']['mechanism'] == 'passed-in':
                 size_parameter = find_size_parameter(parameter, parameters)
                 definition = '({0}.{1} * {2})()  # case 12'.format(module_name, parameter['ctypes_type'], size_parameter['python_name'])
+            elif parameter['size']['mechanism'] == 'python-code':
+                definition = '({0}.{1} * ({2}))()  # case 15'.format(module_name, parameter['ctypes_type'], parameter['size']['value'])
             else:
                 assert False, 'Unknown mechanism: ' + str(parameter)
+        elif parameter['reused_ctype'] is not None:
+            definition = '_scalar_ctypes.{0}  # case 13'.format(parameter['reused_ctype'])
         else:
             definition = '{0}.{1}()  # case 13'.format(module_name, parameter['ctypes_type'])
 
     return parameter['ctypes_variable_name'] + ' = ' + definition
 
 
+def has_into_method(function):
+    '''Returns True if any output buffer of the function is marked into_method, i.e. the function also gets a '_into' Session method'''
+    return any(p['into_method'] for p in function['parameters'])
+
+
+def get_into_method_function(function):
+    '''Returns function metadata for the '_into' variant of a Session method.
+
+    Output buffers marked into_method become input parameters, allocated by the caller and filled in place by the
+    driver. Their size parameter, if any, is then computed from the length of that buffer, as with mechanism 'len'.
+    '''
+    assert has_into_method(function), pp.pformat(function)
+    into_function = copy.deepcopy(function)
+    into_function['python_name'] = function['python_name'] + '_into'
+    into_buffer_names = []
+    for p in into_function['parameters']:
+        if p['into_method']:
+            p['direction'] = 'in'
+            p['array_type'] = None
+            if p['size']['mechanism'] == 'passed-in':
+                p['size'] = {'mechanism': 'len', 'value': p['size']['value']}
+            into_buffer_names.append('**' + p['python_name'] + '**')
+
+    description = 'Same as {0}, but the driver writes {1} directly into a buffer you allocate, such as a numpy.ndarray or array.array. Nothing is copied and no list is created.'.format(function['python_name'], ', '.join(into_buffer_names))
+    if 'description' in function['documentation']:
+        description += '\n\n' + function['documentation']['description']
+    into_function['documentation']['description'] = description
+    return into_function
+
+
+def get_python_implementation_call_snippet(function):
+    '''Returns the call to the Python function that implements a Session method with no C function behind it, i.e. "_streaming.stream(self, channels)"'''
+    assert function['python_implementation'] is not None, pp.pformat(function)
+    parameters = [p['python_name'] for p in filter_parameters(function, ParameterUsageOptions.SESSION_METHOD_CALL)]
+    return '{0}({1})'.format(function['python_implementation'], ', '.join(['self'] + parameters))
+
+
+def get_array_type_default(function):
+    '''Returns the default value of the 'array_type' keyword argument of the Session method, or None if it has none
+
+    The keyword argument exists if any output buffer of the function has array_type set in the metadata.
+    '''
+    array_types = set([p['array_type'] for p in function['parameters'] if p['array_type'] is not None])
+    assert len(array_types) <= 1, 'All output buffers of a function must have the same array_type: ' + pp.pformat(function)
+    return array_types.pop() if len(array_types) == 1 else None
+
+
 def get_dictionary_snippet(d, indent=4):
     '''Returns a formatted dictionary'''
     d_str = pprint.pformat(d)
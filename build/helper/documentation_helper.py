@@ -1,5 +1,7 @@
 
 from .codegen_helper import filter_parameters
+from .codegen_helper import get_array_type_default
+from .codegen_helper import get_into_method_function
 from .codegen_helper import get_params_snippet
 from .parameter_usage_options import ParameterUsageOptions
 
@@ -305,11 +307,20 @@ def _format_type_for_rst_documentation(param, config):
     # it would end up as 'list of int'
     if param['type'] == 'ViChar' and param['is_buffer'] is True:
         p_type = 'string'
+    elif param['is_buffer'] is True and param['into_method'] is True and param['direction'] == 'in':
+        p_type = 'writable buffer of ' + p_type
+    elif param['is_buffer'] is True and param['array_type'] is not None and param['direction'] == 'out':
+        p_type = 'list, array.array or numpy.ndarray of ' + p_type
+    elif param['is_buffer'] is True and param['enum'] is not None and param['direction'] == 'out':
+        p_type = 'EnumArray of ' + p_type
     elif param['is_buffer'] is True:
         p_type = 'list of ' + p_type
     return p_type
 
 
+array_type_param_desc = '''Selects how arrays are returned: 'list', 'array' for array.array or 'numpy' for numpy.ndarray. A numpy.ndarray shares memory with the buffer filled by the driver, so nothing is copied.'''
+
+
 rep_cap_method_desc = '''
 This method requires repeated capabilities (usually channels). If called directly on the
 {0}.Session object, then the method will use all repeated capabilities in the session.
@@ -323,17 +334,26 @@ rep_cap_method_desc_rst = rep_cap_method_desc + '''
 '''
 
 
-def get_function_rst(fname, config, indent=0):
+def _filter_into_method_size_parameters(function, parameters):
+    '''Returns parameters without the size parameters of the buffers of an '_into' method, which are computed from the length of those buffers'''
+    size_parameter_names = [p['size']['value'] for p in function['parameters'] if p['into_method'] and p['size']['mechanism'] == 'len']
+    return [p for p in parameters if p['name'] not in size_parameter_names]
+
+
+def get_function_rst(fname, config, indent=0, into_method=False):
     '''Gets rst formatted documentation for given function
 
     Args:
         fname (str): Function name - key in function dictionary
         function (dict): function entry correcsponding to fname in function dictionary
+        into_method (bool): Document the '_into' variant of the function instead
 
     Returns:
         str: rst formatted documentation
     '''
     function = config['functions'][fname]
+    if into_method:
+        function = get_into_method_function(function)
     if function['has_repeated_capability'] is True:
         function['documentation']['tip'] = rep_cap_method_desc_rst.format(config['module_name'], function['python_name'], get_params_snippet(function, ParameterUsageOptions.DOCUMENTATION_SESSION_METHOD))
 
@@ -343,6 +363,8 @@ def get_function_rst(fname, config, indent=0):
     rst += get_documentation_for_node_rst(function, config, indent)
 
     input_params = filter_parameters(function, ParameterUsageOptions.INPUT_PARAMETERS)
+    if into_method:
+        input_params = _filter_into_method_size_parameters(function, input_params)
     if len(input_params) > 0:
         rst += '\n'
     for p in input_params:
@@ -352,6 +374,12 @@ def get_function_rst(fname, config, indent=0):
         p_type = _format_type_for_rst_documentation(p, config)
         rst += '\n' + (' ' * indent) + ':type {0}: '.format(p['python_name']) + p_type
 
+    if get_array_type_default(function) is not None:
+        if len(input_params) == 0:
+            rst += '\n'
+        rst += '\n' + (' ' * indent) + ':param array_type:' + '\n\n' + (' ' * (indent + 4)) + array_type_param_desc + '\n'
+        rst += '\n' + (' ' * indent) + ':type array_type: str'
+
     output_params = filter_parameters(function, ParameterUsageOptions.OUTPUT_PARAMETERS)
     if len(output_params) > 1:
         rst += '\n\n' + (' ' * indent) + ':rtype: tuple (' + ', '.join([p['python_name'] for p in output_params]) + ')\n\n'
@@ -376,6 +404,12 @@ def _format_type_for_docstring(param, config):
     # it would end up as 'list of int'
     if param['type'] == 'ViChar' and param['is_buffer'] is True:
         p_type = 'string'
+    elif param['is_buffer'] is True and param['into_method'] is True and param['direction'] == 'in':
+        p_type = 'writable buffer of ' + p_type
+    elif param['is_buffer'] is True and param['array_type'] is not None and param['direction'] == 'out':
+        p_type = 'list, array.array or numpy.ndarray of ' + p_type
+    elif param['is_buffer'] is True and param['enum'] is not None and param['direction'] == 'out':
+        p_type = 'EnumArray of ' + p_type
     elif param['is_buffer'] is True:
         p_type = 'list of ' + p_type
     return p_type
@@ -386,24 +420,29 @@ rep_cap_method_desc_docstring = rep_cap_method_desc + '''
 '''
 
 
-def get_function_docstring(fname, config, indent=0):
+def get_function_docstring(fname, config, indent=0, into_method=False):
     '''Gets formatted documentation for given function that can be used as a docstring
 
     Args:
         fname (str): Function name - key in function dictionary
         function (dict): function entry correcsponding to fname in function dictionary
+        into_method (bool): Document the '_into' variant of the function instead
 
     Returns:
         str: docstring formatted documentation
     '''
     docstring = ''
     function = config['functions'][fname]
+    if into_method:
+        function = get_into_method_function(function)
     if function['has_repeated_capability'] is True:
         function['documentation']['tip'] = rep_cap_method_desc_docstring.format(config['module_name'], function['python_name'], get_params_snippet(function, ParameterUsageOptions.DOCUMENTATION_SESSION_METHOD))
 
     docstring += get_documentation_for_node_docstring(function, config, indent)
 
     input_params = filter_parameters(function, ParameterUsageOptions.INPUT_PARAMETERS)
+    if into_method:
+        input_params = _filter_into_method_size_parameters(function, input_params)
     if len(input_params) > 0:
         docstring += '\n\n' + (' ' * indent) + 'Args:'
     for p in input_params:
@@ -412,6 +451,11 @@ def get_function_docstring(fname, config, indent=0):
         if len(ds) > 0:
             docstring += ' ' + ds
 
+    if get_array_type_default(function) is not None:
+        if len(input_params) == 0:
+            docstring += '\n\n' + (' ' * indent) + 'Args:'
+        docstring += '\n' + (' ' * (indent + 4)) + 'array_type (str): ' + array_type_param_desc
+
     output_params = filter_parameters(function, ParameterUsageOptions.OUTPUT_PARAMETERS)
     if len(output_params) > 0:
         docstring += '\n\n' + (' ' * indent) + 'Returns:'
@@ -545,7 +589,9 @@ config = {
                     'python_name_with_doc_default': 'vi',
                     'is_repeated_capability': False,
                     'is_session_handle': True,
-                    'library_method_call_snippet': 'self._vi'
+                    'library_method_call_snippet': 'self._vi',
+                    'into_method': False,
+                    'array_type': None,
                 },
                 {
                     'direction': 'in',
@@ -577,7 +623,9 @@ wanted to choose.''',
                     'python_name_with_doc_default': 'turtle_type',
                     'is_repeated_capability': False,
                     'is_session_handle': False,
-                    'library_method_call_snippet': 'turtle_type'
+                    'library_method_call_snippet': 'turtle_type',
+                    'into_method': False,
+                    'array_type': None,
                 },
                 {
                     'direction': 'out',
@@ -601,7 +649,9 @@ wanted to choose.''',
                     'python_name_with_doc_default': 'turtleId',
                     'is_repeated_capability': False,
                     'is_session_handle': False,
-                    'library_method_call_snippet': 'ctypes.pointer(turtleId_ctype)'
+                    'library_method_call_snippet': 'ctypes.pointer(turtleId_ctype)',
+                    'into_method': False,
+                    'array_type': None,
                 }
             ],
             'documentation': {
@@ -709,6 +759,16 @@ Returns:
     assert_rst_strings_are_equal(expected_function_docstring, actual_function_docstring)
 
 
+def test_filter_into_method_size_parameters():
+    function = {
+        'parameters': [
+            {'name': 'numSamples', 'into_method': False, 'size': {'mechanism': 'fixed', 'value': 1}},
+            {'name': 'waveform', 'into_method': True, 'size': {'mechanism': 'len', 'value': 'numSamples'}},
+        ],
+    }
+    assert _filter_into_method_size_parameters(function, function['parameters']) == [function['parameters'][1]]
+
+
 def test_get_rst_header_snippet():
     header = "This will be your method header"
     actual_rst_header = get_rst_header_snippet(header)
@@ -40,6 +40,7 @@ def get_python_type_for_api_type(api_type, config):
         'ViString': 'str',
         'ViConstString': 'str',
         'ViString': 'str',
+        'ViInt8': 'int',
         'ViInt16': 'int',
         'ViUInt16': 'int',
         'ViInt32': 'int',
@@ -38,7 +38,9 @@ def _add_python_parameter_name(parameter):
 
 
 def _add_python_type(parameter, config):
-    '''Adds the type to use in the Python API to the parameter metadata'''
+    '''Adds the type to use in the Python API to the parameter metadata, if not previously populated (i.e. dict for parameters of Python-only methods)'''
+    if 'python_type' in parameter:
+        return parameter
     if parameter['enum'] is None:
         parameter['python_type'] = get_python_type_for_api_type(parameter['type'], config)
     else:
@@ -73,6 +75,56 @@ def _add_is_error_handling(f):
     return f
 
 
+def _add_python_implementation(f):
+    '''Adds 'python_implementation' to the function metadata if not previously populated. Defaults to None.
+
+    Functions with a python_implementation have no C function behind them. The Session method calls the named
+    Python function ('<module>.<function>') instead, passing the session followed by the method parameters.
+    '''
+    if 'python_implementation' not in f:
+        f['python_implementation'] = None
+    return f
+
+
+# Functions that change the values of attributes, so the attribute cache of the session is cleared after calling them.
+_invalidates_attribute_cache_function_names = ['reset', 'ResetWithDefaults', 'ResetDevice', 'Commit', 'self_test']
+_invalidates_attribute_cache_function_prefixes = ('Configure', 'AutoSetup', 'ImportAttributeConfiguration')
+
+
+def _add_invalidates_attribute_cache(f):
+    '''Adds 'invalidates_attribute_cache' to the function metadata by inferring it from its name, if not previously populated.
+
+    Functions that reset or configure the session change the values of attributes without going through them, so
+    calling one clears the attribute cache of the session.
+    '''
+    if 'invalidates_attribute_cache' not in f:
+        f['invalidates_attribute_cache'] = f['name'] in _invalidates_attribute_cache_function_names or f['name'].startswith(_invalidates_attribute_cache_function_prefixes)
+
+
+def _add_reuse_ctypes(f):
+    '''Adds 'reuse_ctypes' to the function metadata if not previously populated. Defaults to True.
+
+    The Session method then reuses the ctypes objects of its scalar parameters, which each thread creates once, instead
+    of creating new ones on every call. Set it to False for functions that can be called again on the same thread before
+    they return, i.e. from a callback.
+    '''
+    if 'reuse_ctypes' not in f:
+        f['reuse_ctypes'] = True
+
+
+def _add_reused_ctype(parameter, f, config):
+    '''Adds 'reused_ctype' to the parameter metadata: name of the ctypes object the Session method reuses for it, or None.
+
+    Only scalars of VISA types are reused. Not the session handle, which the session keeps, nor sizes of buffers.
+    '''
+    is_custom_type = any(c['ctypes_type'] == parameter['ctypes_type'] for c in config.get('custom_types', []))
+    is_buffer_size = any(p['is_buffer'] and p['size']['value'] == parameter['name'] for p in f['parameters'])
+    if not f['reuse_ctypes'] or f['python_implementation'] is not None or parameter['is_buffer'] or parameter['is_session_handle'] or parameter['is_repeated_capability'] or is_custom_type or is_buffer_size:
+        parameter['reused_ctype'] = None
+    else:
+        parameter['reused_ctype'] = f['name'] + '_' + parameter['python_name']
+
+
 def _add_buffer_info(parameter):
     '''Adds buffer information to the parameter metadata iff 'size' is defined else assume not a buffer'''
 
@@ -101,9 +153,35 @@ def _add_buffer_info(parameter):
     return parameter
 
 
+def _add_into_method(parameter):
+    '''Adds into_method information to the parameter metadata if it isn't already defined. Defaults to False.
+
+    An output buffer with into_method True also gets a '<python_name>_into' Session method that fills a buffer
+    allocated by the caller (i.e. numpy.ndarray) in place, rather than returning a new list.
+    '''
+    if 'into_method' not in parameter:
+        parameter['into_method'] = False
+    assert not parameter['into_method'] or (parameter['direction'] == 'out' and parameter['size']['mechanism'] in ('passed-in', 'python-code')), 'into_method is only supported on output buffers with mechanism passed-in or python-code: ' + str(parameter)
+
+
+def _add_array_type(parameter):
+    '''Adds array_type information to the parameter metadata if it isn't already defined. Defaults to None.
+
+    When set on an output buffer, the Session method gets an 'array_type' keyword argument that selects whether the
+    buffer is returned as a list, an array.array or a numpy.ndarray. The value in the metadata is the default.
+    '''
+    if 'array_type' not in parameter:
+        parameter['array_type'] = None
+    assert parameter['array_type'] in (None, 'list', 'array', 'numpy'), 'Unknown array_type: ' + str(parameter)
+    assert parameter['array_type'] is None or (parameter['direction'] == 'out' and parameter['size']['mechanism'] == 'passed-in' and parameter['python_type'] in ('int', 'float')), 'array_type is only supported on int or float output buffers with mechanism passed-in: ' + str(parameter)
+
+
 def _add_library_method_call_snippet(parameter):
     '''Code snippet for calling a method of Library for this parameter.'''
-    if parameter['direction'] == 'out' and parameter['is_buffer'] is False:
+    if parameter['direction'] == 'out' and parameter['is_buffer'] is False and parameter['reused_ctype'] is not None:
+        # The pointer to the reused ctypes object is reused as well
+        parameter['library_method_call_snippet'] = '_scalar_ctypes.{0}_pointer'.format(parameter['reused_ctype'])
+    elif parameter['direction'] == 'out' and parameter['is_buffer'] is False:
         parameter['library_method_call_snippet'] = 'ctypes.pointer({0})'.format(parameter['ctypes_variable_name'])
     else:
         parameter['library_method_call_snippet'] = parameter['ctypes_variable_name']
@@ -164,6 +242,9 @@ def _add_is_session_handle(parameter):
 def add_all_function_metadata(functions, config):
     '''Merges and Adds all codegen-specific metada to the function metadata list'''
     if 'modules' in config and 'metadata.functions_addon' in config['modules']:
+        # Functions implemented only in Python aren't in functions.py, so they are added rather than merged
+        if hasattr(config['modules']['metadata.functions_addon'], 'python_only_functions'):
+            functions.update(copy.deepcopy(config['modules']['metadata.functions_addon'].python_only_functions))
         for m in dir(config['modules']['metadata.functions_addon']):
             if m.startswith('functions_'):
                 merge_dicts(functions, config['modules']['metadata.functions_addon'].__getattribute__(m))
@@ -171,18 +252,25 @@ def add_all_function_metadata(functions, config):
     for f in filter_codegen_functions(functions):
         _add_name(functions[f], f)
         _add_python_method_name(functions[f], f)
+        _add_python_implementation(functions[f])
         _add_is_error_handling(functions[f])
         _add_has_repeated_capability(functions[f])
+        _add_invalidates_attribute_cache(functions[f])
+        _add_reuse_ctypes(functions[f])
         for p in functions[f]['parameters']:
             _add_buffer_info(p)
+            _add_into_method(p)
             _add_python_parameter_name(p)
             _add_python_type(p, config)
+            _add_array_type(p)
             _add_ctypes_variable_name(p)
             _add_ctypes_type(p)
             _add_default_value_name(p)
             _add_default_value_name_for_docs(p, config['module_name'])
             _add_is_repeated_capability(p)
             _add_is_session_handle(p)
+        for p in functions[f]['parameters']:
+            _add_reused_ctype(p, functions[f], config)
             _add_library_method_call_snippet(p)
     return functions
 
@@ -201,6 +289,15 @@ def _add_python_name(a, attributes):
     attributes[a]['python_name'] = n
 
 
+def _add_volatile(a, attributes):
+    '''Adds 'volatile' to the attribute metadata if not previously populated. Defaults to False.
+
+    Volatile attributes change without the application setting them (i.e. status), so they are never cached.
+    '''
+    if 'volatile' not in attributes[a]:
+        attributes[a]['volatile'] = False
+
+
 def add_all_attribute_metadata(attributes, config):
     '''Merges and Adds all codegen-specific metada to the function metadata list'''
     if 'modules' in config and 'metadata.functions_addon' in config['modules']:
@@ -211,6 +308,7 @@ def add_all_attribute_metadata(attributes, config):
     for a in attributes:
         _add_codegen_method(a, attributes)
         _add_python_name(a, attributes)
+        _add_volatile(a, attributes)
 
     return attributes
 
@@ -341,7 +439,10 @@ def test_add_all_metadata_simple():
                 'description': 'Performs a foo, and performs it well.'
             },
             'has_repeated_capability': True,
+            'invalidates_attribute_cache': False,
+            'reuse_ctypes': True,
             'is_error_handling': False,
+            'python_implementation': None,
             'parameters': [
                 {
                     'ctypes_type': 'ViSession',
@@ -366,6 +467,9 @@ def test_add_all_metadata_simple():
                     },
                     'type': 'ViSession',
                     'library_method_call_snippet': 'vi_ctype',
+                    'into_method': False,
+                    'array_type': None,
+                    'reused_ctype': None,
                 },
                 {
                     'ctypes_type': 'ViChar',
@@ -388,6 +492,9 @@ def test_add_all_metadata_simple():
                     'type': 'ViChar',
                     'original_type': 'ViString',
                     'library_method_call_snippet': 'channel_name_ctype',
+                    'into_method': False,
+                    'array_type': None,
+                    'reused_ctype': None,
                 },
             ],
             'python_name': 'make_a_foo',
@@ -418,7 +525,10 @@ def test_add_all_metadata_simple():
                 'python_name_with_doc_default': 'vi',
                 'is_repeated_capability': False,
                 'is_session_handle': True,
-                'library_method_call_snippet': 'vi_ctype'
+                'library_method_call_snippet': 'vi_ctype',
+                'into_method': False,
+                'array_type': None,
+                'reused_ctype': None,
             }, {
                 'direction': 'out',
                 'enum': None,
@@ -442,7 +552,10 @@ def test_add_all_metadata_simple():
                 'python_name_with_doc_default': 'status',
                 'is_repeated_capability': False,
                 'is_session_handle': False,
-                'library_method_call_snippet': 'status_ctype'
+                'library_method_call_snippet': 'status_ctype',
+                'into_method': False,
+                'array_type': None,
+                'reused_ctype': None,
             }],
             'documentation': {
                 'description': 'Perform actions as method defined'
@@ -450,7 +563,10 @@ def test_add_all_metadata_simple():
             'name': 'MakeAPrivateMethod',
             'python_name': '_make_a_private_method',
             'is_error_handling': False,
-            'has_repeated_capability': False
+            'python_implementation': None,
+            'has_repeated_capability': False,
+            'invalidates_attribute_cache': False,
+            'reuse_ctypes': True,
         }
     }
 
@@ -95,7 +95,7 @@ _parameterUsageOptionsFiltering[ParameterUsageOptions.OUTPUT_PARAMETERS] = {
     'reordered_for_default_values': False,
     'skip_repeated_capability_parameter': False,
     'skip_non_enum_parameter': False,
-    'mechanism': 'fixed, passed-in, len',  # any but ivi-dance
+    'mechanism': 'fixed, passed-in, len, python-code',  # any but ivi-dance
 }
 _parameterUsageOptionsFiltering[ParameterUsageOptions.IVI_DANCE_PARAMETER] = {
     'skip_session_handle': True,
@@ -186,7 +186,8 @@ def filter_parameters(function, parameter_usage_options):
 def filter_ivi_dance_parameter(function):
     '''Returns the ivi-dance parameter of a session method if there is one. This is the parameter whose size is determined at runtime.
 
-    asserts if more than one parameter found
+    asserts if more than one parameter found, unless they all have the same size parameter (i.e. output buffers of an
+    '_into' method that share a count). Then the first one is returned, since the size is its length.
     Args:
         function: function whose parameters should be checked
 
@@ -217,7 +218,7 @@ def filter_len_parameter(function):
     params = filter_parameters(function, ParameterUsageOptions.LEN_PARAMETER)
     if len(params) == 0:
         return None
-    assert len(params) == 1, 'Found more than one len parameter: {0}'.format(pp.pformat(params))
+    assert len(set(p['size']['value'] for p in params)) == 1, 'Found more than one len parameter: {0}'.format(pp.pformat(params))
     return params[0]
 
 
@@ -226,6 +227,11 @@ def filter_codegen_functions(functions):
     return {k: v for k, v in functions.items() if v['codegen_method'] != 'no'}
 
 
+def filter_library_functions(functions):
+    '''Returns function metadata only for those functions that call into the driver library, i.e. excludes functions implemented only in Python'''
+    return {k: v for k, v in filter_codegen_functions(functions).items() if v['python_implementation'] is None}
+
+
 def filter_codegen_attributes(attributes):
     '''Returns attribute metadata only for those attributes to be included in codegen'''
     return {k: v for k, v in attributes.items() if v['codegen_method'] != 'no'}
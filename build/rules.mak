@@ -5,6 +5,7 @@ MODULE_FILES := \
                 $(addprefix $(MODULE_DIR)/,$(MODULE_FILES_TO_GENERATE)) \
                 $(addprefix $(MODULE_DIR)/,$(MODULE_FILES_TO_COPY)) \
                 $(addprefix $(MODULE_DIR)/,$(CUSTOM_TYPES_TO_COPY)) \
+                $(addprefix $(MODULE_DIR)/,$(PYTHON_IMPLEMENTATION_TO_COPY)) \
 
 
 RST_FILES := \
@@ -45,6 +46,12 @@ $(MODULE_DIR)/%.py: $(DRIVER_DIR)/custom_types/%.py
 # Need to signal the top level makefile to run tests again
 	$(_hide_cmds)$(call trigger_tests)
 
+$(MODULE_DIR)/%.py: $(DRIVER_DIR)/python_implementation/%.py
+	$(call trace_to_console, "Copying",$@)
+	$(_hide_cmds)cp $< $@
+# Need to signal the top level makefile to run tests again
+	$(_hide_cmds)$(call trigger_tests)
+
 $(DRIVER_DOCS_DIR)/%.rst: %.rst.mako $(BUILD_HELPER_SCRIPTS) $(METADATA_FILES)
 	$(call trace_to_console, "Generating",$@)
 	$(_hide_cmds)$(call log_command,$(call GENERATE_SCRIPT, $<, $(dir $@), $(METADATA_DIR)))
@@ -5,21 +5,63 @@ enums = template_parameters['metadata'].enums
 config = template_parameters['metadata'].config
 module_name = config['module_name']
 module_name_class = module_name.title()
-%>
-% if len(enums) > 0:
-from ${module_name}.enums import *          # noqa: F403,F401,H303
-% endif
-from ${module_name}.errors import Error     # noqa: F401
-from ${module_name}.errors import ${module_name_class}Warning   # noqa: F401
-from ${module_name}.session import Session  # noqa: F401
-<%
- # Blank lines are to make each import separate so that they do not need to be sorted
- # Otherwise flake8 test fails
+
+lazy_names = [('Error', 'errors'), (module_name_class + 'Warning', 'errors'), ('Session', 'session')]
+if len(enums) > 0:
+    lazy_names += [(e, 'enums') for e in sorted(enums)]
+for c in config['custom_types']:
+    lazy_names += [(c['python_name'], c['file_name']), (c['ctypes_type'], c['file_name'])]
 %>\
-% for c in config['custom_types']:
 
-from ${module_name}.${c['file_name']} import ${c['python_name']}  # noqa: F401
+import sys
+% for c in config['custom_types']:
+%   if c['ctypes_type'] == c['file_name']:
 
+# Importing ${c['file_name']} later would replace the ctypes type of the same name in the package with the module
 from ${module_name}.${c['file_name']} import ${c['ctypes_type']}  # noqa: F401
+%   endif
+% endfor
+
+# Modules are imported when one of their names is first used, so that importing the package is fast
+_lazy_names = {
+% for name, submodule in sorted(lazy_names):
+    '${name}': '${submodule}',
 % endfor
+}
 
+__all__ = sorted(_lazy_names)
+
+if sys.version_info >= (3, 7):
+    import importlib
+    import importlib.util
+
+    def __getattr__(name):
+        if name in _lazy_names:
+            submodule = importlib.import_module('${module_name}.' + _lazy_names[name])
+            # Next time, all the names of the module are found without calling __getattr__. This also replaces the
+            # module in the package with the name it exports, when they are the same.
+            for n in _lazy_names:
+                if _lazy_names[n] == _lazy_names[name]:
+                    globals()[n] = getattr(submodule, n)
+            return globals()[name]
+        # Modules of the package are attributes of it once imported, as they were when the package imported them all
+        if not name.startswith('__') and importlib.util.find_spec('${module_name}.' + name) is not None:
+            return importlib.import_module('${module_name}.' + name)
+        raise AttributeError("module '${module_name}' has no attribute '{0}'".format(name))
+
+    def __dir__():
+        return sorted(set(globals()) | set(_lazy_names))
+else:
+    # Module __getattr__ needs Python 3.7
+% if len(enums) > 0:
+    from ${module_name}.enums import *          # noqa: F403,F401,H303
+% endif
+    from ${module_name}.errors import Error     # noqa: F401
+    from ${module_name}.errors import ${module_name_class}Warning   # noqa: F401
+    from ${module_name}.session import Session  # noqa: F401
+% for c in config['custom_types']:
+    from ${module_name}.${c['file_name']} import ${c['python_name']}  # noqa: F401
+%   if c['ctypes_type'] != c['file_name']:
+    from ${module_name}.${c['file_name']} import ${c['ctypes_type']}  # noqa: F401
+%   endif
+% endfor
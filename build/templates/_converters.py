@@ -0,0 +1,207 @@
+'''Helpers for passing Python buffers (i.e. numpy.ndarray, array.array) to the driver runtime without copying.'''
+
+import array
+import ctypes
+import sys
+
+try:
+    from collections.abc import Sequence
+except ImportError:
+    from collections import Sequence
+
+
+# Element kind for each struct/buffer protocol format character. ctypes simple types use the same characters in _type_
+_format_kinds = {
+    'e': 'float', 'f': 'float', 'd': 'float',
+    'b': 'int', 'h': 'int', 'i': 'int', 'l': 'int', 'q': 'int',
+    'B': 'uint', 'H': 'uint', 'I': 'uint', 'L': 'uint', 'Q': 'uint',
+    '?': 'bool',
+}
+
+
+_native_byte_order = '<' if sys.byteorder == 'little' else '>'
+
+
+def _get_format_kind(fmt):
+    if fmt[:1] in ('<', '>', '!'):
+        # Buffers that are not in native byte order can't be handed to the driver as is
+        if fmt[:1].replace('!', '>') != _native_byte_order:
+            return None
+        fmt = fmt[1:]
+    elif fmt[:1] in ('@', '='):
+        fmt = fmt[1:]
+    return _format_kinds.get(fmt)
+
+
+def _is_compatible_buffer(view, ctypes_type):
+    if issubclass(ctypes_type, ctypes.Structure):
+        # Structures can only be checked by size, i.e. a numpy structured array with a dtype built from ctypes_type
+        return view.itemsize == ctypes.sizeof(ctypes_type) and view.format.lstrip('@=<>!').startswith('T{')
+    ctypes_format = getattr(ctypes_type, '_type_', None)
+    if not isinstance(ctypes_format, str) or view.itemsize != ctypes.sizeof(ctypes_type):
+        return False
+    kind = _get_format_kind(view.format)
+    return kind is not None and kind == _get_format_kind(ctypes_format)
+
+
+class _ArrayView(object):
+    '''Stands in for the memoryview of an array.array on Python 2, where memoryview() doesn't accept array.array'''
+
+    def __init__(self, value):
+        self.format = value.typecode
+        self.itemsize = value.itemsize
+        self.ndim = 1
+        self.readonly = False
+        self.strides = (value.itemsize,)
+        self._length = len(value)
+
+    def __len__(self):
+        return self._length
+
+
+def _get_view(value):
+    '''Returns memoryview(value), or an _ArrayView if value is an array.array on Python 2. Raises TypeError for anything else that is not a buffer.'''
+    try:
+        return memoryview(value)
+    except TypeError:
+        if isinstance(value, array.array):
+            return _ArrayView(value)
+        raise
+
+
+def _is_c_contiguous(view):
+    '''Returns whether the 1-dimensional memoryview view is C-contiguous'''
+    try:
+        return view.c_contiguous
+    except AttributeError:
+        # Python 2 memoryview has no c_contiguous: its elements are contiguous when the stride is the element size, or
+        # when it has no strides, as for ctypes arrays
+        return view.strides is None or view.strides == (view.itemsize,)
+
+
+def get_ctypes_array_for_buffer(value, ctypes_type, name, minimum_size=None):
+    '''Returns a ctypes array of ctypes_type that shares memory with value
+
+    value must be a writable, 1-dimensional, C-contiguous buffer whose elements have the same kind and size
+    as ctypes_type. For example, numpy.ndarray of numpy.float64 or array.array('d') for visatype.ViReal64.
+    Nothing is copied, so the driver writes directly into value.
+
+    If minimum_size is not None, value must have at least that many elements.
+    '''
+    try:
+        view = _get_view(value)
+    except TypeError:
+        raise TypeError('{0} must be a writable buffer (i.e. numpy.ndarray or array.array), not {1}'.format(name, type(value).__name__))
+    if view.readonly:
+        raise TypeError('{0} must be a writable buffer, not read-only {1}'.format(name, type(value).__name__))
+    if view.ndim != 1 or not _is_c_contiguous(view):
+        raise ValueError('{0} must be a 1-dimensional, contiguous buffer'.format(name))
+    if not _is_compatible_buffer(view, ctypes_type):
+        raise TypeError('{0} must be a buffer of {1} ({2} bytes per element), not format \'{3}\' ({4} bytes per element)'.format(name, ctypes_type.__name__, ctypes.sizeof(ctypes_type), view.format, view.itemsize))
+    if minimum_size is not None and len(view) < minimum_size:
+        raise ValueError('{0} must have at least {1} elements, not {2}'.format(name, minimum_size, len(view)))
+    return (ctypes_type * len(view)).from_buffer(value)
+
+
+def get_ctypes_array_head(ctypes_array, size):
+    '''Returns a ctypes array of the first size elements of ctypes_array, that shares memory with it
+
+    Unlike slicing a ctypes array, nothing is copied.
+    '''
+    if size == len(ctypes_array):
+        return ctypes_array
+    return (ctypes_array._type_ * size).from_buffer(ctypes_array)
+
+
+def convert_to_ctypes_array(value, ctypes_type):
+    '''Returns a ctypes array of ctypes_type with the contents of value
+
+    Buffers (i.e. numpy.ndarray, array.array, memoryview) that are 1-dimensional, contiguous and whose elements have the
+    same kind and size as ctypes_type are not unpacked element by element: writable buffers are shared with from_buffer,
+    read-only ones are copied in a single step with from_buffer_copy. Anything else (i.e. list) is converted one element
+    at a time.
+    '''
+    try:
+        view = _get_view(value)
+    except TypeError:
+        view = None
+    if view is not None and view.ndim == 1 and _is_c_contiguous(view) and _is_compatible_buffer(view, ctypes_type):
+        array_type = ctypes_type * len(view)
+        if view.readonly:
+            return array_type.from_buffer_copy(view)
+        return array_type.from_buffer(value)
+    return (ctypes_type * len(value))(*value)
+
+
+def check_array_type(array_type):
+    '''Raises ValueError if array_type is not one of the values accepted by convert_from_ctypes_array()
+
+    Called by Session methods before calling into the driver, so that measurements are not fetched and then lost.
+    '''
+    if array_type not in ('list', 'array', 'numpy'):
+        raise ValueError('array_type must be one of \'list\', \'array\' or \'numpy\', not {0!r}'.format(array_type))
+
+
+def convert_from_ctypes_array(ctypes_array, size, python_type, array_type):
+    '''Returns the first size elements of ctypes_array as the type selected by array_type
+
+    array_type is one of:
+        'list'  - list of python_type
+        'array' - array.array, filled with a single copy of the memory
+        'numpy' - numpy.ndarray that shares memory with ctypes_array. Requires numpy to be installed.
+    '''
+    if array_type == 'list':
+        return [python_type(ctypes_array[i]) for i in range(size)]
+    elif array_type == 'array':
+        element_type = ctypes_array._type_
+        return array.array(element_type._type_, ctypes.string_at(ctypes_array, size * ctypes.sizeof(element_type)))
+    elif array_type == 'numpy':
+        import numpy
+        return numpy.ctypeslib.as_array(ctypes_array)[:size]
+    check_array_type(array_type)
+
+
+class EnumArray(Sequence):
+    '''Array of enum values returned by the driver, kept as the integers (or floats) it returned
+
+    Indexing and iterating return members of the enum, which are only looked up when they are used. values is the
+    array.array of the numbers themselves, for code that doesn't need the members (i.e. to compare or store them).
+    '''
+
+    def __init__(self, values, enum_type, members_by_value):
+        self.values = values
+        self._enum_type = enum_type
+        self._members_by_value = members_by_value
+
+    def _get_member(self, value):
+        try:
+            return self._members_by_value[value]
+        except KeyError:
+            # Raises ValueError, as the enum does for values it doesn't have
+            return self._enum_type(value)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return EnumArray(self.values[index], self._enum_type, self._members_by_value)
+        return self._get_member(self.values[index])
+
+    def __iter__(self):
+        for value in self.values:
+            yield self._get_member(value)
+
+    def __eq__(self, other):
+        if isinstance(other, (EnumArray, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{0}({1}, [{2}])'.format(type(self).__name__, self._enum_type.__name__, ', '.join(str(member) for member in self))
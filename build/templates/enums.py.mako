@@ -1,8 +1,14 @@
+<%
+# Have to put this in a variable and add it that way because mako keeps thinking it is for it, not for the output file
+encoding_tag = '# -*- coding: utf-8 -*-'
+%>\
+${encoding_tag}
 # This file was generated
 <%
 import build.helper as helper
 config = template_parameters['metadata'].config
 enums = config['enums']
+docstrings = template_parameters['docstrings']
 %>
 from enum import Enum
 % for enum_name in sorted(enums):
@@ -15,10 +21,27 @@ class ${enum_name}(Enum):
     % else:
     ${enum_value['name']} = ${enum_value['value']}
     % endif
-    % if 'documentation' in enum_value and len(helper.get_documentation_for_node_docstring(enum_value, config, indent=4).strip()) > 0:
+    % if docstrings and 'documentation' in enum_value and len(helper.get_documentation_for_node_docstring(enum_value, config, indent=4).strip()) > 0:
     '''
     ${helper.get_documentation_for_node_docstring(enum_value, config, indent=4)}
     '''
     % endif
     % endfor
 % endfor
+
+
+# Members of each enum by value. Looking a value from the driver up in these is much faster than calling the enum with it.
+_members_by_value = {
+% for enum_name in sorted(enums):
+    ${enum_name}: dict((member.value, member) for member in ${enum_name}),
+% endfor
+}
+
+
+def _get_member(enum_type, value):
+    '''Returns the member of enum_type that has value, like enum_type(value)'''
+    try:
+        return _members_by_value[enum_type][value]
+    except KeyError:
+        # Raises ValueError, as the enum does for values it doesn't have
+        return enum_type(value)
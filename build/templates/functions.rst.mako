@@ -17,6 +17,10 @@ ${helper.get_rst_header_snippet(module_name + '.Session methods', '=')}
 %    if functions[fname]['codegen_method'] == 'public':
 ${helper.get_function_rst(fname, config, indent=0)}
 
+%       if helper.has_into_method(functions[fname]):
+${helper.get_function_rst(fname, config, indent=0, into_method=True)}
+
+%       endif
 %    endif
 % endfor
 
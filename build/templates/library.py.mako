@@ -10,7 +10,7 @@ c_function_prefix = config['c_function_prefix']
 driver_name = config['driver_name']
 
 functions = config['functions']
-functions = helper.filter_codegen_functions(functions)
+functions = helper.filter_library_functions(functions)
 %>\
 
 import ctypes
@@ -19,7 +19,7 @@ import threading
 from ${module_name}.visatype import *  # noqa: F403,H303
 % for c in config['custom_types']:
 
-from ${module_name} import ${c['file_name']}  # noqa: F401
+from ${module_name}.${c['file_name']} import ${c['ctypes_type']}  # noqa: F401
 % endfor
 
 
@@ -28,6 +28,9 @@ class Library(object):
 
     Wrapper around driver library.
     Class will setup the correct ctypes information for every function on first call.
+
+    The lock is only taken while a function is being resolved. The cfunc is published only
+    after its argtypes and restype are set, so once cached, calls do not serialize on the lock.
     '''
 
     def __init__(self, ctypes_library):
@@ -48,10 +51,12 @@ class Library(object):
 %>\
 
     def ${c_func_name}(${param_names_method}):  # noqa: N802
-        with self._func_lock:
-            if self.${c_func_name}_cfunc is None:
-                self.${c_func_name}_cfunc = self._library.${c_func_name}
-                self.${c_func_name}_cfunc.argtypes = [${param_ctypes_library}]  # noqa: F405
-                self.${c_func_name}_cfunc.restype = ${f['returns']}  # noqa: F405
+        if self.${c_func_name}_cfunc is None:
+            with self._func_lock:
+                if self.${c_func_name}_cfunc is None:
+                    cfunc = self._library.${c_func_name}
+                    cfunc.argtypes = [${param_ctypes_library}]  # noqa: F405
+                    cfunc.restype = ${f['returns']}  # noqa: F405
+                    self.${c_func_name}_cfunc = cfunc
         return self.${c_func_name}_cfunc(${param_names_library})
 % endfor
@@ -55,3 +55,19 @@ def get():
             _instance = library.Library(ctypes_library)
         return _instance
 
+
+def set_backend(backend):
+    '''set_backend
+
+    Makes get() return a library.Library that calls into backend instead of the ${config['driver_name']} runtime.
+
+    backend is any object that has the C functions of the driver as attributes, the way a ctypes.CDLL does, i.e. a
+    ${config['module_name']}.simulator.Simulator. Pass None to go back to the driver runtime.
+
+    Sessions keep the library they were created with, so call this before creating sessions.
+    '''
+    global _instance
+
+    with _instance_lock:
+        _instance = None if backend is None else library.Library(backend)
+
@@ -11,7 +11,7 @@ c_function_prefix = config['c_function_prefix']
 driver_name = config['driver_name']
 
 functions = template_parameters['metadata'].functions
-functions = helper.filter_codegen_functions(functions)
+functions = helper.filter_library_functions(functions)
 %>\
 
 
@@ -28,7 +28,7 @@ class MockFunctionCallError(Exception):
 class SideEffectsHelper(object):
     def __init__(self):
         self._defaults = {}
-% for func_name in sorted(helper.filter_codegen_functions(functions)):
+% for func_name in sorted(helper.filter_library_functions(functions)):
 <%
 f = functions[func_name]
 %>\
@@ -51,7 +51,7 @@ ivi_dance_param = helper.filter_ivi_dance_parameter(f)
     def __setitem__(self, func, val):
         self._defaults[func] = val
 
-% for func_name in sorted(helper.filter_codegen_functions(functions)):
+% for func_name in sorted(helper.filter_library_functions(functions)):
 <%
 f = functions[func_name]
 params = f['parameters']
@@ -85,11 +85,13 @@ ivi_dance_size_param = helper.find_size_parameter(ivi_dance_param, params)
 %    if ivi_dance_param is not None:
         if self._defaults['${func_name}']['${ivi_dance_param['name']}'] is None:
             raise MockFunctionCallError("${c_function_prefix}${func_name}", param='${ivi_dance_param['name']}')
-        if ${ivi_dance_size_param['python_name']}.value == 0:
-            return len(self._defaults['${func_name}']['${ivi_dance_param['name']}'])
 %       if ivi_dance_param['type'] == 'ViChar':  # strings
+        if ${ivi_dance_size_param['python_name']}.value < len(self._defaults['${func_name}']['${ivi_dance_param['name']}']):
+            return len(self._defaults['${func_name}']['${ivi_dance_param['name']}'])
         ${ivi_dance_param['python_name']}.value = self._defaults['${func_name}']['${ivi_dance_param['name']}'].encode('ascii')
 %       else:  # arrays
+        if ${ivi_dance_size_param['python_name']}.value == 0:
+            return len(self._defaults['${func_name}']['${ivi_dance_param['name']}'])
         for i in range(len(self._defaults['${func_name}']['${ivi_dance_param['name']}'])):
             ${ivi_dance_param['python_name']}[i] = self._defaults['${func_name}']['${ivi_dance_param['name']}'][i]
 %       endif
@@ -99,7 +101,7 @@ ivi_dance_size_param = helper.find_size_parameter(ivi_dance_param, params)
 % endfor
     # Helper function to setup Mock object with default side effects and return values
     def set_side_effects_and_return_values(self, mock_library):
-% for func_name in sorted(helper.filter_codegen_functions(functions)):
+% for func_name in sorted(helper.filter_library_functions(functions)):
 <%
 f = functions[func_name]
 %>\
@@ -13,18 +13,26 @@ ${encoding_tag}
 
     module_name = config['module_name']
     c_function_prefix = config['c_function_prefix']
+    docstrings = template_parameters['docstrings']
 
     attributes = helper.filter_codegen_attributes(config['attributes'])
 
+    python_implementation_modules = sorted(set([f['python_implementation'].split('.')[0] for f in functions.values() if f['python_implementation'] is not None]))
+
     session_context_manager = None
     if 'task' in config['context_manager_name']:
         session_context_manager = '_' + config['context_manager_name']['task'].title()
         session_context_manager_initiate = functions[config['context_manager_name']['initiate_function']]['python_name']
         session_context_manager_abort = functions[config['context_manager_name']['abort_function']]['python_name']
 %>\
-<%def name="render_method(f)">\
+<%def name="render_method(f, into_method=False)">\
 <%
-    '''Renders a Session method corresponding to the passed-in function metadata.'''
+    '''Renders a Session method corresponding to the passed-in function metadata.
+
+    If into_method is True, renders the '_into' variant that fills caller-allocated buffers in place instead.
+    '''
+    if into_method:
+        f = helper.get_into_method_function(f)
 
     parameters = f['parameters']
     enum_input_parameters = helper.filter_parameters(f, helper.ParameterUsageOptions.INPUT_ENUM_PARAMETERS)
@@ -35,16 +43,48 @@ ${encoding_tag}
     assert ivi_dance_size_parameter is None or len_size_parameter is None
 %>\
     def ${f['python_name']}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.SESSION_METHOD_DECLARATION)}):
+% if docstrings:
         '''${f['python_name']}
 
-        ${helper.get_function_docstring(f['name'], config, indent=8)}
+        ${helper.get_function_docstring(f['name'], config, indent=8, into_method=into_method)}
         '''
+% endif
 % for parameter in enum_input_parameters:
         ${helper.get_enum_type_check_snippet(parameter, indent=12)}
 % endfor
+% if f['python_implementation'] is None and helper.get_array_type_default(f) is not None:
+        _converters.check_array_type(array_type)
+% endif
+% if f['python_implementation'] is not None:
+        return ${helper.get_python_implementation_call_snippet(f)}
+% else:
 % for p in helper.filter_parameters(f, helper.ParameterUsageOptions.LIBRARY_METHOD_CALL):
+%   if ivi_dance_parameter is None or ivi_dance_parameter['type'] != 'ViChar' or p not in (ivi_dance_parameter, ivi_dance_size_parameter):
         ${helper.get_ctype_variable_declaration_snippet(p, parameters, config)}
+%   endif
 % endfor
+% if ivi_dance_parameter is not None and ivi_dance_parameter['type'] == 'ViChar':
+<%
+    # Strings are NUL terminated, so a buffer larger than needed works. Try with the size that was needed last time.
+    buffer_size_key = repr(f['name'])
+    if 'attributeId' in [p['name'] for p in parameters]:
+        buffer_size_key = '({0}, attribute_id)'.format(repr(f['name']))
+%>\
+        ${ivi_dance_size_parameter['ctypes_variable_name']} = visatype.${ivi_dance_size_parameter['ctypes_type']}(_ivi_dance_buffer_sizes.get(${buffer_size_key}, _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        ${ivi_dance_parameter['ctypes_variable_name']} = (visatype.${ivi_dance_parameter['ctypes_type']} * ${ivi_dance_size_parameter['ctypes_variable_name']}.value)()
+        error_code = self._library.${c_function_prefix}${f['name']}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.LIBRARY_METHOD_CALL)})
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            ${ivi_dance_size_parameter['ctypes_variable_name']} = visatype.${ivi_dance_size_parameter['ctypes_type']}(0)
+            ${ivi_dance_parameter['ctypes_variable_name']} = None
+            error_code = self._library.${c_function_prefix}${f['name']}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.LIBRARY_METHOD_CALL)})
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=${f['is_error_handling']})
+            ${ivi_dance_size_parameter['ctypes_variable_name']} = visatype.${ivi_dance_size_parameter['ctypes_type']}(error_code)
+            ${ivi_dance_parameter['ctypes_variable_name']} = (visatype.${ivi_dance_parameter['ctypes_type']} * ${ivi_dance_size_parameter['ctypes_variable_name']}.value)()
+            error_code = self._library.${c_function_prefix}${f['name']}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.LIBRARY_METHOD_CALL)})
+            _ivi_dance_buffer_sizes[${buffer_size_key}] = ${ivi_dance_size_parameter['ctypes_variable_name']}.value
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=${f['is_error_handling']})
+% else:
 % if ivi_dance_parameter is not None:
         error_code = self._library.${c_function_prefix}${f['name']}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.LIBRARY_METHOD_CALL)})
         errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=${f['is_error_handling']})
@@ -53,19 +93,98 @@ ${encoding_tag}
 % endif
         error_code = self._library.${c_function_prefix}${f['name']}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.LIBRARY_METHOD_CALL)})
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=${f['is_error_handling']})
+% endif
+% if f['invalidates_attribute_cache']:
+        self._attribute_cache.clear()
+% endif
         ${helper.get_method_return_snippet(parameters, config)}
+% endif
 </%def>\
+import collections
 import ctypes
+% if any(c['ctypes_type'] == c['file_name'] for c in config['custom_types']):
+import importlib
+% endif
+import threading
 
+from ${module_name} import _converters  # noqa: F401
+% for m in python_implementation_modules:
+from ${module_name} import ${m}
+% endfor
 from ${module_name} import attributes
+from ${module_name} import call_stats
 from ${module_name} import enums
 from ${module_name} import errors
 from ${module_name} import library_singleton
 from ${module_name} import visatype
 % for c in config['custom_types']:
 
+%   if c['ctypes_type'] == c['file_name']:
+# Not imported from the package, where ${c['file_name']} is the ctypes type of the same name once it has been used
+${c['file_name']} = importlib.import_module('${module_name}.${c['file_name']}')
+%   else:
 from ${module_name} import ${c['file_name']}  # noqa: F401
+%   endif
+% endfor
+
+# Size of the buffer that string IVI-dance methods try first, until they know the size they need
+_DEFAULT_IVI_DANCE_BUFFER_SIZE = 256
+
+# Size of the buffer that each string IVI-dance method needed last time, by C function name (and attribute ID). Shared
+# by all sessions.
+_ivi_dance_buffer_sizes = {}
+
+% if 'error_message' in functions:
+# Messages of the most recently used error and warning codes, from _error_message(). Shared by all sessions.
+_MAX_ERROR_MESSAGES = 64
+_error_messages = collections.OrderedDict()
+_error_messages_lock = threading.Lock()
+
+% endif
+<%
+reused_ctypes = []
+for f in functions.values():
+    for p in f['parameters']:
+        if p['reused_ctype'] is not None:
+            reused_ctypes.append((p['reused_ctype'], p['ctypes_type'], p['direction']))
+%>\
+% if len(reused_ctypes) > 0:
+
+class _ScalarCtypes(threading.local):
+    '''ctypes objects for the scalar parameters of driver functions, which methods reuse instead of creating new ones on every call
+
+    Each thread has its own, so that calls on different threads don't share them.
+    '''
+
+    def __init__(self):
+%   for name, ctypes_type, direction in sorted(reused_ctypes):
+        self.${name} = visatype.${ctypes_type}()
+%     if direction == 'out':
+        self.${name}_pointer = ctypes.pointer(self.${name})
+%     endif
+%   endfor
+
+
+_scalar_ctypes = _ScalarCtypes()
+
+% endif
+<%
+c_functions = {}
+for f in functions.values():
+    if f['python_implementation'] is None:
+        c_functions[f['python_name']] = c_function_prefix + f['name']
+        if helper.has_into_method(f):
+            c_functions[helper.get_into_method_function(f)['python_name']] = c_function_prefix + f['name']
+%>\
+# C function that each method calls, for call_stats
+_c_functions = {
+% for method_name, c_function_name in sorted(c_functions.items()):
+    '${method_name}': '${c_function_name}',
 % endfor
+}
+
+# Maximum number of repeated capability views (i.e. session['0']) that a session keeps to return again
+_MAX_REPEATED_CAPABILITY_VIEWS = 256
 
 
 % if session_context_manager is not None:
@@ -101,13 +220,16 @@ You can specify a subset of repeated capabilities using the Python index notatio
 '''
 if attributes[attribute]['channel_based'] == 'True':
     attributes[attribute]['documentation']['tip'] = rep_cap_attr_desc.format(attributes[attribute]["name"].lower())
+%>\
+<%
+volatile_snippet = ', volatile=True' if attributes[attribute]['volatile'] else ''
 %>\
     %if attributes[attribute]['enum']:
-    ${attributes[attribute]['python_name']} = attributes.AttributeEnum(attributes.Attribute${attributes[attribute]['type']}, enums.${attributes[attribute]['enum']}, ${attribute})
+    ${attributes[attribute]['python_name']} = attributes.AttributeEnum(attributes.Attribute${attributes[attribute]['type']}, enums.${attributes[attribute]['enum']}, ${attribute}${volatile_snippet})
     %else:
-    ${attributes[attribute]['python_name']} = attributes.Attribute${attributes[attribute]['type']}(${attribute})
+    ${attributes[attribute]['python_name']} = attributes.Attribute${attributes[attribute]['type']}(${attribute}${volatile_snippet})
     %endif
-%   if 'documentation' in attributes[attribute] and len(helper.get_documentation_for_node_docstring(attributes[attribute], config, indent=4).strip()) > 0:
+%   if docstrings and 'documentation' in attributes[attribute] and len(helper.get_documentation_for_node_docstring(attributes[attribute], config, indent=4).strip()) > 0:
     '''
     ${helper.get_documentation_for_node_docstring(attributes[attribute], config, indent=4)}
     '''
@@ -119,26 +241,130 @@ init_method_params = helper.get_params_snippet(init_function, helper.ParameterUs
 init_call_params = helper.get_params_snippet(init_function, helper.ParameterUsageOptions.SESSION_METHOD_CALL)
 %>\
 
-    def __init__(self, repeated_capability):
-        self._library = library_singleton.get()
+    def __init__(self, repeated_capability, attribute_cache, library, warning_policy, session_stats):
+        self._library = library
         self._repeated_capability = repeated_capability
+        self._attribute_cache = attribute_cache
+        self._warning_policy = warning_policy
+        self._session_stats = session_stats
         self._encoding = 'windows-1251'
+        # The driver does not modify it, so every call can pass the same buffer
+        self._repeated_capability_ctype = ctypes.create_string_buffer(repeated_capability.encode(self._encoding))
+        session_stats._add_session(self)
 
     def __setattr__(self, key, value):
-        if self._is_frozen and key not in dir(self):
+        if self._is_frozen and key not in self._get_attribute_names() and key not in self.__dict__:
             raise AttributeError("'{0}' object has no attribute '{1}'".format(type(self).__name__, key))
         object.__setattr__(self, key, value)
 
+    @property
+    def warning_policy(self):
+        '''warning_policy
+
+        How the session, and its repeated capabilities, report warnings from the driver. Change its mode to warn only
+        once per code, at most once per interval, or only count warnings:
+
+            session.warning_policy.mode = 'count'
+            ...
+            print(session.warning_policy.counts)
+
+        See errors.WarningPolicy.
+        '''
+        return self._warning_policy
+
+    @classmethod
+    def _get_attribute_names(cls):
+        '''_get_attribute_names
+
+        Returns a frozenset of the names of the properties and methods of the class, which can be set once the session
+        is frozen. It is computed once per class, because dir() is too slow to call every time a property is set.
+        '''
+        names = cls.__dict__.get('_attribute_names')
+        if names is None:
+            names = frozenset(dir(cls))
+            cls._attribute_names = names
+        return names
+
+    def _get_attribute_info(self, name_or_id):
+        try:
+            # type(u'') is unicode on Python 2
+            if isinstance(name_or_id, (str, type(u''))):
+                return attributes.index_by_name[name_or_id]
+            return attributes.index[name_or_id]
+        except KeyError:
+            raise ValueError('{0!r} is not an attribute of ${config['driver_name']}'.format(name_or_id))
+
+    def get_attributes(self, names_or_ids, channels=None):
+        '''get_attributes
+
+        Gets the values of many attributes in one call. It creates the ctypes objects once for each type of attribute,
+        instead of once for each attribute like the properties do.
+
+        Args:
+            names_or_ids (list of str or int): Python names (i.e. '${attributes[helper.sorted_attrs(attributes)[0]]['python_name']}') or IDs of the attributes
+
+            channels (str): Repeated capabilities (usually channels) to get the attributes for. If not specified, uses the
+                ones of this object, like the properties do.
+
+        Returns:
+            values (collections.OrderedDict): Value of each attribute, by Python name, in the same order as names_or_ids
+        '''
+        session = self if channels is None else _RepeatedCapability(self._${config['session_handle_parameter_name']}, channels, self._attribute_cache, self._library, self._warning_policy, self._session_stats)
+        return attributes.get_values(session, [self._get_attribute_info(a) for a in names_or_ids])
+
+    def snapshot(self):
+        '''snapshot
+
+        Gets the values of all the read-write attributes, to restore them later with apply(). Attributes that the driver
+        returns an error for (i.e. not supported by the device) and volatile attributes are left out.
+
+        Use it on a repeated capability (i.e. session['0'].snapshot()) to get the values of specific channels.
+
+        Returns:
+            values (collections.OrderedDict): Value of each attribute, by Python name
+        '''
+        infos = [a for a in sorted(attributes.index.values()) if a.access == 'read-write' and not a.volatile]
+        return attributes.get_values(self, infos, skip_errors=True)
+
+    def apply(self, values):
+        '''apply
+
+        Sets many attributes, i.e. from snapshot(), in order. It first gets the values of the attributes, and only sets
+        the ones that are different.
+
+        Args:
+            values (dict): Value of each attribute, by Python name or ID. Values of enum attributes must be members of
+                their enum.
+
+        Returns:
+            names (list of str): Python names of the attributes that were set
+        '''
+        infos_and_values = [(self._get_attribute_info(a), v) for a, v in values.items()]
+        current_values = attributes.get_values(self, [info for info, _ in infos_and_values if info.access != 'write only'], skip_errors=True)
+        changes = [(info, v) for info, v in infos_and_values if info.python_name not in current_values or current_values[info.python_name] != v]
+        attributes.set_values(self, changes)
+        return [info.python_name for info, _ in changes]
+
+    def _set_attributes(self, values):
+        '''Sets attributes from (Python name or ID, value) pairs, in order, without getting them first like apply() does'''
+        attributes.set_values(self, [(self._get_attribute_info(a), v) for a, v in values])
+
     def _get_error_description(self, error_code):
         '''_get_error_description
 
         Returns the error description.
+
+% if 'error_message' in functions:
+        errors retrieves descriptions only when they are used, when the last error of the session may be another one.
+        Those get the message for their code instead.
         '''
-        try:
-            _, error_string = self._get_error()
-            return error_string
-        except errors.Error:
-            pass
+        if error_code < 0:
+            try:
+                last_error_code, error_string = self._get_error()
+                if last_error_code == error_code:
+                    return error_string
+            except errors.Error:
+                pass
 
         try:
             '''
@@ -146,23 +372,57 @@ init_call_params = helper.get_params_snippet(init_function, helper.ParameterUsag
             (IVI spec requires GetError to fail).
             Use _error_message instead. It doesn't require a session.
             '''
-            error_string = self._error_message(error_code)
-            return error_string
+            return self._get_error_message(error_code)
         except errors.Error:
             return "Failed to retrieve error description."
+% else:
+        errors retrieves the description of warnings only when it is used, so the last error of the session may be another
+        one by then.
+        '''
+        try:
+            last_error_code, error_string = self._get_error()
+            if last_error_code == error_code:
+                return error_string
+        except errors.Error:
+            pass
+        return "Failed to retrieve error description."
+% endif
+% if 'error_message' in functions:
+
+    def _get_error_message(self, error_code):
+        '''_get_error_message
+
+        Returns _error_message(error_code), from the messages of the most recently used codes if it is there.
+        '''
+        with _error_messages_lock:
+            error_string = _error_messages.pop(error_code, None)
+            if error_string is not None:
+                _error_messages[error_code] = error_string
+                return error_string
+        error_string = self._error_message(error_code)
+        with _error_messages_lock:
+            _error_messages[error_code] = error_string
+            if len(_error_messages) > _MAX_ERROR_MESSAGES:
+                _error_messages.popitem(last=False)
+        return error_string
+% endif
 
     ''' These are code-generated '''
 
 % for func_name in sorted({k: v for k, v in functions.items() if v['has_repeated_capability'] or v['is_error_handling']}):
 ${render_method(functions[func_name])}
+%   if helper.has_into_method(functions[func_name]):
+${render_method(functions[func_name], into_method=True)}
+%   endif
 % endfor
 
 class _RepeatedCapability(_SessionBase):
     '''Allows for setting/getting properties and calling methods for specific repeated capabilities (such as channels) on your session.'''
 
-    def __init__(self, ${config['session_handle_parameter_name']}, repeated_capability):
-        super(_RepeatedCapability, self).__init__(repeated_capability)
+    def __init__(self, ${config['session_handle_parameter_name']}, repeated_capability, attribute_cache, library, warning_policy, session_stats):
+        super(_RepeatedCapability, self).__init__(repeated_capability, attribute_cache, library, warning_policy, session_stats)
         self._${config['session_handle_parameter_name']} = ${config['session_handle_parameter_name']}
+        self._${config['session_handle_parameter_name']}_ctype = visatype.ViSession(${config['session_handle_parameter_name']})
         self._is_frozen = True
 
 
@@ -170,9 +430,16 @@ class Session(_SessionBase):
     '''${config['session_class_description']}'''
 
     def __init__(${init_method_params}):
-        super(Session, self).__init__(repeated_capability='')
+        super(Session, self).__init__(repeated_capability='', attribute_cache=attributes.AttributeCache(), library=library_singleton.get(), warning_policy=errors.WarningPolicy(), session_stats=call_stats.SessionStats(_c_functions))
+        if call_stats.registry.enabled:
+            self._session_stats.enable()
+        self._repeated_capability_views = collections.OrderedDict()
+        self._repeated_capability_views_lock = threading.Lock()
         self._${config['session_handle_parameter_name']} = 0  # This must be set before calling ${init_function['python_name']}().
+        # Passed to every method, which would otherwise create it on every call
+        self._${config['session_handle_parameter_name']}_ctype = visatype.ViSession(0)
         self._${config['session_handle_parameter_name']} = self.${init_function['python_name']}(${init_call_params})
+        self._${config['session_handle_parameter_name']}_ctype = visatype.ViSession(self._${config['session_handle_parameter_name']})
         self._is_frozen = True
 
     def __enter__(self):
@@ -183,23 +450,97 @@ class Session(_SessionBase):
 
     def __getitem__(self, repeated_capability):
         '''Set/get properties or call methods with a repeated capability (i.e. channels)'''
-        return _RepeatedCapability(self._${config['session_handle_parameter_name']}, repeated_capability)
+        # The most recently used views are kept, so loops over channels don't create a view each time
+        with self._repeated_capability_views_lock:
+            view = self._repeated_capability_views.pop(repeated_capability, None)
+            if view is None:
+                view = _RepeatedCapability(self._${config['session_handle_parameter_name']}, repeated_capability, self._attribute_cache, self._library, self._warning_policy, self._session_stats)
+                if len(self._repeated_capability_views) >= _MAX_REPEATED_CAPABILITY_VIEWS:
+                    self._repeated_capability_views.popitem(last=False)
+            self._repeated_capability_views[repeated_capability] = view
+        return view
 
     def initiate(self):
         return ${session_context_manager}(self)
 
+    def enable_attribute_cache(self):
+        '''enable_attribute_cache
+
+        Caches the values of attributes in this session, and in its repeated capabilities, so that getting them again
+        doesn't call into the driver. Setting an attribute updates the cache. Methods that reset or configure the
+        session (i.e. reset(), commit() and configure methods) clear it.
+
+        Volatile attributes, whose values change on their own (i.e. status), are never cached.
+
+        Note:
+        Setting an attribute caches the value that was set. If the driver coerces it (i.e. up to a valid range), the
+        cache returns the value that was set until it is cleared. Calling enable_attribute_cache() again clears it.
+        '''
+        self._attribute_cache.clear()
+        self._attribute_cache.enabled = True
+
+    def disable_attribute_cache(self):
+        '''disable_attribute_cache
+
+        Stops caching the values of attributes, and clears the cache. See enable_attribute_cache().
+        '''
+        self._attribute_cache.enabled = False
+        self._attribute_cache.clear()
+
+    def enable_stats(self):
+        '''enable_stats
+
+        Starts recording statistics of the driver calls of this session, and of its repeated capabilities: for each C
+        function, the number of calls, their latencies, and how much of that time was spent in the driver and how much
+        in Python. Calling enable_stats() again clears them. See stats().
+
+        Methods are slower while stats are enabled. Set call_stats.registry.enabled to True to enable them for all new
+        sessions instead.
+        '''
+        self._session_stats.enable()
+
+    def disable_stats(self):
+        '''disable_stats
+
+        Stops recording statistics of the driver calls. stats() still returns the ones recorded. See enable_stats().
+        '''
+        self._session_stats.disable()
+
+    def stats(self):
+        '''stats
+
+        Returns the statistics of the driver calls recorded since enable_stats():
+
+            session.enable_stats()
+            ...
+            for function, s in session.stats().items():
+                print(function, s.calls, s.driver_time, s.python_time, s.percentile(99))
+
+        Returns:
+            stats (collections.OrderedDict): call_stats.FunctionStats by C function name, the one with the most total
+                time first
+        '''
+        return self._session_stats.stats()
+
     def close(self):
+        with self._repeated_capability_views_lock:
+            self._repeated_capability_views.clear()
         try:
             self._close()
         except errors.Error as e:
             self._${config['session_handle_parameter_name']} = 0
+            self._${config['session_handle_parameter_name']}_ctype = visatype.ViSession(0)
             raise
         self._${config['session_handle_parameter_name']} = 0
+        self._${config['session_handle_parameter_name']}_ctype = visatype.ViSession(0)
 
     ''' These are code-generated '''
 
 % for func_name in sorted({k: v for k, v in functions.items() if not v['has_repeated_capability'] and not v['is_error_handling']}):
 ${render_method(functions[func_name])}
+%   if helper.has_into_method(functions[func_name]):
+${render_method(functions[func_name], into_method=True)}
+%   endif
 % endfor
 
 
@@ -43,6 +43,10 @@ for f in sorted(functions):
         if len(param_list) == 0:
             param_list = " "
         table_contents.append((':py:func:`{0}`'.format(name), param_list))
+        if helper.has_into_method(functions[f]):
+            into_function = helper.get_into_method_function(functions[f])
+            into_param_list = helper.get_params_snippet(into_function, helper.ParameterUsageOptions.DOCUMENTATION_SESSION_METHOD)
+            table_contents.append((':py:func:`{0}`'.format(into_function['python_name']), into_param_list))
 
 table = helper.as_rest_table(table_contents)
 %>\
@@ -0,0 +1,95 @@
+# This file was generated
+<%
+import build.helper as helper
+
+config = template_parameters['metadata'].config
+attributes = config['attributes']
+enums = config['enums']
+
+module_name = config['module_name']
+c_function_prefix = config['c_function_prefix']
+driver_name = config['driver_name']
+
+functions = config['functions']
+functions = helper.filter_library_functions(functions)
+
+simulator = config.get('simulator', {})
+attribute_values = simulator.get('attribute_values', {})
+output_values = simulator.get('output_values', {})
+%>\
+'''Simulated ${driver_name} runtime, for testing and benchmarking without hardware.'''
+
+from ${module_name} import _simulation
+
+
+# (name, direction, type, is_buffer, size mechanism, index of the size parameter, default value) of every parameter of every function
+_functions = {
+% for func_name in sorted(functions):
+    '${c_function_prefix}${func_name}': (
+% for p in functions[func_name]['parameters']:
+<%
+    mechanism = p['size']['mechanism'] if p['is_buffer'] else None
+    size_index = None
+    if mechanism in ('ivi-dance', 'passed-in'):
+        size_index = [x['name'] for x in functions[func_name]['parameters']].index(p['size']['value'])
+    default = None
+    if p['enum'] in enums:
+        default = enums[p['enum']]['values'][0]['value']
+%>\
+        (${repr(p['name'])}, ${repr(p['direction'])}, ${repr(p['type'])}, ${p['is_buffer']}, ${repr(mechanism)}, ${size_index}, ${repr(default)}),
+% endfor
+    ),
+% endfor
+}
+
+# Value of every attribute until it is set
+_attributes = {
+% for attribute_id in sorted(attributes):
+<%
+    a = attributes[attribute_id]
+    if a['name'] in attribute_values:
+        value = attribute_values[a['name']]
+    elif a['enum'] in enums:
+        value = enums[a['enum']]['values'][0]['value']
+    elif a['type'] == 'ViBoolean':
+        value = False
+    elif a['type'] == 'ViReal64':
+        value = 0.0
+    elif a['type'] in ('ViString', 'ViConstString', 'ViRsrc'):
+        value = ''
+    else:
+        value = 0
+%>\
+    ${attribute_id}: ${repr(value)},  # ${a['name']}
+% endfor
+}
+
+# Values returned in output parameters, by function and parameter name. Output buffers that are not listed are
+# filled with synthetic data, and output counts (i.e. actualNumberOfPoints) return the number of elements written.
+_output_values = {
+% for func_name in sorted(output_values):
+    '${func_name}': ${repr(output_values[func_name])},
+% endfor
+}
+
+
+class Simulator(_simulation.SimulatedLibrary):
+    '''Simulator
+
+    Pure-Python stand-in for the ${driver_name} runtime. It keeps the value of attributes for each session and fills
+    output buffers with synthetic data. Pass an instance to library_singleton.set_backend() before creating sessions:
+
+        import ${module_name}.simulator
+        ${module_name}.library_singleton.set_backend(${module_name}.simulator.Simulator(latency=0.0001))
+
+    Args:
+        latency (float): Time, in seconds, that every function call sleeps for. Can be changed at any time.
+        array_size (int): Number of elements of output buffers that the driver sizes, i.e. with the IVI-dance
+        attribute_values (dict): Value of attributes, by attribute ID, until they are set
+        output_values (dict): Values returned in output parameters, by C function name without the prefix and
+            parameter name, i.e. {'ReadMultiPoint': {'readingArray': 1.5}}. A single value fills a whole buffer, and
+            a dict of field values fills every structure of a buffer of structures.
+    '''
+
+    def __init__(self, latency=0.0, array_size=1000, attribute_values=None, output_values=None):
+        super(Simulator, self).__init__('${c_function_prefix}', _functions, _attributes, _output_values, latency, array_size, attribute_values, output_values)
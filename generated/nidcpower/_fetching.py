@@ -0,0 +1,66 @@
+'''Fetching measurements into numpy arrays, as columns.'''
+
+import collections
+import threading
+
+
+# Name and numpy dtype of each column returned by fetch_multiple_columns()
+_COLUMNS = [('voltage', 'float64'), ('current', 'float64'), ('in_compliance', 'bool')]
+
+# Other dtype accepted in out for a column, that the driver fills in place
+_OUT_DTYPES = {'in_compliance': 'uint16'}
+
+
+class _ScratchArrays(threading.local):
+    '''Arrays that measurements are fetched into before they are converted. Each thread has its own.'''
+
+    def __init__(self):
+        self.in_compliance = None
+
+
+_scratch_arrays = _ScratchArrays()
+
+
+def _get_columns(out, count):
+    '''Returns the arrays of out, checked and cut to count elements'''
+    import numpy
+    columns = []
+    for name, dtype in _COLUMNS:
+        try:
+            column = out[name]
+        except KeyError:
+            raise ValueError('out must have an array for each of {0}, but has none for {1!r}'.format(', '.join(n for n, _ in _COLUMNS), name))
+        dtypes = [dtype] if name not in _OUT_DTYPES else [dtype, _OUT_DTYPES[name]]
+        if not isinstance(column, numpy.ndarray) or column.dtype not in [numpy.dtype(d) for d in dtypes]:
+            raise TypeError('out[{0!r}] must be a numpy.ndarray of {1}'.format(name, ' or '.join(dtypes)))
+        if len(column) < count:
+            raise ValueError('out[{0!r}] must have at least {1} elements, not {2}'.format(name, count, len(column)))
+        columns.append(column[:count])
+    return columns
+
+
+def _get_in_compliance_scratch_array(count):
+    '''Returns count elements of the uint16 array of this thread, grown if needed'''
+    import numpy
+    if _scratch_arrays.in_compliance is None or len(_scratch_arrays.in_compliance) < count:
+        _scratch_arrays.in_compliance = numpy.empty(count, numpy.uint16)
+    return _scratch_arrays.in_compliance[:count]
+
+
+def fetch_multiple_columns(session, count, timeout=1.0, out=None):
+    '''Behind nidcpower.Session.fetch_multiple_columns(). See the Session method for documentation.'''
+    import numpy
+    if out is None:
+        columns = [numpy.empty(count, dtype) for _, dtype in _COLUMNS]
+    else:
+        columns = _get_columns(out, count)
+    voltage, current, in_compliance = columns
+
+    if in_compliance.dtype == numpy.uint16:
+        actual_count = session.fetch_multiple_into(voltage, current, in_compliance, timeout)
+    else:
+        # The driver writes visatype.ViBoolean, which is 16-bit, and numpy.bool_ is 8-bit
+        in_compliance_values = _get_in_compliance_scratch_array(count)
+        actual_count = session.fetch_multiple_into(voltage, current, in_compliance_values, timeout)
+        numpy.not_equal(in_compliance_values[:actual_count], 0, out=in_compliance[:actual_count])
+    return collections.OrderedDict((name, column[:actual_count]) for (name, _), column in zip(_COLUMNS, columns))
@@ -0,0 +1,198 @@
+'''Pure-Python stand-in for the driver runtime. Used through the generated simulator module, to test and benchmark without hardware.'''
+
+import ctypes
+import itertools
+import math
+import time
+
+
+# Number of samples in one period of the synthetic sine wave
+_SINE_PERIOD = 100
+
+# Maximum number of buffer sizes to keep synthetic data for
+_MAX_SYNTHETIC_DATA = 32
+
+
+def _is_count_parameter(name):
+    '''Returns True for output parameters that return how many elements were written to an output buffer, i.e. actualNumberOfPoints'''
+    name = name.lower()
+    return name.startswith('actual') or name.endswith('read')
+
+
+def _generate_synthetic_data(element_type, size):
+    if element_type in (ctypes.c_double, ctypes.c_float):
+        return [math.sin(2 * math.pi * i / _SINE_PERIOD) for i in range(size)]
+    # Sawtooth that fits in any integer type
+    return [(i % 256) - 128 for i in range(size)]
+
+
+class SimulatedFunction(object):
+    '''Stands in for a ctypes function of the driver runtime
+
+    library.Library sets argtypes and restype on it like on a ctypes function, and calls it with the same ctypes arguments.
+    '''
+
+    def __init__(self, simulator, name, parameters):
+        self.argtypes = None
+        self.restype = None
+        self.name = name
+        self._simulator = simulator
+        self._parameters = parameters
+        base_name = name[len(simulator._c_function_prefix):]
+        if base_name.startswith('GetAttribute'):
+            self._implementation = simulator._get_attribute
+        elif base_name.startswith('SetAttribute'):
+            self._implementation = simulator._set_attribute
+        elif base_name in ('reset', 'ResetWithDefaults', 'ResetDevice'):
+            self._implementation = simulator._reset
+        elif base_name == 'close':
+            self._implementation = simulator._close
+        else:
+            self._implementation = simulator._call
+
+    def __call__(self, *args):
+        latency = self._simulator.latency
+        if latency > 0:
+            time.sleep(latency)
+        return self._implementation(self, args)
+
+
+class SimulatedLibrary(object):
+    '''Base class of the generated simulator.Simulator. See that class for documentation.'''
+
+    def __init__(self, c_function_prefix, functions, attributes, output_values, latency, array_size, attribute_values, user_output_values):
+        self.latency = latency
+        self.array_size = array_size
+        self._c_function_prefix = c_function_prefix
+        self._functions = functions
+        self._attribute_defaults = dict(attributes)
+        self._attribute_defaults.update(attribute_values or {})
+        self._output_values = dict((f, dict(v)) for f, v in output_values.items())
+        for f, v in (user_output_values or {}).items():
+            self._output_values.setdefault(f, {}).update(v)
+        self._sessions = {}
+        self._session_handles = itertools.count(1)
+        self._readings = itertools.count()
+        self._synthetic_data = {}
+
+    def __getattr__(self, name):
+        functions = self.__dict__.get('_functions', {})
+        if name not in functions:
+            raise AttributeError(name)
+        function = SimulatedFunction(self, name, functions[name])
+        # Cache it, so the next lookup doesn't get here
+        setattr(self, name, function)
+        return function
+
+    def set_attribute_value(self, attribute_id, value):
+        '''Changes the value of an attribute in every session, and in sessions created later, as the device would
+
+        Used to simulate attributes whose value changes on its own, i.e. status.
+        '''
+        self._attribute_defaults[attribute_id] = value
+        for state in self._sessions.values():
+            state[attribute_id] = {b'': value}
+
+    def _get_session_state(self, vi):
+        # Sessions are created on first use, so handles that did not come from this simulator also work
+        return self._sessions.setdefault(vi, {})
+
+    def _get_attribute(self, function, args):
+        # (vi, channelName, attributeId, attributeValue) or (vi, channelName, attributeId, bufSize, attributeValue)
+        values = self._get_session_state(args[0].value).get(args[2].value, {})
+        # For a channel list, the value of the first channel
+        channel = args[1].value.split(b',')[0].strip()
+        value = values.get(channel, values.get(b'', self._attribute_defaults.get(args[2].value, 0)))
+        if len(args) == 5:
+            return self._write_string(value, args[3].value, args[4])
+        args[3].contents.value = value
+        return 0
+
+    def _set_attribute(self, function, args):
+        # (vi, channelName, attributeId, attributeValue)
+        state = self._get_session_state(args[0].value)
+        channel = args[1].value
+        # Strings are passed as bytes
+        value = args[3] if isinstance(args[3], bytes) else args[3].value
+        if len(channel) == 0:
+            # Setting all channels replaces any channel specific value
+            state[args[2].value] = {b'': value}
+        else:
+            values = state.setdefault(args[2].value, {})
+            for c in channel.split(b','):
+                values[c.strip()] = value
+        return 0
+
+    def _reset(self, function, args):
+        self._sessions[args[0].value] = {}
+        return 0
+
+    def _close(self, function, args):
+        self._sessions.pop(args[0].value, None)
+        return 0
+
+    def _write_string(self, value, buffer_size, buffer):
+        '''Writes value to a ViChar buffer, using the IVI-dance: returns the size needed if buffer_size is too small'''
+        if not isinstance(value, bytes):
+            value = value.encode('ascii')
+        if buffer_size == 0 or buffer is None:
+            return len(value) + 1
+        truncated = value[:buffer_size - 1]
+        ctypes.memmove(buffer, truncated + b'\0', len(truncated) + 1)
+        return 0 if len(truncated) == len(value) else len(value) + 1
+
+    def _fill(self, buffer, value):
+        '''Fills an output buffer with value, or with synthetic data if value is None. Returns the number of elements written.'''
+        size = len(buffer)
+        element_type = buffer._type_
+        if issubclass(element_type, ctypes.Structure):
+            for field, field_value in (value or {}).items():
+                for i in range(size):
+                    setattr(buffer[i], field, field_value)
+            return size
+        key = (element_type, size, value)
+        data = self._synthetic_data.get(key)
+        if data is None:
+            if len(self._synthetic_data) >= _MAX_SYNTHETIC_DATA:
+                self._synthetic_data.clear()
+            elements = _generate_synthetic_data(element_type, size) if value is None else [value] * size
+            data = (element_type * size)(*elements)
+            self._synthetic_data[key] = data
+        ctypes.memmove(buffer, data, ctypes.sizeof(data))
+        return size
+
+    def _call(self, function, args):
+        output_values = self._output_values.get(function.name[len(self._c_function_prefix):], {})
+        count = 0
+        for arg, (name, direction, visa_type, is_buffer, mechanism, size_index, default) in zip(args, function._parameters):
+            if direction != 'out':
+                continue
+            value = output_values.get(name, default)
+            if value is None and visa_type == 'ViBoolean':
+                value = False
+            if visa_type == 'ViChar':
+                if mechanism == 'ivi-dance':
+                    buffer_size = args[size_index].value
+                    status = self._write_string(value or b'', buffer_size, arg)
+                    if status > 0:
+                        return status
+                else:
+                    self._write_string(value or b'', len(arg), arg)
+            elif is_buffer:
+                if mechanism == 'ivi-dance' and args[size_index].value == 0:
+                    return self.array_size
+                count = self._fill(arg, value)
+            elif visa_type == 'ViSession':
+                session = next(self._session_handles)
+                self._get_session_state(session)
+                arg.contents.value = session
+            elif isinstance(arg.contents, ctypes.Structure):
+                pass
+            elif value is None and _is_count_parameter(name):
+                arg.contents.value = count
+            elif value is None and visa_type == 'ViReal64':
+                # Readings follow the same sine wave as the synthetic waveforms
+                arg.contents.value = math.sin(2 * math.pi * next(self._readings) / _SINE_PERIOD)
+            else:
+                arg.contents.value = value if value is not None else 0
+        return 0
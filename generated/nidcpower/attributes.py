@@ -1,68 +1,132 @@
 # -*- coding: utf-8 -*-
 # This file was generated
+import collections
+import ctypes
+
+from nidcpower import enums
+from nidcpower import errors
+from nidcpower import visatype
+
+
+class AttributeCache(object):
+    '''Values of the attributes of a session, by attribute ID and repeated capability.
+
+    Shared by a session and all its repeated capabilities. Disabled until the session enables it. generation counts how
+    many times it was cleared, so that others can tell when the values of attributes may have changed.
+    '''
+
+    def __init__(self):
+        self.enabled = False
+        self.values = {}
+        self.generation = 0
+
+    def clear(self):
+        self.values.clear()
+        self.generation += 1
 
 
 class Attribute(object):
     '''Base class for all typed attributes.'''
 
-    def __init__(self, attribute_id):
+    def __init__(self, attribute_id, volatile=False):
         self._attribute_id = attribute_id
+        self._volatile = volatile
+
+    def _convert(self, value):
+        '''Returns value as the type that the getter returns, so the cache returns the same thing the driver would'''
+        return value
+
+    def _get(self, session, getter):
+        cache = session._attribute_cache
+        if not cache.enabled or self._volatile:
+            return getter(self._attribute_id)
+        values = cache.values.get(self._attribute_id)
+        if values is not None and session._repeated_capability in values:
+            return values[session._repeated_capability]
+        value = getter(self._attribute_id)
+        cache.values.setdefault(self._attribute_id, {})[session._repeated_capability] = value
+        return value
+
+    def _set(self, session, setter, value):
+        setter(self._attribute_id, value)
+        cache = session._attribute_cache
+        if cache.enabled and not self._volatile:
+            # Write-through. Values cached for other repeated capabilities are dropped, since they may overlap
+            cache.values[self._attribute_id] = {session._repeated_capability: self._convert(value)}
 
 
 class AttributeViInt32(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_int32(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_int32)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_int32(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_int32, value)
+
+    def _convert(self, value):
+        return int(value)
 
 
 class AttributeViInt64(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_int64(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_int64)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_int64(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_int64, value)
+
+    def _convert(self, value):
+        return int(value)
 
 
 class AttributeViReal64(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_real64(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_real64)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_real64(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_real64, value)
+
+    def _convert(self, value):
+        return float(value)
 
 
 class AttributeViString(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_string(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_string)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_string(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_string, value)
 
 
 class AttributeViBoolean(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_boolean(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_boolean)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_boolean(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_boolean, value)
+
+    def _convert(self, value):
+        return bool(value)
 
 
 class AttributeEnum(object):
 
-    def __init__(self, underlying_attribute_meta_class, enum_meta_class, attribute_id):
-        self._underlying_attribute = underlying_attribute_meta_class(attribute_id)
+    def __init__(self, underlying_attribute_meta_class, enum_meta_class, attribute_id, volatile=False):
+        self._underlying_attribute = underlying_attribute_meta_class(attribute_id, volatile)
         self._attribute_type = enum_meta_class
         self._attribute_id = attribute_id
+        self._members_by_value = enums._members_by_value[enum_meta_class]
 
     def __get__(self, session, session_type):
-        return self._attribute_type(self._underlying_attribute.__get__(session, session_type))
+        value = self._underlying_attribute.__get__(session, session_type)
+        try:
+            return self._members_by_value[value]
+        except KeyError:
+            # Raises ValueError, as the enum does for values it doesn't have
+            return self._attribute_type(value)
 
     def __set__(self, session, value):
         if type(value) is not self._attribute_type:
@@ -70,3 +134,246 @@ class AttributeEnum(object):
         return self._underlying_attribute.__set__(session, value.value)
 
 
+# (attribute_id, python_name, type, enum, channel_based, access, volatile) of an attribute. enum is the enum class or None,
+# channel_based is True if it can be used with repeated capabilities, and access is 'read-write', 'read only' or 'write only'.
+AttributeInfo = collections.namedtuple('AttributeInfo', ['attribute_id', 'python_name', 'type', 'enum', 'channel_based', 'access', 'volatile'])
+
+# Every attribute of NI-DCPower, by attribute ID
+index = {
+    1050002: AttributeInfo(1050002, 'range_check', 'ViBoolean', None, False, 'read-write', False),
+    1050003: AttributeInfo(1050003, 'query_instrument_status', 'ViBoolean', None, False, 'read-write', False),
+    1050004: AttributeInfo(1050004, 'cache', 'ViBoolean', None, False, 'read-write', False),
+    1050005: AttributeInfo(1050005, 'simulate', 'ViBoolean', None, False, 'read-write', False),
+    1050006: AttributeInfo(1050006, 'record_coercions', 'ViBoolean', None, False, 'read-write', False),
+    1050007: AttributeInfo(1050007, 'driver_setup', 'ViString', None, False, 'read only', False),
+    1050021: AttributeInfo(1050021, 'interchange_check', 'ViBoolean', None, False, 'read-write', False),
+    1050203: AttributeInfo(1050203, 'channel_count', 'ViInt32', None, False, 'read only', False),
+    1050302: AttributeInfo(1050302, 'specific_driver_prefix', 'ViString', None, False, 'read only', False),
+    1050304: AttributeInfo(1050304, 'io_resource_descriptor', 'ViString', None, False, 'read only', False),
+    1050305: AttributeInfo(1050305, 'logical_name', 'ViString', None, False, 'read only', False),
+    1050327: AttributeInfo(1050327, 'supported_instrument_models', 'ViString', None, False, 'read only', False),
+    1050401: AttributeInfo(1050401, 'group_capabilities', 'ViString', None, False, 'read only', False),
+    1050510: AttributeInfo(1050510, 'instrument_firmware_revision', 'ViString', None, False, 'read only', False),
+    1050511: AttributeInfo(1050511, 'instrument_manufacturer', 'ViString', None, False, 'read only', False),
+    1050512: AttributeInfo(1050512, 'instrument_model', 'ViString', None, False, 'read only', False),
+    1050513: AttributeInfo(1050513, 'specific_driver_vendor', 'ViString', None, False, 'read only', False),
+    1050514: AttributeInfo(1050514, 'specific_driver_description', 'ViString', None, False, 'read only', False),
+    1050515: AttributeInfo(1050515, 'specific_driver_class_spec_major_version', 'ViInt32', None, False, 'read only', False),
+    1050516: AttributeInfo(1050516, 'specific_driver_class_spec_minor_version', 'ViInt32', None, False, 'read only', False),
+    1050551: AttributeInfo(1050551, 'specific_driver_revision', 'ViString', None, False, 'read only', False),
+    1150000: AttributeInfo(1150000, 'power_source', 'ViInt32', enums.PowerSource, False, 'read-write', False),
+    1150001: AttributeInfo(1150001, 'power_source_in_use', 'ViInt32', enums.PowerSourceInUse, False, 'read only', True),
+    1150002: AttributeInfo(1150002, 'auxiliary_power_source_available', 'ViBoolean', None, False, 'read only', True),
+    1150003: AttributeInfo(1150003, 'samples_to_average', 'ViInt32', None, True, 'read-write', False),
+    1150004: AttributeInfo(1150004, 'current_limit_range', 'ViReal64', None, True, 'read-write', False),
+    1150005: AttributeInfo(1150005, 'voltage_level_range', 'ViReal64', None, True, 'read-write', False),
+    1150006: AttributeInfo(1150006, 'reset_average_before_measurement', 'ViBoolean', None, True, 'read-write', False),
+    1150007: AttributeInfo(1150007, 'overranging_enabled', 'ViBoolean', None, False, 'read-write', False),
+    1150008: AttributeInfo(1150008, 'output_function', 'ViInt32', enums.OutputFunction, True, 'read-write', False),
+    1150009: AttributeInfo(1150009, 'current_level', 'ViReal64', None, True, 'read-write', False),
+    1150010: AttributeInfo(1150010, 'voltage_limit', 'ViReal64', None, True, 'read-write', False),
+    1150011: AttributeInfo(1150011, 'current_level_range', 'ViReal64', None, True, 'read-write', False),
+    1150012: AttributeInfo(1150012, 'voltage_limit_range', 'ViReal64', None, True, 'read-write', False),
+    1150013: AttributeInfo(1150013, 'sense', 'ViInt32', enums.Sense, True, 'read-write', False),
+    1150014: AttributeInfo(1150014, 'output_capacitance', 'ViInt32', enums.OutputCapacitance, True, 'read-write', False),
+    1150015: AttributeInfo(1150015, 'voltage_level_autorange', 'ViInt32', enums.VoltageLevelAutorange, True, 'read-write', False),
+    1150016: AttributeInfo(1150016, 'current_limit_autorange', 'ViInt32', enums.CurrentLimitAutorange, True, 'read-write', False),
+    1150017: AttributeInfo(1150017, 'current_level_autorange', 'ViInt32', enums.CurrentLevelAutorange, True, 'read-write', False),
+    1150018: AttributeInfo(1150018, 'voltage_limit_autorange', 'ViInt32', enums.VoltageLimitAutorange, True, 'read-write', False),
+    1150020: AttributeInfo(1150020, 'power_line_frequency', 'ViReal64', enums.PowerLineFrequency, True, 'read-write', False),
+    1150021: AttributeInfo(1150021, 'start_trigger_type', 'ViInt32', enums.TriggerType, False, 'read-write', False),
+    1150022: AttributeInfo(1150022, 'digital_edge_start_trigger_edge', 'ViInt32', enums.DigitalEdge, False, 'read-write', False),
+    1150023: AttributeInfo(1150023, 'digital_edge_start_trigger_input_terminal', 'ViString', None, False, 'read-write', False),
+    1150024: AttributeInfo(1150024, 'exported_start_trigger_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150025: AttributeInfo(1150025, 'sequence_loop_count', 'ViInt32', None, False, 'read-write', False),
+    1150026: AttributeInfo(1150026, 'sequence_advance_trigger_type', 'ViInt32', enums.TriggerType, False, 'read-write', False),
+    1150027: AttributeInfo(1150027, 'digital_edge_sequence_advance_trigger_edge', 'ViInt32', enums.DigitalEdge, False, 'read-write', False),
+    1150028: AttributeInfo(1150028, 'digital_edge_sequence_advance_trigger_input_terminal', 'ViString', None, False, 'read-write', False),
+    1150029: AttributeInfo(1150029, 'exported_sequence_advance_trigger_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150030: AttributeInfo(1150030, 'source_trigger_type', 'ViInt32', enums.TriggerType, False, 'read-write', False),
+    1150031: AttributeInfo(1150031, 'digital_edge_source_trigger_edge', 'ViInt32', enums.DigitalEdge, False, 'read-write', False),
+    1150032: AttributeInfo(1150032, 'digital_edge_source_trigger_input_terminal', 'ViString', None, False, 'read-write', False),
+    1150033: AttributeInfo(1150033, 'exported_source_trigger_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150034: AttributeInfo(1150034, 'measure_trigger_type', 'ViInt32', enums.TriggerType, False, 'read-write', False),
+    1150035: AttributeInfo(1150035, 'digital_edge_measure_trigger_edge', 'ViInt32', enums.DigitalEdge, False, 'read-write', False),
+    1150036: AttributeInfo(1150036, 'digital_edge_measure_trigger_input_terminal', 'ViString', None, False, 'read-write', False),
+    1150037: AttributeInfo(1150037, 'exported_measure_trigger_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150038: AttributeInfo(1150038, 'sequence_iteration_complete_event_pulse_polarity', 'ViInt32', enums.Polarity, False, 'read-write', False),
+    1150039: AttributeInfo(1150039, 'sequence_iteration_complete_event_pulse_width', 'ViReal64', None, False, 'read-write', False),
+    1150040: AttributeInfo(1150040, 'sequence_iteration_complete_event_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150041: AttributeInfo(1150041, 'source_complete_event_pulse_polarity', 'ViInt32', enums.Polarity, False, 'read-write', False),
+    1150042: AttributeInfo(1150042, 'source_complete_event_pulse_width', 'ViReal64', None, False, 'read-write', False),
+    1150043: AttributeInfo(1150043, 'source_complete_event_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150044: AttributeInfo(1150044, 'measure_complete_event_pulse_polarity', 'ViInt32', enums.Polarity, False, 'read-write', False),
+    1150045: AttributeInfo(1150045, 'measure_complete_event_pulse_width', 'ViReal64', None, False, 'read-write', False),
+    1150046: AttributeInfo(1150046, 'measure_complete_event_delay', 'ViReal64', None, False, 'read-write', False),
+    1150047: AttributeInfo(1150047, 'measure_complete_event_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150048: AttributeInfo(1150048, 'sequence_engine_done_event_pulse_polarity', 'ViInt32', enums.Polarity, False, 'read-write', False),
+    1150049: AttributeInfo(1150049, 'sequence_engine_done_event_pulse_width', 'ViReal64', None, False, 'read-write', False),
+    1150050: AttributeInfo(1150050, 'sequence_engine_done_event_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150051: AttributeInfo(1150051, 'source_delay', 'ViReal64', None, True, 'read-write', False),
+    1150054: AttributeInfo(1150054, 'source_mode', 'ViInt32', enums.SourceMode, False, 'read-write', False),
+    1150055: AttributeInfo(1150055, 'auto_zero', 'ViInt32', enums.AutoZero, True, 'read-write', False),
+    1150056: AttributeInfo(1150056, 'fetch_backlog', 'ViInt32', None, False, 'read only', True),
+    1150057: AttributeInfo(1150057, 'measure_when', 'ViInt32', enums.MeasureWhen, False, 'read-write', False),
+    1150058: AttributeInfo(1150058, 'aperture_time', 'ViReal64', None, True, 'read-write', False),
+    1150059: AttributeInfo(1150059, 'aperture_time_units', 'ViInt32', enums.ApertureTimeUnits, True, 'read-write', False),
+    1150060: AttributeInfo(1150060, 'output_connected', 'ViBoolean', None, True, 'read-write', False),
+    1150061: AttributeInfo(1150061, 'output_resistance', 'ViReal64', None, True, 'read-write', False),
+    1150062: AttributeInfo(1150062, 'transient_response', 'ViInt32', enums.TransientResponse, True, 'read-write', False),
+    1150063: AttributeInfo(1150063, 'measure_record_length', 'ViInt32', None, False, 'read-write', False),
+    1150064: AttributeInfo(1150064, 'measure_record_length_is_finite', 'ViBoolean', None, False, 'read-write', False),
+    1150065: AttributeInfo(1150065, 'measure_record_delta_time', 'ViReal64', None, False, 'read only', False),
+    1150066: AttributeInfo(1150066, 'dc_noise_rejection', 'ViInt32', enums.DCNoiseRejection, False, 'read-write', False),
+    1150067: AttributeInfo(1150067, 'voltage_gain_bandwidth', 'ViReal64', None, True, 'read-write', False),
+    1150068: AttributeInfo(1150068, 'voltage_compensation_frequency', 'ViReal64', None, True, 'read-write', False),
+    1150069: AttributeInfo(1150069, 'voltage_pole_zero_ratio', 'ViReal64', None, True, 'read-write', False),
+    1150070: AttributeInfo(1150070, 'current_gain_bandwidth', 'ViReal64', None, True, 'read-write', False),
+    1150071: AttributeInfo(1150071, 'current_compensation_frequency', 'ViReal64', None, True, 'read-write', False),
+    1150072: AttributeInfo(1150072, 'current_pole_zero_ratio', 'ViReal64', None, True, 'read-write', False),
+    1150073: AttributeInfo(1150073, 'self_calibration_persistence', 'ViInt32', enums.SelfCalibrationPersistence, False, 'read-write', False),
+    1150074: AttributeInfo(1150074, 'active_advanced_sequence', 'ViString', None, True, 'read-write', False),
+    1150075: AttributeInfo(1150075, 'active_advanced_sequence_step', 'ViInt64', None, True, 'read-write', False),
+    1150077: AttributeInfo(1150077, 'measure_buffer_size', 'ViInt32', None, False, 'read-write', False),
+    1150078: AttributeInfo(1150078, 'sequence_loop_count_is_finite', 'ViBoolean', None, False, 'read-write', False),
+    1150080: AttributeInfo(1150080, 'pulse_voltage_level', 'ViReal64', None, True, 'read-write', False),
+    1150081: AttributeInfo(1150081, 'pulse_current_limit', 'ViReal64', None, True, 'read-write', False),
+    1150082: AttributeInfo(1150082, 'pulse_bias_voltage_level', 'ViReal64', None, True, 'read-write', False),
+    1150083: AttributeInfo(1150083, 'pulse_bias_current_limit', 'ViReal64', None, True, 'read-write', False),
+    1150084: AttributeInfo(1150084, 'pulse_voltage_level_range', 'ViReal64', None, True, 'read-write', False),
+    1150085: AttributeInfo(1150085, 'pulse_current_limit_range', 'ViReal64', None, True, 'read-write', False),
+    1150086: AttributeInfo(1150086, 'pulse_current_level', 'ViReal64', None, True, 'read-write', False),
+    1150087: AttributeInfo(1150087, 'pulse_voltage_limit', 'ViReal64', None, True, 'read-write', False),
+    1150088: AttributeInfo(1150088, 'pulse_bias_current_level', 'ViReal64', None, True, 'read-write', False),
+    1150089: AttributeInfo(1150089, 'pulse_bias_voltage_limit', 'ViReal64', None, True, 'read-write', False),
+    1150090: AttributeInfo(1150090, 'pulse_current_level_range', 'ViReal64', None, True, 'read-write', False),
+    1150091: AttributeInfo(1150091, 'pulse_voltage_limit_range', 'ViReal64', None, True, 'read-write', False),
+    1150092: AttributeInfo(1150092, 'pulse_bias_delay', 'ViReal64', None, True, 'read-write', False),
+    1150093: AttributeInfo(1150093, 'pulse_on_time', 'ViReal64', None, True, 'read-write', False),
+    1150094: AttributeInfo(1150094, 'pulse_off_time', 'ViReal64', None, True, 'read-write', False),
+    1150095: AttributeInfo(1150095, 'pulse_trigger_type', 'ViInt32', enums.TriggerType, False, 'read-write', False),
+    1150096: AttributeInfo(1150096, 'digital_edge_pulse_trigger_edge', 'ViInt32', enums.DigitalEdge, False, 'read-write', False),
+    1150097: AttributeInfo(1150097, 'digital_edge_pulse_trigger_input_terminal', 'ViString', None, False, 'read-write', False),
+    1150098: AttributeInfo(1150098, 'exported_pulse_trigger_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150099: AttributeInfo(1150099, 'pulse_complete_event_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150100: AttributeInfo(1150100, 'pulse_complete_event_pulse_polarity', 'ViInt32', enums.Polarity, False, 'read-write', False),
+    1150101: AttributeInfo(1150101, 'pulse_complete_event_pulse_width', 'ViReal64', None, False, 'read-write', False),
+    1150102: AttributeInfo(1150102, 'ready_for_pulse_trigger_event_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150103: AttributeInfo(1150103, 'ready_for_pulse_trigger_event_pulse_polarity', 'ViInt32', enums.Polarity, False, 'read-write', False),
+    1150104: AttributeInfo(1150104, 'ready_for_pulse_trigger_event_pulse_width', 'ViReal64', None, False, 'read-write', False),
+    1150105: AttributeInfo(1150105, 'interlock_input_open', 'ViBoolean', None, False, 'read only', True),
+    1250001: AttributeInfo(1250001, 'voltage_level', 'ViReal64', None, True, 'read-write', False),
+    1250002: AttributeInfo(1250002, 'ovp_enabled', 'ViBoolean', None, False, 'read-write', False),
+    1250003: AttributeInfo(1250003, 'ovp_limit', 'ViReal64', None, False, 'read-write', False),
+    1250005: AttributeInfo(1250005, 'current_limit', 'ViReal64', None, True, 'read-write', False),
+    1250006: AttributeInfo(1250006, 'output_enabled', 'ViBoolean', None, True, 'read-write', False),
+}
+
+# Every attribute of NI-DCPower, by python_name
+index_by_name = dict((a.python_name, a) for a in index.values())
+
+# ctypes type and conversion of the attribute types that _BulkAccessor can get and set
+_bulk_types = {
+    'ViBoolean': (visatype.ViBoolean, bool),
+    'ViInt32': (visatype.ViInt32, int),
+    'ViInt64': (visatype.ViInt64, int),
+    'ViReal64': (visatype.ViReal64, float),
+}
+
+# Session methods that get and set the attribute types that _BulkAccessor can't
+_accessor_methods = {
+    'ViString': ('_get_attribute_vi_string', '_set_attribute_vi_string'),
+}
+
+
+class _BulkAccessor(object):
+    '''Gets and sets attributes of one type, reusing the same ctypes objects for all of them'''
+
+    def __init__(self, session, attribute_type):
+        ctype, self.convert = _bulk_types[attribute_type]
+        self._session = session
+        self._get_function = getattr(session._library, 'niDCPower_GetAttribute' + attribute_type)
+        self._set_function = getattr(session._library, 'niDCPower_SetAttribute' + attribute_type)
+        self._vi_ctype = visatype.ViSession(session._vi)
+        self._attribute_id_ctype = visatype.ViAttr()
+        self._value_ctype = ctype()
+        self._value_reference = ctypes.pointer(self._value_ctype)
+
+    def get(self, attribute_id):
+        self._attribute_id_ctype.value = attribute_id
+        error_code = self._get_function(self._vi_ctype, self._session._repeated_capability_ctype, self._attribute_id_ctype, self._value_reference)
+        errors.handle_error(self._session, error_code, ignore_warnings=False, is_error_handling=False)
+        return self.convert(self._value_ctype.value)
+
+    def set(self, attribute_id, value):
+        self._attribute_id_ctype.value = attribute_id
+        self._value_ctype.value = value
+        error_code = self._set_function(self._vi_ctype, self._session._repeated_capability_ctype, self._attribute_id_ctype, self._value_ctype)
+        errors.handle_error(self._session, error_code, ignore_warnings=False, is_error_handling=False)
+
+
+class _MethodAccessor(object):
+    '''Gets and sets attributes of one type through the session methods, i.e. for strings'''
+
+    def __init__(self, session, attribute_type):
+        get_method, set_method = _accessor_methods[attribute_type]
+        self.get = getattr(session, get_method)
+        self.set = getattr(session, set_method)
+
+    def convert(self, value):
+        return value
+
+
+def _get_accessor(session, accessors, attribute_type):
+    accessor = accessors.get(attribute_type)
+    if accessor is None:
+        accessor = _BulkAccessor(session, attribute_type) if attribute_type in _bulk_types else _MethodAccessor(session, attribute_type)
+        accessors[attribute_type] = accessor
+    return accessor
+
+
+def get_values(session, infos, skip_errors=False):
+    '''Returns an OrderedDict of the values of the attributes in infos, by python_name
+
+    Uses and updates the attribute cache the same way the properties do. If skip_errors is True, attributes that the
+    driver returns an error for are left out instead of raising.
+    '''
+    cache = session._attribute_cache
+    repeated_capability = session._repeated_capability
+    accessors = {}
+    values = collections.OrderedDict()
+    for info in infos:
+        use_cache = cache.enabled and not info.volatile
+        cached = cache.values.get(info.attribute_id) if use_cache else None
+        if cached is not None and repeated_capability in cached:
+            value = cached[repeated_capability]
+        else:
+            try:
+                value = _get_accessor(session, accessors, info.type).get(info.attribute_id)
+            except errors.Error:
+                if skip_errors:
+                    continue
+                raise
+            if use_cache:
+                cache.values.setdefault(info.attribute_id, {})[repeated_capability] = value
+        values[info.python_name] = value if info.enum is None else enums._get_member(info.enum, value)
+    return values
+
+
+def set_values(session, infos_and_values):
+    '''Sets attributes from (info, value) pairs, in order
+
+    Values of enum attributes must be members of their enum. Updates the attribute cache the same way the properties do.
+    '''
+    cache = session._attribute_cache
+    accessors = {}
+    for info, value in infos_and_values:
+        if info.enum is not None:
+            if type(value) is not info.enum:
+                raise TypeError('{0} must be {1} not {2}'.format(info.python_name, info.enum.__name__, type(value).__name__))
+            value = value.value
+        accessor = _get_accessor(session, accessors, info.type)
+        accessor.set(info.attribute_id, value)
+        if cache.enabled and not info.volatile:
+            cache.values[info.attribute_id] = {session._repeated_capability: accessor.convert(value)}
+
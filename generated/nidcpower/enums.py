@@ -1,3 +1,4 @@
+# -*- coding: utf-8 -*-
 # This file was generated
 
 from enum import Enum
@@ -297,3 +298,42 @@ class VoltageLimitAutorange(Enum):
     '''
     Autoranging is enabled.
     '''
+
+
+# Members of each enum by value. Looking a value from the driver up in these is much faster than calling the enum with it.
+_members_by_value = {
+    ApertureTimeUnits: dict((member.value, member) for member in ApertureTimeUnits),
+    AutoZero: dict((member.value, member) for member in AutoZero),
+    CurrentLevelAutorange: dict((member.value, member) for member in CurrentLevelAutorange),
+    CurrentLimitAutorange: dict((member.value, member) for member in CurrentLimitAutorange),
+    CurrentLimitBehavior: dict((member.value, member) for member in CurrentLimitBehavior),
+    DCNoiseRejection: dict((member.value, member) for member in DCNoiseRejection),
+    DigitalEdge: dict((member.value, member) for member in DigitalEdge),
+    Event: dict((member.value, member) for member in Event),
+    MeasureWhen: dict((member.value, member) for member in MeasureWhen),
+    MeasurementTypes: dict((member.value, member) for member in MeasurementTypes),
+    OutputCapacitance: dict((member.value, member) for member in OutputCapacitance),
+    OutputFunction: dict((member.value, member) for member in OutputFunction),
+    OutputStates: dict((member.value, member) for member in OutputStates),
+    Polarity: dict((member.value, member) for member in Polarity),
+    PowerLineFrequency: dict((member.value, member) for member in PowerLineFrequency),
+    PowerSource: dict((member.value, member) for member in PowerSource),
+    PowerSourceInUse: dict((member.value, member) for member in PowerSourceInUse),
+    SelfCalibrationPersistence: dict((member.value, member) for member in SelfCalibrationPersistence),
+    SendSoftwareEdgeTriggerType: dict((member.value, member) for member in SendSoftwareEdgeTriggerType),
+    Sense: dict((member.value, member) for member in Sense),
+    SourceMode: dict((member.value, member) for member in SourceMode),
+    TransientResponse: dict((member.value, member) for member in TransientResponse),
+    TriggerType: dict((member.value, member) for member in TriggerType),
+    VoltageLevelAutorange: dict((member.value, member) for member in VoltageLevelAutorange),
+    VoltageLimitAutorange: dict((member.value, member) for member in VoltageLimitAutorange),
+}
+
+
+def _get_member(enum_type, value):
+    '''Returns the member of enum_type that has value, like enum_type(value)'''
+    try:
+        return _members_by_value[enum_type][value]
+    except KeyError:
+        # Raises ValueError, as the enum does for values it doesn't have
+        return enum_type(value)
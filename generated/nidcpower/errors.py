@@ -3,6 +3,8 @@
 
 
 import platform
+import threading
+import time
 import warnings
 
 
@@ -18,13 +20,35 @@ def _is_warning(code):
     return (code > 0)
 
 
-class _ErrorBase(Exception):
+class _LazyDescription(object):
+    '''Base of the exceptions of the driver, whose description can be a function that returns it, so it is only retrieved if it is used
 
-    def __init__(self, code, description):
+    args is the same as if the message had been passed to Exception.
+    '''
 
+    def __init__(self, code, description):
         self.code = code
-        self.description = description
-        super(_ErrorBase, self).__init__(str(self.code) + ": " + self.description)
+        self._description = description
+        super(_LazyDescription, self).__init__()
+
+    @property
+    def description(self):
+        if callable(self._description):
+            self._description = self._description()
+        return self._description
+
+    @property
+    def args(self):
+        return (str(self),)
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(type(self).__name__, str(self))
+
+
+class _ErrorBase(_LazyDescription, Exception):
+
+    def __str__(self):
+        return str(self.code) + ": " + self.description
 
 
 class Error(_ErrorBase):
@@ -35,12 +59,15 @@ class Error(_ErrorBase):
         super(Error, self).__init__(code, description)
 
 
-class NidcpowerWarning(Warning):
+class NidcpowerWarning(_LazyDescription, Warning):
     '''A warning originating from the NI-DCPower driver'''
 
     def __init__(self, code, description):
         assert (_is_warning(code)), "Should not create Warning if code is not positive."
-        super(NidcpowerWarning, self).__init__('Warning {0} occurred.\n\n{1}'.format(code, description))
+        super(NidcpowerWarning, self).__init__(code, description)
+
+    def __str__(self):
+        return 'Warning {0} occurred.\n\n{1}'.format(self.code, self.description)
 
 
 class UnsupportedConfigurationError(Exception):
@@ -57,6 +84,70 @@ class DriverNotInstalledError(Exception):
         super(DriverNotInstalledError, self).__init__('The NI-DCPower runtime is not installed. Please visit http://www.ni.com/downloads/drivers/ to download and install it.')
 
 
+class WarningPolicy(object):
+    '''How a session reports warnings from the driver
+
+    Every warning is counted by code, in counts, whatever the mode. mode is one of:
+
+    - 'always': Warns every time. This is the default.
+    - 'once': Warns the first time each code occurs.
+    - 'rate_limited': Warns at most once every interval seconds for each code.
+    - 'count': Never warns. The driver isn't asked for descriptions either.
+
+    Args:
+        mode (str): One of the modes above
+        interval (float): Seconds between warnings of the same code, for 'rate_limited'
+    '''
+
+    _modes = ('always', 'once', 'rate_limited', 'count')
+
+    def __init__(self, mode='always', interval=1.0):
+        self.mode = mode
+        self.interval = interval
+        self._counts = {}
+        self._last_warning_times = {}
+        self._lock = threading.Lock()
+
+    @property
+    def mode(self):
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode):
+        if mode not in self._modes:
+            raise ValueError('mode must be one of {0}, not {1!r}'.format(', '.join(repr(m) for m in self._modes), mode))
+        self._mode = mode
+
+    @property
+    def counts(self):
+        '''dict of the number of times each warning code occurred, by code'''
+        with self._lock:
+            return dict(self._counts)
+
+    def reset_counts(self):
+        '''Forgets which warnings occurred, so that 'once' and 'rate_limited' warn about them again'''
+        with self._lock:
+            self._counts.clear()
+            self._last_warning_times.clear()
+
+    def should_warn(self, code):
+        '''Counts the warning, and returns whether to warn about it'''
+        with self._lock:
+            count = self._counts.get(code, 0) + 1
+            self._counts[code] = count
+            if self._mode == 'always':
+                return True
+            if self._mode == 'once':
+                return count == 1
+            if self._mode == 'rate_limited':
+                now = time.time()
+                last_warning_time = self._last_warning_times.get(code)
+                if last_warning_time is None or now - last_warning_time >= self.interval:
+                    self._last_warning_times[code] = now
+                    return True
+            return False
+
+
 def handle_error(session, code, ignore_warnings, is_error_handling):
     '''handle_error
 
@@ -73,13 +164,18 @@ def handle_error(session, code, ignore_warnings, is_error_handling):
         # Don't try to get the description or we'll start recursing until the stack overflows.
         description = ''
     else:
-        description = session._get_error_description(code)
+        # Warnings, and errors such as timeouts of polling methods, happen on every call of some methods, so their
+        # description is only retrieved if it is used. If the last error of the session is another one by then, it is the
+        # message for the code.
+        def description():
+            return session._get_error_description(code)
 
     if _is_error(code):
         raise Error(code, description)
 
     assert _is_warning(code)
-    warnings.warn(NidcpowerWarning(code, description))
+    if session._warning_policy.should_warn(code):
+        warnings.warn(NidcpowerWarning(code, description))
 
 
 warnings.filterwarnings("always", category=NidcpowerWarning)
@@ -1,13 +1,175 @@
 # -*- coding: utf-8 -*-
 # This file was generated
+import collections
 import ctypes
+import threading
 
+from nidcpower import _converters  # noqa: F401
+from nidcpower import _fetching
+from nidcpower import _streaming
 from nidcpower import attributes
+from nidcpower import call_stats
 from nidcpower import enums
 from nidcpower import errors
 from nidcpower import library_singleton
 from nidcpower import visatype
 
+# Size of the buffer that string IVI-dance methods try first, until they know the size they need
+_DEFAULT_IVI_DANCE_BUFFER_SIZE = 256
+
+# Size of the buffer that each string IVI-dance method needed last time, by C function name (and attribute ID). Shared
+# by all sessions.
+_ivi_dance_buffer_sizes = {}
+
+# Messages of the most recently used error and warning codes, from _error_message(). Shared by all sessions.
+_MAX_ERROR_MESSAGES = 64
+_error_messages = collections.OrderedDict()
+_error_messages_lock = threading.Lock()
+
+
+class _ScalarCtypes(threading.local):
+    '''ctypes objects for the scalar parameters of driver functions, which methods reuse instead of creating new ones on every call
+
+    Each thread has its own, so that calls on different threads don't share them.
+    '''
+
+    def __init__(self):
+        self.ConfigureApertureTime_aperture_time = visatype.ViReal64()
+        self.ConfigureApertureTime_units = visatype.ViInt32()
+        self.ConfigureDigitalEdgeMeasureTrigger_edge = visatype.ViInt32()
+        self.ConfigureDigitalEdgePulseTrigger_edge = visatype.ViInt32()
+        self.ConfigureDigitalEdgeSequenceAdvanceTrigger_edge = visatype.ViInt32()
+        self.ConfigureDigitalEdgeSourceTrigger_edge = visatype.ViInt32()
+        self.ConfigureDigitalEdgeStartTrigger_edge = visatype.ViInt32()
+        self.CreateAdvancedSequenceStep_set_as_active_step = visatype.ViBoolean()
+        self.CreateAdvancedSequence_set_as_active_sequence = visatype.ViBoolean()
+        self.ExportSignal_signal = visatype.ViInt32()
+        self.FetchMultiple_actual_count = visatype.ViInt32()
+        self.FetchMultiple_actual_count_pointer = ctypes.pointer(self.FetchMultiple_actual_count)
+        self.FetchMultiple_timeout = visatype.ViReal64()
+        self.GetAttributeViBoolean_attribute_id = visatype.ViAttr()
+        self.GetAttributeViBoolean_attribute_value = visatype.ViBoolean()
+        self.GetAttributeViBoolean_attribute_value_pointer = ctypes.pointer(self.GetAttributeViBoolean_attribute_value)
+        self.GetAttributeViInt32_attribute_id = visatype.ViAttr()
+        self.GetAttributeViInt32_attribute_value = visatype.ViInt32()
+        self.GetAttributeViInt32_attribute_value_pointer = ctypes.pointer(self.GetAttributeViInt32_attribute_value)
+        self.GetAttributeViInt64_attribute_id = visatype.ViAttr()
+        self.GetAttributeViInt64_attribute_value = visatype.ViInt64()
+        self.GetAttributeViInt64_attribute_value_pointer = ctypes.pointer(self.GetAttributeViInt64_attribute_value)
+        self.GetAttributeViReal64_attribute_id = visatype.ViAttr()
+        self.GetAttributeViReal64_attribute_value = visatype.ViReal64()
+        self.GetAttributeViReal64_attribute_value_pointer = ctypes.pointer(self.GetAttributeViReal64_attribute_value)
+        self.GetAttributeViString_attribute_id = visatype.ViAttr()
+        self.GetChannelName_index = visatype.ViInt32()
+        self.GetError_code = visatype.ViStatus()
+        self.GetError_code_pointer = ctypes.pointer(self.GetError_code)
+        self.GetSelfCalLastDateAndTime_day = visatype.ViInt32()
+        self.GetSelfCalLastDateAndTime_day_pointer = ctypes.pointer(self.GetSelfCalLastDateAndTime_day)
+        self.GetSelfCalLastDateAndTime_hour = visatype.ViInt32()
+        self.GetSelfCalLastDateAndTime_hour_pointer = ctypes.pointer(self.GetSelfCalLastDateAndTime_hour)
+        self.GetSelfCalLastDateAndTime_minute = visatype.ViInt32()
+        self.GetSelfCalLastDateAndTime_minute_pointer = ctypes.pointer(self.GetSelfCalLastDateAndTime_minute)
+        self.GetSelfCalLastDateAndTime_month = visatype.ViInt32()
+        self.GetSelfCalLastDateAndTime_month_pointer = ctypes.pointer(self.GetSelfCalLastDateAndTime_month)
+        self.GetSelfCalLastDateAndTime_year = visatype.ViInt32()
+        self.GetSelfCalLastDateAndTime_year_pointer = ctypes.pointer(self.GetSelfCalLastDateAndTime_year)
+        self.GetSelfCalLastTemp_temperature = visatype.ViReal64()
+        self.GetSelfCalLastTemp_temperature_pointer = ctypes.pointer(self.GetSelfCalLastTemp_temperature)
+        self.InitializeWithChannels_reset = visatype.ViBoolean()
+        self.InitializeWithChannels_vi = visatype.ViSession()
+        self.InitializeWithChannels_vi_pointer = ctypes.pointer(self.InitializeWithChannels_vi)
+        self.Measure_measurement = visatype.ViReal64()
+        self.Measure_measurement_pointer = ctypes.pointer(self.Measure_measurement)
+        self.Measure_measurement_type = visatype.ViInt32()
+        self.QueryInCompliance_in_compliance = visatype.ViBoolean()
+        self.QueryInCompliance_in_compliance_pointer = ctypes.pointer(self.QueryInCompliance_in_compliance)
+        self.QueryMaxCurrentLimit_max_current_limit = visatype.ViReal64()
+        self.QueryMaxCurrentLimit_max_current_limit_pointer = ctypes.pointer(self.QueryMaxCurrentLimit_max_current_limit)
+        self.QueryMaxCurrentLimit_voltage_level = visatype.ViReal64()
+        self.QueryMaxVoltageLevel_current_limit = visatype.ViReal64()
+        self.QueryMaxVoltageLevel_max_voltage_level = visatype.ViReal64()
+        self.QueryMaxVoltageLevel_max_voltage_level_pointer = ctypes.pointer(self.QueryMaxVoltageLevel_max_voltage_level)
+        self.QueryMinCurrentLimit_min_current_limit = visatype.ViReal64()
+        self.QueryMinCurrentLimit_min_current_limit_pointer = ctypes.pointer(self.QueryMinCurrentLimit_min_current_limit)
+        self.QueryMinCurrentLimit_voltage_level = visatype.ViReal64()
+        self.QueryOutputState_in_state = visatype.ViBoolean()
+        self.QueryOutputState_in_state_pointer = ctypes.pointer(self.QueryOutputState_in_state)
+        self.QueryOutputState_output_state = visatype.ViInt32()
+        self.ReadCurrentTemperature_temperature = visatype.ViReal64()
+        self.ReadCurrentTemperature_temperature_pointer = ctypes.pointer(self.ReadCurrentTemperature_temperature)
+        self.SendSoftwareEdgeTrigger_trigger = visatype.ViInt32()
+        self.SetAttributeViBoolean_attribute_id = visatype.ViAttr()
+        self.SetAttributeViBoolean_attribute_value = visatype.ViBoolean()
+        self.SetAttributeViInt32_attribute_id = visatype.ViAttr()
+        self.SetAttributeViInt32_attribute_value = visatype.ViInt32()
+        self.SetAttributeViInt64_attribute_id = visatype.ViAttr()
+        self.SetAttributeViInt64_attribute_value = visatype.ViInt64()
+        self.SetAttributeViReal64_attribute_id = visatype.ViAttr()
+        self.SetAttributeViReal64_attribute_value = visatype.ViReal64()
+        self.SetAttributeViString_attribute_id = visatype.ViAttr()
+        self.WaitForEvent_event_id = visatype.ViInt32()
+        self.WaitForEvent_timeout = visatype.ViReal64()
+        self.error_message_error_code = visatype.ViStatus()
+        self.self_test_self_test_result = visatype.ViInt16()
+        self.self_test_self_test_result_pointer = ctypes.pointer(self.self_test_self_test_result)
+
+
+_scalar_ctypes = _ScalarCtypes()
+
+# C function that each method calls, for call_stats
+_c_functions = {
+    '_abort': 'niDCPower_Abort',
+    '_close': 'niDCPower_close',
+    '_error_message': 'niDCPower_error_message',
+    '_get_attribute_vi_boolean': 'niDCPower_GetAttributeViBoolean',
+    '_get_attribute_vi_int32': 'niDCPower_GetAttributeViInt32',
+    '_get_attribute_vi_int64': 'niDCPower_GetAttributeViInt64',
+    '_get_attribute_vi_real64': 'niDCPower_GetAttributeViReal64',
+    '_get_attribute_vi_string': 'niDCPower_GetAttributeViString',
+    '_get_error': 'niDCPower_GetError',
+    '_initialize_with_channels': 'niDCPower_InitializeWithChannels',
+    '_initiate': 'niDCPower_Initiate',
+    '_set_attribute_vi_boolean': 'niDCPower_SetAttributeViBoolean',
+    '_set_attribute_vi_int32': 'niDCPower_SetAttributeViInt32',
+    '_set_attribute_vi_int64': 'niDCPower_SetAttributeViInt64',
+    '_set_attribute_vi_real64': 'niDCPower_SetAttributeViReal64',
+    '_set_attribute_vi_string': 'niDCPower_SetAttributeViString',
+    'commit': 'niDCPower_Commit',
+    'configure_aperture_time': 'niDCPower_ConfigureApertureTime',
+    'configure_digital_edge_measure_trigger': 'niDCPower_ConfigureDigitalEdgeMeasureTrigger',
+    'configure_digital_edge_pulse_trigger': 'niDCPower_ConfigureDigitalEdgePulseTrigger',
+    'configure_digital_edge_sequence_advance_trigger': 'niDCPower_ConfigureDigitalEdgeSequenceAdvanceTrigger',
+    'configure_digital_edge_source_trigger': 'niDCPower_ConfigureDigitalEdgeSourceTrigger',
+    'configure_digital_edge_start_trigger': 'niDCPower_ConfigureDigitalEdgeStartTrigger',
+    'create_advanced_sequence': 'niDCPower_CreateAdvancedSequence',
+    'create_advanced_sequence_step': 'niDCPower_CreateAdvancedSequenceStep',
+    'delete_advanced_sequence': 'niDCPower_DeleteAdvancedSequence',
+    'disable': 'niDCPower_Disable',
+    'export_signal': 'niDCPower_ExportSignal',
+    'fetch_multiple': 'niDCPower_FetchMultiple',
+    'fetch_multiple_into': 'niDCPower_FetchMultiple',
+    'get_channel_name': 'niDCPower_GetChannelName',
+    'get_self_cal_last_date_and_time': 'niDCPower_GetSelfCalLastDateAndTime',
+    'get_self_cal_last_temp': 'niDCPower_GetSelfCalLastTemp',
+    'measure': 'niDCPower_Measure',
+    'query_in_compliance': 'niDCPower_QueryInCompliance',
+    'query_max_current_limit': 'niDCPower_QueryMaxCurrentLimit',
+    'query_max_voltage_level': 'niDCPower_QueryMaxVoltageLevel',
+    'query_min_current_limit': 'niDCPower_QueryMinCurrentLimit',
+    'query_output_state': 'niDCPower_QueryOutputState',
+    'read_current_temperature': 'niDCPower_ReadCurrentTemperature',
+    'reset': 'niDCPower_reset',
+    'reset_device': 'niDCPower_ResetDevice',
+    'reset_with_defaults': 'niDCPower_ResetWithDefaults',
+    'self_test': 'niDCPower_self_test',
+    'send_software_edge_trigger': 'niDCPower_SendSoftwareEdgeTrigger',
+    'set_sequence': 'niDCPower_SetSequence',
+    'wait_for_event': 'niDCPower_WaitForEvent',
+}
+
+# Maximum number of repeated capability views (i.e. session['0']) that a session keeps to return again
+_MAX_REPEATED_CAPABILITY_VIEWS = 256
+
 
 class _Acquisition(object):
     def __init__(self, session):
@@ -108,7 +270,7 @@ class _SessionBase(object):
         session['0,1'].auto_zero = var
         var = session['0,1'].auto_zero
     '''
-    auxiliary_power_source_available = attributes.AttributeViBoolean(1150002)
+    auxiliary_power_source_available = attributes.AttributeViBoolean(1150002, volatile=True)
     '''
     Indicates whether an auxiliary power source is connected to the device.
     A value of VI_FALSE may indicate that the auxiliary input fuse has blown.  Refer to the Detecting Internal/Auxiliary Power topic in the NI DC Power Supplies and SMUs Help for  more information about internal and auxiliary power.
@@ -429,7 +591,7 @@ class _SessionBase(object):
 
     Note: This attribute is not supported by all devices. Refer to Supported Attributes by Device topic
     '''
-    fetch_backlog = attributes.AttributeViInt32(1150056)
+    fetch_backlog = attributes.AttributeViInt32(1150056, volatile=True)
     '''
     Returns the number of measurements acquired that have not been fetched yet.
     '''
@@ -457,7 +619,7 @@ class _SessionBase(object):
     Interchangeability checking examines the attributes in a capability group only if you specify a value  for at least one attribute within that group. Interchangeability warnings can occur when an attribute  affects the behavior of the device and you have not set that attribute or when the attribute has been  invalidated since you set it.
     Default Value: VI_FALSE
     '''
-    interlock_input_open = attributes.AttributeViBoolean(1150105)
+    interlock_input_open = attributes.AttributeViBoolean(1150105, volatile=True)
     '''
     Indicates whether the safety interlock circuit is open.
     Refer to the Safety Interlock topic in the NI DC Power Supplies and SMUs Help for more information about  the safety interlock circuit.
@@ -707,7 +869,7 @@ class _SessionBase(object):
 
     Note: Automatic selection is not persistent and occurs only at the time this attribute
     '''
-    power_source_in_use = attributes.AttributeEnum(attributes.AttributeViInt32, enums.PowerSourceInUse, 1150001)
+    power_source_in_use = attributes.AttributeEnum(attributes.AttributeViInt32, enums.PowerSourceInUse, 1150001, volatile=True)
     '''
     Indicates whether the device is using the internal or auxiliary power source to generate power.
     '''
@@ -1467,26 +1629,129 @@ class _SessionBase(object):
         var = session['0,1'].voltage_pole_zero_ratio
     '''
 
-    def __init__(self, repeated_capability):
-        self._library = library_singleton.get()
+    def __init__(self, repeated_capability, attribute_cache, library, warning_policy, session_stats):
+        self._library = library
         self._repeated_capability = repeated_capability
+        self._attribute_cache = attribute_cache
+        self._warning_policy = warning_policy
+        self._session_stats = session_stats
         self._encoding = 'windows-1251'
+        # The driver does not modify it, so every call can pass the same buffer
+        self._repeated_capability_ctype = ctypes.create_string_buffer(repeated_capability.encode(self._encoding))
+        session_stats._add_session(self)
 
     def __setattr__(self, key, value):
-        if self._is_frozen and key not in dir(self):
+        if self._is_frozen and key not in self._get_attribute_names() and key not in self.__dict__:
             raise AttributeError("'{0}' object has no attribute '{1}'".format(type(self).__name__, key))
         object.__setattr__(self, key, value)
 
+    @property
+    def warning_policy(self):
+        '''warning_policy
+
+        How the session, and its repeated capabilities, report warnings from the driver. Change its mode to warn only
+        once per code, at most once per interval, or only count warnings:
+
+            session.warning_policy.mode = 'count'
+            ...
+            print(session.warning_policy.counts)
+
+        See errors.WarningPolicy.
+        '''
+        return self._warning_policy
+
+    @classmethod
+    def _get_attribute_names(cls):
+        '''_get_attribute_names
+
+        Returns a frozenset of the names of the properties and methods of the class, which can be set once the session
+        is frozen. It is computed once per class, because dir() is too slow to call every time a property is set.
+        '''
+        names = cls.__dict__.get('_attribute_names')
+        if names is None:
+            names = frozenset(dir(cls))
+            cls._attribute_names = names
+        return names
+
+    def _get_attribute_info(self, name_or_id):
+        try:
+            # type(u'') is unicode on Python 2
+            if isinstance(name_or_id, (str, type(u''))):
+                return attributes.index_by_name[name_or_id]
+            return attributes.index[name_or_id]
+        except KeyError:
+            raise ValueError('{0!r} is not an attribute of NI-DCPower'.format(name_or_id))
+
+    def get_attributes(self, names_or_ids, channels=None):
+        '''get_attributes
+
+        Gets the values of many attributes in one call. It creates the ctypes objects once for each type of attribute,
+        instead of once for each attribute like the properties do.
+
+        Args:
+            names_or_ids (list of str or int): Python names (i.e. 'active_advanced_sequence') or IDs of the attributes
+
+            channels (str): Repeated capabilities (usually channels) to get the attributes for. If not specified, uses the
+                ones of this object, like the properties do.
+
+        Returns:
+            values (collections.OrderedDict): Value of each attribute, by Python name, in the same order as names_or_ids
+        '''
+        session = self if channels is None else _RepeatedCapability(self._vi, channels, self._attribute_cache, self._library, self._warning_policy, self._session_stats)
+        return attributes.get_values(session, [self._get_attribute_info(a) for a in names_or_ids])
+
+    def snapshot(self):
+        '''snapshot
+
+        Gets the values of all the read-write attributes, to restore them later with apply(). Attributes that the driver
+        returns an error for (i.e. not supported by the device) and volatile attributes are left out.
+
+        Use it on a repeated capability (i.e. session['0'].snapshot()) to get the values of specific channels.
+
+        Returns:
+            values (collections.OrderedDict): Value of each attribute, by Python name
+        '''
+        infos = [a for a in sorted(attributes.index.values()) if a.access == 'read-write' and not a.volatile]
+        return attributes.get_values(self, infos, skip_errors=True)
+
+    def apply(self, values):
+        '''apply
+
+        Sets many attributes, i.e. from snapshot(), in order. It first gets the values of the attributes, and only sets
+        the ones that are different.
+
+        Args:
+            values (dict): Value of each attribute, by Python name or ID. Values of enum attributes must be members of
+                their enum.
+
+        Returns:
+            names (list of str): Python names of the attributes that were set
+        '''
+        infos_and_values = [(self._get_attribute_info(a), v) for a, v in values.items()]
+        current_values = attributes.get_values(self, [info for info, _ in infos_and_values if info.access != 'write only'], skip_errors=True)
+        changes = [(info, v) for info, v in infos_and_values if info.python_name not in current_values or current_values[info.python_name] != v]
+        attributes.set_values(self, changes)
+        return [info.python_name for info, _ in changes]
+
+    def _set_attributes(self, values):
+        '''Sets attributes from (Python name or ID, value) pairs, in order, without getting them first like apply() does'''
+        attributes.set_values(self, [(self._get_attribute_info(a), v) for a, v in values])
+
     def _get_error_description(self, error_code):
         '''_get_error_description
 
         Returns the error description.
+
+        errors retrieves descriptions only when they are used, when the last error of the session may be another one.
+        Those get the message for their code instead.
         '''
-        try:
-            _, error_string = self._get_error()
-            return error_string
-        except errors.Error:
-            pass
+        if error_code < 0:
+            try:
+                last_error_code, error_string = self._get_error()
+                if last_error_code == error_code:
+                    return error_string
+            except errors.Error:
+                pass
 
         try:
             '''
@@ -1494,11 +1759,27 @@ class _SessionBase(object):
             (IVI spec requires GetError to fail).
             Use _error_message instead. It doesn't require a session.
             '''
-            error_string = self._error_message(error_code)
-            return error_string
+            return self._get_error_message(error_code)
         except errors.Error:
             return "Failed to retrieve error description."
 
+    def _get_error_message(self, error_code):
+        '''_get_error_message
+
+        Returns _error_message(error_code), from the messages of the most recently used codes if it is there.
+        '''
+        with _error_messages_lock:
+            error_string = _error_messages.pop(error_code, None)
+            if error_string is not None:
+                _error_messages[error_code] = error_string
+                return error_string
+        error_string = self._error_message(error_code)
+        with _error_messages_lock:
+            _error_messages[error_code] = error_string
+            if len(_error_messages) > _MAX_ERROR_MESSAGES:
+                _error_messages.popitem(last=False)
+        return error_string
+
     ''' These are code-generated '''
 
     def configure_aperture_time(self, aperture_time, units=enums.ApertureTimeUnits.SECONDS):
@@ -1548,15 +1829,18 @@ class _SessionBase(object):
         '''
         if type(units) is not enums.ApertureTimeUnits:
             raise TypeError('Parameter mode must be of type ' + str(enums.ApertureTimeUnits))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        aperture_time_ctype = visatype.ViReal64(aperture_time)  # case 8
-        units_ctype = visatype.ViInt32(units.value)  # case 9
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        aperture_time_ctype = _scalar_ctypes.ConfigureApertureTime_aperture_time
+        aperture_time_ctype.value = aperture_time  # case 8
+        units_ctype = _scalar_ctypes.ConfigureApertureTime_units
+        units_ctype.value = units.value  # case 9
         error_code = self._library.niDCPower_ConfigureApertureTime(vi_ctype, channel_name_ctype, aperture_time_ctype, units_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
-    def fetch_multiple(self, count, timeout=1.0):
+    def fetch_multiple(self, count, timeout=1.0, array_type='list'):
         '''fetch_multiple
 
         Returns an array of voltage measurements, an array of current
@@ -1584,7 +1868,7 @@ class _SessionBase(object):
         You can specify a subset of repeated capabilities using the Python index notation on an
         nidcpower.Session instance, and calling this method on the result.:
 
-            session['0,1'].fetch_multiple(count, timeout=1.0)
+            session['0,1'].fetch_multiple(count, timeout=1.0, array_type='list')
 
         Args:
             timeout (float): Specifies the maximum time allowed for this function to complete, in
@@ -1596,11 +1880,12 @@ class _SessionBase(object):
                 triggers so that the timeout interval is long enough for your
                 application.
             count (int): Specifies the number of measurements to fetch.
+            array_type (str): Selects how arrays are returned: 'list', 'array' for array.array or 'numpy' for numpy.ndarray. A numpy.ndarray shares memory with the buffer filled by the driver, so nothing is copied.
 
         Returns:
-            voltage_measurements (list of float): Returns an array of voltage measurements. Ensure that sufficient space
+            voltage_measurements (list, array.array or numpy.ndarray of float): Returns an array of voltage measurements. Ensure that sufficient space
                 has been allocated for the returned array.
-            current_measurements (list of float): Returns an array of current measurements. Ensure that sufficient space
+            current_measurements (list, array.array or numpy.ndarray of float): Returns an array of current measurements. Ensure that sufficient space
                 has been allocated for the returned array.
             in_compliance (list of bool): Returns an array of Boolean values indicating whether the output was in
                 compliance at the time the measurement was taken. Ensure that sufficient
@@ -1608,17 +1893,121 @@ class _SessionBase(object):
             actual_count (int): Indicates the number of measured values actually retrieved from the
                 device.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        timeout_ctype = visatype.ViReal64(timeout)  # case 8
+        _converters.check_array_type(array_type)
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        timeout_ctype = _scalar_ctypes.FetchMultiple_timeout
+        timeout_ctype.value = timeout  # case 8
         count_ctype = visatype.ViInt32(count)  # case 7
         voltage_measurements_ctype = (visatype.ViReal64 * count)()  # case 12
         current_measurements_ctype = (visatype.ViReal64 * count)()  # case 12
         in_compliance_ctype = (visatype.ViBoolean * count)()  # case 12
-        actual_count_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niDCPower_FetchMultiple(vi_ctype, channel_name_ctype, timeout_ctype, count_ctype, voltage_measurements_ctype, current_measurements_ctype, in_compliance_ctype, ctypes.pointer(actual_count_ctype))
+        actual_count_ctype = _scalar_ctypes.FetchMultiple_actual_count  # case 13
+        error_code = self._library.niDCPower_FetchMultiple(vi_ctype, channel_name_ctype, timeout_ctype, count_ctype, voltage_measurements_ctype, current_measurements_ctype, in_compliance_ctype, _scalar_ctypes.FetchMultiple_actual_count_pointer)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return _converters.convert_from_ctypes_array(voltage_measurements_ctype, count_ctype.value, float, array_type), _converters.convert_from_ctypes_array(current_measurements_ctype, count_ctype.value, float, array_type), [bool(in_compliance_ctype[i]) for i in range(count_ctype.value)], int(actual_count_ctype.value)
+
+    def fetch_multiple_into(self, voltage_measurements, current_measurements, in_compliance, timeout=1.0):
+        '''fetch_multiple_into
+
+        Same as fetch_multiple, but the driver writes **voltage_measurements**, **current_measurements**, **in_compliance** directly into a buffer you allocate, such as a numpy.ndarray or array.array. Nothing is copied and no list is created.
+
+
+        Returns an array of voltage measurements, an array of current
+        measurements, and an array of compliance measurements that were
+        previously taken and are stored in the NI-DCPower buffer. This function
+        should not be used when the MEASURE_WHEN attribute is
+        set to NIDCPOWER_VAL_ON_DEMAND. You must first call
+        _initiate before calling this function.
+
+        Refer to the `Acquiring
+        Measurements <REPLACE_DRIVER_SPECIFIC_URL_1(acquiringmeasurements)>`__
+        and `Compliance <REPLACE_DRIVER_SPECIFIC_URL_1(compliance)>`__ topics in
+        the *NI DC Power Supplies and SMUs Help* for more information about
+        configuring this function.
+
+        Note:
+        This function is not supported on all devices. Refer to `Supported
+        Functions by
+        Device <REPLACE_DRIVER_SPECIFIC_URL_2(nidcpowercref.chm',%20'supportedfunctions)>`__
+        for more information about supported devices.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nidcpower.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nidcpower.Session instance, and calling this method on the result.:
+
+            session['0,1'].fetch_multiple_into(voltage_measurements, current_measurements, in_compliance, timeout=1.0)
+
+        Args:
+            timeout (float): Specifies the maximum time allowed for this function to complete, in
+                seconds. If the function does not complete within this time interval,
+                NI-DCPower returns an error.
+
+                Note:
+                When setting the timeout interval, ensure you take into account any
+                triggers so that the timeout interval is long enough for your
+                application.
+            voltage_measurements (writable buffer of float): Returns an array of voltage measurements. Ensure that sufficient space
+                has been allocated for the returned array.
+            current_measurements (writable buffer of float): Returns an array of current measurements. Ensure that sufficient space
+                has been allocated for the returned array.
+            in_compliance (writable buffer of bool): Returns an array of Boolean values indicating whether the output was in
+                compliance at the time the measurement was taken. Ensure that sufficient
+                space has been allocated for the returned array.
+
+        Returns:
+            actual_count (int): Indicates the number of measured values actually retrieved from the
+                device.
+        '''
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        timeout_ctype = _scalar_ctypes.FetchMultiple_timeout
+        timeout_ctype.value = timeout  # case 8
+        count_ctype = visatype.ViInt32(len(voltage_measurements))  # case 5
+        voltage_measurements_ctype = _converters.get_ctypes_array_for_buffer(voltage_measurements, visatype.ViReal64, 'voltage_measurements')  # case 14
+        current_measurements_ctype = _converters.get_ctypes_array_for_buffer(current_measurements, visatype.ViReal64, 'current_measurements', len(voltage_measurements))  # case 14
+        in_compliance_ctype = _converters.get_ctypes_array_for_buffer(in_compliance, visatype.ViBoolean, 'in_compliance', len(voltage_measurements))  # case 14
+        actual_count_ctype = _scalar_ctypes.FetchMultiple_actual_count  # case 13
+        error_code = self._library.niDCPower_FetchMultiple(vi_ctype, channel_name_ctype, timeout_ctype, count_ctype, voltage_measurements_ctype, current_measurements_ctype, in_compliance_ctype, _scalar_ctypes.FetchMultiple_actual_count_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return [float(voltage_measurements_ctype[i]) for i in range(count_ctype.value)], [float(current_measurements_ctype[i]) for i in range(count_ctype.value)], [bool(in_compliance_ctype[i]) for i in range(count_ctype.value)], int(actual_count_ctype.value)
+        return int(actual_count_ctype.value)
+
+    def fetch_multiple_columns(self, count, timeout=1.0, out=None):
+        '''fetch_multiple_columns
+
+        Same as fetch_multiple, but returns the measurements as columns of numpy arrays instead of lists,
+        so no Python object is created for each measurement.
+
+        Returns an OrderedDict of numpy.ndarray of the measurements actually fetched:
+
+        -  **voltage**, of numpy.float64
+        -  **current**, of numpy.float64
+        -  **in_compliance**, of numpy.bool_
+
+        The driver fills the voltage and current arrays in place. Pass **out**, i.e. the dict returned by a
+        previous call, to fetch into the same arrays again instead of allocating new ones. The returned arrays
+        are then views of those. **in_compliance** in **out** may also be of numpy.uint16, nonzero where the
+        output was in compliance, which the driver fills in place as well instead of it being converted.
+
+        Note:
+        This method requires numpy.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nidcpower.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nidcpower.Session instance, and calling this method on the result.:
+
+            session['0,1'].fetch_multiple_columns(count, timeout=1.0, out=None)
+
+        Args:
+            count (int): Specifies the number of measurements to fetch.
+            timeout (float): Specifies the maximum time allowed for this function to complete, in seconds.
+            out (dict): Arrays to fetch into, with the same keys and dtypes as the returned ones, of at least **count** elements. By default, new arrays are allocated.
+        '''
+        return _fetching.fetch_multiple_columns(self, count, timeout, out)
 
     def _get_attribute_vi_boolean(self, attribute_id):
         '''_get_attribute_vi_boolean
@@ -1664,11 +2053,12 @@ class _SessionBase(object):
                 pressing **Enter** on this control. Select a value by double-clicking on
                 it or by selecting it and then pressing **Enter**.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViBoolean()  # case 13
-        error_code = self._library.niDCPower_GetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViBoolean_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetAttributeViBoolean_attribute_value  # case 13
+        error_code = self._library.niDCPower_GetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViBoolean_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return bool(attribute_value_ctype.value)
 
@@ -1716,11 +2106,12 @@ class _SessionBase(object):
                 pressing **Enter** on this control. Select a value by double-clicking on
                 it or by selecting it and then pressing **Enter**.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niDCPower_GetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViInt32_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetAttributeViInt32_attribute_value  # case 13
+        error_code = self._library.niDCPower_GetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViInt32_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(attribute_value_ctype.value)
 
@@ -1768,11 +2159,12 @@ class _SessionBase(object):
                 pressing **Enter** on this control. Select a value by double-clicking on
                 it or by selecting it and then pressing **Enter**.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViInt64()  # case 13
-        error_code = self._library.niDCPower_GetAttributeViInt64(vi_ctype, channel_name_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViInt64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetAttributeViInt64_attribute_value  # case 13
+        error_code = self._library.niDCPower_GetAttributeViInt64(vi_ctype, channel_name_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViInt64_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(attribute_value_ctype.value)
 
@@ -1820,11 +2212,12 @@ class _SessionBase(object):
                 pressing **Enter** on this control. Select a value by double-clicking on
                 it or by selecting it and then pressing **Enter**.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niDCPower_GetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViReal64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetAttributeViReal64_attribute_value  # case 13
+        error_code = self._library.niDCPower_GetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViReal64_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(attribute_value_ctype.value)
 
@@ -1876,16 +2269,23 @@ class _SessionBase(object):
                 buffer regardless of the number of bytes in the value, pass a negative
                 number for this attribute.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        buffer_size_ctype = visatype.ViInt32()  # case 6
-        attribute_value_ctype = None  # case 11
-        error_code = self._library.niDCPower_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
-        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
-        buffer_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        attribute_value_ctype = (visatype.ViChar * buffer_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViString_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        buffer_size_ctype = visatype.ViInt32(_ivi_dance_buffer_sizes.get(('GetAttributeViString', attribute_id), _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        attribute_value_ctype = (visatype.ViChar * buffer_size_ctype.value)()
         error_code = self._library.niDCPower_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            buffer_size_ctype = visatype.ViInt32(0)
+            attribute_value_ctype = None
+            error_code = self._library.niDCPower_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+            buffer_size_ctype = visatype.ViInt32(error_code)
+            attribute_value_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+            error_code = self._library.niDCPower_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
+            _ivi_dance_buffer_sizes[('GetAttributeViString', attribute_id)] = buffer_size_ctype.value
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return attribute_value_ctype.value.decode(self._encoding)
 
@@ -1917,15 +2317,22 @@ class _SessionBase(object):
                 returns 7.
                 If you pass 0, you can pass VI_NULL for **channelName**.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        index_ctype = visatype.ViInt32(index)  # case 8
-        buffer_size_ctype = visatype.ViInt32()  # case 6
-        channel_name_ctype = None  # case 11
-        error_code = self._library.niDCPower_GetChannelName(vi_ctype, index_ctype, buffer_size_ctype, channel_name_ctype)
-        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
-        buffer_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        channel_name_ctype = (visatype.ViChar * buffer_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
+        vi_ctype = self._vi_ctype  # case 1
+        index_ctype = _scalar_ctypes.GetChannelName_index
+        index_ctype.value = index  # case 8
+        buffer_size_ctype = visatype.ViInt32(_ivi_dance_buffer_sizes.get('GetChannelName', _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        channel_name_ctype = (visatype.ViChar * buffer_size_ctype.value)()
         error_code = self._library.niDCPower_GetChannelName(vi_ctype, index_ctype, buffer_size_ctype, channel_name_ctype)
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            buffer_size_ctype = visatype.ViInt32(0)
+            channel_name_ctype = None
+            error_code = self._library.niDCPower_GetChannelName(vi_ctype, index_ctype, buffer_size_ctype, channel_name_ctype)
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+            buffer_size_ctype = visatype.ViInt32(error_code)
+            channel_name_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+            error_code = self._library.niDCPower_GetChannelName(vi_ctype, index_ctype, buffer_size_ctype, channel_name_ctype)
+            _ivi_dance_buffer_sizes['GetChannelName'] = buffer_size_ctype.value
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return channel_name_ctype.value.decode(self._encoding)
 
@@ -1962,15 +2369,21 @@ class _SessionBase(object):
         Returns:
             code (int): Returns the error code for the session or execution thread.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        code_ctype = visatype.ViStatus()  # case 13
-        buffer_size_ctype = visatype.ViInt32()  # case 6
-        description_ctype = None  # case 11
-        error_code = self._library.niDCPower_GetError(vi_ctype, ctypes.pointer(code_ctype), buffer_size_ctype, description_ctype)
-        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=True)
-        buffer_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        description_ctype = (visatype.ViChar * buffer_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        error_code = self._library.niDCPower_GetError(vi_ctype, ctypes.pointer(code_ctype), buffer_size_ctype, description_ctype)
+        vi_ctype = self._vi_ctype  # case 1
+        code_ctype = _scalar_ctypes.GetError_code  # case 13
+        buffer_size_ctype = visatype.ViInt32(_ivi_dance_buffer_sizes.get('GetError', _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        description_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+        error_code = self._library.niDCPower_GetError(vi_ctype, _scalar_ctypes.GetError_code_pointer, buffer_size_ctype, description_ctype)
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            buffer_size_ctype = visatype.ViInt32(0)
+            description_ctype = None
+            error_code = self._library.niDCPower_GetError(vi_ctype, _scalar_ctypes.GetError_code_pointer, buffer_size_ctype, description_ctype)
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=True)
+            buffer_size_ctype = visatype.ViInt32(error_code)
+            description_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+            error_code = self._library.niDCPower_GetError(vi_ctype, _scalar_ctypes.GetError_code_pointer, buffer_size_ctype, description_ctype)
+            _ivi_dance_buffer_sizes['GetError'] = buffer_size_ctype.value
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=True)
         return int(code_ctype.value), description_ctype.value.decode(self._encoding)
 
@@ -2007,11 +2420,12 @@ class _SessionBase(object):
         '''
         if type(measurement_type) is not enums.MeasurementTypes:
             raise TypeError('Parameter mode must be of type ' + str(enums.MeasurementTypes))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        measurement_type_ctype = visatype.ViInt32(measurement_type.value)  # case 9
-        measurement_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niDCPower_Measure(vi_ctype, channel_name_ctype, measurement_type_ctype, ctypes.pointer(measurement_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        measurement_type_ctype = _scalar_ctypes.Measure_measurement_type
+        measurement_type_ctype.value = measurement_type.value  # case 9
+        measurement_ctype = _scalar_ctypes.Measure_measurement  # case 13
+        error_code = self._library.niDCPower_Measure(vi_ctype, channel_name_ctype, measurement_type_ctype, _scalar_ctypes.Measure_measurement_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(measurement_ctype.value)
 
@@ -2050,10 +2464,10 @@ class _SessionBase(object):
         Returns:
             in_compliance (bool): Returns whether the device output channel is in compliance.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        in_compliance_ctype = visatype.ViBoolean()  # case 13
-        error_code = self._library.niDCPower_QueryInCompliance(vi_ctype, channel_name_ctype, ctypes.pointer(in_compliance_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        in_compliance_ctype = _scalar_ctypes.QueryInCompliance_in_compliance  # case 13
+        error_code = self._library.niDCPower_QueryInCompliance(vi_ctype, channel_name_ctype, _scalar_ctypes.QueryInCompliance_in_compliance_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return bool(in_compliance_ctype.value)
 
@@ -2079,11 +2493,12 @@ class _SessionBase(object):
             max_current_limit (float): Returns the maximum current limit that can be set with the specified
                 **voltageLevel**.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        voltage_level_ctype = visatype.ViReal64(voltage_level)  # case 8
-        max_current_limit_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niDCPower_QueryMaxCurrentLimit(vi_ctype, channel_name_ctype, voltage_level_ctype, ctypes.pointer(max_current_limit_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        voltage_level_ctype = _scalar_ctypes.QueryMaxCurrentLimit_voltage_level
+        voltage_level_ctype.value = voltage_level  # case 8
+        max_current_limit_ctype = _scalar_ctypes.QueryMaxCurrentLimit_max_current_limit  # case 13
+        error_code = self._library.niDCPower_QueryMaxCurrentLimit(vi_ctype, channel_name_ctype, voltage_level_ctype, _scalar_ctypes.QueryMaxCurrentLimit_max_current_limit_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(max_current_limit_ctype.value)
 
@@ -2109,11 +2524,12 @@ class _SessionBase(object):
             max_voltage_level (float): Returns the maximum voltage level that can be set on an output channel
                 with the specified **currentLimit**.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        current_limit_ctype = visatype.ViReal64(current_limit)  # case 8
-        max_voltage_level_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niDCPower_QueryMaxVoltageLevel(vi_ctype, channel_name_ctype, current_limit_ctype, ctypes.pointer(max_voltage_level_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        current_limit_ctype = _scalar_ctypes.QueryMaxVoltageLevel_current_limit
+        current_limit_ctype.value = current_limit  # case 8
+        max_voltage_level_ctype = _scalar_ctypes.QueryMaxVoltageLevel_max_voltage_level  # case 13
+        error_code = self._library.niDCPower_QueryMaxVoltageLevel(vi_ctype, channel_name_ctype, current_limit_ctype, _scalar_ctypes.QueryMaxVoltageLevel_max_voltage_level_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(max_voltage_level_ctype.value)
 
@@ -2139,11 +2555,12 @@ class _SessionBase(object):
             min_current_limit (float): Returns the minimum current limit that can be set on an output channel
                 with the specified **voltageLevel**.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        voltage_level_ctype = visatype.ViReal64(voltage_level)  # case 8
-        min_current_limit_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niDCPower_QueryMinCurrentLimit(vi_ctype, channel_name_ctype, voltage_level_ctype, ctypes.pointer(min_current_limit_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        voltage_level_ctype = _scalar_ctypes.QueryMinCurrentLimit_voltage_level
+        voltage_level_ctype.value = voltage_level  # case 8
+        min_current_limit_ctype = _scalar_ctypes.QueryMinCurrentLimit_min_current_limit  # case 13
+        error_code = self._library.niDCPower_QueryMinCurrentLimit(vi_ctype, channel_name_ctype, voltage_level_ctype, _scalar_ctypes.QueryMinCurrentLimit_min_current_limit_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(min_current_limit_ctype.value)
 
@@ -2181,11 +2598,12 @@ class _SessionBase(object):
         '''
         if type(output_state) is not enums.OutputStates:
             raise TypeError('Parameter mode must be of type ' + str(enums.OutputStates))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        output_state_ctype = visatype.ViInt32(output_state.value)  # case 9
-        in_state_ctype = visatype.ViBoolean()  # case 13
-        error_code = self._library.niDCPower_QueryOutputState(vi_ctype, channel_name_ctype, output_state_ctype, ctypes.pointer(in_state_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        output_state_ctype = _scalar_ctypes.QueryOutputState_output_state
+        output_state_ctype.value = output_state.value  # case 9
+        in_state_ctype = _scalar_ctypes.QueryOutputState_in_state  # case 13
+        error_code = self._library.niDCPower_QueryOutputState(vi_ctype, channel_name_ctype, output_state_ctype, _scalar_ctypes.QueryOutputState_in_state_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return bool(in_state_ctype.value)
 
@@ -2236,10 +2654,12 @@ class _SessionBase(object):
                 Some of the values might not be valid depending upon the current
                 settings of the device session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViBoolean(attribute_value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViBoolean_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.SetAttributeViBoolean_attribute_value
+        attribute_value_ctype.value = attribute_value  # case 8
         error_code = self._library.niDCPower_SetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2291,10 +2711,12 @@ class _SessionBase(object):
                 Some of the values might not be valid depending upon the current
                 settings of the device session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViInt32(attribute_value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViInt32_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.SetAttributeViInt32_attribute_value
+        attribute_value_ctype.value = attribute_value  # case 8
         error_code = self._library.niDCPower_SetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2346,10 +2768,12 @@ class _SessionBase(object):
                 Some of the values might not be valid depending upon the current
                 settings of the device session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViInt64(attribute_value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViInt64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.SetAttributeViInt64_attribute_value
+        attribute_value_ctype.value = attribute_value  # case 8
         error_code = self._library.niDCPower_SetAttributeViInt64(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2401,10 +2825,12 @@ class _SessionBase(object):
                 Some of the values might not be valid depending upon the current
                 settings of the device session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViReal64(attribute_value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViReal64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.SetAttributeViReal64_attribute_value
+        attribute_value_ctype.value = attribute_value  # case 8
         error_code = self._library.niDCPower_SetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2456,10 +2882,11 @@ class _SessionBase(object):
                 Some of the values might not be valid depending upon the current
                 settings of the device session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = ctypes.create_string_buffer(attribute_value.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViString_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = attribute_value.encode(self._encoding)  # case 3
         error_code = self._library.niDCPower_SetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2511,10 +2938,10 @@ class _SessionBase(object):
             size (int): The number of elements in the Values and the Source Delays arrays. The
                 Values and Source Delays arrays should have the same size.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        values_ctype = (visatype.ViReal64 * len(values))(*values)  # case 4
-        source_delays_ctype = (visatype.ViReal64 * len(source_delays))(*source_delays)  # case 4
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        values_ctype = _converters.convert_to_ctypes_array(values, visatype.ViReal64)  # case 4
+        source_delays_ctype = _converters.convert_to_ctypes_array(source_delays, visatype.ViReal64)  # case 4
         size_ctype = visatype.ViUInt32(len(values))  # case 5
         error_code = self._library.niDCPower_SetSequence(vi_ctype, channel_name_ctype, values_ctype, source_delays_ctype, size_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
@@ -2535,8 +2962,9 @@ class _SessionBase(object):
                 code you specify.
                 You must pass a ViChar array with at least 256 bytes.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        error_code_ctype = visatype.ViStatus(error_code)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        error_code_ctype = _scalar_ctypes.error_message_error_code
+        error_code_ctype.value = error_code  # case 8
         error_message_ctype = (visatype.ViChar * 256)()  # case 10
         error_code = self._library.niDCPower_error_message(vi_ctype, error_code_ctype, error_message_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=True)
@@ -2546,9 +2974,10 @@ class _SessionBase(object):
 class _RepeatedCapability(_SessionBase):
     '''Allows for setting/getting properties and calling methods for specific repeated capabilities (such as channels) on your session.'''
 
-    def __init__(self, vi, repeated_capability):
-        super(_RepeatedCapability, self).__init__(repeated_capability)
+    def __init__(self, vi, repeated_capability, attribute_cache, library, warning_policy, session_stats):
+        super(_RepeatedCapability, self).__init__(repeated_capability, attribute_cache, library, warning_policy, session_stats)
         self._vi = vi
+        self._vi_ctype = visatype.ViSession(vi)
         self._is_frozen = True
 
 
@@ -2556,9 +2985,16 @@ class Session(_SessionBase):
     '''An NI-DCPower session to a National Instruments Programmable Power Supply or Source Measure Unit.'''
 
     def __init__(self, resource_name, channels='', reset=False, option_string=''):
-        super(Session, self).__init__(repeated_capability='')
+        super(Session, self).__init__(repeated_capability='', attribute_cache=attributes.AttributeCache(), library=library_singleton.get(), warning_policy=errors.WarningPolicy(), session_stats=call_stats.SessionStats(_c_functions))
+        if call_stats.registry.enabled:
+            self._session_stats.enable()
+        self._repeated_capability_views = collections.OrderedDict()
+        self._repeated_capability_views_lock = threading.Lock()
         self._vi = 0  # This must be set before calling _initialize_with_channels().
+        # Passed to every method, which would otherwise create it on every call
+        self._vi_ctype = visatype.ViSession(0)
         self._vi = self._initialize_with_channels(resource_name, channels, reset, option_string)
+        self._vi_ctype = visatype.ViSession(self._vi)
         self._is_frozen = True
 
     def __enter__(self):
@@ -2569,18 +3005,89 @@ class Session(_SessionBase):
 
     def __getitem__(self, repeated_capability):
         '''Set/get properties or call methods with a repeated capability (i.e. channels)'''
-        return _RepeatedCapability(self._vi, repeated_capability)
+        # The most recently used views are kept, so loops over channels don't create a view each time
+        with self._repeated_capability_views_lock:
+            view = self._repeated_capability_views.pop(repeated_capability, None)
+            if view is None:
+                view = _RepeatedCapability(self._vi, repeated_capability, self._attribute_cache, self._library, self._warning_policy, self._session_stats)
+                if len(self._repeated_capability_views) >= _MAX_REPEATED_CAPABILITY_VIEWS:
+                    self._repeated_capability_views.popitem(last=False)
+            self._repeated_capability_views[repeated_capability] = view
+        return view
 
     def initiate(self):
         return _Acquisition(self)
 
+    def enable_attribute_cache(self):
+        '''enable_attribute_cache
+
+        Caches the values of attributes in this session, and in its repeated capabilities, so that getting them again
+        doesn't call into the driver. Setting an attribute updates the cache. Methods that reset or configure the
+        session (i.e. reset(), commit() and configure methods) clear it.
+
+        Volatile attributes, whose values change on their own (i.e. status), are never cached.
+
+        Note:
+        Setting an attribute caches the value that was set. If the driver coerces it (i.e. up to a valid range), the
+        cache returns the value that was set until it is cleared. Calling enable_attribute_cache() again clears it.
+        '''
+        self._attribute_cache.clear()
+        self._attribute_cache.enabled = True
+
+    def disable_attribute_cache(self):
+        '''disable_attribute_cache
+
+        Stops caching the values of attributes, and clears the cache. See enable_attribute_cache().
+        '''
+        self._attribute_cache.enabled = False
+        self._attribute_cache.clear()
+
+    def enable_stats(self):
+        '''enable_stats
+
+        Starts recording statistics of the driver calls of this session, and of its repeated capabilities: for each C
+        function, the number of calls, their latencies, and how much of that time was spent in the driver and how much
+        in Python. Calling enable_stats() again clears them. See stats().
+
+        Methods are slower while stats are enabled. Set call_stats.registry.enabled to True to enable them for all new
+        sessions instead.
+        '''
+        self._session_stats.enable()
+
+    def disable_stats(self):
+        '''disable_stats
+
+        Stops recording statistics of the driver calls. stats() still returns the ones recorded. See enable_stats().
+        '''
+        self._session_stats.disable()
+
+    def stats(self):
+        '''stats
+
+        Returns the statistics of the driver calls recorded since enable_stats():
+
+            session.enable_stats()
+            ...
+            for function, s in session.stats().items():
+                print(function, s.calls, s.driver_time, s.python_time, s.percentile(99))
+
+        Returns:
+            stats (collections.OrderedDict): call_stats.FunctionStats by C function name, the one with the most total
+                time first
+        '''
+        return self._session_stats.stats()
+
     def close(self):
+        with self._repeated_capability_views_lock:
+            self._repeated_capability_views.clear()
         try:
             self._close()
         except errors.Error as e:
             self._vi = 0
+            self._vi_ctype = visatype.ViSession(0)
             raise
         self._vi = 0
+        self._vi_ctype = visatype.ViSession(0)
 
     ''' These are code-generated '''
 
@@ -2608,7 +3115,7 @@ class Session(_SessionBase):
         `Programming
         States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niDCPower_Abort(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2631,9 +3138,10 @@ class Session(_SessionBase):
         `Programming
         States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niDCPower_Commit(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_digital_edge_measure_trigger(self, input_terminal, edge=enums.DigitalEdge.RISING):
@@ -2674,11 +3182,13 @@ class Session(_SessionBase):
         '''
         if type(edge) is not enums.DigitalEdge:
             raise TypeError('Parameter mode must be of type ' + str(enums.DigitalEdge))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        input_terminal_ctype = ctypes.create_string_buffer(input_terminal.encode(self._encoding))  # case 3
-        edge_ctype = visatype.ViInt32(edge.value)  # case 9
+        vi_ctype = self._vi_ctype  # case 1
+        input_terminal_ctype = input_terminal.encode(self._encoding)  # case 3
+        edge_ctype = _scalar_ctypes.ConfigureDigitalEdgeMeasureTrigger_edge
+        edge_ctype.value = edge.value  # case 9
         error_code = self._library.niDCPower_ConfigureDigitalEdgeMeasureTrigger(vi_ctype, input_terminal_ctype, edge_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_digital_edge_pulse_trigger(self, input_terminal, edge=enums.DigitalEdge.RISING):
@@ -2719,11 +3229,13 @@ class Session(_SessionBase):
         '''
         if type(edge) is not enums.DigitalEdge:
             raise TypeError('Parameter mode must be of type ' + str(enums.DigitalEdge))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        input_terminal_ctype = ctypes.create_string_buffer(input_terminal.encode(self._encoding))  # case 3
-        edge_ctype = visatype.ViInt32(edge.value)  # case 9
+        vi_ctype = self._vi_ctype  # case 1
+        input_terminal_ctype = input_terminal.encode(self._encoding)  # case 3
+        edge_ctype = _scalar_ctypes.ConfigureDigitalEdgePulseTrigger_edge
+        edge_ctype.value = edge.value  # case 9
         error_code = self._library.niDCPower_ConfigureDigitalEdgePulseTrigger(vi_ctype, input_terminal_ctype, edge_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_digital_edge_sequence_advance_trigger(self, input_terminal, edge=enums.DigitalEdge.RISING):
@@ -2765,11 +3277,13 @@ class Session(_SessionBase):
         '''
         if type(edge) is not enums.DigitalEdge:
             raise TypeError('Parameter mode must be of type ' + str(enums.DigitalEdge))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        input_terminal_ctype = ctypes.create_string_buffer(input_terminal.encode(self._encoding))  # case 3
-        edge_ctype = visatype.ViInt32(edge.value)  # case 9
+        vi_ctype = self._vi_ctype  # case 1
+        input_terminal_ctype = input_terminal.encode(self._encoding)  # case 3
+        edge_ctype = _scalar_ctypes.ConfigureDigitalEdgeSequenceAdvanceTrigger_edge
+        edge_ctype.value = edge.value  # case 9
         error_code = self._library.niDCPower_ConfigureDigitalEdgeSequenceAdvanceTrigger(vi_ctype, input_terminal_ctype, edge_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_digital_edge_source_trigger(self, input_terminal, edge=enums.DigitalEdge.RISING):
@@ -2810,11 +3324,13 @@ class Session(_SessionBase):
         '''
         if type(edge) is not enums.DigitalEdge:
             raise TypeError('Parameter mode must be of type ' + str(enums.DigitalEdge))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        input_terminal_ctype = ctypes.create_string_buffer(input_terminal.encode(self._encoding))  # case 3
-        edge_ctype = visatype.ViInt32(edge.value)  # case 9
+        vi_ctype = self._vi_ctype  # case 1
+        input_terminal_ctype = input_terminal.encode(self._encoding)  # case 3
+        edge_ctype = _scalar_ctypes.ConfigureDigitalEdgeSourceTrigger_edge
+        edge_ctype.value = edge.value  # case 9
         error_code = self._library.niDCPower_ConfigureDigitalEdgeSourceTrigger(vi_ctype, input_terminal_ctype, edge_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_digital_edge_start_trigger(self, input_terminal, edge=enums.DigitalEdge.RISING):
@@ -2855,11 +3371,13 @@ class Session(_SessionBase):
         '''
         if type(edge) is not enums.DigitalEdge:
             raise TypeError('Parameter mode must be of type ' + str(enums.DigitalEdge))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        input_terminal_ctype = ctypes.create_string_buffer(input_terminal.encode(self._encoding))  # case 3
-        edge_ctype = visatype.ViInt32(edge.value)  # case 9
+        vi_ctype = self._vi_ctype  # case 1
+        input_terminal_ctype = input_terminal.encode(self._encoding)  # case 3
+        edge_ctype = _scalar_ctypes.ConfigureDigitalEdgeStartTrigger_edge
+        edge_ctype.value = edge.value  # case 9
         error_code = self._library.niDCPower_ConfigureDigitalEdgeStartTrigger(vi_ctype, input_terminal_ctype, edge_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def create_advanced_sequence(self, sequence_name, attribute_ids, set_as_active_sequence=True):
@@ -2993,11 +3511,12 @@ class Session(_SessionBase):
                 +--------------------------------+-----------+---------+---------+---------+---------+-------------------+-------------------+----------------+
             set_as_active_sequence (bool): Specifies that this current sequence is active.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        sequence_name_ctype = ctypes.create_string_buffer(sequence_name.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        sequence_name_ctype = sequence_name.encode(self._encoding)  # case 3
         attribute_id_count_ctype = visatype.ViInt32(len(attribute_ids))  # case 5
-        attribute_ids_ctype = (visatype.ViInt32 * len(attribute_ids))(*attribute_ids)  # case 4
-        set_as_active_sequence_ctype = visatype.ViBoolean(set_as_active_sequence)  # case 8
+        attribute_ids_ctype = _converters.convert_to_ctypes_array(attribute_ids, visatype.ViInt32)  # case 4
+        set_as_active_sequence_ctype = _scalar_ctypes.CreateAdvancedSequence_set_as_active_sequence
+        set_as_active_sequence_ctype.value = set_as_active_sequence  # case 8
         error_code = self._library.niDCPower_CreateAdvancedSequence(vi_ctype, sequence_name_ctype, attribute_id_count_ctype, attribute_ids_ctype, set_as_active_sequence_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -3037,8 +3556,9 @@ class Session(_SessionBase):
         Args:
             set_as_active_step (bool): Specifies that this current step in the active sequence is active.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        set_as_active_step_ctype = visatype.ViBoolean(set_as_active_step)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        set_as_active_step_ctype = _scalar_ctypes.CreateAdvancedSequenceStep_set_as_active_step
+        set_as_active_step_ctype.value = set_as_active_step  # case 8
         error_code = self._library.niDCPower_CreateAdvancedSequenceStep(vi_ctype, set_as_active_step_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -3073,8 +3593,8 @@ class Session(_SessionBase):
         Args:
             sequence_name (string): specifies the name of the sequence to delete.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        sequence_name_ctype = ctypes.create_string_buffer(sequence_name.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        sequence_name_ctype = sequence_name.encode(self._encoding)  # case 3
         error_code = self._library.niDCPower_DeleteAdvancedSequence(vi_ctype, sequence_name_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -3089,7 +3609,7 @@ class Session(_SessionBase):
         This function opens the output relay on devices that have an output
         relay.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niDCPower_Disable(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -3161,10 +3681,11 @@ class Session(_SessionBase):
                 | "PXI_Trig7" | PXI trigger line 7   |
                 +-------------+----------------------+
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        signal_ctype = visatype.ViInt32(signal)  # case 8
-        signal_identifier_ctype = ctypes.create_string_buffer(signal_identifier.encode(self._encoding))  # case 3
-        output_terminal_ctype = ctypes.create_string_buffer(output_terminal.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        signal_ctype = _scalar_ctypes.ExportSignal_signal
+        signal_ctype.value = signal  # case 8
+        signal_identifier_ctype = signal_identifier.encode(self._encoding)  # case 3
+        output_terminal_ctype = output_terminal.encode(self._encoding)  # case 3
         error_code = self._library.niDCPower_ExportSignal(vi_ctype, signal_ctype, signal_identifier_ctype, output_terminal_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -3195,13 +3716,13 @@ class Session(_SessionBase):
                 calibrated.
             minute (int): Returns the **minute** in which the device was last calibrated.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        year_ctype = visatype.ViInt32()  # case 13
-        month_ctype = visatype.ViInt32()  # case 13
-        day_ctype = visatype.ViInt32()  # case 13
-        hour_ctype = visatype.ViInt32()  # case 13
-        minute_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niDCPower_GetSelfCalLastDateAndTime(vi_ctype, ctypes.pointer(year_ctype), ctypes.pointer(month_ctype), ctypes.pointer(day_ctype), ctypes.pointer(hour_ctype), ctypes.pointer(minute_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        year_ctype = _scalar_ctypes.GetSelfCalLastDateAndTime_year  # case 13
+        month_ctype = _scalar_ctypes.GetSelfCalLastDateAndTime_month  # case 13
+        day_ctype = _scalar_ctypes.GetSelfCalLastDateAndTime_day  # case 13
+        hour_ctype = _scalar_ctypes.GetSelfCalLastDateAndTime_hour  # case 13
+        minute_ctype = _scalar_ctypes.GetSelfCalLastDateAndTime_minute  # case 13
+        error_code = self._library.niDCPower_GetSelfCalLastDateAndTime(vi_ctype, _scalar_ctypes.GetSelfCalLastDateAndTime_year_pointer, _scalar_ctypes.GetSelfCalLastDateAndTime_month_pointer, _scalar_ctypes.GetSelfCalLastDateAndTime_day_pointer, _scalar_ctypes.GetSelfCalLastDateAndTime_hour_pointer, _scalar_ctypes.GetSelfCalLastDateAndTime_minute_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(year_ctype.value), int(month_ctype.value), int(day_ctype.value), int(hour_ctype.value), int(minute_ctype.value)
 
@@ -3228,9 +3749,9 @@ class Session(_SessionBase):
             temperature (float): Returns the onboard **temperature** of the device, in degrees Celsius,
                 during the oldest successful calibration.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        temperature_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niDCPower_GetSelfCalLastTemp(vi_ctype, ctypes.pointer(temperature_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        temperature_ctype = _scalar_ctypes.GetSelfCalLastTemp_temperature  # case 13
+        error_code = self._library.niDCPower_GetSelfCalLastTemp(vi_ctype, _scalar_ctypes.GetSelfCalLastTemp_temperature_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(temperature_ctype.value)
 
@@ -3299,12 +3820,13 @@ class Session(_SessionBase):
             vi (int): Returns a session handle that you use to identify the device in all
                 subsequent NI-DCPower function calls.
         '''
-        resource_name_ctype = ctypes.create_string_buffer(resource_name.encode(self._encoding))  # case 3
-        channels_ctype = ctypes.create_string_buffer(channels.encode(self._encoding))  # case 3
-        reset_ctype = visatype.ViBoolean(reset)  # case 8
-        option_string_ctype = ctypes.create_string_buffer(option_string.encode(self._encoding))  # case 3
-        vi_ctype = visatype.ViSession()  # case 13
-        error_code = self._library.niDCPower_InitializeWithChannels(resource_name_ctype, channels_ctype, reset_ctype, option_string_ctype, ctypes.pointer(vi_ctype))
+        resource_name_ctype = resource_name.encode(self._encoding)  # case 3
+        channels_ctype = channels.encode(self._encoding)  # case 3
+        reset_ctype = _scalar_ctypes.InitializeWithChannels_reset
+        reset_ctype.value = reset  # case 8
+        option_string_ctype = option_string.encode(self._encoding)  # case 3
+        vi_ctype = _scalar_ctypes.InitializeWithChannels_vi  # case 13
+        error_code = self._library.niDCPower_InitializeWithChannels(resource_name_ctype, channels_ctype, reset_ctype, option_string_ctype, _scalar_ctypes.InitializeWithChannels_vi_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(vi_ctype.value)
 
@@ -3324,7 +3846,7 @@ class Session(_SessionBase):
         `Programming
         States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niDCPower_Initiate(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -3338,9 +3860,9 @@ class Session(_SessionBase):
         Returns:
             temperature (float): Returns the onboard **temperature**, in degrees Celsius, of the device.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        temperature_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niDCPower_ReadCurrentTemperature(vi_ctype, ctypes.pointer(temperature_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        temperature_ctype = _scalar_ctypes.ReadCurrentTemperature_temperature  # case 13
+        error_code = self._library.niDCPower_ReadCurrentTemperature(vi_ctype, _scalar_ctypes.ReadCurrentTemperature_temperature_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(temperature_ctype.value)
 
@@ -3361,9 +3883,10 @@ class Session(_SessionBase):
         This will also open the output relay on devices that have an output
         relay.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niDCPower_ResetDevice(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def reset_with_defaults(self):
@@ -3377,9 +3900,10 @@ class Session(_SessionBase):
         function, this function can assign user-defined default values for
         configurable attributes from the IVI configuration.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niDCPower_ResetWithDefaults(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def send_software_edge_trigger(self, trigger=enums.SendSoftwareEdgeTriggerType.START):
@@ -3416,12 +3940,47 @@ class Session(_SessionBase):
         '''
         if type(trigger) is not enums.SendSoftwareEdgeTriggerType:
             raise TypeError('Parameter mode must be of type ' + str(enums.SendSoftwareEdgeTriggerType))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        trigger_ctype = visatype.ViInt32(trigger.value)  # case 9
+        vi_ctype = self._vi_ctype  # case 1
+        trigger_ctype = _scalar_ctypes.SendSoftwareEdgeTrigger_trigger
+        trigger_ctype.value = trigger.value  # case 9
         error_code = self._library.niDCPower_SendSoftwareEdgeTrigger(vi_ctype, trigger_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
+    def stream_measurements(self, channels, chunk_size=1000, timeout=5.0):
+        '''stream_measurements
+
+        Generator that fetches the measure records of channels while they are being acquired, in chunks of the
+        measurements available so far.
+
+        It reads fetch_backlog of each channel in turn, and fetches that many measurements, up to
+        **chunk_size**, with fetch_multiple_into(). It stops once measure_record_length measurements of every
+        channel are fetched, or never for channels whose measure_record_length_is_finite is False, until the
+        caller stops iterating.
+
+        Each item is a MeasurementChunk named tuple of (channel, offset, timestamps, voltage_measurements,
+        current_measurements, in_compliance), where **offset** is the index of the first measurement of the
+        chunk within the record of the channel. The other fields have the same length.
+        **voltage_measurements** and **current_measurements** are ctypes arrays of visatype.ViReal64, and
+        **in_compliance** is a ctypes array of visatype.ViBoolean, nonzero where the output was in compliance.
+        Use numpy.frombuffer() to wrap them without copying them. **timestamps** is a sequence of the time of
+        each measurement, in seconds from the first one, computed from measure_record_delta_time when indexed.
+        Its **offset** and **delta_time** attributes give all of them at once, i.e.
+        (offset + numpy.arange(len(timestamps))) * delta_time.
+
+        Each channel has its own buffers, allocated once, so a chunk stays valid until the next chunk of the
+        same channel is requested. Copy the data to keep it longer.
+
+        Note:
+        Initiate first, i.e. in a 'with session.initiate():' block.
+
+        Args:
+            channels (string): Comma-separated list, or Python list, of the channels to fetch. Each entry must name a single channel.
+            chunk_size (int): Maximum number of measurements in each chunk.
+            timeout (float): Maximum time, in seconds, to wait for new measurements on any of the channels.
+        '''
+        return _streaming.stream_measurements(self, channels, chunk_size, timeout)
+
     def wait_for_event(self, event_id, timeout=10.0):
         '''wait_for_event
 
@@ -3466,9 +4025,11 @@ class Session(_SessionBase):
         '''
         if type(event_id) is not enums.Event:
             raise TypeError('Parameter mode must be of type ' + str(enums.Event))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        event_id_ctype = visatype.ViInt32(event_id.value)  # case 9
-        timeout_ctype = visatype.ViReal64(timeout)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        event_id_ctype = _scalar_ctypes.WaitForEvent_event_id
+        event_id_ctype.value = event_id.value  # case 9
+        timeout_ctype = _scalar_ctypes.WaitForEvent_timeout
+        timeout_ctype.value = timeout  # case 8
         error_code = self._library.niDCPower_WaitForEvent(vi_ctype, event_id_ctype, timeout_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -3488,7 +4049,7 @@ class Session(_SessionBase):
         `Programming
         States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niDCPower_close(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -3503,9 +4064,10 @@ class Session(_SessionBase):
         States <REPLACE_DRIVER_SPECIFIC_URL_1(programmingstates)>`__ topic for
         more information about NI-DCPower software states.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niDCPower_reset(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def self_test(self):
@@ -3527,11 +4089,12 @@ class Session(_SessionBase):
             self_test_message (string): Returns the self-test result message. The size of this array must be at
                 least 256 bytes.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        self_test_result_ctype = visatype.ViInt16()  # case 13
+        vi_ctype = self._vi_ctype  # case 1
+        self_test_result_ctype = _scalar_ctypes.self_test_self_test_result  # case 13
         self_test_message_ctype = (visatype.ViChar * 256)()  # case 10
-        error_code = self._library.niDCPower_self_test(vi_ctype, ctypes.pointer(self_test_result_ctype), self_test_message_ctype)
+        error_code = self._library.niDCPower_self_test(vi_ctype, _scalar_ctypes.self_test_self_test_result_pointer, self_test_message_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return int(self_test_result_ctype.value), self_test_message_ctype.value.decode(self._encoding)
 
 
@@ -0,0 +1,410 @@
+# This file was generated
+'''Simulated NI-DCPower runtime, for testing and benchmarking without hardware.'''
+
+from nidcpower import _simulation
+
+
+# (name, direction, type, is_buffer, size mechanism, index of the size parameter, default value) of every parameter of every function
+_functions = {
+    'niDCPower_Abort': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niDCPower_Commit': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niDCPower_ConfigureApertureTime': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('apertureTime', 'in', 'ViReal64', False, None, None, None),
+        ('Units', 'in', 'ViInt32', False, None, None, 1028),
+    ),
+    'niDCPower_ConfigureDigitalEdgeMeasureTrigger': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('inputTerminal', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Edge', 'in', 'ViInt32', False, None, None, 1016),
+    ),
+    'niDCPower_ConfigureDigitalEdgePulseTrigger': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('inputTerminal', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Edge', 'in', 'ViInt32', False, None, None, 1016),
+    ),
+    'niDCPower_ConfigureDigitalEdgeSequenceAdvanceTrigger': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('inputTerminal', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Edge', 'in', 'ViInt32', False, None, None, 1016),
+    ),
+    'niDCPower_ConfigureDigitalEdgeSourceTrigger': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('inputTerminal', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Edge', 'in', 'ViInt32', False, None, None, 1016),
+    ),
+    'niDCPower_ConfigureDigitalEdgeStartTrigger': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('inputTerminal', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Edge', 'in', 'ViInt32', False, None, None, 1016),
+    ),
+    'niDCPower_CreateAdvancedSequence': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('sequenceName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeIdCount', 'in', 'ViInt32', False, None, None, None),
+        ('attributeIds', 'in', 'ViInt32', True, 'len', None, None),
+        ('setAsActiveSequence', 'in', 'ViBoolean', False, None, None, None),
+    ),
+    'niDCPower_CreateAdvancedSequenceStep': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('setAsActiveStep', 'in', 'ViBoolean', False, None, None, None),
+    ),
+    'niDCPower_DeleteAdvancedSequence': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('sequenceName', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niDCPower_Disable': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niDCPower_ExportSignal': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Signal', 'in', 'ViInt32', False, None, None, None),
+        ('signalIdentifier', 'in', 'ViChar', True, 'fixed', None, None),
+        ('outputTerminal', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niDCPower_FetchMultiple': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Timeout', 'in', 'ViReal64', False, None, None, None),
+        ('Count', 'in', 'ViInt32', False, None, None, None),
+        ('voltageMeasurements', 'out', 'ViReal64', True, 'passed-in', 3, None),
+        ('currentMeasurements', 'out', 'ViReal64', True, 'passed-in', 3, None),
+        ('inCompliance', 'out', 'ViBoolean', True, 'passed-in', 3, None),
+        ('actualCount', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niDCPower_GetAttributeViBoolean': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'out', 'ViBoolean', False, None, None, None),
+    ),
+    'niDCPower_GetAttributeViInt32': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niDCPower_GetAttributeViInt64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'out', 'ViInt64', False, None, None, None),
+    ),
+    'niDCPower_GetAttributeViReal64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niDCPower_GetAttributeViString': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('bufferSize', 'in', 'ViInt32', False, None, None, None),
+        ('attributeValue', 'out', 'ViChar', True, 'ivi-dance', 3, None),
+    ),
+    'niDCPower_GetChannelName': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Index', 'in', 'ViInt32', False, None, None, None),
+        ('bufferSize', 'in', 'ViInt32', False, None, None, None),
+        ('channelName', 'out', 'ViChar', True, 'ivi-dance', 2, None),
+    ),
+    'niDCPower_GetError': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Code', 'out', 'ViStatus', False, None, None, None),
+        ('BufferSize', 'in', 'ViInt32', False, None, None, None),
+        ('Description', 'out', 'ViChar', True, 'ivi-dance', 2, None),
+    ),
+    'niDCPower_GetSelfCalLastDateAndTime': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Year', 'out', 'ViInt32', False, None, None, None),
+        ('Month', 'out', 'ViInt32', False, None, None, None),
+        ('Day', 'out', 'ViInt32', False, None, None, None),
+        ('Hour', 'out', 'ViInt32', False, None, None, None),
+        ('Minute', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niDCPower_GetSelfCalLastTemp': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Temperature', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niDCPower_InitializeWithChannels': (
+        ('resourceName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Channels', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Reset', 'in', 'ViBoolean', False, None, None, None),
+        ('optionString', 'in', 'ViChar', True, 'fixed', None, None),
+        ('vi', 'out', 'ViSession', False, None, None, None),
+    ),
+    'niDCPower_Initiate': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niDCPower_Measure': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('measurementType', 'in', 'ViInt32', False, None, None, 0),
+        ('Measurement', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niDCPower_QueryInCompliance': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('inCompliance', 'out', 'ViBoolean', False, None, None, None),
+    ),
+    'niDCPower_QueryMaxCurrentLimit': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('voltageLevel', 'in', 'ViReal64', False, None, None, None),
+        ('maxCurrentLimit', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niDCPower_QueryMaxVoltageLevel': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('currentLimit', 'in', 'ViReal64', False, None, None, None),
+        ('maxVoltageLevel', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niDCPower_QueryMinCurrentLimit': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('voltageLevel', 'in', 'ViReal64', False, None, None, None),
+        ('minCurrentLimit', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niDCPower_QueryOutputState': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('outputState', 'in', 'ViInt32', False, None, None, 0),
+        ('inState', 'out', 'ViBoolean', False, None, None, None),
+    ),
+    'niDCPower_ReadCurrentTemperature': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Temperature', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niDCPower_ResetDevice': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niDCPower_ResetWithDefaults': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niDCPower_SendSoftwareEdgeTrigger': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Trigger', 'in', 'ViInt32', False, None, None, 1034),
+    ),
+    'niDCPower_SetAttributeViBoolean': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViBoolean', False, None, None, None),
+    ),
+    'niDCPower_SetAttributeViInt32': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niDCPower_SetAttributeViInt64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViInt64', False, None, None, None),
+    ),
+    'niDCPower_SetAttributeViReal64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niDCPower_SetAttributeViString': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niDCPower_SetSequence': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Values', 'in', 'ViReal64', True, 'len', None, None),
+        ('sourceDelays', 'in', 'ViReal64', True, 'fixed', None, None),
+        ('Size', 'in', 'ViUInt32', False, None, None, None),
+    ),
+    'niDCPower_WaitForEvent': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('eventId', 'in', 'ViInt32', False, None, None, 1030),
+        ('Timeout', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niDCPower_close': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niDCPower_error_message': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('errorCode', 'in', 'ViStatus', False, None, None, None),
+        ('errorMessage', 'out', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niDCPower_reset': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niDCPower_self_test': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('selfTestResult', 'out', 'ViInt16', False, None, None, None),
+        ('selfTestMessage', 'out', 'ViChar', True, 'fixed', None, None),
+    ),
+}
+
+# Value of every attribute until it is set
+_attributes = {
+    1050002: False,  # RANGE_CHECK
+    1050003: False,  # QUERY_INSTRUMENT_STATUS
+    1050004: False,  # CACHE
+    1050005: False,  # SIMULATE
+    1050006: False,  # RECORD_COERCIONS
+    1050007: '',  # DRIVER_SETUP
+    1050021: False,  # INTERCHANGE_CHECK
+    1050203: 0,  # CHANNEL_COUNT
+    1050302: '',  # SPECIFIC_DRIVER_PREFIX
+    1050304: '',  # IO_RESOURCE_DESCRIPTOR
+    1050305: '',  # LOGICAL_NAME
+    1050327: '',  # SUPPORTED_INSTRUMENT_MODELS
+    1050401: '',  # GROUP_CAPABILITIES
+    1050510: '',  # INSTRUMENT_FIRMWARE_REVISION
+    1050511: '',  # INSTRUMENT_MANUFACTURER
+    1050512: '',  # INSTRUMENT_MODEL
+    1050513: '',  # SPECIFIC_DRIVER_VENDOR
+    1050514: '',  # SPECIFIC_DRIVER_DESCRIPTION
+    1050515: 0,  # SPECIFIC_DRIVER_CLASS_SPEC_MAJOR_VERSION
+    1050516: 0,  # SPECIFIC_DRIVER_CLASS_SPEC_MINOR_VERSION
+    1050551: '',  # SPECIFIC_DRIVER_REVISION
+    1150000: 1003,  # POWER_SOURCE
+    1150001: 1003,  # POWER_SOURCE_IN_USE
+    1150002: False,  # AUXILIARY_POWER_SOURCE_AVAILABLE
+    1150003: 0,  # SAMPLES_TO_AVERAGE
+    1150004: 0.0,  # CURRENT_LIMIT_RANGE
+    1150005: 0.0,  # VOLTAGE_LEVEL_RANGE
+    1150006: False,  # RESET_AVERAGE_BEFORE_MEASUREMENT
+    1150007: False,  # OVERRANGING_ENABLED
+    1150008: 1006,  # OUTPUT_FUNCTION
+    1150009: 0.0,  # CURRENT_LEVEL
+    1150010: 0.0,  # VOLTAGE_LIMIT
+    1150011: 0.0,  # CURRENT_LEVEL_RANGE
+    1150012: 0.0,  # VOLTAGE_LIMIT_RANGE
+    1150013: 1008,  # SENSE
+    1150014: 1010,  # OUTPUT_CAPACITANCE
+    1150015: 0,  # VOLTAGE_LEVEL_AUTORANGE
+    1150016: 0,  # CURRENT_LIMIT_AUTORANGE
+    1150017: 0,  # CURRENT_LEVEL_AUTORANGE
+    1150018: 0,  # VOLTAGE_LIMIT_AUTORANGE
+    1150020: 50.0,  # POWER_LINE_FREQUENCY
+    1150021: 1012,  # START_TRIGGER_TYPE
+    1150022: 1016,  # DIGITAL_EDGE_START_TRIGGER_EDGE
+    1150023: '',  # DIGITAL_EDGE_START_TRIGGER_INPUT_TERMINAL
+    1150024: '',  # EXPORTED_START_TRIGGER_OUTPUT_TERMINAL
+    1150025: 0,  # SEQUENCE_LOOP_COUNT
+    1150026: 1012,  # SEQUENCE_ADVANCE_TRIGGER_TYPE
+    1150027: 1016,  # DIGITAL_EDGE_SEQUENCE_ADVANCE_TRIGGER_EDGE
+    1150028: '',  # DIGITAL_EDGE_SEQUENCE_ADVANCE_TRIGGER_INPUT_TERMINAL
+    1150029: '',  # EXPORTED_SEQUENCE_ADVANCE_TRIGGER_OUTPUT_TERMINAL
+    1150030: 1012,  # SOURCE_TRIGGER_TYPE
+    1150031: 1016,  # DIGITAL_EDGE_SOURCE_TRIGGER_EDGE
+    1150032: '',  # DIGITAL_EDGE_SOURCE_TRIGGER_INPUT_TERMINAL
+    1150033: '',  # EXPORTED_SOURCE_TRIGGER_OUTPUT_TERMINAL
+    1150034: 1012,  # MEASURE_TRIGGER_TYPE
+    1150035: 1016,  # DIGITAL_EDGE_MEASURE_TRIGGER_EDGE
+    1150036: '',  # DIGITAL_EDGE_MEASURE_TRIGGER_INPUT_TERMINAL
+    1150037: '',  # EXPORTED_MEASURE_TRIGGER_OUTPUT_TERMINAL
+    1150038: 1018,  # SEQUENCE_ITERATION_COMPLETE_EVENT_PULSE_POLARITY
+    1150039: 0.0,  # SEQUENCE_ITERATION_COMPLETE_EVENT_PULSE_WIDTH
+    1150040: '',  # SEQUENCE_ITERATION_COMPLETE_EVENT_OUTPUT_TERMINAL
+    1150041: 1018,  # SOURCE_COMPLETE_EVENT_PULSE_POLARITY
+    1150042: 0.0,  # SOURCE_COMPLETE_EVENT_PULSE_WIDTH
+    1150043: '',  # SOURCE_COMPLETE_EVENT_OUTPUT_TERMINAL
+    1150044: 1018,  # MEASURE_COMPLETE_EVENT_PULSE_POLARITY
+    1150045: 0.0,  # MEASURE_COMPLETE_EVENT_PULSE_WIDTH
+    1150046: 0.0,  # MEASURE_COMPLETE_EVENT_DELAY
+    1150047: '',  # MEASURE_COMPLETE_EVENT_OUTPUT_TERMINAL
+    1150048: 1018,  # SEQUENCE_ENGINE_DONE_EVENT_PULSE_POLARITY
+    1150049: 0.0,  # SEQUENCE_ENGINE_DONE_EVENT_PULSE_WIDTH
+    1150050: '',  # SEQUENCE_ENGINE_DONE_EVENT_OUTPUT_TERMINAL
+    1150051: 0.0,  # SOURCE_DELAY
+    1150054: 1020,  # SOURCE_MODE
+    1150055: 0,  # AUTO_ZERO
+    1150056: 0,  # FETCH_BACKLOG
+    1150057: 1025,  # MEASURE_WHEN
+    1150058: 0.0,  # APERTURE_TIME
+    1150059: 1028,  # APERTURE_TIME_UNITS
+    1150060: False,  # OUTPUT_CONNECTED
+    1150061: 0.0,  # OUTPUT_RESISTANCE
+    1150062: 1038,  # TRANSIENT_RESPONSE
+    1150063: 0,  # MEASURE_RECORD_LENGTH
+    1150064: False,  # MEASURE_RECORD_LENGTH_IS_FINITE
+    1150065: 0.0,  # MEASURE_RECORD_DELTA_TIME
+    1150066: 1043,  # DC_NOISE_REJECTION
+    1150067: 0.0,  # VOLTAGE_GAIN_BANDWIDTH
+    1150068: 0.0,  # VOLTAGE_COMPENSATION_FREQUENCY
+    1150069: 0.0,  # VOLTAGE_POLE_ZERO_RATIO
+    1150070: 0.0,  # CURRENT_GAIN_BANDWIDTH
+    1150071: 0.0,  # CURRENT_COMPENSATION_FREQUENCY
+    1150072: 0.0,  # CURRENT_POLE_ZERO_RATIO
+    1150073: 1045,  # SELF_CALIBRATION_PERSISTENCE
+    1150074: '',  # ACTIVE_ADVANCED_SEQUENCE
+    1150075: 0,  # ACTIVE_ADVANCED_SEQUENCE_STEP
+    1150077: 0,  # MEASURE_BUFFER_SIZE
+    1150078: False,  # SEQUENCE_LOOP_COUNT_IS_FINITE
+    1150080: 0.0,  # PULSE_VOLTAGE_LEVEL
+    1150081: 0.0,  # PULSE_CURRENT_LIMIT
+    1150082: 0.0,  # PULSE_BIAS_VOLTAGE_LEVEL
+    1150083: 0.0,  # PULSE_BIAS_CURRENT_LIMIT
+    1150084: 0.0,  # PULSE_VOLTAGE_LEVEL_RANGE
+    1150085: 0.0,  # PULSE_CURRENT_LIMIT_RANGE
+    1150086: 0.0,  # PULSE_CURRENT_LEVEL
+    1150087: 0.0,  # PULSE_VOLTAGE_LIMIT
+    1150088: 0.0,  # PULSE_BIAS_CURRENT_LEVEL
+    1150089: 0.0,  # PULSE_BIAS_VOLTAGE_LIMIT
+    1150090: 0.0,  # PULSE_CURRENT_LEVEL_RANGE
+    1150091: 0.0,  # PULSE_VOLTAGE_LIMIT_RANGE
+    1150092: 0.0,  # PULSE_BIAS_DELAY
+    1150093: 0.0,  # PULSE_ON_TIME
+    1150094: 0.0,  # PULSE_OFF_TIME
+    1150095: 1012,  # PULSE_TRIGGER_TYPE
+    1150096: 1016,  # DIGITAL_EDGE_PULSE_TRIGGER_EDGE
+    1150097: '',  # DIGITAL_EDGE_PULSE_TRIGGER_INPUT_TERMINAL
+    1150098: '',  # EXPORTED_PULSE_TRIGGER_OUTPUT_TERMINAL
+    1150099: '',  # PULSE_COMPLETE_EVENT_OUTPUT_TERMINAL
+    1150100: 1018,  # PULSE_COMPLETE_EVENT_PULSE_POLARITY
+    1150101: 0.0,  # PULSE_COMPLETE_EVENT_PULSE_WIDTH
+    1150102: '',  # READY_FOR_PULSE_TRIGGER_EVENT_OUTPUT_TERMINAL
+    1150103: 1018,  # READY_FOR_PULSE_TRIGGER_EVENT_PULSE_POLARITY
+    1150104: 0.0,  # READY_FOR_PULSE_TRIGGER_EVENT_PULSE_WIDTH
+    1150105: False,  # INTERLOCK_INPUT_OPEN
+    1250001: 0.0,  # VOLTAGE_LEVEL
+    1250002: False,  # OVP_ENABLED
+    1250003: 0.0,  # OVP_LIMIT
+    1250005: 0.0,  # CURRENT_LIMIT
+    1250006: False,  # OUTPUT_ENABLED
+}
+
+# Values returned in output parameters, by function and parameter name. Output buffers that are not listed are
+# filled with synthetic data, and output counts (i.e. actualNumberOfPoints) return the number of elements written.
+_output_values = {
+}
+
+
+class Simulator(_simulation.SimulatedLibrary):
+    '''Simulator
+
+    Pure-Python stand-in for the NI-DCPower runtime. It keeps the value of attributes for each session and fills
+    output buffers with synthetic data. Pass an instance to library_singleton.set_backend() before creating sessions:
+
+        import nidcpower.simulator
+        nidcpower.library_singleton.set_backend(nidcpower.simulator.Simulator(latency=0.0001))
+
+    Args:
+        latency (float): Time, in seconds, that every function call sleeps for. Can be changed at any time.
+        array_size (int): Number of elements of output buffers that the driver sizes, i.e. with the IVI-dance
+        attribute_values (dict): Value of attributes, by attribute ID, until they are set
+        output_values (dict): Values returned in output parameters, by C function name without the prefix and
+            parameter name, i.e. {'ReadMultiPoint': {'readingArray': 1.5}}. A single value fills a whole buffer, and
+            a dict of field values fills every structure of a buffer of structures.
+    '''
+
+    def __init__(self, latency=0.0, array_size=1000, attribute_values=None, output_values=None):
+        super(Simulator, self).__init__('niDCPower_', _functions, _attributes, _output_values, latency, array_size, attribute_values, output_values)
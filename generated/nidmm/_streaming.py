@@ -0,0 +1,129 @@
+'''Fetching of an acquisition while it is in progress, as readings and waveform samples become available.'''
+
+import collections
+import threading
+import time
+
+from nidmm import _converters
+from nidmm import errors
+from nidmm import visatype
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+
+# NIDMM_ERROR_MAX_TIME_EXCEEDED, the same error the driver returns when a fetch times out
+_MAX_TIME_EXCEEDED = -1074126845
+
+# Seconds to wait between calls to read_status() while not enough readings are available
+_POLL_INTERVAL = 0.001
+
+WaveformChunk = collections.namedtuple('WaveformChunk', ['offset', 'start_time', 'sample_interval', 'samples'])
+
+# Put in the queue of waveform chunks after the last one
+_END = object()
+
+
+def _get_total_readings(session, readings_per_trigger):
+    '''Returns the number of readings of the acquisition, or None if it is continuous'''
+    return session.trigger_count * readings_per_trigger or None
+
+
+def stream_readings(session, chunk_size, timeout=5.0):
+    '''Generator behind nidmm.Session.stream_readings(). See the Session method for documentation.'''
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be greater than 0, not {0}'.format(chunk_size))
+
+    remaining = _get_total_readings(session, session.sample_count)
+
+    buffer = (visatype.ViReal64 * chunk_size)()
+    deadline = time.time() + timeout
+    while remaining is None or remaining > 0:
+        backlog, _ = session.read_status()
+        count = min(backlog, chunk_size) if remaining is None else min(backlog, chunk_size, remaining)
+        if count == 0:
+            if time.time() > deadline:
+                raise errors.Error(_MAX_TIME_EXCEEDED, 'Maximum time exceeded before the operation completed.')
+            time.sleep(_POLL_INTERVAL)
+            continue
+        readings = _converters.get_ctypes_array_head(buffer, count)
+        count = session.fetch_multi_point_into(readings)
+        if remaining is not None:
+            remaining -= count
+        yield _converters.get_ctypes_array_head(readings, count)
+        deadline = time.time() + timeout
+
+
+def _put(chunks, item, stop):
+    '''Puts item in the queue once there is room, unless stop is set first. Returns whether it was put.'''
+    while not stop.is_set():
+        try:
+            chunks.put(item, timeout=_POLL_INTERVAL * 10)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _wait_for_backlog(session, count, timeout, stop):
+    '''Waits until count samples are available. Returns False if stop was set first.'''
+    deadline = time.time() + timeout
+    while session.read_status()[0] < count:
+        if stop.is_set():
+            return False
+        if time.time() > deadline:
+            raise errors.Error(_MAX_TIME_EXCEEDED, 'Maximum time exceeded before the operation completed.')
+        time.sleep(_POLL_INTERVAL)
+    return True
+
+
+def _fetch_waveform_chunks(session, chunk_size, remaining, timeout, chunks, stop):
+    '''Runs on the fetching thread: puts the chunks, then _END or the exception that stopped it, in chunks'''
+    try:
+        while remaining is None or remaining > 0:
+            count = chunk_size if remaining is None else min(chunk_size, remaining)
+            if not _wait_for_backlog(session, count, timeout, stop):
+                return
+            # A new array each time, since the caller may keep the ones it got
+            samples = (visatype.ViReal64 * count)()
+            count = session.fetch_waveform_into(samples)
+            if not _put(chunks, _converters.get_ctypes_array_head(samples, count), stop):
+                return
+            if remaining is not None:
+                remaining -= count
+        _put(chunks, _END, stop)
+    except Exception as e:
+        _put(chunks, e, stop)
+
+
+def stream_waveform(session, chunk_size, queue_size=4, timeout=5.0):
+    '''Generator behind nidmm.Session.stream_waveform(). See the Session method for documentation.'''
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be greater than 0, not {0}'.format(chunk_size))
+    if queue_size <= 0:
+        raise ValueError('queue_size must be greater than 0, not {0}'.format(queue_size))
+
+    remaining = _get_total_readings(session, session.waveform_points)
+    sample_interval = 1.0 / session.waveform_rate
+
+    chunks = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    fetcher = threading.Thread(target=_fetch_waveform_chunks, name='nidmm stream_waveform', args=(session, chunk_size, remaining, timeout, chunks, stop))
+    fetcher.daemon = True
+    fetcher.start()
+    offset = 0
+    try:
+        while True:
+            item = chunks.get()
+            if item is _END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield WaveformChunk(offset, offset * sample_interval, sample_interval, item)
+            offset += len(item)
+    finally:
+        # Also when the caller stops iterating early
+        stop.set()
+        fetcher.join()
@@ -1,3 +1,4 @@
+# -*- coding: utf-8 -*-
 # This file was generated
 
 from enum import Enum
@@ -612,3 +613,44 @@ class WaveformCoupling(Enum):
     '''
     DC Coupled
     '''
+
+
+# Members of each enum by value. Looking a value from the driver up in these is much faster than calling the enum with it.
+_members_by_value = {
+    ADCCalibration: dict((member.value, member) for member in ADCCalibration),
+    AcquisitionStatus: dict((member.value, member) for member in AcquisitionStatus),
+    ApertureTimeUnits: dict((member.value, member) for member in ApertureTimeUnits),
+    AutoZero: dict((member.value, member) for member in AutoZero),
+    CableCompensationType: dict((member.value, member) for member in CableCompensationType),
+    CurrentSource: dict((member.value, member) for member in CurrentSource),
+    DCBias: dict((member.value, member) for member in DCBias),
+    DCNoiseRejection: dict((member.value, member) for member in DCNoiseRejection),
+    DigitsResolution: dict((member.value, member) for member in DigitsResolution),
+    Function: dict((member.value, member) for member in Function),
+    InputResistance: dict((member.value, member) for member in InputResistance),
+    LCCalculationModel: dict((member.value, member) for member in LCCalculationModel),
+    MeasurementCompleteDest: dict((member.value, member) for member in MeasurementCompleteDest),
+    MeasurementDestinationSlope: dict((member.value, member) for member in MeasurementDestinationSlope),
+    OffsetCompensatedOhms: dict((member.value, member) for member in OffsetCompensatedOhms),
+    OperationMode: dict((member.value, member) for member in OperationMode),
+    PowerlineFrequency: dict((member.value, member) for member in PowerlineFrequency),
+    RTDType: dict((member.value, member) for member in RTDType),
+    SampleTrigSlope: dict((member.value, member) for member in SampleTrigSlope),
+    SampleTrigger: dict((member.value, member) for member in SampleTrigger),
+    ThermistorType: dict((member.value, member) for member in ThermistorType),
+    ThermocoupleReferenceJunctionType: dict((member.value, member) for member in ThermocoupleReferenceJunctionType),
+    ThermocoupleType: dict((member.value, member) for member in ThermocoupleType),
+    TransducerType: dict((member.value, member) for member in TransducerType),
+    TriggerSlope: dict((member.value, member) for member in TriggerSlope),
+    TriggerSource: dict((member.value, member) for member in TriggerSource),
+    WaveformCoupling: dict((member.value, member) for member in WaveformCoupling),
+}
+
+
+def _get_member(enum_type, value):
+    '''Returns the member of enum_type that has value, like enum_type(value)'''
+    try:
+        return _members_by_value[enum_type][value]
+    except KeyError:
+        # Raises ValueError, as the enum does for values it doesn't have
+        return enum_type(value)
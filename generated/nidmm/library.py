@@ -11,6 +11,9 @@ class Library(object):
 
     Wrapper around driver library.
     Class will setup the correct ctypes information for every function on first call.
+
+    The lock is only taken while a function is being resolved. The cfunc is published only
+    after its argtypes and restype are set, so once cached, calls do not serialize on the lock.
     '''
 
     def __init__(self, ctypes_library):
@@ -68,393 +71,491 @@ class Library(object):
         self.niDMM_self_test_cfunc = None
 
     def niDMM_Abort(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_Abort_cfunc is None:
-                self.niDMM_Abort_cfunc = self._library.niDMM_Abort
-                self.niDMM_Abort_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDMM_Abort_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_Abort_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_Abort_cfunc is None:
+                    cfunc = self._library.niDMM_Abort
+                    cfunc.argtypes = [ViSession]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_Abort_cfunc = cfunc
         return self.niDMM_Abort_cfunc(vi)
 
     def niDMM_ConfigureACBandwidth(self, vi, ac_minimum_frequency_hz, ac_maximum_frequency_hz):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureACBandwidth_cfunc is None:
-                self.niDMM_ConfigureACBandwidth_cfunc = self._library.niDMM_ConfigureACBandwidth
-                self.niDMM_ConfigureACBandwidth_cfunc.argtypes = [ViSession, ViReal64, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureACBandwidth_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_ConfigureACBandwidth_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_ConfigureACBandwidth_cfunc is None:
+                    cfunc = self._library.niDMM_ConfigureACBandwidth
+                    cfunc.argtypes = [ViSession, ViReal64, ViReal64]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_ConfigureACBandwidth_cfunc = cfunc
         return self.niDMM_ConfigureACBandwidth_cfunc(vi, ac_minimum_frequency_hz, ac_maximum_frequency_hz)
 
     def niDMM_ConfigureMeasurementAbsolute(self, vi, measurement_function, range, resolution_absolute):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureMeasurementAbsolute_cfunc is None:
-                self.niDMM_ConfigureMeasurementAbsolute_cfunc = self._library.niDMM_ConfigureMeasurementAbsolute
-                self.niDMM_ConfigureMeasurementAbsolute_cfunc.argtypes = [ViSession, ViInt32, ViReal64, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureMeasurementAbsolute_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_ConfigureMeasurementAbsolute_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_ConfigureMeasurementAbsolute_cfunc is None:
+                    cfunc = self._library.niDMM_ConfigureMeasurementAbsolute
+                    cfunc.argtypes = [ViSession, ViInt32, ViReal64, ViReal64]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_ConfigureMeasurementAbsolute_cfunc = cfunc
         return self.niDMM_ConfigureMeasurementAbsolute_cfunc(vi, measurement_function, range, resolution_absolute)
 
     def niDMM_ConfigureMeasurementDigits(self, vi, measurement_function, range, resolution_digits):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureMeasurementDigits_cfunc is None:
-                self.niDMM_ConfigureMeasurementDigits_cfunc = self._library.niDMM_ConfigureMeasurementDigits
-                self.niDMM_ConfigureMeasurementDigits_cfunc.argtypes = [ViSession, ViInt32, ViReal64, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureMeasurementDigits_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_ConfigureMeasurementDigits_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_ConfigureMeasurementDigits_cfunc is None:
+                    cfunc = self._library.niDMM_ConfigureMeasurementDigits
+                    cfunc.argtypes = [ViSession, ViInt32, ViReal64, ViReal64]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_ConfigureMeasurementDigits_cfunc = cfunc
         return self.niDMM_ConfigureMeasurementDigits_cfunc(vi, measurement_function, range, resolution_digits)
 
     def niDMM_ConfigureMultiPoint(self, vi, trigger_count, sample_count, sample_trigger, sample_interval):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureMultiPoint_cfunc is None:
-                self.niDMM_ConfigureMultiPoint_cfunc = self._library.niDMM_ConfigureMultiPoint
-                self.niDMM_ConfigureMultiPoint_cfunc.argtypes = [ViSession, ViInt32, ViInt32, ViInt32, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureMultiPoint_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_ConfigureMultiPoint_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_ConfigureMultiPoint_cfunc is None:
+                    cfunc = self._library.niDMM_ConfigureMultiPoint
+                    cfunc.argtypes = [ViSession, ViInt32, ViInt32, ViInt32, ViReal64]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_ConfigureMultiPoint_cfunc = cfunc
         return self.niDMM_ConfigureMultiPoint_cfunc(vi, trigger_count, sample_count, sample_trigger, sample_interval)
 
     def niDMM_ConfigureOpenCableCompValues(self, vi, conductance, susceptance):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureOpenCableCompValues_cfunc is None:
-                self.niDMM_ConfigureOpenCableCompValues_cfunc = self._library.niDMM_ConfigureOpenCableCompValues
-                self.niDMM_ConfigureOpenCableCompValues_cfunc.argtypes = [ViSession, ViReal64, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureOpenCableCompValues_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_ConfigureOpenCableCompValues_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_ConfigureOpenCableCompValues_cfunc is None:
+                    cfunc = self._library.niDMM_ConfigureOpenCableCompValues
+                    cfunc.argtypes = [ViSession, ViReal64, ViReal64]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_ConfigureOpenCableCompValues_cfunc = cfunc
         return self.niDMM_ConfigureOpenCableCompValues_cfunc(vi, conductance, susceptance)
 
     def niDMM_ConfigurePowerLineFrequency(self, vi, power_line_frequency_hz):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigurePowerLineFrequency_cfunc is None:
-                self.niDMM_ConfigurePowerLineFrequency_cfunc = self._library.niDMM_ConfigurePowerLineFrequency
-                self.niDMM_ConfigurePowerLineFrequency_cfunc.argtypes = [ViSession, ViReal64]  # noqa: F405
-                self.niDMM_ConfigurePowerLineFrequency_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_ConfigurePowerLineFrequency_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_ConfigurePowerLineFrequency_cfunc is None:
+                    cfunc = self._library.niDMM_ConfigurePowerLineFrequency
+                    cfunc.argtypes = [ViSession, ViReal64]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_ConfigurePowerLineFrequency_cfunc = cfunc
         return self.niDMM_ConfigurePowerLineFrequency_cfunc(vi, power_line_frequency_hz)
 
     def niDMM_ConfigureRTDCustom(self, vi, rtd_a, rtd_b, rtd_c):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureRTDCustom_cfunc is None:
-                self.niDMM_ConfigureRTDCustom_cfunc = self._library.niDMM_ConfigureRTDCustom
-                self.niDMM_ConfigureRTDCustom_cfunc.argtypes = [ViSession, ViReal64, ViReal64, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureRTDCustom_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_ConfigureRTDCustom_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_ConfigureRTDCustom_cfunc is None:
+                    cfunc = self._library.niDMM_ConfigureRTDCustom
+                    cfunc.argtypes = [ViSession, ViReal64, ViReal64, ViReal64]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_ConfigureRTDCustom_cfunc = cfunc
         return self.niDMM_ConfigureRTDCustom_cfunc(vi, rtd_a, rtd_b, rtd_c)
 
     def niDMM_ConfigureRTDType(self, vi, rtd_type, rtd_resistance):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureRTDType_cfunc is None:
-                self.niDMM_ConfigureRTDType_cfunc = self._library.niDMM_ConfigureRTDType
-                self.niDMM_ConfigureRTDType_cfunc.argtypes = [ViSession, ViInt32, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureRTDType_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_ConfigureRTDType_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_ConfigureRTDType_cfunc is None:
+                    cfunc = self._library.niDMM_ConfigureRTDType
+                    cfunc.argtypes = [ViSession, ViInt32, ViReal64]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_ConfigureRTDType_cfunc = cfunc
         return self.niDMM_ConfigureRTDType_cfunc(vi, rtd_type, rtd_resistance)
 
     def niDMM_ConfigureShortCableCompValues(self, vi, resistance, reactance):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureShortCableCompValues_cfunc is None:
-                self.niDMM_ConfigureShortCableCompValues_cfunc = self._library.niDMM_ConfigureShortCableCompValues
-                self.niDMM_ConfigureShortCableCompValues_cfunc.argtypes = [ViSession, ViReal64, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureShortCableCompValues_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_ConfigureShortCableCompValues_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_ConfigureShortCableCompValues_cfunc is None:
+                    cfunc = self._library.niDMM_ConfigureShortCableCompValues
+                    cfunc.argtypes = [ViSession, ViReal64, ViReal64]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_ConfigureShortCableCompValues_cfunc = cfunc
         return self.niDMM_ConfigureShortCableCompValues_cfunc(vi, resistance, reactance)
 
     def niDMM_ConfigureThermistorCustom(self, vi, thermistor_a, thermistor_b, thermistor_c):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureThermistorCustom_cfunc is None:
-                self.niDMM_ConfigureThermistorCustom_cfunc = self._library.niDMM_ConfigureThermistorCustom
-                self.niDMM_ConfigureThermistorCustom_cfunc.argtypes = [ViSession, ViReal64, ViReal64, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureThermistorCustom_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_ConfigureThermistorCustom_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_ConfigureThermistorCustom_cfunc is None:
+                    cfunc = self._library.niDMM_ConfigureThermistorCustom
+                    cfunc.argtypes = [ViSession, ViReal64, ViReal64, ViReal64]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_ConfigureThermistorCustom_cfunc = cfunc
         return self.niDMM_ConfigureThermistorCustom_cfunc(vi, thermistor_a, thermistor_b, thermistor_c)
 
     def niDMM_ConfigureThermocouple(self, vi, thermocouple_type, reference_junction_type):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureThermocouple_cfunc is None:
-                self.niDMM_ConfigureThermocouple_cfunc = self._library.niDMM_ConfigureThermocouple
-                self.niDMM_ConfigureThermocouple_cfunc.argtypes = [ViSession, ViInt32, ViInt32]  # noqa: F405
-                self.niDMM_ConfigureThermocouple_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_ConfigureThermocouple_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_ConfigureThermocouple_cfunc is None:
+                    cfunc = self._library.niDMM_ConfigureThermocouple
+                    cfunc.argtypes = [ViSession, ViInt32, ViInt32]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_ConfigureThermocouple_cfunc = cfunc
         return self.niDMM_ConfigureThermocouple_cfunc(vi, thermocouple_type, reference_junction_type)
 
     def niDMM_ConfigureTrigger(self, vi, trigger_source, trigger_delay):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureTrigger_cfunc is None:
-                self.niDMM_ConfigureTrigger_cfunc = self._library.niDMM_ConfigureTrigger
-                self.niDMM_ConfigureTrigger_cfunc.argtypes = [ViSession, ViInt32, ViReal64]  # noqa: F405
-                self.niDMM_ConfigureTrigger_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_ConfigureTrigger_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_ConfigureTrigger_cfunc is None:
+                    cfunc = self._library.niDMM_ConfigureTrigger
+                    cfunc.argtypes = [ViSession, ViInt32, ViReal64]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_ConfigureTrigger_cfunc = cfunc
         return self.niDMM_ConfigureTrigger_cfunc(vi, trigger_source, trigger_delay)
 
     def niDMM_ConfigureWaveformAcquisition(self, vi, measurement_function, range, rate, waveform_points):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ConfigureWaveformAcquisition_cfunc is None:
-                self.niDMM_ConfigureWaveformAcquisition_cfunc = self._library.niDMM_ConfigureWaveformAcquisition
-                self.niDMM_ConfigureWaveformAcquisition_cfunc.argtypes = [ViSession, ViInt32, ViReal64, ViReal64, ViInt32]  # noqa: F405
-                self.niDMM_ConfigureWaveformAcquisition_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_ConfigureWaveformAcquisition_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_ConfigureWaveformAcquisition_cfunc is None:
+                    cfunc = self._library.niDMM_ConfigureWaveformAcquisition
+                    cfunc.argtypes = [ViSession, ViInt32, ViReal64, ViReal64, ViInt32]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_ConfigureWaveformAcquisition_cfunc = cfunc
         return self.niDMM_ConfigureWaveformAcquisition_cfunc(vi, measurement_function, range, rate, waveform_points)
 
     def niDMM_Disable(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_Disable_cfunc is None:
-                self.niDMM_Disable_cfunc = self._library.niDMM_Disable
-                self.niDMM_Disable_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDMM_Disable_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_Disable_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_Disable_cfunc is None:
+                    cfunc = self._library.niDMM_Disable
+                    cfunc.argtypes = [ViSession]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_Disable_cfunc = cfunc
         return self.niDMM_Disable_cfunc(vi)
 
     def niDMM_Fetch(self, vi, maximum_time, reading):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_Fetch_cfunc is None:
-                self.niDMM_Fetch_cfunc = self._library.niDMM_Fetch
-                self.niDMM_Fetch_cfunc.argtypes = [ViSession, ViInt32, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDMM_Fetch_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_Fetch_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_Fetch_cfunc is None:
+                    cfunc = self._library.niDMM_Fetch
+                    cfunc.argtypes = [ViSession, ViInt32, ctypes.POINTER(ViReal64)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_Fetch_cfunc = cfunc
         return self.niDMM_Fetch_cfunc(vi, maximum_time, reading)
 
     def niDMM_FetchMultiPoint(self, vi, maximum_time, array_size, reading_array, actual_number_of_points):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_FetchMultiPoint_cfunc is None:
-                self.niDMM_FetchMultiPoint_cfunc = self._library.niDMM_FetchMultiPoint
-                self.niDMM_FetchMultiPoint_cfunc.argtypes = [ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDMM_FetchMultiPoint_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_FetchMultiPoint_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_FetchMultiPoint_cfunc is None:
+                    cfunc = self._library.niDMM_FetchMultiPoint
+                    cfunc.argtypes = [ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_FetchMultiPoint_cfunc = cfunc
         return self.niDMM_FetchMultiPoint_cfunc(vi, maximum_time, array_size, reading_array, actual_number_of_points)
 
     def niDMM_FetchWaveform(self, vi, maximum_time, array_size, waveform_array, actual_number_of_points):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_FetchWaveform_cfunc is None:
-                self.niDMM_FetchWaveform_cfunc = self._library.niDMM_FetchWaveform
-                self.niDMM_FetchWaveform_cfunc.argtypes = [ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDMM_FetchWaveform_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_FetchWaveform_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_FetchWaveform_cfunc is None:
+                    cfunc = self._library.niDMM_FetchWaveform
+                    cfunc.argtypes = [ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_FetchWaveform_cfunc = cfunc
         return self.niDMM_FetchWaveform_cfunc(vi, maximum_time, array_size, waveform_array, actual_number_of_points)
 
     def niDMM_GetApertureTimeInfo(self, vi, aperture_time, aperture_time_units):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetApertureTimeInfo_cfunc is None:
-                self.niDMM_GetApertureTimeInfo_cfunc = self._library.niDMM_GetApertureTimeInfo
-                self.niDMM_GetApertureTimeInfo_cfunc.argtypes = [ViSession, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDMM_GetApertureTimeInfo_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_GetApertureTimeInfo_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_GetApertureTimeInfo_cfunc is None:
+                    cfunc = self._library.niDMM_GetApertureTimeInfo
+                    cfunc.argtypes = [ViSession, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_GetApertureTimeInfo_cfunc = cfunc
         return self.niDMM_GetApertureTimeInfo_cfunc(vi, aperture_time, aperture_time_units)
 
     def niDMM_GetAttributeViBoolean(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetAttributeViBoolean_cfunc is None:
-                self.niDMM_GetAttributeViBoolean_cfunc = self._library.niDMM_GetAttributeViBoolean
-                self.niDMM_GetAttributeViBoolean_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViBoolean)]  # noqa: F405
-                self.niDMM_GetAttributeViBoolean_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_GetAttributeViBoolean_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_GetAttributeViBoolean_cfunc is None:
+                    cfunc = self._library.niDMM_GetAttributeViBoolean
+                    cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViBoolean)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_GetAttributeViBoolean_cfunc = cfunc
         return self.niDMM_GetAttributeViBoolean_cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDMM_GetAttributeViInt32(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetAttributeViInt32_cfunc is None:
-                self.niDMM_GetAttributeViInt32_cfunc = self._library.niDMM_GetAttributeViInt32
-                self.niDMM_GetAttributeViInt32_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDMM_GetAttributeViInt32_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_GetAttributeViInt32_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_GetAttributeViInt32_cfunc is None:
+                    cfunc = self._library.niDMM_GetAttributeViInt32
+                    cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViInt32)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_GetAttributeViInt32_cfunc = cfunc
         return self.niDMM_GetAttributeViInt32_cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDMM_GetAttributeViReal64(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetAttributeViReal64_cfunc is None:
-                self.niDMM_GetAttributeViReal64_cfunc = self._library.niDMM_GetAttributeViReal64
-                self.niDMM_GetAttributeViReal64_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDMM_GetAttributeViReal64_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_GetAttributeViReal64_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_GetAttributeViReal64_cfunc is None:
+                    cfunc = self._library.niDMM_GetAttributeViReal64
+                    cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViReal64)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_GetAttributeViReal64_cfunc = cfunc
         return self.niDMM_GetAttributeViReal64_cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDMM_GetAttributeViString(self, vi, channel_name, attribute_id, buffer_size, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetAttributeViString_cfunc is None:
-                self.niDMM_GetAttributeViString_cfunc = self._library.niDMM_GetAttributeViString
-                self.niDMM_GetAttributeViString_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niDMM_GetAttributeViString_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_GetAttributeViString_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_GetAttributeViString_cfunc is None:
+                    cfunc = self._library.niDMM_GetAttributeViString
+                    cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32, ctypes.POINTER(ViChar)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_GetAttributeViString_cfunc = cfunc
         return self.niDMM_GetAttributeViString_cfunc(vi, channel_name, attribute_id, buffer_size, attribute_value)
 
     def niDMM_GetAutoRangeValue(self, vi, actual_range):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetAutoRangeValue_cfunc is None:
-                self.niDMM_GetAutoRangeValue_cfunc = self._library.niDMM_GetAutoRangeValue
-                self.niDMM_GetAutoRangeValue_cfunc.argtypes = [ViSession, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDMM_GetAutoRangeValue_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_GetAutoRangeValue_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_GetAutoRangeValue_cfunc is None:
+                    cfunc = self._library.niDMM_GetAutoRangeValue
+                    cfunc.argtypes = [ViSession, ctypes.POINTER(ViReal64)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_GetAutoRangeValue_cfunc = cfunc
         return self.niDMM_GetAutoRangeValue_cfunc(vi, actual_range)
 
     def niDMM_GetCalDateAndTime(self, vi, cal_type, month, day, year, hour, minute):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetCalDateAndTime_cfunc is None:
-                self.niDMM_GetCalDateAndTime_cfunc = self._library.niDMM_GetCalDateAndTime
-                self.niDMM_GetCalDateAndTime_cfunc.argtypes = [ViSession, ViInt32, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDMM_GetCalDateAndTime_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_GetCalDateAndTime_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_GetCalDateAndTime_cfunc is None:
+                    cfunc = self._library.niDMM_GetCalDateAndTime
+                    cfunc.argtypes = [ViSession, ViInt32, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt32)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_GetCalDateAndTime_cfunc = cfunc
         return self.niDMM_GetCalDateAndTime_cfunc(vi, cal_type, month, day, year, hour, minute)
 
     def niDMM_GetDevTemp(self, vi, options, temperature):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetDevTemp_cfunc is None:
-                self.niDMM_GetDevTemp_cfunc = self._library.niDMM_GetDevTemp
-                self.niDMM_GetDevTemp_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDMM_GetDevTemp_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_GetDevTemp_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_GetDevTemp_cfunc is None:
+                    cfunc = self._library.niDMM_GetDevTemp
+                    cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ctypes.POINTER(ViReal64)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_GetDevTemp_cfunc = cfunc
         return self.niDMM_GetDevTemp_cfunc(vi, options, temperature)
 
     def niDMM_GetError(self, vi, error_code, buffer_size, description):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetError_cfunc is None:
-                self.niDMM_GetError_cfunc = self._library.niDMM_GetError
-                self.niDMM_GetError_cfunc.argtypes = [ViSession, ctypes.POINTER(ViStatus), ViInt32, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niDMM_GetError_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_GetError_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_GetError_cfunc is None:
+                    cfunc = self._library.niDMM_GetError
+                    cfunc.argtypes = [ViSession, ctypes.POINTER(ViStatus), ViInt32, ctypes.POINTER(ViChar)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_GetError_cfunc = cfunc
         return self.niDMM_GetError_cfunc(vi, error_code, buffer_size, description)
 
     def niDMM_GetLastCalTemp(self, vi, cal_type, temperature):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetLastCalTemp_cfunc is None:
-                self.niDMM_GetLastCalTemp_cfunc = self._library.niDMM_GetLastCalTemp
-                self.niDMM_GetLastCalTemp_cfunc.argtypes = [ViSession, ViInt32, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDMM_GetLastCalTemp_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_GetLastCalTemp_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_GetLastCalTemp_cfunc is None:
+                    cfunc = self._library.niDMM_GetLastCalTemp
+                    cfunc.argtypes = [ViSession, ViInt32, ctypes.POINTER(ViReal64)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_GetLastCalTemp_cfunc = cfunc
         return self.niDMM_GetLastCalTemp_cfunc(vi, cal_type, temperature)
 
     def niDMM_GetMeasurementPeriod(self, vi, period):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetMeasurementPeriod_cfunc is None:
-                self.niDMM_GetMeasurementPeriod_cfunc = self._library.niDMM_GetMeasurementPeriod
-                self.niDMM_GetMeasurementPeriod_cfunc.argtypes = [ViSession, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDMM_GetMeasurementPeriod_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_GetMeasurementPeriod_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_GetMeasurementPeriod_cfunc is None:
+                    cfunc = self._library.niDMM_GetMeasurementPeriod
+                    cfunc.argtypes = [ViSession, ctypes.POINTER(ViReal64)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_GetMeasurementPeriod_cfunc = cfunc
         return self.niDMM_GetMeasurementPeriod_cfunc(vi, period)
 
     def niDMM_GetSelfCalSupported(self, vi, self_cal_supported):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_GetSelfCalSupported_cfunc is None:
-                self.niDMM_GetSelfCalSupported_cfunc = self._library.niDMM_GetSelfCalSupported
-                self.niDMM_GetSelfCalSupported_cfunc.argtypes = [ViSession, ctypes.POINTER(ViBoolean)]  # noqa: F405
-                self.niDMM_GetSelfCalSupported_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_GetSelfCalSupported_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_GetSelfCalSupported_cfunc is None:
+                    cfunc = self._library.niDMM_GetSelfCalSupported
+                    cfunc.argtypes = [ViSession, ctypes.POINTER(ViBoolean)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_GetSelfCalSupported_cfunc = cfunc
         return self.niDMM_GetSelfCalSupported_cfunc(vi, self_cal_supported)
 
     def niDMM_InitWithOptions(self, resource_name, id_query, reset_device, option_string, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_InitWithOptions_cfunc is None:
-                self.niDMM_InitWithOptions_cfunc = self._library.niDMM_InitWithOptions
-                self.niDMM_InitWithOptions_cfunc.argtypes = [ctypes.POINTER(ViChar), ViBoolean, ViBoolean, ctypes.POINTER(ViChar), ctypes.POINTER(ViSession)]  # noqa: F405
-                self.niDMM_InitWithOptions_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_InitWithOptions_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_InitWithOptions_cfunc is None:
+                    cfunc = self._library.niDMM_InitWithOptions
+                    cfunc.argtypes = [ctypes.POINTER(ViChar), ViBoolean, ViBoolean, ctypes.POINTER(ViChar), ctypes.POINTER(ViSession)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_InitWithOptions_cfunc = cfunc
         return self.niDMM_InitWithOptions_cfunc(resource_name, id_query, reset_device, option_string, vi)
 
     def niDMM_Initiate(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_Initiate_cfunc is None:
-                self.niDMM_Initiate_cfunc = self._library.niDMM_Initiate
-                self.niDMM_Initiate_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDMM_Initiate_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_Initiate_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_Initiate_cfunc is None:
+                    cfunc = self._library.niDMM_Initiate
+                    cfunc.argtypes = [ViSession]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_Initiate_cfunc = cfunc
         return self.niDMM_Initiate_cfunc(vi)
 
     def niDMM_PerformOpenCableComp(self, vi, conductance, susceptance):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_PerformOpenCableComp_cfunc is None:
-                self.niDMM_PerformOpenCableComp_cfunc = self._library.niDMM_PerformOpenCableComp
-                self.niDMM_PerformOpenCableComp_cfunc.argtypes = [ViSession, ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDMM_PerformOpenCableComp_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_PerformOpenCableComp_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_PerformOpenCableComp_cfunc is None:
+                    cfunc = self._library.niDMM_PerformOpenCableComp
+                    cfunc.argtypes = [ViSession, ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_PerformOpenCableComp_cfunc = cfunc
         return self.niDMM_PerformOpenCableComp_cfunc(vi, conductance, susceptance)
 
     def niDMM_PerformShortCableComp(self, vi, resistance, reactance):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_PerformShortCableComp_cfunc is None:
-                self.niDMM_PerformShortCableComp_cfunc = self._library.niDMM_PerformShortCableComp
-                self.niDMM_PerformShortCableComp_cfunc.argtypes = [ViSession, ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDMM_PerformShortCableComp_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_PerformShortCableComp_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_PerformShortCableComp_cfunc is None:
+                    cfunc = self._library.niDMM_PerformShortCableComp
+                    cfunc.argtypes = [ViSession, ctypes.POINTER(ViReal64), ctypes.POINTER(ViReal64)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_PerformShortCableComp_cfunc = cfunc
         return self.niDMM_PerformShortCableComp_cfunc(vi, resistance, reactance)
 
     def niDMM_Read(self, vi, maximum_time, reading):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_Read_cfunc is None:
-                self.niDMM_Read_cfunc = self._library.niDMM_Read
-                self.niDMM_Read_cfunc.argtypes = [ViSession, ViInt32, ctypes.POINTER(ViReal64)]  # noqa: F405
-                self.niDMM_Read_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_Read_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_Read_cfunc is None:
+                    cfunc = self._library.niDMM_Read
+                    cfunc.argtypes = [ViSession, ViInt32, ctypes.POINTER(ViReal64)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_Read_cfunc = cfunc
         return self.niDMM_Read_cfunc(vi, maximum_time, reading)
 
     def niDMM_ReadMultiPoint(self, vi, maximum_time, array_size, reading_array, actual_number_of_points):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ReadMultiPoint_cfunc is None:
-                self.niDMM_ReadMultiPoint_cfunc = self._library.niDMM_ReadMultiPoint
-                self.niDMM_ReadMultiPoint_cfunc.argtypes = [ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDMM_ReadMultiPoint_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_ReadMultiPoint_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_ReadMultiPoint_cfunc is None:
+                    cfunc = self._library.niDMM_ReadMultiPoint
+                    cfunc.argtypes = [ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_ReadMultiPoint_cfunc = cfunc
         return self.niDMM_ReadMultiPoint_cfunc(vi, maximum_time, array_size, reading_array, actual_number_of_points)
 
     def niDMM_ReadStatus(self, vi, acquisition_backlog, acquisition_status):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ReadStatus_cfunc is None:
-                self.niDMM_ReadStatus_cfunc = self._library.niDMM_ReadStatus
-                self.niDMM_ReadStatus_cfunc.argtypes = [ViSession, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt16)]  # noqa: F405
-                self.niDMM_ReadStatus_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_ReadStatus_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_ReadStatus_cfunc is None:
+                    cfunc = self._library.niDMM_ReadStatus
+                    cfunc.argtypes = [ViSession, ctypes.POINTER(ViInt32), ctypes.POINTER(ViInt16)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_ReadStatus_cfunc = cfunc
         return self.niDMM_ReadStatus_cfunc(vi, acquisition_backlog, acquisition_status)
 
     def niDMM_ReadWaveform(self, vi, maximum_time, array_size, waveform_array, actual_number_of_points):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ReadWaveform_cfunc is None:
-                self.niDMM_ReadWaveform_cfunc = self._library.niDMM_ReadWaveform
-                self.niDMM_ReadWaveform_cfunc.argtypes = [ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niDMM_ReadWaveform_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_ReadWaveform_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_ReadWaveform_cfunc is None:
+                    cfunc = self._library.niDMM_ReadWaveform
+                    cfunc.argtypes = [ViSession, ViInt32, ViInt32, ctypes.POINTER(ViReal64), ctypes.POINTER(ViInt32)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_ReadWaveform_cfunc = cfunc
         return self.niDMM_ReadWaveform_cfunc(vi, maximum_time, array_size, waveform_array, actual_number_of_points)
 
     def niDMM_ResetWithDefaults(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_ResetWithDefaults_cfunc is None:
-                self.niDMM_ResetWithDefaults_cfunc = self._library.niDMM_ResetWithDefaults
-                self.niDMM_ResetWithDefaults_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDMM_ResetWithDefaults_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_ResetWithDefaults_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_ResetWithDefaults_cfunc is None:
+                    cfunc = self._library.niDMM_ResetWithDefaults
+                    cfunc.argtypes = [ViSession]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_ResetWithDefaults_cfunc = cfunc
         return self.niDMM_ResetWithDefaults_cfunc(vi)
 
     def niDMM_SelfCal(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_SelfCal_cfunc is None:
-                self.niDMM_SelfCal_cfunc = self._library.niDMM_SelfCal
-                self.niDMM_SelfCal_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDMM_SelfCal_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_SelfCal_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_SelfCal_cfunc is None:
+                    cfunc = self._library.niDMM_SelfCal
+                    cfunc.argtypes = [ViSession]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_SelfCal_cfunc = cfunc
         return self.niDMM_SelfCal_cfunc(vi)
 
     def niDMM_SendSoftwareTrigger(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_SendSoftwareTrigger_cfunc is None:
-                self.niDMM_SendSoftwareTrigger_cfunc = self._library.niDMM_SendSoftwareTrigger
-                self.niDMM_SendSoftwareTrigger_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDMM_SendSoftwareTrigger_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_SendSoftwareTrigger_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_SendSoftwareTrigger_cfunc is None:
+                    cfunc = self._library.niDMM_SendSoftwareTrigger
+                    cfunc.argtypes = [ViSession]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_SendSoftwareTrigger_cfunc = cfunc
         return self.niDMM_SendSoftwareTrigger_cfunc(vi)
 
     def niDMM_SetAttributeViBoolean(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_SetAttributeViBoolean_cfunc is None:
-                self.niDMM_SetAttributeViBoolean_cfunc = self._library.niDMM_SetAttributeViBoolean
-                self.niDMM_SetAttributeViBoolean_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViBoolean]  # noqa: F405
-                self.niDMM_SetAttributeViBoolean_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_SetAttributeViBoolean_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_SetAttributeViBoolean_cfunc is None:
+                    cfunc = self._library.niDMM_SetAttributeViBoolean
+                    cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViBoolean]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_SetAttributeViBoolean_cfunc = cfunc
         return self.niDMM_SetAttributeViBoolean_cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDMM_SetAttributeViInt32(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_SetAttributeViInt32_cfunc is None:
-                self.niDMM_SetAttributeViInt32_cfunc = self._library.niDMM_SetAttributeViInt32
-                self.niDMM_SetAttributeViInt32_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32]  # noqa: F405
-                self.niDMM_SetAttributeViInt32_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_SetAttributeViInt32_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_SetAttributeViInt32_cfunc is None:
+                    cfunc = self._library.niDMM_SetAttributeViInt32
+                    cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViInt32]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_SetAttributeViInt32_cfunc = cfunc
         return self.niDMM_SetAttributeViInt32_cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDMM_SetAttributeViReal64(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_SetAttributeViReal64_cfunc is None:
-                self.niDMM_SetAttributeViReal64_cfunc = self._library.niDMM_SetAttributeViReal64
-                self.niDMM_SetAttributeViReal64_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViReal64]  # noqa: F405
-                self.niDMM_SetAttributeViReal64_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_SetAttributeViReal64_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_SetAttributeViReal64_cfunc is None:
+                    cfunc = self._library.niDMM_SetAttributeViReal64
+                    cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ViReal64]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_SetAttributeViReal64_cfunc = cfunc
         return self.niDMM_SetAttributeViReal64_cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDMM_SetAttributeViString(self, vi, channel_name, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_SetAttributeViString_cfunc is None:
-                self.niDMM_SetAttributeViString_cfunc = self._library.niDMM_SetAttributeViString
-                self.niDMM_SetAttributeViString_cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niDMM_SetAttributeViString_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_SetAttributeViString_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_SetAttributeViString_cfunc is None:
+                    cfunc = self._library.niDMM_SetAttributeViString
+                    cfunc.argtypes = [ViSession, ctypes.POINTER(ViChar), ViAttr, ctypes.POINTER(ViChar)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_SetAttributeViString_cfunc = cfunc
         return self.niDMM_SetAttributeViString_cfunc(vi, channel_name, attribute_id, attribute_value)
 
     def niDMM_close(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_close_cfunc is None:
-                self.niDMM_close_cfunc = self._library.niDMM_close
-                self.niDMM_close_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDMM_close_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_close_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_close_cfunc is None:
+                    cfunc = self._library.niDMM_close
+                    cfunc.argtypes = [ViSession]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_close_cfunc = cfunc
         return self.niDMM_close_cfunc(vi)
 
     def niDMM_error_message(self, vi, error_code, error_message):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_error_message_cfunc is None:
-                self.niDMM_error_message_cfunc = self._library.niDMM_error_message
-                self.niDMM_error_message_cfunc.argtypes = [ViSession, ViStatus, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niDMM_error_message_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_error_message_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_error_message_cfunc is None:
+                    cfunc = self._library.niDMM_error_message
+                    cfunc.argtypes = [ViSession, ViStatus, ctypes.POINTER(ViChar)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_error_message_cfunc = cfunc
         return self.niDMM_error_message_cfunc(vi, error_code, error_message)
 
     def niDMM_reset(self, vi):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_reset_cfunc is None:
-                self.niDMM_reset_cfunc = self._library.niDMM_reset
-                self.niDMM_reset_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niDMM_reset_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_reset_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_reset_cfunc is None:
+                    cfunc = self._library.niDMM_reset
+                    cfunc.argtypes = [ViSession]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_reset_cfunc = cfunc
         return self.niDMM_reset_cfunc(vi)
 
     def niDMM_self_test(self, vi, self_test_result, self_test_message):  # noqa: N802
-        with self._func_lock:
-            if self.niDMM_self_test_cfunc is None:
-                self.niDMM_self_test_cfunc = self._library.niDMM_self_test
-                self.niDMM_self_test_cfunc.argtypes = [ViSession, ctypes.POINTER(ViInt16), ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niDMM_self_test_cfunc.restype = ViStatus  # noqa: F405
+        if self.niDMM_self_test_cfunc is None:
+            with self._func_lock:
+                if self.niDMM_self_test_cfunc is None:
+                    cfunc = self._library.niDMM_self_test
+                    cfunc.argtypes = [ViSession, ctypes.POINTER(ViInt16), ctypes.POINTER(ViChar)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niDMM_self_test_cfunc = cfunc
         return self.niDMM_self_test_cfunc(vi, self_test_result, self_test_message)
@@ -1,13 +1,215 @@
 # -*- coding: utf-8 -*-
 # This file was generated
+import collections
 import ctypes
+import threading
 
+from nidmm import _converters  # noqa: F401
+from nidmm import _streaming
 from nidmm import attributes
+from nidmm import call_stats
 from nidmm import enums
 from nidmm import errors
 from nidmm import library_singleton
 from nidmm import visatype
 
+# Size of the buffer that string IVI-dance methods try first, until they know the size they need
+_DEFAULT_IVI_DANCE_BUFFER_SIZE = 256
+
+# Size of the buffer that each string IVI-dance method needed last time, by C function name (and attribute ID). Shared
+# by all sessions.
+_ivi_dance_buffer_sizes = {}
+
+# Messages of the most recently used error and warning codes, from _error_message(). Shared by all sessions.
+_MAX_ERROR_MESSAGES = 64
+_error_messages = collections.OrderedDict()
+_error_messages_lock = threading.Lock()
+
+
+class _ScalarCtypes(threading.local):
+    '''ctypes objects for the scalar parameters of driver functions, which methods reuse instead of creating new ones on every call
+
+    Each thread has its own, so that calls on different threads don't share them.
+    '''
+
+    def __init__(self):
+        self.ConfigureACBandwidth_ac_maximum_frequency_hz = visatype.ViReal64()
+        self.ConfigureACBandwidth_ac_minimum_frequency_hz = visatype.ViReal64()
+        self.ConfigureMeasurementAbsolute_measurement_function = visatype.ViInt32()
+        self.ConfigureMeasurementAbsolute_range = visatype.ViReal64()
+        self.ConfigureMeasurementAbsolute_resolution_absolute = visatype.ViReal64()
+        self.ConfigureMeasurementDigits_measurement_function = visatype.ViInt32()
+        self.ConfigureMeasurementDigits_range = visatype.ViReal64()
+        self.ConfigureMeasurementDigits_resolution_digits = visatype.ViReal64()
+        self.ConfigureMultiPoint_sample_count = visatype.ViInt32()
+        self.ConfigureMultiPoint_sample_interval = visatype.ViReal64()
+        self.ConfigureMultiPoint_sample_trigger = visatype.ViInt32()
+        self.ConfigureMultiPoint_trigger_count = visatype.ViInt32()
+        self.ConfigureOpenCableCompValues_conductance = visatype.ViReal64()
+        self.ConfigureOpenCableCompValues_susceptance = visatype.ViReal64()
+        self.ConfigurePowerLineFrequency_power_line_frequency_hz = visatype.ViReal64()
+        self.ConfigureRTDCustom_rtd_a = visatype.ViReal64()
+        self.ConfigureRTDCustom_rtd_b = visatype.ViReal64()
+        self.ConfigureRTDCustom_rtd_c = visatype.ViReal64()
+        self.ConfigureRTDType_rtd_resistance = visatype.ViReal64()
+        self.ConfigureRTDType_rtd_type = visatype.ViInt32()
+        self.ConfigureShortCableCompValues_reactance = visatype.ViReal64()
+        self.ConfigureShortCableCompValues_resistance = visatype.ViReal64()
+        self.ConfigureThermistorCustom_thermistor_a = visatype.ViReal64()
+        self.ConfigureThermistorCustom_thermistor_b = visatype.ViReal64()
+        self.ConfigureThermistorCustom_thermistor_c = visatype.ViReal64()
+        self.ConfigureThermocouple_reference_junction_type = visatype.ViInt32()
+        self.ConfigureThermocouple_thermocouple_type = visatype.ViInt32()
+        self.ConfigureTrigger_trigger_delay = visatype.ViReal64()
+        self.ConfigureTrigger_trigger_source = visatype.ViInt32()
+        self.ConfigureWaveformAcquisition_measurement_function = visatype.ViInt32()
+        self.ConfigureWaveformAcquisition_range = visatype.ViReal64()
+        self.ConfigureWaveformAcquisition_rate = visatype.ViReal64()
+        self.ConfigureWaveformAcquisition_waveform_points = visatype.ViInt32()
+        self.FetchMultiPoint_actual_number_of_points = visatype.ViInt32()
+        self.FetchMultiPoint_actual_number_of_points_pointer = ctypes.pointer(self.FetchMultiPoint_actual_number_of_points)
+        self.FetchMultiPoint_maximum_time = visatype.ViInt32()
+        self.FetchWaveform_actual_number_of_points = visatype.ViInt32()
+        self.FetchWaveform_actual_number_of_points_pointer = ctypes.pointer(self.FetchWaveform_actual_number_of_points)
+        self.FetchWaveform_maximum_time = visatype.ViInt32()
+        self.Fetch_maximum_time = visatype.ViInt32()
+        self.Fetch_reading = visatype.ViReal64()
+        self.Fetch_reading_pointer = ctypes.pointer(self.Fetch_reading)
+        self.GetApertureTimeInfo_aperture_time = visatype.ViReal64()
+        self.GetApertureTimeInfo_aperture_time_pointer = ctypes.pointer(self.GetApertureTimeInfo_aperture_time)
+        self.GetApertureTimeInfo_aperture_time_units = visatype.ViInt32()
+        self.GetApertureTimeInfo_aperture_time_units_pointer = ctypes.pointer(self.GetApertureTimeInfo_aperture_time_units)
+        self.GetAttributeViBoolean_attribute_id = visatype.ViAttr()
+        self.GetAttributeViBoolean_attribute_value = visatype.ViBoolean()
+        self.GetAttributeViBoolean_attribute_value_pointer = ctypes.pointer(self.GetAttributeViBoolean_attribute_value)
+        self.GetAttributeViInt32_attribute_id = visatype.ViAttr()
+        self.GetAttributeViInt32_attribute_value = visatype.ViInt32()
+        self.GetAttributeViInt32_attribute_value_pointer = ctypes.pointer(self.GetAttributeViInt32_attribute_value)
+        self.GetAttributeViReal64_attribute_id = visatype.ViAttr()
+        self.GetAttributeViReal64_attribute_value = visatype.ViReal64()
+        self.GetAttributeViReal64_attribute_value_pointer = ctypes.pointer(self.GetAttributeViReal64_attribute_value)
+        self.GetAttributeViString_attribute_id = visatype.ViAttr()
+        self.GetAutoRangeValue_actual_range = visatype.ViReal64()
+        self.GetAutoRangeValue_actual_range_pointer = ctypes.pointer(self.GetAutoRangeValue_actual_range)
+        self.GetCalDateAndTime_cal_type = visatype.ViInt32()
+        self.GetCalDateAndTime_day = visatype.ViInt32()
+        self.GetCalDateAndTime_day_pointer = ctypes.pointer(self.GetCalDateAndTime_day)
+        self.GetCalDateAndTime_hour = visatype.ViInt32()
+        self.GetCalDateAndTime_hour_pointer = ctypes.pointer(self.GetCalDateAndTime_hour)
+        self.GetCalDateAndTime_minute = visatype.ViInt32()
+        self.GetCalDateAndTime_minute_pointer = ctypes.pointer(self.GetCalDateAndTime_minute)
+        self.GetCalDateAndTime_month = visatype.ViInt32()
+        self.GetCalDateAndTime_month_pointer = ctypes.pointer(self.GetCalDateAndTime_month)
+        self.GetCalDateAndTime_year = visatype.ViInt32()
+        self.GetCalDateAndTime_year_pointer = ctypes.pointer(self.GetCalDateAndTime_year)
+        self.GetDevTemp_temperature = visatype.ViReal64()
+        self.GetDevTemp_temperature_pointer = ctypes.pointer(self.GetDevTemp_temperature)
+        self.GetError_error_code = visatype.ViStatus()
+        self.GetError_error_code_pointer = ctypes.pointer(self.GetError_error_code)
+        self.GetLastCalTemp_cal_type = visatype.ViInt32()
+        self.GetLastCalTemp_temperature = visatype.ViReal64()
+        self.GetLastCalTemp_temperature_pointer = ctypes.pointer(self.GetLastCalTemp_temperature)
+        self.GetMeasurementPeriod_period = visatype.ViReal64()
+        self.GetMeasurementPeriod_period_pointer = ctypes.pointer(self.GetMeasurementPeriod_period)
+        self.GetSelfCalSupported_self_cal_supported = visatype.ViBoolean()
+        self.GetSelfCalSupported_self_cal_supported_pointer = ctypes.pointer(self.GetSelfCalSupported_self_cal_supported)
+        self.InitWithOptions_id_query = visatype.ViBoolean()
+        self.InitWithOptions_reset_device = visatype.ViBoolean()
+        self.InitWithOptions_vi = visatype.ViSession()
+        self.InitWithOptions_vi_pointer = ctypes.pointer(self.InitWithOptions_vi)
+        self.PerformOpenCableComp_conductance = visatype.ViReal64()
+        self.PerformOpenCableComp_conductance_pointer = ctypes.pointer(self.PerformOpenCableComp_conductance)
+        self.PerformOpenCableComp_susceptance = visatype.ViReal64()
+        self.PerformOpenCableComp_susceptance_pointer = ctypes.pointer(self.PerformOpenCableComp_susceptance)
+        self.PerformShortCableComp_reactance = visatype.ViReal64()
+        self.PerformShortCableComp_reactance_pointer = ctypes.pointer(self.PerformShortCableComp_reactance)
+        self.PerformShortCableComp_resistance = visatype.ViReal64()
+        self.PerformShortCableComp_resistance_pointer = ctypes.pointer(self.PerformShortCableComp_resistance)
+        self.ReadMultiPoint_actual_number_of_points = visatype.ViInt32()
+        self.ReadMultiPoint_actual_number_of_points_pointer = ctypes.pointer(self.ReadMultiPoint_actual_number_of_points)
+        self.ReadMultiPoint_maximum_time = visatype.ViInt32()
+        self.ReadStatus_acquisition_backlog = visatype.ViInt32()
+        self.ReadStatus_acquisition_backlog_pointer = ctypes.pointer(self.ReadStatus_acquisition_backlog)
+        self.ReadStatus_acquisition_status = visatype.ViInt16()
+        self.ReadStatus_acquisition_status_pointer = ctypes.pointer(self.ReadStatus_acquisition_status)
+        self.ReadWaveform_actual_number_of_points = visatype.ViInt32()
+        self.ReadWaveform_actual_number_of_points_pointer = ctypes.pointer(self.ReadWaveform_actual_number_of_points)
+        self.ReadWaveform_maximum_time = visatype.ViInt32()
+        self.Read_maximum_time = visatype.ViInt32()
+        self.Read_reading = visatype.ViReal64()
+        self.Read_reading_pointer = ctypes.pointer(self.Read_reading)
+        self.SetAttributeViBoolean_attribute_id = visatype.ViAttr()
+        self.SetAttributeViBoolean_attribute_value = visatype.ViBoolean()
+        self.SetAttributeViInt32_attribute_id = visatype.ViAttr()
+        self.SetAttributeViInt32_attribute_value = visatype.ViInt32()
+        self.SetAttributeViReal64_attribute_id = visatype.ViAttr()
+        self.SetAttributeViReal64_attribute_value = visatype.ViReal64()
+        self.SetAttributeViString_attribute_id = visatype.ViAttr()
+        self.error_message_error_code = visatype.ViStatus()
+        self.self_test_self_test_result = visatype.ViInt16()
+        self.self_test_self_test_result_pointer = ctypes.pointer(self.self_test_self_test_result)
+
+
+_scalar_ctypes = _ScalarCtypes()
+
+# C function that each method calls, for call_stats
+_c_functions = {
+    '_abort': 'niDMM_Abort',
+    '_close': 'niDMM_close',
+    '_error_message': 'niDMM_error_message',
+    '_get_attribute_vi_boolean': 'niDMM_GetAttributeViBoolean',
+    '_get_attribute_vi_int32': 'niDMM_GetAttributeViInt32',
+    '_get_attribute_vi_real64': 'niDMM_GetAttributeViReal64',
+    '_get_attribute_vi_string': 'niDMM_GetAttributeViString',
+    '_get_error': 'niDMM_GetError',
+    '_init_with_options': 'niDMM_InitWithOptions',
+    '_initiate': 'niDMM_Initiate',
+    '_set_attribute_vi_boolean': 'niDMM_SetAttributeViBoolean',
+    '_set_attribute_vi_int32': 'niDMM_SetAttributeViInt32',
+    '_set_attribute_vi_real64': 'niDMM_SetAttributeViReal64',
+    '_set_attribute_vi_string': 'niDMM_SetAttributeViString',
+    'configure_ac_bandwidth': 'niDMM_ConfigureACBandwidth',
+    'configure_measurement_absolute': 'niDMM_ConfigureMeasurementAbsolute',
+    'configure_measurement_digits': 'niDMM_ConfigureMeasurementDigits',
+    'configure_multi_point': 'niDMM_ConfigureMultiPoint',
+    'configure_open_cable_comp_values': 'niDMM_ConfigureOpenCableCompValues',
+    'configure_power_line_frequency': 'niDMM_ConfigurePowerLineFrequency',
+    'configure_rtd_custom': 'niDMM_ConfigureRTDCustom',
+    'configure_rtd_type': 'niDMM_ConfigureRTDType',
+    'configure_short_cable_comp_values': 'niDMM_ConfigureShortCableCompValues',
+    'configure_thermistor_custom': 'niDMM_ConfigureThermistorCustom',
+    'configure_thermocouple': 'niDMM_ConfigureThermocouple',
+    'configure_trigger': 'niDMM_ConfigureTrigger',
+    'configure_waveform_acquisition': 'niDMM_ConfigureWaveformAcquisition',
+    'disable': 'niDMM_Disable',
+    'fetch': 'niDMM_Fetch',
+    'fetch_multi_point': 'niDMM_FetchMultiPoint',
+    'fetch_multi_point_into': 'niDMM_FetchMultiPoint',
+    'fetch_waveform': 'niDMM_FetchWaveform',
+    'fetch_waveform_into': 'niDMM_FetchWaveform',
+    'get_aperture_time_info': 'niDMM_GetApertureTimeInfo',
+    'get_auto_range_value': 'niDMM_GetAutoRangeValue',
+    'get_cal_date_and_time': 'niDMM_GetCalDateAndTime',
+    'get_dev_temp': 'niDMM_GetDevTemp',
+    'get_last_cal_temp': 'niDMM_GetLastCalTemp',
+    'get_measurement_period': 'niDMM_GetMeasurementPeriod',
+    'get_self_cal_supported': 'niDMM_GetSelfCalSupported',
+    'perform_open_cable_comp': 'niDMM_PerformOpenCableComp',
+    'perform_short_cable_comp': 'niDMM_PerformShortCableComp',
+    'read': 'niDMM_Read',
+    'read_multi_point': 'niDMM_ReadMultiPoint',
+    'read_status': 'niDMM_ReadStatus',
+    'read_waveform': 'niDMM_ReadWaveform',
+    'reset': 'niDMM_reset',
+    'reset_with_defaults': 'niDMM_ResetWithDefaults',
+    'self_cal': 'niDMM_SelfCal',
+    'self_test': 'niDMM_self_test',
+    'send_software_trigger': 'niDMM_SendSoftwareTrigger',
+}
+
+# Maximum number of repeated capability views (i.e. session['0']) that a session keeps to return again
+_MAX_REPEATED_CAPABILITY_VIEWS = 256
+
 
 class _Acquisition(object):
     def __init__(self, session):
@@ -53,7 +255,7 @@ class _SessionBase(object):
     Specifies the units of aperture time for the current configuration.
     The NI 4060 does not support an aperture time set in seconds.
     '''
-    auto_range_value = attributes.AttributeViReal64(1250331)
+    auto_range_value = attributes.AttributeViReal64(1250331, volatile=True)
     '''
     Specifies the value of the range. If auto ranging, shows the actual value of  the active range. The value of this attribute is set during a read operation.
     '''
@@ -99,7 +301,7 @@ class _SessionBase(object):
     Some cases exist where the end-user must specify instrument driver options  at initialization time.  An example of this is specifying a particular  instrument model from among a family of instruments that the driver supports.   This is useful when using simulation.  The end-user can specify  driver-specific options through the DriverSetup keyword in the optionsString  parameter to the niDMM Init With Options.vi.
     If the user does not specify a Driver Setup string, this attribute returns  an empty string.
     '''
-    frequency_voltage_auto_range_value = attributes.AttributeViReal64(1150044)
+    frequency_voltage_auto_range_value = attributes.AttributeViReal64(1150044, volatile=True)
     '''
     For the NI 4080/4081/4082 and NI 4070/4071/4072, specifies the value of
     the frequency voltage range. If auto ranging is enabled, shows the
@@ -393,26 +595,129 @@ class _SessionBase(object):
     For the NI 4070/4071/4072 only, specifies the rate of the waveform acquisition in Samples per second (S/s).  The valid Range is 10.0-1,800,000 S/s. Values are coerced to the  closest integer divisor of 1,800,000. The default value is 1,800,000.
     '''
 
-    def __init__(self, repeated_capability):
-        self._library = library_singleton.get()
+    def __init__(self, repeated_capability, attribute_cache, library, warning_policy, session_stats):
+        self._library = library
         self._repeated_capability = repeated_capability
+        self._attribute_cache = attribute_cache
+        self._warning_policy = warning_policy
+        self._session_stats = session_stats
         self._encoding = 'windows-1251'
+        # The driver does not modify it, so every call can pass the same buffer
+        self._repeated_capability_ctype = ctypes.create_string_buffer(repeated_capability.encode(self._encoding))
+        session_stats._add_session(self)
 
     def __setattr__(self, key, value):
-        if self._is_frozen and key not in dir(self):
+        if self._is_frozen and key not in self._get_attribute_names() and key not in self.__dict__:
             raise AttributeError("'{0}' object has no attribute '{1}'".format(type(self).__name__, key))
         object.__setattr__(self, key, value)
 
+    @property
+    def warning_policy(self):
+        '''warning_policy
+
+        How the session, and its repeated capabilities, report warnings from the driver. Change its mode to warn only
+        once per code, at most once per interval, or only count warnings:
+
+            session.warning_policy.mode = 'count'
+            ...
+            print(session.warning_policy.counts)
+
+        See errors.WarningPolicy.
+        '''
+        return self._warning_policy
+
+    @classmethod
+    def _get_attribute_names(cls):
+        '''_get_attribute_names
+
+        Returns a frozenset of the names of the properties and methods of the class, which can be set once the session
+        is frozen. It is computed once per class, because dir() is too slow to call every time a property is set.
+        '''
+        names = cls.__dict__.get('_attribute_names')
+        if names is None:
+            names = frozenset(dir(cls))
+            cls._attribute_names = names
+        return names
+
+    def _get_attribute_info(self, name_or_id):
+        try:
+            # type(u'') is unicode on Python 2
+            if isinstance(name_or_id, (str, type(u''))):
+                return attributes.index_by_name[name_or_id]
+            return attributes.index[name_or_id]
+        except KeyError:
+            raise ValueError('{0!r} is not an attribute of NI-DMM'.format(name_or_id))
+
+    def get_attributes(self, names_or_ids, channels=None):
+        '''get_attributes
+
+        Gets the values of many attributes in one call. It creates the ctypes objects once for each type of attribute,
+        instead of once for each attribute like the properties do.
+
+        Args:
+            names_or_ids (list of str or int): Python names (i.e. 'ac_max_freq') or IDs of the attributes
+
+            channels (str): Repeated capabilities (usually channels) to get the attributes for. If not specified, uses the
+                ones of this object, like the properties do.
+
+        Returns:
+            values (collections.OrderedDict): Value of each attribute, by Python name, in the same order as names_or_ids
+        '''
+        session = self if channels is None else _RepeatedCapability(self._vi, channels, self._attribute_cache, self._library, self._warning_policy, self._session_stats)
+        return attributes.get_values(session, [self._get_attribute_info(a) for a in names_or_ids])
+
+    def snapshot(self):
+        '''snapshot
+
+        Gets the values of all the read-write attributes, to restore them later with apply(). Attributes that the driver
+        returns an error for (i.e. not supported by the device) and volatile attributes are left out.
+
+        Use it on a repeated capability (i.e. session['0'].snapshot()) to get the values of specific channels.
+
+        Returns:
+            values (collections.OrderedDict): Value of each attribute, by Python name
+        '''
+        infos = [a for a in sorted(attributes.index.values()) if a.access == 'read-write' and not a.volatile]
+        return attributes.get_values(self, infos, skip_errors=True)
+
+    def apply(self, values):
+        '''apply
+
+        Sets many attributes, i.e. from snapshot(), in order. It first gets the values of the attributes, and only sets
+        the ones that are different.
+
+        Args:
+            values (dict): Value of each attribute, by Python name or ID. Values of enum attributes must be members of
+                their enum.
+
+        Returns:
+            names (list of str): Python names of the attributes that were set
+        '''
+        infos_and_values = [(self._get_attribute_info(a), v) for a, v in values.items()]
+        current_values = attributes.get_values(self, [info for info, _ in infos_and_values if info.access != 'write only'], skip_errors=True)
+        changes = [(info, v) for info, v in infos_and_values if info.python_name not in current_values or current_values[info.python_name] != v]
+        attributes.set_values(self, changes)
+        return [info.python_name for info, _ in changes]
+
+    def _set_attributes(self, values):
+        '''Sets attributes from (Python name or ID, value) pairs, in order, without getting them first like apply() does'''
+        attributes.set_values(self, [(self._get_attribute_info(a), v) for a, v in values])
+
     def _get_error_description(self, error_code):
         '''_get_error_description
 
         Returns the error description.
+
+        errors retrieves descriptions only when they are used, when the last error of the session may be another one.
+        Those get the message for their code instead.
         '''
-        try:
-            _, error_string = self._get_error()
-            return error_string
-        except errors.Error:
-            pass
+        if error_code < 0:
+            try:
+                last_error_code, error_string = self._get_error()
+                if last_error_code == error_code:
+                    return error_string
+            except errors.Error:
+                pass
 
         try:
             '''
@@ -420,11 +725,27 @@ class _SessionBase(object):
             (IVI spec requires GetError to fail).
             Use _error_message instead. It doesn't require a session.
             '''
-            error_string = self._error_message(error_code)
-            return error_string
+            return self._get_error_message(error_code)
         except errors.Error:
             return "Failed to retrieve error description."
 
+    def _get_error_message(self, error_code):
+        '''_get_error_message
+
+        Returns _error_message(error_code), from the messages of the most recently used codes if it is there.
+        '''
+        with _error_messages_lock:
+            error_string = _error_messages.pop(error_code, None)
+            if error_string is not None:
+                _error_messages[error_code] = error_string
+                return error_string
+        error_string = self._error_message(error_code)
+        with _error_messages_lock:
+            _error_messages[error_code] = error_string
+            if len(_error_messages) > _MAX_ERROR_MESSAGES:
+                _error_messages.popitem(last=False)
+        return error_string
+
     ''' These are code-generated '''
 
     def _get_attribute_vi_boolean(self, attribute_id):
@@ -456,11 +777,12 @@ class _SessionBase(object):
             attribute_value (bool): Returns the current value of the attribute. Pass the address of a
                 ViBoolean variable.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViBoolean()  # case 13
-        error_code = self._library.niDMM_GetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViBoolean_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetAttributeViBoolean_attribute_value  # case 13
+        error_code = self._library.niDMM_GetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViBoolean_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return bool(attribute_value_ctype.value)
 
@@ -493,11 +815,12 @@ class _SessionBase(object):
             attribute_value (int): Returns the current value of the attribute. Pass the address of a
                 ViInt32 variable.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niDMM_GetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViInt32_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetAttributeViInt32_attribute_value  # case 13
+        error_code = self._library.niDMM_GetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViInt32_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(attribute_value_ctype.value)
 
@@ -530,11 +853,12 @@ class _SessionBase(object):
             attribute_value (float): Returns the current value of the attribute. Pass the address of a
                 ViReal64 variable.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niDMM_GetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViReal64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetAttributeViReal64_attribute_value  # case 13
+        error_code = self._library.niDMM_GetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViReal64_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(attribute_value_ctype.value)
 
@@ -580,16 +904,23 @@ class _SessionBase(object):
                 buffer regardless of the number of bytes in the value. If you pass 0,
                 you can pass VI_NULL for the **Attribute_Value** buffer parameter.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        buffer_size_ctype = visatype.ViInt32()  # case 6
-        attribute_value_ctype = None  # case 11
-        error_code = self._library.niDMM_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
-        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
-        buffer_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        attribute_value_ctype = (visatype.ViChar * buffer_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViString_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        buffer_size_ctype = visatype.ViInt32(_ivi_dance_buffer_sizes.get(('GetAttributeViString', attribute_id), _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        attribute_value_ctype = (visatype.ViChar * buffer_size_ctype.value)()
         error_code = self._library.niDMM_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            buffer_size_ctype = visatype.ViInt32(0)
+            attribute_value_ctype = None
+            error_code = self._library.niDMM_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+            buffer_size_ctype = visatype.ViInt32(error_code)
+            attribute_value_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+            error_code = self._library.niDMM_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
+            _ivi_dance_buffer_sizes[('GetAttributeViString', attribute_id)] = buffer_size_ctype.value
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return attribute_value_ctype.value.decode(self._encoding)
 
@@ -622,15 +953,21 @@ class _SessionBase(object):
                 pass 0 for the **Buffer_Size**, you can pass VI_NULL for this
                 parameter.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        error_code_ctype = visatype.ViStatus()  # case 13
-        buffer_size_ctype = visatype.ViInt32()  # case 6
-        description_ctype = None  # case 11
-        error_code = self._library.niDMM_GetError(vi_ctype, ctypes.pointer(error_code_ctype), buffer_size_ctype, description_ctype)
-        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=True)
-        buffer_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        description_ctype = (visatype.ViChar * buffer_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        error_code = self._library.niDMM_GetError(vi_ctype, ctypes.pointer(error_code_ctype), buffer_size_ctype, description_ctype)
+        vi_ctype = self._vi_ctype  # case 1
+        error_code_ctype = _scalar_ctypes.GetError_error_code  # case 13
+        buffer_size_ctype = visatype.ViInt32(_ivi_dance_buffer_sizes.get('GetError', _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        description_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+        error_code = self._library.niDMM_GetError(vi_ctype, _scalar_ctypes.GetError_error_code_pointer, buffer_size_ctype, description_ctype)
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            buffer_size_ctype = visatype.ViInt32(0)
+            description_ctype = None
+            error_code = self._library.niDMM_GetError(vi_ctype, _scalar_ctypes.GetError_error_code_pointer, buffer_size_ctype, description_ctype)
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=True)
+            buffer_size_ctype = visatype.ViInt32(error_code)
+            description_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+            error_code = self._library.niDMM_GetError(vi_ctype, _scalar_ctypes.GetError_error_code_pointer, buffer_size_ctype, description_ctype)
+            _ivi_dance_buffer_sizes['GetError'] = buffer_size_ctype.value
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=True)
         return int(error_code_ctype.value), description_ctype.value.decode(self._encoding)
 
@@ -675,10 +1012,12 @@ class _SessionBase(object):
             attribute_id (int): Pass the ID of an attribute.
             attribute_value (bool): Pass the value that you want to set the attribute to.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViBoolean(attribute_value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViBoolean_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.SetAttributeViBoolean_attribute_value
+        attribute_value_ctype.value = attribute_value  # case 8
         error_code = self._library.niDMM_SetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -724,10 +1063,12 @@ class _SessionBase(object):
             attribute_id (int): Pass the ID of an attribute.
             attribute_value (int): Pass the value that you want to set the attribute to.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViInt32(attribute_value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViInt32_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.SetAttributeViInt32_attribute_value
+        attribute_value_ctype.value = attribute_value  # case 8
         error_code = self._library.niDMM_SetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -773,10 +1114,12 @@ class _SessionBase(object):
             attribute_id (int): Pass the ID of an attribute.
             attribute_value (float): Pass the value that you want to set the attribute to.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViReal64(attribute_value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViReal64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.SetAttributeViReal64_attribute_value
+        attribute_value_ctype.value = attribute_value  # case 8
         error_code = self._library.niDMM_SetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -822,10 +1165,11 @@ class _SessionBase(object):
             attribute_id (int): Pass the ID of an attribute.
             attribute_value (string): Pass the value that you want to set the attribute to.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = ctypes.create_string_buffer(attribute_value.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViString_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = attribute_value.encode(self._encoding)  # case 3
         error_code = self._library.niDMM_SetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -843,8 +1187,9 @@ class _SessionBase(object):
         Returns:
             error_message (string): The error information formatted into a string.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        error_code_ctype = visatype.ViStatus(error_code)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        error_code_ctype = _scalar_ctypes.error_message_error_code
+        error_code_ctype.value = error_code  # case 8
         error_message_ctype = (visatype.ViChar * 256)()  # case 10
         error_code = self._library.niDMM_error_message(vi_ctype, error_code_ctype, error_message_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=True)
@@ -854,9 +1199,10 @@ class _SessionBase(object):
 class _RepeatedCapability(_SessionBase):
     '''Allows for setting/getting properties and calling methods for specific repeated capabilities (such as channels) on your session.'''
 
-    def __init__(self, vi, repeated_capability):
-        super(_RepeatedCapability, self).__init__(repeated_capability)
+    def __init__(self, vi, repeated_capability, attribute_cache, library, warning_policy, session_stats):
+        super(_RepeatedCapability, self).__init__(repeated_capability, attribute_cache, library, warning_policy, session_stats)
         self._vi = vi
+        self._vi_ctype = visatype.ViSession(vi)
         self._is_frozen = True
 
 
@@ -864,9 +1210,16 @@ class Session(_SessionBase):
     '''An NI-DMM session to a National Instruments Digital Multimeter'''
 
     def __init__(self, resource_name, id_query=False, reset_device=False, option_string=''):
-        super(Session, self).__init__(repeated_capability='')
+        super(Session, self).__init__(repeated_capability='', attribute_cache=attributes.AttributeCache(), library=library_singleton.get(), warning_policy=errors.WarningPolicy(), session_stats=call_stats.SessionStats(_c_functions))
+        if call_stats.registry.enabled:
+            self._session_stats.enable()
+        self._repeated_capability_views = collections.OrderedDict()
+        self._repeated_capability_views_lock = threading.Lock()
         self._vi = 0  # This must be set before calling _init_with_options().
+        # Passed to every method, which would otherwise create it on every call
+        self._vi_ctype = visatype.ViSession(0)
         self._vi = self._init_with_options(resource_name, id_query, reset_device, option_string)
+        self._vi_ctype = visatype.ViSession(self._vi)
         self._is_frozen = True
 
     def __enter__(self):
@@ -877,18 +1230,89 @@ class Session(_SessionBase):
 
     def __getitem__(self, repeated_capability):
         '''Set/get properties or call methods with a repeated capability (i.e. channels)'''
-        return _RepeatedCapability(self._vi, repeated_capability)
+        # The most recently used views are kept, so loops over channels don't create a view each time
+        with self._repeated_capability_views_lock:
+            view = self._repeated_capability_views.pop(repeated_capability, None)
+            if view is None:
+                view = _RepeatedCapability(self._vi, repeated_capability, self._attribute_cache, self._library, self._warning_policy, self._session_stats)
+                if len(self._repeated_capability_views) >= _MAX_REPEATED_CAPABILITY_VIEWS:
+                    self._repeated_capability_views.popitem(last=False)
+            self._repeated_capability_views[repeated_capability] = view
+        return view
 
     def initiate(self):
         return _Acquisition(self)
 
+    def enable_attribute_cache(self):
+        '''enable_attribute_cache
+
+        Caches the values of attributes in this session, and in its repeated capabilities, so that getting them again
+        doesn't call into the driver. Setting an attribute updates the cache. Methods that reset or configure the
+        session (i.e. reset(), commit() and configure methods) clear it.
+
+        Volatile attributes, whose values change on their own (i.e. status), are never cached.
+
+        Note:
+        Setting an attribute caches the value that was set. If the driver coerces it (i.e. up to a valid range), the
+        cache returns the value that was set until it is cleared. Calling enable_attribute_cache() again clears it.
+        '''
+        self._attribute_cache.clear()
+        self._attribute_cache.enabled = True
+
+    def disable_attribute_cache(self):
+        '''disable_attribute_cache
+
+        Stops caching the values of attributes, and clears the cache. See enable_attribute_cache().
+        '''
+        self._attribute_cache.enabled = False
+        self._attribute_cache.clear()
+
+    def enable_stats(self):
+        '''enable_stats
+
+        Starts recording statistics of the driver calls of this session, and of its repeated capabilities: for each C
+        function, the number of calls, their latencies, and how much of that time was spent in the driver and how much
+        in Python. Calling enable_stats() again clears them. See stats().
+
+        Methods are slower while stats are enabled. Set call_stats.registry.enabled to True to enable them for all new
+        sessions instead.
+        '''
+        self._session_stats.enable()
+
+    def disable_stats(self):
+        '''disable_stats
+
+        Stops recording statistics of the driver calls. stats() still returns the ones recorded. See enable_stats().
+        '''
+        self._session_stats.disable()
+
+    def stats(self):
+        '''stats
+
+        Returns the statistics of the driver calls recorded since enable_stats():
+
+            session.enable_stats()
+            ...
+            for function, s in session.stats().items():
+                print(function, s.calls, s.driver_time, s.python_time, s.percentile(99))
+
+        Returns:
+            stats (collections.OrderedDict): call_stats.FunctionStats by C function name, the one with the most total
+                time first
+        '''
+        return self._session_stats.stats()
+
     def close(self):
+        with self._repeated_capability_views_lock:
+            self._repeated_capability_views.clear()
         try:
             self._close()
         except errors.Error as e:
             self._vi = 0
+            self._vi_ctype = visatype.ViSession(0)
             raise
         self._vi = 0
+        self._vi_ctype = visatype.ViSession(0)
 
     ''' These are code-generated '''
 
@@ -898,7 +1322,7 @@ class Session(_SessionBase):
         Aborts a previously initiated measurement and returns the DMM to the
         Idle state.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niDMM_Abort(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -929,11 +1353,14 @@ class Session(_SessionBase):
                 Hz–300 kHz for the NI 4080/4081/4082 and the NI 4070/4071/4072, 10
                 Hz–100 Hz for the NI 4065, and 20 Hz–25 kHz for the NI 4050 and NI 4060.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        ac_minimum_frequency_hz_ctype = visatype.ViReal64(ac_minimum_frequency_hz)  # case 8
-        ac_maximum_frequency_hz_ctype = visatype.ViReal64(ac_maximum_frequency_hz)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        ac_minimum_frequency_hz_ctype = _scalar_ctypes.ConfigureACBandwidth_ac_minimum_frequency_hz
+        ac_minimum_frequency_hz_ctype.value = ac_minimum_frequency_hz  # case 8
+        ac_maximum_frequency_hz_ctype = _scalar_ctypes.ConfigureACBandwidth_ac_maximum_frequency_hz
+        ac_maximum_frequency_hz_ctype.value = ac_maximum_frequency_hz  # case 8
         error_code = self._library.niDMM_ConfigureACBandwidth(vi_ctype, ac_minimum_frequency_hz_ctype, ac_maximum_frequency_hz_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_measurement_absolute(self, measurement_function, range, resolution_absolute):
@@ -984,12 +1411,16 @@ class Session(_SessionBase):
         '''
         if type(measurement_function) is not enums.Function:
             raise TypeError('Parameter mode must be of type ' + str(enums.Function))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        measurement_function_ctype = visatype.ViInt32(measurement_function.value)  # case 9
-        range_ctype = visatype.ViReal64(range)  # case 8
-        resolution_absolute_ctype = visatype.ViReal64(resolution_absolute)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        measurement_function_ctype = _scalar_ctypes.ConfigureMeasurementAbsolute_measurement_function
+        measurement_function_ctype.value = measurement_function.value  # case 9
+        range_ctype = _scalar_ctypes.ConfigureMeasurementAbsolute_range
+        range_ctype.value = range  # case 8
+        resolution_absolute_ctype = _scalar_ctypes.ConfigureMeasurementAbsolute_resolution_absolute
+        resolution_absolute_ctype.value = resolution_absolute  # case 8
         error_code = self._library.niDMM_ConfigureMeasurementAbsolute(vi_ctype, measurement_function_ctype, range_ctype, resolution_absolute_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_measurement_digits(self, measurement_function, range, resolution_digits):
@@ -1041,12 +1472,16 @@ class Session(_SessionBase):
         '''
         if type(measurement_function) is not enums.Function:
             raise TypeError('Parameter mode must be of type ' + str(enums.Function))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        measurement_function_ctype = visatype.ViInt32(measurement_function.value)  # case 9
-        range_ctype = visatype.ViReal64(range)  # case 8
-        resolution_digits_ctype = visatype.ViReal64(resolution_digits)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        measurement_function_ctype = _scalar_ctypes.ConfigureMeasurementDigits_measurement_function
+        measurement_function_ctype.value = measurement_function.value  # case 9
+        range_ctype = _scalar_ctypes.ConfigureMeasurementDigits_range
+        range_ctype.value = range  # case 8
+        resolution_digits_ctype = _scalar_ctypes.ConfigureMeasurementDigits_resolution_digits
+        resolution_digits_ctype.value = resolution_digits  # case 8
         error_code = self._library.niDMM_ConfigureMeasurementDigits(vi_ctype, measurement_function_ctype, range_ctype, resolution_digits_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_multi_point(self, trigger_count, sample_count, sample_trigger=enums.SampleTrigger.IMMEDIATE, sample_interval=-1):
@@ -1095,13 +1530,18 @@ class Session(_SessionBase):
         '''
         if type(sample_trigger) is not enums.SampleTrigger:
             raise TypeError('Parameter mode must be of type ' + str(enums.SampleTrigger))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        trigger_count_ctype = visatype.ViInt32(trigger_count)  # case 8
-        sample_count_ctype = visatype.ViInt32(sample_count)  # case 8
-        sample_trigger_ctype = visatype.ViInt32(sample_trigger.value)  # case 9
-        sample_interval_ctype = visatype.ViReal64(sample_interval)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        trigger_count_ctype = _scalar_ctypes.ConfigureMultiPoint_trigger_count
+        trigger_count_ctype.value = trigger_count  # case 8
+        sample_count_ctype = _scalar_ctypes.ConfigureMultiPoint_sample_count
+        sample_count_ctype.value = sample_count  # case 8
+        sample_trigger_ctype = _scalar_ctypes.ConfigureMultiPoint_sample_trigger
+        sample_trigger_ctype.value = sample_trigger.value  # case 9
+        sample_interval_ctype = _scalar_ctypes.ConfigureMultiPoint_sample_interval
+        sample_interval_ctype.value = sample_interval  # case 8
         error_code = self._library.niDMM_ConfigureMultiPoint(vi_ctype, trigger_count_ctype, sample_count_ctype, sample_trigger_ctype, sample_interval_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_open_cable_comp_values(self, conductance, susceptance):
@@ -1115,11 +1555,14 @@ class Session(_SessionBase):
             conductance (float): Specifies the open cable compensation **conductance**.
             susceptance (float): Specifies the open cable compensation **susceptance**.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        conductance_ctype = visatype.ViReal64(conductance)  # case 8
-        susceptance_ctype = visatype.ViReal64(susceptance)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        conductance_ctype = _scalar_ctypes.ConfigureOpenCableCompValues_conductance
+        conductance_ctype.value = conductance  # case 8
+        susceptance_ctype = _scalar_ctypes.ConfigureOpenCableCompValues_susceptance
+        susceptance_ctype.value = susceptance  # case 8
         error_code = self._library.niDMM_ConfigureOpenCableCompValues(vi_ctype, conductance_ctype, susceptance_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_power_line_frequency(self, power_line_frequency_hz):
@@ -1131,10 +1574,12 @@ class Session(_SessionBase):
             power_line_frequency_hz (float): **Powerline Frequency** specifies the powerline frequency in hertz.
                 NI-DMM sets the Powerline Frequency property to this value.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        power_line_frequency_hz_ctype = visatype.ViReal64(power_line_frequency_hz)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        power_line_frequency_hz_ctype = _scalar_ctypes.ConfigurePowerLineFrequency_power_line_frequency_hz
+        power_line_frequency_hz_ctype.value = power_line_frequency_hz  # case 8
         error_code = self._library.niDMM_ConfigurePowerLineFrequency(vi_ctype, power_line_frequency_hz_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_rtd_custom(self, rtd_a, rtd_b, rtd_c):
@@ -1153,12 +1598,16 @@ class Session(_SessionBase):
                 Type parameter is set to Custom in the configure_rtd_type function.
                 The default is -4.183e-12 (Pt3851).
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        rtd_a_ctype = visatype.ViReal64(rtd_a)  # case 8
-        rtd_b_ctype = visatype.ViReal64(rtd_b)  # case 8
-        rtd_c_ctype = visatype.ViReal64(rtd_c)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        rtd_a_ctype = _scalar_ctypes.ConfigureRTDCustom_rtd_a
+        rtd_a_ctype.value = rtd_a  # case 8
+        rtd_b_ctype = _scalar_ctypes.ConfigureRTDCustom_rtd_b
+        rtd_b_ctype.value = rtd_b  # case 8
+        rtd_c_ctype = _scalar_ctypes.ConfigureRTDCustom_rtd_c
+        rtd_c_ctype.value = rtd_c  # case 8
         error_code = self._library.niDMM_ConfigureRTDCustom(vi_ctype, rtd_a_ctype, rtd_b_ctype, rtd_c_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_rtd_type(self, rtd_type, rtd_resistance):
@@ -1195,11 +1644,14 @@ class Session(_SessionBase):
         '''
         if type(rtd_type) is not enums.RTDType:
             raise TypeError('Parameter mode must be of type ' + str(enums.RTDType))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        rtd_type_ctype = visatype.ViInt32(rtd_type.value)  # case 9
-        rtd_resistance_ctype = visatype.ViReal64(rtd_resistance)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        rtd_type_ctype = _scalar_ctypes.ConfigureRTDType_rtd_type
+        rtd_type_ctype.value = rtd_type.value  # case 9
+        rtd_resistance_ctype = _scalar_ctypes.ConfigureRTDType_rtd_resistance
+        rtd_resistance_ctype.value = rtd_resistance  # case 8
         error_code = self._library.niDMM_ConfigureRTDType(vi_ctype, rtd_type_ctype, rtd_resistance_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_short_cable_comp_values(self, resistance, reactance):
@@ -1213,11 +1665,14 @@ class Session(_SessionBase):
             resistance (float): Specifies the short cable compensation **resistance**.
             reactance (float): Specifies the short cable compensation **reactance**.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        resistance_ctype = visatype.ViReal64(resistance)  # case 8
-        reactance_ctype = visatype.ViReal64(reactance)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        resistance_ctype = _scalar_ctypes.ConfigureShortCableCompValues_resistance
+        resistance_ctype.value = resistance  # case 8
+        reactance_ctype = _scalar_ctypes.ConfigureShortCableCompValues_reactance
+        reactance_ctype.value = reactance  # case 8
         error_code = self._library.niDMM_ConfigureShortCableCompValues(vi_ctype, resistance_ctype, reactance_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_thermistor_custom(self, thermistor_a, thermistor_b, thermistor_c):
@@ -1236,12 +1691,16 @@ class Session(_SessionBase):
                 Thermistor Type is set to Custom in the ConfigureThermistorType
                 function. The default is 1.568e-7 (44006).
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        thermistor_a_ctype = visatype.ViReal64(thermistor_a)  # case 8
-        thermistor_b_ctype = visatype.ViReal64(thermistor_b)  # case 8
-        thermistor_c_ctype = visatype.ViReal64(thermistor_c)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        thermistor_a_ctype = _scalar_ctypes.ConfigureThermistorCustom_thermistor_a
+        thermistor_a_ctype.value = thermistor_a  # case 8
+        thermistor_b_ctype = _scalar_ctypes.ConfigureThermistorCustom_thermistor_b
+        thermistor_b_ctype.value = thermistor_b  # case 8
+        thermistor_c_ctype = _scalar_ctypes.ConfigureThermistorCustom_thermistor_c
+        thermistor_c_ctype.value = thermistor_c  # case 8
         error_code = self._library.niDMM_ConfigureThermistorCustom(vi_ctype, thermistor_a_ctype, thermistor_b_ctype, thermistor_c_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_thermocouple(self, thermocouple_type, reference_junction_type=enums.ThermocoupleReferenceJunctionType.FIXED):
@@ -1281,11 +1740,14 @@ class Session(_SessionBase):
             raise TypeError('Parameter mode must be of type ' + str(enums.ThermocoupleType))
         if type(reference_junction_type) is not enums.ThermocoupleReferenceJunctionType:
             raise TypeError('Parameter mode must be of type ' + str(enums.ThermocoupleReferenceJunctionType))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        thermocouple_type_ctype = visatype.ViInt32(thermocouple_type.value)  # case 9
-        reference_junction_type_ctype = visatype.ViInt32(reference_junction_type.value)  # case 9
+        vi_ctype = self._vi_ctype  # case 1
+        thermocouple_type_ctype = _scalar_ctypes.ConfigureThermocouple_thermocouple_type
+        thermocouple_type_ctype.value = thermocouple_type.value  # case 9
+        reference_junction_type_ctype = _scalar_ctypes.ConfigureThermocouple_reference_junction_type
+        reference_junction_type_ctype.value = reference_junction_type.value  # case 9
         error_code = self._library.niDMM_ConfigureThermocouple(vi_ctype, thermocouple_type_ctype, reference_junction_type_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_trigger(self, trigger_source, trigger_delay=-1):
@@ -1321,11 +1783,14 @@ class Session(_SessionBase):
         '''
         if type(trigger_source) is not enums.TriggerSource:
             raise TypeError('Parameter mode must be of type ' + str(enums.TriggerSource))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        trigger_source_ctype = visatype.ViInt32(trigger_source.value)  # case 9
-        trigger_delay_ctype = visatype.ViReal64(trigger_delay)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        trigger_source_ctype = _scalar_ctypes.ConfigureTrigger_trigger_source
+        trigger_source_ctype.value = trigger_source.value  # case 9
+        trigger_delay_ctype = _scalar_ctypes.ConfigureTrigger_trigger_delay
+        trigger_delay_ctype.value = trigger_delay  # case 8
         error_code = self._library.niDMM_ConfigureTrigger(vi_ctype, trigger_source_ctype, trigger_delay_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_waveform_acquisition(self, measurement_function, range, rate, waveform_points):
@@ -1370,13 +1835,18 @@ class Session(_SessionBase):
         '''
         if type(measurement_function) is not enums.Function:
             raise TypeError('Parameter mode must be of type ' + str(enums.Function))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        measurement_function_ctype = visatype.ViInt32(measurement_function.value)  # case 9
-        range_ctype = visatype.ViReal64(range)  # case 8
-        rate_ctype = visatype.ViReal64(rate)  # case 8
-        waveform_points_ctype = visatype.ViInt32(waveform_points)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        measurement_function_ctype = _scalar_ctypes.ConfigureWaveformAcquisition_measurement_function
+        measurement_function_ctype.value = measurement_function.value  # case 9
+        range_ctype = _scalar_ctypes.ConfigureWaveformAcquisition_range
+        range_ctype.value = range  # case 8
+        rate_ctype = _scalar_ctypes.ConfigureWaveformAcquisition_rate
+        rate_ctype.value = rate  # case 8
+        waveform_points_ctype = _scalar_ctypes.ConfigureWaveformAcquisition_waveform_points
+        waveform_points_ctype.value = waveform_points  # case 8
         error_code = self._library.niDMM_ConfigureWaveformAcquisition(vi_ctype, measurement_function_ctype, range_ctype, rate_ctype, waveform_points_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def disable(self):
@@ -1386,7 +1856,7 @@ class Session(_SessionBase):
         impact on the system to which it is connected. If a measurement is in
         progress when this function is called, the measurement is aborted.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niDMM_Disable(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1412,14 +1882,15 @@ class Session(_SessionBase):
         Returns:
             reading (float): The measured value returned from the DMM.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        maximum_time_ctype = visatype.ViInt32(maximum_time)  # case 8
-        reading_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niDMM_Fetch(vi_ctype, maximum_time_ctype, ctypes.pointer(reading_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        maximum_time_ctype = _scalar_ctypes.Fetch_maximum_time
+        maximum_time_ctype.value = maximum_time  # case 8
+        reading_ctype = _scalar_ctypes.Fetch_reading  # case 13
+        error_code = self._library.niDMM_Fetch(vi_ctype, maximum_time_ctype, _scalar_ctypes.Fetch_reading_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(reading_ctype.value)
 
-    def fetch_multi_point(self, array_size, maximum_time=-1):
+    def fetch_multi_point(self, array_size, maximum_time=-1, array_type='list'):
         '''fetch_multi_point
 
         Returns an array of values from a previously initiated multipoint
@@ -1446,25 +1917,70 @@ class Session(_SessionBase):
                 For continuous acquisitions, up to 100,000 points can be returned at
                 once. The number of measurements can be a subset. The valid range is any
                 positive ViInt32. The default value is 1.
+            array_type (str): Selects how arrays are returned: 'list', 'array' for array.array or 'numpy' for numpy.ndarray. A numpy.ndarray shares memory with the buffer filled by the driver, so nothing is copied.
 
         Returns:
-            reading_array (list of float): An array of measurement values.
+            reading_array (list, array.array or numpy.ndarray of float): An array of measurement values.
 
                 Note:
                 The size of the **Reading_Array** must be at least the size that you
                 specify for the **Array_Size** parameter.
             actual_number_of_points (int): Indicates the number of measured values actually retrieved from the DMM.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        maximum_time_ctype = visatype.ViInt32(maximum_time)  # case 8
+        _converters.check_array_type(array_type)
+        vi_ctype = self._vi_ctype  # case 1
+        maximum_time_ctype = _scalar_ctypes.FetchMultiPoint_maximum_time
+        maximum_time_ctype.value = maximum_time  # case 8
         array_size_ctype = visatype.ViInt32(array_size)  # case 7
         reading_array_ctype = (visatype.ViReal64 * array_size)()  # case 12
-        actual_number_of_points_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niDMM_FetchMultiPoint(vi_ctype, maximum_time_ctype, array_size_ctype, reading_array_ctype, ctypes.pointer(actual_number_of_points_ctype))
+        actual_number_of_points_ctype = _scalar_ctypes.FetchMultiPoint_actual_number_of_points  # case 13
+        error_code = self._library.niDMM_FetchMultiPoint(vi_ctype, maximum_time_ctype, array_size_ctype, reading_array_ctype, _scalar_ctypes.FetchMultiPoint_actual_number_of_points_pointer)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return _converters.convert_from_ctypes_array(reading_array_ctype, array_size_ctype.value, float, array_type), int(actual_number_of_points_ctype.value)
+
+    def fetch_multi_point_into(self, reading_array, maximum_time=-1):
+        '''fetch_multi_point_into
+
+        Same as fetch_multi_point, but the driver writes **reading_array** directly into a buffer you allocate, such as a numpy.ndarray or array.array. Nothing is copied and no list is created.
+
+
+        Returns an array of values from a previously initiated multipoint
+        measurement. The number of measurements the DMM makes is determined by
+        the values you specify for the **Trigger_Count** and **Sample_Count**
+        parameters of configure_multi_point. You must first call
+        _initiate to initiate a measurement before calling this function.
+
+        Args:
+            maximum_time (int): Specifies the **maximum_time** allowed for this function to complete in
+                milliseconds. If the function does not complete within this time
+                interval, the function returns the NIDMM_ERROR_MAX_TIME_EXCEEDED
+                error code. This may happen if an external trigger has not been
+                received, or if the specified timeout is not long enough for the
+                acquisition to complete.
+
+                The valid range is 0–86400000. The default value is
+                NIDMM_VAL_TIME_LIMIT_AUTO (-1). The DMM calculates the timeout
+                automatically.
+            reading_array (writable buffer of float): An array of measurement values.
+
+                Note:
+                The size of the **Reading_Array** must be at least the size that you
+                specify for the **Array_Size** parameter.
+
+        Returns:
+            actual_number_of_points (int): Indicates the number of measured values actually retrieved from the DMM.
+        '''
+        vi_ctype = self._vi_ctype  # case 1
+        maximum_time_ctype = _scalar_ctypes.FetchMultiPoint_maximum_time
+        maximum_time_ctype.value = maximum_time  # case 8
+        array_size_ctype = visatype.ViInt32(len(reading_array))  # case 5
+        reading_array_ctype = _converters.get_ctypes_array_for_buffer(reading_array, visatype.ViReal64, 'reading_array')  # case 14
+        actual_number_of_points_ctype = _scalar_ctypes.FetchMultiPoint_actual_number_of_points  # case 13
+        error_code = self._library.niDMM_FetchMultiPoint(vi_ctype, maximum_time_ctype, array_size_ctype, reading_array_ctype, _scalar_ctypes.FetchMultiPoint_actual_number_of_points_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return [float(reading_array_ctype[i]) for i in range(array_size_ctype.value)], int(actual_number_of_points_ctype.value)
+        return int(actual_number_of_points_ctype.value)
 
-    def fetch_waveform(self, array_size, maximum_time=-1):
+    def fetch_waveform(self, array_size, maximum_time=-1, array_type='list'):
         '''fetch_waveform
 
         For the NI 4080/4081/4082 and the NI 4070/4071/4072, returns an array of
@@ -1486,20 +2002,60 @@ class Session(_SessionBase):
                 number of points that the DMM acquires in the **Waveform Points**
                 parameter of configure_waveform_acquisition. The default value is
                 1.
+            array_type (str): Selects how arrays are returned: 'list', 'array' for array.array or 'numpy' for numpy.ndarray. A numpy.ndarray shares memory with the buffer filled by the driver, so nothing is copied.
 
         Returns:
-            waveform_array (list of float): **Waveform Array** is an array of measurement values stored in waveform
+            waveform_array (list, array.array or numpy.ndarray of float): **Waveform Array** is an array of measurement values stored in waveform
                 data type.
             actual_number_of_points (int): Indicates the number of measured values actually retrieved from the DMM.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        maximum_time_ctype = visatype.ViInt32(maximum_time)  # case 8
+        _converters.check_array_type(array_type)
+        vi_ctype = self._vi_ctype  # case 1
+        maximum_time_ctype = _scalar_ctypes.FetchWaveform_maximum_time
+        maximum_time_ctype.value = maximum_time  # case 8
         array_size_ctype = visatype.ViInt32(array_size)  # case 7
         waveform_array_ctype = (visatype.ViReal64 * array_size)()  # case 12
-        actual_number_of_points_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niDMM_FetchWaveform(vi_ctype, maximum_time_ctype, array_size_ctype, waveform_array_ctype, ctypes.pointer(actual_number_of_points_ctype))
+        actual_number_of_points_ctype = _scalar_ctypes.FetchWaveform_actual_number_of_points  # case 13
+        error_code = self._library.niDMM_FetchWaveform(vi_ctype, maximum_time_ctype, array_size_ctype, waveform_array_ctype, _scalar_ctypes.FetchWaveform_actual_number_of_points_pointer)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return _converters.convert_from_ctypes_array(waveform_array_ctype, array_size_ctype.value, float, array_type), int(actual_number_of_points_ctype.value)
+
+    def fetch_waveform_into(self, waveform_array, maximum_time=-1):
+        '''fetch_waveform_into
+
+        Same as fetch_waveform, but the driver writes **waveform_array** directly into a buffer you allocate, such as a numpy.ndarray or array.array. Nothing is copied and no list is created.
+
+
+        For the NI 4080/4081/4082 and the NI 4070/4071/4072, returns an array of
+        values from a previously initiated waveform acquisition. You must call
+        _initiate before calling this function.
+
+        Args:
+            maximum_time (int): Specifies the **maximum_time** allowed for this function to complete in
+                milliseconds. If the function does not complete within this time
+                interval, the function returns the NIDMM_ERROR_MAX_TIME_EXCEEDED
+                error code. This may happen if an external trigger has not been
+                received, or if the specified timeout is not long enough for the
+                acquisition to complete.
+
+                The valid range is 0–86400000. The default value is
+                NIDMM_VAL_TIME_LIMIT_AUTO (-1). The DMM calculates the timeout
+                automatically.
+            waveform_array (writable buffer of float): **Waveform Array** is an array of measurement values stored in waveform
+                data type.
+
+        Returns:
+            actual_number_of_points (int): Indicates the number of measured values actually retrieved from the DMM.
+        '''
+        vi_ctype = self._vi_ctype  # case 1
+        maximum_time_ctype = _scalar_ctypes.FetchWaveform_maximum_time
+        maximum_time_ctype.value = maximum_time  # case 8
+        array_size_ctype = visatype.ViInt32(len(waveform_array))  # case 5
+        waveform_array_ctype = _converters.get_ctypes_array_for_buffer(waveform_array, visatype.ViReal64, 'waveform_array')  # case 14
+        actual_number_of_points_ctype = _scalar_ctypes.FetchWaveform_actual_number_of_points  # case 13
+        error_code = self._library.niDMM_FetchWaveform(vi_ctype, maximum_time_ctype, array_size_ctype, waveform_array_ctype, _scalar_ctypes.FetchWaveform_actual_number_of_points_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return [float(waveform_array_ctype[i]) for i in range(array_size_ctype.value)], int(actual_number_of_points_ctype.value)
+        return int(actual_number_of_points_ctype.value)
 
     def get_aperture_time_info(self):
         '''get_aperture_time_info
@@ -1537,12 +2093,12 @@ class Session(_SessionBase):
                 | NIDMM_VAL_POWER_LINE_CYCLES | 1 | Powerline Cycles |
                 +-----------------------------+---+------------------+
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        aperture_time_ctype = visatype.ViReal64()  # case 13
-        aperture_time_units_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niDMM_GetApertureTimeInfo(vi_ctype, ctypes.pointer(aperture_time_ctype), ctypes.pointer(aperture_time_units_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        aperture_time_ctype = _scalar_ctypes.GetApertureTimeInfo_aperture_time  # case 13
+        aperture_time_units_ctype = _scalar_ctypes.GetApertureTimeInfo_aperture_time_units  # case 13
+        error_code = self._library.niDMM_GetApertureTimeInfo(vi_ctype, _scalar_ctypes.GetApertureTimeInfo_aperture_time_pointer, _scalar_ctypes.GetApertureTimeInfo_aperture_time_units_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return float(aperture_time_ctype.value), enums.ApertureTimeUnits(aperture_time_units_ctype.value)
+        return float(aperture_time_ctype.value), enums._get_member(enums.ApertureTimeUnits, aperture_time_units_ctype.value)
 
     def get_auto_range_value(self):
         '''get_auto_range_value
@@ -1555,9 +2111,9 @@ class Session(_SessionBase):
                 the AUTO_RANGE_VALUE attribute. The units of the returned
                 value depend on the function.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        actual_range_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niDMM_GetAutoRangeValue(vi_ctype, ctypes.pointer(actual_range_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        actual_range_ctype = _scalar_ctypes.GetAutoRangeValue_actual_range  # case 13
+        error_code = self._library.niDMM_GetAutoRangeValue(vi_ctype, _scalar_ctypes.GetAutoRangeValue_actual_range_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(actual_range_ctype.value)
 
@@ -1587,14 +2143,15 @@ class Session(_SessionBase):
             hour (int): Indicates the **hour** of the last calibration.
             minute (int): Indicates the **minute** of the last calibration.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        cal_type_ctype = visatype.ViInt32(cal_type)  # case 8
-        month_ctype = visatype.ViInt32()  # case 13
-        day_ctype = visatype.ViInt32()  # case 13
-        year_ctype = visatype.ViInt32()  # case 13
-        hour_ctype = visatype.ViInt32()  # case 13
-        minute_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niDMM_GetCalDateAndTime(vi_ctype, cal_type_ctype, ctypes.pointer(month_ctype), ctypes.pointer(day_ctype), ctypes.pointer(year_ctype), ctypes.pointer(hour_ctype), ctypes.pointer(minute_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        cal_type_ctype = _scalar_ctypes.GetCalDateAndTime_cal_type
+        cal_type_ctype.value = cal_type  # case 8
+        month_ctype = _scalar_ctypes.GetCalDateAndTime_month  # case 13
+        day_ctype = _scalar_ctypes.GetCalDateAndTime_day  # case 13
+        year_ctype = _scalar_ctypes.GetCalDateAndTime_year  # case 13
+        hour_ctype = _scalar_ctypes.GetCalDateAndTime_hour  # case 13
+        minute_ctype = _scalar_ctypes.GetCalDateAndTime_minute  # case 13
+        error_code = self._library.niDMM_GetCalDateAndTime(vi_ctype, cal_type_ctype, _scalar_ctypes.GetCalDateAndTime_month_pointer, _scalar_ctypes.GetCalDateAndTime_day_pointer, _scalar_ctypes.GetCalDateAndTime_year_pointer, _scalar_ctypes.GetCalDateAndTime_hour_pointer, _scalar_ctypes.GetCalDateAndTime_minute_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(month_ctype.value), int(day_ctype.value), int(year_ctype.value), int(hour_ctype.value), int(minute_ctype.value)
 
@@ -1611,10 +2168,10 @@ class Session(_SessionBase):
         Returns:
             temperature (float): Returns the current **temperature** of the device.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        options_ctype = ctypes.create_string_buffer(options.encode(self._encoding))  # case 3
-        temperature_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niDMM_GetDevTemp(vi_ctype, options_ctype, ctypes.pointer(temperature_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        options_ctype = options.encode(self._encoding)  # case 3
+        temperature_ctype = _scalar_ctypes.GetDevTemp_temperature  # case 13
+        error_code = self._library.niDMM_GetDevTemp(vi_ctype, options_ctype, _scalar_ctypes.GetDevTemp_temperature_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(temperature_ctype.value)
 
@@ -1640,10 +2197,11 @@ class Session(_SessionBase):
         Returns:
             temperature (float): Returns the **temperature** during the last calibration.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        cal_type_ctype = visatype.ViInt32(cal_type)  # case 8
-        temperature_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niDMM_GetLastCalTemp(vi_ctype, cal_type_ctype, ctypes.pointer(temperature_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        cal_type_ctype = _scalar_ctypes.GetLastCalTemp_cal_type
+        cal_type_ctype.value = cal_type  # case 8
+        temperature_ctype = _scalar_ctypes.GetLastCalTemp_temperature  # case 13
+        error_code = self._library.niDMM_GetLastCalTemp(vi_ctype, cal_type_ctype, _scalar_ctypes.GetLastCalTemp_temperature_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(temperature_ctype.value)
 
@@ -1665,9 +2223,9 @@ class Session(_SessionBase):
                 Time required for internal measurements, such as
                 AUTO_ZERO, is included.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        period_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niDMM_GetMeasurementPeriod(vi_ctype, ctypes.pointer(period_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        period_ctype = _scalar_ctypes.GetMeasurementPeriod_period  # case 13
+        error_code = self._library.niDMM_GetMeasurementPeriod(vi_ctype, _scalar_ctypes.GetMeasurementPeriod_period_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(period_ctype.value)
 
@@ -1687,9 +2245,9 @@ class Session(_SessionBase):
                 | VI_FALSE | 0 | The DMM that you are using cannot perform self-calibration. |
                 +----------+---+-------------------------------------------------------------+
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        self_cal_supported_ctype = visatype.ViBoolean()  # case 13
-        error_code = self._library.niDMM_GetSelfCalSupported(vi_ctype, ctypes.pointer(self_cal_supported_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        self_cal_supported_ctype = _scalar_ctypes.GetSelfCalSupported_self_cal_supported  # case 13
+        error_code = self._library.niDMM_GetSelfCalSupported(vi_ctype, _scalar_ctypes.GetSelfCalSupported_self_cal_supported_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return bool(self_cal_supported_ctype.value)
 
@@ -1789,12 +2347,14 @@ class Session(_SessionBase):
             vi (int): Returns a ViSession handle that you use to identify the instrument in
                 all subsequent instrument driver function calls.
         '''
-        resource_name_ctype = ctypes.create_string_buffer(resource_name.encode(self._encoding))  # case 3
-        id_query_ctype = visatype.ViBoolean(id_query)  # case 8
-        reset_device_ctype = visatype.ViBoolean(reset_device)  # case 8
-        option_string_ctype = ctypes.create_string_buffer(option_string.encode(self._encoding))  # case 3
-        vi_ctype = visatype.ViSession()  # case 13
-        error_code = self._library.niDMM_InitWithOptions(resource_name_ctype, id_query_ctype, reset_device_ctype, option_string_ctype, ctypes.pointer(vi_ctype))
+        resource_name_ctype = resource_name.encode(self._encoding)  # case 3
+        id_query_ctype = _scalar_ctypes.InitWithOptions_id_query
+        id_query_ctype.value = id_query  # case 8
+        reset_device_ctype = _scalar_ctypes.InitWithOptions_reset_device
+        reset_device_ctype.value = reset_device  # case 8
+        option_string_ctype = option_string.encode(self._encoding)  # case 3
+        vi_ctype = _scalar_ctypes.InitWithOptions_vi  # case 13
+        error_code = self._library.niDMM_InitWithOptions(resource_name_ctype, id_query_ctype, reset_device_ctype, option_string_ctype, _scalar_ctypes.InitWithOptions_vi_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(vi_ctype.value)
 
@@ -1807,7 +2367,7 @@ class Session(_SessionBase):
         fetch, fetch_multi_point, or fetch_waveform to
         retrieve the measurement data.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niDMM_Initiate(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1831,10 +2391,10 @@ class Session(_SessionBase):
             susceptance (float): **susceptance** is the measured value of open cable compensation
                 **susceptance**.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        conductance_ctype = visatype.ViReal64()  # case 13
-        susceptance_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niDMM_PerformOpenCableComp(vi_ctype, ctypes.pointer(conductance_ctype), ctypes.pointer(susceptance_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        conductance_ctype = _scalar_ctypes.PerformOpenCableComp_conductance  # case 13
+        susceptance_ctype = _scalar_ctypes.PerformOpenCableComp_susceptance  # case 13
+        error_code = self._library.niDMM_PerformOpenCableComp(vi_ctype, _scalar_ctypes.PerformOpenCableComp_conductance_pointer, _scalar_ctypes.PerformOpenCableComp_susceptance_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(conductance_ctype.value), float(susceptance_ctype.value)
 
@@ -1856,10 +2416,10 @@ class Session(_SessionBase):
             reactance (float): **reactance** is the measured value of short cable compensation
                 **reactance**.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        resistance_ctype = visatype.ViReal64()  # case 13
-        reactance_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niDMM_PerformShortCableComp(vi_ctype, ctypes.pointer(resistance_ctype), ctypes.pointer(reactance_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        resistance_ctype = _scalar_ctypes.PerformShortCableComp_resistance  # case 13
+        reactance_ctype = _scalar_ctypes.PerformShortCableComp_reactance  # case 13
+        error_code = self._library.niDMM_PerformShortCableComp(vi_ctype, _scalar_ctypes.PerformShortCableComp_resistance_pointer, _scalar_ctypes.PerformShortCableComp_reactance_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(resistance_ctype.value), float(reactance_ctype.value)
 
@@ -1883,14 +2443,15 @@ class Session(_SessionBase):
         Returns:
             reading (float): The measured value returned from the DMM.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        maximum_time_ctype = visatype.ViInt32(maximum_time)  # case 8
-        reading_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niDMM_Read(vi_ctype, maximum_time_ctype, ctypes.pointer(reading_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        maximum_time_ctype = _scalar_ctypes.Read_maximum_time
+        maximum_time_ctype.value = maximum_time  # case 8
+        reading_ctype = _scalar_ctypes.Read_reading  # case 13
+        error_code = self._library.niDMM_Read(vi_ctype, maximum_time_ctype, _scalar_ctypes.Read_reading_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(reading_ctype.value)
 
-    def read_multi_point(self, array_size, maximum_time=-1):
+    def read_multi_point(self, array_size, maximum_time=-1, array_type='list'):
         '''read_multi_point
 
         Acquires multiple measurements and returns an array of measured values.
@@ -1916,23 +2477,26 @@ class Session(_SessionBase):
                 For continuous acquisitions, up to 100,000 points can be returned at
                 once. The number of measurements can be a subset. The valid range is any
                 positive ViInt32. The default value is 1.
+            array_type (str): Selects how arrays are returned: 'list', 'array' for array.array or 'numpy' for numpy.ndarray. A numpy.ndarray shares memory with the buffer filled by the driver, so nothing is copied.
 
         Returns:
-            reading_array (list of float): An array of measurement values.
+            reading_array (list, array.array or numpy.ndarray of float): An array of measurement values.
 
                 Note:
                 The size of the **Reading_Array** must be at least the size that you
                 specify for the **Array_Size** parameter.
             actual_number_of_points (int): Indicates the number of measured values actually retrieved from the DMM.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        maximum_time_ctype = visatype.ViInt32(maximum_time)  # case 8
+        _converters.check_array_type(array_type)
+        vi_ctype = self._vi_ctype  # case 1
+        maximum_time_ctype = _scalar_ctypes.ReadMultiPoint_maximum_time
+        maximum_time_ctype.value = maximum_time  # case 8
         array_size_ctype = visatype.ViInt32(array_size)  # case 7
         reading_array_ctype = (visatype.ViReal64 * array_size)()  # case 12
-        actual_number_of_points_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niDMM_ReadMultiPoint(vi_ctype, maximum_time_ctype, array_size_ctype, reading_array_ctype, ctypes.pointer(actual_number_of_points_ctype))
+        actual_number_of_points_ctype = _scalar_ctypes.ReadMultiPoint_actual_number_of_points  # case 13
+        error_code = self._library.niDMM_ReadMultiPoint(vi_ctype, maximum_time_ctype, array_size_ctype, reading_array_ctype, _scalar_ctypes.ReadMultiPoint_actual_number_of_points_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return [float(reading_array_ctype[i]) for i in range(array_size_ctype.value)], int(actual_number_of_points_ctype.value)
+        return _converters.convert_from_ctypes_array(reading_array_ctype, array_size_ctype.value, float, array_type), int(actual_number_of_points_ctype.value)
 
     def read_status(self):
         '''read_status
@@ -1969,14 +2533,14 @@ class Session(_SessionBase):
                 | 4 | No acquisition in progress |
                 +---+----------------------------+
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        acquisition_backlog_ctype = visatype.ViInt32()  # case 13
-        acquisition_status_ctype = visatype.ViInt16()  # case 13
-        error_code = self._library.niDMM_ReadStatus(vi_ctype, ctypes.pointer(acquisition_backlog_ctype), ctypes.pointer(acquisition_status_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        acquisition_backlog_ctype = _scalar_ctypes.ReadStatus_acquisition_backlog  # case 13
+        acquisition_status_ctype = _scalar_ctypes.ReadStatus_acquisition_status  # case 13
+        error_code = self._library.niDMM_ReadStatus(vi_ctype, _scalar_ctypes.ReadStatus_acquisition_backlog_pointer, _scalar_ctypes.ReadStatus_acquisition_status_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return int(acquisition_backlog_ctype.value), enums.AcquisitionStatus(acquisition_status_ctype.value)
+        return int(acquisition_backlog_ctype.value), enums._get_member(enums.AcquisitionStatus, acquisition_status_ctype.value)
 
-    def read_waveform(self, array_size, maximum_time=-1):
+    def read_waveform(self, array_size, maximum_time=-1, array_type='list'):
         '''read_waveform
 
         For the NI 4080/4081/4082 and the NI 4070/4071/4072, acquires a waveform
@@ -2000,23 +2564,26 @@ class Session(_SessionBase):
                 number of points that the DMM acquires in the **Waveform Points**
                 parameter of configure_waveform_acquisition. The default value is
                 1.
+            array_type (str): Selects how arrays are returned: 'list', 'array' for array.array or 'numpy' for numpy.ndarray. A numpy.ndarray shares memory with the buffer filled by the driver, so nothing is copied.
 
         Returns:
-            waveform_array (list of float): An array of measurement values.
+            waveform_array (list, array.array or numpy.ndarray of float): An array of measurement values.
 
                 Note:
                 The size of the **Waveform_Array** must be at least the size that you
                 specify for the **Array_Size** parameter.
             actual_number_of_points (int): Indicates the number of measured values actually retrieved from the DMM.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        maximum_time_ctype = visatype.ViInt32(maximum_time)  # case 8
+        _converters.check_array_type(array_type)
+        vi_ctype = self._vi_ctype  # case 1
+        maximum_time_ctype = _scalar_ctypes.ReadWaveform_maximum_time
+        maximum_time_ctype.value = maximum_time  # case 8
         array_size_ctype = visatype.ViInt32(array_size)  # case 7
         waveform_array_ctype = (visatype.ViReal64 * array_size)()  # case 12
-        actual_number_of_points_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niDMM_ReadWaveform(vi_ctype, maximum_time_ctype, array_size_ctype, waveform_array_ctype, ctypes.pointer(actual_number_of_points_ctype))
+        actual_number_of_points_ctype = _scalar_ctypes.ReadWaveform_actual_number_of_points  # case 13
+        error_code = self._library.niDMM_ReadWaveform(vi_ctype, maximum_time_ctype, array_size_ctype, waveform_array_ctype, _scalar_ctypes.ReadWaveform_actual_number_of_points_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return [float(waveform_array_ctype[i]) for i in range(array_size_ctype.value)], int(actual_number_of_points_ctype.value)
+        return _converters.convert_from_ctypes_array(waveform_array_ctype, array_size_ctype.value, float, array_type), int(actual_number_of_points_ctype.value)
 
     def reset_with_defaults(self):
         '''reset_with_defaults
@@ -2026,9 +2593,10 @@ class Session(_SessionBase):
         state necessary for the operation of NI-DMM. All user-defined default
         values associated with a logical name are applied after setting the DMM.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niDMM_ResetWithDefaults(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def self_cal(self):
@@ -2042,7 +2610,7 @@ class Session(_SessionBase):
         the call will be lost. All attributes will be set to their default
         values after the call returns.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niDMM_SelfCal(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2058,17 +2626,71 @@ class Session(_SessionBase):
         can use this function to override the trigger source that you configured
         and trigger the device. The NI 4050 and NI 4060 are not supported.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niDMM_SendSoftwareTrigger(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
+    def stream_readings(self, chunk_size, timeout=5.0):
+        '''stream_readings
+
+        Generator that fetches the readings of a multipoint acquisition while it is in progress, in chunks of
+        the readings available so far.
+
+        It calls read_status() to get the acquisition backlog, and fetches that many readings, up to
+        **chunk_size**, with fetch_multi_point_into(). It stops once **trigger_count** x **sample_count**
+        readings are fetched, or never for continuous acquisitions (either of them set to 0), until the caller
+        stops iterating.
+
+        Each chunk is a ctypes array of visatype.ViReal64. Use numpy.frombuffer() to wrap it without copying it.
+        Chunks are fetched into the same buffer, allocated once, so a chunk stays valid until the next one is requested.
+        Copy the data to keep it longer.
+
+        Note:
+        Initiate the acquisition first, i.e. in a 'with session.initiate():' block.
+
+        Args:
+            chunk_size (int): Maximum number of readings in each chunk.
+            timeout (float): Maximum time, in seconds, to wait for readings to be available for each chunk.
+        '''
+        return _streaming.stream_readings(self, chunk_size, timeout)
+
+    def stream_waveform(self, chunk_size, queue_size=4, timeout=5.0):
+        '''stream_waveform
+
+        Generator that fetches a waveform acquisition while it is in progress, in chunks of **chunk_size**
+        samples.
+
+        Each item is a WaveformChunk named tuple of (offset, start_time, sample_interval, samples), where
+        **offset** is the index of the first sample of the chunk in the acquisition, **start_time** is its
+        time in seconds from the first sample, **sample_interval** is 1 / waveform_rate and **samples** is a
+        ctypes array of visatype.ViReal64. Each chunk has its own array, so chunks stay valid after the next
+        one is requested. Use numpy.frombuffer() to wrap it without copying it.
+
+        A thread fetches each chunk as soon as read_status() reports enough samples, and puts it in a queue
+        of at most **queue_size** chunks. When the caller falls behind and the queue is full, the thread
+        waits instead of fetching more, so memory doesn't grow. The samples then wait in the memory of the
+        DMM, and the driver returns an error if they are overwritten, which the generator raises.
+
+        It stops after **trigger_count** x waveform_points samples, or never for continuous acquisitions
+        (**trigger_count** set to 0), until the caller stops iterating.
+
+        Note:
+        Initiate the acquisition first, i.e. in a 'with session.initiate():' block.
+
+        Args:
+            chunk_size (int): Number of samples in each chunk. The last chunk of a finite acquisition can have fewer.
+            queue_size (int): Maximum number of chunks fetched ahead of the caller.
+            timeout (float): Maximum time, in seconds, to wait for the samples of each chunk to be acquired.
+        '''
+        return _streaming.stream_waveform(self, chunk_size, queue_size, timeout)
+
     def _close(self):
         '''_close
 
         Closes the specified session and deallocates resources that it reserved.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niDMM_close(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2080,9 +2702,10 @@ class Session(_SessionBase):
         to the instrument. The initialization commands set instrument settings
         to the state necessary for the operation of the instrument driver.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niDMM_reset(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def self_test(self):
@@ -2123,11 +2746,12 @@ class Session(_SessionBase):
                 returned for a self-test failure is NIDMM_ERROR_SELF_TEST_FAILURE.
                 This error code indicates that the DMM should be repaired.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        self_test_result_ctype = visatype.ViInt16()  # case 13
+        vi_ctype = self._vi_ctype  # case 1
+        self_test_result_ctype = _scalar_ctypes.self_test_self_test_result  # case 13
         self_test_message_ctype = (visatype.ViChar * 256)()  # case 10
-        error_code = self._library.niDMM_self_test(vi_ctype, ctypes.pointer(self_test_result_ctype), self_test_message_ctype)
+        error_code = self._library.niDMM_self_test(vi_ctype, _scalar_ctypes.self_test_self_test_result_pointer, self_test_message_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return int(self_test_result_ctype.value), self_test_message_ctype.value.decode(self._encoding)
 
 
@@ -0,0 +1,388 @@
+# This file was generated
+'''Simulated NI-DMM runtime, for testing and benchmarking without hardware.'''
+
+from nidmm import _simulation
+
+
+# (name, direction, type, is_buffer, size mechanism, index of the size parameter, default value) of every parameter of every function
+_functions = {
+    'niDMM_Abort': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niDMM_ConfigureACBandwidth': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('acMinimumFrequencyHz', 'in', 'ViReal64', False, None, None, None),
+        ('acMaximumFrequencyHz', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_ConfigureMeasurementAbsolute': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('measurementFunction', 'in', 'ViInt32', False, None, None, 1),
+        ('Range', 'in', 'ViReal64', False, None, None, None),
+        ('resolutionAbsolute', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_ConfigureMeasurementDigits': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('measurementFunction', 'in', 'ViInt32', False, None, None, 1),
+        ('Range', 'in', 'ViReal64', False, None, None, None),
+        ('resolutionDigits', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_ConfigureMultiPoint': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('triggerCount', 'in', 'ViInt32', False, None, None, None),
+        ('sampleCount', 'in', 'ViInt32', False, None, None, None),
+        ('sampleTrigger', 'in', 'ViInt32', False, None, None, 1),
+        ('sampleInterval', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_ConfigureOpenCableCompValues': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Conductance', 'in', 'ViReal64', False, None, None, None),
+        ('Susceptance', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_ConfigurePowerLineFrequency': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('powerLineFrequencyHz', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_ConfigureRTDCustom': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('rtdA', 'in', 'ViReal64', False, None, None, None),
+        ('rtdB', 'in', 'ViReal64', False, None, None, None),
+        ('rtdC', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_ConfigureRTDType': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('rtdType', 'in', 'ViInt32', False, None, None, 0),
+        ('rtdResistance', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_ConfigureShortCableCompValues': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Resistance', 'in', 'ViReal64', False, None, None, None),
+        ('Reactance', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_ConfigureThermistorCustom': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('thermistorA', 'in', 'ViReal64', False, None, None, None),
+        ('thermistorB', 'in', 'ViReal64', False, None, None, None),
+        ('thermistorC', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_ConfigureThermocouple': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('thermocoupleType', 'in', 'ViInt32', False, None, None, 1),
+        ('referenceJunctionType', 'in', 'ViInt32', False, None, None, 2),
+    ),
+    'niDMM_ConfigureTrigger': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('triggerSource', 'in', 'ViInt32', False, None, None, 1),
+        ('triggerDelay', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_ConfigureWaveformAcquisition': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('measurementFunction', 'in', 'ViInt32', False, None, None, 1),
+        ('Range', 'in', 'ViReal64', False, None, None, None),
+        ('Rate', 'in', 'ViReal64', False, None, None, None),
+        ('waveformPoints', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niDMM_Disable': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niDMM_Fetch': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('maximumTime', 'in', 'ViInt32', False, None, None, None),
+        ('Reading', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_FetchMultiPoint': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('maximumTime', 'in', 'ViInt32', False, None, None, None),
+        ('arraySize', 'in', 'ViInt32', False, None, None, None),
+        ('readingArray', 'out', 'ViReal64', True, 'passed-in', 2, None),
+        ('actualNumberOfPoints', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niDMM_FetchWaveform': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('maximumTime', 'in', 'ViInt32', False, None, None, None),
+        ('arraySize', 'in', 'ViInt32', False, None, None, None),
+        ('waveformArray', 'out', 'ViReal64', True, 'passed-in', 2, None),
+        ('actualNumberOfPoints', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niDMM_GetApertureTimeInfo': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('apertureTime', 'out', 'ViReal64', False, None, None, None),
+        ('apertureTimeUnits', 'out', 'ViInt32', False, None, None, 0),
+    ),
+    'niDMM_GetAttributeViBoolean': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'out', 'ViBoolean', False, None, None, None),
+    ),
+    'niDMM_GetAttributeViInt32': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niDMM_GetAttributeViReal64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_GetAttributeViString': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('bufferSize', 'in', 'ViInt32', False, None, None, None),
+        ('attributeValue', 'out', 'ViChar', True, 'ivi-dance', 3, None),
+    ),
+    'niDMM_GetAutoRangeValue': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('actualRange', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_GetCalDateAndTime': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('calType', 'in', 'ViInt32', False, None, None, None),
+        ('Month', 'out', 'ViInt32', False, None, None, None),
+        ('Day', 'out', 'ViInt32', False, None, None, None),
+        ('Year', 'out', 'ViInt32', False, None, None, None),
+        ('Hour', 'out', 'ViInt32', False, None, None, None),
+        ('Minute', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niDMM_GetDevTemp': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Options', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Temperature', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_GetError': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('errorCode', 'out', 'ViStatus', False, None, None, None),
+        ('bufferSize', 'in', 'ViInt32', False, None, None, None),
+        ('Description', 'out', 'ViChar', True, 'ivi-dance', 2, None),
+    ),
+    'niDMM_GetLastCalTemp': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('calType', 'in', 'ViInt32', False, None, None, None),
+        ('Temperature', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_GetMeasurementPeriod': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Period', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_GetSelfCalSupported': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('selfCalSupported', 'out', 'ViBoolean', False, None, None, None),
+    ),
+    'niDMM_InitWithOptions': (
+        ('resourceName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('idQuery', 'in', 'ViBoolean', False, None, None, None),
+        ('resetDevice', 'in', 'ViBoolean', False, None, None, None),
+        ('optionString', 'in', 'ViChar', True, 'fixed', None, None),
+        ('vi', 'out', 'ViSession', False, None, None, None),
+    ),
+    'niDMM_Initiate': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niDMM_PerformOpenCableComp': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Conductance', 'out', 'ViReal64', False, None, None, None),
+        ('Susceptance', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_PerformShortCableComp': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Resistance', 'out', 'ViReal64', False, None, None, None),
+        ('Reactance', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_Read': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('maximumTime', 'in', 'ViInt32', False, None, None, None),
+        ('Reading', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_ReadMultiPoint': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('maximumTime', 'in', 'ViInt32', False, None, None, None),
+        ('arraySize', 'in', 'ViInt32', False, None, None, None),
+        ('readingArray', 'out', 'ViReal64', True, 'passed-in', 2, None),
+        ('actualNumberOfPoints', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niDMM_ReadStatus': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('acquisitionBacklog', 'out', 'ViInt32', False, None, None, None),
+        ('acquisitionStatus', 'out', 'ViInt16', False, None, None, 0),
+    ),
+    'niDMM_ReadWaveform': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('maximumTime', 'in', 'ViInt32', False, None, None, None),
+        ('arraySize', 'in', 'ViInt32', False, None, None, None),
+        ('waveformArray', 'out', 'ViReal64', True, 'passed-in', 2, None),
+        ('actualNumberOfPoints', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niDMM_ResetWithDefaults': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niDMM_SelfCal': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niDMM_SendSoftwareTrigger': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niDMM_SetAttributeViBoolean': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViBoolean', False, None, None, None),
+    ),
+    'niDMM_SetAttributeViInt32': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niDMM_SetAttributeViReal64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niDMM_SetAttributeViString': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niDMM_close': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niDMM_error_message': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('errorCode', 'in', 'ViStatus', False, None, None, None),
+        ('errorMessage', 'out', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niDMM_reset': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niDMM_self_test': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('selfTestResult', 'out', 'ViInt16', False, None, None, None),
+        ('selfTestMessage', 'out', 'ViChar', True, 'fixed', None, None),
+    ),
+}
+
+# Value of every attribute until it is set
+_attributes = {
+    1050002: False,  # RANGE_CHECK
+    1050003: False,  # QUERY_INSTRUMENT_STATUS
+    1050004: False,  # CACHE
+    1050005: False,  # SIMULATE
+    1050006: False,  # RECORD_COERCIONS
+    1050007: '',  # DRIVER_SETUP
+    1050021: False,  # INTERCHANGE_CHECK
+    1050101: 0,  # PRIMARY_ERROR
+    1050102: 0,  # SECONDARY_ERROR
+    1050103: '',  # ERROR_ELABORATION
+    1050203: 0,  # CHANNEL_COUNT
+    1050302: '',  # SPECIFIC_DRIVER_PREFIX
+    1050304: '',  # IO_RESOURCE_DESCRIPTOR
+    1050305: '',  # LOGICAL_NAME
+    1050327: '',  # SUPPORTED_INSTRUMENT_MODELS
+    1050401: '',  # GROUP_CAPABILITIES
+    1050501: 0,  # ENGINE_MAJOR_VERSION
+    1050502: 0,  # ENGINE_MINOR_VERSION
+    1050503: 0,  # SPECIFIC_DRIVER_MAJOR_VERSION
+    1050504: 0,  # SPECIFIC_DRIVER_MINOR_VERSION
+    1050510: '',  # INSTRUMENT_FIRMWARE_REVISION
+    1050511: '',  # INSTRUMENT_MANUFACTURER
+    1050512: '',  # INSTRUMENT_MODEL
+    1050513: '',  # SPECIFIC_DRIVER_VENDOR
+    1050514: '',  # SPECIFIC_DRIVER_DESCRIPTION
+    1050515: 0,  # SPECIFIC_DRIVER_CLASS_SPEC_MAJOR_VERSION
+    1050516: 0,  # SPECIFIC_DRIVER_CLASS_SPEC_MINOR_VERSION
+    1050551: '',  # SPECIFIC_DRIVER_REVISION
+    1050553: '',  # ENGINE_REVISION
+    1150001: '',  # IDQUERY_RESPONSE
+    1150002: 0,  # MEAS_DEST_SLOPE
+    1150003: 0.0,  # SHUNT_VALUE
+    1150010: 0,  # SAMPLE_TRIGGER_SLOPE
+    1150014: 0,  # OPERATION_MODE
+    1150018: 0.0,  # WAVEFORM_RATE
+    1150019: 0,  # WAVEFORM_POINTS
+    1150022: -1,  # ADC_CALIBRATION
+    1150023: 0,  # OFFSET_COMP_OHMS
+    1150025: 1e-06,  # CURRENT_SOURCE
+    1150026: -1,  # DC_NOISE_REJECTION
+    1150027: 0,  # WAVEFORM_COUPLING
+    1150028: 0.0,  # SETTLE_TIME
+    1150029: 1000000.0,  # INPUT_RESISTANCE
+    1150031: 0,  # SAMPLE_DELAY_MODE
+    1150032: 0,  # NUMBER_OF_AVERAGES
+    1150034: 0,  # LATENCY
+    1150037: 0,  # BUFFER_SIZE
+    1150044: 0.0,  # FREQUENCY_VOLTAGE_AUTO_RANGE_VALUE
+    1150045: 0,  # CABLE_COMP_TYPE
+    1150046: 0.0,  # SHORT_CABLE_COMP_REACTANCE
+    1150047: 0.0,  # SHORT_CABLE_COMP_RESISTANCE
+    1150048: 0.0,  # OPEN_CABLE_COMP_SUSCEPTANCE
+    1150049: 0.0,  # OPEN_CABLE_COMP_CONDUCTANCE
+    1150052: -1,  # LC_CALCULATION_MODEL
+    1150053: 0,  # DC_BIAS
+    1150054: '',  # SERIAL_NUMBER
+    1150055: 0,  # LC_NUMBER_MEAS_TO_AVERAGE
+    1150061: 0,  # INSTRUMENT_PRODUCT_ID
+    1150120: 0,  # TEMP_RTD_TYPE
+    1150121: 0.0,  # TEMP_RTD_A
+    1150122: 0.0,  # TEMP_RTD_B
+    1150123: 0.0,  # TEMP_RTD_C
+    1150124: 0,  # TEMP_THERMISTOR_TYPE
+    1150125: 0.0,  # TEMP_THERMISTOR_A
+    1150126: 0.0,  # TEMP_THERMISTOR_B
+    1150127: 0.0,  # TEMP_THERMISTOR_C
+    1250001: 1,  # FUNCTION
+    1250002: 0.0,  # RANGE
+    1250003: 3.5,  # RESOLUTION_DIGITS
+    1250004: 1,  # TRIGGER_SOURCE
+    1250005: 0.0,  # TRIGGER_DELAY
+    1250006: 0.0,  # AC_MIN_FREQ
+    1250007: 0.0,  # AC_MAX_FREQ
+    1250008: 0.0,  # RESOLUTION_ABSOLUTE
+    1250101: 0.0,  # FREQ_VOLTAGE_RANGE
+    1250201: 1,  # TEMP_TRANSDUCER_TYPE
+    1250231: 1,  # TEMP_TC_TYPE
+    1250232: 2,  # TEMP_TC_REF_JUNC_TYPE
+    1250233: 0.0,  # TEMP_TC_FIXED_REF_JUNC
+    1250242: 0.0,  # TEMP_RTD_RES
+    1250301: 0,  # SAMPLE_COUNT
+    1250302: 1,  # SAMPLE_TRIGGER
+    1250303: 0.0,  # SAMPLE_INTERVAL
+    1250304: 0,  # TRIGGER_COUNT
+    1250305: -1,  # MEAS_COMPLETE_DEST
+    1250321: 0.0,  # APERTURE_TIME
+    1250322: 0,  # APERTURE_TIME_UNITS
+    1250331: 0.0,  # AUTO_RANGE_VALUE
+    1250332: -1,  # AUTO_ZERO
+    1250333: 50.0,  # POWERLINE_FREQ
+    1250334: 0,  # TRIGGER_SLOPE
+}
+
+# Values returned in output parameters, by function and parameter name. Output buffers that are not listed are
+# filled with synthetic data, and output counts (i.e. actualNumberOfPoints) return the number of elements written.
+_output_values = {
+}
+
+
+class Simulator(_simulation.SimulatedLibrary):
+    '''Simulator
+
+    Pure-Python stand-in for the NI-DMM runtime. It keeps the value of attributes for each session and fills
+    output buffers with synthetic data. Pass an instance to library_singleton.set_backend() before creating sessions:
+
+        import nidmm.simulator
+        nidmm.library_singleton.set_backend(nidmm.simulator.Simulator(latency=0.0001))
+
+    Args:
+        latency (float): Time, in seconds, that every function call sleeps for. Can be changed at any time.
+        array_size (int): Number of elements of output buffers that the driver sizes, i.e. with the IVI-dance
+        attribute_values (dict): Value of attributes, by attribute ID, until they are set
+        output_values (dict): Values returned in output parameters, by C function name without the prefix and
+            parameter name, i.e. {'ReadMultiPoint': {'readingArray': 1.5}}. A single value fills a whole buffer, and
+            a dict of field values fills every structure of a buffer of structures.
+    '''
+
+    def __init__(self, latency=0.0, array_size=1000, attribute_values=None, output_values=None):
+        super(Simulator, self).__init__('niDMM_', _functions, _attributes, _output_values, latency, array_size, attribute_values, output_values)
@@ -1,12 +1,49 @@
 #!/usr/bin/python
 # This file was generated
 
-from nifake.enums import *          # noqa: F403,F401,H303
-from nifake.errors import Error     # noqa: F401
-from nifake.errors import NifakeWarning   # noqa: F401
-from nifake.session import Session  # noqa: F401
-
-from nifake.custom_struct import CustomStruct  # noqa: F401
+import sys
 
+# Importing custom_struct later would replace the ctypes type of the same name in the package with the module
 from nifake.custom_struct import custom_struct  # noqa: F401
 
+# Modules are imported when one of their names is first used, so that importing the package is fast
+_lazy_names = {
+    'Color': 'enums',
+    'CustomStruct': 'custom_struct',
+    'Error': 'errors',
+    'FloatEnum': 'enums',
+    'NifakeWarning': 'errors',
+    'Session': 'session',
+    'Turtle': 'enums',
+    'custom_struct': 'custom_struct',
+}
+
+__all__ = sorted(_lazy_names)
+
+if sys.version_info >= (3, 7):
+    import importlib
+    import importlib.util
+
+    def __getattr__(name):
+        if name in _lazy_names:
+            submodule = importlib.import_module('nifake.' + _lazy_names[name])
+            # Next time, all the names of the module are found without calling __getattr__. This also replaces the
+            # module in the package with the name it exports, when they are the same.
+            for n in _lazy_names:
+                if _lazy_names[n] == _lazy_names[name]:
+                    globals()[n] = getattr(submodule, n)
+            return globals()[name]
+        # Modules of the package are attributes of it once imported, as they were when the package imported them all
+        if not name.startswith('__') and importlib.util.find_spec('nifake.' + name) is not None:
+            return importlib.import_module('nifake.' + name)
+        raise AttributeError("module 'nifake' has no attribute '{0}'".format(name))
+
+    def __dir__():
+        return sorted(set(globals()) | set(_lazy_names))
+else:
+    # Module __getattr__ needs Python 3.7
+    from nifake.enums import *          # noqa: F403,F401,H303
+    from nifake.errors import Error     # noqa: F401
+    from nifake.errors import NifakeWarning   # noqa: F401
+    from nifake.session import Session  # noqa: F401
+    from nifake.custom_struct import CustomStruct  # noqa: F401
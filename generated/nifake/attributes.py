@@ -1,68 +1,132 @@
 # -*- coding: utf-8 -*-
 # This file was generated
+import collections
+import ctypes
+
+from nifake import enums
+from nifake import errors
+from nifake import visatype
+
+
+class AttributeCache(object):
+    '''Values of the attributes of a session, by attribute ID and repeated capability.
+
+    Shared by a session and all its repeated capabilities. Disabled until the session enables it. generation counts how
+    many times it was cleared, so that others can tell when the values of attributes may have changed.
+    '''
+
+    def __init__(self):
+        self.enabled = False
+        self.values = {}
+        self.generation = 0
+
+    def clear(self):
+        self.values.clear()
+        self.generation += 1
 
 
 class Attribute(object):
     '''Base class for all typed attributes.'''
 
-    def __init__(self, attribute_id):
+    def __init__(self, attribute_id, volatile=False):
         self._attribute_id = attribute_id
+        self._volatile = volatile
+
+    def _convert(self, value):
+        '''Returns value as the type that the getter returns, so the cache returns the same thing the driver would'''
+        return value
+
+    def _get(self, session, getter):
+        cache = session._attribute_cache
+        if not cache.enabled or self._volatile:
+            return getter(self._attribute_id)
+        values = cache.values.get(self._attribute_id)
+        if values is not None and session._repeated_capability in values:
+            return values[session._repeated_capability]
+        value = getter(self._attribute_id)
+        cache.values.setdefault(self._attribute_id, {})[session._repeated_capability] = value
+        return value
+
+    def _set(self, session, setter, value):
+        setter(self._attribute_id, value)
+        cache = session._attribute_cache
+        if cache.enabled and not self._volatile:
+            # Write-through. Values cached for other repeated capabilities are dropped, since they may overlap
+            cache.values[self._attribute_id] = {session._repeated_capability: self._convert(value)}
 
 
 class AttributeViInt32(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_int32(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_int32)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_int32(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_int32, value)
+
+    def _convert(self, value):
+        return int(value)
 
 
 class AttributeViInt64(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_int64(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_int64)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_int64(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_int64, value)
+
+    def _convert(self, value):
+        return int(value)
 
 
 class AttributeViReal64(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_real64(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_real64)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_real64(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_real64, value)
+
+    def _convert(self, value):
+        return float(value)
 
 
 class AttributeViString(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_string(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_string)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_string(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_string, value)
 
 
 class AttributeViBoolean(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_boolean(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_boolean)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_boolean(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_boolean, value)
+
+    def _convert(self, value):
+        return bool(value)
 
 
 class AttributeEnum(object):
 
-    def __init__(self, underlying_attribute_meta_class, enum_meta_class, attribute_id):
-        self._underlying_attribute = underlying_attribute_meta_class(attribute_id)
+    def __init__(self, underlying_attribute_meta_class, enum_meta_class, attribute_id, volatile=False):
+        self._underlying_attribute = underlying_attribute_meta_class(attribute_id, volatile)
         self._attribute_type = enum_meta_class
         self._attribute_id = attribute_id
+        self._members_by_value = enums._members_by_value[enum_meta_class]
 
     def __get__(self, session, session_type):
-        return self._attribute_type(self._underlying_attribute.__get__(session, session_type))
+        value = self._underlying_attribute.__get__(session, session_type)
+        try:
+            return self._members_by_value[value]
+        except KeyError:
+            # Raises ValueError, as the enum does for values it doesn't have
+            return self._attribute_type(value)
 
     def __set__(self, session, value):
         if type(value) is not self._attribute_type:
@@ -70,3 +134,126 @@ class AttributeEnum(object):
         return self._underlying_attribute.__set__(session, value.value)
 
 
+# (attribute_id, python_name, type, enum, channel_based, access, volatile) of an attribute. enum is the enum class or None,
+# channel_based is True if it can be used with repeated capabilities, and access is 'read-write', 'read only' or 'write only'.
+AttributeInfo = collections.namedtuple('AttributeInfo', ['attribute_id', 'python_name', 'type', 'enum', 'channel_based', 'access', 'volatile'])
+
+# Every attribute of NI-FAKE, by attribute ID
+index = {
+    1000000: AttributeInfo(1000000, 'read_write_bool', 'ViBoolean', None, False, 'read-write', False),
+    1000001: AttributeInfo(1000001, 'read_write_double', 'ViReal64', None, False, 'read-write', False),
+    1000002: AttributeInfo(1000002, 'read_write_string', 'ViString', None, False, 'read-write', False),
+    1000003: AttributeInfo(1000003, 'read_write_color', 'ViInt32', enums.Color, False, 'read-write', False),
+    1000004: AttributeInfo(1000004, 'read_write_integer', 'ViInt32', None, False, 'read-write', False),
+    1000005: AttributeInfo(1000005, 'float_enum', 'ViReal64', enums.FloatEnum, False, 'read-write', False),
+    1000006: AttributeInfo(1000006, 'read_write_int64', 'ViInt64', None, False, 'read-write', True),
+}
+
+# Every attribute of NI-FAKE, by python_name
+index_by_name = dict((a.python_name, a) for a in index.values())
+
+# ctypes type and conversion of the attribute types that _BulkAccessor can get and set
+_bulk_types = {
+    'ViBoolean': (visatype.ViBoolean, bool),
+    'ViInt32': (visatype.ViInt32, int),
+    'ViInt64': (visatype.ViInt64, int),
+    'ViReal64': (visatype.ViReal64, float),
+}
+
+# Session methods that get and set the attribute types that _BulkAccessor can't
+_accessor_methods = {
+    'ViString': ('_get_attribute_vi_string', '_set_attribute_vi_string'),
+}
+
+
+class _BulkAccessor(object):
+    '''Gets and sets attributes of one type, reusing the same ctypes objects for all of them'''
+
+    def __init__(self, session, attribute_type):
+        ctype, self.convert = _bulk_types[attribute_type]
+        self._session = session
+        self._get_function = getattr(session._library, 'niFake_GetAttribute' + attribute_type)
+        self._set_function = getattr(session._library, 'niFake_SetAttribute' + attribute_type)
+        self._vi_ctype = visatype.ViSession(session._vi)
+        self._attribute_id_ctype = visatype.ViAttr()
+        self._value_ctype = ctype()
+        self._value_reference = ctypes.pointer(self._value_ctype)
+
+    def get(self, attribute_id):
+        self._attribute_id_ctype.value = attribute_id
+        error_code = self._get_function(self._vi_ctype, self._session._repeated_capability_ctype, self._attribute_id_ctype, self._value_reference)
+        errors.handle_error(self._session, error_code, ignore_warnings=False, is_error_handling=False)
+        return self.convert(self._value_ctype.value)
+
+    def set(self, attribute_id, value):
+        self._attribute_id_ctype.value = attribute_id
+        self._value_ctype.value = value
+        error_code = self._set_function(self._vi_ctype, self._session._repeated_capability_ctype, self._attribute_id_ctype, self._value_ctype)
+        errors.handle_error(self._session, error_code, ignore_warnings=False, is_error_handling=False)
+
+
+class _MethodAccessor(object):
+    '''Gets and sets attributes of one type through the session methods, i.e. for strings'''
+
+    def __init__(self, session, attribute_type):
+        get_method, set_method = _accessor_methods[attribute_type]
+        self.get = getattr(session, get_method)
+        self.set = getattr(session, set_method)
+
+    def convert(self, value):
+        return value
+
+
+def _get_accessor(session, accessors, attribute_type):
+    accessor = accessors.get(attribute_type)
+    if accessor is None:
+        accessor = _BulkAccessor(session, attribute_type) if attribute_type in _bulk_types else _MethodAccessor(session, attribute_type)
+        accessors[attribute_type] = accessor
+    return accessor
+
+
+def get_values(session, infos, skip_errors=False):
+    '''Returns an OrderedDict of the values of the attributes in infos, by python_name
+
+    Uses and updates the attribute cache the same way the properties do. If skip_errors is True, attributes that the
+    driver returns an error for are left out instead of raising.
+    '''
+    cache = session._attribute_cache
+    repeated_capability = session._repeated_capability
+    accessors = {}
+    values = collections.OrderedDict()
+    for info in infos:
+        use_cache = cache.enabled and not info.volatile
+        cached = cache.values.get(info.attribute_id) if use_cache else None
+        if cached is not None and repeated_capability in cached:
+            value = cached[repeated_capability]
+        else:
+            try:
+                value = _get_accessor(session, accessors, info.type).get(info.attribute_id)
+            except errors.Error:
+                if skip_errors:
+                    continue
+                raise
+            if use_cache:
+                cache.values.setdefault(info.attribute_id, {})[repeated_capability] = value
+        values[info.python_name] = value if info.enum is None else enums._get_member(info.enum, value)
+    return values
+
+
+def set_values(session, infos_and_values):
+    '''Sets attributes from (info, value) pairs, in order
+
+    Values of enum attributes must be members of their enum. Updates the attribute cache the same way the properties do.
+    '''
+    cache = session._attribute_cache
+    accessors = {}
+    for info, value in infos_and_values:
+        if info.enum is not None:
+            if type(value) is not info.enum:
+                raise TypeError('{0} must be {1} not {2}'.format(info.python_name, info.enum.__name__, type(value).__name__))
+            value = value.value
+        accessor = _get_accessor(session, accessors, info.type)
+        accessor.set(info.attribute_id, value)
+        if cache.enabled and not info.volatile:
+            cache.values[info.attribute_id] = {session._repeated_capability: accessor.convert(value)}
+
@@ -1,3 +1,4 @@
+# -*- coding: utf-8 -*-
 # This file was generated
 
 from enum import Enum
@@ -62,3 +63,20 @@ class Turtle(Enum):
     '''
     Owns nunchucks.
     '''
+
+
+# Members of each enum by value. Looking a value from the driver up in these is much faster than calling the enum with it.
+_members_by_value = {
+    Color: dict((member.value, member) for member in Color),
+    FloatEnum: dict((member.value, member) for member in FloatEnum),
+    Turtle: dict((member.value, member) for member in Turtle),
+}
+
+
+def _get_member(enum_type, value):
+    '''Returns the member of enum_type that has value, like enum_type(value)'''
+    try:
+        return _members_by_value[enum_type][value]
+    except KeyError:
+        # Raises ValueError, as the enum does for values it doesn't have
+        return enum_type(value)
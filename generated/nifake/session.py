@@ -1,14 +1,164 @@
 # -*- coding: utf-8 -*-
 # This file was generated
+import collections
 import ctypes
+import importlib
+import threading
 
+from nifake import _converters  # noqa: F401
 from nifake import attributes
+from nifake import call_stats
 from nifake import enums
 from nifake import errors
 from nifake import library_singleton
 from nifake import visatype
 
-from nifake import custom_struct  # noqa: F401
+# Not imported from the package, where custom_struct is the ctypes type of the same name once it has been used
+custom_struct = importlib.import_module('nifake.custom_struct')
+
+# Size of the buffer that string IVI-dance methods try first, until they know the size they need
+_DEFAULT_IVI_DANCE_BUFFER_SIZE = 256
+
+# Size of the buffer that each string IVI-dance method needed last time, by C function name (and attribute ID). Shared
+# by all sessions.
+_ivi_dance_buffer_sizes = {}
+
+# Messages of the most recently used error and warning codes, from _error_message(). Shared by all sessions.
+_MAX_ERROR_MESSAGES = 64
+_error_messages = collections.OrderedDict()
+_error_messages_lock = threading.Lock()
+
+
+class _ScalarCtypes(threading.local):
+    '''ctypes objects for the scalar parameters of driver functions, which methods reuse instead of creating new ones on every call
+
+    Each thread has its own, so that calls on different threads don't share them.
+    '''
+
+    def __init__(self):
+        self.EnumInputFunctionWithDefaults_a_turtle = visatype.ViInt16()
+        self.GetABoolean_a_boolean = visatype.ViBoolean()
+        self.GetABoolean_a_boolean_pointer = ctypes.pointer(self.GetABoolean_a_boolean)
+        self.GetANumber_a_number = visatype.ViInt16()
+        self.GetANumber_a_number_pointer = ctypes.pointer(self.GetANumber_a_number)
+        self.GetAttributeViBoolean_attribute_id = visatype.ViAttr()
+        self.GetAttributeViBoolean_attribute_value = visatype.ViBoolean()
+        self.GetAttributeViBoolean_attribute_value_pointer = ctypes.pointer(self.GetAttributeViBoolean_attribute_value)
+        self.GetAttributeViInt32_attribute_id = visatype.ViAttr()
+        self.GetAttributeViInt32_attribute_value = visatype.ViInt32()
+        self.GetAttributeViInt32_attribute_value_pointer = ctypes.pointer(self.GetAttributeViInt32_attribute_value)
+        self.GetAttributeViInt64_attribute_id = visatype.ViAttr()
+        self.GetAttributeViInt64_attribute_value = visatype.ViInt64()
+        self.GetAttributeViInt64_attribute_value_pointer = ctypes.pointer(self.GetAttributeViInt64_attribute_value)
+        self.GetAttributeViReal64_attribute_id = visatype.ViAttr()
+        self.GetAttributeViReal64_attribute_value = visatype.ViReal64()
+        self.GetAttributeViReal64_attribute_value_pointer = ctypes.pointer(self.GetAttributeViReal64_attribute_value)
+        self.GetAttributeViString_attribute_id = visatype.ViAttr()
+        self.GetEnumValue_a_quantity = visatype.ViInt32()
+        self.GetEnumValue_a_quantity_pointer = ctypes.pointer(self.GetEnumValue_a_quantity)
+        self.GetEnumValue_a_turtle = visatype.ViInt16()
+        self.GetEnumValue_a_turtle_pointer = ctypes.pointer(self.GetEnumValue_a_turtle)
+        self.GetError_error_code = visatype.ViStatus()
+        self.GetError_error_code_pointer = ctypes.pointer(self.GetError_error_code)
+        self.InitWithOptions_id_query = visatype.ViBoolean()
+        self.InitWithOptions_reset_device = visatype.ViBoolean()
+        self.InitWithOptions_vi = visatype.ViSession()
+        self.InitWithOptions_vi_pointer = ctypes.pointer(self.InitWithOptions_vi)
+        self.OneInputFunction_a_number = visatype.ViInt32()
+        self.ParametersAreMultipleTypes_a_boolean = visatype.ViBoolean()
+        self.ParametersAreMultipleTypes_a_float = visatype.ViReal64()
+        self.ParametersAreMultipleTypes_a_float_enum = visatype.ViReal64()
+        self.ParametersAreMultipleTypes_an_int32 = visatype.ViInt32()
+        self.ParametersAreMultipleTypes_an_int64 = visatype.ViInt64()
+        self.ParametersAreMultipleTypes_an_int_enum = visatype.ViInt16()
+        self.ReadFromChannel_maximum_time = visatype.ViInt32()
+        self.ReadFromChannel_reading = visatype.ViReal64()
+        self.ReadFromChannel_reading_pointer = ctypes.pointer(self.ReadFromChannel_reading)
+        self.ReadMultiPoint_actual_number_of_points = visatype.ViInt32()
+        self.ReadMultiPoint_actual_number_of_points_pointer = ctypes.pointer(self.ReadMultiPoint_actual_number_of_points)
+        self.ReadMultiPoint_maximum_time = visatype.ViInt32()
+        self.Read_maximum_time = visatype.ViInt32()
+        self.Read_reading = visatype.ViReal64()
+        self.Read_reading_pointer = ctypes.pointer(self.Read_reading)
+        self.ReturnANumberAndAString_a_number = visatype.ViInt16()
+        self.ReturnANumberAndAString_a_number_pointer = ctypes.pointer(self.ReturnANumberAndAString_a_number)
+        self.ReturnMultipleTypes_a_boolean = visatype.ViBoolean()
+        self.ReturnMultipleTypes_a_boolean_pointer = ctypes.pointer(self.ReturnMultipleTypes_a_boolean)
+        self.ReturnMultipleTypes_a_float = visatype.ViReal64()
+        self.ReturnMultipleTypes_a_float_pointer = ctypes.pointer(self.ReturnMultipleTypes_a_float)
+        self.ReturnMultipleTypes_a_float_enum = visatype.ViReal64()
+        self.ReturnMultipleTypes_a_float_enum_pointer = ctypes.pointer(self.ReturnMultipleTypes_a_float_enum)
+        self.ReturnMultipleTypes_an_int32 = visatype.ViInt32()
+        self.ReturnMultipleTypes_an_int32_pointer = ctypes.pointer(self.ReturnMultipleTypes_an_int32)
+        self.ReturnMultipleTypes_an_int64 = visatype.ViInt64()
+        self.ReturnMultipleTypes_an_int64_pointer = ctypes.pointer(self.ReturnMultipleTypes_an_int64)
+        self.ReturnMultipleTypes_an_int_enum = visatype.ViInt16()
+        self.ReturnMultipleTypes_an_int_enum_pointer = ctypes.pointer(self.ReturnMultipleTypes_an_int_enum)
+        self.SetAttributeViBoolean_attribute_id = visatype.ViAttr()
+        self.SetAttributeViBoolean_attribute_value = visatype.ViBoolean()
+        self.SetAttributeViInt32_attribute_id = visatype.ViAttr()
+        self.SetAttributeViInt32_attribute_value = visatype.ViInt32()
+        self.SetAttributeViInt64_attribute_id = visatype.ViAttr()
+        self.SetAttributeViInt64_attribute_value = visatype.ViInt64()
+        self.SetAttributeViReal64_attribute_id = visatype.ViAttr()
+        self.SetAttributeViReal64_attribute_value = visatype.ViReal64()
+        self.SetAttributeViString_attribute_id = visatype.ViAttr()
+        self.TwoInputFunction_a_number = visatype.ViReal64()
+        self.TwoInputFunction_a_string = visatype.ViChar()
+        self.Use64BitNumber_input = visatype.ViInt64()
+        self.Use64BitNumber_output = visatype.ViInt64()
+        self.Use64BitNumber_output_pointer = ctypes.pointer(self.Use64BitNumber_output)
+        self.error_message_error_code = visatype.ViStatus()
+
+
+_scalar_ctypes = _ScalarCtypes()
+
+# C function that each method calls, for call_stats
+_c_functions = {
+    '_abort': 'niFake_Abort',
+    '_close': 'niFake_close',
+    '_error_message': 'niFake_error_message',
+    '_get_attribute_vi_boolean': 'niFake_GetAttributeViBoolean',
+    '_get_attribute_vi_int32': 'niFake_GetAttributeViInt32',
+    '_get_attribute_vi_int64': 'niFake_GetAttributeViInt64',
+    '_get_attribute_vi_real64': 'niFake_GetAttributeViReal64',
+    '_get_attribute_vi_string': 'niFake_GetAttributeViString',
+    '_get_error': 'niFake_GetError',
+    '_init_with_options': 'niFake_InitWithOptions',
+    '_initiate': 'niFake_Initiate',
+    '_set_attribute_vi_boolean': 'niFake_SetAttributeViBoolean',
+    '_set_attribute_vi_int32': 'niFake_SetAttributeViInt32',
+    '_set_attribute_vi_int64': 'niFake_SetAttributeViInt64',
+    '_set_attribute_vi_real64': 'niFake_SetAttributeViReal64',
+    '_set_attribute_vi_string': 'niFake_SetAttributeViString',
+    'array_input_function': 'niFake_ArrayInputFunction',
+    'bool_array_output_function': 'niFake_BoolArrayOutputFunction',
+    'enum_array_output_function': 'niFake_EnumArrayOutputFunction',
+    'enum_input_function_with_defaults': 'niFake_EnumInputFunctionWithDefaults',
+    'get_a_boolean': 'niFake_GetABoolean',
+    'get_a_number': 'niFake_GetANumber',
+    'get_a_string_of_fixed_maximum_size': 'niFake_GetAStringOfFixedMaximumSize',
+    'get_an_ivi_dance_string': 'niFake_GetAnIviDanceString',
+    'get_array_using_ivi_dance': 'niFake_GetArrayUsingIVIDance',
+    'get_custom_type': 'niFake_GetCustomType',
+    'get_enum_value': 'niFake_GetEnumValue',
+    'multiple_array_types': 'niFake_MultipleArrayTypes',
+    'one_input_function': 'niFake_OneInputFunction',
+    'parameters_are_multiple_types': 'niFake_ParametersAreMultipleTypes',
+    'read': 'niFake_Read',
+    'read_from_channel': 'niFake_ReadFromChannel',
+    'read_multi_point': 'niFake_ReadMultiPoint',
+    'read_multi_point_into': 'niFake_ReadMultiPoint',
+    'return_a_number_and_a_string': 'niFake_ReturnANumberAndAString',
+    'return_multiple_types': 'niFake_ReturnMultipleTypes',
+    'set_custom_type': 'niFake_SetCustomType',
+    'simple_function': 'niFake_SimpleFunction',
+    'two_input_function': 'niFake_TwoInputFunction',
+    'use64_bit_number': 'niFake_Use64BitNumber',
+}
+
+# Maximum number of repeated capability views (i.e. session['0']) that a session keeps to return again
+_MAX_REPEATED_CAPABILITY_VIEWS = 256
 
 
 class _Acquisition(object):
@@ -45,7 +195,7 @@ class _SessionBase(object):
     '''
     An attribute of type float with read/write access.
     '''
-    read_write_int64 = attributes.AttributeViInt64(1000006)
+    read_write_int64 = attributes.AttributeViInt64(1000006, volatile=True)
     '''
     An attribute of type 64-bit integer with read/write access.
     '''
@@ -58,26 +208,129 @@ class _SessionBase(object):
     An attribute of type string with read/write access.
     '''
 
-    def __init__(self, repeated_capability):
-        self._library = library_singleton.get()
+    def __init__(self, repeated_capability, attribute_cache, library, warning_policy, session_stats):
+        self._library = library
         self._repeated_capability = repeated_capability
+        self._attribute_cache = attribute_cache
+        self._warning_policy = warning_policy
+        self._session_stats = session_stats
         self._encoding = 'windows-1251'
+        # The driver does not modify it, so every call can pass the same buffer
+        self._repeated_capability_ctype = ctypes.create_string_buffer(repeated_capability.encode(self._encoding))
+        session_stats._add_session(self)
 
     def __setattr__(self, key, value):
-        if self._is_frozen and key not in dir(self):
+        if self._is_frozen and key not in self._get_attribute_names() and key not in self.__dict__:
             raise AttributeError("'{0}' object has no attribute '{1}'".format(type(self).__name__, key))
         object.__setattr__(self, key, value)
 
+    @property
+    def warning_policy(self):
+        '''warning_policy
+
+        How the session, and its repeated capabilities, report warnings from the driver. Change its mode to warn only
+        once per code, at most once per interval, or only count warnings:
+
+            session.warning_policy.mode = 'count'
+            ...
+            print(session.warning_policy.counts)
+
+        See errors.WarningPolicy.
+        '''
+        return self._warning_policy
+
+    @classmethod
+    def _get_attribute_names(cls):
+        '''_get_attribute_names
+
+        Returns a frozenset of the names of the properties and methods of the class, which can be set once the session
+        is frozen. It is computed once per class, because dir() is too slow to call every time a property is set.
+        '''
+        names = cls.__dict__.get('_attribute_names')
+        if names is None:
+            names = frozenset(dir(cls))
+            cls._attribute_names = names
+        return names
+
+    def _get_attribute_info(self, name_or_id):
+        try:
+            # type(u'') is unicode on Python 2
+            if isinstance(name_or_id, (str, type(u''))):
+                return attributes.index_by_name[name_or_id]
+            return attributes.index[name_or_id]
+        except KeyError:
+            raise ValueError('{0!r} is not an attribute of NI-FAKE'.format(name_or_id))
+
+    def get_attributes(self, names_or_ids, channels=None):
+        '''get_attributes
+
+        Gets the values of many attributes in one call. It creates the ctypes objects once for each type of attribute,
+        instead of once for each attribute like the properties do.
+
+        Args:
+            names_or_ids (list of str or int): Python names (i.e. 'float_enum') or IDs of the attributes
+
+            channels (str): Repeated capabilities (usually channels) to get the attributes for. If not specified, uses the
+                ones of this object, like the properties do.
+
+        Returns:
+            values (collections.OrderedDict): Value of each attribute, by Python name, in the same order as names_or_ids
+        '''
+        session = self if channels is None else _RepeatedCapability(self._vi, channels, self._attribute_cache, self._library, self._warning_policy, self._session_stats)
+        return attributes.get_values(session, [self._get_attribute_info(a) for a in names_or_ids])
+
+    def snapshot(self):
+        '''snapshot
+
+        Gets the values of all the read-write attributes, to restore them later with apply(). Attributes that the driver
+        returns an error for (i.e. not supported by the device) and volatile attributes are left out.
+
+        Use it on a repeated capability (i.e. session['0'].snapshot()) to get the values of specific channels.
+
+        Returns:
+            values (collections.OrderedDict): Value of each attribute, by Python name
+        '''
+        infos = [a for a in sorted(attributes.index.values()) if a.access == 'read-write' and not a.volatile]
+        return attributes.get_values(self, infos, skip_errors=True)
+
+    def apply(self, values):
+        '''apply
+
+        Sets many attributes, i.e. from snapshot(), in order. It first gets the values of the attributes, and only sets
+        the ones that are different.
+
+        Args:
+            values (dict): Value of each attribute, by Python name or ID. Values of enum attributes must be members of
+                their enum.
+
+        Returns:
+            names (list of str): Python names of the attributes that were set
+        '''
+        infos_and_values = [(self._get_attribute_info(a), v) for a, v in values.items()]
+        current_values = attributes.get_values(self, [info for info, _ in infos_and_values if info.access != 'write only'], skip_errors=True)
+        changes = [(info, v) for info, v in infos_and_values if info.python_name not in current_values or current_values[info.python_name] != v]
+        attributes.set_values(self, changes)
+        return [info.python_name for info, _ in changes]
+
+    def _set_attributes(self, values):
+        '''Sets attributes from (Python name or ID, value) pairs, in order, without getting them first like apply() does'''
+        attributes.set_values(self, [(self._get_attribute_info(a), v) for a, v in values])
+
     def _get_error_description(self, error_code):
         '''_get_error_description
 
         Returns the error description.
+
+        errors retrieves descriptions only when they are used, when the last error of the session may be another one.
+        Those get the message for their code instead.
         '''
-        try:
-            _, error_string = self._get_error()
-            return error_string
-        except errors.Error:
-            pass
+        if error_code < 0:
+            try:
+                last_error_code, error_string = self._get_error()
+                if last_error_code == error_code:
+                    return error_string
+            except errors.Error:
+                pass
 
         try:
             '''
@@ -85,11 +338,27 @@ class _SessionBase(object):
             (IVI spec requires GetError to fail).
             Use _error_message instead. It doesn't require a session.
             '''
-            error_string = self._error_message(error_code)
-            return error_string
+            return self._get_error_message(error_code)
         except errors.Error:
             return "Failed to retrieve error description."
 
+    def _get_error_message(self, error_code):
+        '''_get_error_message
+
+        Returns _error_message(error_code), from the messages of the most recently used codes if it is there.
+        '''
+        with _error_messages_lock:
+            error_string = _error_messages.pop(error_code, None)
+            if error_string is not None:
+                _error_messages[error_code] = error_string
+                return error_string
+        error_string = self._error_message(error_code)
+        with _error_messages_lock:
+            _error_messages[error_code] = error_string
+            if len(_error_messages) > _MAX_ERROR_MESSAGES:
+                _error_messages.popitem(last=False)
+        return error_string
+
     ''' These are code-generated '''
 
     def _get_attribute_vi_boolean(self, attribute_id):
@@ -111,11 +380,12 @@ class _SessionBase(object):
         Returns:
             attribute_value (bool): Returns the value of the attribute.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViBoolean()  # case 13
-        error_code = self._library.niFake_GetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViBoolean_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetAttributeViBoolean_attribute_value  # case 13
+        error_code = self._library.niFake_GetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViBoolean_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return bool(attribute_value_ctype.value)
 
@@ -138,11 +408,12 @@ class _SessionBase(object):
         Returns:
             attribute_value (int): Returns the value of the attribute.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niFake_GetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViInt32_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetAttributeViInt32_attribute_value  # case 13
+        error_code = self._library.niFake_GetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViInt32_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(attribute_value_ctype.value)
 
@@ -165,11 +436,12 @@ class _SessionBase(object):
         Returns:
             attribute_value (int): Returns the value of the attribute.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViInt64()  # case 13
-        error_code = self._library.niFake_GetAttributeViInt64(vi_ctype, channel_name_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViInt64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetAttributeViInt64_attribute_value  # case 13
+        error_code = self._library.niFake_GetAttributeViInt64(vi_ctype, channel_name_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViInt64_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(attribute_value_ctype.value)
 
@@ -192,11 +464,12 @@ class _SessionBase(object):
         Returns:
             attribute_value (float): Returns the value of the attribute.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niFake_GetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViReal64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetAttributeViReal64_attribute_value  # case 13
+        error_code = self._library.niFake_GetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViReal64_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(attribute_value_ctype.value)
 
@@ -217,16 +490,23 @@ class _SessionBase(object):
             attribute_id (int): Pass the ID of an attribute.
             buffer_size (int): Number of bytes in attributeValue. You can IVI-dance with this.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        buffer_size_ctype = visatype.ViInt32()  # case 6
-        attribute_value_ctype = None  # case 11
-        error_code = self._library.niFake_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
-        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
-        buffer_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        attribute_value_ctype = (visatype.ViChar * buffer_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViString_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        buffer_size_ctype = visatype.ViInt32(_ivi_dance_buffer_sizes.get(('GetAttributeViString', attribute_id), _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        attribute_value_ctype = (visatype.ViChar * buffer_size_ctype.value)()
         error_code = self._library.niFake_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            buffer_size_ctype = visatype.ViInt32(0)
+            attribute_value_ctype = None
+            error_code = self._library.niFake_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+            buffer_size_ctype = visatype.ViInt32(error_code)
+            attribute_value_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+            error_code = self._library.niFake_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, buffer_size_ctype, attribute_value_ctype)
+            _ivi_dance_buffer_sizes[('GetAttributeViString', attribute_id)] = buffer_size_ctype.value
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return attribute_value_ctype.value.decode(self._encoding)
 
@@ -241,15 +521,21 @@ class _SessionBase(object):
         Returns:
             error_code (int): Returns errorCode for the session. If you pass 0 for bufferSize, you can pass VI_NULL for this.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        error_code_ctype = visatype.ViStatus()  # case 13
-        buffer_size_ctype = visatype.ViInt32()  # case 6
-        description_ctype = None  # case 11
-        error_code = self._library.niFake_GetError(vi_ctype, ctypes.pointer(error_code_ctype), buffer_size_ctype, description_ctype)
-        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=True)
-        buffer_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        description_ctype = (visatype.ViChar * buffer_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        error_code = self._library.niFake_GetError(vi_ctype, ctypes.pointer(error_code_ctype), buffer_size_ctype, description_ctype)
+        vi_ctype = self._vi_ctype  # case 1
+        error_code_ctype = _scalar_ctypes.GetError_error_code  # case 13
+        buffer_size_ctype = visatype.ViInt32(_ivi_dance_buffer_sizes.get('GetError', _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        description_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+        error_code = self._library.niFake_GetError(vi_ctype, _scalar_ctypes.GetError_error_code_pointer, buffer_size_ctype, description_ctype)
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            buffer_size_ctype = visatype.ViInt32(0)
+            description_ctype = None
+            error_code = self._library.niFake_GetError(vi_ctype, _scalar_ctypes.GetError_error_code_pointer, buffer_size_ctype, description_ctype)
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=True)
+            buffer_size_ctype = visatype.ViInt32(error_code)
+            description_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+            error_code = self._library.niFake_GetError(vi_ctype, _scalar_ctypes.GetError_error_code_pointer, buffer_size_ctype, description_ctype)
+            _ivi_dance_buffer_sizes['GetError'] = buffer_size_ctype.value
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=True)
         return int(error_code_ctype.value), description_ctype.value.decode(self._encoding)
 
@@ -272,11 +558,12 @@ class _SessionBase(object):
         Returns:
             reading (float): The measured value.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        maximum_time_ctype = visatype.ViInt32(maximum_time)  # case 8
-        reading_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niFake_ReadFromChannel(vi_ctype, channel_name_ctype, maximum_time_ctype, ctypes.pointer(reading_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        maximum_time_ctype = _scalar_ctypes.ReadFromChannel_maximum_time
+        maximum_time_ctype.value = maximum_time  # case 8
+        reading_ctype = _scalar_ctypes.ReadFromChannel_reading  # case 13
+        error_code = self._library.niFake_ReadFromChannel(vi_ctype, channel_name_ctype, maximum_time_ctype, _scalar_ctypes.ReadFromChannel_reading_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(reading_ctype.value)
 
@@ -297,10 +584,12 @@ class _SessionBase(object):
             attribute_id (int): Pass the ID of an attribute.
             attribute_value (bool): Pass the value that you want to set the attribute to.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViBoolean(attribute_value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViBoolean_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.SetAttributeViBoolean_attribute_value
+        attribute_value_ctype.value = attribute_value  # case 8
         error_code = self._library.niFake_SetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -322,10 +611,12 @@ class _SessionBase(object):
             attribute_id (int): Pass the ID of an attribute.
             attribute_value (int): Pass the value that you want to set the attribute to.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViInt32(attribute_value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViInt32_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.SetAttributeViInt32_attribute_value
+        attribute_value_ctype.value = attribute_value  # case 8
         error_code = self._library.niFake_SetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -347,10 +638,12 @@ class _SessionBase(object):
             attribute_id (int): Pass the ID of an attribute.
             attribute_value (int): Pass the value that you want to set the attribute to.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViInt64(attribute_value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViInt64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.SetAttributeViInt64_attribute_value
+        attribute_value_ctype.value = attribute_value  # case 8
         error_code = self._library.niFake_SetAttributeViInt64(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -372,10 +665,12 @@ class _SessionBase(object):
             attribute_id (int): Pass the ID of an attribute.
             attribute_value (float): Pass the value that you want to set the attribute to.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViReal64(attribute_value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViReal64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.SetAttributeViReal64_attribute_value
+        attribute_value_ctype.value = attribute_value  # case 8
         error_code = self._library.niFake_SetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -397,10 +692,11 @@ class _SessionBase(object):
             attribute_id (int): Pass the ID of an attribute.
             attribute_value (string): Pass the value that you want to set the attribute to.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = ctypes.create_string_buffer(attribute_value.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViString_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = attribute_value.encode(self._encoding)  # case 3
         error_code = self._library.niFake_SetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -416,8 +712,9 @@ class _SessionBase(object):
         Returns:
             error_message (string): The error information formatted into a string.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        error_code_ctype = visatype.ViStatus(error_code)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        error_code_ctype = _scalar_ctypes.error_message_error_code
+        error_code_ctype.value = error_code  # case 8
         error_message_ctype = (visatype.ViChar * 256)()  # case 10
         error_code = self._library.niFake_error_message(vi_ctype, error_code_ctype, error_message_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=True)
@@ -427,9 +724,10 @@ class _SessionBase(object):
 class _RepeatedCapability(_SessionBase):
     '''Allows for setting/getting properties and calling methods for specific repeated capabilities (such as channels) on your session.'''
 
-    def __init__(self, vi, repeated_capability):
-        super(_RepeatedCapability, self).__init__(repeated_capability)
+    def __init__(self, vi, repeated_capability, attribute_cache, library, warning_policy, session_stats):
+        super(_RepeatedCapability, self).__init__(repeated_capability, attribute_cache, library, warning_policy, session_stats)
         self._vi = vi
+        self._vi_ctype = visatype.ViSession(vi)
         self._is_frozen = True
 
 
@@ -437,9 +735,16 @@ class Session(_SessionBase):
     '''An NI-FAKE session to a fake MI driver whose sole purpose is to test nimi-python code generation'''
 
     def __init__(self, resource_name, id_query=False, reset_device=False, option_string=''):
-        super(Session, self).__init__(repeated_capability='')
+        super(Session, self).__init__(repeated_capability='', attribute_cache=attributes.AttributeCache(), library=library_singleton.get(), warning_policy=errors.WarningPolicy(), session_stats=call_stats.SessionStats(_c_functions))
+        if call_stats.registry.enabled:
+            self._session_stats.enable()
+        self._repeated_capability_views = collections.OrderedDict()
+        self._repeated_capability_views_lock = threading.Lock()
         self._vi = 0  # This must be set before calling _init_with_options().
+        # Passed to every method, which would otherwise create it on every call
+        self._vi_ctype = visatype.ViSession(0)
         self._vi = self._init_with_options(resource_name, id_query, reset_device, option_string)
+        self._vi_ctype = visatype.ViSession(self._vi)
         self._is_frozen = True
 
     def __enter__(self):
@@ -450,18 +755,89 @@ class Session(_SessionBase):
 
     def __getitem__(self, repeated_capability):
         '''Set/get properties or call methods with a repeated capability (i.e. channels)'''
-        return _RepeatedCapability(self._vi, repeated_capability)
+        # The most recently used views are kept, so loops over channels don't create a view each time
+        with self._repeated_capability_views_lock:
+            view = self._repeated_capability_views.pop(repeated_capability, None)
+            if view is None:
+                view = _RepeatedCapability(self._vi, repeated_capability, self._attribute_cache, self._library, self._warning_policy, self._session_stats)
+                if len(self._repeated_capability_views) >= _MAX_REPEATED_CAPABILITY_VIEWS:
+                    self._repeated_capability_views.popitem(last=False)
+            self._repeated_capability_views[repeated_capability] = view
+        return view
 
     def initiate(self):
         return _Acquisition(self)
 
+    def enable_attribute_cache(self):
+        '''enable_attribute_cache
+
+        Caches the values of attributes in this session, and in its repeated capabilities, so that getting them again
+        doesn't call into the driver. Setting an attribute updates the cache. Methods that reset or configure the
+        session (i.e. reset(), commit() and configure methods) clear it.
+
+        Volatile attributes, whose values change on their own (i.e. status), are never cached.
+
+        Note:
+        Setting an attribute caches the value that was set. If the driver coerces it (i.e. up to a valid range), the
+        cache returns the value that was set until it is cleared. Calling enable_attribute_cache() again clears it.
+        '''
+        self._attribute_cache.clear()
+        self._attribute_cache.enabled = True
+
+    def disable_attribute_cache(self):
+        '''disable_attribute_cache
+
+        Stops caching the values of attributes, and clears the cache. See enable_attribute_cache().
+        '''
+        self._attribute_cache.enabled = False
+        self._attribute_cache.clear()
+
+    def enable_stats(self):
+        '''enable_stats
+
+        Starts recording statistics of the driver calls of this session, and of its repeated capabilities: for each C
+        function, the number of calls, their latencies, and how much of that time was spent in the driver and how much
+        in Python. Calling enable_stats() again clears them. See stats().
+
+        Methods are slower while stats are enabled. Set call_stats.registry.enabled to True to enable them for all new
+        sessions instead.
+        '''
+        self._session_stats.enable()
+
+    def disable_stats(self):
+        '''disable_stats
+
+        Stops recording statistics of the driver calls. stats() still returns the ones recorded. See enable_stats().
+        '''
+        self._session_stats.disable()
+
+    def stats(self):
+        '''stats
+
+        Returns the statistics of the driver calls recorded since enable_stats():
+
+            session.enable_stats()
+            ...
+            for function, s in session.stats().items():
+                print(function, s.calls, s.driver_time, s.python_time, s.percentile(99))
+
+        Returns:
+            stats (collections.OrderedDict): call_stats.FunctionStats by C function name, the one with the most total
+                time first
+        '''
+        return self._session_stats.stats()
+
     def close(self):
+        with self._repeated_capability_views_lock:
+            self._repeated_capability_views.clear()
         try:
             self._close()
         except errors.Error as e:
             self._vi = 0
+            self._vi_ctype = visatype.ViSession(0)
             raise
         self._vi = 0
+        self._vi_ctype = visatype.ViSession(0)
 
     ''' These are code-generated '''
 
@@ -470,7 +846,7 @@ class Session(_SessionBase):
 
         Aborts a previously initiated thingie.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niFake_Abort(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -484,9 +860,9 @@ class Session(_SessionBase):
             number_of_elements (int): Number of elements in the array.
             an_array (list of float): Contains an array of float numbers
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         number_of_elements_ctype = visatype.ViInt32(len(an_array))  # case 5
-        an_array_ctype = (visatype.ViReal64 * len(an_array))(*an_array)  # case 4
+        an_array_ctype = _converters.convert_to_ctypes_array(an_array, visatype.ViReal64)  # case 4
         error_code = self._library.niFake_ArrayInputFunction(vi_ctype, number_of_elements_ctype, an_array_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -502,7 +878,7 @@ class Session(_SessionBase):
         Returns:
             an_array (list of bool): Contains an array of booleans
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         number_of_elements_ctype = visatype.ViInt32(number_of_elements)  # case 7
         an_array_ctype = (visatype.ViBoolean * number_of_elements)()  # case 12
         error_code = self._library.niFake_BoolArrayOutputFunction(vi_ctype, number_of_elements_ctype, an_array_ctype)
@@ -518,14 +894,14 @@ class Session(_SessionBase):
             number_of_elements (int): Number of elements in the array.
 
         Returns:
-            an_array (list of enums.Turtle): Contains an array of enums, stored as 16 bit integers under the hood
+            an_array (EnumArray of enums.Turtle): Contains an array of enums, stored as 16 bit integers under the hood
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         number_of_elements_ctype = visatype.ViInt32(number_of_elements)  # case 7
         an_array_ctype = (visatype.ViInt16 * number_of_elements)()  # case 12
         error_code = self._library.niFake_EnumArrayOutputFunction(vi_ctype, number_of_elements_ctype, an_array_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return [enums.Turtle(an_array_ctype[i]) for i in range(number_of_elements_ctype.value)]
+        return _converters.EnumArray(_converters.convert_from_ctypes_array(an_array_ctype, number_of_elements_ctype.value, None, 'array'), enums.Turtle, enums._members_by_value[enums.Turtle])
 
     def enum_input_function_with_defaults(self, a_turtle=enums.Turtle.LEONARDO):
         '''enum_input_function_with_defaults
@@ -547,8 +923,9 @@ class Session(_SessionBase):
         '''
         if type(a_turtle) is not enums.Turtle:
             raise TypeError('Parameter mode must be of type ' + str(enums.Turtle))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        a_turtle_ctype = visatype.ViInt16(a_turtle.value)  # case 9
+        vi_ctype = self._vi_ctype  # case 1
+        a_turtle_ctype = _scalar_ctypes.EnumInputFunctionWithDefaults_a_turtle
+        a_turtle_ctype.value = a_turtle.value  # case 9
         error_code = self._library.niFake_EnumInputFunctionWithDefaults(vi_ctype, a_turtle_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -563,9 +940,9 @@ class Session(_SessionBase):
         Returns:
             a_boolean (bool): Contains a boolean.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        a_boolean_ctype = visatype.ViBoolean()  # case 13
-        error_code = self._library.niFake_GetABoolean(vi_ctype, ctypes.pointer(a_boolean_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        a_boolean_ctype = _scalar_ctypes.GetABoolean_a_boolean  # case 13
+        error_code = self._library.niFake_GetABoolean(vi_ctype, _scalar_ctypes.GetABoolean_a_boolean_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return bool(a_boolean_ctype.value)
 
@@ -579,9 +956,9 @@ class Session(_SessionBase):
         Returns:
             a_number (int): Contains a number.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        a_number_ctype = visatype.ViInt16()  # case 13
-        error_code = self._library.niFake_GetANumber(vi_ctype, ctypes.pointer(a_number_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        a_number_ctype = _scalar_ctypes.GetANumber_a_number  # case 13
+        error_code = self._library.niFake_GetANumber(vi_ctype, _scalar_ctypes.GetANumber_a_number_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(a_number_ctype.value)
 
@@ -593,7 +970,7 @@ class Session(_SessionBase):
         Returns:
             a_string (string): String comes back here. Buffer must be 256 big.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         a_string_ctype = (visatype.ViChar * 256)()  # case 10
         error_code = self._library.niFake_GetAStringOfFixedMaximumSize(vi_ctype, a_string_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
@@ -607,14 +984,20 @@ class Session(_SessionBase):
         Args:
             buffer_size (int): Number of bytes in aString You can IVI-dance with this.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        buffer_size_ctype = visatype.ViInt32()  # case 6
-        a_string_ctype = None  # case 11
-        error_code = self._library.niFake_GetAnIviDanceString(vi_ctype, buffer_size_ctype, a_string_ctype)
-        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
-        buffer_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        a_string_ctype = (visatype.ViChar * buffer_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
+        vi_ctype = self._vi_ctype  # case 1
+        buffer_size_ctype = visatype.ViInt32(_ivi_dance_buffer_sizes.get('GetAnIviDanceString', _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        a_string_ctype = (visatype.ViChar * buffer_size_ctype.value)()
         error_code = self._library.niFake_GetAnIviDanceString(vi_ctype, buffer_size_ctype, a_string_ctype)
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            buffer_size_ctype = visatype.ViInt32(0)
+            a_string_ctype = None
+            error_code = self._library.niFake_GetAnIviDanceString(vi_ctype, buffer_size_ctype, a_string_ctype)
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+            buffer_size_ctype = visatype.ViInt32(error_code)
+            a_string_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+            error_code = self._library.niFake_GetAnIviDanceString(vi_ctype, buffer_size_ctype, a_string_ctype)
+            _ivi_dance_buffer_sizes['GetAnIviDanceString'] = buffer_size_ctype.value
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return a_string_ctype.value.decode(self._encoding)
 
@@ -626,7 +1009,7 @@ class Session(_SessionBase):
         Args:
             array_size (int): Specifies the size of the buffer for copyint arrayOut onto.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         array_size_ctype = visatype.ViInt32()  # case 6
         array_out_ctype = None  # case 11
         error_code = self._library.niFake_GetArrayUsingIVIDance(vi_ctype, array_size_ctype, array_out_ctype)
@@ -645,7 +1028,7 @@ class Session(_SessionBase):
         Returns:
             cs (CustomStruct): Set using custom type
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         cs_ctype = custom_struct.custom_struct()  # case 13
         error_code = self._library.niFake_GetCustomType(vi_ctype, ctypes.pointer(cs_ctype))
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
@@ -674,12 +1057,12 @@ class Session(_SessionBase):
                 | 3 | Mich elangelo |
                 +---+---------------+
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        a_quantity_ctype = visatype.ViInt32()  # case 13
-        a_turtle_ctype = visatype.ViInt16()  # case 13
-        error_code = self._library.niFake_GetEnumValue(vi_ctype, ctypes.pointer(a_quantity_ctype), ctypes.pointer(a_turtle_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        a_quantity_ctype = _scalar_ctypes.GetEnumValue_a_quantity  # case 13
+        a_turtle_ctype = _scalar_ctypes.GetEnumValue_a_turtle  # case 13
+        error_code = self._library.niFake_GetEnumValue(vi_ctype, _scalar_ctypes.GetEnumValue_a_quantity_pointer, _scalar_ctypes.GetEnumValue_a_turtle_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return int(a_quantity_ctype.value), enums.Turtle(a_turtle_ctype.value)
+        return int(a_quantity_ctype.value), enums._get_member(enums.Turtle, a_turtle_ctype.value)
 
     def _init_with_options(self, resource_name, id_query=False, reset_device=False, option_string=''):
         '''_init_with_options
@@ -709,12 +1092,14 @@ class Session(_SessionBase):
         Returns:
             vi (int): Returns a ViSession handle that you use.
         '''
-        resource_name_ctype = ctypes.create_string_buffer(resource_name.encode(self._encoding))  # case 3
-        id_query_ctype = visatype.ViBoolean(id_query)  # case 8
-        reset_device_ctype = visatype.ViBoolean(reset_device)  # case 8
-        option_string_ctype = ctypes.create_string_buffer(option_string.encode(self._encoding))  # case 3
-        vi_ctype = visatype.ViSession()  # case 13
-        error_code = self._library.niFake_InitWithOptions(resource_name_ctype, id_query_ctype, reset_device_ctype, option_string_ctype, ctypes.pointer(vi_ctype))
+        resource_name_ctype = resource_name.encode(self._encoding)  # case 3
+        id_query_ctype = _scalar_ctypes.InitWithOptions_id_query
+        id_query_ctype.value = id_query  # case 8
+        reset_device_ctype = _scalar_ctypes.InitWithOptions_reset_device
+        reset_device_ctype.value = reset_device  # case 8
+        option_string_ctype = option_string.encode(self._encoding)  # case 3
+        vi_ctype = _scalar_ctypes.InitWithOptions_vi  # case 13
+        error_code = self._library.niFake_InitWithOptions(resource_name_ctype, id_query_ctype, reset_device_ctype, option_string_ctype, _scalar_ctypes.InitWithOptions_vi_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(vi_ctype.value)
 
@@ -723,7 +1108,7 @@ class Session(_SessionBase):
 
         Initiates a thingie.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niFake_Initiate(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -748,7 +1133,7 @@ class Session(_SessionBase):
         passed_in_array_ctype = (visatype.ViReal64 * passed_in_array_size)()  # case 12
         a_fixed_array_ctype = (visatype.ViReal64 * 3)()  # case 10
         len_array_size_ctype = visatype.ViInt32(len(len_array))  # case 5
-        len_array_ctype = (visatype.ViReal64 * len(len_array))(*len_array)  # case 4
+        len_array_ctype = _converters.convert_to_ctypes_array(len_array, visatype.ViReal64)  # case 4
         error_code = self._library.niFake_MultipleArrayTypes(passed_in_array_size_ctype, passed_in_array_ctype, a_fixed_array_ctype, len_array_size_ctype, len_array_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return [float(passed_in_array_ctype[i]) for i in range(passed_in_array_size_ctype.value)], [float(a_fixed_array_ctype[i]) for i in range(3)]
@@ -761,8 +1146,9 @@ class Session(_SessionBase):
         Args:
             a_number (int): Contains a number
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        a_number_ctype = visatype.ViInt32(a_number)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        a_number_ctype = _scalar_ctypes.OneInputFunction_a_number
+        a_number_ctype.value = a_number  # case 8
         error_code = self._library.niFake_OneInputFunction(vi_ctype, a_number_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -796,15 +1182,21 @@ class Session(_SessionBase):
             raise TypeError('Parameter mode must be of type ' + str(enums.Turtle))
         if type(a_float_enum) is not enums.FloatEnum:
             raise TypeError('Parameter mode must be of type ' + str(enums.FloatEnum))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        a_boolean_ctype = visatype.ViBoolean(a_boolean)  # case 8
-        an_int32_ctype = visatype.ViInt32(an_int32)  # case 8
-        an_int64_ctype = visatype.ViInt64(an_int64)  # case 8
-        an_int_enum_ctype = visatype.ViInt16(an_int_enum.value)  # case 9
-        a_float_ctype = visatype.ViReal64(a_float)  # case 8
-        a_float_enum_ctype = visatype.ViReal64(a_float_enum.value)  # case 9
+        vi_ctype = self._vi_ctype  # case 1
+        a_boolean_ctype = _scalar_ctypes.ParametersAreMultipleTypes_a_boolean
+        a_boolean_ctype.value = a_boolean  # case 8
+        an_int32_ctype = _scalar_ctypes.ParametersAreMultipleTypes_an_int32
+        an_int32_ctype.value = an_int32  # case 8
+        an_int64_ctype = _scalar_ctypes.ParametersAreMultipleTypes_an_int64
+        an_int64_ctype.value = an_int64  # case 8
+        an_int_enum_ctype = _scalar_ctypes.ParametersAreMultipleTypes_an_int_enum
+        an_int_enum_ctype.value = an_int_enum.value  # case 9
+        a_float_ctype = _scalar_ctypes.ParametersAreMultipleTypes_a_float
+        a_float_ctype.value = a_float  # case 8
+        a_float_enum_ctype = _scalar_ctypes.ParametersAreMultipleTypes_a_float_enum
+        a_float_enum_ctype.value = a_float_enum.value  # case 9
         string_size_ctype = visatype.ViInt32(len(a_string))  # case 5
-        a_string_ctype = ctypes.create_string_buffer(a_string.encode(self._encoding))  # case 3
+        a_string_ctype = a_string.encode(self._encoding)  # case 3
         error_code = self._library.niFake_ParametersAreMultipleTypes(vi_ctype, a_boolean_ctype, an_int32_ctype, an_int64_ctype, an_int_enum_ctype, a_float_ctype, a_float_enum_ctype, string_size_ctype, a_string_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -820,14 +1212,15 @@ class Session(_SessionBase):
         Returns:
             reading (float): The measured value.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        maximum_time_ctype = visatype.ViInt32(maximum_time)  # case 8
-        reading_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niFake_Read(vi_ctype, maximum_time_ctype, ctypes.pointer(reading_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        maximum_time_ctype = _scalar_ctypes.Read_maximum_time
+        maximum_time_ctype.value = maximum_time  # case 8
+        reading_ctype = _scalar_ctypes.Read_reading  # case 13
+        error_code = self._library.niFake_Read(vi_ctype, maximum_time_ctype, _scalar_ctypes.Read_reading_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(reading_ctype.value)
 
-    def read_multi_point(self, maximum_time, array_size):
+    def read_multi_point(self, maximum_time, array_size, array_type='list'):
         '''read_multi_point
 
         Acquires multiple measurements and returns an array of measured values.
@@ -835,21 +1228,50 @@ class Session(_SessionBase):
         Args:
             maximum_time (int): Specifies the **maximum_time** allowed in years.
             array_size (int): Number of measurements to acquire.
+            array_type (str): Selects how arrays are returned: 'list', 'array' for array.array or 'numpy' for numpy.ndarray. A numpy.ndarray shares memory with the buffer filled by the driver, so nothing is copied.
 
         Returns:
-            reading_array (list of float): An array of measurement values.
+            reading_array (list, array.array or numpy.ndarray of float): An array of measurement values.
 
                 Note: The size must be at least arraySize.
             actual_number_of_points (int): Indicates the number of measured values actually retrieved.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        maximum_time_ctype = visatype.ViInt32(maximum_time)  # case 8
+        _converters.check_array_type(array_type)
+        vi_ctype = self._vi_ctype  # case 1
+        maximum_time_ctype = _scalar_ctypes.ReadMultiPoint_maximum_time
+        maximum_time_ctype.value = maximum_time  # case 8
         array_size_ctype = visatype.ViInt32(array_size)  # case 7
         reading_array_ctype = (visatype.ViReal64 * array_size)()  # case 12
-        actual_number_of_points_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niFake_ReadMultiPoint(vi_ctype, maximum_time_ctype, array_size_ctype, reading_array_ctype, ctypes.pointer(actual_number_of_points_ctype))
+        actual_number_of_points_ctype = _scalar_ctypes.ReadMultiPoint_actual_number_of_points  # case 13
+        error_code = self._library.niFake_ReadMultiPoint(vi_ctype, maximum_time_ctype, array_size_ctype, reading_array_ctype, _scalar_ctypes.ReadMultiPoint_actual_number_of_points_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return [float(reading_array_ctype[i]) for i in range(array_size_ctype.value)], int(actual_number_of_points_ctype.value)
+        return _converters.convert_from_ctypes_array(reading_array_ctype, array_size_ctype.value, float, array_type), int(actual_number_of_points_ctype.value)
+
+    def read_multi_point_into(self, maximum_time, reading_array):
+        '''read_multi_point_into
+
+        Same as read_multi_point, but the driver writes **reading_array** directly into a buffer you allocate, such as a numpy.ndarray or array.array. Nothing is copied and no list is created.
+
+        Acquires multiple measurements and returns an array of measured values.
+
+        Args:
+            maximum_time (int): Specifies the **maximum_time** allowed in years.
+            reading_array (writable buffer of float): An array of measurement values.
+
+                Note: The size must be at least arraySize.
+
+        Returns:
+            actual_number_of_points (int): Indicates the number of measured values actually retrieved.
+        '''
+        vi_ctype = self._vi_ctype  # case 1
+        maximum_time_ctype = _scalar_ctypes.ReadMultiPoint_maximum_time
+        maximum_time_ctype.value = maximum_time  # case 8
+        array_size_ctype = visatype.ViInt32(len(reading_array))  # case 5
+        reading_array_ctype = _converters.get_ctypes_array_for_buffer(reading_array, visatype.ViReal64, 'reading_array')  # case 14
+        actual_number_of_points_ctype = _scalar_ctypes.ReadMultiPoint_actual_number_of_points  # case 13
+        error_code = self._library.niFake_ReadMultiPoint(vi_ctype, maximum_time_ctype, array_size_ctype, reading_array_ctype, _scalar_ctypes.ReadMultiPoint_actual_number_of_points_pointer)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return int(actual_number_of_points_ctype.value)
 
     def return_a_number_and_a_string(self):
         '''return_a_number_and_a_string
@@ -862,10 +1284,10 @@ class Session(_SessionBase):
             a_number (int): Contains a number.
             a_string (string): Contains a string. Buffer must be 256 bytes or larger.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        a_number_ctype = visatype.ViInt16()  # case 13
+        vi_ctype = self._vi_ctype  # case 1
+        a_number_ctype = _scalar_ctypes.ReturnANumberAndAString_a_number  # case 13
         a_string_ctype = (visatype.ViChar * 256)()  # case 10
-        error_code = self._library.niFake_ReturnANumberAndAString(vi_ctype, ctypes.pointer(a_number_ctype), a_string_ctype)
+        error_code = self._library.niFake_ReturnANumberAndAString(vi_ctype, _scalar_ctypes.ReturnANumberAndAString_a_number_pointer, a_string_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(a_number_ctype.value), a_string_ctype.value.decode(self._encoding)
 
@@ -899,24 +1321,30 @@ class Session(_SessionBase):
 
                 Note: The size must be at least arraySize.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        a_boolean_ctype = visatype.ViBoolean()  # case 13
-        an_int32_ctype = visatype.ViInt32()  # case 13
-        an_int64_ctype = visatype.ViInt64()  # case 13
-        an_int_enum_ctype = visatype.ViInt16()  # case 13
-        a_float_ctype = visatype.ViReal64()  # case 13
-        a_float_enum_ctype = visatype.ViReal64()  # case 13
+        vi_ctype = self._vi_ctype  # case 1
+        a_boolean_ctype = _scalar_ctypes.ReturnMultipleTypes_a_boolean  # case 13
+        an_int32_ctype = _scalar_ctypes.ReturnMultipleTypes_an_int32  # case 13
+        an_int64_ctype = _scalar_ctypes.ReturnMultipleTypes_an_int64  # case 13
+        an_int_enum_ctype = _scalar_ctypes.ReturnMultipleTypes_an_int_enum  # case 13
+        a_float_ctype = _scalar_ctypes.ReturnMultipleTypes_a_float  # case 13
+        a_float_enum_ctype = _scalar_ctypes.ReturnMultipleTypes_a_float_enum  # case 13
         array_size_ctype = visatype.ViInt32(array_size)  # case 7
         an_array_ctype = (visatype.ViReal64 * array_size)()  # case 12
-        string_size_ctype = visatype.ViInt32()  # case 6
-        a_string_ctype = None  # case 11
-        error_code = self._library.niFake_ReturnMultipleTypes(vi_ctype, ctypes.pointer(a_boolean_ctype), ctypes.pointer(an_int32_ctype), ctypes.pointer(an_int64_ctype), ctypes.pointer(an_int_enum_ctype), ctypes.pointer(a_float_ctype), ctypes.pointer(a_float_enum_ctype), array_size_ctype, an_array_ctype, string_size_ctype, a_string_ctype)
-        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
-        string_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        a_string_ctype = (visatype.ViChar * string_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        error_code = self._library.niFake_ReturnMultipleTypes(vi_ctype, ctypes.pointer(a_boolean_ctype), ctypes.pointer(an_int32_ctype), ctypes.pointer(an_int64_ctype), ctypes.pointer(an_int_enum_ctype), ctypes.pointer(a_float_ctype), ctypes.pointer(a_float_enum_ctype), array_size_ctype, an_array_ctype, string_size_ctype, a_string_ctype)
+        string_size_ctype = visatype.ViInt32(_ivi_dance_buffer_sizes.get('ReturnMultipleTypes', _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        a_string_ctype = (visatype.ViChar * string_size_ctype.value)()
+        error_code = self._library.niFake_ReturnMultipleTypes(vi_ctype, _scalar_ctypes.ReturnMultipleTypes_a_boolean_pointer, _scalar_ctypes.ReturnMultipleTypes_an_int32_pointer, _scalar_ctypes.ReturnMultipleTypes_an_int64_pointer, _scalar_ctypes.ReturnMultipleTypes_an_int_enum_pointer, _scalar_ctypes.ReturnMultipleTypes_a_float_pointer, _scalar_ctypes.ReturnMultipleTypes_a_float_enum_pointer, array_size_ctype, an_array_ctype, string_size_ctype, a_string_ctype)
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            string_size_ctype = visatype.ViInt32(0)
+            a_string_ctype = None
+            error_code = self._library.niFake_ReturnMultipleTypes(vi_ctype, _scalar_ctypes.ReturnMultipleTypes_a_boolean_pointer, _scalar_ctypes.ReturnMultipleTypes_an_int32_pointer, _scalar_ctypes.ReturnMultipleTypes_an_int64_pointer, _scalar_ctypes.ReturnMultipleTypes_an_int_enum_pointer, _scalar_ctypes.ReturnMultipleTypes_a_float_pointer, _scalar_ctypes.ReturnMultipleTypes_a_float_enum_pointer, array_size_ctype, an_array_ctype, string_size_ctype, a_string_ctype)
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+            string_size_ctype = visatype.ViInt32(error_code)
+            a_string_ctype = (visatype.ViChar * string_size_ctype.value)()
+            error_code = self._library.niFake_ReturnMultipleTypes(vi_ctype, _scalar_ctypes.ReturnMultipleTypes_a_boolean_pointer, _scalar_ctypes.ReturnMultipleTypes_an_int32_pointer, _scalar_ctypes.ReturnMultipleTypes_an_int64_pointer, _scalar_ctypes.ReturnMultipleTypes_an_int_enum_pointer, _scalar_ctypes.ReturnMultipleTypes_a_float_pointer, _scalar_ctypes.ReturnMultipleTypes_a_float_enum_pointer, array_size_ctype, an_array_ctype, string_size_ctype, a_string_ctype)
+            _ivi_dance_buffer_sizes['ReturnMultipleTypes'] = string_size_ctype.value
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return bool(a_boolean_ctype.value), int(an_int32_ctype.value), int(an_int64_ctype.value), enums.Turtle(an_int_enum_ctype.value), float(a_float_ctype.value), enums.FloatEnum(a_float_enum_ctype.value), [float(an_array_ctype[i]) for i in range(array_size_ctype.value)], a_string_ctype.value.decode(self._encoding)
+        return bool(a_boolean_ctype.value), int(an_int32_ctype.value), int(an_int64_ctype.value), enums._get_member(enums.Turtle, an_int_enum_ctype.value), float(a_float_ctype.value), enums._get_member(enums.FloatEnum, a_float_enum_ctype.value), [float(an_array_ctype[i]) for i in range(array_size_ctype.value)], a_string_ctype.value.decode(self._encoding)
 
     def set_custom_type(self, cs):
         '''set_custom_type
@@ -926,7 +1354,7 @@ class Session(_SessionBase):
         Args:
             cs (CustomStruct): Set using custom type
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         cs_ctype = custom_struct.custom_struct(cs)  # case 8
         error_code = self._library.niFake_SetCustomType(vi_ctype, cs_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
@@ -937,9 +1365,10 @@ class Session(_SessionBase):
 
         This function takes no parameters other than the session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niFake_SimpleFunction(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def two_input_function(self, a_number, a_string):
@@ -951,9 +1380,10 @@ class Session(_SessionBase):
             a_number (float): Contains a number
             a_string (int): Contains a string
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        a_number_ctype = visatype.ViReal64(a_number)  # case 8
-        a_string_ctype = ctypes.create_string_buffer(a_string.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        a_number_ctype = _scalar_ctypes.TwoInputFunction_a_number
+        a_number_ctype.value = a_number  # case 8
+        a_string_ctype = a_string.encode(self._encoding)  # case 3
         error_code = self._library.niFake_TwoInputFunction(vi_ctype, a_number_ctype, a_string_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -971,10 +1401,11 @@ class Session(_SessionBase):
         Returns:
             output (int): A big number on its way out.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        input_ctype = visatype.ViInt64(input)  # case 8
-        output_ctype = visatype.ViInt64()  # case 13
-        error_code = self._library.niFake_Use64BitNumber(vi_ctype, input_ctype, ctypes.pointer(output_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        input_ctype = _scalar_ctypes.Use64BitNumber_input
+        input_ctype.value = input  # case 8
+        output_ctype = _scalar_ctypes.Use64BitNumber_output  # case 13
+        error_code = self._library.niFake_Use64BitNumber(vi_ctype, input_ctype, _scalar_ctypes.Use64BitNumber_output_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(output_ctype.value)
 
@@ -983,7 +1414,7 @@ class Session(_SessionBase):
 
         Closes the specified session and deallocates resources that it reserved.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niFake_close(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
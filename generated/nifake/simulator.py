@@ -0,0 +1,260 @@
+# This file was generated
+'''Simulated NI-FAKE runtime, for testing and benchmarking without hardware.'''
+
+from nifake import _simulation
+
+
+# (name, direction, type, is_buffer, size mechanism, index of the size parameter, default value) of every parameter of every function
+_functions = {
+    'niFake_Abort': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niFake_ArrayInputFunction': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('numberOfElements', 'in', 'ViInt32', False, None, None, None),
+        ('anArray', 'in', 'ViReal64', True, 'len', None, None),
+    ),
+    'niFake_BoolArrayOutputFunction': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('numberOfElements', 'in', 'ViInt32', False, None, None, None),
+        ('anArray', 'out', 'ViBoolean', True, 'passed-in', 1, None),
+    ),
+    'niFake_EnumArrayOutputFunction': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('numberOfElements', 'in', 'ViInt32', False, None, None, None),
+        ('anArray', 'out', 'ViInt16', True, 'passed-in', 1, 0),
+    ),
+    'niFake_EnumInputFunctionWithDefaults': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('aTurtle', 'in', 'ViInt16', False, None, None, 0),
+    ),
+    'niFake_GetABoolean': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('aBoolean', 'out', 'ViBoolean', False, None, None, None),
+    ),
+    'niFake_GetANumber': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('aNumber', 'out', 'ViInt16', False, None, None, None),
+    ),
+    'niFake_GetAStringOfFixedMaximumSize': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('aString', 'out', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niFake_GetAnIviDanceString': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('bufferSize', 'in', 'ViInt32', False, None, None, None),
+        ('aString', 'out', 'ViChar', True, 'ivi-dance', 1, None),
+    ),
+    'niFake_GetArrayUsingIVIDance': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('arraySize', 'in', 'ViInt32', False, None, None, None),
+        ('arrayOut', 'out', 'ViReal64', True, 'ivi-dance', 1, None),
+    ),
+    'niFake_GetAttributeViBoolean': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'out', 'ViBoolean', False, None, None, None),
+    ),
+    'niFake_GetAttributeViInt32': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niFake_GetAttributeViInt64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'out', 'ViInt64', False, None, None, None),
+    ),
+    'niFake_GetAttributeViReal64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niFake_GetAttributeViString': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('bufferSize', 'in', 'ViInt32', False, None, None, None),
+        ('attributeValue', 'out', 'ViChar', True, 'ivi-dance', 3, None),
+    ),
+    'niFake_GetCustomType': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('cs', 'out', 'custom_struct', False, None, None, None),
+    ),
+    'niFake_GetEnumValue': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('aQuantity', 'out', 'ViInt32', False, None, None, None),
+        ('aTurtle', 'out', 'ViInt16', False, None, None, 0),
+    ),
+    'niFake_GetError': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('errorCode', 'out', 'ViStatus', False, None, None, None),
+        ('bufferSize', 'in', 'ViInt32', False, None, None, None),
+        ('description', 'out', 'ViChar', True, 'ivi-dance', 2, None),
+    ),
+    'niFake_InitWithOptions': (
+        ('resourceName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('idQuery', 'in', 'ViBoolean', False, None, None, None),
+        ('resetDevice', 'in', 'ViBoolean', False, None, None, None),
+        ('optionString', 'in', 'ViChar', True, 'fixed', None, None),
+        ('vi', 'out', 'ViSession', False, None, None, None),
+    ),
+    'niFake_Initiate': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niFake_MultipleArrayTypes': (
+        ('passedInArraySize', 'in', 'ViInt32', False, None, None, None),
+        ('passedInArray', 'out', 'ViReal64', True, 'passed-in', 0, None),
+        ('aFixedArray', 'out', 'ViReal64', True, 'fixed', None, None),
+        ('lenArraySize', 'in', 'ViInt32', False, None, None, None),
+        ('lenArray', 'in', 'ViReal64', True, 'len', None, None),
+    ),
+    'niFake_OneInputFunction': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('aNumber', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niFake_ParametersAreMultipleTypes': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('aBoolean', 'in', 'ViBoolean', False, None, None, None),
+        ('anInt32', 'in', 'ViInt32', False, None, None, None),
+        ('anInt64', 'in', 'ViInt64', False, None, None, None),
+        ('anIntEnum', 'in', 'ViInt16', False, None, None, 0),
+        ('aFloat', 'in', 'ViReal64', False, None, None, None),
+        ('aFloatEnum', 'in', 'ViReal64', False, None, None, 3.5),
+        ('stringSize', 'in', 'ViInt32', False, None, None, None),
+        ('aString', 'in', 'ViChar', True, 'len', None, None),
+    ),
+    'niFake_Read': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('maximumTime', 'in', 'ViInt32', False, None, None, None),
+        ('reading', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niFake_ReadFromChannel': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('maximumTime', 'in', 'ViInt32', False, None, None, None),
+        ('reading', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niFake_ReadMultiPoint': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('maximumTime', 'in', 'ViInt32', False, None, None, None),
+        ('arraySize', 'in', 'ViInt32', False, None, None, None),
+        ('readingArray', 'out', 'ViReal64', True, 'passed-in', 2, None),
+        ('actualNumberOfPoints', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niFake_ReturnANumberAndAString': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('aNumber', 'out', 'ViInt16', False, None, None, None),
+        ('aString', 'out', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niFake_ReturnMultipleTypes': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('aBoolean', 'out', 'ViBoolean', False, None, None, None),
+        ('anInt32', 'out', 'ViInt32', False, None, None, None),
+        ('anInt64', 'out', 'ViInt64', False, None, None, None),
+        ('anIntEnum', 'out', 'ViInt16', False, None, None, 0),
+        ('aFloat', 'out', 'ViReal64', False, None, None, None),
+        ('aFloatEnum', 'out', 'ViReal64', False, None, None, 3.5),
+        ('arraySize', 'in', 'ViInt32', False, None, None, None),
+        ('anArray', 'out', 'ViReal64', True, 'passed-in', 7, None),
+        ('stringSize', 'in', 'ViInt32', False, None, None, None),
+        ('aString', 'out', 'ViChar', True, 'ivi-dance', 9, None),
+    ),
+    'niFake_SetAttributeViBoolean': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViBoolean', False, None, None, None),
+    ),
+    'niFake_SetAttributeViInt32': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niFake_SetAttributeViInt64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViInt64', False, None, None, None),
+    ),
+    'niFake_SetAttributeViReal64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niFake_SetAttributeViString': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niFake_SetCustomType': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('cs', 'in', 'custom_struct', False, None, None, None),
+    ),
+    'niFake_SimpleFunction': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niFake_TwoInputFunction': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('aNumber', 'in', 'ViReal64', False, None, None, None),
+        ('aString', 'in', 'ViChar', False, None, None, None),
+    ),
+    'niFake_Use64BitNumber': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('input', 'in', 'ViInt64', False, None, None, None),
+        ('output', 'out', 'ViInt64', False, None, None, None),
+    ),
+    'niFake_close': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niFake_error_message': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('errorCode', 'in', 'ViStatus', False, None, None, None),
+        ('errorMessage', 'out', 'ViChar', True, 'fixed', None, None),
+    ),
+}
+
+# Value of every attribute until it is set
+_attributes = {
+    1000000: False,  # READ_WRITE_BOOL
+    1000001: 0.0,  # READ_WRITE_DOUBLE
+    1000002: '',  # READ_WRITE_STRING
+    1000003: 1,  # READ_WRITE_COLOR
+    1000004: 0,  # READ_WRITE_INTEGER
+    1000005: 3.5,  # FLOAT_ENUM
+    1000006: 0,  # READ_WRITE_INT64
+}
+
+# Values returned in output parameters, by function and parameter name. Output buffers that are not listed are
+# filled with synthetic data, and output counts (i.e. actualNumberOfPoints) return the number of elements written.
+_output_values = {
+}
+
+
+class Simulator(_simulation.SimulatedLibrary):
+    '''Simulator
+
+    Pure-Python stand-in for the NI-FAKE runtime. It keeps the value of attributes for each session and fills
+    output buffers with synthetic data. Pass an instance to library_singleton.set_backend() before creating sessions:
+
+        import nifake.simulator
+        nifake.library_singleton.set_backend(nifake.simulator.Simulator(latency=0.0001))
+
+    Args:
+        latency (float): Time, in seconds, that every function call sleeps for. Can be changed at any time.
+        array_size (int): Number of elements of output buffers that the driver sizes, i.e. with the IVI-dance
+        attribute_values (dict): Value of attributes, by attribute ID, until they are set
+        output_values (dict): Values returned in output parameters, by C function name without the prefix and
+            parameter name, i.e. {'ReadMultiPoint': {'readingArray': 1.5}}. A single value fills a whole buffer, and
+            a dict of field values fills every structure of a buffer of structures.
+    '''
+
+    def __init__(self, latency=0.0, array_size=1000, attribute_values=None, output_values=None):
+        super(Simulator, self).__init__('niFake_', _functions, _attributes, _output_values, latency, array_size, attribute_values, output_values)
@@ -0,0 +1,145 @@
+'''Moving a session between named configurations with as few attribute writes as possible.'''
+
+import collections
+import itertools
+
+
+# Value of attributes that the StateMachine did not write, or whose value it forgot
+_UNKNOWN = object()
+
+
+def _split_channels(channels):
+    return [c.strip() for c in channels.split(',') if len(c.strip()) > 0]
+
+
+def _expand_state(session, state):
+    '''Returns an OrderedDict of (value for all channels, OrderedDict of value by channel) by property name'''
+    expanded = collections.OrderedDict()
+    for channels, values in state.items():
+        channel_names = _split_channels(channels)
+        for name, value in values.items():
+            # Raises for names that are not properties of the driver
+            name = session._get_attribute_info(name).python_name
+            _, channel_values = expanded.setdefault(name, (_UNKNOWN, collections.OrderedDict()))
+            if len(channel_names) == 0:
+                expanded[name] = (value, channel_values)
+            for channel in channel_names:
+                channel_values[channel] = value
+    return expanded
+
+
+class StateMachine(object):
+    '''Moves a session between named states, writing only the attributes that change
+
+    A state has values of properties of the session, by comma-separated list of repeated capabilities (usually
+    channels). '' is all repeated capabilities:
+
+        states = {
+            'small_signal': {
+                '': {'vertical_coupling': niscope.VerticalCoupling.DC, 'horz_record_length': 1000},
+                '0,1': {'vertical_range': 0.2},
+            },
+            'large_signal': {
+                '': {'vertical_coupling': niscope.VerticalCoupling.DC, 'horz_record_length': 1000},
+                '0': {'vertical_range': 10.0},
+                '1': {'vertical_range': 5.0},
+            },
+        }
+        machine = niscope.state_transitions.StateMachine(session, states)
+        machine.transition('small_signal')
+
+    transition() writes the attributes whose values are different from the ones it last wrote, or that it never
+    wrote. Channels that get the same value are written with one channel list. Attributes are written in the order
+    the state first lists them, since some depend on others (i.e. a range before an offset): use
+    collections.OrderedDict for states on Python versions before 3.7. Consecutive writes to the same channels are done
+    with one call. Then it calls commit() once, if the session has it.
+
+    The StateMachine only knows the values that it wrote. Session methods that reset or configure the session
+    (i.e. reset(), configure methods) make it forget them. Setting properties directly doesn't: call invalidate()
+    after that.
+
+    Args:
+        session (Session): Session to write the attributes of
+        states (dict): States by name
+    '''
+
+    def __init__(self, session, states):
+        self._session = session
+        self._states = dict((name, _expand_state(session, state)) for name, state in states.items())
+        self._known_values = {}
+        self._generation = None
+        self.current = None
+        '''Name of the last state transitioned to, or None'''
+
+    def invalidate(self):
+        '''Forgets the values of attributes, so that the next transition writes all of them'''
+        self._known_values = {}
+        self.current = None
+
+    def _forget_if_invalidated(self):
+        if self._session._attribute_cache.generation != self._generation:
+            self.invalidate()
+
+    def _plan(self, name):
+        '''Returns the writes to transition to the state, and the values of attributes after them'''
+        try:
+            target = self._states[name]
+        except KeyError:
+            raise ValueError('{0!r} is not one of the states: {1}'.format(name, ', '.join(sorted(repr(s) for s in self._states))))
+        known_values = dict((attribute, dict(values)) for attribute, values in self._known_values.items())
+        writes = []
+        for attribute, (all_channels_value, channel_values) in target.items():
+            values = known_values.setdefault(attribute, {})
+            if all_channels_value is not _UNKNOWN:
+                # Channels that were written on their own may have other values
+                if '' not in values or any(v != all_channels_value for v in values.values()):
+                    writes.append(('', attribute, all_channels_value))
+                    values.clear()
+                    values[''] = all_channels_value
+            # Channels that need the same value share a write: [value, [channel, ...]]
+            changes = []
+            for channel, value in channel_values.items():
+                if values.get(channel, values.get('', _UNKNOWN)) == value:
+                    continue
+                for change in changes:
+                    if change[0] == value:
+                        change[1].append(channel)
+                        break
+                else:
+                    changes.append([value, [channel]])
+                values[channel] = value
+            writes.extend((','.join(channels), attribute, value) for value, channels in changes)
+        return writes, known_values
+
+    def plan(self, name):
+        '''Returns the writes that transition() would do, as a list of (channels, property name, value)'''
+        self._forget_if_invalidated()
+        writes, _ = self._plan(name)
+        return writes
+
+    def transition(self, name):
+        '''Writes the attributes of the state that changed, then commits
+
+        Args:
+            name (str): Name of the state
+
+        Returns:
+            writes (list): Writes done, as (channels, property name, value)
+        '''
+        self._forget_if_invalidated()
+        writes, known_values = self._plan(name)
+        try:
+            for channels, group in itertools.groupby(writes, key=lambda w: w[0]):
+                target = self._session if channels == '' else self._session[channels]
+                target._set_attributes([(attribute, value) for _, attribute, value in group])
+            if len(writes) > 0 and hasattr(self._session, 'commit'):
+                self._session.commit()
+        except Exception:
+            # Some of the writes may have been done
+            self.invalidate()
+            raise
+        self._known_values = known_values
+        # commit() clears the attribute cache, which would otherwise make the next transition forget the values
+        self._generation = self._session._attribute_cache.generation
+        self.current = name
+        return writes
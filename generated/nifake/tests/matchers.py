@@ -71,6 +71,12 @@ class ViStringMatcher(object):
         self.expected_string_value = expected_string_value
 
     def __eq__(self, other):
+        # Session methods pass input strings as bytes, and repeated capabilities as buffers
+        if isinstance(other, bytes):
+            if other.decode("ascii") != self.expected_string_value:
+                print("Unexpected value. Expected {0}. Received: {1}".format(self.expected_string_value, other.decode("ascii")))
+                return False
+            return True
         if not isinstance(other, ctypes.Array):
             print("Unexpected type. Expected: {0}. Received: {1}".format(ctypes.Array, type(other)))
             return False
@@ -0,0 +1,87 @@
+import nifake
+import nifake.call_stats
+import nifake.simulator
+import pytest
+
+from nifake import library_singleton
+
+
+class TestCallStats(object):
+
+    def setup_method(self, method):
+        library_singleton.set_backend(nifake.simulator.Simulator())
+
+    def teardown_method(self, method):
+        library_singleton.set_backend(None)
+        nifake.call_stats.registry.enabled = False
+        nifake.call_stats.registry.clear()
+
+    def test_disabled_by_default(self):
+        with nifake.Session('dev1') as session:
+            session.get_a_number()
+            assert session.stats() == {}
+            # Methods are the ones of the class
+            assert 'get_a_number' not in session.__dict__
+
+    def test_calls_and_times(self):
+        library_singleton.set_backend(nifake.simulator.Simulator(latency=0.01))
+        with nifake.Session('dev1') as session:
+            session.enable_stats()
+            for _ in range(3):
+                session.read(1)
+            session.get_a_number()
+            stats = session.stats()
+            assert list(stats) == ['niFake_Read', 'niFake_GetANumber']
+            read_stats = stats['niFake_Read']
+            assert read_stats.calls == 3
+            assert read_stats.driver_calls == 3
+            assert read_stats.driver_time >= 0.03
+            assert read_stats.python_time < read_stats.driver_time
+            assert read_stats.total_time == read_stats.driver_time + read_stats.python_time
+            assert len(read_stats.latencies) == 3
+            assert 0.01 <= read_stats.percentile(50) <= read_stats.percentile(100) == max(read_stats.latencies)
+            with pytest.raises(ValueError):
+                read_stats.percentile(101)
+
+    def test_repeated_capabilities(self):
+        with nifake.Session('dev1') as session:
+            channel = session['0']
+            session.enable_stats()
+            channel.read_write_integer
+            session['1'].read_write_integer
+            assert session.stats()['niFake_GetAttributeViInt32'].calls == 2
+
+    def test_enable_clears_and_disable_keeps(self):
+        with nifake.Session('dev1') as session:
+            session.enable_stats()
+            session.get_a_number()
+            session.enable_stats()
+            session.simple_function()
+            session.disable_stats()
+            session.simple_function()
+            assert list(session.stats()) == ['niFake_SimpleFunction']
+            assert session.stats()['niFake_SimpleFunction'].calls == 1
+            assert 'simple_function' not in session.__dict__
+
+    def test_driver_calls_without_method(self):
+        with nifake.Session('dev1') as session:
+            session.enable_stats()
+            # Gets the attributes directly from the library
+            session.get_attributes(['read_write_double', 'read_write_integer'])
+            stats = session.stats()
+            assert stats['niFake_GetAttributeViReal64'].calls == 1
+            assert stats['niFake_GetAttributeViReal64'].python_time == 0.0
+
+    def test_registry(self):
+        nifake.call_stats.registry.enabled = True
+        with nifake.Session('dev1') as session1:
+            session1.get_a_number()
+        with nifake.Session('dev2') as session2:
+            session2.get_a_number()
+        assert session1.stats()['niFake_InitWithOptions'].calls == 1
+        assert len(nifake.call_stats.registry.sessions()) == 2
+        stats = nifake.call_stats.registry.stats()
+        assert stats['niFake_GetANumber'].calls == 2
+        assert stats['niFake_close'].calls == 2
+        nifake.call_stats.registry.clear()
+        assert nifake.call_stats.registry.stats() == {}
@@ -0,0 +1,80 @@
+import ctypes
+import nifake
+import threading
+
+from nifake import library
+
+
+class _FakeCFunc(object):
+    def __init__(self, name):
+        self.name = name
+        self.argtypes = None
+        self.restype = None
+        self.call_count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, *args):
+        assert self.argtypes is not None, '{0} called before argtypes were set'.format(self.name)
+        with self._lock:
+            self.call_count += 1
+        return 0
+
+
+class _FakeCtypesLibrary(object):
+    '''Stands in for ctypes.CDLL and counts how many times each function is resolved.'''
+
+    def __init__(self):
+        self.resolve_count = {}
+        self.cfuncs = {}
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        self.resolve_count[name] = self.resolve_count.get(name, 0) + 1
+        cfunc = _FakeCFunc(name)
+        self.cfuncs[name] = cfunc
+        return cfunc
+
+
+class TestLibrary(object):
+
+    def setup_method(self, method):
+        self.ctypes_library = _FakeCtypesLibrary()
+        self.library = library.Library(self.ctypes_library)
+
+    def test_function_resolved_and_prototyped_once(self):
+        vi_ctype = nifake.visatype.ViSession(42)
+        for _ in range(5):
+            assert self.library.niFake_SimpleFunction(vi_ctype) == 0
+        assert self.ctypes_library.resolve_count['niFake_SimpleFunction'] == 1
+        cfunc = self.ctypes_library.cfuncs['niFake_SimpleFunction']
+        assert cfunc.argtypes == [nifake.visatype.ViSession]
+        assert cfunc.restype == nifake.visatype.ViStatus
+        assert cfunc.call_count == 5
+
+    def test_argtypes_for_output_parameters(self):
+        vi_ctype = nifake.visatype.ViSession(42)
+        a_number_ctype = nifake.visatype.ViInt16()
+        self.library.niFake_GetANumber(vi_ctype, ctypes.pointer(a_number_ctype))
+        cfunc = self.ctypes_library.cfuncs['niFake_GetANumber']
+        assert cfunc.argtypes == [nifake.visatype.ViSession, ctypes.POINTER(nifake.visatype.ViInt16)]
+
+    def test_concurrent_first_calls_resolve_once(self):
+        number_of_threads = 8
+        calls_per_thread = 200
+        start = threading.Event()
+        vi_ctype = nifake.visatype.ViSession(42)
+
+        def worker():
+            start.wait()
+            for _ in range(calls_per_thread):
+                self.library.niFake_SimpleFunction(vi_ctype)
+
+        threads = [threading.Thread(target=worker) for _ in range(number_of_threads)]
+        for t in threads:
+            t.start()
+        start.set()
+        for t in threads:
+            t.join()
+        assert self.ctypes_library.resolve_count['niFake_SimpleFunction'] == 1
+        assert self.ctypes_library.cfuncs['niFake_SimpleFunction'].call_count == number_of_threads * calls_per_thread
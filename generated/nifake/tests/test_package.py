@@ -0,0 +1,28 @@
+import nifake
+import os
+import pytest
+import subprocess
+import sys
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='Module __getattr__ needs Python 3.7')
+class TestPackage(object):
+
+    def test_import_is_lazy(self):
+        # A new interpreter, where nothing is imported yet
+        code = 'import sys, nifake.errors; print(\'nifake.enums\' in sys.modules); nifake.Color; print(\'nifake.enums\' in sys.modules)'
+        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(nifake.__file__)))
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=package_dir)
+        assert output.split() == [b'False', b'True']
+
+    def test_names(self):
+        assert nifake.Color is nifake.enums.Color
+        assert nifake.Error is nifake.errors.Error
+        assert nifake.Session is nifake.session.Session
+        # Not the module of the same name
+        assert nifake.custom_struct.__name__ == 'custom_struct'
+        assert nifake.CustomStruct.__name__ == 'CustomStruct'
+        assert 'Turtle' in dir(nifake)
+        assert 'Session' in nifake.__all__
+        with pytest.raises(AttributeError):
+            nifake.NonExistent
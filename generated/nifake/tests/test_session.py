@@ -1,8 +1,15 @@
+import array
+import ctypes
 import matchers
 import math
 import mock_helper
 import nifake
+import pytest
 import six
+import struct
+import sys
+import threading
+import time
 import warnings
 
 from mock import patch
@@ -12,6 +19,9 @@ from mock import patch
 
 SESSION_NUM_FOR_TEST = 42
 
+# memoryview() of array.array, and memoryview.cast(), need Python 3
+requires_python_3_memoryview = pytest.mark.skipif(sys.version_info.major < 3, reason='memoryview of array.array needs Python 3')
+
 
 class TestSession(object):
 
@@ -21,6 +31,8 @@ class TestSession(object):
         self.patched_library_singleton_get = patch('nifake.session.library_singleton.get', return_value=self.patched_library)
         self.patched_library_singleton_get.start()
 
+        nifake.session._ivi_dance_buffer_sizes.clear()
+        nifake.session._error_messages.clear()
         self.side_effects_helper = mock_helper.SideEffectsHelper()
         self.side_effects_helper.set_side_effects_and_return_values(self.patched_library)
         self.patched_library.niFake_InitWithOptions.side_effect = self.side_effects_helper.niFake_InitWithOptions
@@ -40,7 +52,7 @@ class TestSession(object):
     # Session management
 
     def test_init_with_options_and_close(self):
-        errors_patcher = patch('nifake.session.errors', spec_set=['handle_error', '_is_error'])
+        errors_patcher = patch('nifake.session.errors', spec_set=['handle_error', '_is_error', 'WarningPolicy'])
         patched_errors = errors_patcher.start()
         patched_errors._is_error.return_value = 0
 
@@ -154,6 +166,39 @@ class TestSession(object):
             assert test_result == test_number
             self.patched_library.niFake_GetANumber.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt16PointerMatcher())
 
+    def test_scalar_ctypes_reused(self):
+        numbers = []
+
+        def get_a_number(vi, a_number):
+            numbers.append(a_number)
+            a_number.contents.value = len(numbers)
+            return 0
+        self.patched_library.niFake_GetANumber.side_effect = get_a_number
+        with nifake.Session('dev1') as session:
+            assert session.get_a_number() == 1
+            assert session.get_a_number() == 2
+            assert numbers[0] is numbers[1]
+
+    def test_scalar_ctypes_per_thread(self):
+        def get_a_number(vi, a_number):
+            a_number.contents.value = threading.current_thread().number
+            # Gives the other threads time to call it too
+            time.sleep(0.01)
+            return 0
+        self.patched_library.niFake_GetANumber.side_effect = get_a_number
+        results = {}
+
+        def worker(number):
+            threading.current_thread().number = number
+            results[number] = session.get_a_number()
+        with nifake.Session('dev1') as session:
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        assert results == {0: 0, 1: 1, 2: 2, 3: 3}
+
     def test_one_input_function(self):
         test_number = 1
         self.patched_library.niFake_OneInputFunction.side_effect = self.side_effects_helper.niFake_OneInputFunction
@@ -205,6 +250,27 @@ class TestSession(object):
                 assert test_result[i].value == test_array[i]
             self.patched_library.niFake_EnumArrayOutputFunction.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt32Matcher(test_array_size), matchers.ViInt16BufferMatcher(test_array_size))
 
+    def test_get_a_list_enums_values(self):
+        self.patched_library.niFake_EnumArrayOutputFunction.side_effect = self.side_effects_helper.niFake_EnumArrayOutputFunction
+        test_array = [1, 1, 0, 3]
+        self.side_effects_helper['EnumArrayOutputFunction']['anArray'] = test_array
+        with nifake.Session('dev1') as session:
+            test_result = session.enum_array_output_function(len(test_array))
+            assert test_result.values == array.array('h', test_array)
+            assert test_result == [nifake.Turtle(v) for v in test_array]
+            assert list(test_result[1:3]) == [nifake.Turtle(1), nifake.Turtle(0)]
+            assert test_result[-1] is nifake.Turtle.MICHELANGELO
+            assert nifake.Turtle.LEONARDO in test_result
+
+    def test_get_a_list_enums_invalid_value(self):
+        self.patched_library.niFake_EnumArrayOutputFunction.side_effect = self.side_effects_helper.niFake_EnumArrayOutputFunction
+        self.side_effects_helper['EnumArrayOutputFunction']['anArray'] = [0, 42]
+        with nifake.Session('dev1') as session:
+            test_result = session.enum_array_output_function(2)
+            assert test_result[0] is nifake.Turtle(0)
+            with pytest.raises(ValueError):
+                test_result[1]
+
     def test_get_a_boolean(self):
         self.patched_library.niFake_GetABoolean.side_effect = self.side_effects_helper.niFake_GetABoolean
         self.side_effects_helper['GetABoolean']['aBoolean'] = 1
@@ -255,13 +321,18 @@ class TestSession(object):
 
     def test_enum_input_function_with_defaults(self):
         test_turtle = nifake.Turtle.DONATELLO
-        self.patched_library.niFake_EnumInputFunctionWithDefaults.side_effect = self.side_effects_helper.niFake_EnumInputFunctionWithDefaults
+        # The method reuses the same ctypes object on every call, so the values are checked when it is called
+        calls = []
+
+        def enum_input_function_with_defaults(vi, a_turtle):
+            calls.append((matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST) == vi, matchers.ViInt16Matcher(a_turtle.value) == a_turtle, a_turtle.value))
+            return 0
+        self.patched_library.niFake_EnumInputFunctionWithDefaults.side_effect = enum_input_function_with_defaults
         with nifake.Session('dev1') as session:
             session.enum_input_function_with_defaults()
             session.enum_input_function_with_defaults(test_turtle)
-            from mock import call
-            calls = [call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt16Matcher(0)), call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt16Matcher(1))]  # 0 is the value of the default of nifake.Turtle.LEONARDO, 1 is the value of nifake.Turtle.DONATELLO
-            self.patched_library.niFake_EnumInputFunctionWithDefaults.assert_has_calls(calls)
+            # 0 is the value of the default of nifake.Turtle.LEONARDO, 1 is the value of nifake.Turtle.DONATELLO
+            assert calls == [(True, True, 0), (True, True, 1)]
 
     def test_multipoint_read(self):
         test_maximum_time = 1000
@@ -278,6 +349,105 @@ class TestSession(object):
             assert measurements == test_reading_array
             self.patched_library.niFake_ReadMultiPoint.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt32Matcher(test_maximum_time), matchers.ViInt32Matcher(len(test_reading_array)), matchers.ViReal64BufferMatcher(len(test_reading_array)), matchers.ViInt32PointerMatcher())
 
+    def test_multipoint_read_as_array(self):
+        test_maximum_time = 1000
+        test_reading_array = [1.0, 0.1, 42, .42]
+        test_actual_number_of_points = len(test_reading_array)
+        self.patched_library.niFake_ReadMultiPoint.side_effect = self.side_effects_helper.niFake_ReadMultiPoint
+        self.side_effects_helper['ReadMultiPoint']['readingArray'] = test_reading_array
+        self.side_effects_helper['ReadMultiPoint']['actualNumberOfPoints'] = test_actual_number_of_points
+        with nifake.Session('dev1') as session:
+            measurements, points = session.read_multi_point(test_maximum_time, len(test_reading_array), array_type='array')
+            assert isinstance(measurements, array.array)
+            assert measurements.typecode == 'd'
+            assert measurements.tolist() == test_reading_array
+            assert points == test_actual_number_of_points
+
+    def test_multipoint_read_invalid_array_type_error(self):
+        self.patched_library.niFake_ReadMultiPoint.side_effect = self.side_effects_helper.niFake_ReadMultiPoint
+        self.side_effects_helper['ReadMultiPoint']['readingArray'] = [1.0]
+        self.side_effects_helper['ReadMultiPoint']['actualNumberOfPoints'] = 1
+        with nifake.Session('dev1') as session:
+            try:
+                session.read_multi_point(1000, 1, array_type='tuple')
+                assert False
+            except ValueError:
+                pass
+            # Checked before the driver call, so no measurements are fetched and lost
+            assert self.patched_library.niFake_ReadMultiPoint.call_count == 0
+
+    def test_multipoint_read_into(self):
+        test_maximum_time = 1000
+        test_reading_array = [1.0, 0.1, 42, .42]
+        test_actual_number_of_points = len(test_reading_array)
+        self.patched_library.niFake_ReadMultiPoint.side_effect = self.side_effects_helper.niFake_ReadMultiPoint
+        self.side_effects_helper['ReadMultiPoint']['readingArray'] = test_reading_array
+        self.side_effects_helper['ReadMultiPoint']['actualNumberOfPoints'] = test_actual_number_of_points
+        measurements = array.array('d', [0.0] * len(test_reading_array))
+        with nifake.Session('dev1') as session:
+            points = session.read_multi_point_into(test_maximum_time, measurements)
+            assert points == test_actual_number_of_points
+            assert measurements.tolist() == test_reading_array
+            self.patched_library.niFake_ReadMultiPoint.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt32Matcher(test_maximum_time), matchers.ViInt32Matcher(len(test_reading_array)), matchers.ViReal64BufferMatcher(len(test_reading_array)), matchers.ViInt32PointerMatcher())
+
+    def test_multipoint_read_into_ctypes_array(self):
+        test_reading_array = [1.0, 0.1, 42, .42]
+        self.patched_library.niFake_ReadMultiPoint.side_effect = self.side_effects_helper.niFake_ReadMultiPoint
+        self.side_effects_helper['ReadMultiPoint']['readingArray'] = test_reading_array
+        self.side_effects_helper['ReadMultiPoint']['actualNumberOfPoints'] = len(test_reading_array)
+        measurements = (nifake.visatype.ViReal64 * len(test_reading_array))()
+        with nifake.Session('dev1') as session:
+            assert session.read_multi_point_into(1000, measurements) == len(test_reading_array)
+            assert list(measurements) == test_reading_array
+
+    def test_multipoint_read_into_list_error(self):
+        with nifake.Session('dev1') as session:
+            try:
+                session.read_multi_point_into(1000, [0.0] * 4)
+                assert False
+            except TypeError:
+                pass
+            assert self.patched_library.niFake_ReadMultiPoint.call_count == 0
+
+    def test_multipoint_read_into_read_only_buffer_error(self):
+        with nifake.Session('dev1') as session:
+            try:
+                session.read_multi_point_into(1000, bytes(32))
+                assert False
+            except TypeError:
+                pass
+            assert self.patched_library.niFake_ReadMultiPoint.call_count == 0
+
+    def test_multipoint_read_into_wrong_type_error(self):
+        with nifake.Session('dev1') as session:
+            try:
+                session.read_multi_point_into(1000, array.array('i', [0] * 4))
+                assert False
+            except TypeError:
+                pass
+            assert self.patched_library.niFake_ReadMultiPoint.call_count == 0
+
+    @requires_python_3_memoryview
+    def test_multipoint_read_into_non_contiguous_buffer_error(self):
+        with nifake.Session('dev1') as session:
+            try:
+                session.read_multi_point_into(1000, memoryview(array.array('d', [0.0] * 8))[::2])
+                assert False
+            except ValueError:
+                pass
+            assert self.patched_library.niFake_ReadMultiPoint.call_count == 0
+
+    def test_is_c_contiguous_without_c_contiguous(self):
+        class View(object):
+            '''Like memoryview on Python 2, which has strides but no c_contiguous'''
+            itemsize = 8
+
+            def __init__(self, strides):
+                self.strides = strides
+        assert nifake._converters._is_c_contiguous(View((8,))) is True
+        assert nifake._converters._is_c_contiguous(View(None)) is True
+        assert nifake._converters._is_c_contiguous(View((16,))) is False
+
     def test_array_input_function(self):
         test_array = [1, 2, 3, 4]
         test_array_size = len(test_array)
@@ -286,6 +456,45 @@ class TestSession(object):
             session.array_input_function(test_array)
             self.patched_library.niFake_ArrayInputFunction.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt32Matcher(test_array_size), matchers.ViReal64BufferMatcher(test_array))
 
+    def test_array_input_function_with_buffer(self):
+        test_array = array.array('d', [1, 2, 3, 4])
+        test_array_size = len(test_array)
+        addresses = []
+
+        def side_effect(vi, number_of_elements, an_array):
+            addresses.append(ctypes.addressof(an_array))
+            return 0
+        self.patched_library.niFake_ArrayInputFunction.side_effect = side_effect
+        with nifake.Session('dev1') as session:
+            session.array_input_function(test_array)
+            self.patched_library.niFake_ArrayInputFunction.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt32Matcher(test_array_size), matchers.ViReal64BufferMatcher(test_array.tolist()))
+        # Writable buffers of the right type are handed to the driver without copying
+        assert addresses == [test_array.buffer_info()[0]]
+
+    @requires_python_3_memoryview
+    def test_array_input_function_with_read_only_buffer(self):
+        test_values = [1.0, 2.0, 3.0, 4.0]
+        test_array = memoryview(struct.pack('4d', *test_values)).cast('d')
+        self.patched_library.niFake_ArrayInputFunction.side_effect = self.side_effects_helper.niFake_ArrayInputFunction
+        with nifake.Session('dev1') as session:
+            session.array_input_function(test_array)
+            self.patched_library.niFake_ArrayInputFunction.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt32Matcher(len(test_values)), matchers.ViReal64BufferMatcher(test_values))
+
+    @requires_python_3_memoryview
+    def test_array_input_function_with_non_contiguous_buffer(self):
+        test_array = memoryview(array.array('d', [1, 2, 3, 4, 5, 6, 7, 8]))[::2]
+        self.patched_library.niFake_ArrayInputFunction.side_effect = self.side_effects_helper.niFake_ArrayInputFunction
+        with nifake.Session('dev1') as session:
+            session.array_input_function(test_array)
+            self.patched_library.niFake_ArrayInputFunction.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt32Matcher(len(test_array)), matchers.ViReal64BufferMatcher([1.0, 3.0, 5.0, 7.0]))
+
+    def test_array_input_function_with_buffer_of_other_type(self):
+        test_array = array.array('i', [1, 2, 3, 4])
+        self.patched_library.niFake_ArrayInputFunction.side_effect = self.side_effects_helper.niFake_ArrayInputFunction
+        with nifake.Session('dev1') as session:
+            session.array_input_function(test_array)
+            self.patched_library.niFake_ArrayInputFunction.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt32Matcher(len(test_array)), matchers.ViReal64BufferMatcher([1.0, 2.0, 3.0, 4.0]))
+
     def test_return_multiple_types(self):
         self.patched_library.niFake_ReturnMultipleTypes.side_effect = self.side_effects_helper.niFake_ReturnMultipleTypes
         boolean_val = True
@@ -326,7 +535,8 @@ class TestSession(object):
             assert isinstance(result_array[0], float)
             assert result_string == string_val
             assert isinstance(result_string, six.text_type)
-            assert self.patched_library.niFake_ReturnMultipleTypes.call_count == 2
+            # The string fits in the default buffer, so there is no need to ask for its size first
+            assert self.patched_library.niFake_ReturnMultipleTypes.call_count == 1
 
     def test_multiple_array_types(self):
         self.patched_library.niFake_MultipleArrayTypes.side_effect = self.side_effects_helper.niFake_MultipleArrayTypes
@@ -403,6 +613,66 @@ class TestSession(object):
                 assert e.code == test_error_code
                 assert e.description == test_error_desc
 
+    def test_error_description_retrieved_when_used(self):
+        test_error_code = -42
+        test_error_desc = "The answer to the ultimate question"
+        self.patched_library.niFake_SimpleFunction.side_effect = self.side_effects_helper.niFake_SimpleFunction
+        self.side_effects_helper['SimpleFunction']['return'] = test_error_code
+        self.patched_library.niFake_GetError.side_effect = self.side_effects_helper.niFake_GetError
+        self.side_effects_helper['GetError']['errorCode'] = test_error_code
+        self.side_effects_helper['GetError']['description'] = test_error_desc
+        with nifake.Session('dev1') as session:
+            try:
+                session.simple_function()
+                assert False
+            except nifake.Error as e:
+                assert self.patched_library.niFake_GetError.call_count == 0
+                assert e.code == test_error_code
+                assert e.args == ('-42: ' + test_error_desc,)
+                assert str(e) == '-42: ' + test_error_desc
+                assert e.description == test_error_desc
+                assert self.patched_library.niFake_GetError.call_count == 1
+
+    def test_error_description_retrieved_after_another_error(self):
+        test_error_code = -42
+        test_error_desc = "The answer to the ultimate question"
+        self.patched_library.niFake_SimpleFunction.side_effect = self.side_effects_helper.niFake_SimpleFunction
+        self.side_effects_helper['SimpleFunction']['return'] = test_error_code
+        self.patched_library.niFake_GetError.side_effect = self.side_effects_helper.niFake_GetError
+        self.patched_library.niFake_error_message.side_effect = self.side_effects_helper.niFake_error_message
+        self.side_effects_helper['error_message']['errorMessage'] = test_error_desc
+        raised = []
+        with nifake.Session('dev1') as session:
+            for _ in range(2):
+                try:
+                    session.simple_function()
+                    assert False
+                except nifake.Error as e:
+                    raised.append(e)
+        # The session is closed and its last error is another one, so the description is the message for the code
+        self.side_effects_helper['GetError']['errorCode'] = -1
+        self.side_effects_helper['GetError']['description'] = "Description of another error"
+        assert [e.description for e in raised] == [test_error_desc, test_error_desc]
+        # The message of each code is only retrieved once
+        assert self.patched_library.niFake_error_message.call_count == 1
+
+    def test_error_description_of_another_error(self):
+        test_error_code = -42
+        test_error_desc = "The answer to the ultimate question"
+        self.patched_library.niFake_SimpleFunction.side_effect = self.side_effects_helper.niFake_SimpleFunction
+        self.side_effects_helper['SimpleFunction']['return'] = test_error_code
+        self.patched_library.niFake_GetError.side_effect = self.side_effects_helper.niFake_GetError
+        self.side_effects_helper['GetError']['errorCode'] = -1
+        self.side_effects_helper['GetError']['description'] = "Description of another error"
+        self.patched_library.niFake_error_message.side_effect = self.side_effects_helper.niFake_error_message
+        self.side_effects_helper['error_message']['errorMessage'] = test_error_desc
+        with nifake.Session('dev1') as session:
+            try:
+                session.simple_function()
+                assert False
+            except nifake.Error as e:
+                assert e.description == test_error_desc
+
     def test_error_with_rep_cap(self):
         test_error_code = -42
         test_error_desc = "The answer to the ultimate question"
@@ -450,15 +720,82 @@ class TestSession(object):
         test_error_desc = "The answer to the ultimate question, only positive"
         self.patched_library.niFake_SimpleFunction.side_effect = self.side_effects_helper.niFake_SimpleFunction
         self.side_effects_helper['SimpleFunction']['return'] = test_error_code
-        self.patched_library.niFake_GetError.side_effect = self.side_effects_helper.niFake_GetError
-        self.side_effects_helper['GetError']['errorCode'] = test_error_code
-        self.side_effects_helper['GetError']['description'] = test_error_desc
+        self.patched_library.niFake_error_message.side_effect = self.side_effects_helper.niFake_error_message
+        self.side_effects_helper['error_message']['errorMessage'] = test_error_desc
         with nifake.Session('dev1') as session:
             with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter('always')
                 session.simple_function()
                 assert len(w) == 1
                 assert issubclass(w[0].category, nifake.NifakeWarning)
                 assert test_error_desc in str(w[0].message)
+                assert w[0].message.code == test_error_code
+                # The message of each code is only retrieved once
+                session.simple_function()
+                assert len(w) == 2
+                assert test_error_desc in str(w[1].message)
+                self.patched_library.niFake_error_message.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt32Matcher(test_error_code), matchers.ViCharBufferMatcher(256))
+                self.patched_library.niFake_GetError.assert_not_called()
+
+    def test_warning_policy_once(self):
+        self.patched_library.niFake_SimpleFunction.side_effect = self.side_effects_helper.niFake_SimpleFunction
+        self.side_effects_helper['SimpleFunction']['return'] = 42
+        self.patched_library.niFake_error_message.side_effect = self.side_effects_helper.niFake_error_message
+        self.side_effects_helper['error_message']['errorMessage'] = 'Warning'
+        with nifake.Session('dev1') as session:
+            session.warning_policy.mode = 'once'
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter('always')
+                session.simple_function()
+                session.simple_function()
+                assert len(w) == 1
+                assert session.warning_policy.counts == {42: 2}
+                # Repeated capabilities share the policy of their session
+                assert session['0'].warning_policy is session.warning_policy
+                session.warning_policy.reset_counts()
+                session.simple_function()
+                assert len(w) == 2
+
+    def test_warning_policy_count(self):
+        self.patched_library.niFake_SimpleFunction.side_effect = self.side_effects_helper.niFake_SimpleFunction
+        self.side_effects_helper['SimpleFunction']['return'] = 42
+        with nifake.Session('dev1') as session:
+            session.warning_policy.mode = 'count'
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter('always')
+                for _ in range(5):
+                    session.simple_function()
+                self.side_effects_helper['SimpleFunction']['return'] = 43
+                session.simple_function()
+                assert len(w) == 0
+            assert session.warning_policy.counts == {42: 5, 43: 1}
+            # Descriptions of warnings that are only counted are never retrieved
+            self.patched_library.niFake_error_message.assert_not_called()
+            self.patched_library.niFake_GetError.assert_not_called()
+
+    def test_warning_policy_rate_limited(self):
+        self.patched_library.niFake_SimpleFunction.side_effect = self.side_effects_helper.niFake_SimpleFunction
+        self.side_effects_helper['SimpleFunction']['return'] = 42
+        self.patched_library.niFake_error_message.side_effect = self.side_effects_helper.niFake_error_message
+        self.side_effects_helper['error_message']['errorMessage'] = 'Warning'
+        with nifake.Session('dev1') as session:
+            session.warning_policy.mode = 'rate_limited'
+            session.warning_policy.interval = 3600.0
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter('always')
+                session.simple_function()
+                session.simple_function()
+                assert len(w) == 1
+                session.warning_policy.interval = 0.0
+                session.simple_function()
+                assert len(w) == 2
+            assert session.warning_policy.counts == {42: 3}
+
+    def test_warning_policy_invalid_mode(self):
+        with nifake.Session('dev1') as session:
+            with pytest.raises(ValueError):
+                session.warning_policy.mode = 'never'
+            assert session.warning_policy.mode == 'always'
 
     def test_read_with_warning(self):
         test_maximum_time = 10
@@ -468,9 +805,8 @@ class TestSession(object):
         self.patched_library.niFake_Read.side_effect = self.niFake_read_warning
         self.error_code_return = test_error_code
         self.reading = test_reading
-        self.patched_library.niFake_GetError.side_effect = self.side_effects_helper.niFake_GetError
-        self.side_effects_helper['GetError']['errorCode'] = test_error_code
-        self.side_effects_helper['GetError']['description'] = test_error_desc
+        self.patched_library.niFake_error_message.side_effect = self.side_effects_helper.niFake_error_message
+        self.side_effects_helper['error_message']['errorMessage'] = test_error_desc
         with nifake.Session('dev1') as session:
             with warnings.catch_warnings(record=True) as w:
                 assert math.isnan(session.read(test_maximum_time))
@@ -505,13 +841,26 @@ class TestSession(object):
         self.patched_library.niFake_GetAnIviDanceString.side_effect = self.side_effects_helper.niFake_GetAnIviDanceString
         string_val = 'Testing is fun?'
         self.side_effects_helper['GetAnIviDanceString']['aString'] = string_val
+        with nifake.Session('dev1') as session:
+            result_string = session.get_an_ivi_dance_string()
+            assert result_string == string_val
+            self.patched_library.niFake_GetAnIviDanceString.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt32Matcher(256), matchers.ViCharBufferMatcher(256))
+
+    def test_get_an_ivi_dance_string_longer_than_default_buffer(self):
+        self.patched_library.niFake_GetAnIviDanceString.side_effect = self.side_effects_helper.niFake_GetAnIviDanceString
+        string_val = 'Testing is fun?' * 20
+        self.side_effects_helper['GetAnIviDanceString']['aString'] = string_val
         with nifake.Session('dev1') as session:
             result_string = session.get_an_ivi_dance_string()
             assert result_string == string_val
             from mock import call
-            calls = [call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt32Matcher(0), None), call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt32Matcher(len(string_val)), matchers.ViCharBufferMatcher(len(string_val)))]
+            calls = [call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt32Matcher(256), matchers.ViCharBufferMatcher(256)), call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt32Matcher(0), None), call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt32Matcher(len(string_val)), matchers.ViCharBufferMatcher(len(string_val)))]
             self.patched_library.niFake_GetAnIviDanceString.assert_has_calls(calls)
-            assert self.patched_library.niFake_GetAnIviDanceString.call_count == 2
+            assert self.patched_library.niFake_GetAnIviDanceString.call_count == 3
+            # The size that was needed is used the next time
+            self.patched_library.niFake_GetAnIviDanceString.reset_mock()
+            assert session.get_an_ivi_dance_string() == string_val
+            self.patched_library.niFake_GetAnIviDanceString.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViInt32Matcher(len(string_val)), matchers.ViCharBufferMatcher(len(string_val)))
 
     def test_get_string_ivi_dance_error(self):
         test_error_code = -1234
@@ -559,6 +908,32 @@ class TestSession(object):
         self.patched_library.niFake_ReadFromChannel.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher('3'), matchers.ViInt32Matcher(test_maximum_time), matchers.ViReal64PointerMatcher())
         assert value == test_reading
 
+    def test_repeated_capability_views_are_reused(self):
+        self.patched_library.niFake_ReadFromChannel.side_effect = self.side_effects_helper.niFake_ReadFromChannel
+        self.side_effects_helper['ReadFromChannel']['reading'] = 5
+        with nifake.Session('dev1') as session:
+            view = session['3']
+            assert session['3'] is view
+            assert session['4'] is not view
+            channel_name_buffer = view._repeated_capability_ctype
+            view.read_from_channel(10)
+            view.read_from_channel(10)
+            for call in self.patched_library.niFake_ReadFromChannel.call_args_list:
+                assert call[0][1] is channel_name_buffer
+            assert channel_name_buffer.value == b'3'
+
+    def test_repeated_capability_views_are_bounded(self):
+        with nifake.Session('dev1') as session:
+            first = session['0']
+            for i in range(1, nifake.session._MAX_REPEATED_CAPABILITY_VIEWS):
+                session[str(i)]
+            assert session['0'] is first
+            # '1' is now the least recently used one
+            session['new']
+            assert len(session._repeated_capability_views) == nifake.session._MAX_REPEATED_CAPABILITY_VIEWS
+            assert session['0'] is first
+            assert '1' not in session._repeated_capability_views
+
     def test_device_method_not_exist_on_repeated_capability_error(self):
         with nifake.Session('dev1') as session:
             try:
@@ -610,10 +985,18 @@ class TestSession(object):
         with nifake.Session('dev1') as session:
             attr_string = session.read_write_string
             assert attr_string == string
-            from mock import call
-            calls = [call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher(''), matchers.ViInt32Matcher(1000002), matchers.ViInt32Matcher(0), None), call(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher(''), matchers.ViInt32Matcher(1000002), matchers.ViInt32Matcher(15), matchers.ViCharBufferMatcher(len(string)))]
-            self.patched_library.niFake_GetAttributeViString.assert_has_calls(calls)
-            assert self.patched_library.niFake_GetAttributeViString.call_count == 2
+            self.patched_library.niFake_GetAttributeViString.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher(''), matchers.ViInt32Matcher(1000002), matchers.ViInt32Matcher(256), matchers.ViCharBufferMatcher(256))
+
+    def test_get_attribute_string_buffer_size_by_attribute(self):
+        self.patched_library.niFake_GetAttributeViString.side_effect = self.side_effects_helper.niFake_GetAttributeViString
+        string = 'Testing is fun?' * 20
+        self.side_effects_helper['GetAttributeViString']['attributeValue'] = string
+        with nifake.Session('dev1') as session:
+            assert session.read_write_string == string
+            assert self.patched_library.niFake_GetAttributeViString.call_count == 3
+            assert nifake.session._ivi_dance_buffer_sizes[('GetAttributeViString', 1000002)] == len(string)
+            assert session.read_write_string == string
+            assert self.patched_library.niFake_GetAttributeViString.call_count == 4
 
     def test_set_attribute_string(self):
         self.patched_library.niFake_SetAttributeViString.side_effect = self.side_effects_helper.niFake_SetAttributeViString
@@ -646,6 +1029,13 @@ class TestSession(object):
             attribute_id = 1000003
             self.patched_library.niFake_GetAttributeViInt32.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher(''), matchers.ViInt32Matcher(attribute_id), matchers.ViInt32PointerMatcher())
 
+    def test_get_attribute_enum_invalid_value(self):
+        self.patched_library.niFake_GetAttributeViInt32.side_effect = self.side_effects_helper.niFake_GetAttributeViInt32
+        self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = 42
+        with nifake.Session('dev1') as session:
+            with pytest.raises(ValueError):
+                session.read_write_color
+
     def test_set_attribute_enum_int32(self):
         self.patched_library.niFake_SetAttributeViInt32.side_effect = self.side_effects_helper.niFake_SetAttributeViInt32
         enum_value = nifake.Color.RED
@@ -706,6 +1096,168 @@ class TestSession(object):
             session.read_write_int64 = test_number
             self.patched_library.niFake_SetAttributeViInt64.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher(''), matchers.ViInt32Matcher(attribute_id), matchers.ViInt64Matcher(test_number))
 
+    def test_attribute_cache_disabled_by_default(self):
+        self.patched_library.niFake_GetAttributeViInt32.side_effect = self.side_effects_helper.niFake_GetAttributeViInt32
+        self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = 3
+        with nifake.Session('dev1') as session:
+            assert session.read_write_integer == 3
+            assert session.read_write_integer == 3
+            assert self.patched_library.niFake_GetAttributeViInt32.call_count == 2
+
+    def test_attribute_cache_get(self):
+        self.patched_library.niFake_GetAttributeViInt32.side_effect = self.side_effects_helper.niFake_GetAttributeViInt32
+        self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = 3
+        with nifake.Session('dev1') as session:
+            session.enable_attribute_cache()
+            assert session.read_write_integer == 3
+            assert session.read_write_integer == 3
+            assert self.patched_library.niFake_GetAttributeViInt32.call_count == 1
+            # Each repeated capability has its own value
+            assert session['0'].read_write_integer == 3
+            assert self.patched_library.niFake_GetAttributeViInt32.call_count == 2
+
+    def test_attribute_cache_write_through(self):
+        self.patched_library.niFake_SetAttributeViReal64.side_effect = self.side_effects_helper.niFake_SetAttributeViReal64
+        self.patched_library.niFake_SetAttributeViInt32.side_effect = self.side_effects_helper.niFake_SetAttributeViInt32
+        with nifake.Session('dev1') as session:
+            session.enable_attribute_cache()
+            session.read_write_double = 2
+            session.read_write_color = nifake.Color.BLUE
+            assert session.read_write_double == 2.0
+            assert isinstance(session.read_write_double, float)
+            assert session.read_write_color == nifake.Color.BLUE
+            self.patched_library.niFake_GetAttributeViReal64.assert_not_called()
+            self.patched_library.niFake_GetAttributeViInt32.assert_not_called()
+
+    def test_attribute_cache_set_replaces_other_repeated_capabilities(self):
+        self.patched_library.niFake_GetAttributeViInt32.side_effect = self.side_effects_helper.niFake_GetAttributeViInt32
+        self.patched_library.niFake_SetAttributeViInt32.side_effect = self.side_effects_helper.niFake_SetAttributeViInt32
+        self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = 3
+        with nifake.Session('dev1') as session:
+            session.enable_attribute_cache()
+            session['0'].read_write_integer = 1
+            session['0,1'].read_write_integer = 2
+            assert session['0,1'].read_write_integer == 2
+            assert session['0'].read_write_integer == 3
+            assert self.patched_library.niFake_GetAttributeViInt32.call_count == 1
+
+    def test_attribute_cache_volatile_attribute_not_cached(self):
+        self.patched_library.niFake_GetAttributeViInt64.side_effect = self.side_effects_helper.niFake_GetAttributeViInt64
+        self.patched_library.niFake_SetAttributeViInt64.side_effect = self.side_effects_helper.niFake_SetAttributeViInt64
+        self.side_effects_helper['GetAttributeViInt64']['attributeValue'] = 6
+        with nifake.Session('dev1') as session:
+            session.enable_attribute_cache()
+            session.read_write_int64 = 5
+            assert session.read_write_int64 == 6
+            assert session.read_write_int64 == 6
+            assert self.patched_library.niFake_GetAttributeViInt64.call_count == 2
+
+    def test_attribute_cache_cleared(self):
+        self.patched_library.niFake_GetAttributeViInt32.side_effect = self.side_effects_helper.niFake_GetAttributeViInt32
+        self.patched_library.niFake_SimpleFunction.side_effect = self.side_effects_helper.niFake_SimpleFunction
+        self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = 3
+        with nifake.Session('dev1') as session:
+            session.enable_attribute_cache()
+            assert session.read_write_integer == 3
+            session.simple_function()
+            assert session.read_write_integer == 3
+            assert self.patched_library.niFake_GetAttributeViInt32.call_count == 2
+            session.disable_attribute_cache()
+            assert session.read_write_integer == 3
+            assert self.patched_library.niFake_GetAttributeViInt32.call_count == 3
+
+    def _set_attribute_side_effects(self):
+        for t in ['ViBoolean', 'ViInt32', 'ViInt64', 'ViReal64', 'ViString']:
+            getattr(self.patched_library, 'niFake_GetAttribute' + t).side_effect = getattr(self.side_effects_helper, 'niFake_GetAttribute' + t)
+            getattr(self.patched_library, 'niFake_SetAttribute' + t).side_effect = getattr(self.side_effects_helper, 'niFake_SetAttribute' + t)
+        self.side_effects_helper['GetAttributeViBoolean']['attributeValue'] = True
+        self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = 1
+        self.side_effects_helper['GetAttributeViInt64']['attributeValue'] = 6
+        self.side_effects_helper['GetAttributeViReal64']['attributeValue'] = 3.5
+        self.side_effects_helper['GetAttributeViString']['attributeValue'] = 'Hello'
+
+    def test_get_attributes(self):
+        self._set_attribute_side_effects()
+        with nifake.Session('dev1') as session:
+            values = session.get_attributes(['read_write_integer', 1000003, 'float_enum', 'read_write_string'])
+            assert list(values.items()) == [('read_write_integer', 1), ('read_write_color', nifake.Color.RED), ('float_enum', nifake.FloatEnum._3_5), ('read_write_string', 'Hello')]
+            assert self.patched_library.niFake_GetAttributeViInt32.call_count == 2
+            assert self.patched_library.niFake_GetAttributeViReal64.call_count == 1
+
+    def test_get_attributes_unicode_names(self):
+        self._set_attribute_side_effects()
+        with nifake.Session('dev1') as session:
+            assert session.get_attributes([u'read_write_integer']) == {'read_write_integer': 1}
+
+    def test_get_attributes_unknown_enum_value(self):
+        self._set_attribute_side_effects()
+        self.side_effects_helper['GetAttributeViInt32']['attributeValue'] = 99
+        with nifake.Session('dev1') as session:
+            # Same error as reading the property
+            with pytest.raises(ValueError):
+                session.read_write_color
+            with pytest.raises(ValueError):
+                session.get_attributes(['read_write_color'])
+
+    def test_get_attributes_channels(self):
+        self._set_attribute_side_effects()
+        with nifake.Session('dev1') as session:
+            assert session.get_attributes(['read_write_integer'], channels='0,1') == {'read_write_integer': 1}
+        self.patched_library.niFake_GetAttributeViInt32.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher('0,1'), matchers.ViInt32Matcher(1000004), matchers.ViInt32PointerMatcher())
+
+    def test_get_attributes_uses_attribute_cache(self):
+        self._set_attribute_side_effects()
+        with nifake.Session('dev1') as session:
+            session.enable_attribute_cache()
+            assert session.read_write_double == 3.5
+            assert session.get_attributes(['read_write_double', 'read_write_int64']) == {'read_write_double': 3.5, 'read_write_int64': 6}
+            assert self.patched_library.niFake_GetAttributeViReal64.call_count == 1
+            assert self.patched_library.niFake_GetAttributeViInt64.call_count == 1
+
+    def test_get_attributes_unknown_attribute(self):
+        with nifake.Session('dev1') as session:
+            try:
+                session.get_attributes(['read_write_integer', 'non_existent_property'])
+                assert False
+            except ValueError as e:
+                assert str(e) == "'non_existent_property' is not an attribute of NI-FAKE"
+
+    def test_snapshot(self):
+        self._set_attribute_side_effects()
+        self.patched_library.niFake_GetAttributeViBoolean.side_effect = None
+        self.patched_library.niFake_GetAttributeViBoolean.return_value = -1
+        self.patched_library.niFake_GetError.side_effect = self.side_effects_helper.niFake_GetError
+        self.side_effects_helper['GetError']['errorCode'] = -1
+        self.side_effects_helper['GetError']['description'] = 'Not supported'
+        with nifake.Session('dev1') as session:
+            snapshot = session.snapshot()
+        # read_write_bool returns an error and read_write_int64 is volatile, so they are left out
+        assert list(snapshot.items()) == [
+            ('read_write_double', 3.5),
+            ('read_write_string', 'Hello'),
+            ('read_write_color', nifake.Color.RED),
+            ('read_write_integer', 1),
+            ('float_enum', nifake.FloatEnum._3_5),
+        ]
+
+    def test_apply_sets_changed_attributes(self):
+        self._set_attribute_side_effects()
+        with nifake.Session('dev1') as session:
+            changed = session.apply({'read_write_integer': 1, 'read_write_double': 3.5, 'read_write_color': nifake.Color.BLUE, 'read_write_string': 'Goodbye'})
+        assert sorted(changed) == ['read_write_color', 'read_write_string']
+        self.patched_library.niFake_SetAttributeViInt32.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher(''), matchers.ViInt32Matcher(1000003), matchers.ViInt32Matcher(2))
+        self.patched_library.niFake_SetAttributeViString.assert_called_once_with(matchers.ViSessionMatcher(SESSION_NUM_FOR_TEST), matchers.ViStringMatcher(''), matchers.ViInt32Matcher(1000002), matchers.ViStringMatcher('Goodbye'))
+        self.patched_library.niFake_SetAttributeViReal64.assert_not_called()
+
+    def test_apply_enum_type_error(self):
+        self._set_attribute_side_effects()
+        with nifake.Session('dev1') as session:
+            try:
+                session.apply({'read_write_color': 2})
+                assert False
+            except TypeError as e:
+                assert str(e) == 'read_write_color must be Color not int'
+
     def test_get_attribute_error(self):
         test_error_code = -123
         test_error_desc = "ascending order"
@@ -772,6 +1324,25 @@ class TestSession(object):
             except AttributeError as e:
                 assert str(e) == "'_RepeatedCapability' object has no attribute 'non_existent_property'"
 
+    def test_set_properties_of_session_subclass(self):
+        class SessionWithNotes(nifake.Session):
+            notes = None
+
+        with SessionWithNotes('dev1') as session:
+            session.notes = 'Bench 1'
+            assert session.notes == 'Bench 1'
+            try:
+                session.non_existent_property = 5
+                assert False
+            except AttributeError as e:
+                assert str(e) == "'SessionWithNotes' object has no attribute 'non_existent_property'"
+        with nifake.Session('dev1') as session:
+            try:
+                session.notes = 'Bench 1'
+                assert False
+            except AttributeError as e:
+                assert str(e) == "'Session' object has no attribute 'notes'"
+
     def test_set_enum_attribute_int32_error(self):
         with nifake.Session('dev1') as session:
             try:
@@ -0,0 +1,92 @@
+import nifake
+import nifake.simulator
+import pytest
+import time
+
+from nifake import library_singleton
+
+
+class TestSimulator(object):
+
+    def setup_method(self, method):
+        self.simulator = nifake.simulator.Simulator(array_size=4)
+        library_singleton.set_backend(self.simulator)
+
+    def teardown_method(self, method):
+        library_singleton.set_backend(None)
+
+    def test_set_backend(self):
+        library = library_singleton.get()
+        assert library is library_singleton.get()
+        assert library._library is self.simulator
+
+    def test_attributes_keep_their_value(self):
+        with nifake.Session('dev1') as session:
+            assert session.read_write_double == 0.0
+            assert session.read_write_color == nifake.Color.RED
+            session.read_write_double = 4.2
+            session.read_write_string = 'Hello'
+            session.read_write_bool = True
+            assert session.read_write_double == 4.2
+            assert session.read_write_string == 'Hello'
+            assert session.read_write_bool is True
+
+    def test_attributes_are_per_session(self):
+        with nifake.Session('dev1') as session1, nifake.Session('dev2') as session2:
+            session1.read_write_integer = 5
+            assert session1.read_write_integer == 5
+            assert session2.read_write_integer == 0
+
+    def test_channel_specific_attributes(self):
+        with nifake.Session('dev1') as session:
+            session.read_write_integer = 1
+            session['0'].read_write_integer = 2
+            assert session['0'].read_write_integer == 2
+            assert session['1'].read_write_integer == 1
+            session.read_write_integer = 3
+            assert session['0'].read_write_integer == 3
+
+    def test_initial_attribute_values(self):
+        library_singleton.set_backend(nifake.simulator.Simulator(attribute_values={1000004: 7}))
+        with nifake.Session('dev1') as session:
+            assert session.read_write_integer == 7
+
+    def test_set_attribute_value(self):
+        with nifake.Session('dev1') as session:
+            session.read_write_integer = 1
+            self.simulator.set_attribute_value(1000004, 7)  # READ_WRITE_INTEGER
+            assert session.read_write_integer == 7
+            with nifake.Session('dev2') as session2:
+                assert session2.read_write_integer == 7
+
+    def test_volatile_attribute_read_again_with_attribute_cache(self):
+        with nifake.Session('dev1') as session:
+            session.enable_attribute_cache()
+            assert session.read_write_int64 == 0
+            assert session.read_write_integer == 0
+            self.simulator.set_attribute_value(1000006, 7)  # READ_WRITE_INT64, which is volatile
+            self.simulator.set_attribute_value(1000004, 7)  # READ_WRITE_INTEGER
+            assert session.read_write_int64 == 7
+            # Not volatile, so the value is still the cached one
+            assert session.read_write_integer == 0
+
+    def test_output_buffers_filled_with_synthetic_data(self):
+        with nifake.Session('dev1') as session:
+            readings, actual_number_of_points = session.read_multi_point(1, 10)
+            assert actual_number_of_points == 10
+            assert readings[0] == 0.0
+            assert readings[1] == pytest.approx(0.0627905195)
+            assert session.get_array_using_ivi_dance() == readings[:4]
+
+    def test_output_values(self):
+        library_singleton.set_backend(nifake.simulator.Simulator(output_values={'GetANumber': {'aNumber': 42}, 'GetAnIviDanceString': {'aString': 'Hi'}}))
+        with nifake.Session('dev1') as session:
+            assert session.get_a_number() == 42
+            assert session.get_an_ivi_dance_string() == 'Hi'
+
+    def test_latency(self):
+        self.simulator.latency = 0.01
+        with nifake.Session('dev1') as session:
+            start = time.time()
+            session.simple_function()
+            assert time.time() - start >= 0.01
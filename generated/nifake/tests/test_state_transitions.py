@@ -0,0 +1,109 @@
+import collections
+import nifake
+import nifake.simulator
+import nifake.state_transitions
+import pytest
+
+from nifake import library_singleton
+
+
+class SessionWithCommit(nifake.Session):
+    commits = 0
+
+    def commit(self):
+        self.commits += 1
+
+
+_states = {
+    # Ordered, so that channels are written in the same order on every version of Python
+    'a': collections.OrderedDict([
+        ('', {'read_write_double': 1.0, 'read_write_color': nifake.Color.RED}),
+        ('0,1', {'read_write_integer': 5}),
+        ('2', {'read_write_integer': 5}),
+        ('3', {'read_write_integer': 7}),
+    ]),
+    'b': {
+        '': {'read_write_double': 1.0, 'read_write_color': nifake.Color.BLUE},
+        '0,1,2,3': {'read_write_integer': 5},
+    },
+    'c': {
+        '': {'read_write_integer': 5},
+    },
+}
+
+
+class TestStateTransitions(object):
+
+    def setup_method(self, method):
+        library_singleton.set_backend(nifake.simulator.Simulator())
+
+    def teardown_method(self, method):
+        library_singleton.set_backend(None)
+
+    def test_first_transition_writes_everything(self):
+        with SessionWithCommit('dev1') as session:
+            machine = nifake.state_transitions.StateMachine(session, _states)
+            writes = machine.transition('a')
+            assert sorted(writes[:2]) == [('', 'read_write_color', nifake.Color.RED), ('', 'read_write_double', 1.0)]
+            # Channels with the same value are written together
+            assert writes[2:] == [('0,1,2', 'read_write_integer', 5), ('3', 'read_write_integer', 7)]
+            assert session.commits == 1
+            assert machine.current == 'a'
+            assert session['1'].read_write_integer == 5
+            assert session['3'].read_write_integer == 7
+            assert session.read_write_color == nifake.Color.RED
+
+    def test_writes_keep_the_order_of_the_state(self):
+        states = {
+            'd': collections.OrderedDict([
+                ('0', collections.OrderedDict([('read_write_integer', 1), ('read_write_double', 2.0)])),
+                ('', {'read_write_color': nifake.Color.BLUE}),
+                ('1', {'read_write_integer': 1}),
+            ]),
+        }
+        with nifake.Session('dev1') as session:
+            machine = nifake.state_transitions.StateMachine(session, states)
+            assert machine.transition('d') == [('0,1', 'read_write_integer', 1), ('0', 'read_write_double', 2.0), ('', 'read_write_color', nifake.Color.BLUE)]
+            assert session['1'].read_write_integer == 1
+            assert session.read_write_color == nifake.Color.BLUE
+
+    def test_transitions_only_write_changes(self):
+        with SessionWithCommit('dev1') as session:
+            machine = nifake.state_transitions.StateMachine(session, _states)
+            machine.transition('a')
+            assert machine.transition('b') == [('', 'read_write_color', nifake.Color.BLUE), ('3', 'read_write_integer', 5)]
+            assert machine.transition('b') == []
+            assert session.commits == 2
+            assert session['3'].read_write_integer == 5
+
+    def test_all_channels_write_replaces_channel_values(self):
+        with nifake.Session('dev1') as session:
+            machine = nifake.state_transitions.StateMachine(session, _states)
+            machine.transition('a')
+            # Channel 3 has another value, so all channels are written
+            assert machine.plan('c') == [('', 'read_write_integer', 5)]
+            machine.transition('c')
+            assert machine.plan('b') == [('', 'read_write_color', nifake.Color.BLUE)]
+
+    def test_invalidated_by_session_methods(self):
+        with nifake.Session('dev1') as session:
+            machine = nifake.state_transitions.StateMachine(session, _states)
+            machine.transition('b')
+            assert machine.plan('b') == []
+            # simple_function() invalidates the attribute cache
+            session.simple_function()
+            assert len(machine.plan('b')) == 3
+            machine.transition('b')
+            machine.invalidate()
+            assert machine.current is None
+            assert len(machine.plan('b')) == 3
+
+    def test_errors(self):
+        with nifake.Session('dev1') as session:
+            with pytest.raises(ValueError):
+                nifake.state_transitions.StateMachine(session, {'a': {'': {'non_existent_property': 1}}})
+            machine = nifake.state_transitions.StateMachine(session, _states)
+            with pytest.raises(ValueError):
+                machine.transition('d')
+            with pytest.raises(TypeError):
+                nifake.state_transitions.StateMachine(session, {'a': {'': {'read_write_color': 1}}}).transition('a')
@@ -12,6 +12,7 @@ ViSession = ctypes.c_ulong
 ViChar = ctypes.c_char
 ViUInt32 = ctypes.c_ulong
 ViInt32 = ctypes.c_long
+ViInt8 = ctypes.c_byte
 ViInt16 = ctypes.c_short
 ViUInt16 = ctypes.c_ushort
 ViInt64 = ctypes.c_longlong
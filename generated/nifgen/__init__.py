@@ -1,8 +1,86 @@
 #!/usr/bin/python
 # This file was generated
 
-from nifgen.enums import *          # noqa: F403,F401,H303
-from nifgen.errors import Error     # noqa: F401
-from nifgen.errors import NifgenWarning   # noqa: F401
-from nifgen.session import Session  # noqa: F401
+import sys
 
+# Modules are imported when one of their names is first used, so that importing the package is fast
+_lazy_names = {
+    'AnalogPath': 'enums',
+    'BusType': 'enums',
+    'CalADCInput': 'enums',
+    'ClockMode': 'enums',
+    'DataMarkerEventLevelPolarity': 'enums',
+    'DataProcessingMode': 'enums',
+    'DoneEventActiveLevel': 'enums',
+    'DoneEventDelayUnits': 'enums',
+    'DoneEventOutputBehavior': 'enums',
+    'DoneEventPulsePolarity': 'enums',
+    'DoneEventPulseWidthUnits': 'enums',
+    'Error': 'errors',
+    'FilterType': 'enums',
+    'IdleBehavior': 'enums',
+    'MarkerEventDelayUnits': 'enums',
+    'MarkerEventOutputBehavior': 'enums',
+    'MarkerEventPulsePolarity': 'enums',
+    'MarkerEventPulseWidthUnits': 'enums',
+    'MarkerEventToggleInitialState': 'enums',
+    'NifgenWarning': 'errors',
+    'OSPMode': 'enums',
+    'OSPOverflowErrorReporting': 'enums',
+    'OperationMode': 'enums',
+    'OutputMode': 'enums',
+    'P2PAddressType': 'enums',
+    'ReadyForStartEventActiveLevel': 'enums',
+    'ReferenceClockSource': 'enums',
+    'RelativeTo': 'enums',
+    'SampleClockSource': 'enums',
+    'SampleClockTimebaseSource': 'enums',
+    'ScriptTriggerDigitalEdgeEdge': 'enums',
+    'ScriptTriggerDigitalLevelActiveLevel': 'enums',
+    'ScriptTriggerType': 'enums',
+    'Session': 'session',
+    'StartTriggerDigitalEdgeEdge': 'enums',
+    'StartTriggerType': 'enums',
+    'StartedEventActiveLevel': 'enums',
+    'StartedEventDelayUnits': 'enums',
+    'StartedEventOutputBehavior': 'enums',
+    'StartedEventPulsePolarity': 'enums',
+    'StartedEventPulseWidthUnits': 'enums',
+    'SynchronizationSource': 'enums',
+    'TerminalConfiguration': 'enums',
+    'TriggerMode': 'enums',
+    'TriggerSource': 'enums',
+    'UpdateClockSource': 'enums',
+    'VideoWaveformType': 'enums',
+    'WaitBehavior': 'enums',
+    'Waveform': 'enums',
+}
+
+__all__ = sorted(_lazy_names)
+
+if sys.version_info >= (3, 7):
+    import importlib
+    import importlib.util
+
+    def __getattr__(name):
+        if name in _lazy_names:
+            submodule = importlib.import_module('nifgen.' + _lazy_names[name])
+            # Next time, all the names of the module are found without calling __getattr__. This also replaces the
+            # module in the package with the name it exports, when they are the same.
+            for n in _lazy_names:
+                if _lazy_names[n] == _lazy_names[name]:
+                    globals()[n] = getattr(submodule, n)
+            return globals()[name]
+        # Modules of the package are attributes of it once imported, as they were when the package imported them all
+        if not name.startswith('__') and importlib.util.find_spec('nifgen.' + name) is not None:
+            return importlib.import_module('nifgen.' + name)
+        raise AttributeError("module 'nifgen' has no attribute '{0}'".format(name))
+
+    def __dir__():
+        return sorted(set(globals()) | set(_lazy_names))
+else:
+    # Module __getattr__ needs Python 3.7
+    from nifgen.enums import *          # noqa: F403,F401,H303
+    from nifgen.errors import Error     # noqa: F401
+    from nifgen.errors import NifgenWarning   # noqa: F401
+    from nifgen.session import Session  # noqa: F401
@@ -1,68 +1,132 @@
 # -*- coding: utf-8 -*-
 # This file was generated
+import collections
+import ctypes
+
+from nifgen import enums
+from nifgen import errors
+from nifgen import visatype
+
+
+class AttributeCache(object):
+    '''Values of the attributes of a session, by attribute ID and repeated capability.
+
+    Shared by a session and all its repeated capabilities. Disabled until the session enables it. generation counts how
+    many times it was cleared, so that others can tell when the values of attributes may have changed.
+    '''
+
+    def __init__(self):
+        self.enabled = False
+        self.values = {}
+        self.generation = 0
+
+    def clear(self):
+        self.values.clear()
+        self.generation += 1
 
 
 class Attribute(object):
     '''Base class for all typed attributes.'''
 
-    def __init__(self, attribute_id):
+    def __init__(self, attribute_id, volatile=False):
         self._attribute_id = attribute_id
+        self._volatile = volatile
+
+    def _convert(self, value):
+        '''Returns value as the type that the getter returns, so the cache returns the same thing the driver would'''
+        return value
+
+    def _get(self, session, getter):
+        cache = session._attribute_cache
+        if not cache.enabled or self._volatile:
+            return getter(self._attribute_id)
+        values = cache.values.get(self._attribute_id)
+        if values is not None and session._repeated_capability in values:
+            return values[session._repeated_capability]
+        value = getter(self._attribute_id)
+        cache.values.setdefault(self._attribute_id, {})[session._repeated_capability] = value
+        return value
+
+    def _set(self, session, setter, value):
+        setter(self._attribute_id, value)
+        cache = session._attribute_cache
+        if cache.enabled and not self._volatile:
+            # Write-through. Values cached for other repeated capabilities are dropped, since they may overlap
+            cache.values[self._attribute_id] = {session._repeated_capability: self._convert(value)}
 
 
 class AttributeViInt32(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_int32(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_int32)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_int32(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_int32, value)
+
+    def _convert(self, value):
+        return int(value)
 
 
 class AttributeViInt64(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_int64(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_int64)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_int64(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_int64, value)
+
+    def _convert(self, value):
+        return int(value)
 
 
 class AttributeViReal64(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_real64(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_real64)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_real64(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_real64, value)
+
+    def _convert(self, value):
+        return float(value)
 
 
 class AttributeViString(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_string(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_string)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_string(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_string, value)
 
 
 class AttributeViBoolean(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_boolean(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_boolean)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_boolean(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_boolean, value)
+
+    def _convert(self, value):
+        return bool(value)
 
 
 class AttributeEnum(object):
 
-    def __init__(self, underlying_attribute_meta_class, enum_meta_class, attribute_id):
-        self._underlying_attribute = underlying_attribute_meta_class(attribute_id)
+    def __init__(self, underlying_attribute_meta_class, enum_meta_class, attribute_id, volatile=False):
+        self._underlying_attribute = underlying_attribute_meta_class(attribute_id, volatile)
         self._attribute_type = enum_meta_class
         self._attribute_id = attribute_id
+        self._members_by_value = enums._members_by_value[enum_meta_class]
 
     def __get__(self, session, session_type):
-        return self._attribute_type(self._underlying_attribute.__get__(session, session_type))
+        value = self._underlying_attribute.__get__(session, session_type)
+        try:
+            return self._members_by_value[value]
+        except KeyError:
+            # Raises ValueError, as the enum does for values it doesn't have
+            return self._attribute_type(value)
 
     def __set__(self, session, value):
         if type(value) is not self._attribute_type:
@@ -70,3 +134,346 @@ class AttributeEnum(object):
         return self._underlying_attribute.__set__(session, value.value)
 
 
+# (attribute_id, python_name, type, enum, channel_based, access, volatile) of an attribute. enum is the enum class or None,
+# channel_based is True if it can be used with repeated capabilities, and access is 'read-write', 'read only' or 'write only'.
+AttributeInfo = collections.namedtuple('AttributeInfo', ['attribute_id', 'python_name', 'type', 'enum', 'channel_based', 'access', 'volatile'])
+
+# Every attribute of NI-FGEN, by attribute ID
+index = {
+    1050002: AttributeInfo(1050002, 'range_check', 'ViBoolean', None, False, 'read-write', False),
+    1050003: AttributeInfo(1050003, 'query_instrument_status', 'ViBoolean', None, False, 'read-write', False),
+    1050004: AttributeInfo(1050004, 'cache', 'ViBoolean', None, False, 'read-write', False),
+    1050005: AttributeInfo(1050005, 'simulate', 'ViBoolean', None, False, 'read-write', False),
+    1050006: AttributeInfo(1050006, 'record_coercions', 'ViBoolean', None, False, 'read-write', False),
+    1050007: AttributeInfo(1050007, 'driver_setup', 'ViString', None, False, 'read only', False),
+    1050021: AttributeInfo(1050021, 'interchange_check', 'ViBoolean', None, False, 'read-write', False),
+    1050101: AttributeInfo(1050101, 'primary_error', 'ViInt32', None, False, 'read-write', False),
+    1050102: AttributeInfo(1050102, 'secondary_error', 'ViInt32', None, False, 'read-write', False),
+    1050103: AttributeInfo(1050103, 'error_elaboration', 'ViString', None, False, 'read-write', False),
+    1050203: AttributeInfo(1050203, 'channel_count', 'ViInt32', None, False, 'read only', False),
+    1050302: AttributeInfo(1050302, 'specific_driver_prefix', 'ViString', None, False, 'read only', False),
+    1050304: AttributeInfo(1050304, 'io_resource_descriptor', 'ViString', None, False, 'read only', False),
+    1050305: AttributeInfo(1050305, 'logical_name', 'ViString', None, False, 'read only', False),
+    1050327: AttributeInfo(1050327, 'supported_instrument_models', 'ViString', None, False, 'read only', False),
+    1050401: AttributeInfo(1050401, 'group_capabilities', 'ViString', None, False, 'read only', False),
+    1050503: AttributeInfo(1050503, 'major_version', 'ViInt32', None, False, 'read only', False),
+    1050504: AttributeInfo(1050504, 'minor_version', 'ViInt32', None, False, 'read only', False),
+    1050510: AttributeInfo(1050510, 'instrument_firmware_revision', 'ViString', None, False, 'read only', False),
+    1050511: AttributeInfo(1050511, 'instrument_manufacturer', 'ViString', None, False, 'read only', False),
+    1050512: AttributeInfo(1050512, 'instrument_model', 'ViString', None, False, 'read only', False),
+    1050513: AttributeInfo(1050513, 'specific_driver_vendor', 'ViString', None, False, 'read only', False),
+    1050514: AttributeInfo(1050514, 'specific_driver_description', 'ViString', None, False, 'read only', False),
+    1050515: AttributeInfo(1050515, 'specific_driver_class_spec_major_version', 'ViInt32', None, False, 'read only', False),
+    1050516: AttributeInfo(1050516, 'specific_driver_class_spec_minor_version', 'ViInt32', None, False, 'read only', False),
+    1050551: AttributeInfo(1050551, 'specific_driver_revision', 'ViString', None, False, 'read only', False),
+    1150001: AttributeInfo(1150001, 'id_query_response', 'ViString', None, False, 'read only', False),
+    1150101: AttributeInfo(1150101, 'digital_pattern_enabled', 'ViBoolean', None, False, 'read-write', False),
+    1150102: AttributeInfo(1150102, 'digital_filter_enabled', 'ViBoolean', None, False, 'read-write', False),
+    1150103: AttributeInfo(1150103, 'analog_filter_enabled', 'ViBoolean', None, False, 'read-write', False),
+    1150104: AttributeInfo(1150104, 'filter_correction_frequency', 'ViReal64', None, False, 'read-write', False),
+    1150105: AttributeInfo(1150105, 'sync_duty_cycle_high', 'ViReal64', None, False, 'read-write', False),
+    1150106: AttributeInfo(1150106, 'update_clock_source', 'ViInt32', enums.UpdateClockSource, False, 'read-write', False),
+    1150107: AttributeInfo(1150107, 'ref_clock_frequency', 'ViReal64', None, False, 'read-write', False),
+    1150108: AttributeInfo(1150108, 'trigger_mode', 'ViInt32', enums.TriggerMode, False, 'read-write', False),
+    1150109: AttributeInfo(1150109, 'actual_arb_sample_rate', 'ViReal64', None, False, 'read only', False),
+    1150110: AttributeInfo(1150110, 'clock_mode', 'ViInt32', enums.ClockMode, False, 'read-write', False),
+    1150111: AttributeInfo(1150111, 'synchronization', 'ViInt32', enums.SynchronizationSource, False, 'read-write', False),
+    1150112: AttributeInfo(1150112, 'sample_clock_source', 'ViString', enums.SampleClockSource, False, 'read-write', False),
+    1150113: AttributeInfo(1150113, 'reference_clock_source', 'ViString', enums.ReferenceClockSource, False, 'read-write', False),
+    1150208: AttributeInfo(1150208, 'freq_list_handle', 'ViInt32', None, False, 'read-write', False),
+    1150209: AttributeInfo(1150209, 'max_num_freq_lists', 'ViInt32', None, False, 'read only', False),
+    1150210: AttributeInfo(1150210, 'min_freq_list_length', 'ViInt32', None, False, 'read only', False),
+    1150211: AttributeInfo(1150211, 'max_freq_list_length', 'ViInt32', None, False, 'read only', False),
+    1150212: AttributeInfo(1150212, 'min_freq_list_duration', 'ViReal64', None, False, 'read only', False),
+    1150213: AttributeInfo(1150213, 'max_freq_list_duration', 'ViReal64', None, False, 'read only', False),
+    1150214: AttributeInfo(1150214, 'freq_list_duration_quantum', 'ViReal64', None, False, 'read-write', False),
+    1150215: AttributeInfo(1150215, 'bus_type', 'ViInt32', enums.BusType, False, 'read only', False),
+    1150216: AttributeInfo(1150216, 'video_waveform_type', 'ViInt32', enums.VideoWaveformType, False, 'read-write', False),
+    1150218: AttributeInfo(1150218, 'digital_filter_interpolation_factor', 'ViReal64', None, False, 'read-write', False),
+    1150219: AttributeInfo(1150219, 'exported_sample_clock_divisor', 'ViInt32', None, False, 'read-write', False),
+    1150220: AttributeInfo(1150220, 'load_impedance', 'ViReal64', None, False, 'read-write', False),
+    1150221: AttributeInfo(1150221, 'daqmx_task', 'ViInt32', None, False, 'read only', False),
+    1150222: AttributeInfo(1150222, 'analog_path', 'ViInt32', enums.AnalogPath, False, 'read-write', False),
+    1150223: AttributeInfo(1150223, 'gain_dac_value', 'ViInt32', None, False, 'read-write', False),
+    1150224: AttributeInfo(1150224, 'offset_dac_value', 'ViInt32', None, False, 'read-write', False),
+    1150225: AttributeInfo(1150225, 'oscillator_freq_dac_value', 'ViInt32', None, False, 'read-write', False),
+    1150227: AttributeInfo(1150227, 'cal_adc_input', 'ViInt32', enums.CalADCInput, False, 'read-write', False),
+    1150228: AttributeInfo(1150228, 'pre_amplifier_attenuation', 'ViReal64', None, False, 'read-write', False),
+    1150229: AttributeInfo(1150229, 'post_amplifier_attenuation', 'ViReal64', None, False, 'read-write', False),
+    1150230: AttributeInfo(1150230, 'exported_sample_clock_timebase_divisor', 'ViInt32', None, False, 'read-write', False),
+    1150231: AttributeInfo(1150231, 'sample_clock_absolute_delay', 'ViReal64', None, False, 'read-write', False),
+    1150232: AttributeInfo(1150232, 'oscillator_phase_dac_value', 'ViInt32', None, False, 'read-write', False),
+    1150233: AttributeInfo(1150233, 'external_clock_delay_binary_value', 'ViInt32', None, False, 'read-write', False),
+    1150234: AttributeInfo(1150234, 'analog_data_mask', 'ViInt32', None, False, 'read-write', False),
+    1150235: AttributeInfo(1150235, 'analog_static_value', 'ViInt32', None, False, 'read-write', False),
+    1150236: AttributeInfo(1150236, 'digital_data_mask', 'ViInt32', None, False, 'read-write', False),
+    1150237: AttributeInfo(1150237, 'digital_static_value', 'ViInt32', None, False, 'read-write', False),
+    1150238: AttributeInfo(1150238, 'func_buffer_size', 'ViInt32', None, False, 'read only', False),
+    1150239: AttributeInfo(1150239, 'func_max_buffer_size', 'ViInt32', None, False, 'read-write', False),
+    1150240: AttributeInfo(1150240, 'file_transfer_block_size', 'ViInt32', None, False, 'read-write', False),
+    1150241: AttributeInfo(1150241, 'data_transfer_block_size', 'ViInt32', None, False, 'read-write', False),
+    1150242: AttributeInfo(1150242, 'memory_size', 'ViInt32', None, False, 'read only', False),
+    1150243: AttributeInfo(1150243, 'serial_number', 'ViString', None, False, 'read only', False),
+    1150244: AttributeInfo(1150244, 'direct_dma_enabled', 'ViBoolean', None, False, 'read-write', False),
+    1150245: AttributeInfo(1150245, 'direct_dma_window_size', 'ViInt32', None, False, 'read-write', False),
+    1150246: AttributeInfo(1150246, 'osp_enabled', 'ViBoolean', None, False, 'read-write', False),
+    1150247: AttributeInfo(1150247, 'osp_data_processing_mode', 'ViInt32', enums.DataProcessingMode, False, 'read-write', False),
+    1150248: AttributeInfo(1150248, 'osp_iq_rate', 'ViReal64', None, False, 'read-write', False),
+    1150249: AttributeInfo(1150249, 'osp_carrier_enabled', 'ViBoolean', None, False, 'read-write', False),
+    1150250: AttributeInfo(1150250, 'osp_carrier_frequency', 'ViReal64', None, False, 'read-write', False),
+    1150251: AttributeInfo(1150251, 'osp_carrier_phase_i', 'ViReal64', None, False, 'read-write', False),
+    1150252: AttributeInfo(1150252, 'osp_carrier_phase_q', 'ViReal64', None, False, 'read-write', False),
+    1150253: AttributeInfo(1150253, 'osp_fir_filter_type', 'ViInt32', enums.FilterType, False, 'read-write', False),
+    1150254: AttributeInfo(1150254, 'digital_gain', 'ViReal64', None, False, 'read-write', False),
+    1150255: AttributeInfo(1150255, 'osp_fir_filter_enabled', 'ViBoolean', None, False, 'read-write', False),
+    1150256: AttributeInfo(1150256, 'osp_fir_filter_interpolation', 'ViReal64', None, False, 'read-write', False),
+    1150257: AttributeInfo(1150257, 'osp_cic_filter_enabled', 'ViBoolean', None, False, 'read-write', False),
+    1150258: AttributeInfo(1150258, 'osp_cic_filter_interpolation', 'ViReal64', None, False, 'read-write', False),
+    1150259: AttributeInfo(1150259, 'osp_fir_filter_root_raised_cosine_alpha', 'ViReal64', None, False, 'read-write', False),
+    1150260: AttributeInfo(1150260, 'osp_fir_filter_raised_cosine_alpha', 'ViReal64', None, False, 'read-write', False),
+    1150261: AttributeInfo(1150261, 'osp_fir_filter_flat_passband', 'ViReal64', None, False, 'read-write', False),
+    1150262: AttributeInfo(1150262, 'osp_fir_filter_gaussian_bt', 'ViReal64', None, False, 'read-write', False),
+    1150263: AttributeInfo(1150263, 'osp_cic_filter_gain', 'ViReal64', None, False, 'read-write', False),
+    1150264: AttributeInfo(1150264, 'osp_pre_filter_gain_i', 'ViReal64', None, False, 'read-write', False),
+    1150265: AttributeInfo(1150265, 'osp_pre_filter_gain_q', 'ViReal64', None, False, 'read-write', False),
+    1150266: AttributeInfo(1150266, 'osp_pre_filter_offset_i', 'ViReal64', None, False, 'read-write', False),
+    1150267: AttributeInfo(1150267, 'osp_pre_filter_offset_q', 'ViReal64', None, False, 'read-write', False),
+    1150268: AttributeInfo(1150268, 'osp_overflow_error_reporting', 'ViInt32', enums.OSPOverflowErrorReporting, False, 'read-write', False),
+    1150269: AttributeInfo(1150269, 'osp_overflow_status', 'ViInt32', None, False, 'read-write', True),
+    1150270: AttributeInfo(1150270, 'script_to_generate', 'ViString', None, False, 'read-write', False),
+    1150271: AttributeInfo(1150271, 'marker_events_count', 'ViInt32', None, False, 'read only', False),
+    1150272: AttributeInfo(1150272, 'script_triggers_count', 'ViInt32', None, False, 'read only', False),
+    1150273: AttributeInfo(1150273, 'data_marker_events_count', 'ViInt32', None, False, 'read only', False),
+    1150274: AttributeInfo(1150274, 'direct_dma_window_address', 'ViInt32', None, False, 'read-write', False),
+    1150280: AttributeInfo(1150280, 'start_trigger_type', 'ViInt32', enums.StartTriggerType, False, 'read-write', False),
+    1150281: AttributeInfo(1150281, 'digital_edge_start_trigger_source', 'ViString', None, False, 'read-write', False),
+    1150282: AttributeInfo(1150282, 'digital_edge_start_trigger_edge', 'ViInt32', enums.StartTriggerDigitalEdgeEdge, False, 'read-write', False),
+    1150283: AttributeInfo(1150283, 'exported_start_trigger_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150290: AttributeInfo(1150290, 'script_trigger_type', 'ViInt32', enums.ScriptTriggerType, False, 'read-write', False),
+    1150291: AttributeInfo(1150291, 'digital_edge_script_trigger_source', 'ViString', None, False, 'read-write', False),
+    1150292: AttributeInfo(1150292, 'digital_edge_script_trigger_edge', 'ViInt32', enums.ScriptTriggerDigitalEdgeEdge, False, 'read-write', False),
+    1150293: AttributeInfo(1150293, 'digital_level_script_trigger_source', 'ViString', None, False, 'read-write', False),
+    1150294: AttributeInfo(1150294, 'digital_level_script_trigger_active_level', 'ViInt32', enums.ScriptTriggerDigitalLevelActiveLevel, False, 'read-write', False),
+    1150295: AttributeInfo(1150295, 'exported_script_trigger_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150310: AttributeInfo(1150310, 'ready_for_start_event_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150311: AttributeInfo(1150311, 'ready_for_start_event_level_active_level', 'ViInt32', enums.ReadyForStartEventActiveLevel, False, 'read-write', False),
+    1150312: AttributeInfo(1150312, 'marker_event_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150313: AttributeInfo(1150313, 'marker_event_pulse_polarity', 'ViInt32', enums.MarkerEventPulsePolarity, False, 'read-write', False),
+    1150314: AttributeInfo(1150314, 'started_event_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150315: AttributeInfo(1150315, 'done_event_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150316: AttributeInfo(1150316, 'started_event_level_active_level', 'ViInt32', enums.StartedEventActiveLevel, False, 'read-write', False),
+    1150317: AttributeInfo(1150317, 'done_event_level_active_level', 'ViInt32', enums.DoneEventActiveLevel, False, 'read-write', False),
+    1150318: AttributeInfo(1150318, 'started_event_pulse_polarity', 'ViInt32', enums.StartedEventPulsePolarity, False, 'read-write', False),
+    1150319: AttributeInfo(1150319, 'done_event_pulse_polarity', 'ViInt32', enums.DoneEventPulsePolarity, False, 'read-write', False),
+    1150320: AttributeInfo(1150320, 'exported_sample_clock_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150321: AttributeInfo(1150321, 'exported_reference_clock_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150322: AttributeInfo(1150322, 'exported_onboard_reference_clock_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150323: AttributeInfo(1150323, 'flatness_correction_enabled', 'ViBoolean', None, False, 'read-write', False),
+    1150324: AttributeInfo(1150324, 'streaming_waveform_handle', 'ViInt32', None, False, 'read-write', False),
+    1150325: AttributeInfo(1150325, 'streaming_space_available_in_waveform', 'ViInt32', None, False, 'read only', True),
+    1150326: AttributeInfo(1150326, 'streaming_waveform_name', 'ViString', None, False, 'read-write', False),
+    1150327: AttributeInfo(1150327, 'arb_marker_position', 'ViInt32', None, False, 'read-write', False),
+    1150328: AttributeInfo(1150328, 'arb_repeat_count', 'ViInt32', None, False, 'read-write', False),
+    1150329: AttributeInfo(1150329, 'exported_sample_clock_timebase_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150330: AttributeInfo(1150330, 'sync_out_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150331: AttributeInfo(1150331, 'started_event_output_behavior', 'ViInt32', enums.StartedEventOutputBehavior, False, 'read-write', False),
+    1150332: AttributeInfo(1150332, 'done_event_output_behavior', 'ViInt32', enums.DoneEventOutputBehavior, False, 'read-write', False),
+    1150333: AttributeInfo(1150333, 'started_event_pulse_width_units', 'ViInt32', enums.StartedEventPulseWidthUnits, False, 'read-write', False),
+    1150334: AttributeInfo(1150334, 'done_event_pulse_width_units', 'ViInt32', enums.DoneEventPulseWidthUnits, False, 'read-write', False),
+    1150335: AttributeInfo(1150335, 'started_event_pulse_width', 'ViReal64', None, False, 'read-write', False),
+    1150336: AttributeInfo(1150336, 'done_event_pulse_width', 'ViReal64', None, False, 'read-write', False),
+    1150337: AttributeInfo(1150337, 'data_marker_event_data_bit_number', 'ViInt32', None, False, 'read-write', False),
+    1150338: AttributeInfo(1150338, 'data_marker_event_level_polarity', 'ViInt32', enums.DataMarkerEventLevelPolarity, False, 'read-write', False),
+    1150339: AttributeInfo(1150339, 'data_marker_event_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150340: AttributeInfo(1150340, 'marker_event_pulse_width', 'ViReal64', None, False, 'read-write', False),
+    1150341: AttributeInfo(1150341, 'marker_event_pulse_width_units', 'ViInt32', enums.MarkerEventPulseWidthUnits, False, 'read-write', False),
+    1150342: AttributeInfo(1150342, 'marker_event_output_behavior', 'ViInt32', enums.MarkerEventOutputBehavior, False, 'read-write', False),
+    1150343: AttributeInfo(1150343, 'marker_event_toggle_initial_state', 'ViInt32', enums.MarkerEventToggleInitialState, False, 'read-write', False),
+    1150344: AttributeInfo(1150344, 'all_marker_events_live_status', 'ViInt32', None, False, 'read only', True),
+    1150345: AttributeInfo(1150345, 'marker_event_live_status', 'ViBoolean', None, False, 'read only', True),
+    1150348: AttributeInfo(1150348, 'ready_for_start_event_live_status', 'ViBoolean', None, False, 'read only', True),
+    1150349: AttributeInfo(1150349, 'all_marker_events_latched_status', 'ViInt32', None, False, 'read-write', True),
+    1150350: AttributeInfo(1150350, 'marker_event_latched_status', 'ViBoolean', None, False, 'read-write', True),
+    1150351: AttributeInfo(1150351, 'done_event_latched_status', 'ViBoolean', None, False, 'read only', True),
+    1150352: AttributeInfo(1150352, 'started_event_latched_status', 'ViBoolean', None, False, 'read only', True),
+    1150354: AttributeInfo(1150354, 'marker_event_delay', 'ViReal64', None, False, 'read-write', False),
+    1150355: AttributeInfo(1150355, 'marker_event_delay_units', 'ViInt32', enums.MarkerEventDelayUnits, False, 'read-write', False),
+    1150356: AttributeInfo(1150356, 'started_event_delay', 'ViReal64', None, False, 'read-write', False),
+    1150357: AttributeInfo(1150357, 'started_event_delay_units', 'ViInt32', enums.StartedEventDelayUnits, False, 'read-write', False),
+    1150358: AttributeInfo(1150358, 'done_event_delay', 'ViReal64', None, False, 'read-write', False),
+    1150359: AttributeInfo(1150359, 'done_event_delay_units', 'ViInt32', enums.DoneEventDelayUnits, False, 'read-write', False),
+    1150362: AttributeInfo(1150362, 'pci_dma_optimizations_enabled', 'ViBoolean', None, False, 'read-write', False),
+    1150365: AttributeInfo(1150365, 'terminal_configuration', 'ViInt32', enums.TerminalConfiguration, False, 'read-write', False),
+    1150366: AttributeInfo(1150366, 'common_mode_offset', 'ViReal64', None, False, 'read-write', False),
+    1150367: AttributeInfo(1150367, 'sample_clock_timebase_source', 'ViString', enums.SampleClockTimebaseSource, False, 'read-write', False),
+    1150368: AttributeInfo(1150368, 'sample_clock_timebase_rate', 'ViReal64', None, False, 'read-write', False),
+    1150369: AttributeInfo(1150369, 'channel_delay', 'ViReal64', None, False, 'read-write', False),
+    1150370: AttributeInfo(1150370, 'osp_mode', 'ViInt32', enums.OSPMode, False, 'read-write', False),
+    1150371: AttributeInfo(1150371, 'osp_frequency_shift', 'ViReal64', None, False, 'read-write', False),
+    1150373: AttributeInfo(1150373, 'data_transfer_maximum_bandwidth', 'ViReal64', None, False, 'read-write', False),
+    1150374: AttributeInfo(1150374, 'data_transfer_preferred_packet_size', 'ViInt32', None, False, 'read-write', False),
+    1150375: AttributeInfo(1150375, 'data_transfer_maximum_in_flight_reads', 'ViInt32', None, False, 'read-write', False),
+    1150376: AttributeInfo(1150376, 'external_sample_clock_multiplier', 'ViReal64', None, False, 'read-write', False),
+    1150377: AttributeInfo(1150377, 'idle_behavior', 'ViInt32', enums.IdleBehavior, False, 'read-write', False),
+    1150378: AttributeInfo(1150378, 'idle_value', 'ViInt32', None, False, 'read-write', False),
+    1150379: AttributeInfo(1150379, 'wait_behavior', 'ViInt32', enums.WaitBehavior, False, 'read-write', False),
+    1150380: AttributeInfo(1150380, 'wait_value', 'ViInt32', None, False, 'read-write', False),
+    1150389: AttributeInfo(1150389, 'osp_compensate_for_filter_group_delay', 'ViBoolean', None, False, 'read-write', False),
+    1150390: AttributeInfo(1150390, 'module_revision', 'ViString', None, False, 'read only', False),
+    1150391: AttributeInfo(1150391, 'p2p_enabled', 'ViBoolean', None, False, 'read-write', False),
+    1150392: AttributeInfo(1150392, 'p2p_destination_channels', 'ViString', None, False, 'read-write', False),
+    1150393: AttributeInfo(1150393, 'p2p_endpoint_size', 'ViInt32', None, False, 'read only', False),
+    1150394: AttributeInfo(1150394, 'p2p_space_available_in_endpoint', 'ViInt32', None, False, 'read only', False),
+    1150395: AttributeInfo(1150395, 'p2p_most_space_available_in_endpoint', 'ViInt32', None, False, 'read only', False),
+    1150396: AttributeInfo(1150396, 'p2p_endpoint_count', 'ViInt32', None, False, 'read only', False),
+    1150397: AttributeInfo(1150397, 'p2p_manual_configuration_enabled', 'ViBoolean', None, False, 'read-write', False),
+    1150398: AttributeInfo(1150398, 'p2p_data_transfer_permission_address', 'ViInt64', None, False, 'write only', False),
+    1150399: AttributeInfo(1150399, 'p2p_data_transfer_permission_address_type', 'ViInt32', enums.P2PAddressType, False, 'read-write', False),
+    1150400: AttributeInfo(1150400, 'p2p_data_transfer_permission_interval', 'ViInt32', None, False, 'read-write', False),
+    1150401: AttributeInfo(1150401, 'p2p_endpoint_window_address', 'ViInt64', None, False, 'read only', False),
+    1150402: AttributeInfo(1150402, 'p2p_endpoint_window_address_type', 'ViInt32', enums.P2PAddressType, False, 'read-write', False),
+    1150403: AttributeInfo(1150403, 'p2p_endpoint_window_size', 'ViInt32', None, False, 'read only', False),
+    1150405: AttributeInfo(1150405, 'p2p_done_notification_address', 'ViInt64', None, False, 'read only', False),
+    1150406: AttributeInfo(1150406, 'p2p_done_notification_address_type', 'ViInt32', enums.P2PAddressType, False, 'read-write', False),
+    1150407: AttributeInfo(1150407, 'p2p_done_notification_value', 'ViInt32', None, False, 'read only', False),
+    1150408: AttributeInfo(1150408, 'p2p_data_transfer_permission_initial_credits', 'ViInt32', None, False, 'read-write', False),
+    1150409: AttributeInfo(1150409, 'streaming_write_timeout', 'ViReal64', None, False, 'read-write', False),
+    1150410: AttributeInfo(1150410, 'p2p_endpoint_fullness_start_trigger_level', 'ViInt32', None, False, 'read-write', False),
+    1150411: AttributeInfo(1150411, 'aux_power_enabled', 'ViBoolean', None, False, 'read-write', False),
+    1150412: AttributeInfo(1150412, 'fpga_bitfile_path', 'ViString', None, False, 'read only', False),
+    1250001: AttributeInfo(1250001, 'output_mode', 'ViInt32', enums.OutputMode, False, 'read-write', False),
+    1250002: AttributeInfo(1250002, 'ref_clock_source', 'ViInt32', None, False, 'read-write', False),
+    1250003: AttributeInfo(1250003, 'output_enabled', 'ViBoolean', None, False, 'read-write', False),
+    1250004: AttributeInfo(1250004, 'output_impedance', 'ViReal64', None, False, 'read-write', False),
+    1250005: AttributeInfo(1250005, 'operation_mode', 'ViInt32', enums.OperationMode, False, 'read-write', False),
+    1250101: AttributeInfo(1250101, 'func_waveform', 'ViInt32', enums.Waveform, False, 'read-write', False),
+    1250102: AttributeInfo(1250102, 'func_amplitude', 'ViReal64', None, False, 'read-write', False),
+    1250103: AttributeInfo(1250103, 'func_dc_offset', 'ViReal64', None, False, 'read-write', False),
+    1250104: AttributeInfo(1250104, 'func_frequency', 'ViReal64', None, False, 'read-write', False),
+    1250105: AttributeInfo(1250105, 'func_start_phase', 'ViReal64', None, False, 'read-write', False),
+    1250106: AttributeInfo(1250106, 'func_duty_cycle_high', 'ViReal64', None, False, 'read-write', False),
+    1250201: AttributeInfo(1250201, 'arb_waveform_handle', 'ViInt32', None, False, 'read-write', False),
+    1250202: AttributeInfo(1250202, 'arb_gain', 'ViReal64', None, False, 'read-write', False),
+    1250203: AttributeInfo(1250203, 'arb_offset', 'ViReal64', None, False, 'read-write', False),
+    1250204: AttributeInfo(1250204, 'arb_sample_rate', 'ViReal64', None, False, 'read-write', False),
+    1250205: AttributeInfo(1250205, 'max_num_waveforms', 'ViInt32', None, False, 'read only', False),
+    1250206: AttributeInfo(1250206, 'waveform_quantum', 'ViInt32', None, False, 'read only', False),
+    1250207: AttributeInfo(1250207, 'min_waveform_size', 'ViInt32', None, False, 'read only', False),
+    1250208: AttributeInfo(1250208, 'max_waveform_size', 'ViInt32', None, False, 'read only', False),
+    1250211: AttributeInfo(1250211, 'arb_sequence_handle', 'ViInt32', None, False, 'read-write', False),
+    1250212: AttributeInfo(1250212, 'max_num_sequences', 'ViInt32', None, False, 'read only', False),
+    1250213: AttributeInfo(1250213, 'min_sequence_length', 'ViInt32', None, False, 'read only', False),
+    1250214: AttributeInfo(1250214, 'max_sequence_length', 'ViInt32', None, False, 'read only', False),
+    1250215: AttributeInfo(1250215, 'max_loop_count', 'ViInt32', None, False, 'read only', False),
+    1250302: AttributeInfo(1250302, 'trigger_source', 'ViInt32', enums.TriggerSource, False, 'read-write', False),
+    1250350: AttributeInfo(1250350, 'burst_count', 'ViInt32', None, False, 'read-write', False),
+}
+
+# Every attribute of NI-FGEN, by python_name
+index_by_name = dict((a.python_name, a) for a in index.values())
+
+# ctypes type and conversion of the attribute types that _BulkAccessor can get and set
+_bulk_types = {
+    'ViBoolean': (visatype.ViBoolean, bool),
+    'ViInt32': (visatype.ViInt32, int),
+    'ViInt64': (visatype.ViInt64, int),
+    'ViReal64': (visatype.ViReal64, float),
+}
+
+# Session methods that get and set the attribute types that _BulkAccessor can't
+_accessor_methods = {
+    'ViString': ('_get_attribute_vi_string', '_set_attribute_vi_string'),
+}
+
+
+class _BulkAccessor(object):
+    '''Gets and sets attributes of one type, reusing the same ctypes objects for all of them'''
+
+    def __init__(self, session, attribute_type):
+        ctype, self.convert = _bulk_types[attribute_type]
+        self._session = session
+        self._get_function = getattr(session._library, 'niFgen_GetAttribute' + attribute_type)
+        self._set_function = getattr(session._library, 'niFgen_SetAttribute' + attribute_type)
+        self._vi_ctype = visatype.ViSession(session._vi)
+        self._attribute_id_ctype = visatype.ViAttr()
+        self._value_ctype = ctype()
+        self._value_reference = ctypes.pointer(self._value_ctype)
+
+    def get(self, attribute_id):
+        self._attribute_id_ctype.value = attribute_id
+        error_code = self._get_function(self._vi_ctype, self._session._repeated_capability_ctype, self._attribute_id_ctype, self._value_reference)
+        errors.handle_error(self._session, error_code, ignore_warnings=False, is_error_handling=False)
+        return self.convert(self._value_ctype.value)
+
+    def set(self, attribute_id, value):
+        self._attribute_id_ctype.value = attribute_id
+        self._value_ctype.value = value
+        error_code = self._set_function(self._vi_ctype, self._session._repeated_capability_ctype, self._attribute_id_ctype, self._value_ctype)
+        errors.handle_error(self._session, error_code, ignore_warnings=False, is_error_handling=False)
+
+
+class _MethodAccessor(object):
+    '''Gets and sets attributes of one type through the session methods, i.e. for strings'''
+
+    def __init__(self, session, attribute_type):
+        get_method, set_method = _accessor_methods[attribute_type]
+        self.get = getattr(session, get_method)
+        self.set = getattr(session, set_method)
+
+    def convert(self, value):
+        return value
+
+
+def _get_accessor(session, accessors, attribute_type):
+    accessor = accessors.get(attribute_type)
+    if accessor is None:
+        accessor = _BulkAccessor(session, attribute_type) if attribute_type in _bulk_types else _MethodAccessor(session, attribute_type)
+        accessors[attribute_type] = accessor
+    return accessor
+
+
+def get_values(session, infos, skip_errors=False):
+    '''Returns an OrderedDict of the values of the attributes in infos, by python_name
+
+    Uses and updates the attribute cache the same way the properties do. If skip_errors is True, attributes that the
+    driver returns an error for are left out instead of raising.
+    '''
+    cache = session._attribute_cache
+    repeated_capability = session._repeated_capability
+    accessors = {}
+    values = collections.OrderedDict()
+    for info in infos:
+        use_cache = cache.enabled and not info.volatile
+        cached = cache.values.get(info.attribute_id) if use_cache else None
+        if cached is not None and repeated_capability in cached:
+            value = cached[repeated_capability]
+        else:
+            try:
+                value = _get_accessor(session, accessors, info.type).get(info.attribute_id)
+            except errors.Error:
+                if skip_errors:
+                    continue
+                raise
+            if use_cache:
+                cache.values.setdefault(info.attribute_id, {})[repeated_capability] = value
+        values[info.python_name] = value if info.enum is None else enums._get_member(info.enum, value)
+    return values
+
+
+def set_values(session, infos_and_values):
+    '''Sets attributes from (info, value) pairs, in order
+
+    Values of enum attributes must be members of their enum. Updates the attribute cache the same way the properties do.
+    '''
+    cache = session._attribute_cache
+    accessors = {}
+    for info, value in infos_and_values:
+        if info.enum is not None:
+            if type(value) is not info.enum:
+                raise TypeError('{0} must be {1} not {2}'.format(info.python_name, info.enum.__name__, type(value).__name__))
+            value = value.value
+        accessor = _get_accessor(session, accessors, info.type)
+        accessor.set(info.attribute_id, value)
+        if cache.enabled and not info.volatile:
+            cache.values[info.attribute_id] = {session._repeated_capability: accessor.convert(value)}
+
@@ -0,0 +1,255 @@
+'''Statistics of the driver calls of sessions, to tell the time spent in the driver from the time spent in Python.'''
+
+import collections
+import threading
+import time
+import weakref
+
+
+# Python 2.7 has no perf_counter
+_clock = getattr(time, 'perf_counter', time.time)
+
+# Number of most recent calls of each C function that percentiles are computed from
+_MAX_LATENCIES = 1000
+
+# Methods being called on each thread, innermost last
+_calls_in_progress = threading.local()
+
+
+class FunctionStats(object):
+    '''Statistics of the calls to one C function of the driver
+
+    A call is a call to the session method of the C function (i.e. session.read() for niDMM_Read). Calls made without
+    one, like the ones that get many attributes at once, count too, with no Python time.
+
+    Python time is the time spent in the method outside of the driver, i.e. creating and converting ctypes objects and
+    handling errors. Methods that call other methods (i.e. to get the description of an error) don't include the time
+    of those. So the Python time and driver time of all the functions add up to the time spent in the methods.
+    '''
+
+    def __init__(self, function):
+        self.function = function
+        '''Name of the C function, i.e. 'niDMM_Read' '''
+        self.calls = 0
+        '''Number of calls'''
+        self.driver_calls = 0
+        '''Number of times the C function was called. More than calls when methods call it more than once.'''
+        self.driver_time = 0.0
+        '''Seconds spent in the C function'''
+        self.python_time = 0.0
+        '''Seconds spent in the method outside of the C function'''
+        self.latencies = collections.deque(maxlen=_MAX_LATENCIES)
+        '''Seconds that each of the most recent calls took'''
+
+    @property
+    def total_time(self):
+        '''Seconds spent in the method, in Python and in the driver'''
+        return self.python_time + self.driver_time
+
+    def percentile(self, percent):
+        '''Returns the latency, in seconds, that percent % of the most recent calls took at most, i.e. percentile(99)'''
+        if not 0 <= percent <= 100:
+            raise ValueError('percent must be between 0 and 100, not {0!r}'.format(percent))
+        if len(self.latencies) == 0:
+            return None
+        latencies = sorted(self.latencies)
+        # Nearest rank
+        rank = max(1, int(-(-percent * len(latencies) // 100)))
+        return latencies[rank - 1]
+
+    def _add(self, other):
+        self.calls += other.calls
+        self.driver_calls += other.driver_calls
+        self.driver_time += other.driver_time
+        self.python_time += other.python_time
+        self.latencies.extend(other.latencies)
+
+    def _copy(self):
+        copy = FunctionStats(self.function)
+        copy._add(self)
+        return copy
+
+    def __repr__(self):
+        return '{0}({1!r}, calls={2}, driver_time={3:.6f}, python_time={4:.6f})'.format(type(self).__name__, self.function, self.calls, self.driver_time, self.python_time)
+
+
+def _sorted_by_total_time(stats):
+    return collections.OrderedDict((s.function, s) for s in sorted(stats, key=lambda s: (-s.total_time, s.function)))
+
+
+class _Call(object):
+    '''A method call in progress'''
+
+    __slots__ = ('function', 'driver_calls', 'driver_time', 'nested_time')
+
+    def __init__(self, function):
+        self.function = function
+        self.driver_calls = 0
+        self.driver_time = 0.0
+        # Time of the methods it called, which they record themselves
+        self.nested_time = 0.0
+
+
+class _InstrumentedLibrary(object):
+    '''Times the calls to the C functions of a library.Library'''
+
+    def __init__(self, library, session_stats):
+        self._library = library
+        self._session_stats = session_stats
+
+    def __getattr__(self, name):
+        cfunc = getattr(self._library, name)
+        session_stats = self._session_stats
+
+        def timed_cfunc(*args):
+            start = _clock()
+            try:
+                return cfunc(*args)
+            finally:
+                session_stats._record_driver_call(name, _clock() - start)
+        # Next time, it is found without calling __getattr__
+        self.__dict__[name] = timed_cfunc
+        return timed_cfunc
+
+
+class SessionStats(object):
+    '''Statistics of the driver calls of a session, and of its repeated capabilities, by C function
+
+    Sessions have one, and record into it once their stats are enabled, i.e. by session.enable_stats().
+
+    Args:
+        c_functions (dict): Name of the C function that each method of the session calls, by method name
+    '''
+
+    def __init__(self, c_functions):
+        self._c_functions = c_functions
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._sessions = weakref.WeakSet()
+        self._library = None
+        self.enabled = False
+
+    def _add_session(self, session):
+        '''Records the calls of session (i.e. a repeated capability of the session) too'''
+        self._sessions.add(session)
+        if self.enabled:
+            self._instrument(session)
+
+    def enable(self):
+        '''Clears the statistics, and starts recording'''
+        self.clear()
+        if not self.enabled:
+            self.enabled = True
+            for session in list(self._sessions):
+                self._instrument(session)
+            registry._add(self)
+
+    def disable(self):
+        '''Stops recording. The statistics are kept.'''
+        if self.enabled:
+            self.enabled = False
+            for session in list(self._sessions):
+                self._uninstrument(session)
+
+    def clear(self):
+        with self._lock:
+            self._stats = {}
+
+    def stats(self):
+        '''Returns a copy of the statistics, as an OrderedDict of FunctionStats by C function, most total time first'''
+        with self._lock:
+            return _sorted_by_total_time([s._copy() for s in self._stats.values()])
+
+    def _instrument(self, session):
+        # Sessions and their repeated capabilities all have the same library
+        if self._library is None:
+            self._library = session._library
+        object.__setattr__(session, '_library', _InstrumentedLibrary(self._library, self))
+        for method_name, function in self._c_functions.items():
+            method = getattr(session, method_name, None)
+            if method is not None:
+                # An attribute of the object hides the method of its class
+                object.__setattr__(session, method_name, self._timed_method(method, function))
+
+    def _uninstrument(self, session):
+        object.__setattr__(session, '_library', self._library)
+        for method_name in self._c_functions:
+            session.__dict__.pop(method_name, None)
+
+    def _timed_method(self, method, function):
+        def timed_method(*args, **kwargs):
+            calls = getattr(_calls_in_progress, 'calls', None)
+            if calls is None:
+                calls = _calls_in_progress.calls = []
+            call = _Call(function)
+            calls.append(call)
+            start = _clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = _clock() - start
+                calls.pop()
+                if len(calls) > 0:
+                    calls[-1].nested_time += elapsed
+                self._record(function, 1, call.driver_calls, call.driver_time, elapsed - call.nested_time - call.driver_time)
+        return timed_method
+
+    def _record_driver_call(self, function, elapsed):
+        calls = getattr(_calls_in_progress, 'calls', None)
+        if calls and calls[-1].function == function:
+            # The method records it when it returns
+            calls[-1].driver_calls += 1
+            calls[-1].driver_time += elapsed
+        else:
+            self._record(function, 1, 1, elapsed, 0.0)
+
+    def _record(self, function, calls, driver_calls, driver_time, python_time):
+        with self._lock:
+            stats = self._stats.get(function)
+            if stats is None:
+                stats = self._stats[function] = FunctionStats(function)
+            stats.calls += calls
+            stats.driver_calls += driver_calls
+            stats.driver_time += driver_time
+            stats.python_time += python_time
+            stats.latencies.append(driver_time + python_time)
+
+
+class Registry(object):
+    '''The statistics of all the sessions of the process that enabled them
+
+    Statistics are kept after sessions are closed, until clear() is called.
+    '''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._session_stats = []
+        self.enabled = False
+        '''If True, new sessions enable their stats when they are created, i.e. for a whole test run'''
+
+    def _add(self, session_stats):
+        with self._lock:
+            if session_stats not in self._session_stats:
+                self._session_stats.append(session_stats)
+
+    def sessions(self):
+        '''Returns the SessionStats of the sessions, in the order they enabled them'''
+        with self._lock:
+            return list(self._session_stats)
+
+    def stats(self):
+        '''Returns the statistics of all the sessions added together, as an OrderedDict of FunctionStats by C function, most total time first'''
+        totals = {}
+        for session_stats in self.sessions():
+            for function, stats in session_stats.stats().items():
+                totals.setdefault(function, FunctionStats(function))._add(stats)
+        return _sorted_by_total_time(totals.values())
+
+    def clear(self):
+        '''Forgets the sessions that were added so far. They keep recording their own statistics.'''
+        with self._lock:
+            self._session_stats = []
+
+
+registry = Registry()
+'''Process-wide Registry of the statistics of sessions'''
@@ -1,3 +1,4 @@
+# -*- coding: utf-8 -*-
 # This file was generated
 
 from enum import Enum
@@ -370,6 +371,17 @@ class ReferenceClockSource(Enum):
     '''
 
 
+class RelativeTo(Enum):
+    START = 0
+    '''
+    Use the start of the waveform as the reference position.
+    '''
+    CURRENT = 1
+    '''
+    Use the current position within the waveform as the reference position.
+    '''
+
+
 class SampleClockSource(Enum):
     CLOCK_IN = '"ClkIn"'
     '''
@@ -907,3 +919,63 @@ class Waveform(Enum):
     '''
     User-defined waveform as defined by the niFgen_DefineUserStandardWaveform function.
     '''
+
+
+# Members of each enum by value. Looking a value from the driver up in these is much faster than calling the enum with it.
+_members_by_value = {
+    AnalogPath: dict((member.value, member) for member in AnalogPath),
+    BusType: dict((member.value, member) for member in BusType),
+    CalADCInput: dict((member.value, member) for member in CalADCInput),
+    ClockMode: dict((member.value, member) for member in ClockMode),
+    DataMarkerEventLevelPolarity: dict((member.value, member) for member in DataMarkerEventLevelPolarity),
+    DataProcessingMode: dict((member.value, member) for member in DataProcessingMode),
+    DoneEventActiveLevel: dict((member.value, member) for member in DoneEventActiveLevel),
+    DoneEventDelayUnits: dict((member.value, member) for member in DoneEventDelayUnits),
+    DoneEventOutputBehavior: dict((member.value, member) for member in DoneEventOutputBehavior),
+    DoneEventPulsePolarity: dict((member.value, member) for member in DoneEventPulsePolarity),
+    DoneEventPulseWidthUnits: dict((member.value, member) for member in DoneEventPulseWidthUnits),
+    FilterType: dict((member.value, member) for member in FilterType),
+    IdleBehavior: dict((member.value, member) for member in IdleBehavior),
+    MarkerEventDelayUnits: dict((member.value, member) for member in MarkerEventDelayUnits),
+    MarkerEventOutputBehavior: dict((member.value, member) for member in MarkerEventOutputBehavior),
+    MarkerEventPulsePolarity: dict((member.value, member) for member in MarkerEventPulsePolarity),
+    MarkerEventPulseWidthUnits: dict((member.value, member) for member in MarkerEventPulseWidthUnits),
+    MarkerEventToggleInitialState: dict((member.value, member) for member in MarkerEventToggleInitialState),
+    OSPMode: dict((member.value, member) for member in OSPMode),
+    OSPOverflowErrorReporting: dict((member.value, member) for member in OSPOverflowErrorReporting),
+    OperationMode: dict((member.value, member) for member in OperationMode),
+    OutputMode: dict((member.value, member) for member in OutputMode),
+    P2PAddressType: dict((member.value, member) for member in P2PAddressType),
+    ReadyForStartEventActiveLevel: dict((member.value, member) for member in ReadyForStartEventActiveLevel),
+    ReferenceClockSource: dict((member.value, member) for member in ReferenceClockSource),
+    RelativeTo: dict((member.value, member) for member in RelativeTo),
+    SampleClockSource: dict((member.value, member) for member in SampleClockSource),
+    SampleClockTimebaseSource: dict((member.value, member) for member in SampleClockTimebaseSource),
+    ScriptTriggerDigitalEdgeEdge: dict((member.value, member) for member in ScriptTriggerDigitalEdgeEdge),
+    ScriptTriggerDigitalLevelActiveLevel: dict((member.value, member) for member in ScriptTriggerDigitalLevelActiveLevel),
+    ScriptTriggerType: dict((member.value, member) for member in ScriptTriggerType),
+    StartTriggerDigitalEdgeEdge: dict((member.value, member) for member in StartTriggerDigitalEdgeEdge),
+    StartTriggerType: dict((member.value, member) for member in StartTriggerType),
+    StartedEventActiveLevel: dict((member.value, member) for member in StartedEventActiveLevel),
+    StartedEventDelayUnits: dict((member.value, member) for member in StartedEventDelayUnits),
+    StartedEventOutputBehavior: dict((member.value, member) for member in StartedEventOutputBehavior),
+    StartedEventPulsePolarity: dict((member.value, member) for member in StartedEventPulsePolarity),
+    StartedEventPulseWidthUnits: dict((member.value, member) for member in StartedEventPulseWidthUnits),
+    SynchronizationSource: dict((member.value, member) for member in SynchronizationSource),
+    TerminalConfiguration: dict((member.value, member) for member in TerminalConfiguration),
+    TriggerMode: dict((member.value, member) for member in TriggerMode),
+    TriggerSource: dict((member.value, member) for member in TriggerSource),
+    UpdateClockSource: dict((member.value, member) for member in UpdateClockSource),
+    VideoWaveformType: dict((member.value, member) for member in VideoWaveformType),
+    WaitBehavior: dict((member.value, member) for member in WaitBehavior),
+    Waveform: dict((member.value, member) for member in Waveform),
+}
+
+
+def _get_member(enum_type, value):
+    '''Returns the member of enum_type that has value, like enum_type(value)'''
+    try:
+        return _members_by_value[enum_type][value]
+    except KeyError:
+        # Raises ValueError, as the enum does for values it doesn't have
+        return enum_type(value)
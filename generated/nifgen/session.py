@@ -1,13 +1,269 @@
 # -*- coding: utf-8 -*-
 # This file was generated
+import collections
 import ctypes
+import threading
 
+from nifgen import _converters  # noqa: F401
+from nifgen import _streaming
 from nifgen import attributes
+from nifgen import call_stats
 from nifgen import enums
 from nifgen import errors
 from nifgen import library_singleton
 from nifgen import visatype
 
+# Size of the buffer that string IVI-dance methods try first, until they know the size they need
+_DEFAULT_IVI_DANCE_BUFFER_SIZE = 256
+
+# Size of the buffer that each string IVI-dance method needed last time, by C function name (and attribute ID). Shared
+# by all sessions.
+_ivi_dance_buffer_sizes = {}
+
+# Messages of the most recently used error and warning codes, from _error_message(). Shared by all sessions.
+_MAX_ERROR_MESSAGES = 64
+_error_messages = collections.OrderedDict()
+_error_messages_lock = threading.Lock()
+
+
+class _ScalarCtypes(threading.local):
+    '''ctypes objects for the scalar parameters of driver functions, which methods reuse instead of creating new ones on every call
+
+    Each thread has its own, so that calls on different threads don't share them.
+    '''
+
+    def __init__(self):
+        self.AdjustSampleClockRelativeDelay_adjustment_time = visatype.ViReal64()
+        self.AllocateNamedWaveform_waveform_size = visatype.ViInt32()
+        self.AllocateWaveform_waveform_handle = visatype.ViInt32()
+        self.AllocateWaveform_waveform_handle_pointer = ctypes.pointer(self.AllocateWaveform_waveform_handle)
+        self.AllocateWaveform_waveform_size = visatype.ViInt32()
+        self.ClearArbSequence_sequence_handle = visatype.ViInt32()
+        self.ClearArbWaveform_waveform_handle = visatype.ViInt32()
+        self.ClearFreqList_frequency_list_handle = visatype.ViInt32()
+        self.ConfigureArbSequence_gain = visatype.ViReal64()
+        self.ConfigureArbSequence_offset = visatype.ViReal64()
+        self.ConfigureArbSequence_sequence_handle = visatype.ViInt32()
+        self.ConfigureArbWaveform_gain = visatype.ViReal64()
+        self.ConfigureArbWaveform_offset = visatype.ViReal64()
+        self.ConfigureArbWaveform_waveform_handle = visatype.ViInt32()
+        self.ConfigureDigitalEdgeScriptTrigger_edge = visatype.ViInt32()
+        self.ConfigureDigitalEdgeStartTrigger_edge = visatype.ViInt32()
+        self.ConfigureDigitalLevelScriptTrigger_trigger_when = visatype.ViInt32()
+        self.ConfigureFreqList_amplitude = visatype.ViReal64()
+        self.ConfigureFreqList_dc_offset = visatype.ViReal64()
+        self.ConfigureFreqList_frequency_list_handle = visatype.ViInt32()
+        self.ConfigureFreqList_start_phase = visatype.ViReal64()
+        self.ConfigureStandardWaveform_amplitude = visatype.ViReal64()
+        self.ConfigureStandardWaveform_dc_offset = visatype.ViReal64()
+        self.ConfigureStandardWaveform_frequency = visatype.ViReal64()
+        self.ConfigureStandardWaveform_start_phase = visatype.ViReal64()
+        self.ConfigureStandardWaveform_waveform = visatype.ViInt32()
+        self.CreateAdvancedArbSequence_sequence_handle = visatype.ViInt32()
+        self.CreateAdvancedArbSequence_sequence_handle_pointer = ctypes.pointer(self.CreateAdvancedArbSequence_sequence_handle)
+        self.CreateArbSequence_sequence_handle = visatype.ViInt32()
+        self.CreateArbSequence_sequence_handle_pointer = ctypes.pointer(self.CreateArbSequence_sequence_handle)
+        self.CreateArbSequence_sequence_length = visatype.ViInt32()
+        self.CreateFreqList_frequency_list_handle = visatype.ViInt32()
+        self.CreateFreqList_frequency_list_handle_pointer = ctypes.pointer(self.CreateFreqList_frequency_list_handle)
+        self.CreateFreqList_waveform = visatype.ViInt32()
+        self.CreateWaveformF64_waveform_handle = visatype.ViInt32()
+        self.CreateWaveformF64_waveform_handle_pointer = ctypes.pointer(self.CreateWaveformF64_waveform_handle)
+        self.CreateWaveformFromFileF64_byte_order = visatype.ViInt32()
+        self.CreateWaveformFromFileF64_waveform_handle = visatype.ViInt32()
+        self.CreateWaveformFromFileF64_waveform_handle_pointer = ctypes.pointer(self.CreateWaveformFromFileF64_waveform_handle)
+        self.CreateWaveformFromFileI16_byte_order = visatype.ViInt32()
+        self.CreateWaveformFromFileI16_waveform_handle = visatype.ViInt32()
+        self.CreateWaveformFromFileI16_waveform_handle_pointer = ctypes.pointer(self.CreateWaveformFromFileI16_waveform_handle)
+        self.CreateWaveformI16_waveform_handle = visatype.ViInt32()
+        self.CreateWaveformI16_waveform_handle_pointer = ctypes.pointer(self.CreateWaveformI16_waveform_handle)
+        self.ExportSignal_signal = visatype.ViInt32()
+        self.GetAttributeViBoolean_attribute_id = visatype.ViAttr()
+        self.GetAttributeViBoolean_attribute_value = visatype.ViBoolean()
+        self.GetAttributeViBoolean_attribute_value_pointer = ctypes.pointer(self.GetAttributeViBoolean_attribute_value)
+        self.GetAttributeViInt32_attribute_id = visatype.ViAttr()
+        self.GetAttributeViInt32_attribute_value = visatype.ViInt32()
+        self.GetAttributeViInt32_attribute_value_pointer = ctypes.pointer(self.GetAttributeViInt32_attribute_value)
+        self.GetAttributeViInt64_attribute_id = visatype.ViAttr()
+        self.GetAttributeViInt64_attribute_value = visatype.ViInt64()
+        self.GetAttributeViInt64_attribute_value_pointer = ctypes.pointer(self.GetAttributeViInt64_attribute_value)
+        self.GetAttributeViReal64_attribute_id = visatype.ViAttr()
+        self.GetAttributeViReal64_attribute_value = visatype.ViReal64()
+        self.GetAttributeViReal64_attribute_value_pointer = ctypes.pointer(self.GetAttributeViReal64_attribute_value)
+        self.GetAttributeViString_attribute_id = visatype.ViAttr()
+        self.GetError_error_code = visatype.ViStatus()
+        self.GetError_error_code_pointer = ctypes.pointer(self.GetError_error_code)
+        self.GetExtCalLastDateAndTime_day = visatype.ViInt32()
+        self.GetExtCalLastDateAndTime_day_pointer = ctypes.pointer(self.GetExtCalLastDateAndTime_day)
+        self.GetExtCalLastDateAndTime_hour = visatype.ViInt32()
+        self.GetExtCalLastDateAndTime_hour_pointer = ctypes.pointer(self.GetExtCalLastDateAndTime_hour)
+        self.GetExtCalLastDateAndTime_minute = visatype.ViInt32()
+        self.GetExtCalLastDateAndTime_minute_pointer = ctypes.pointer(self.GetExtCalLastDateAndTime_minute)
+        self.GetExtCalLastDateAndTime_month = visatype.ViInt32()
+        self.GetExtCalLastDateAndTime_month_pointer = ctypes.pointer(self.GetExtCalLastDateAndTime_month)
+        self.GetExtCalLastDateAndTime_year = visatype.ViInt32()
+        self.GetExtCalLastDateAndTime_year_pointer = ctypes.pointer(self.GetExtCalLastDateAndTime_year)
+        self.GetExtCalLastTemp_temperature = visatype.ViReal64()
+        self.GetExtCalLastTemp_temperature_pointer = ctypes.pointer(self.GetExtCalLastTemp_temperature)
+        self.GetExtCalRecommendedInterval_months = visatype.ViInt32()
+        self.GetExtCalRecommendedInterval_months_pointer = ctypes.pointer(self.GetExtCalRecommendedInterval_months)
+        self.GetFIRFilterCoefficients_number_of_coefficients_read = visatype.ViInt32()
+        self.GetFIRFilterCoefficients_number_of_coefficients_read_pointer = ctypes.pointer(self.GetFIRFilterCoefficients_number_of_coefficients_read)
+        self.GetHardwareState_state = visatype.ViInt32()
+        self.GetHardwareState_state_pointer = ctypes.pointer(self.GetHardwareState_state)
+        self.GetSelfCalLastDateAndTime_day = visatype.ViInt32()
+        self.GetSelfCalLastDateAndTime_day_pointer = ctypes.pointer(self.GetSelfCalLastDateAndTime_day)
+        self.GetSelfCalLastDateAndTime_hour = visatype.ViInt32()
+        self.GetSelfCalLastDateAndTime_hour_pointer = ctypes.pointer(self.GetSelfCalLastDateAndTime_hour)
+        self.GetSelfCalLastDateAndTime_minute = visatype.ViInt32()
+        self.GetSelfCalLastDateAndTime_minute_pointer = ctypes.pointer(self.GetSelfCalLastDateAndTime_minute)
+        self.GetSelfCalLastDateAndTime_month = visatype.ViInt32()
+        self.GetSelfCalLastDateAndTime_month_pointer = ctypes.pointer(self.GetSelfCalLastDateAndTime_month)
+        self.GetSelfCalLastDateAndTime_year = visatype.ViInt32()
+        self.GetSelfCalLastDateAndTime_year_pointer = ctypes.pointer(self.GetSelfCalLastDateAndTime_year)
+        self.GetSelfCalLastTemp_temperature = visatype.ViReal64()
+        self.GetSelfCalLastTemp_temperature_pointer = ctypes.pointer(self.GetSelfCalLastTemp_temperature)
+        self.GetSelfCalSupported_self_cal_supported = visatype.ViBoolean()
+        self.GetSelfCalSupported_self_cal_supported_pointer = ctypes.pointer(self.GetSelfCalSupported_self_cal_supported)
+        self.InitializeWithChannels_reset_device = visatype.ViBoolean()
+        self.InitializeWithChannels_vi = visatype.ViSession()
+        self.InitializeWithChannels_vi_pointer = ctypes.pointer(self.InitializeWithChannels_vi)
+        self.IsDone_done = visatype.ViBoolean()
+        self.IsDone_done_pointer = ctypes.pointer(self.IsDone_done)
+        self.QueryArbSeqCapabilities_maximum_loop_count = visatype.ViInt32()
+        self.QueryArbSeqCapabilities_maximum_loop_count_pointer = ctypes.pointer(self.QueryArbSeqCapabilities_maximum_loop_count)
+        self.QueryArbSeqCapabilities_maximum_number_of_sequences = visatype.ViInt32()
+        self.QueryArbSeqCapabilities_maximum_number_of_sequences_pointer = ctypes.pointer(self.QueryArbSeqCapabilities_maximum_number_of_sequences)
+        self.QueryArbSeqCapabilities_maximum_sequence_length = visatype.ViInt32()
+        self.QueryArbSeqCapabilities_maximum_sequence_length_pointer = ctypes.pointer(self.QueryArbSeqCapabilities_maximum_sequence_length)
+        self.QueryArbSeqCapabilities_minimum_sequence_length = visatype.ViInt32()
+        self.QueryArbSeqCapabilities_minimum_sequence_length_pointer = ctypes.pointer(self.QueryArbSeqCapabilities_minimum_sequence_length)
+        self.QueryArbWfmCapabilities_maximum_number_of_waveforms = visatype.ViInt32()
+        self.QueryArbWfmCapabilities_maximum_number_of_waveforms_pointer = ctypes.pointer(self.QueryArbWfmCapabilities_maximum_number_of_waveforms)
+        self.QueryArbWfmCapabilities_maximum_waveform_size = visatype.ViInt32()
+        self.QueryArbWfmCapabilities_maximum_waveform_size_pointer = ctypes.pointer(self.QueryArbWfmCapabilities_maximum_waveform_size)
+        self.QueryArbWfmCapabilities_minimum_waveform_size = visatype.ViInt32()
+        self.QueryArbWfmCapabilities_minimum_waveform_size_pointer = ctypes.pointer(self.QueryArbWfmCapabilities_minimum_waveform_size)
+        self.QueryArbWfmCapabilities_waveform_quantum = visatype.ViInt32()
+        self.QueryArbWfmCapabilities_waveform_quantum_pointer = ctypes.pointer(self.QueryArbWfmCapabilities_waveform_quantum)
+        self.QueryFreqListCapabilities_frequency_list_duration_quantum = visatype.ViReal64()
+        self.QueryFreqListCapabilities_frequency_list_duration_quantum_pointer = ctypes.pointer(self.QueryFreqListCapabilities_frequency_list_duration_quantum)
+        self.QueryFreqListCapabilities_maximum_frequency_list_duration = visatype.ViReal64()
+        self.QueryFreqListCapabilities_maximum_frequency_list_duration_pointer = ctypes.pointer(self.QueryFreqListCapabilities_maximum_frequency_list_duration)
+        self.QueryFreqListCapabilities_maximum_frequency_list_length = visatype.ViInt32()
+        self.QueryFreqListCapabilities_maximum_frequency_list_length_pointer = ctypes.pointer(self.QueryFreqListCapabilities_maximum_frequency_list_length)
+        self.QueryFreqListCapabilities_maximum_number_of_freq_lists = visatype.ViInt32()
+        self.QueryFreqListCapabilities_maximum_number_of_freq_lists_pointer = ctypes.pointer(self.QueryFreqListCapabilities_maximum_number_of_freq_lists)
+        self.QueryFreqListCapabilities_minimum_frequency_list_duration = visatype.ViReal64()
+        self.QueryFreqListCapabilities_minimum_frequency_list_duration_pointer = ctypes.pointer(self.QueryFreqListCapabilities_minimum_frequency_list_duration)
+        self.QueryFreqListCapabilities_minimum_frequency_list_length = visatype.ViInt32()
+        self.QueryFreqListCapabilities_minimum_frequency_list_length_pointer = ctypes.pointer(self.QueryFreqListCapabilities_minimum_frequency_list_length)
+        self.ReadCurrentTemperature_temperature = visatype.ViReal64()
+        self.ReadCurrentTemperature_temperature_pointer = ctypes.pointer(self.ReadCurrentTemperature_temperature)
+        self.SendSoftwareEdgeTrigger_trigger = visatype.ViInt32()
+        self.SetAttributeViBoolean_attribute_id = visatype.ViAttr()
+        self.SetAttributeViBoolean_attribute_value = visatype.ViBoolean()
+        self.SetAttributeViInt32_attribute_id = visatype.ViAttr()
+        self.SetAttributeViInt32_attribute_value = visatype.ViInt32()
+        self.SetAttributeViInt64_attribute_id = visatype.ViAttr()
+        self.SetAttributeViInt64_attribute_value = visatype.ViInt64()
+        self.SetAttributeViReal64_attribute_id = visatype.ViAttr()
+        self.SetAttributeViReal64_attribute_value = visatype.ViReal64()
+        self.SetAttributeViString_attribute_id = visatype.ViAttr()
+        self.SetNamedWaveformNextWritePosition_offset = visatype.ViInt32()
+        self.SetNamedWaveformNextWritePosition_relative_to = visatype.ViInt32()
+        self.SetWaveformNextWritePosition_offset = visatype.ViInt32()
+        self.SetWaveformNextWritePosition_relative_to = visatype.ViInt32()
+        self.SetWaveformNextWritePosition_waveform_handle = visatype.ViInt32()
+        self.WaitUntilDone_max_time = visatype.ViInt32()
+        self.WriteBinary16Waveform_waveform_handle = visatype.ViInt32()
+        self.WriteWaveform_waveform_handle = visatype.ViInt32()
+        self.error_message_error_code = visatype.ViStatus()
+        self.self_test_self_test_result = visatype.ViInt16()
+        self.self_test_self_test_result_pointer = ctypes.pointer(self.self_test_self_test_result)
+
+
+_scalar_ctypes = _ScalarCtypes()
+
+# C function that each method calls, for call_stats
+_c_functions = {
+    '_abort_generation': 'niFgen_AbortGeneration',
+    '_close': 'niFgen_close',
+    '_error_message': 'niFgen_error_message',
+    '_get_attribute_vi_boolean': 'niFgen_GetAttributeViBoolean',
+    '_get_attribute_vi_int32': 'niFgen_GetAttributeViInt32',
+    '_get_attribute_vi_int64': 'niFgen_GetAttributeViInt64',
+    '_get_attribute_vi_real64': 'niFgen_GetAttributeViReal64',
+    '_get_attribute_vi_string': 'niFgen_GetAttributeViString',
+    '_get_error': 'niFgen_GetError',
+    '_initialize_with_channels': 'niFgen_InitializeWithChannels',
+    '_initiate_generation': 'niFgen_InitiateGeneration',
+    '_set_attribute_vi_boolean': 'niFgen_SetAttributeViBoolean',
+    '_set_attribute_vi_int32': 'niFgen_SetAttributeViInt32',
+    '_set_attribute_vi_int64': 'niFgen_SetAttributeViInt64',
+    '_set_attribute_vi_real64': 'niFgen_SetAttributeViReal64',
+    '_set_attribute_vi_string': 'niFgen_SetAttributeViString',
+    'adjust_sample_clock_relative_delay': 'niFgen_AdjustSampleClockRelativeDelay',
+    'allocate_named_waveform': 'niFgen_AllocateNamedWaveform',
+    'allocate_waveform': 'niFgen_AllocateWaveform',
+    'clear_arb_memory': 'niFgen_ClearArbMemory',
+    'clear_arb_sequence': 'niFgen_ClearArbSequence',
+    'clear_arb_waveform': 'niFgen_ClearArbWaveform',
+    'clear_freq_list': 'niFgen_ClearFreqList',
+    'clear_user_standard_waveform': 'niFgen_ClearUserStandardWaveform',
+    'commit': 'niFgen_Commit',
+    'configure_arb_sequence': 'niFgen_ConfigureArbSequence',
+    'configure_arb_waveform': 'niFgen_ConfigureArbWaveform',
+    'configure_custom_fir_filter_coefficients': 'niFgen_ConfigureCustomFIRFilterCoefficients',
+    'configure_digital_edge_script_trigger': 'niFgen_ConfigureDigitalEdgeScriptTrigger',
+    'configure_digital_edge_start_trigger': 'niFgen_ConfigureDigitalEdgeStartTrigger',
+    'configure_digital_level_script_trigger': 'niFgen_ConfigureDigitalLevelScriptTrigger',
+    'configure_freq_list': 'niFgen_ConfigureFreqList',
+    'configure_standard_waveform': 'niFgen_ConfigureStandardWaveform',
+    'create_advanced_arb_sequence': 'niFgen_CreateAdvancedArbSequence',
+    'create_arb_sequence': 'niFgen_CreateArbSequence',
+    'create_freq_list': 'niFgen_CreateFreqList',
+    'create_waveform_f64': 'niFgen_CreateWaveformF64',
+    'create_waveform_from_file_f64': 'niFgen_CreateWaveformFromFileF64',
+    'create_waveform_from_file_i16': 'niFgen_CreateWaveformFromFileI16',
+    'create_waveform_i16': 'niFgen_CreateWaveformI16',
+    'define_user_standard_waveform': 'niFgen_DefineUserStandardWaveform',
+    'delete_named_waveform': 'niFgen_DeleteNamedWaveform',
+    'delete_script': 'niFgen_DeleteScript',
+    'disable': 'niFgen_Disable',
+    'export_signal': 'niFgen_ExportSignal',
+    'get_ext_cal_last_date_and_time': 'niFgen_GetExtCalLastDateAndTime',
+    'get_ext_cal_last_temp': 'niFgen_GetExtCalLastTemp',
+    'get_ext_cal_recommended_interval': 'niFgen_GetExtCalRecommendedInterval',
+    'get_fir_filter_coefficients': 'niFgen_GetFIRFilterCoefficients',
+    'get_hardware_state': 'niFgen_GetHardwareState',
+    'get_self_cal_last_date_and_time': 'niFgen_GetSelfCalLastDateAndTime',
+    'get_self_cal_last_temp': 'niFgen_GetSelfCalLastTemp',
+    'get_self_cal_supported': 'niFgen_GetSelfCalSupported',
+    'is_done': 'niFgen_IsDone',
+    'query_arb_seq_capabilities': 'niFgen_QueryArbSeqCapabilities',
+    'query_arb_wfm_capabilities': 'niFgen_QueryArbWfmCapabilities',
+    'query_freq_list_capabilities': 'niFgen_QueryFreqListCapabilities',
+    'read_current_temperature': 'niFgen_ReadCurrentTemperature',
+    'reset': 'niFgen_reset',
+    'reset_device': 'niFgen_ResetDevice',
+    'reset_with_defaults': 'niFgen_ResetWithDefaults',
+    'self_cal': 'niFgen_SelfCal',
+    'self_test': 'niFgen_self_test',
+    'send_software_edge_trigger': 'niFgen_SendSoftwareEdgeTrigger',
+    'set_named_waveform_next_write_position': 'niFgen_SetNamedWaveformNextWritePosition',
+    'set_waveform_next_write_position': 'niFgen_SetWaveformNextWritePosition',
+    'wait_until_done': 'niFgen_WaitUntilDone',
+    'write_binary16_waveform': 'niFgen_WriteBinary16Waveform',
+    'write_named_waveform_f64': 'niFgen_WriteNamedWaveformF64',
+    'write_named_waveform_i16': 'niFgen_WriteNamedWaveformI16',
+    'write_script': 'niFgen_WriteScript',
+    'write_waveform': 'niFgen_WriteWaveform',
+}
+
+# Maximum number of repeated capability views (i.e. session['0']) that a session keeps to return again
+_MAX_REPEATED_CAPABILITY_VIEWS = 256
+
 
 class _Generation(object):
     def __init__(self, session):
@@ -27,11 +283,11 @@ class _SessionBase(object):
     # This is needed during __init__. Without it, __setattr__ raises an exception
     _is_frozen = False
 
-    all_marker_events_latched_status = attributes.AttributeViInt32(1150349)
+    all_marker_events_latched_status = attributes.AttributeViInt32(1150349, volatile=True)
     '''
     Returns a bit field of the latched status of all Marker Events.  Write 0 to this attribute to clear the latched status of all Marker Events.
     '''
-    all_marker_events_live_status = attributes.AttributeViInt32(1150344)
+    all_marker_events_live_status = attributes.AttributeViInt32(1150344, volatile=True)
     '''
     Returns a bit field of the live status of all Marker Events.
     '''
@@ -243,7 +499,7 @@ class _SessionBase(object):
     '''
     Specifies the units applied to the value of the NIFGEN_ATTR_DONE_EVENT_DELAY attribute. Valid units are seconds and sample clock periods.
     '''
-    done_event_latched_status = attributes.AttributeViBoolean(1150351)
+    done_event_latched_status = attributes.AttributeViBoolean(1150351, volatile=True)
     '''
     Returns the latched status of the specified Done Event.
     '''
@@ -476,12 +732,12 @@ class _SessionBase(object):
     '''
     Specifies the units applied to the value of the NIFGEN_ATTR_MARKER_EVENT_DELAY attribute.  Valid units are seconds and sample clock periods.
     '''
-    marker_event_latched_status = attributes.AttributeViBoolean(1150350)
+    marker_event_latched_status = attributes.AttributeViBoolean(1150350, volatile=True)
     '''
     Specifies the latched status of the specified Marker Event.
     Write VI_TRUE to this attribute to clear the latched status of the Marker Event.
     '''
-    marker_event_live_status = attributes.AttributeViBoolean(1150345)
+    marker_event_live_status = attributes.AttributeViBoolean(1150345, volatile=True)
     '''
     Returns the live status of the specified Marker Event.
     '''
@@ -660,7 +916,7 @@ class _SessionBase(object):
     Configures error reporting when the OSP block detects an overflow in any of its stages.  Overflows lead to clipping of the waveform.
     You can use the NIFGEN_ATTR_OSP_OVERFLOW_STATUS attribute to query for overflow  conditions whether or not the NIFGEN_ATTR_OSP_OVERFLOW_ERROR_REPORTING attribute is  enabled. The device will continue to generate after an overflow whether or not the  NIFGEN_ATTR_OSP_OVERFLOW_ERROR_REPORTING attribute is enabled.
     '''
-    osp_overflow_status = attributes.AttributeViInt32(1150269)
+    osp_overflow_status = attributes.AttributeViInt32(1150269, volatile=True)
     '''
     Returns a bit field of the overflow status in any stage of the OSP block.  This attribute is functional regardless of the value for the  NIFGEN_ATTR_OSP_OVERFLOW_ERROR_REPORTING attribute.
     Write 0 to this attribute to clear the current NIFGEN_ATTR_OSP_OVERFLOW_ERROR_REPORTING value.
@@ -723,7 +979,7 @@ class _SessionBase(object):
     '''
     Specifies the output polarity of the Ready for Start Event.
     '''
-    ready_for_start_event_live_status = attributes.AttributeViBoolean(1150348)
+    ready_for_start_event_live_status = attributes.AttributeViBoolean(1150348, volatile=True)
     '''
     Returns the live status of the specified Ready For Start Event.
     '''
@@ -827,7 +1083,7 @@ class _SessionBase(object):
     Specifies the units applied to the value of the NIFGEN_ATTR_STARTED_EVENT_DELAY
     attribute.  Valid units are seconds and sample clock periods.
     '''
-    started_event_latched_status = attributes.AttributeViBoolean(1150352)
+    started_event_latched_status = attributes.AttributeViBoolean(1150352, volatile=True)
     '''
     Specifies the latched status of the Started Event.
     '''
@@ -859,7 +1115,7 @@ class _SessionBase(object):
     '''
     Specifies whether you want the Start trigger to be a Digital Edge, or Software trigger. You can also choose None as the value for this attribute.
     '''
-    streaming_space_available_in_waveform = attributes.AttributeViInt32(1150325)
+    streaming_space_available_in_waveform = attributes.AttributeViInt32(1150325, volatile=True)
     '''
     Indicates the space available (in samples) in the streaming waveform for writing new data. During generation, this available space may be in multiple locations with, for example, part of the available space at the end of the streaming waveform and the rest at the beginning. In this situation, writing a block of waveform data the size of the  total space available in the streaming waveform causes NI-FGEN to return an error, as  NI-FGEN will not wrap the data from the end of the waveform to the beginning and cannot write data past the end of the waveform buffer.
     To avoid writing data past the end of the waveform, write new data to the waveform in a fixed size that is an integer divisor of the total size of the streaming waveform.
@@ -928,26 +1184,129 @@ class _SessionBase(object):
     For example, when this attribute returns a value of 8, all waveform sizes must be a multiple of 8. Typically, this value is constant for the signal generator.
     '''
 
-    def __init__(self, repeated_capability):
-        self._library = library_singleton.get()
+    def __init__(self, repeated_capability, attribute_cache, library, warning_policy, session_stats):
+        self._library = library
         self._repeated_capability = repeated_capability
+        self._attribute_cache = attribute_cache
+        self._warning_policy = warning_policy
+        self._session_stats = session_stats
         self._encoding = 'windows-1251'
+        # The driver does not modify it, so every call can pass the same buffer
+        self._repeated_capability_ctype = ctypes.create_string_buffer(repeated_capability.encode(self._encoding))
+        session_stats._add_session(self)
 
     def __setattr__(self, key, value):
-        if self._is_frozen and key not in dir(self):
+        if self._is_frozen and key not in self._get_attribute_names() and key not in self.__dict__:
             raise AttributeError("'{0}' object has no attribute '{1}'".format(type(self).__name__, key))
         object.__setattr__(self, key, value)
 
+    @property
+    def warning_policy(self):
+        '''warning_policy
+
+        How the session, and its repeated capabilities, report warnings from the driver. Change its mode to warn only
+        once per code, at most once per interval, or only count warnings:
+
+            session.warning_policy.mode = 'count'
+            ...
+            print(session.warning_policy.counts)
+
+        See errors.WarningPolicy.
+        '''
+        return self._warning_policy
+
+    @classmethod
+    def _get_attribute_names(cls):
+        '''_get_attribute_names
+
+        Returns a frozenset of the names of the properties and methods of the class, which can be set once the session
+        is frozen. It is computed once per class, because dir() is too slow to call every time a property is set.
+        '''
+        names = cls.__dict__.get('_attribute_names')
+        if names is None:
+            names = frozenset(dir(cls))
+            cls._attribute_names = names
+        return names
+
+    def _get_attribute_info(self, name_or_id):
+        try:
+            # type(u'') is unicode on Python 2
+            if isinstance(name_or_id, (str, type(u''))):
+                return attributes.index_by_name[name_or_id]
+            return attributes.index[name_or_id]
+        except KeyError:
+            raise ValueError('{0!r} is not an attribute of NI-FGEN'.format(name_or_id))
+
+    def get_attributes(self, names_or_ids, channels=None):
+        '''get_attributes
+
+        Gets the values of many attributes in one call. It creates the ctypes objects once for each type of attribute,
+        instead of once for each attribute like the properties do.
+
+        Args:
+            names_or_ids (list of str or int): Python names (i.e. 'all_marker_events_latched_status') or IDs of the attributes
+
+            channels (str): Repeated capabilities (usually channels) to get the attributes for. If not specified, uses the
+                ones of this object, like the properties do.
+
+        Returns:
+            values (collections.OrderedDict): Value of each attribute, by Python name, in the same order as names_or_ids
+        '''
+        session = self if channels is None else _RepeatedCapability(self._vi, channels, self._attribute_cache, self._library, self._warning_policy, self._session_stats)
+        return attributes.get_values(session, [self._get_attribute_info(a) for a in names_or_ids])
+
+    def snapshot(self):
+        '''snapshot
+
+        Gets the values of all the read-write attributes, to restore them later with apply(). Attributes that the driver
+        returns an error for (i.e. not supported by the device) and volatile attributes are left out.
+
+        Use it on a repeated capability (i.e. session['0'].snapshot()) to get the values of specific channels.
+
+        Returns:
+            values (collections.OrderedDict): Value of each attribute, by Python name
+        '''
+        infos = [a for a in sorted(attributes.index.values()) if a.access == 'read-write' and not a.volatile]
+        return attributes.get_values(self, infos, skip_errors=True)
+
+    def apply(self, values):
+        '''apply
+
+        Sets many attributes, i.e. from snapshot(), in order. It first gets the values of the attributes, and only sets
+        the ones that are different.
+
+        Args:
+            values (dict): Value of each attribute, by Python name or ID. Values of enum attributes must be members of
+                their enum.
+
+        Returns:
+            names (list of str): Python names of the attributes that were set
+        '''
+        infos_and_values = [(self._get_attribute_info(a), v) for a, v in values.items()]
+        current_values = attributes.get_values(self, [info for info, _ in infos_and_values if info.access != 'write only'], skip_errors=True)
+        changes = [(info, v) for info, v in infos_and_values if info.python_name not in current_values or current_values[info.python_name] != v]
+        attributes.set_values(self, changes)
+        return [info.python_name for info, _ in changes]
+
+    def _set_attributes(self, values):
+        '''Sets attributes from (Python name or ID, value) pairs, in order, without getting them first like apply() does'''
+        attributes.set_values(self, [(self._get_attribute_info(a), v) for a, v in values])
+
     def _get_error_description(self, error_code):
         '''_get_error_description
 
         Returns the error description.
+
+        errors retrieves descriptions only when they are used, when the last error of the session may be another one.
+        Those get the message for their code instead.
         '''
-        try:
-            _, error_string = self._get_error()
-            return error_string
-        except errors.Error:
-            pass
+        if error_code < 0:
+            try:
+                last_error_code, error_string = self._get_error()
+                if last_error_code == error_code:
+                    return error_string
+            except errors.Error:
+                pass
 
         try:
             '''
@@ -955,11 +1314,27 @@ class _SessionBase(object):
             (IVI spec requires GetError to fail).
             Use _error_message instead. It doesn't require a session.
             '''
-            error_string = self._error_message(error_code)
-            return error_string
+            return self._get_error_message(error_code)
         except errors.Error:
             return "Failed to retrieve error description."
 
+    def _get_error_message(self, error_code):
+        '''_get_error_message
+
+        Returns _error_message(error_code), from the messages of the most recently used codes if it is there.
+        '''
+        with _error_messages_lock:
+            error_string = _error_messages.pop(error_code, None)
+            if error_string is not None:
+                _error_messages[error_code] = error_string
+                return error_string
+        error_string = self._error_message(error_code)
+        with _error_messages_lock:
+            _error_messages[error_code] = error_string
+            if len(_error_messages) > _MAX_ERROR_MESSAGES:
+                _error_messages.popitem(last=False)
+        return error_string
+
     ''' These are code-generated '''
 
     def allocate_named_waveform(self, waveform_name, waveform_size):
@@ -984,10 +1359,11 @@ class _SessionBase(object):
 
                 **Default Value**: "4096"
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        waveform_name_ctype = ctypes.create_string_buffer(waveform_name.encode(self._encoding))  # case 3
-        waveform_size_ctype = visatype.ViInt32(waveform_size)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        waveform_name_ctype = waveform_name.encode(self._encoding)  # case 3
+        waveform_size_ctype = _scalar_ctypes.AllocateNamedWaveform_waveform_size
+        waveform_size_ctype.value = waveform_size  # case 8
         error_code = self._library.niFgen_AllocateNamedWaveform(vi_ctype, channel_name_ctype, waveform_name_ctype, waveform_size_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1018,11 +1394,12 @@ class _SessionBase(object):
             waveform_handle (int): The handle that identifies the new waveform. This handle is used later
                 when referring to this waveform.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        waveform_size_ctype = visatype.ViInt32(waveform_size)  # case 8
-        waveform_handle_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niFgen_AllocateWaveform(vi_ctype, channel_name_ctype, waveform_size_ctype, ctypes.pointer(waveform_handle_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        waveform_size_ctype = _scalar_ctypes.AllocateWaveform_waveform_size
+        waveform_size_ctype.value = waveform_size  # case 8
+        waveform_handle_ctype = _scalar_ctypes.AllocateWaveform_waveform_handle  # case 13
+        error_code = self._library.niFgen_AllocateWaveform(vi_ctype, channel_name_ctype, waveform_size_ctype, _scalar_ctypes.AllocateWaveform_waveform_handle_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(waveform_handle_ctype.value)
 
@@ -1040,8 +1417,8 @@ class _SessionBase(object):
 
             session['0,1'].clear_user_standard_waveform()
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
         error_code = self._library.niFgen_ClearUserStandardWaveform(vi_ctype, channel_name_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1099,13 +1476,17 @@ class _SessionBase(object):
 
                 **Default Value**: None
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        sequence_handle_ctype = visatype.ViInt32(sequence_handle)  # case 8
-        gain_ctype = visatype.ViReal64(gain)  # case 8
-        offset_ctype = visatype.ViReal64(offset)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        sequence_handle_ctype = _scalar_ctypes.ConfigureArbSequence_sequence_handle
+        sequence_handle_ctype.value = sequence_handle  # case 8
+        gain_ctype = _scalar_ctypes.ConfigureArbSequence_gain
+        gain_ctype.value = gain  # case 8
+        offset_ctype = _scalar_ctypes.ConfigureArbSequence_offset
+        offset_ctype.value = offset  # case 8
         error_code = self._library.niFgen_ConfigureArbSequence(vi_ctype, channel_name_ctype, sequence_handle_ctype, gain_ctype, offset_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_arb_waveform(self, waveform_handle, gain, offset):
@@ -1168,13 +1549,17 @@ class _SessionBase(object):
 
                 **Default Value**: None
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        waveform_handle_ctype = visatype.ViInt32(waveform_handle)  # case 8
-        gain_ctype = visatype.ViReal64(gain)  # case 8
-        offset_ctype = visatype.ViReal64(offset)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        waveform_handle_ctype = _scalar_ctypes.ConfigureArbWaveform_waveform_handle
+        waveform_handle_ctype.value = waveform_handle  # case 8
+        gain_ctype = _scalar_ctypes.ConfigureArbWaveform_gain
+        gain_ctype.value = gain  # case 8
+        offset_ctype = _scalar_ctypes.ConfigureArbWaveform_offset
+        offset_ctype.value = offset  # case 8
         error_code = self._library.niFgen_ConfigureArbWaveform(vi_ctype, channel_name_ctype, waveform_handle_ctype, gain_ctype, offset_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_custom_fir_filter_coefficients(self, coefficients_array):
@@ -1209,12 +1594,13 @@ class _SessionBase(object):
                 parameter in this function.
                 The coefficients should range between –1.00 and +1.00.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
         number_of_coefficients_ctype = visatype.ViInt32(len(coefficients_array))  # case 5
-        coefficients_array_ctype = (visatype.ViReal64 * len(coefficients_array))(*coefficients_array)  # case 4
+        coefficients_array_ctype = _converters.convert_to_ctypes_array(coefficients_array, visatype.ViReal64)  # case 4
         error_code = self._library.niFgen_ConfigureCustomFIRFilterCoefficients(vi_ctype, channel_name_ctype, number_of_coefficients_ctype, coefficients_array_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_freq_list(self, frequency_list_handle, amplitude, dc_offset=0.0, start_phase=0.0):
@@ -1287,14 +1673,19 @@ class _SessionBase(object):
                 This parameter does not affect signal generator behavior when you set
                 the **waveform** parameter to NIFGEN_VAL_WFM_DC.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        frequency_list_handle_ctype = visatype.ViInt32(frequency_list_handle)  # case 8
-        amplitude_ctype = visatype.ViReal64(amplitude)  # case 8
-        dc_offset_ctype = visatype.ViReal64(dc_offset)  # case 8
-        start_phase_ctype = visatype.ViReal64(start_phase)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        frequency_list_handle_ctype = _scalar_ctypes.ConfigureFreqList_frequency_list_handle
+        frequency_list_handle_ctype.value = frequency_list_handle  # case 8
+        amplitude_ctype = _scalar_ctypes.ConfigureFreqList_amplitude
+        amplitude_ctype.value = amplitude  # case 8
+        dc_offset_ctype = _scalar_ctypes.ConfigureFreqList_dc_offset
+        dc_offset_ctype.value = dc_offset  # case 8
+        start_phase_ctype = _scalar_ctypes.ConfigureFreqList_start_phase
+        start_phase_ctype.value = start_phase  # case 8
         error_code = self._library.niFgen_ConfigureFreqList(vi_ctype, channel_name_ctype, frequency_list_handle_ctype, amplitude_ctype, dc_offset_ctype, start_phase_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_standard_waveform(self, waveform, amplitude, frequency, dc_offset=0.0, start_phase=0.0):
@@ -1405,15 +1796,21 @@ class _SessionBase(object):
         '''
         if type(waveform) is not enums.Waveform:
             raise TypeError('Parameter mode must be of type ' + str(enums.Waveform))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        waveform_ctype = visatype.ViInt32(waveform.value)  # case 9
-        amplitude_ctype = visatype.ViReal64(amplitude)  # case 8
-        dc_offset_ctype = visatype.ViReal64(dc_offset)  # case 8
-        frequency_ctype = visatype.ViReal64(frequency)  # case 8
-        start_phase_ctype = visatype.ViReal64(start_phase)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        waveform_ctype = _scalar_ctypes.ConfigureStandardWaveform_waveform
+        waveform_ctype.value = waveform.value  # case 9
+        amplitude_ctype = _scalar_ctypes.ConfigureStandardWaveform_amplitude
+        amplitude_ctype.value = amplitude  # case 8
+        dc_offset_ctype = _scalar_ctypes.ConfigureStandardWaveform_dc_offset
+        dc_offset_ctype.value = dc_offset  # case 8
+        frequency_ctype = _scalar_ctypes.ConfigureStandardWaveform_frequency
+        frequency_ctype.value = frequency  # case 8
+        start_phase_ctype = _scalar_ctypes.ConfigureStandardWaveform_start_phase
+        start_phase_ctype.value = start_phase  # case 8
         error_code = self._library.niFgen_ConfigureStandardWaveform(vi_ctype, channel_name_ctype, waveform_ctype, amplitude_ctype, dc_offset_ctype, frequency_ctype, start_phase_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def create_waveform_f64(self, waveform_data_array):
@@ -1466,12 +1863,12 @@ class _SessionBase(object):
             waveform_handle (int): The handle that identifies the new waveform. This handle is used later
                 when referring to this waveform.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
         waveform_size_ctype = visatype.ViInt32(len(waveform_data_array))  # case 5
-        waveform_data_array_ctype = (visatype.ViReal64 * len(waveform_data_array))(*waveform_data_array)  # case 4
-        waveform_handle_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niFgen_CreateWaveformF64(vi_ctype, channel_name_ctype, waveform_size_ctype, waveform_data_array_ctype, ctypes.pointer(waveform_handle_ctype))
+        waveform_data_array_ctype = _converters.convert_to_ctypes_array(waveform_data_array, visatype.ViReal64)  # case 4
+        waveform_handle_ctype = _scalar_ctypes.CreateWaveformF64_waveform_handle  # case 13
+        error_code = self._library.niFgen_CreateWaveformF64(vi_ctype, channel_name_ctype, waveform_size_ctype, waveform_data_array_ctype, _scalar_ctypes.CreateWaveformF64_waveform_handle_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(waveform_handle_ctype.value)
 
@@ -1526,12 +1923,13 @@ class _SessionBase(object):
         '''
         if type(byte_order) is not enums.ByteOrder:
             raise TypeError('Parameter mode must be of type ' + str(enums.ByteOrder))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        file_name_ctype = ctypes.create_string_buffer(file_name.encode(self._encoding))  # case 3
-        byte_order_ctype = visatype.ViInt32(byte_order.value)  # case 9
-        waveform_handle_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niFgen_CreateWaveformFromFileF64(vi_ctype, channel_name_ctype, file_name_ctype, byte_order_ctype, ctypes.pointer(waveform_handle_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        file_name_ctype = file_name.encode(self._encoding)  # case 3
+        byte_order_ctype = _scalar_ctypes.CreateWaveformFromFileF64_byte_order
+        byte_order_ctype.value = byte_order.value  # case 9
+        waveform_handle_ctype = _scalar_ctypes.CreateWaveformFromFileF64_waveform_handle  # case 13
+        error_code = self._library.niFgen_CreateWaveformFromFileF64(vi_ctype, channel_name_ctype, file_name_ctype, byte_order_ctype, _scalar_ctypes.CreateWaveformFromFileF64_waveform_handle_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(waveform_handle_ctype.value)
 
@@ -1586,12 +1984,13 @@ class _SessionBase(object):
         '''
         if type(byte_order) is not enums.ByteOrder:
             raise TypeError('Parameter mode must be of type ' + str(enums.ByteOrder))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        file_name_ctype = ctypes.create_string_buffer(file_name.encode(self._encoding))  # case 3
-        byte_order_ctype = visatype.ViInt32(byte_order.value)  # case 9
-        waveform_handle_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niFgen_CreateWaveformFromFileI16(vi_ctype, channel_name_ctype, file_name_ctype, byte_order_ctype, ctypes.pointer(waveform_handle_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        file_name_ctype = file_name.encode(self._encoding)  # case 3
+        byte_order_ctype = _scalar_ctypes.CreateWaveformFromFileI16_byte_order
+        byte_order_ctype.value = byte_order.value  # case 9
+        waveform_handle_ctype = _scalar_ctypes.CreateWaveformFromFileI16_waveform_handle  # case 13
+        error_code = self._library.niFgen_CreateWaveformFromFileI16(vi_ctype, channel_name_ctype, file_name_ctype, byte_order_ctype, _scalar_ctypes.CreateWaveformFromFileI16_waveform_handle_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(waveform_handle_ctype.value)
 
@@ -1644,15 +2043,69 @@ class _SessionBase(object):
             waveform_handle (int): The handle that identifies the new waveform. This handle is used later
                 when referring to this waveform.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
         waveform_size_ctype = visatype.ViInt32(len(waveform_data_array))  # case 5
-        waveform_data_array_ctype = (visatype.ViInt16 * len(waveform_data_array))(*waveform_data_array)  # case 4
-        waveform_handle_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niFgen_CreateWaveformI16(vi_ctype, channel_name_ctype, waveform_size_ctype, waveform_data_array_ctype, ctypes.pointer(waveform_handle_ctype))
+        waveform_data_array_ctype = _converters.convert_to_ctypes_array(waveform_data_array, visatype.ViInt16)  # case 4
+        waveform_handle_ctype = _scalar_ctypes.CreateWaveformI16_waveform_handle  # case 13
+        error_code = self._library.niFgen_CreateWaveformI16(vi_ctype, channel_name_ctype, waveform_size_ctype, waveform_data_array_ctype, _scalar_ctypes.CreateWaveformI16_waveform_handle_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(waveform_handle_ctype.value)
 
+    def create_waveform_streamer(self, blocks, waveform_size, write_size, queue_size=4, timeout=10.0):
+        '''create_waveform_streamer
+
+        Returns a WaveformStreamer that plays back blocks of samples that do not fit in onboard memory, i.e.
+        a recording of several GB read from a file, by streaming them through a waveform of **waveform_size**
+        samples.
+
+        It allocates the waveform with allocate_waveform, and sets streaming_waveform_handle to it. The
+        handle is in the **waveform_handle** of the WaveformStreamer: configure the arbitrary waveform with
+        it, i.e. with configure_arb_waveform.
+
+        Its start() method starts two threads, and returns once the waveform is full. One thread reads
+        **blocks** and cuts them into pieces of **write_size** samples, in a queue of at most **queue_size**
+        pieces. The other one waits until streaming_space_available_in_waveform has room for the next piece,
+        and writes it with write_binary16_waveform, for int16 samples, or write_waveform, for float64 samples.
+        It calls set_waveform_next_write_position to write again from the start of the waveform once the end
+        is reached. So the iterator is only read as fast as the device generates the samples.
+
+        Initiate the generation after start(), then call wait() to wait until every block is written. It
+        raises the exception that stopped the threads, i.e. an error of the driver or of **blocks**. stop()
+        stops the threads early. A WaveformStreamer is also a context manager that starts it, and stops it
+        on exit.
+
+        .. code:: python
+
+            streamer = session.create_waveform_streamer(read_blocks('recording.bin'), 1048576, 262144)
+            session.configure_arb_waveform(streamer.waveform_handle, 1.0, 0.0)
+            with streamer:
+                with session.initiate():
+                    streamer.wait()
+
+        Note:
+        Blocks are written some time after they are read from **blocks**. Yield a new array for each block,
+        rather than filling the same one again.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        nifgen.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        nifgen.Session instance, and calling this method on the result.:
+
+            session['0,1'].create_waveform_streamer(blocks, waveform_size, write_size, queue_size=4, timeout=10.0)
+
+        Args:
+            blocks (iterable): Iterable, i.e. a generator, of the blocks of samples to write. Each block is a 1-dimensional numpy.ndarray
+                or array.array of int16 or float64 samples, or bytes of int16 samples in native byte order. All blocks
+                must have the same sample type. They can have any length.
+            waveform_size (int): Number of samples of the streaming waveform allocated in onboard memory. Must be a multiple of **write_size**.
+            write_size (int): Number of samples written with each call to write_waveform or write_binary16_waveform.
+            queue_size (int): Maximum number of writes of **write_size** samples read from **blocks** ahead of the device.
+            timeout (float): Maximum time, in seconds, to wait for space in the streaming waveform.
+        '''
+        return _streaming.create_waveform_streamer(self, blocks, waveform_size, write_size, queue_size, timeout)
+
     def define_user_standard_waveform(self, waveform_data_array):
         '''define_user_standard_waveform
 
@@ -1692,10 +2145,10 @@ class _SessionBase(object):
 
                 **Default Value**: None
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
         waveform_size_ctype = visatype.ViInt32(len(waveform_data_array))  # case 5
-        waveform_data_array_ctype = (visatype.ViReal64 * len(waveform_data_array))(*waveform_data_array)  # case 4
+        waveform_data_array_ctype = _converters.convert_to_ctypes_array(waveform_data_array, visatype.ViReal64)  # case 4
         error_code = self._library.niFgen_DefineUserStandardWaveform(vi_ctype, channel_name_ctype, waveform_size_ctype, waveform_data_array_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1721,9 +2174,9 @@ class _SessionBase(object):
         Args:
             waveform_name (string): Specifies the name to associate with the allocated waveform.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        waveform_name_ctype = ctypes.create_string_buffer(waveform_name.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        waveform_name_ctype = waveform_name.encode(self._encoding)  # case 3
         error_code = self._library.niFgen_DeleteNamedWaveform(vi_ctype, channel_name_ctype, waveform_name_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1745,9 +2198,9 @@ class _SessionBase(object):
             script_name (string): Specifies the name of the script you want to delete. The script name
                 appears in the text of the script following the script keyword.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        script_name_ctype = ctypes.create_string_buffer(script_name.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        script_name_ctype = script_name.encode(self._encoding)  # case 3
         error_code = self._library.niFgen_DeleteScript(vi_ctype, channel_name_ctype, script_name_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1781,11 +2234,12 @@ class _SessionBase(object):
             attribute_value (bool): Returns the current value of the attribute. Pass the address of a
                 ViBoolean variable.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViBoolean()  # case 13
-        error_code = self._library.niFgen_GetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViBoolean_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetAttributeViBoolean_attribute_value  # case 13
+        error_code = self._library.niFgen_GetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViBoolean_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return bool(attribute_value_ctype.value)
 
@@ -1816,11 +2270,12 @@ class _SessionBase(object):
             attribute_value (int): Returns the current value of the attribute. Pass the address of a
                 ViInt32 variable.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niFgen_GetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViInt32_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetAttributeViInt32_attribute_value  # case 13
+        error_code = self._library.niFgen_GetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViInt32_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(attribute_value_ctype.value)
 
@@ -1851,11 +2306,12 @@ class _SessionBase(object):
             attribute_value (int): Returns the current value of the attribute. Pass the address of a
                 ViInt64 variable.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViInt64()  # case 13
-        error_code = self._library.niFgen_GetAttributeViInt64(vi_ctype, channel_name_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViInt64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetAttributeViInt64_attribute_value  # case 13
+        error_code = self._library.niFgen_GetAttributeViInt64(vi_ctype, channel_name_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViInt64_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(attribute_value_ctype.value)
 
@@ -1888,11 +2344,12 @@ class _SessionBase(object):
             attribute_value (float): Returns the current value of the attribute. Pass the address of a
                 ViReal64 variable.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niFgen_GetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViReal64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetAttributeViReal64_attribute_value  # case 13
+        error_code = self._library.niFgen_GetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViReal64_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(attribute_value_ctype.value)
 
@@ -1955,16 +2412,23 @@ class _SessionBase(object):
                 If you pass 0, you can pass VI_NULL for the **attributeValue** buffer
                 parameter.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        array_size_ctype = visatype.ViInt32()  # case 6
-        attribute_value_ctype = None  # case 11
-        error_code = self._library.niFgen_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, array_size_ctype, attribute_value_ctype)
-        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
-        array_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        attribute_value_ctype = (visatype.ViChar * array_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViString_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        array_size_ctype = visatype.ViInt32(_ivi_dance_buffer_sizes.get(('GetAttributeViString', attribute_id), _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        attribute_value_ctype = (visatype.ViChar * array_size_ctype.value)()
         error_code = self._library.niFgen_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, array_size_ctype, attribute_value_ctype)
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            array_size_ctype = visatype.ViInt32(0)
+            attribute_value_ctype = None
+            error_code = self._library.niFgen_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, array_size_ctype, attribute_value_ctype)
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+            array_size_ctype = visatype.ViInt32(error_code)
+            attribute_value_ctype = (visatype.ViChar * array_size_ctype.value)()
+            error_code = self._library.niFgen_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, array_size_ctype, attribute_value_ctype)
+            _ivi_dance_buffer_sizes[('GetAttributeViString', attribute_id)] = array_size_ctype.value
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return attribute_value_ctype.value.decode(self._encoding)
 
@@ -2004,15 +2468,21 @@ class _SessionBase(object):
 
                 If you are not interested in this value, you can pass VI_NULL.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        error_code_ctype = visatype.ViStatus()  # case 13
-        error_description_buffer_size_ctype = visatype.ViInt32()  # case 6
-        error_description_ctype = None  # case 11
-        error_code = self._library.niFgen_GetError(vi_ctype, ctypes.pointer(error_code_ctype), error_description_buffer_size_ctype, error_description_ctype)
-        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=True)
-        error_description_buffer_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        error_description_ctype = (visatype.ViChar * error_description_buffer_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        error_code = self._library.niFgen_GetError(vi_ctype, ctypes.pointer(error_code_ctype), error_description_buffer_size_ctype, error_description_ctype)
+        vi_ctype = self._vi_ctype  # case 1
+        error_code_ctype = _scalar_ctypes.GetError_error_code  # case 13
+        error_description_buffer_size_ctype = visatype.ViInt32(_ivi_dance_buffer_sizes.get('GetError', _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        error_description_ctype = (visatype.ViChar * error_description_buffer_size_ctype.value)()
+        error_code = self._library.niFgen_GetError(vi_ctype, _scalar_ctypes.GetError_error_code_pointer, error_description_buffer_size_ctype, error_description_ctype)
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            error_description_buffer_size_ctype = visatype.ViInt32(0)
+            error_description_ctype = None
+            error_code = self._library.niFgen_GetError(vi_ctype, _scalar_ctypes.GetError_error_code_pointer, error_description_buffer_size_ctype, error_description_ctype)
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=True)
+            error_description_buffer_size_ctype = visatype.ViInt32(error_code)
+            error_description_ctype = (visatype.ViChar * error_description_buffer_size_ctype.value)()
+            error_code = self._library.niFgen_GetError(vi_ctype, _scalar_ctypes.GetError_error_code_pointer, error_description_buffer_size_ctype, error_description_ctype)
+            _ivi_dance_buffer_sizes['GetError'] = error_description_buffer_size_ctype.value
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=True)
         return int(error_code_ctype.value), error_description_ctype.value.decode(self._encoding)
 
@@ -2056,16 +2526,16 @@ class _SessionBase(object):
             number_of_coefficients_read (int): Specifies the array of data containing the number of coefficients you
                 want to read.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
         array_size_ctype = visatype.ViInt32()  # case 6
         coefficients_array_ctype = None  # case 11
-        number_of_coefficients_read_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niFgen_GetFIRFilterCoefficients(vi_ctype, channel_name_ctype, array_size_ctype, coefficients_array_ctype, ctypes.pointer(number_of_coefficients_read_ctype))
+        number_of_coefficients_read_ctype = _scalar_ctypes.GetFIRFilterCoefficients_number_of_coefficients_read  # case 13
+        error_code = self._library.niFgen_GetFIRFilterCoefficients(vi_ctype, channel_name_ctype, array_size_ctype, coefficients_array_ctype, _scalar_ctypes.GetFIRFilterCoefficients_number_of_coefficients_read_pointer)
         errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
         array_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
         coefficients_array_ctype = (visatype.ViReal64 * array_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        error_code = self._library.niFgen_GetFIRFilterCoefficients(vi_ctype, channel_name_ctype, array_size_ctype, coefficients_array_ctype, ctypes.pointer(number_of_coefficients_read_ctype))
+        error_code = self._library.niFgen_GetFIRFilterCoefficients(vi_ctype, channel_name_ctype, array_size_ctype, coefficients_array_ctype, _scalar_ctypes.GetFIRFilterCoefficients_number_of_coefficients_read_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return [float(coefficients_array_ctype[i]) for i in range(array_size_ctype.value)], int(number_of_coefficients_read_ctype.value)
 
@@ -2197,12 +2667,13 @@ class _SessionBase(object):
             vi (int): Returns a session handle that you can use to identify the device in all
                 subsequent NI-FGEN function calls.
         '''
-        resource_name_ctype = ctypes.create_string_buffer(resource_name.encode(self._encoding))  # case 3
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        reset_device_ctype = visatype.ViBoolean(reset_device)  # case 8
-        option_string_ctype = ctypes.create_string_buffer(option_string.encode(self._encoding))  # case 3
-        vi_ctype = visatype.ViSession()  # case 13
-        error_code = self._library.niFgen_InitializeWithChannels(resource_name_ctype, channel_name_ctype, reset_device_ctype, option_string_ctype, ctypes.pointer(vi_ctype))
+        resource_name_ctype = resource_name.encode(self._encoding)  # case 3
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        reset_device_ctype = _scalar_ctypes.InitializeWithChannels_reset_device
+        reset_device_ctype.value = reset_device  # case 8
+        option_string_ctype = option_string.encode(self._encoding)  # case 3
+        vi_ctype = _scalar_ctypes.InitializeWithChannels_vi  # case 13
+        error_code = self._library.niFgen_InitializeWithChannels(resource_name_ctype, channel_name_ctype, reset_device_ctype, option_string_ctype, _scalar_ctypes.InitializeWithChannels_vi_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(vi_ctype.value)
 
@@ -2251,10 +2722,12 @@ class _SessionBase(object):
                 Some of the values might not be valid depending on the current
                 settings of the instrument session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViBoolean(attribute_value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViBoolean_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.SetAttributeViBoolean_attribute_value
+        attribute_value_ctype.value = attribute_value  # case 8
         error_code = self._library.niFgen_SetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2304,10 +2777,12 @@ class _SessionBase(object):
                 Some of the values might not be valid depending on the current
                 settings of the instrument session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViInt32(attribute_value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViInt32_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.SetAttributeViInt32_attribute_value
+        attribute_value_ctype.value = attribute_value  # case 8
         error_code = self._library.niFgen_SetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2357,10 +2832,12 @@ class _SessionBase(object):
                 Some of the values might not be valid depending on the current
                 settings of the instrument session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViInt64(attribute_value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViInt64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.SetAttributeViInt64_attribute_value
+        attribute_value_ctype.value = attribute_value  # case 8
         error_code = self._library.niFgen_SetAttributeViInt64(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2410,10 +2887,12 @@ class _SessionBase(object):
                 Some of the values might not be valid depending on the current
                 settings of the instrument session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViReal64(attribute_value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViReal64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.SetAttributeViReal64_attribute_value
+        attribute_value_ctype.value = attribute_value  # case 8
         error_code = self._library.niFgen_SetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2463,10 +2942,11 @@ class _SessionBase(object):
                 Some of the values might not be valid depending on the current
                 settings of the instrument session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = ctypes.create_string_buffer(attribute_value.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViString_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = attribute_value.encode(self._encoding)  # case 3
         error_code = self._library.niFgen_SetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2515,11 +2995,13 @@ class _SessionBase(object):
         '''
         if type(relative_to) is not enums.RelativeTo:
             raise TypeError('Parameter mode must be of type ' + str(enums.RelativeTo))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        waveform_name_ctype = ctypes.create_string_buffer(waveform_name.encode(self._encoding))  # case 3
-        relative_to_ctype = visatype.ViInt32(relative_to.value)  # case 9
-        offset_ctype = visatype.ViInt32(offset)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        waveform_name_ctype = waveform_name.encode(self._encoding)  # case 3
+        relative_to_ctype = _scalar_ctypes.SetNamedWaveformNextWritePosition_relative_to
+        relative_to_ctype.value = relative_to.value  # case 9
+        offset_ctype = _scalar_ctypes.SetNamedWaveformNextWritePosition_offset
+        offset_ctype.value = offset  # case 8
         error_code = self._library.niFgen_SetNamedWaveformNextWritePosition(vi_ctype, channel_name_ctype, waveform_name_ctype, relative_to_ctype, offset_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2569,11 +3051,14 @@ class _SessionBase(object):
         '''
         if type(relative_to) is not enums.RelativeTo:
             raise TypeError('Parameter mode must be of type ' + str(enums.RelativeTo))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        waveform_handle_ctype = visatype.ViInt32(waveform_handle)  # case 8
-        relative_to_ctype = visatype.ViInt32(relative_to.value)  # case 9
-        offset_ctype = visatype.ViInt32(offset)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        waveform_handle_ctype = _scalar_ctypes.SetWaveformNextWritePosition_waveform_handle
+        waveform_handle_ctype.value = waveform_handle  # case 8
+        relative_to_ctype = _scalar_ctypes.SetWaveformNextWritePosition_relative_to
+        relative_to_ctype.value = relative_to.value  # case 9
+        offset_ctype = _scalar_ctypes.SetWaveformNextWritePosition_offset
+        offset_ctype.value = offset  # case 8
         error_code = self._library.niFgen_SetWaveformNextWritePosition(vi_ctype, channel_name_ctype, waveform_handle_ctype, relative_to_ctype, offset_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2612,11 +3097,12 @@ class _SessionBase(object):
                 have at least as many elements as the value in **size**. The binary data
                 is left-justified.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        waveform_handle_ctype = visatype.ViInt32(waveform_handle)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        waveform_handle_ctype = _scalar_ctypes.WriteBinary16Waveform_waveform_handle
+        waveform_handle_ctype.value = waveform_handle  # case 8
         size_ctype = visatype.ViInt32(len(data))  # case 5
-        data_ctype = (visatype.ViInt16 * len(data))(*data)  # case 4
+        data_ctype = _converters.convert_to_ctypes_array(data, visatype.ViInt16)  # case 4
         error_code = self._library.niFgen_WriteBinary16Waveform(vi_ctype, channel_name_ctype, waveform_handle_ctype, size_ctype, data_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2660,11 +3146,11 @@ class _SessionBase(object):
             data (list of float): Specifies the array of data to load into the waveform. The array must
                 have at least as many elements as the value in **size**.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        waveform_name_ctype = ctypes.create_string_buffer(waveform_name.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        waveform_name_ctype = waveform_name.encode(self._encoding)  # case 3
         size_ctype = visatype.ViInt32(len(data))  # case 5
-        data_ctype = (visatype.ViReal64 * len(data))(*data)  # case 4
+        data_ctype = _converters.convert_to_ctypes_array(data, visatype.ViReal64)  # case 4
         error_code = self._library.niFgen_WriteNamedWaveformF64(vi_ctype, channel_name_ctype, waveform_name_ctype, size_ctype, data_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2699,11 +3185,11 @@ class _SessionBase(object):
             data (list of int): Specifies the array of data to load into the waveform. The array must
                 have at least as many elements as the value in **size**.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        waveform_name_ctype = ctypes.create_string_buffer(waveform_name.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        waveform_name_ctype = waveform_name.encode(self._encoding)  # case 3
         size_ctype = visatype.ViInt32(len(data))  # case 5
-        data_ctype = (visatype.ViInt16 * len(data))(*data)  # case 4
+        data_ctype = _converters.convert_to_ctypes_array(data, visatype.ViInt16)  # case 4
         error_code = self._library.niFgen_WriteNamedWaveformI16(vi_ctype, channel_name_ctype, waveform_name_ctype, size_ctype, data_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2728,9 +3214,9 @@ class _SessionBase(object):
                 Instructions <REPLACE_DRIVER_SPECIFIC_URL_2(niscripted.chm',%20'scripting_instructions)>`__
                 for more information about writing scripts.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        script_ctype = ctypes.create_string_buffer(script.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        script_ctype = script.encode(self._encoding)  # case 3
         error_code = self._library.niFgen_WriteScript(vi_ctype, channel_name_ctype, script_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2775,11 +3261,12 @@ class _SessionBase(object):
             data (list of float): Specifies the array of data to load into the waveform. The array must
                 have at least as many elements as the value in **size**.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        waveform_handle_ctype = visatype.ViInt32(waveform_handle)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        waveform_handle_ctype = _scalar_ctypes.WriteWaveform_waveform_handle
+        waveform_handle_ctype.value = waveform_handle  # case 8
         size_ctype = visatype.ViInt32(len(data))  # case 5
-        data_ctype = (visatype.ViReal64 * len(data))(*data)  # case 4
+        data_ctype = _converters.convert_to_ctypes_array(data, visatype.ViReal64)  # case 4
         error_code = self._library.niFgen_WriteWaveform(vi_ctype, channel_name_ctype, waveform_handle_ctype, size_ctype, data_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2802,8 +3289,9 @@ class _SessionBase(object):
 
                 You must pass a ViChar array with at least 256 bytes.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        error_code_ctype = visatype.ViStatus(error_code)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        error_code_ctype = _scalar_ctypes.error_message_error_code
+        error_code_ctype.value = error_code  # case 8
         error_message_ctype = (visatype.ViChar * 256)()  # case 10
         error_code = self._library.niFgen_error_message(vi_ctype, error_code_ctype, error_message_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=True)
@@ -2813,9 +3301,10 @@ class _SessionBase(object):
 class _RepeatedCapability(_SessionBase):
     '''Allows for setting/getting properties and calling methods for specific repeated capabilities (such as channels) on your session.'''
 
-    def __init__(self, vi, repeated_capability):
-        super(_RepeatedCapability, self).__init__(repeated_capability)
+    def __init__(self, vi, repeated_capability, attribute_cache, library, warning_policy, session_stats):
+        super(_RepeatedCapability, self).__init__(repeated_capability, attribute_cache, library, warning_policy, session_stats)
         self._vi = vi
+        self._vi_ctype = visatype.ViSession(vi)
         self._is_frozen = True
 
 
@@ -2823,9 +3312,16 @@ class Session(_SessionBase):
     '''An NI-FGEN session to a National Instruments Signal Generator.'''
 
     def __init__(self, resource_name, reset_device=False, option_string=''):
-        super(Session, self).__init__(repeated_capability='')
+        super(Session, self).__init__(repeated_capability='', attribute_cache=attributes.AttributeCache(), library=library_singleton.get(), warning_policy=errors.WarningPolicy(), session_stats=call_stats.SessionStats(_c_functions))
+        if call_stats.registry.enabled:
+            self._session_stats.enable()
+        self._repeated_capability_views = collections.OrderedDict()
+        self._repeated_capability_views_lock = threading.Lock()
         self._vi = 0  # This must be set before calling _initialize_with_channels().
+        # Passed to every method, which would otherwise create it on every call
+        self._vi_ctype = visatype.ViSession(0)
         self._vi = self._initialize_with_channels(resource_name, reset_device, option_string)
+        self._vi_ctype = visatype.ViSession(self._vi)
         self._is_frozen = True
 
     def __enter__(self):
@@ -2836,18 +3332,89 @@ class Session(_SessionBase):
 
     def __getitem__(self, repeated_capability):
         '''Set/get properties or call methods with a repeated capability (i.e. channels)'''
-        return _RepeatedCapability(self._vi, repeated_capability)
+        # The most recently used views are kept, so loops over channels don't create a view each time
+        with self._repeated_capability_views_lock:
+            view = self._repeated_capability_views.pop(repeated_capability, None)
+            if view is None:
+                view = _RepeatedCapability(self._vi, repeated_capability, self._attribute_cache, self._library, self._warning_policy, self._session_stats)
+                if len(self._repeated_capability_views) >= _MAX_REPEATED_CAPABILITY_VIEWS:
+                    self._repeated_capability_views.popitem(last=False)
+            self._repeated_capability_views[repeated_capability] = view
+        return view
 
     def initiate(self):
         return _Generation(self)
 
+    def enable_attribute_cache(self):
+        '''enable_attribute_cache
+
+        Caches the values of attributes in this session, and in its repeated capabilities, so that getting them again
+        doesn't call into the driver. Setting an attribute updates the cache. Methods that reset or configure the
+        session (i.e. reset(), commit() and configure methods) clear it.
+
+        Volatile attributes, whose values change on their own (i.e. status), are never cached.
+
+        Note:
+        Setting an attribute caches the value that was set. If the driver coerces it (i.e. up to a valid range), the
+        cache returns the value that was set until it is cleared. Calling enable_attribute_cache() again clears it.
+        '''
+        self._attribute_cache.clear()
+        self._attribute_cache.enabled = True
+
+    def disable_attribute_cache(self):
+        '''disable_attribute_cache
+
+        Stops caching the values of attributes, and clears the cache. See enable_attribute_cache().
+        '''
+        self._attribute_cache.enabled = False
+        self._attribute_cache.clear()
+
+    def enable_stats(self):
+        '''enable_stats
+
+        Starts recording statistics of the driver calls of this session, and of its repeated capabilities: for each C
+        function, the number of calls, their latencies, and how much of that time was spent in the driver and how much
+        in Python. Calling enable_stats() again clears them. See stats().
+
+        Methods are slower while stats are enabled. Set call_stats.registry.enabled to True to enable them for all new
+        sessions instead.
+        '''
+        self._session_stats.enable()
+
+    def disable_stats(self):
+        '''disable_stats
+
+        Stops recording statistics of the driver calls. stats() still returns the ones recorded. See enable_stats().
+        '''
+        self._session_stats.disable()
+
+    def stats(self):
+        '''stats
+
+        Returns the statistics of the driver calls recorded since enable_stats():
+
+            session.enable_stats()
+            ...
+            for function, s in session.stats().items():
+                print(function, s.calls, s.driver_time, s.python_time, s.percentile(99))
+
+        Returns:
+            stats (collections.OrderedDict): call_stats.FunctionStats by C function name, the one with the most total
+                time first
+        '''
+        return self._session_stats.stats()
+
     def close(self):
+        with self._repeated_capability_views_lock:
+            self._repeated_capability_views.clear()
         try:
             self._close()
         except errors.Error as e:
             self._vi = 0
+            self._vi_ctype = visatype.ViSession(0)
             raise
         self._vi = 0
+        self._vi_ctype = visatype.ViSession(0)
 
     ''' These are code-generated '''
 
@@ -2858,7 +3425,7 @@ class Session(_SessionBase):
         nifgen_InitiateGeneration function to cause the signal generator to
         produce a signal again.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niFgen_AbortGeneration(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2883,8 +3450,9 @@ class Session(_SessionBase):
 
                 **Default Value**: 0
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        adjustment_time_ctype = visatype.ViReal64(adjustment_time)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        adjustment_time_ctype = _scalar_ctypes.AdjustSampleClockRelativeDelay_adjustment_time
+        adjustment_time_ctype.value = adjustment_time  # case 8
         error_code = self._library.niFgen_AdjustSampleClockRelativeDelay(vi_ctype, adjustment_time_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2900,7 +3468,7 @@ class Session(_SessionBase):
         The signal generator must not be in the Generating state when you
         call this function.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niFgen_ClearArbMemory(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2927,8 +3495,9 @@ class Session(_SessionBase):
 
                 **Default Value**: None
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        sequence_handle_ctype = visatype.ViInt32(sequence_handle)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        sequence_handle_ctype = _scalar_ctypes.ClearArbSequence_sequence_handle
+        sequence_handle_ctype.value = sequence_handle  # case 8
         error_code = self._library.niFgen_ClearArbSequence(vi_ctype, sequence_handle_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2963,8 +3532,9 @@ class Session(_SessionBase):
 
                 **Default Value**: None
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        waveform_handle_ctype = visatype.ViInt32(waveform_handle)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        waveform_handle_ctype = _scalar_ctypes.ClearArbWaveform_waveform_handle
+        waveform_handle_ctype.value = waveform_handle  # case 8
         error_code = self._library.niFgen_ClearArbWaveform(vi_ctype, waveform_handle_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2993,8 +3563,9 @@ class Session(_SessionBase):
 
                 **Default Value**: None
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        frequency_list_handle_ctype = visatype.ViInt32(frequency_list_handle)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        frequency_list_handle_ctype = _scalar_ctypes.ClearFreqList_frequency_list_handle
+        frequency_list_handle_ctype.value = frequency_list_handle  # case 8
         error_code = self._library.niFgen_ClearFreqList(vi_ctype, frequency_list_handle_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -3023,9 +3594,10 @@ class Session(_SessionBase):
         -  A subsequent _initiate_generation function can run faster
            because the device is already configured.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niFgen_Commit(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_digital_edge_script_trigger(self, trigger_id, source, edge=enums.ScriptTriggerDigitalEdgeEdge.RISING):
@@ -3104,12 +3676,14 @@ class Session(_SessionBase):
         '''
         if type(edge) is not enums.ScriptTriggerDigitalEdgeEdge:
             raise TypeError('Parameter mode must be of type ' + str(enums.ScriptTriggerDigitalEdgeEdge))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        trigger_id_ctype = ctypes.create_string_buffer(trigger_id.encode(self._encoding))  # case 3
-        source_ctype = ctypes.create_string_buffer(source.encode(self._encoding))  # case 3
-        edge_ctype = visatype.ViInt32(edge.value)  # case 9
+        vi_ctype = self._vi_ctype  # case 1
+        trigger_id_ctype = trigger_id.encode(self._encoding)  # case 3
+        source_ctype = source.encode(self._encoding)  # case 3
+        edge_ctype = _scalar_ctypes.ConfigureDigitalEdgeScriptTrigger_edge
+        edge_ctype.value = edge.value  # case 9
         error_code = self._library.niFgen_ConfigureDigitalEdgeScriptTrigger(vi_ctype, trigger_id_ctype, source_ctype, edge_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_digital_edge_start_trigger(self, source, edge=enums.StartTriggerDigitalEdgeEdge.RISING):
@@ -3173,11 +3747,13 @@ class Session(_SessionBase):
         '''
         if type(edge) is not enums.StartTriggerDigitalEdgeEdge:
             raise TypeError('Parameter mode must be of type ' + str(enums.StartTriggerDigitalEdgeEdge))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        source_ctype = ctypes.create_string_buffer(source.encode(self._encoding))  # case 3
-        edge_ctype = visatype.ViInt32(edge.value)  # case 9
+        vi_ctype = self._vi_ctype  # case 1
+        source_ctype = source.encode(self._encoding)  # case 3
+        edge_ctype = _scalar_ctypes.ConfigureDigitalEdgeStartTrigger_edge
+        edge_ctype.value = edge.value  # case 9
         error_code = self._library.niFgen_ConfigureDigitalEdgeStartTrigger(vi_ctype, source_ctype, edge_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_digital_level_script_trigger(self, trigger_id, source, trigger_when):
@@ -3255,12 +3831,14 @@ class Session(_SessionBase):
                 | "LowLevel"  | Script Trigger asserts on a low digital level.  |
                 +-------------+-------------------------------------------------+
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        trigger_id_ctype = ctypes.create_string_buffer(trigger_id.encode(self._encoding))  # case 3
-        source_ctype = ctypes.create_string_buffer(source.encode(self._encoding))  # case 3
-        trigger_when_ctype = visatype.ViInt32(trigger_when)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        trigger_id_ctype = trigger_id.encode(self._encoding)  # case 3
+        source_ctype = source.encode(self._encoding)  # case 3
+        trigger_when_ctype = _scalar_ctypes.ConfigureDigitalLevelScriptTrigger_trigger_when
+        trigger_when_ctype.value = trigger_when  # case 8
         error_code = self._library.niFgen_ConfigureDigitalLevelScriptTrigger(vi_ctype, trigger_id_ctype, source_ctype, trigger_when_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def create_advanced_arb_sequence(self, waveform_handles_array, loop_counts_array, sample_counts_array=None, marker_location_array=None):
@@ -3362,15 +3940,15 @@ class Session(_SessionBase):
                 pass this handle to nifgen_ConfigureArbSequence to generate the
                 arbitrary sequence.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         sequence_length_ctype = visatype.ViInt32(len(waveform_handles_array))  # case 5
-        waveform_handles_array_ctype = (visatype.ViInt32 * len(waveform_handles_array))(*waveform_handles_array)  # case 4
-        loop_counts_array_ctype = (visatype.ViInt32 * len(loop_counts_array))(*loop_counts_array)  # case 4
-        sample_counts_array_ctype = (visatype.ViInt32 * len(sample_counts_array))(*sample_counts_array)  # case 4
-        marker_location_array_ctype = (visatype.ViInt32 * len(marker_location_array))(*marker_location_array)  # case 4
+        waveform_handles_array_ctype = _converters.convert_to_ctypes_array(waveform_handles_array, visatype.ViInt32)  # case 4
+        loop_counts_array_ctype = _converters.convert_to_ctypes_array(loop_counts_array, visatype.ViInt32)  # case 4
+        sample_counts_array_ctype = _converters.convert_to_ctypes_array(sample_counts_array, visatype.ViInt32)  # case 4
+        marker_location_array_ctype = _converters.convert_to_ctypes_array(marker_location_array, visatype.ViInt32)  # case 4
         coerced_markers_array_ctype = (visatype.ViInt32 * 1)()  # case 10
-        sequence_handle_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niFgen_CreateAdvancedArbSequence(vi_ctype, sequence_length_ctype, waveform_handles_array_ctype, loop_counts_array_ctype, sample_counts_array_ctype, marker_location_array_ctype, coerced_markers_array_ctype, ctypes.pointer(sequence_handle_ctype))
+        sequence_handle_ctype = _scalar_ctypes.CreateAdvancedArbSequence_sequence_handle  # case 13
+        error_code = self._library.niFgen_CreateAdvancedArbSequence(vi_ctype, sequence_length_ctype, waveform_handles_array_ctype, loop_counts_array_ctype, sample_counts_array_ctype, marker_location_array_ctype, coerced_markers_array_ctype, _scalar_ctypes.CreateAdvancedArbSequence_sequence_handle_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return [int(coerced_markers_array_ctype[i]) for i in range(1)], int(sequence_handle_ctype.value)
 
@@ -3435,12 +4013,13 @@ class Session(_SessionBase):
                 pass this handle to nifgen_ConfigureArbSequence to generate the
                 arbitrary sequence.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        sequence_length_ctype = visatype.ViInt32(sequence_length)  # case 8
-        waveform_handles_array_ctype = (visatype.ViInt32 * len(waveform_handles_array))(*waveform_handles_array)  # case 4
-        loop_counts_array_ctype = (visatype.ViInt32 * len(loop_counts_array))(*loop_counts_array)  # case 4
-        sequence_handle_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niFgen_CreateArbSequence(vi_ctype, sequence_length_ctype, waveform_handles_array_ctype, loop_counts_array_ctype, ctypes.pointer(sequence_handle_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        sequence_length_ctype = _scalar_ctypes.CreateArbSequence_sequence_length
+        sequence_length_ctype.value = sequence_length  # case 8
+        waveform_handles_array_ctype = _converters.convert_to_ctypes_array(waveform_handles_array, visatype.ViInt32)  # case 4
+        loop_counts_array_ctype = _converters.convert_to_ctypes_array(loop_counts_array, visatype.ViInt32)  # case 4
+        sequence_handle_ctype = _scalar_ctypes.CreateArbSequence_sequence_handle  # case 13
+        error_code = self._library.niFgen_CreateArbSequence(vi_ctype, sequence_length_ctype, waveform_handles_array_ctype, loop_counts_array_ctype, _scalar_ctypes.CreateArbSequence_sequence_handle_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(sequence_handle_ctype.value)
 
@@ -3527,13 +4106,14 @@ class Session(_SessionBase):
         '''
         if type(waveform) is not enums.Waveform:
             raise TypeError('Parameter mode must be of type ' + str(enums.Waveform))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        waveform_ctype = visatype.ViInt32(waveform.value)  # case 9
+        vi_ctype = self._vi_ctype  # case 1
+        waveform_ctype = _scalar_ctypes.CreateFreqList_waveform
+        waveform_ctype.value = waveform.value  # case 9
         frequency_list_length_ctype = visatype.ViInt32(len(frequency_array))  # case 5
-        frequency_array_ctype = (visatype.ViReal64 * len(frequency_array))(*frequency_array)  # case 4
-        duration_array_ctype = (visatype.ViReal64 * len(duration_array))(*duration_array)  # case 4
-        frequency_list_handle_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niFgen_CreateFreqList(vi_ctype, waveform_ctype, frequency_list_length_ctype, frequency_array_ctype, duration_array_ctype, ctypes.pointer(frequency_list_handle_ctype))
+        frequency_array_ctype = _converters.convert_to_ctypes_array(frequency_array, visatype.ViReal64)  # case 4
+        duration_array_ctype = _converters.convert_to_ctypes_array(duration_array, visatype.ViReal64)  # case 4
+        frequency_list_handle_ctype = _scalar_ctypes.CreateFreqList_frequency_list_handle  # case 13
+        error_code = self._library.niFgen_CreateFreqList(vi_ctype, waveform_ctype, frequency_list_length_ctype, frequency_array_ctype, duration_array_ctype, _scalar_ctypes.CreateFreqList_frequency_list_handle_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(frequency_list_handle_ctype.value)
 
@@ -3544,7 +4124,7 @@ class Session(_SessionBase):
         impact on the system to which it is connected. The analog output and all
         exported signals are disabled.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niFgen_Disable(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -3669,10 +4249,11 @@ class Session(_SessionBase):
         '''
         if type(signal) is not enums.Signal:
             raise TypeError('Parameter mode must be of type ' + str(enums.Signal))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        signal_ctype = visatype.ViInt32(signal.value)  # case 9
-        signal_identifier_ctype = ctypes.create_string_buffer(signal_identifier.encode(self._encoding))  # case 3
-        output_terminal_ctype = ctypes.create_string_buffer(output_terminal.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        signal_ctype = _scalar_ctypes.ExportSignal_signal
+        signal_ctype.value = signal.value  # case 9
+        signal_identifier_ctype = signal_identifier.encode(self._encoding)  # case 3
+        output_terminal_ctype = output_terminal.encode(self._encoding)  # case 3
         error_code = self._library.niFgen_ExportSignal(vi_ctype, signal_ctype, signal_identifier_ctype, output_terminal_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -3692,13 +4273,13 @@ class Session(_SessionBase):
             hour (int): Specifies the hour of the last successful calibration.
             minute (int): Specifies the minute of the last successful calibration.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        year_ctype = visatype.ViInt32()  # case 13
-        month_ctype = visatype.ViInt32()  # case 13
-        day_ctype = visatype.ViInt32()  # case 13
-        hour_ctype = visatype.ViInt32()  # case 13
-        minute_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niFgen_GetExtCalLastDateAndTime(vi_ctype, ctypes.pointer(year_ctype), ctypes.pointer(month_ctype), ctypes.pointer(day_ctype), ctypes.pointer(hour_ctype), ctypes.pointer(minute_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        year_ctype = _scalar_ctypes.GetExtCalLastDateAndTime_year  # case 13
+        month_ctype = _scalar_ctypes.GetExtCalLastDateAndTime_month  # case 13
+        day_ctype = _scalar_ctypes.GetExtCalLastDateAndTime_day  # case 13
+        hour_ctype = _scalar_ctypes.GetExtCalLastDateAndTime_hour  # case 13
+        minute_ctype = _scalar_ctypes.GetExtCalLastDateAndTime_minute  # case 13
+        error_code = self._library.niFgen_GetExtCalLastDateAndTime(vi_ctype, _scalar_ctypes.GetExtCalLastDateAndTime_year_pointer, _scalar_ctypes.GetExtCalLastDateAndTime_month_pointer, _scalar_ctypes.GetExtCalLastDateAndTime_day_pointer, _scalar_ctypes.GetExtCalLastDateAndTime_hour_pointer, _scalar_ctypes.GetExtCalLastDateAndTime_minute_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(year_ctype.value), int(month_ctype.value), int(day_ctype.value), int(hour_ctype.value), int(minute_ctype.value)
 
@@ -3712,9 +4293,9 @@ class Session(_SessionBase):
             temperature (float): Specifies the temperature at the last successful calibration in degrees
                 Celsius.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        temperature_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niFgen_GetExtCalLastTemp(vi_ctype, ctypes.pointer(temperature_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        temperature_ctype = _scalar_ctypes.GetExtCalLastTemp_temperature  # case 13
+        error_code = self._library.niFgen_GetExtCalLastTemp(vi_ctype, _scalar_ctypes.GetExtCalLastTemp_temperature_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(temperature_ctype.value)
 
@@ -3728,9 +4309,9 @@ class Session(_SessionBase):
             months (int): Specifies the recommended interval between external calibrations in
                 months.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        months_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niFgen_GetExtCalRecommendedInterval(vi_ctype, ctypes.pointer(months_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        months_ctype = _scalar_ctypes.GetExtCalRecommendedInterval_months  # case 13
+        error_code = self._library.niFgen_GetExtCalRecommendedInterval(vi_ctype, _scalar_ctypes.GetExtCalRecommendedInterval_months_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(months_ctype.value)
 
@@ -3759,11 +4340,11 @@ class Session(_SessionBase):
                 | NIFGEN_VAL_HARDWARE_ERROR            | There is a hardware error.                 |
                 +--------------------------------------+--------------------------------------------+
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        state_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niFgen_GetHardwareState(vi_ctype, ctypes.pointer(state_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        state_ctype = _scalar_ctypes.GetHardwareState_state  # case 13
+        error_code = self._library.niFgen_GetHardwareState(vi_ctype, _scalar_ctypes.GetHardwareState_state_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return enums.HardwareState(state_ctype.value)
+        return enums._get_member(enums.HardwareState, state_ctype.value)
 
     def get_self_cal_last_date_and_time(self):
         '''get_self_cal_last_date_and_time
@@ -3787,13 +4368,13 @@ class Session(_SessionBase):
             hour (int): Specifies the hour of the last successful calibration.
             minute (int): Specifies the minute of the last successful calibration.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        year_ctype = visatype.ViInt32()  # case 13
-        month_ctype = visatype.ViInt32()  # case 13
-        day_ctype = visatype.ViInt32()  # case 13
-        hour_ctype = visatype.ViInt32()  # case 13
-        minute_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niFgen_GetSelfCalLastDateAndTime(vi_ctype, ctypes.pointer(year_ctype), ctypes.pointer(month_ctype), ctypes.pointer(day_ctype), ctypes.pointer(hour_ctype), ctypes.pointer(minute_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        year_ctype = _scalar_ctypes.GetSelfCalLastDateAndTime_year  # case 13
+        month_ctype = _scalar_ctypes.GetSelfCalLastDateAndTime_month  # case 13
+        day_ctype = _scalar_ctypes.GetSelfCalLastDateAndTime_day  # case 13
+        hour_ctype = _scalar_ctypes.GetSelfCalLastDateAndTime_hour  # case 13
+        minute_ctype = _scalar_ctypes.GetSelfCalLastDateAndTime_minute  # case 13
+        error_code = self._library.niFgen_GetSelfCalLastDateAndTime(vi_ctype, _scalar_ctypes.GetSelfCalLastDateAndTime_year_pointer, _scalar_ctypes.GetSelfCalLastDateAndTime_month_pointer, _scalar_ctypes.GetSelfCalLastDateAndTime_day_pointer, _scalar_ctypes.GetSelfCalLastDateAndTime_hour_pointer, _scalar_ctypes.GetSelfCalLastDateAndTime_minute_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(year_ctype.value), int(month_ctype.value), int(day_ctype.value), int(hour_ctype.value), int(minute_ctype.value)
 
@@ -3807,9 +4388,9 @@ class Session(_SessionBase):
             temperature (float): Specifies the temperature at the last successful calibration in degrees
                 Celsius.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        temperature_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niFgen_GetSelfCalLastTemp(vi_ctype, ctypes.pointer(temperature_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        temperature_ctype = _scalar_ctypes.GetSelfCalLastTemp_temperature  # case 13
+        error_code = self._library.niFgen_GetSelfCalLastTemp(vi_ctype, _scalar_ctypes.GetSelfCalLastTemp_temperature_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(temperature_ctype.value)
 
@@ -3829,9 +4410,9 @@ class Session(_SessionBase):
                 | VI_FALSE | Self–calibration is not supported. |
                 +----------+------------------------------------+
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        self_cal_supported_ctype = visatype.ViBoolean()  # case 13
-        error_code = self._library.niFgen_GetSelfCalSupported(vi_ctype, ctypes.pointer(self_cal_supported_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        self_cal_supported_ctype = _scalar_ctypes.GetSelfCalSupported_self_cal_supported  # case 13
+        error_code = self._library.niFgen_GetSelfCalSupported(vi_ctype, _scalar_ctypes.GetSelfCalSupported_self_cal_supported_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return bool(self_cal_supported_ctype.value)
 
@@ -3843,7 +4424,7 @@ class Session(_SessionBase):
         is aborted, you can call the _initiate_generation function to
         cause the signal generator to produce a signal again.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niFgen_InitiateGeneration(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -3870,9 +4451,9 @@ class Session(_SessionBase):
                 | VI_FALSE | Generation is not complete. |
                 +----------+-----------------------------+
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        done_ctype = visatype.ViBoolean()  # case 13
-        error_code = self._library.niFgen_IsDone(vi_ctype, ctypes.pointer(done_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        done_ctype = _scalar_ctypes.IsDone_done  # case 13
+        error_code = self._library.niFgen_IsDone(vi_ctype, _scalar_ctypes.IsDone_done_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return bool(done_ctype.value)
 
@@ -3899,12 +4480,12 @@ class Session(_SessionBase):
                 arbitrary waveform in a sequence. NI-FGEN obtains this value from the
                 MAX_LOOP_COUNT attribute.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        maximum_number_of_sequences_ctype = visatype.ViInt32()  # case 13
-        minimum_sequence_length_ctype = visatype.ViInt32()  # case 13
-        maximum_sequence_length_ctype = visatype.ViInt32()  # case 13
-        maximum_loop_count_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niFgen_QueryArbSeqCapabilities(vi_ctype, ctypes.pointer(maximum_number_of_sequences_ctype), ctypes.pointer(minimum_sequence_length_ctype), ctypes.pointer(maximum_sequence_length_ctype), ctypes.pointer(maximum_loop_count_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        maximum_number_of_sequences_ctype = _scalar_ctypes.QueryArbSeqCapabilities_maximum_number_of_sequences  # case 13
+        minimum_sequence_length_ctype = _scalar_ctypes.QueryArbSeqCapabilities_minimum_sequence_length  # case 13
+        maximum_sequence_length_ctype = _scalar_ctypes.QueryArbSeqCapabilities_maximum_sequence_length  # case 13
+        maximum_loop_count_ctype = _scalar_ctypes.QueryArbSeqCapabilities_maximum_loop_count  # case 13
+        error_code = self._library.niFgen_QueryArbSeqCapabilities(vi_ctype, _scalar_ctypes.QueryArbSeqCapabilities_maximum_number_of_sequences_pointer, _scalar_ctypes.QueryArbSeqCapabilities_minimum_sequence_length_pointer, _scalar_ctypes.QueryArbSeqCapabilities_maximum_sequence_length_pointer, _scalar_ctypes.QueryArbSeqCapabilities_maximum_loop_count_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(maximum_number_of_sequences_ctype.value), int(minimum_sequence_length_ctype.value), int(maximum_sequence_length_ctype.value), int(maximum_loop_count_ctype.value)
 
@@ -3938,12 +4519,12 @@ class Session(_SessionBase):
                 a waveform. NI-FGEN obtains this value from the
                 MAX_WAVEFORM_SIZE attribute.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        maximum_number_of_waveforms_ctype = visatype.ViInt32()  # case 13
-        waveform_quantum_ctype = visatype.ViInt32()  # case 13
-        minimum_waveform_size_ctype = visatype.ViInt32()  # case 13
-        maximum_waveform_size_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niFgen_QueryArbWfmCapabilities(vi_ctype, ctypes.pointer(maximum_number_of_waveforms_ctype), ctypes.pointer(waveform_quantum_ctype), ctypes.pointer(minimum_waveform_size_ctype), ctypes.pointer(maximum_waveform_size_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        maximum_number_of_waveforms_ctype = _scalar_ctypes.QueryArbWfmCapabilities_maximum_number_of_waveforms  # case 13
+        waveform_quantum_ctype = _scalar_ctypes.QueryArbWfmCapabilities_waveform_quantum  # case 13
+        minimum_waveform_size_ctype = _scalar_ctypes.QueryArbWfmCapabilities_minimum_waveform_size  # case 13
+        maximum_waveform_size_ctype = _scalar_ctypes.QueryArbWfmCapabilities_maximum_waveform_size  # case 13
+        error_code = self._library.niFgen_QueryArbWfmCapabilities(vi_ctype, _scalar_ctypes.QueryArbWfmCapabilities_maximum_number_of_waveforms_pointer, _scalar_ctypes.QueryArbWfmCapabilities_waveform_quantum_pointer, _scalar_ctypes.QueryArbWfmCapabilities_minimum_waveform_size_pointer, _scalar_ctypes.QueryArbWfmCapabilities_maximum_waveform_size_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(maximum_number_of_waveforms_ctype.value), int(waveform_quantum_ctype.value), int(minimum_waveform_size_ctype.value), int(maximum_waveform_size_ctype.value)
 
@@ -3979,14 +4560,14 @@ class Session(_SessionBase):
                 frequency list. NI-FGEN obtains this value from the
                 FREQ_LIST_DURATION_QUANTUM attribute.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        maximum_number_of_freq_lists_ctype = visatype.ViInt32()  # case 13
-        minimum_frequency_list_length_ctype = visatype.ViInt32()  # case 13
-        maximum_frequency_list_length_ctype = visatype.ViInt32()  # case 13
-        minimum_frequency_list_duration_ctype = visatype.ViReal64()  # case 13
-        maximum_frequency_list_duration_ctype = visatype.ViReal64()  # case 13
-        frequency_list_duration_quantum_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niFgen_QueryFreqListCapabilities(vi_ctype, ctypes.pointer(maximum_number_of_freq_lists_ctype), ctypes.pointer(minimum_frequency_list_length_ctype), ctypes.pointer(maximum_frequency_list_length_ctype), ctypes.pointer(minimum_frequency_list_duration_ctype), ctypes.pointer(maximum_frequency_list_duration_ctype), ctypes.pointer(frequency_list_duration_quantum_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        maximum_number_of_freq_lists_ctype = _scalar_ctypes.QueryFreqListCapabilities_maximum_number_of_freq_lists  # case 13
+        minimum_frequency_list_length_ctype = _scalar_ctypes.QueryFreqListCapabilities_minimum_frequency_list_length  # case 13
+        maximum_frequency_list_length_ctype = _scalar_ctypes.QueryFreqListCapabilities_maximum_frequency_list_length  # case 13
+        minimum_frequency_list_duration_ctype = _scalar_ctypes.QueryFreqListCapabilities_minimum_frequency_list_duration  # case 13
+        maximum_frequency_list_duration_ctype = _scalar_ctypes.QueryFreqListCapabilities_maximum_frequency_list_duration  # case 13
+        frequency_list_duration_quantum_ctype = _scalar_ctypes.QueryFreqListCapabilities_frequency_list_duration_quantum  # case 13
+        error_code = self._library.niFgen_QueryFreqListCapabilities(vi_ctype, _scalar_ctypes.QueryFreqListCapabilities_maximum_number_of_freq_lists_pointer, _scalar_ctypes.QueryFreqListCapabilities_minimum_frequency_list_length_pointer, _scalar_ctypes.QueryFreqListCapabilities_maximum_frequency_list_length_pointer, _scalar_ctypes.QueryFreqListCapabilities_minimum_frequency_list_duration_pointer, _scalar_ctypes.QueryFreqListCapabilities_maximum_frequency_list_duration_pointer, _scalar_ctypes.QueryFreqListCapabilities_frequency_list_duration_quantum_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(maximum_number_of_freq_lists_ctype.value), int(minimum_frequency_list_length_ctype.value), int(maximum_frequency_list_length_ctype.value), float(minimum_frequency_list_duration_ctype.value), float(maximum_frequency_list_duration_ctype.value), float(frequency_list_duration_quantum_ctype.value)
 
@@ -4000,9 +4581,9 @@ class Session(_SessionBase):
             temperature (float): Returns the current temperature read from onboard temperature sensors,
                 in degrees Celsius.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        temperature_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niFgen_ReadCurrentTemperature(vi_ctype, ctypes.pointer(temperature_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        temperature_ctype = _scalar_ctypes.ReadCurrentTemperature_temperature  # case 13
+        error_code = self._library.niFgen_ReadCurrentTemperature(vi_ctype, _scalar_ctypes.ReadCurrentTemperature_temperature_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(temperature_ctype.value)
 
@@ -4014,9 +4595,10 @@ class Session(_SessionBase):
         reset, hardware is configured to its default state, and all session
         attributes are reset to their default states.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niFgen_ResetDevice(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def reset_with_defaults(self):
@@ -4027,9 +4609,10 @@ class Session(_SessionBase):
         was created without a logical name, this function is equivalent to the
         nifgen_reset function.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niFgen_ResetWithDefaults(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def self_cal(self):
@@ -4039,7 +4622,7 @@ class Session(_SessionBase):
         calibration is successful, new calibration data and constants are stored
         in the onboard EEPROM.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niFgen_SelfCal(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -4070,9 +4653,10 @@ class Session(_SessionBase):
         '''
         if type(trigger) is not enums.Trigger:
             raise TypeError('Parameter mode must be of type ' + str(enums.Trigger))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        trigger_ctype = visatype.ViInt32(trigger.value)  # case 9
-        trigger_id_ctype = ctypes.create_string_buffer(trigger_id.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        trigger_ctype = _scalar_ctypes.SendSoftwareEdgeTrigger_trigger
+        trigger_ctype.value = trigger.value  # case 9
+        trigger_id_ctype = trigger_id.encode(self._encoding)  # case 3
         error_code = self._library.niFgen_SendSoftwareEdgeTrigger(vi_ctype, trigger_ctype, trigger_id_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -4086,8 +4670,9 @@ class Session(_SessionBase):
         Args:
             max_time (int): Specifies the timeout value in milliseconds.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        max_time_ctype = visatype.ViInt32(max_time)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        max_time_ctype = _scalar_ctypes.WaitUntilDone_max_time
+        max_time_ctype.value = max_time  # case 8
         error_code = self._library.niFgen_WaitUntilDone(vi_ctype, max_time_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -4118,7 +4703,7 @@ class Session(_SessionBase):
         After calling _close, you cannot use NI-FGEN again until you
         call the nifgen_init or nifgen_InitWithOptions functions.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niFgen_close(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -4135,9 +4720,10 @@ class Session(_SessionBase):
         For the NI 5401/5404/5411/5431, this function exhibits the same
         behavior as the nifgen_ResetDevice function.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niFgen_reset(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def self_test(self):
@@ -4166,11 +4752,12 @@ class Session(_SessionBase):
 
                 You must pass a ViChar array with at least 256 bytes.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        self_test_result_ctype = visatype.ViInt16()  # case 13
+        vi_ctype = self._vi_ctype  # case 1
+        self_test_result_ctype = _scalar_ctypes.self_test_self_test_result  # case 13
         self_test_message_ctype = (visatype.ViChar * 256)()  # case 10
-        error_code = self._library.niFgen_self_test(vi_ctype, ctypes.pointer(self_test_result_ctype), self_test_message_ctype)
+        error_code = self._library.niFgen_self_test(vi_ctype, _scalar_ctypes.self_test_self_test_result_pointer, self_test_message_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return int(self_test_result_ctype.value), self_test_message_ctype.value.decode(self._encoding)
 
 
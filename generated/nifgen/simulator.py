@@ -0,0 +1,672 @@
+# This file was generated
+'''Simulated NI-FGEN runtime, for testing and benchmarking without hardware.'''
+
+from nifgen import _simulation
+
+
+# (name, direction, type, is_buffer, size mechanism, index of the size parameter, default value) of every parameter of every function
+_functions = {
+    'niFgen_AbortGeneration': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niFgen_AdjustSampleClockRelativeDelay': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('adjustmentTime', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niFgen_AllocateNamedWaveform': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('waveformName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('waveformSize', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_AllocateWaveform': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('waveformSize', 'in', 'ViInt32', False, None, None, None),
+        ('waveformHandle', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_ClearArbMemory': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niFgen_ClearArbSequence': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('sequenceHandle', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_ClearArbWaveform': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('waveformHandle', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_ClearFreqList': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('frequencyListHandle', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_ClearUserStandardWaveform': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niFgen_Commit': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niFgen_ConfigureArbSequence': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('sequenceHandle', 'in', 'ViInt32', False, None, None, None),
+        ('Gain', 'in', 'ViReal64', False, None, None, None),
+        ('Offset', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niFgen_ConfigureArbWaveform': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('waveformHandle', 'in', 'ViInt32', False, None, None, None),
+        ('Gain', 'in', 'ViReal64', False, None, None, None),
+        ('Offset', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niFgen_ConfigureCustomFIRFilterCoefficients': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('numberOfCoefficients', 'in', 'ViInt32', False, None, None, None),
+        ('coefficientsArray', 'in', 'ViReal64', True, 'len', None, None),
+    ),
+    'niFgen_ConfigureDigitalEdgeScriptTrigger': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('triggerId', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Source', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Edge', 'in', 'ViInt32', False, None, None, 101),
+    ),
+    'niFgen_ConfigureDigitalEdgeStartTrigger': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Source', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Edge', 'in', 'ViInt32', False, None, None, 101),
+    ),
+    'niFgen_ConfigureDigitalLevelScriptTrigger': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('triggerId', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Source', 'in', 'ViChar', True, 'fixed', None, None),
+        ('triggerWhen', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_ConfigureFreqList': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('frequencyListHandle', 'in', 'ViInt32', False, None, None, None),
+        ('Amplitude', 'in', 'ViReal64', False, None, None, None),
+        ('dcOffset', 'in', 'ViReal64', False, None, None, None),
+        ('startPhase', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niFgen_ConfigureStandardWaveform': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Waveform', 'in', 'ViInt32', False, None, None, 1),
+        ('Amplitude', 'in', 'ViReal64', False, None, None, None),
+        ('dcOffset', 'in', 'ViReal64', False, None, None, None),
+        ('Frequency', 'in', 'ViReal64', False, None, None, None),
+        ('startPhase', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niFgen_CreateAdvancedArbSequence': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('sequenceLength', 'in', 'ViInt32', False, None, None, None),
+        ('waveformHandlesArray', 'in', 'ViInt32', True, 'len', None, None),
+        ('loopCountsArray', 'in', 'ViInt32', True, 'fixed', None, None),
+        ('sampleCountsArray', 'in', 'ViInt32', True, 'fixed', None, None),
+        ('markerLocationArray', 'in', 'ViInt32', True, 'fixed', None, None),
+        ('coercedMarkersArray', 'out', 'ViInt32', True, 'fixed', None, None),
+        ('sequenceHandle', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_CreateArbSequence': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('sequenceLength', 'in', 'ViInt32', False, None, None, None),
+        ('waveformHandlesArray', 'in', 'ViInt32', True, 'fixed', None, None),
+        ('loopCountsArray', 'in', 'ViInt32', True, 'fixed', None, None),
+        ('sequenceHandle', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_CreateFreqList': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Waveform', 'in', 'ViInt32', False, None, None, 1),
+        ('frequencyListLength', 'in', 'ViInt32', False, None, None, None),
+        ('frequencyArray', 'in', 'ViReal64', True, 'len', None, None),
+        ('durationArray', 'in', 'ViReal64', True, 'fixed', None, None),
+        ('frequencyListHandle', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_CreateWaveformF64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('waveformSize', 'in', 'ViInt32', False, None, None, None),
+        ('waveformDataArray', 'in', 'ViReal64', True, 'len', None, None),
+        ('waveformHandle', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_CreateWaveformFromFileF64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('FileName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('byteOrder', 'in', 'ViInt32', False, None, None, None),
+        ('waveformHandle', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_CreateWaveformFromFileI16': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('FileName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('byteOrder', 'in', 'ViInt32', False, None, None, None),
+        ('waveformHandle', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_CreateWaveformI16': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('waveformSize', 'in', 'ViInt32', False, None, None, None),
+        ('waveformDataArray', 'in', 'ViInt16', True, 'len', None, None),
+        ('waveformHandle', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_DefineUserStandardWaveform': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('waveformSize', 'in', 'ViInt32', False, None, None, None),
+        ('waveformDataArray', 'in', 'ViReal64', True, 'len', None, None),
+    ),
+    'niFgen_DeleteNamedWaveform': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('waveformName', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niFgen_DeleteScript': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('scriptName', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niFgen_Disable': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niFgen_ExportSignal': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Signal', 'in', 'ViInt32', False, None, None, None),
+        ('signalIdentifier', 'in', 'ViChar', True, 'fixed', None, None),
+        ('outputTerminal', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niFgen_GetAttributeViBoolean': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'out', 'ViBoolean', False, None, None, None),
+    ),
+    'niFgen_GetAttributeViInt32': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_GetAttributeViInt64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'out', 'ViInt64', False, None, None, None),
+    ),
+    'niFgen_GetAttributeViReal64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niFgen_GetAttributeViString': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('arraySize', 'in', 'ViInt32', False, None, None, None),
+        ('attributeValue', 'out', 'ViChar', True, 'ivi-dance', 3, None),
+    ),
+    'niFgen_GetError': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('errorCode', 'out', 'ViStatus', False, None, None, None),
+        ('errorDescriptionBufferSize', 'in', 'ViInt32', False, None, None, None),
+        ('errorDescription', 'out', 'ViChar', True, 'ivi-dance', 2, None),
+    ),
+    'niFgen_GetExtCalLastDateAndTime': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Year', 'out', 'ViInt32', False, None, None, None),
+        ('Month', 'out', 'ViInt32', False, None, None, None),
+        ('Day', 'out', 'ViInt32', False, None, None, None),
+        ('Hour', 'out', 'ViInt32', False, None, None, None),
+        ('Minute', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_GetExtCalLastTemp': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Temperature', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niFgen_GetExtCalRecommendedInterval': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Months', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_GetFIRFilterCoefficients': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('arraySize', 'in', 'ViInt32', False, None, None, None),
+        ('coefficientsArray', 'out', 'ViReal64', True, 'ivi-dance', 2, None),
+        ('numberOfCoefficientsRead', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_GetHardwareState': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('state', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_GetSelfCalLastDateAndTime': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Year', 'out', 'ViInt32', False, None, None, None),
+        ('Month', 'out', 'ViInt32', False, None, None, None),
+        ('Day', 'out', 'ViInt32', False, None, None, None),
+        ('Hour', 'out', 'ViInt32', False, None, None, None),
+        ('Minute', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_GetSelfCalLastTemp': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Temperature', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niFgen_GetSelfCalSupported': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('selfCalSupported', 'out', 'ViBoolean', False, None, None, None),
+    ),
+    'niFgen_InitializeWithChannels': (
+        ('resourceName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('resetDevice', 'in', 'ViBoolean', False, None, None, None),
+        ('optionString', 'in', 'ViChar', True, 'fixed', None, None),
+        ('vi', 'out', 'ViSession', False, None, None, None),
+    ),
+    'niFgen_InitiateGeneration': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niFgen_IsDone': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Done', 'out', 'ViBoolean', False, None, None, None),
+    ),
+    'niFgen_QueryArbSeqCapabilities': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('maximumNumberOfSequences', 'out', 'ViInt32', False, None, None, None),
+        ('minimumSequenceLength', 'out', 'ViInt32', False, None, None, None),
+        ('maximumSequenceLength', 'out', 'ViInt32', False, None, None, None),
+        ('maximumLoopCount', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_QueryArbWfmCapabilities': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('maximumNumberOfWaveforms', 'out', 'ViInt32', False, None, None, None),
+        ('waveformQuantum', 'out', 'ViInt32', False, None, None, None),
+        ('minimumWaveformSize', 'out', 'ViInt32', False, None, None, None),
+        ('maximumWaveformSize', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_QueryFreqListCapabilities': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('maximumNumberOfFreqLists', 'out', 'ViInt32', False, None, None, None),
+        ('minimumFrequencyListLength', 'out', 'ViInt32', False, None, None, None),
+        ('maximumFrequencyListLength', 'out', 'ViInt32', False, None, None, None),
+        ('minimumFrequencyListDuration', 'out', 'ViReal64', False, None, None, None),
+        ('maximumFrequencyListDuration', 'out', 'ViReal64', False, None, None, None),
+        ('frequencyListDurationQuantum', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niFgen_ReadCurrentTemperature': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Temperature', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niFgen_ResetDevice': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niFgen_ResetWithDefaults': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niFgen_SelfCal': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niFgen_SendSoftwareEdgeTrigger': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Trigger', 'in', 'ViInt32', False, None, None, None),
+        ('triggerId', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niFgen_SetAttributeViBoolean': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViBoolean', False, None, None, None),
+    ),
+    'niFgen_SetAttributeViInt32': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_SetAttributeViInt64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViInt64', False, None, None, None),
+    ),
+    'niFgen_SetAttributeViReal64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niFgen_SetAttributeViString': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niFgen_SetNamedWaveformNextWritePosition': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('waveformName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('relativeTo', 'in', 'ViInt32', False, None, None, 0),
+        ('offset', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_SetWaveformNextWritePosition': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('waveformHandle', 'in', 'ViInt32', False, None, None, None),
+        ('relativeTo', 'in', 'ViInt32', False, None, None, 0),
+        ('offset', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_WaitUntilDone': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('maxTime', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niFgen_WriteBinary16Waveform': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('waveformHandle', 'in', 'ViInt32', False, None, None, None),
+        ('Size', 'in', 'ViInt32', False, None, None, None),
+        ('Data', 'in', 'ViInt16', True, 'len', None, None),
+    ),
+    'niFgen_WriteNamedWaveformF64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('waveformName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Size', 'in', 'ViInt32', False, None, None, None),
+        ('Data', 'in', 'ViReal64', True, 'len', None, None),
+    ),
+    'niFgen_WriteNamedWaveformI16': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('waveformName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Size', 'in', 'ViInt32', False, None, None, None),
+        ('Data', 'in', 'ViInt16', True, 'len', None, None),
+    ),
+    'niFgen_WriteScript': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Script', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niFgen_WriteWaveform': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('waveformHandle', 'in', 'ViInt32', False, None, None, None),
+        ('Size', 'in', 'ViInt32', False, None, None, None),
+        ('Data', 'in', 'ViReal64', True, 'len', None, None),
+    ),
+    'niFgen_close': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niFgen_error_message': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('errorCode', 'in', 'ViStatus', False, None, None, None),
+        ('errorMessage', 'out', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niFgen_reset': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niFgen_self_test': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('selfTestResult', 'out', 'ViInt16', False, None, None, None),
+        ('selfTestMessage', 'out', 'ViChar', True, 'fixed', None, None),
+    ),
+}
+
+# Value of every attribute until it is set
+_attributes = {
+    1050002: False,  # RANGE_CHECK
+    1050003: False,  # QUERY_INSTRUMENT_STATUS
+    1050004: False,  # CACHE
+    1050005: False,  # SIMULATE
+    1050006: False,  # RECORD_COERCIONS
+    1050007: '',  # DRIVER_SETUP
+    1050021: False,  # INTERCHANGE_CHECK
+    1050101: 0,  # PRIMARY_ERROR
+    1050102: 0,  # SECONDARY_ERROR
+    1050103: '',  # ERROR_ELABORATION
+    1050203: 0,  # CHANNEL_COUNT
+    1050302: '',  # SPECIFIC_DRIVER_PREFIX
+    1050304: '',  # IO_RESOURCE_DESCRIPTOR
+    1050305: '',  # LOGICAL_NAME
+    1050327: '',  # SUPPORTED_INSTRUMENT_MODELS
+    1050401: '',  # GROUP_CAPABILITIES
+    1050503: 0,  # MAJOR_VERSION
+    1050504: 0,  # MINOR_VERSION
+    1050510: '',  # INSTRUMENT_FIRMWARE_REVISION
+    1050511: '',  # INSTRUMENT_MANUFACTURER
+    1050512: '',  # INSTRUMENT_MODEL
+    1050513: '',  # SPECIFIC_DRIVER_VENDOR
+    1050514: '',  # SPECIFIC_DRIVER_DESCRIPTION
+    1050515: 0,  # SPECIFIC_DRIVER_CLASS_SPEC_MAJOR_VERSION
+    1050516: 0,  # SPECIFIC_DRIVER_CLASS_SPEC_MINOR_VERSION
+    1050551: '',  # SPECIFIC_DRIVER_REVISION
+    1150001: '',  # ID_QUERY_RESPONSE
+    1150101: False,  # DIGITAL_PATTERN_ENABLED
+    1150102: False,  # DIGITAL_FILTER_ENABLED
+    1150103: False,  # ANALOG_FILTER_ENABLED
+    1150104: 0.0,  # FILTER_CORRECTION_FREQUENCY
+    1150105: 0.0,  # SYNC_DUTY_CYCLE_HIGH
+    1150106: 0,  # UPDATE_CLOCK_SOURCE
+    1150107: 0.0,  # REF_CLOCK_FREQUENCY
+    1150108: 1,  # TRIGGER_MODE
+    1150109: 0.0,  # ACTUAL_ARB_SAMPLE_RATE
+    1150110: 0,  # CLOCK_MODE
+    1150111: 111,  # SYNCHRONIZATION
+    1150112: '"ClkIn"',  # SAMPLE_CLOCK_SOURCE
+    1150113: 'ClkIn',  # REFERENCE_CLOCK_SOURCE
+    1150208: 0,  # FREQ_LIST_HANDLE
+    1150209: 0,  # MAX_NUM_FREQ_LISTS
+    1150210: 0,  # MIN_FREQ_LIST_LENGTH
+    1150211: 0,  # MAX_FREQ_LIST_LENGTH
+    1150212: 0.0,  # MIN_FREQ_LIST_DURATION
+    1150213: 0.0,  # MAX_FREQ_LIST_DURATION
+    1150214: 0.0,  # FREQ_LIST_DURATION_QUANTUM
+    1150215: 0,  # BUS_TYPE
+    1150216: 0,  # VIDEO_WAVEFORM_TYPE
+    1150218: 0.0,  # DIGITAL_FILTER_INTERPOLATION_FACTOR
+    1150219: 0,  # EXPORTED_SAMPLE_CLOCK_DIVISOR
+    1150220: 0.0,  # LOAD_IMPEDANCE
+    1150221: 0,  # DAQMX_TASK
+    1150222: 0,  # ANALOG_PATH
+    1150223: 0,  # GAIN_DAC_VALUE
+    1150224: 0,  # OFFSET_DAC_VALUE
+    1150225: 0,  # OSCILLATOR_FREQ_DAC_VALUE
+    1150227: 0,  # CAL_ADC_INPUT
+    1150228: 0.0,  # PRE_AMPLIFIER_ATTENUATION
+    1150229: 0.0,  # POST_AMPLIFIER_ATTENUATION
+    1150230: 0,  # EXPORTED_SAMPLE_CLOCK_TIMEBASE_DIVISOR
+    1150231: 0.0,  # SAMPLE_CLOCK_ABSOLUTE_DELAY
+    1150232: 0,  # OSCILLATOR_PHASE_DAC_VALUE
+    1150233: 0,  # EXTERNAL_CLOCK_DELAY_BINARY_VALUE
+    1150234: 0,  # ANALOG_DATA_MASK
+    1150235: 0,  # ANALOG_STATIC_VALUE
+    1150236: 0,  # DIGITAL_DATA_MASK
+    1150237: 0,  # DIGITAL_STATIC_VALUE
+    1150238: 0,  # FUNC_BUFFER_SIZE
+    1150239: 0,  # FUNC_MAX_BUFFER_SIZE
+    1150240: 0,  # FILE_TRANSFER_BLOCK_SIZE
+    1150241: 0,  # DATA_TRANSFER_BLOCK_SIZE
+    1150242: 0,  # MEMORY_SIZE
+    1150243: '',  # SERIAL_NUMBER
+    1150244: False,  # DIRECT_DMA_ENABLED
+    1150245: 0,  # DIRECT_DMA_WINDOW_SIZE
+    1150246: False,  # OSP_ENABLED
+    1150247: 0,  # OSP_DATA_PROCESSING_MODE
+    1150248: 0.0,  # OSP_IQ_RATE
+    1150249: False,  # OSP_CARRIER_ENABLED
+    1150250: 0.0,  # OSP_CARRIER_FREQUENCY
+    1150251: 0.0,  # OSP_CARRIER_PHASE_I
+    1150252: 0.0,  # OSP_CARRIER_PHASE_Q
+    1150253: 0,  # OSP_FIR_FILTER_TYPE
+    1150254: 0.0,  # DIGITAL_GAIN
+    1150255: False,  # OSP_FIR_FILTER_ENABLED
+    1150256: 0.0,  # OSP_FIR_FILTER_INTERPOLATION
+    1150257: False,  # OSP_CIC_FILTER_ENABLED
+    1150258: 0.0,  # OSP_CIC_FILTER_INTERPOLATION
+    1150259: 0.0,  # OSP_FIR_FILTER_ROOT_RAISED_COSINE_ALPHA
+    1150260: 0.0,  # OSP_FIR_FILTER_RAISED_COSINE_ALPHA
+    1150261: 0.0,  # OSP_FIR_FILTER_FLAT_PASSBAND
+    1150262: 0.0,  # OSP_FIR_FILTER_GAUSSIAN_BT
+    1150263: 0.0,  # OSP_CIC_FILTER_GAIN
+    1150264: 0.0,  # OSP_PRE_FILTER_GAIN_I
+    1150265: 0.0,  # OSP_PRE_FILTER_GAIN_Q
+    1150266: 0.0,  # OSP_PRE_FILTER_OFFSET_I
+    1150267: 0.0,  # OSP_PRE_FILTER_OFFSET_Q
+    1150268: 0,  # OSP_OVERFLOW_ERROR_REPORTING
+    1150269: 0,  # OSP_OVERFLOW_STATUS
+    1150270: '',  # SCRIPT_TO_GENERATE
+    1150271: 0,  # MARKER_EVENTS_COUNT
+    1150272: 0,  # SCRIPT_TRIGGERS_COUNT
+    1150273: 0,  # DATA_MARKER_EVENTS_COUNT
+    1150274: 0,  # DIRECT_DMA_WINDOW_ADDRESS
+    1150280: 101,  # START_TRIGGER_TYPE
+    1150281: '',  # DIGITAL_EDGE_START_TRIGGER_SOURCE
+    1150282: 101,  # DIGITAL_EDGE_START_TRIGGER_EDGE
+    1150283: '',  # EXPORTED_START_TRIGGER_OUTPUT_TERMINAL
+    1150290: 101,  # SCRIPT_TRIGGER_TYPE
+    1150291: '',  # DIGITAL_EDGE_SCRIPT_TRIGGER_SOURCE
+    1150292: 101,  # DIGITAL_EDGE_SCRIPT_TRIGGER_EDGE
+    1150293: '',  # DIGITAL_LEVEL_SCRIPT_TRIGGER_SOURCE
+    1150294: 101,  # DIGITAL_LEVEL_SCRIPT_TRIGGER_ACTIVE_LEVEL
+    1150295: '',  # EXPORTED_SCRIPT_TRIGGER_OUTPUT_TERMINAL
+    1150310: '',  # READY_FOR_START_EVENT_OUTPUT_TERMINAL
+    1150311: 101,  # READY_FOR_START_EVENT_LEVEL_ACTIVE_LEVEL
+    1150312: '',  # MARKER_EVENT_OUTPUT_TERMINAL
+    1150313: 101,  # MARKER_EVENT_PULSE_POLARITY
+    1150314: '',  # STARTED_EVENT_OUTPUT_TERMINAL
+    1150315: '',  # DONE_EVENT_OUTPUT_TERMINAL
+    1150316: 101,  # STARTED_EVENT_LEVEL_ACTIVE_LEVEL
+    1150317: 101,  # DONE_EVENT_LEVEL_ACTIVE_LEVEL
+    1150318: 101,  # STARTED_EVENT_PULSE_POLARITY
+    1150319: 101,  # DONE_EVENT_PULSE_POLARITY
+    1150320: '',  # EXPORTED_SAMPLE_CLOCK_OUTPUT_TERMINAL
+    1150321: '',  # EXPORTED_REFERENCE_CLOCK_OUTPUT_TERMINAL
+    1150322: '',  # EXPORTED_ONBOARD_REFERENCE_CLOCK_OUTPUT_TERMINAL
+    1150323: False,  # FLATNESS_CORRECTION_ENABLED
+    1150324: 0,  # STREAMING_WAVEFORM_HANDLE
+    1150325: 0,  # STREAMING_SPACE_AVAILABLE_IN_WAVEFORM
+    1150326: '',  # STREAMING_WAVEFORM_NAME
+    1150327: 0,  # ARB_MARKER_POSITION
+    1150328: 0,  # ARB_REPEAT_COUNT
+    1150329: '',  # EXPORTED_SAMPLE_CLOCK_TIMEBASE_OUTPUT_TERMINAL
+    1150330: '',  # SYNC_OUT_OUTPUT_TERMINAL
+    1150331: 101,  # STARTED_EVENT_OUTPUT_BEHAVIOR
+    1150332: 101,  # DONE_EVENT_OUTPUT_BEHAVIOR
+    1150333: 101,  # STARTED_EVENT_PULSE_WIDTH_UNITS
+    1150334: 101,  # DONE_EVENT_PULSE_WIDTH_UNITS
+    1150335: 0.0,  # STARTED_EVENT_PULSE_WIDTH
+    1150336: 0.0,  # DONE_EVENT_PULSE_WIDTH
+    1150337: 0,  # DATA_MARKER_EVENT_DATA_BIT_NUMBER
+    1150338: 101,  # DATA_MARKER_EVENT_LEVEL_POLARITY
+    1150339: '',  # DATA_MARKER_EVENT_OUTPUT_TERMINAL
+    1150340: 0.0,  # MARKER_EVENT_PULSE_WIDTH
+    1150341: 101,  # MARKER_EVENT_PULSE_WIDTH_UNITS
+    1150342: 101,  # MARKER_EVENT_OUTPUT_BEHAVIOR
+    1150343: 101,  # MARKER_EVENT_TOGGLE_INITIAL_STATE
+    1150344: 0,  # ALL_MARKER_EVENTS_LIVE_STATUS
+    1150345: False,  # MARKER_EVENT_LIVE_STATUS
+    1150348: False,  # READY_FOR_START_EVENT_LIVE_STATUS
+    1150349: 0,  # ALL_MARKER_EVENTS_LATCHED_STATUS
+    1150350: False,  # MARKER_EVENT_LATCHED_STATUS
+    1150351: False,  # DONE_EVENT_LATCHED_STATUS
+    1150352: False,  # STARTED_EVENT_LATCHED_STATUS
+    1150354: 0.0,  # MARKER_EVENT_DELAY
+    1150355: 101,  # MARKER_EVENT_DELAY_UNITS
+    1150356: 0.0,  # STARTED_EVENT_DELAY
+    1150357: 101,  # STARTED_EVENT_DELAY_UNITS
+    1150358: 0.0,  # DONE_EVENT_DELAY
+    1150359: 101,  # DONE_EVENT_DELAY_UNITS
+    1150362: False,  # PCI_DMA_OPTIMIZATIONS_ENABLED
+    1150365: 300,  # TERMINAL_CONFIGURATION
+    1150366: 0.0,  # COMMON_MODE_OFFSET
+    1150367: '"ClkIn"',  # SAMPLE_CLOCK_TIMEBASE_SOURCE
+    1150368: 0.0,  # SAMPLE_CLOCK_TIMEBASE_RATE
+    1150369: 0.0,  # CHANNEL_DELAY
+    1150370: 0,  # OSP_MODE
+    1150371: 0.0,  # OSP_FREQUENCY_SHIFT
+    1150373: 0.0,  # DATA_TRANSFER_MAXIMUM_BANDWIDTH
+    1150374: 0,  # DATA_TRANSFER_PREFERRED_PACKET_SIZE
+    1150375: 0,  # DATA_TRANSFER_MAXIMUM_IN_FLIGHT_READS
+    1150376: 0.0,  # EXTERNAL_SAMPLE_CLOCK_MULTIPLIER
+    1150377: 400,  # IDLE_BEHAVIOR
+    1150378: 0,  # IDLE_VALUE
+    1150379: 400,  # WAIT_BEHAVIOR
+    1150380: 0,  # WAIT_VALUE
+    1150389: False,  # OSP_COMPENSATE_FOR_FILTER_GROUP_DELAY
+    1150390: '',  # MODULE_REVISION
+    1150391: False,  # P2P_ENABLED
+    1150392: '',  # P2P_DESTINATION_CHANNELS
+    1150393: 0,  # P2P_ENDPOINT_SIZE
+    1150394: 0,  # P2P_SPACE_AVAILABLE_IN_ENDPOINT
+    1150395: 0,  # P2P_MOST_SPACE_AVAILABLE_IN_ENDPOINT
+    1150396: 0,  # P2P_ENDPOINT_COUNT
+    1150397: False,  # P2P_MANUAL_CONFIGURATION_ENABLED
+    1150398: 0,  # P2P_DATA_TRANSFER_PERMISSION_ADDRESS
+    1150399: 0,  # P2P_DATA_TRANSFER_PERMISSION_ADDRESS_TYPE
+    1150400: 0,  # P2P_DATA_TRANSFER_PERMISSION_INTERVAL
+    1150401: 0,  # P2P_ENDPOINT_WINDOW_ADDRESS
+    1150402: 0,  # P2P_ENDPOINT_WINDOW_ADDRESS_TYPE
+    1150403: 0,  # P2P_ENDPOINT_WINDOW_SIZE
+    1150405: 0,  # P2P_DONE_NOTIFICATION_ADDRESS
+    1150406: 0,  # P2P_DONE_NOTIFICATION_ADDRESS_TYPE
+    1150407: 0,  # P2P_DONE_NOTIFICATION_VALUE
+    1150408: 0,  # P2P_DATA_TRANSFER_PERMISSION_INITIAL_CREDITS
+    1150409: 0.0,  # STREAMING_WRITE_TIMEOUT
+    1150410: 0,  # P2P_ENDPOINT_FULLNESS_START_TRIGGER_LEVEL
+    1150411: False,  # AUX_POWER_ENABLED
+    1150412: '',  # FPGA_BITFILE_PATH
+    1250001: 0,  # OUTPUT_MODE
+    1250002: 0,  # REF_CLOCK_SOURCE
+    1250003: False,  # OUTPUT_ENABLED
+    1250004: 0.0,  # OUTPUT_IMPEDANCE
+    1250005: 0,  # OPERATION_MODE
+    1250101: 1,  # FUNC_WAVEFORM
+    1250102: 0.0,  # FUNC_AMPLITUDE
+    1250103: 0.0,  # FUNC_DC_OFFSET
+    1250104: 0.0,  # FUNC_FREQUENCY
+    1250105: 0.0,  # FUNC_START_PHASE
+    1250106: 0.0,  # FUNC_DUTY_CYCLE_HIGH
+    1250201: 0,  # ARB_WAVEFORM_HANDLE
+    1250202: 0.0,  # ARB_GAIN
+    1250203: 0.0,  # ARB_OFFSET
+    1250204: 0.0,  # ARB_SAMPLE_RATE
+    1250205: 0,  # MAX_NUM_WAVEFORMS
+    1250206: 0,  # WAVEFORM_QUANTUM
+    1250207: 0,  # MIN_WAVEFORM_SIZE
+    1250208: 0,  # MAX_WAVEFORM_SIZE
+    1250211: 0,  # ARB_SEQUENCE_HANDLE
+    1250212: 0,  # MAX_NUM_SEQUENCES
+    1250213: 0,  # MIN_SEQUENCE_LENGTH
+    1250214: 0,  # MAX_SEQUENCE_LENGTH
+    1250215: 0,  # MAX_LOOP_COUNT
+    1250302: 0,  # TRIGGER_SOURCE
+    1250350: 0,  # BURST_COUNT
+}
+
+# Values returned in output parameters, by function and parameter name. Output buffers that are not listed are
+# filled with synthetic data, and output counts (i.e. actualNumberOfPoints) return the number of elements written.
+_output_values = {
+}
+
+
+class Simulator(_simulation.SimulatedLibrary):
+    '''Simulator
+
+    Pure-Python stand-in for the NI-FGEN runtime. It keeps the value of attributes for each session and fills
+    output buffers with synthetic data. Pass an instance to library_singleton.set_backend() before creating sessions:
+
+        import nifgen.simulator
+        nifgen.library_singleton.set_backend(nifgen.simulator.Simulator(latency=0.0001))
+
+    Args:
+        latency (float): Time, in seconds, that every function call sleeps for. Can be changed at any time.
+        array_size (int): Number of elements of output buffers that the driver sizes, i.e. with the IVI-dance
+        attribute_values (dict): Value of attributes, by attribute ID, until they are set
+        output_values (dict): Values returned in output parameters, by C function name without the prefix and
+            parameter name, i.e. {'ReadMultiPoint': {'readingArray': 1.5}}. A single value fills a whole buffer, and
+            a dict of field values fills every structure of a buffer of structures.
+    '''
+
+    def __init__(self, latency=0.0, array_size=1000, attribute_values=None, output_values=None):
+        super(Simulator, self).__init__('niFgen_', _functions, _attributes, _output_values, latency, array_size, attribute_values, output_values)
@@ -1,7 +1,39 @@
 #!/usr/bin/python
 # This file was generated
 
-from nimodinst.errors import Error     # noqa: F401
-from nimodinst.errors import NimodinstWarning   # noqa: F401
-from nimodinst.session import Session  # noqa: F401
+import sys
 
+# Modules are imported when one of their names is first used, so that importing the package is fast
+_lazy_names = {
+    'Error': 'errors',
+    'NimodinstWarning': 'errors',
+    'Session': 'session',
+}
+
+__all__ = sorted(_lazy_names)
+
+if sys.version_info >= (3, 7):
+    import importlib
+    import importlib.util
+
+    def __getattr__(name):
+        if name in _lazy_names:
+            submodule = importlib.import_module('nimodinst.' + _lazy_names[name])
+            # Next time, all the names of the module are found without calling __getattr__. This also replaces the
+            # module in the package with the name it exports, when they are the same.
+            for n in _lazy_names:
+                if _lazy_names[n] == _lazy_names[name]:
+                    globals()[n] = getattr(submodule, n)
+            return globals()[name]
+        # Modules of the package are attributes of it once imported, as they were when the package imported them all
+        if not name.startswith('__') and importlib.util.find_spec('nimodinst.' + name) is not None:
+            return importlib.import_module('nimodinst.' + name)
+        raise AttributeError("module 'nimodinst' has no attribute '{0}'".format(name))
+
+    def __dir__():
+        return sorted(set(globals()) | set(_lazy_names))
+else:
+    # Module __getattr__ needs Python 3.7
+    from nimodinst.errors import Error     # noqa: F401
+    from nimodinst.errors import NimodinstWarning   # noqa: F401
+    from nimodinst.session import Session  # noqa: F401
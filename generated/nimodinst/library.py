@@ -11,6 +11,9 @@ class Library(object):
 
     Wrapper around driver library.
     Class will setup the correct ctypes information for every function on first call.
+
+    The lock is only taken while a function is being resolved. The cfunc is published only
+    after its argtypes and restype are set, so once cached, calls do not serialize on the lock.
     '''
 
     def __init__(self, ctypes_library):
@@ -24,41 +27,51 @@ class Library(object):
         self.niModInst_OpenInstalledDevicesSession_cfunc = None
 
     def niModInst_CloseInstalledDevicesSession(self, handle):  # noqa: N802
-        with self._func_lock:
-            if self.niModInst_CloseInstalledDevicesSession_cfunc is None:
-                self.niModInst_CloseInstalledDevicesSession_cfunc = self._library.niModInst_CloseInstalledDevicesSession
-                self.niModInst_CloseInstalledDevicesSession_cfunc.argtypes = [ViSession]  # noqa: F405
-                self.niModInst_CloseInstalledDevicesSession_cfunc.restype = ViStatus  # noqa: F405
+        if self.niModInst_CloseInstalledDevicesSession_cfunc is None:
+            with self._func_lock:
+                if self.niModInst_CloseInstalledDevicesSession_cfunc is None:
+                    cfunc = self._library.niModInst_CloseInstalledDevicesSession
+                    cfunc.argtypes = [ViSession]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niModInst_CloseInstalledDevicesSession_cfunc = cfunc
         return self.niModInst_CloseInstalledDevicesSession_cfunc(handle)
 
     def niModInst_GetExtendedErrorInfo(self, error_info_buffer_size, error_info):  # noqa: N802
-        with self._func_lock:
-            if self.niModInst_GetExtendedErrorInfo_cfunc is None:
-                self.niModInst_GetExtendedErrorInfo_cfunc = self._library.niModInst_GetExtendedErrorInfo
-                self.niModInst_GetExtendedErrorInfo_cfunc.argtypes = [ViInt32, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niModInst_GetExtendedErrorInfo_cfunc.restype = ViStatus  # noqa: F405
+        if self.niModInst_GetExtendedErrorInfo_cfunc is None:
+            with self._func_lock:
+                if self.niModInst_GetExtendedErrorInfo_cfunc is None:
+                    cfunc = self._library.niModInst_GetExtendedErrorInfo
+                    cfunc.argtypes = [ViInt32, ctypes.POINTER(ViChar)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niModInst_GetExtendedErrorInfo_cfunc = cfunc
         return self.niModInst_GetExtendedErrorInfo_cfunc(error_info_buffer_size, error_info)
 
     def niModInst_GetInstalledDeviceAttributeViInt32(self, handle, index, attribute_id, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niModInst_GetInstalledDeviceAttributeViInt32_cfunc is None:
-                self.niModInst_GetInstalledDeviceAttributeViInt32_cfunc = self._library.niModInst_GetInstalledDeviceAttributeViInt32
-                self.niModInst_GetInstalledDeviceAttributeViInt32_cfunc.argtypes = [ViSession, ViInt32, ViInt32, ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niModInst_GetInstalledDeviceAttributeViInt32_cfunc.restype = ViStatus  # noqa: F405
+        if self.niModInst_GetInstalledDeviceAttributeViInt32_cfunc is None:
+            with self._func_lock:
+                if self.niModInst_GetInstalledDeviceAttributeViInt32_cfunc is None:
+                    cfunc = self._library.niModInst_GetInstalledDeviceAttributeViInt32
+                    cfunc.argtypes = [ViSession, ViInt32, ViInt32, ctypes.POINTER(ViInt32)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niModInst_GetInstalledDeviceAttributeViInt32_cfunc = cfunc
         return self.niModInst_GetInstalledDeviceAttributeViInt32_cfunc(handle, index, attribute_id, attribute_value)
 
     def niModInst_GetInstalledDeviceAttributeViString(self, handle, index, attribute_id, attribute_value_buffer_size, attribute_value):  # noqa: N802
-        with self._func_lock:
-            if self.niModInst_GetInstalledDeviceAttributeViString_cfunc is None:
-                self.niModInst_GetInstalledDeviceAttributeViString_cfunc = self._library.niModInst_GetInstalledDeviceAttributeViString
-                self.niModInst_GetInstalledDeviceAttributeViString_cfunc.argtypes = [ViSession, ViInt32, ViInt32, ViInt32, ctypes.POINTER(ViChar)]  # noqa: F405
-                self.niModInst_GetInstalledDeviceAttributeViString_cfunc.restype = ViStatus  # noqa: F405
+        if self.niModInst_GetInstalledDeviceAttributeViString_cfunc is None:
+            with self._func_lock:
+                if self.niModInst_GetInstalledDeviceAttributeViString_cfunc is None:
+                    cfunc = self._library.niModInst_GetInstalledDeviceAttributeViString
+                    cfunc.argtypes = [ViSession, ViInt32, ViInt32, ViInt32, ctypes.POINTER(ViChar)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niModInst_GetInstalledDeviceAttributeViString_cfunc = cfunc
         return self.niModInst_GetInstalledDeviceAttributeViString_cfunc(handle, index, attribute_id, attribute_value_buffer_size, attribute_value)
 
     def niModInst_OpenInstalledDevicesSession(self, driver, handle, device_count):  # noqa: N802
-        with self._func_lock:
-            if self.niModInst_OpenInstalledDevicesSession_cfunc is None:
-                self.niModInst_OpenInstalledDevicesSession_cfunc = self._library.niModInst_OpenInstalledDevicesSession
-                self.niModInst_OpenInstalledDevicesSession_cfunc.argtypes = [ctypes.POINTER(ViChar), ctypes.POINTER(ViSession), ctypes.POINTER(ViInt32)]  # noqa: F405
-                self.niModInst_OpenInstalledDevicesSession_cfunc.restype = ViStatus  # noqa: F405
+        if self.niModInst_OpenInstalledDevicesSession_cfunc is None:
+            with self._func_lock:
+                if self.niModInst_OpenInstalledDevicesSession_cfunc is None:
+                    cfunc = self._library.niModInst_OpenInstalledDevicesSession
+                    cfunc.argtypes = [ctypes.POINTER(ViChar), ctypes.POINTER(ViSession), ctypes.POINTER(ViInt32)]  # noqa: F405
+                    cfunc.restype = ViStatus  # noqa: F405
+                    self.niModInst_OpenInstalledDevicesSession_cfunc = cfunc
         return self.niModInst_OpenInstalledDevicesSession_cfunc(driver, handle, device_count)
@@ -1,11 +1,44 @@
 # This file was generated
 
 import ctypes
+import threading
+from nimodinst import call_stats
 from nimodinst import errors
 from nimodinst import library_singleton
 from nimodinst import visatype
 
 
+class _ScalarCtypes(threading.local):
+    '''ctypes objects for the scalar parameters of driver functions, which methods reuse instead of creating new ones on every call
+
+    Each thread has its own, so that calls on different threads don't share them.
+    '''
+
+    def __init__(self):
+        self.GetInstalledDeviceAttributeViInt32_attribute_id = visatype.ViInt32()
+        self.GetInstalledDeviceAttributeViInt32_attribute_value = visatype.ViInt32()
+        self.GetInstalledDeviceAttributeViInt32_attribute_value_pointer = ctypes.pointer(self.GetInstalledDeviceAttributeViInt32_attribute_value)
+        self.GetInstalledDeviceAttributeViInt32_index = visatype.ViInt32()
+        self.GetInstalledDeviceAttributeViString_attribute_id = visatype.ViInt32()
+        self.GetInstalledDeviceAttributeViString_index = visatype.ViInt32()
+        self.OpenInstalledDevicesSession_device_count = visatype.ViInt32()
+        self.OpenInstalledDevicesSession_device_count_pointer = ctypes.pointer(self.OpenInstalledDevicesSession_device_count)
+        self.OpenInstalledDevicesSession_handle = visatype.ViSession()
+        self.OpenInstalledDevicesSession_handle_pointer = ctypes.pointer(self.OpenInstalledDevicesSession_handle)
+
+
+_scalar_ctypes = _ScalarCtypes()
+
+# C function that each method calls, for call_stats
+_c_functions = {
+    '_close_installed_devices_session': 'niModInst_CloseInstalledDevicesSession',
+    '_get_extended_error_info': 'niModInst_GetExtendedErrorInfo',
+    '_get_installed_device_attribute_vi_int32': 'niModInst_GetInstalledDeviceAttributeViInt32',
+    '_get_installed_device_attribute_vi_string': 'niModInst_GetInstalledDeviceAttributeViString',
+    '_open_installed_devices_session': 'niModInst_OpenInstalledDevicesSession',
+}
+
+
 class AttributeViInt32(object):
 
     def __init__(self, owner, attribute_id, index):
@@ -93,11 +126,18 @@ class Session(object):
 
     def __init__(self, driver):
         self._handle = 0
+        self._handle_ctype = visatype.ViSession(self._handle)
         self._item_count = 0
         self._current_item = 0
         self._encoding = 'windows-1251'
         self._library = library_singleton.get()
+        self._warning_policy = errors.WarningPolicy()
+        self._session_stats = call_stats.SessionStats(_c_functions)
+        self._session_stats._add_session(self)
+        if call_stats.registry.enabled:
+            self._session_stats.enable()
         self._handle, self._item_count = self._open_installed_devices_session(driver)
+        self._handle_ctype = visatype.ViSession(self._handle)
 
         self._is_frozen = True
 
@@ -109,6 +149,23 @@ class Session(object):
     def __getitem__(self, index):
         return Device(self, index)
 
+    @property
+    def warning_policy(self):
+        '''How this session reports warnings from the driver. See errors.WarningPolicy.'''
+        return self._warning_policy
+
+    def enable_stats(self):
+        '''Starts recording statistics of the driver calls of this session, and clears them. See stats().'''
+        self._session_stats.enable()
+
+    def disable_stats(self):
+        '''Stops recording statistics of the driver calls. stats() still returns the ones recorded.'''
+        self._session_stats.disable()
+
+    def stats(self):
+        '''Returns the statistics of the driver calls, as an OrderedDict of call_stats.FunctionStats by C function name. See call_stats.'''
+        return self._session_stats.stats()
+
     def __enter__(self):
         return self
 
@@ -162,6 +219,7 @@ class Session(object):
         if(self._handle != 0):
             self._close_installed_devices_session()
             self._handle = 0
+            self._handle_ctype = visatype.ViSession(self._handle)
 
     ''' These are code-generated '''
 
@@ -172,7 +230,7 @@ class Session(object):
         _open_installed_devices_session. Call this function when you are
         finished using the session handle and do not use this handle again.
         '''
-        handle_ctype = visatype.ViSession(self._handle)  # case 1
+        handle_ctype = self._handle_ctype  # case 1
         error_code = self._library.niModInst_CloseInstalledDevicesSession(handle_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -246,11 +304,13 @@ class Session(object):
             attribute_value (int): A pointer to a signed 32-bit integer variable that receives the value of
                 the requested attribute.
         '''
-        handle_ctype = visatype.ViSession(self._handle)  # case 1
-        index_ctype = visatype.ViInt32(index)  # case 8
-        attribute_id_ctype = visatype.ViInt32(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niModInst_GetInstalledDeviceAttributeViInt32(handle_ctype, index_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        handle_ctype = self._handle_ctype  # case 1
+        index_ctype = _scalar_ctypes.GetInstalledDeviceAttributeViInt32_index
+        index_ctype.value = index  # case 8
+        attribute_id_ctype = _scalar_ctypes.GetInstalledDeviceAttributeViInt32_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetInstalledDeviceAttributeViInt32_attribute_value  # case 13
+        error_code = self._library.niModInst_GetInstalledDeviceAttributeViInt32(handle_ctype, index_ctype, attribute_id_ctype, _scalar_ctypes.GetInstalledDeviceAttributeViInt32_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(attribute_value_ctype.value)
 
@@ -287,9 +347,11 @@ class Session(object):
                 Description section for information on how to determine the exact buffer
                 size required.
         '''
-        handle_ctype = visatype.ViSession(self._handle)  # case 1
-        index_ctype = visatype.ViInt32(index)  # case 8
-        attribute_id_ctype = visatype.ViInt32(attribute_id)  # case 8
+        handle_ctype = self._handle_ctype  # case 1
+        index_ctype = _scalar_ctypes.GetInstalledDeviceAttributeViString_index
+        index_ctype.value = index  # case 8
+        attribute_id_ctype = _scalar_ctypes.GetInstalledDeviceAttributeViString_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
         attribute_value_buffer_size_ctype = visatype.ViInt32()  # case 6
         attribute_value_ctype = None  # case 11
         error_code = self._library.niModInst_GetInstalledDeviceAttributeViString(handle_ctype, index_ctype, attribute_id_ctype, attribute_value_buffer_size_ctype, attribute_value_ctype)
@@ -333,10 +395,10 @@ class Session(object):
                 found in the system that are supported by the driver specified in the
                 driver parameter.
         '''
-        driver_ctype = ctypes.create_string_buffer(driver.encode(self._encoding))  # case 3
-        handle_ctype = visatype.ViSession()  # case 13
-        device_count_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niModInst_OpenInstalledDevicesSession(driver_ctype, ctypes.pointer(handle_ctype), ctypes.pointer(device_count_ctype))
+        driver_ctype = driver.encode(self._encoding)  # case 3
+        handle_ctype = _scalar_ctypes.OpenInstalledDevicesSession_handle  # case 13
+        device_count_ctype = _scalar_ctypes.OpenInstalledDevicesSession_device_count  # case 13
+        error_code = self._library.niModInst_OpenInstalledDevicesSession(driver_ctype, _scalar_ctypes.OpenInstalledDevicesSession_handle_pointer, _scalar_ctypes.OpenInstalledDevicesSession_device_count_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(handle_ctype.value), int(device_count_ctype.value)
 
@@ -0,0 +1,74 @@
+# This file was generated
+'''Simulated NI-ModInst runtime, for testing and benchmarking without hardware.'''
+
+from nimodinst import _simulation
+
+
+# (name, direction, type, is_buffer, size mechanism, index of the size parameter, default value) of every parameter of every function
+_functions = {
+    'niModInst_CloseInstalledDevicesSession': (
+        ('handle', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niModInst_GetExtendedErrorInfo': (
+        ('errorInfoBufferSize', 'in', 'ViInt32', False, None, None, None),
+        ('errorInfo', 'out', 'ViChar', True, 'ivi-dance', 0, None),
+    ),
+    'niModInst_GetInstalledDeviceAttributeViInt32': (
+        ('handle', 'in', 'ViSession', False, None, None, None),
+        ('index', 'in', 'ViInt32', False, None, None, None),
+        ('attributeID', 'in', 'ViInt32', False, None, None, None),
+        ('attributeValue', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niModInst_GetInstalledDeviceAttributeViString': (
+        ('handle', 'in', 'ViSession', False, None, None, None),
+        ('index', 'in', 'ViInt32', False, None, None, None),
+        ('attributeID', 'in', 'ViInt32', False, None, None, None),
+        ('attributeValueBufferSize', 'in', 'ViInt32', False, None, None, None),
+        ('attributeValue', 'out', 'ViChar', True, 'ivi-dance', 3, None),
+    ),
+    'niModInst_OpenInstalledDevicesSession': (
+        ('driver', 'in', 'ViChar', True, 'fixed', None, None),
+        ('handle', 'out', 'ViSession', False, None, None, None),
+        ('deviceCount', 'out', 'ViInt32', False, None, None, None),
+    ),
+}
+
+# Value of every attribute until it is set
+_attributes = {
+    0: '',  # DEVICE_NAME
+    1: '',  # DEVICE_MODEL
+    2: '',  # SERIAL_NUMBER
+    10: 0,  # SLOT_NUMBER
+    11: 0,  # CHASSIS_NUMBER
+    12: 0,  # BUS_NUMBER
+    13: 0,  # SOCKET_NUMBER
+    17: 0,  # PCIEXPRESS_LINK_WIDTH
+    18: 0,  # MAX_PCIEXPRESS_LINK_WIDTH
+}
+
+# Values returned in output parameters, by function and parameter name. Output buffers that are not listed are
+# filled with synthetic data, and output counts (i.e. actualNumberOfPoints) return the number of elements written.
+_output_values = {
+}
+
+
+class Simulator(_simulation.SimulatedLibrary):
+    '''Simulator
+
+    Pure-Python stand-in for the NI-ModInst runtime. It keeps the value of attributes for each session and fills
+    output buffers with synthetic data. Pass an instance to library_singleton.set_backend() before creating sessions:
+
+        import nimodinst.simulator
+        nimodinst.library_singleton.set_backend(nimodinst.simulator.Simulator(latency=0.0001))
+
+    Args:
+        latency (float): Time, in seconds, that every function call sleeps for. Can be changed at any time.
+        array_size (int): Number of elements of output buffers that the driver sizes, i.e. with the IVI-dance
+        attribute_values (dict): Value of attributes, by attribute ID, until they are set
+        output_values (dict): Values returned in output parameters, by C function name without the prefix and
+            parameter name, i.e. {'ReadMultiPoint': {'readingArray': 1.5}}. A single value fills a whole buffer, and
+            a dict of field values fills every structure of a buffer of structures.
+    '''
+
+    def __init__(self, latency=0.0, array_size=1000, attribute_values=None, output_values=None):
+        super(Simulator, self).__init__('niModInst_', _functions, _attributes, _output_values, latency, array_size, attribute_values, output_values)
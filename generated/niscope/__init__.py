@@ -1,8 +1,88 @@
 #!/usr/bin/python
 # This file was generated
 
-from niscope.enums import *          # noqa: F403,F401,H303
-from niscope.errors import Error     # noqa: F401
-from niscope.errors import NiscopeWarning   # noqa: F401
-from niscope.session import Session  # noqa: F401
+import sys
 
+# Modules are imported when one of their names is first used, so that importing the package is fast
+_lazy_names = {
+    'AGCAverageControl': 'enums',
+    'AOUTParallelOutputSource': 'enums',
+    'AcquisitionType': 'enums',
+    'AddressType': 'enums',
+    'BOUTParallelOutputSource': 'enums',
+    'BoolEnableDisable': 'enums',
+    'BoolEnableDisableChan': 'enums',
+    'BoolEnableDisableIQ': 'enums',
+    'BoolEnableDisableRealtime': 'enums',
+    'BoolEnableDisableTIS': 'enums',
+    'CoordinateConverterInput': 'enums',
+    'DataJustificationMode': 'enums',
+    'DataProcessingMode': 'enums',
+    'DiscriminatorFIRInputSource': 'enums',
+    'DiscriminatorFIRSymmetry': 'enums',
+    'DiscriminatorFIRSymmetryType': 'enums',
+    'Error': 'errors',
+    'FIRFilterWindow': 'enums',
+    'FetchRelativeTo': 'enums',
+    'FilterType': 'enums',
+    'FlexFIRAntialiasFilterType': 'enums',
+    'NiscopeWarning': 'errors',
+    'NotificationType': 'enums',
+    'OverflowErrorReporting': 'enums',
+    'PercentageMethod': 'enums',
+    'ProgFIRFilterRealComplex': 'enums',
+    'ProgFIRFilterSymmetry': 'enums',
+    'ProgFIRFilterSymmetryType': 'enums',
+    'QInputtoCoordConverter': 'enums',
+    'RISMethod': 'enums',
+    'RefLevelUnits': 'enums',
+    'RefTriggerDetectorLocation': 'enums',
+    'ResamplerFilterMode': 'enums',
+    'Session': 'session',
+    'StreamingPositionType': 'enums',
+    'SyncoutCLKSelect': 'enums',
+    'TerminalConfiguration': 'enums',
+    'TimingNCOFreqOffsetBits': 'enums',
+    'TriggerCoupling': 'enums',
+    'TriggerModifier': 'enums',
+    'TriggerSlope': 'enums',
+    'TriggerType': 'enums',
+    'TriggerWindowMode': 'enums',
+    'VerticalCoupling': 'enums',
+    'VideoPolarity': 'enums',
+    'VideoSignalFormat': 'enums',
+    'VideoTriggerEvent': 'enums',
+    'WaveformInfo': 'waveform_info',
+    'niScope_wfmInfo': 'waveform_info',
+}
+
+__all__ = sorted(_lazy_names)
+
+if sys.version_info >= (3, 7):
+    import importlib
+    import importlib.util
+
+    def __getattr__(name):
+        if name in _lazy_names:
+            submodule = importlib.import_module('niscope.' + _lazy_names[name])
+            # Next time, all the names of the module are found without calling __getattr__. This also replaces the
+            # module in the package with the name it exports, when they are the same.
+            for n in _lazy_names:
+                if _lazy_names[n] == _lazy_names[name]:
+                    globals()[n] = getattr(submodule, n)
+            return globals()[name]
+        # Modules of the package are attributes of it once imported, as they were when the package imported them all
+        if not name.startswith('__') and importlib.util.find_spec('niscope.' + name) is not None:
+            return importlib.import_module('niscope.' + name)
+        raise AttributeError("module 'niscope' has no attribute '{0}'".format(name))
+
+    def __dir__():
+        return sorted(set(globals()) | set(_lazy_names))
+else:
+    # Module __getattr__ needs Python 3.7
+    from niscope.enums import *          # noqa: F403,F401,H303
+    from niscope.errors import Error     # noqa: F401
+    from niscope.errors import NiscopeWarning   # noqa: F401
+    from niscope.session import Session  # noqa: F401
+    from niscope.waveform_info import WaveformInfo  # noqa: F401
+    from niscope.waveform_info import niScope_wfmInfo  # noqa: F401
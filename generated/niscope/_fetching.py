@@ -0,0 +1,110 @@
+'''Fetching many records of many channels at once, into numpy arrays.'''
+
+import numbers
+
+from niscope import visatype
+from niscope import waveform_info
+
+
+# Fields of niScope_wfmInfo returned to the caller, without the reserved ones
+_WFM_INFO_FIELDS = ['absolute_initial_x', 'relative_initial_x', 'x_increment', 'actual_samples', 'offset', 'gain']
+
+# Private Session method and sample type for each value of binary_sample_width
+_BINARY_FETCHES = {
+    8: ('_fetch_binary8_into', visatype.ViInt8),
+    16: ('_fetch_binary16_into', visatype.ViInt16),
+    32: ('_fetch_binary32_into', visatype.ViInt32),
+}
+
+
+class _ScaledView(object):
+    '''Read-only view of binary samples in volts, that only scales the samples it is indexed with'''
+
+    def __init__(self, samples, gain, offset):
+        self._samples = samples
+        self._gain = gain
+        self._offset = offset
+
+    @property
+    def shape(self):
+        return self._samples.shape
+
+    @property
+    def ndim(self):
+        return self._samples.ndim
+
+    def __len__(self):
+        return len(self._samples)
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+        # numbers.Integral includes numpy integers and long on Python 2
+        if len(key) > 3 or not all(isinstance(k, (numbers.Integral, slice)) for k in key):
+            raise TypeError('scaled can only be indexed with up to 3 integers or slices, not {0!r}'.format(key))
+        samples = self._samples[key]
+        gain = self._gain[key[:2]]
+        offset = self._offset[key[:2]]
+        if len(key) < 3 or isinstance(key[2], slice):
+            # The samples axis is still there, so apply the coefficients of each record to all its samples
+            gain = gain[..., None]
+            offset = offset[..., None]
+        return samples * gain + offset
+
+    def __array__(self, dtype=None):
+        scaled = self[:]
+        return scaled if dtype is None else scaled.astype(dtype)
+
+
+class BinaryWaveforms(object):
+    '''Result of niscope.Session.fetch_records_binary(). See the Session method for documentation.'''
+
+    def __init__(self, samples, wfm_info):
+        self.samples = samples
+        self.wfm_info = wfm_info
+        self.scaled = _ScaledView(samples, wfm_info['gain'], wfm_info['offset'])
+
+    def __repr__(self):
+        return '{0}(samples={1!r}, wfm_info={2!r})'.format(self.__class__.__name__, self.samples, self.wfm_info)
+
+
+def _fetch_records_into(session, fetch_into, sample_type, num_samples, record_number, num_records, timeout):
+    '''Fetches all channels of the records into a (channels, records, samples) array of sample_type'''
+    import numpy
+
+    if num_samples == -1:
+        num_samples = session.horz_record_length
+    if num_records == -1:
+        num_records = session.horz_num_records - record_number
+    if num_samples <= 0 or num_records <= 0:
+        raise ValueError('Nothing to fetch: num_samples is {0} and num_records is {1}'.format(num_samples, num_records))
+
+    session.fetch_record_number = record_number
+    session.fetch_num_records = num_records
+    num_wfms = session.actual_num_wfms()
+    num_channels = num_wfms // num_records
+
+    # The driver returns every channel of record 0 first, then every channel of record 1, and so on
+    waveforms = numpy.empty((num_records, num_channels, num_samples), dtype=numpy.dtype(sample_type))
+    info = numpy.zeros((num_records, num_channels), dtype=numpy.dtype(waveform_info.niScope_wfmInfo))
+    fetch_into(timeout, num_samples, waveforms.reshape(-1), info.reshape(-1))
+
+    # One copy puts the samples of each channel next to each other
+    waveforms = numpy.ascontiguousarray(waveforms.transpose(1, 0, 2))
+    info = numpy.ascontiguousarray(info.transpose())[_WFM_INFO_FIELDS]
+    return waveforms, info
+
+
+def fetch_records(session, num_samples=-1, record_number=0, num_records=-1, timeout=5.0):
+    '''Implementation of niscope.Session.fetch_records(). See the Session method for documentation.'''
+    return _fetch_records_into(session, session._fetch_into, visatype.ViReal64, num_samples, record_number, num_records, timeout)
+
+
+def fetch_records_binary(session, num_samples=-1, record_number=0, num_records=-1, timeout=5.0):
+    '''Implementation of niscope.Session.fetch_records_binary(). See the Session method for documentation.'''
+    sample_width = session.binary_sample_width
+    if sample_width not in _BINARY_FETCHES:
+        raise ValueError('binary_sample_width must be one of {0}, not {1}'.format(sorted(_BINARY_FETCHES), sample_width))
+    method_name, sample_type = _BINARY_FETCHES[sample_width]
+    samples, info = _fetch_records_into(session, getattr(session, method_name), sample_type, num_samples, record_number, num_records, timeout)
+    return BinaryWaveforms(samples, info)
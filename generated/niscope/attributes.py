@@ -1,68 +1,132 @@
 # -*- coding: utf-8 -*-
 # This file was generated
+import collections
+import ctypes
+
+from niscope import enums
+from niscope import errors
+from niscope import visatype
+
+
+class AttributeCache(object):
+    '''Values of the attributes of a session, by attribute ID and repeated capability.
+
+    Shared by a session and all its repeated capabilities. Disabled until the session enables it. generation counts how
+    many times it was cleared, so that others can tell when the values of attributes may have changed.
+    '''
+
+    def __init__(self):
+        self.enabled = False
+        self.values = {}
+        self.generation = 0
+
+    def clear(self):
+        self.values.clear()
+        self.generation += 1
 
 
 class Attribute(object):
     '''Base class for all typed attributes.'''
 
-    def __init__(self, attribute_id):
+    def __init__(self, attribute_id, volatile=False):
         self._attribute_id = attribute_id
+        self._volatile = volatile
+
+    def _convert(self, value):
+        '''Returns value as the type that the getter returns, so the cache returns the same thing the driver would'''
+        return value
+
+    def _get(self, session, getter):
+        cache = session._attribute_cache
+        if not cache.enabled or self._volatile:
+            return getter(self._attribute_id)
+        values = cache.values.get(self._attribute_id)
+        if values is not None and session._repeated_capability in values:
+            return values[session._repeated_capability]
+        value = getter(self._attribute_id)
+        cache.values.setdefault(self._attribute_id, {})[session._repeated_capability] = value
+        return value
+
+    def _set(self, session, setter, value):
+        setter(self._attribute_id, value)
+        cache = session._attribute_cache
+        if cache.enabled and not self._volatile:
+            # Write-through. Values cached for other repeated capabilities are dropped, since they may overlap
+            cache.values[self._attribute_id] = {session._repeated_capability: self._convert(value)}
 
 
 class AttributeViInt32(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_int32(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_int32)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_int32(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_int32, value)
+
+    def _convert(self, value):
+        return int(value)
 
 
 class AttributeViInt64(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_int64(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_int64)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_int64(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_int64, value)
+
+    def _convert(self, value):
+        return int(value)
 
 
 class AttributeViReal64(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_real64(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_real64)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_real64(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_real64, value)
+
+    def _convert(self, value):
+        return float(value)
 
 
 class AttributeViString(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_string(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_string)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_string(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_string, value)
 
 
 class AttributeViBoolean(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_boolean(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_boolean)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_boolean(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_boolean, value)
+
+    def _convert(self, value):
+        return bool(value)
 
 
 class AttributeEnum(object):
 
-    def __init__(self, underlying_attribute_meta_class, enum_meta_class, attribute_id):
-        self._underlying_attribute = underlying_attribute_meta_class(attribute_id)
+    def __init__(self, underlying_attribute_meta_class, enum_meta_class, attribute_id, volatile=False):
+        self._underlying_attribute = underlying_attribute_meta_class(attribute_id, volatile)
         self._attribute_type = enum_meta_class
         self._attribute_id = attribute_id
+        self._members_by_value = enums._members_by_value[enum_meta_class]
 
     def __get__(self, session, session_type):
-        return self._attribute_type(self._underlying_attribute.__get__(session, session_type))
+        value = self._underlying_attribute.__get__(session, session_type)
+        try:
+            return self._members_by_value[value]
+        except KeyError:
+            # Raises ValueError, as the enum does for values it doesn't have
+            return self._attribute_type(value)
 
     def __set__(self, session, value):
         if type(value) is not self._attribute_type:
@@ -70,3 +134,371 @@ class AttributeEnum(object):
         return self._underlying_attribute.__set__(session, value.value)
 
 
+# (attribute_id, python_name, type, enum, channel_based, access, volatile) of an attribute. enum is the enum class or None,
+# channel_based is True if it can be used with repeated capabilities, and access is 'read-write', 'read only' or 'write only'.
+AttributeInfo = collections.namedtuple('AttributeInfo', ['attribute_id', 'python_name', 'type', 'enum', 'channel_based', 'access', 'volatile'])
+
+# Every attribute of NI-SCOPE, by attribute ID
+index = {
+    1050002: AttributeInfo(1050002, 'range_check', 'ViBoolean', None, False, 'read-write', False),
+    1050003: AttributeInfo(1050003, 'query_instrument_status', 'ViBoolean', None, False, 'read-write', False),
+    1050004: AttributeInfo(1050004, 'cache', 'ViBoolean', None, False, 'read-write', False),
+    1050005: AttributeInfo(1050005, 'simulate', 'ViBoolean', None, False, 'read-write', False),
+    1050006: AttributeInfo(1050006, 'record_coercions', 'ViBoolean', None, False, 'read-write', False),
+    1050007: AttributeInfo(1050007, 'driver_setup', 'ViString', None, False, 'read only', False),
+    1050021: AttributeInfo(1050021, 'interchange_check', 'ViBoolean', None, False, 'read-write', False),
+    1050203: AttributeInfo(1050203, 'channel_count', 'ViInt32', None, False, 'read only', False),
+    1050302: AttributeInfo(1050302, 'specific_driver_prefix', 'ViString', None, False, 'read only', False),
+    1050304: AttributeInfo(1050304, 'io_resource_descriptor', 'ViString', None, False, 'read only', False),
+    1050305: AttributeInfo(1050305, 'logical_name', 'ViString', None, False, 'read only', False),
+    1050327: AttributeInfo(1050327, 'supported_instrument_models', 'ViString', None, False, 'read only', False),
+    1050401: AttributeInfo(1050401, 'group_capabilities', 'ViString', None, False, 'read only', False),
+    1050510: AttributeInfo(1050510, 'instrument_firmware_revision', 'ViString', None, False, 'read only', False),
+    1050511: AttributeInfo(1050511, 'instrument_manufacturer', 'ViString', None, False, 'read only', False),
+    1050512: AttributeInfo(1050512, 'instrument_model', 'ViString', None, False, 'read only', False),
+    1050513: AttributeInfo(1050513, 'specific_driver_vendor', 'ViString', None, False, 'read only', False),
+    1050514: AttributeInfo(1050514, 'specific_driver_description', 'ViString', None, False, 'read only', False),
+    1050515: AttributeInfo(1050515, 'specific_driver_class_spec_major_version', 'ViInt32', None, False, 'read only', False),
+    1050516: AttributeInfo(1050516, 'specific_driver_class_spec_minor_version', 'ViInt32', None, False, 'read only', False),
+    1050551: AttributeInfo(1050551, 'specific_driver_revision', 'ViString', None, False, 'read only', False),
+    1150001: AttributeInfo(1150001, 'horz_num_records', 'ViInt32', None, False, 'read-write', False),
+    1150002: AttributeInfo(1150002, 'input_clock_source', 'ViString', None, False, 'read-write', False),
+    1150003: AttributeInfo(1150003, 'output_clock_source', 'ViString', None, False, 'read-write', False),
+    1150004: AttributeInfo(1150004, 'horz_enforce_realtime', 'ViBoolean', enums.BoolEnableDisableRealtime, False, 'read-write', False),
+    1150005: AttributeInfo(1150005, 'binary_sample_width', 'ViInt32', None, False, 'read-write', False),
+    1150006: AttributeInfo(1150006, 'trigger_hysteresis', 'ViReal64', None, False, 'read-write', False),
+    1150007: AttributeInfo(1150007, 'clock_sync_pulse_source', 'ViString', None, False, 'read-write', False),
+    1150008: AttributeInfo(1150008, 'master_enable', 'ViBoolean', None, False, 'read-write', False),
+    1150009: AttributeInfo(1150009, 'min_sample_rate', 'ViReal64', None, False, 'read-write', False),
+    1150012: AttributeInfo(1150012, 'trigger_window_mode', 'ViInt32', enums.TriggerWindowMode, False, 'read-write', False),
+    1150013: AttributeInfo(1150013, 'trigger_window_low_level', 'ViReal64', None, False, 'read-write', False),
+    1150014: AttributeInfo(1150014, 'trigger_window_high_level', 'ViReal64', None, False, 'read-write', False),
+    1150016: AttributeInfo(1150016, 'meas_ref_level_units', 'ViInt32', enums.RefLevelUnits, True, 'read-write', False),
+    1150018: AttributeInfo(1150018, 'meas_other_channel', 'ViString', None, True, 'read-write', False),
+    1150019: AttributeInfo(1150019, 'meas_hysteresis_percent', 'ViReal64', None, True, 'read-write', False),
+    1150020: AttributeInfo(1150020, 'meas_last_acq_histogram_size', 'ViInt32', None, True, 'read-write', False),
+    1150021: AttributeInfo(1150021, 'meas_voltage_histogram_size', 'ViInt32', None, False, 'read-write', False),
+    1150022: AttributeInfo(1150022, 'meas_voltage_histogram_low_volts', 'ViReal64', None, False, 'read-write', False),
+    1150023: AttributeInfo(1150023, 'meas_voltage_histogram_high_volts', 'ViReal64', None, False, 'read-write', False),
+    1150024: AttributeInfo(1150024, 'meas_time_histogram_size', 'ViInt32', None, True, 'read-write', False),
+    1150025: AttributeInfo(1150025, 'meas_time_histogram_low_volts', 'ViReal64', None, True, 'read-write', False),
+    1150026: AttributeInfo(1150026, 'meas_time_histogram_high_volts', 'ViReal64', None, True, 'read-write', False),
+    1150027: AttributeInfo(1150027, 'meas_time_histogram_low_time', 'ViReal64', None, False, 'read-write', False),
+    1150028: AttributeInfo(1150028, 'meas_time_histogram_high_time', 'ViReal64', None, False, 'read-write', False),
+    1150029: AttributeInfo(1150029, 'meas_polynomial_interpolation_order', 'ViInt32', None, False, 'read-write', False),
+    1150030: AttributeInfo(1150030, 'meas_interpolation_sampling_factor', 'ViReal64', None, True, 'read-write', False),
+    1150031: AttributeInfo(1150031, 'meas_filter_cutoff_freq', 'ViReal64', None, True, 'read-write', False),
+    1150032: AttributeInfo(1150032, 'meas_filter_center_freq', 'ViReal64', None, True, 'read-write', False),
+    1150033: AttributeInfo(1150033, 'meas_filter_ripple', 'ViReal64', None, False, 'read-write', False),
+    1150034: AttributeInfo(1150034, 'meas_filter_transient_waveform_percent', 'ViReal64', None, True, 'read-write', False),
+    1150035: AttributeInfo(1150035, 'meas_filter_type', 'ViInt32', enums.FilterType, False, 'read-write', False),
+    1150036: AttributeInfo(1150036, 'meas_filter_order', 'ViInt32', None, False, 'read-write', False),
+    1150037: AttributeInfo(1150037, 'meas_filter_taps', 'ViInt32', None, False, 'read-write', False),
+    1150038: AttributeInfo(1150038, 'meas_chan_low_ref_level', 'ViReal64', None, True, 'read-write', False),
+    1150039: AttributeInfo(1150039, 'meas_chan_mid_ref_level', 'ViReal64', None, True, 'read-write', False),
+    1150040: AttributeInfo(1150040, 'meas_chan_high_ref_level', 'ViReal64', None, True, 'read-write', False),
+    1150041: AttributeInfo(1150041, 'meas_filter_width', 'ViReal64', None, False, 'read-write', False),
+    1150042: AttributeInfo(1150042, 'meas_fir_filter_window', 'ViInt32', enums.FIRFilterWindow, True, 'read-write', False),
+    1150043: AttributeInfo(1150043, 'meas_array_gain', 'ViReal64', None, True, 'read-write', False),
+    1150044: AttributeInfo(1150044, 'meas_array_offset', 'ViReal64', None, True, 'read-write', False),
+    1150045: AttributeInfo(1150045, 'meas_percentage_method', 'ViInt32', enums.PercentageMethod, True, 'read-write', False),
+    1150046: AttributeInfo(1150046, 'slave_trigger_delay', 'ViReal64', None, False, 'read-write', False),
+    1150047: AttributeInfo(1150047, 'trigger_to_star_delay', 'ViReal64', None, False, 'read only', False),
+    1150048: AttributeInfo(1150048, 'trigger_to_rtsi_delay', 'ViReal64', None, False, 'read only', False),
+    1150049: AttributeInfo(1150049, 'trigger_to_pfi_delay', 'ViReal64', None, False, 'read only', False),
+    1150050: AttributeInfo(1150050, 'trigger_from_star_delay', 'ViReal64', None, False, 'read only', False),
+    1150051: AttributeInfo(1150051, 'trigger_from_rtsi_delay', 'ViReal64', None, False, 'read only', False),
+    1150052: AttributeInfo(1150052, 'trigger_from_pfi_delay', 'ViReal64', None, False, 'read only', False),
+    1150053: AttributeInfo(1150053, 'acq_arm_source', 'ViString', None, False, 'read-write', False),
+    1150065: AttributeInfo(1150065, 'record_arm_source', 'ViString', None, False, 'read-write', False),
+    1150068: AttributeInfo(1150068, 'allow_more_records_than_memory', 'ViBoolean', None, False, 'read-write', False),
+    1150069: AttributeInfo(1150069, 'onboard_memory_size', 'ViInt32', None, False, 'read only', False),
+    1150070: AttributeInfo(1150070, 'ris_num_averages', 'ViInt32', None, False, 'read-write', False),
+    1150071: AttributeInfo(1150071, 'ris_method', 'ViInt32', enums.RISMethod, False, 'read-write', False),
+    1150072: AttributeInfo(1150072, 'fetch_interleaved_data', 'ViBoolean', None, False, 'read-write', False),
+    1150073: AttributeInfo(1150073, 'max_real_time_sampling_rate', 'ViReal64', None, False, 'read only', False),
+    1150074: AttributeInfo(1150074, 'max_ris_rate', 'ViReal64', None, False, 'read only', False),
+    1150075: AttributeInfo(1150075, 'trigger_impedance', 'ViReal64', None, False, 'read-write', False),
+    1150076: AttributeInfo(1150076, 'device_number', 'ViInt32', None, False, 'read only', False),
+    1150077: AttributeInfo(1150077, 'fetch_relative_to', 'ViInt32', enums.FetchRelativeTo, False, 'read-write', False),
+    1150078: AttributeInfo(1150078, 'fetch_offset', 'ViInt32', None, False, 'read-write', False),
+    1150079: AttributeInfo(1150079, 'fetch_record_number', 'ViInt32', None, False, 'read-write', False),
+    1150080: AttributeInfo(1150080, 'fetch_num_records', 'ViInt32', None, False, 'read-write', False),
+    1150081: AttributeInfo(1150081, 'fetch_meas_num_samples', 'ViInt32', None, False, 'read-write', False),
+    1150082: AttributeInfo(1150082, 'points_done', 'ViReal64', None, False, 'read only', True),
+    1150083: AttributeInfo(1150083, 'records_done', 'ViInt32', None, False, 'read only', True),
+    1150084: AttributeInfo(1150084, 'backlog', 'ViReal64', None, False, 'read only', True),
+    1150085: AttributeInfo(1150085, '_5102_adjust_pretrigger_samples', 'ViBoolean', None, False, 'read-write', False),
+    1150086: AttributeInfo(1150086, 'device_temperature', 'ViReal64', None, False, 'read only', True),
+    1150087: AttributeInfo(1150087, 'samp_clk_timebase_src', 'ViString', None, False, 'read-write', False),
+    1150088: AttributeInfo(1150088, 'samp_clk_timebase_rate', 'ViReal64', None, False, 'read-write', False),
+    1150089: AttributeInfo(1150089, 'samp_clk_timebase_div', 'ViInt32', None, False, 'read-write', False),
+    1150090: AttributeInfo(1150090, 'ref_clk_rate', 'ViReal64', None, False, 'read-write', False),
+    1150091: AttributeInfo(1150091, 'exported_sample_clock_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150093: AttributeInfo(1150093, 'enable_dc_restore', 'ViBoolean', None, False, 'read-write', False),
+    1150094: AttributeInfo(1150094, 'adv_trig_src', 'ViString', None, False, 'read-write', False),
+    1150095: AttributeInfo(1150095, 'arm_ref_trig_src', 'ViString', None, False, 'read-write', False),
+    1150096: AttributeInfo(1150096, 'ref_trig_tdc_enable', 'ViBoolean', None, False, 'read-write', False),
+    1150097: AttributeInfo(1150097, 'exported_start_trigger_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150098: AttributeInfo(1150098, 'exported_ref_trigger_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150099: AttributeInfo(1150099, 'end_of_record_event_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150100: AttributeInfo(1150100, 'poll_interval', 'ViInt32', None, False, 'read-write', False),
+    1150101: AttributeInfo(1150101, 'end_of_acquisition_event_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150102: AttributeInfo(1150102, 'resolution', 'ViInt32', None, False, 'read only', False),
+    1150103: AttributeInfo(1150103, 'start_to_ref_trigger_holdoff', 'ViReal64', None, True, 'read-write', False),
+    1150104: AttributeInfo(1150104, 'serial_number', 'ViString', None, False, 'read only', False),
+    1150105: AttributeInfo(1150105, 'oscillator_phase_dac_value', 'ViInt32', None, False, 'read-write', False),
+    1150106: AttributeInfo(1150106, 'ris_in_auto_setup_enable', 'ViBoolean', None, False, 'read-write', False),
+    1150107: AttributeInfo(1150107, 'channel_terminal_configuration', 'ViInt32', enums.TerminalConfiguration, True, 'read-write', False),
+    1150109: AttributeInfo(1150109, 'exported_advance_trigger_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150110: AttributeInfo(1150110, 'ready_for_start_event_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150111: AttributeInfo(1150111, 'ready_for_ref_event_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150112: AttributeInfo(1150112, 'ready_for_advance_event_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150128: AttributeInfo(1150128, 'enable_time_interleaved_sampling', 'ViBoolean', enums.BoolEnableDisableTIS, True, 'read-write', False),
+    1150129: AttributeInfo(1150129, '_5v_out_output_terminal', 'ViString', None, False, 'read-write', False),
+    1150271: AttributeInfo(1150271, 'flex_fir_antialias_filter_type', 'ViInt32', enums.FlexFIRAntialiasFilterType, True, 'read-write', False),
+    1150278: AttributeInfo(1150278, 'trigger_auto_triggered', 'ViBoolean', None, False, 'read only', True),
+    1150279: AttributeInfo(1150279, 'accessory_gain', 'ViReal64', None, True, 'read only', False),
+    1150280: AttributeInfo(1150280, 'accessory_offset', 'ViReal64', None, True, 'read only', False),
+    1150300: AttributeInfo(1150300, 'ddc_enabled', 'ViBoolean', None, True, 'read-write', False),
+    1150302: AttributeInfo(1150302, 'ddc_frequency_translation_enabled', 'ViBoolean', None, True, 'read-write', False),
+    1150303: AttributeInfo(1150303, 'ddc_center_frequency', 'ViReal64', None, True, 'read-write', False),
+    1150304: AttributeInfo(1150304, 'ddc_data_processing_mode', 'ViInt32', enums.DataProcessingMode, False, 'read-write', False),
+    1150305: AttributeInfo(1150305, 'ddc_frequency_translation_phase_i', 'ViReal64', None, True, 'read-write', False),
+    1150306: AttributeInfo(1150306, 'ddc_frequency_translation_phase_q', 'ViReal64', None, True, 'read-write', False),
+    1150307: AttributeInfo(1150307, 'digital_gain', 'ViReal64', None, True, 'read-write', False),
+    1150308: AttributeInfo(1150308, 'digital_offset', 'ViReal64', None, True, 'read-write', False),
+    1150309: AttributeInfo(1150309, 'overflow_error_reporting', 'ViInt32', enums.OverflowErrorReporting, False, 'read-write', False),
+    1150310: AttributeInfo(1150310, 'ddc_q_source', 'ViString', None, True, 'read-write', False),
+    1150311: AttributeInfo(1150311, 'fetch_interleaved_iq_data', 'ViBoolean', enums.BoolEnableDisableIQ, False, 'read-write', False),
+    1150312: AttributeInfo(1150312, 'equalization_num_coefficients', 'ViInt32', None, True, 'read only', False),
+    1150313: AttributeInfo(1150313, 'equalization_filter_enabled', 'ViBoolean', None, True, 'read-write', False),
+    1150314: AttributeInfo(1150314, 'ref_trigger_detector_location', 'ViInt32', enums.RefTriggerDetectorLocation, False, 'read-write', False),
+    1150315: AttributeInfo(1150315, 'ref_trigger_minimum_quiet_time', 'ViReal64', None, False, 'read-write', False),
+    1150316: AttributeInfo(1150316, 'data_transfer_block_size', 'ViInt32', None, False, 'read-write', False),
+    1150318: AttributeInfo(1150318, 'bandpass_filter_enabled', 'ViBoolean', None, True, 'read-write', False),
+    1150319: AttributeInfo(1150319, 'dither_enabled', 'ViBoolean', None, True, 'read-write', False),
+    1150320: AttributeInfo(1150320, 'fractional_resample_enabled', 'ViBoolean', None, False, 'read-write', False),
+    1150321: AttributeInfo(1150321, 'data_transfer_maximum_bandwidth', 'ViReal64', None, False, 'read-write', False),
+    1150322: AttributeInfo(1150322, 'data_transfer_preferred_packet_size', 'ViInt32', None, False, 'read-write', False),
+    1150328: AttributeInfo(1150328, 'p2p_samples_avail_in_endpoint', 'ViInt32', None, False, 'read only', False),
+    1150329: AttributeInfo(1150329, 'p2p_data_trans_permission_addr', 'ViInt64', None, False, 'read only', False),
+    1150330: AttributeInfo(1150330, 'p2p_data_trans_permission_addr_type', 'ViInt32', enums.AddressType, False, 'read-write', False),
+    1150331: AttributeInfo(1150331, 'p2p_destination_window_addr', 'ViInt64', None, False, 'read-write', False),
+    1150332: AttributeInfo(1150332, 'p2p_destination_window_addr_type', 'ViInt32', enums.AddressType, False, 'read-write', False),
+    1150333: AttributeInfo(1150333, 'p2p_destination_window_size', 'ViInt64', None, False, 'read-write', False),
+    1150334: AttributeInfo(1150334, 'p2p_notify_push_message_on', 'ViInt32', enums.NotificationType, False, 'read-write', False),
+    1150335: AttributeInfo(1150335, 'p2p_notify_message_push_addr', 'ViInt64', None, False, 'read-write', False),
+    1150336: AttributeInfo(1150336, 'p2p_notify_message_push_addr_type', 'ViInt32', enums.AddressType, False, 'read-write', False),
+    1150337: AttributeInfo(1150337, 'p2p_notify_message_push_value', 'ViInt64', None, False, 'read-write', False),
+    1150338: AttributeInfo(1150338, 'p2p_enabled', 'ViBoolean', enums.BoolEnableDisable, False, 'read-write', False),
+    1150339: AttributeInfo(1150339, 'p2p_channels_to_stream', 'ViString', None, False, 'read-write', False),
+    1150340: AttributeInfo(1150340, 'p2p_samples_transferred', 'ViInt64', None, False, 'read only', False),
+    1150341: AttributeInfo(1150341, 'p2p_most_samples_avail_in_endpoint', 'ViInt32', None, False, 'read only', False),
+    1150342: AttributeInfo(1150342, 'p2p_endpoint_size', 'ViInt32', None, False, 'read only', False),
+    1150343: AttributeInfo(1150343, 'manual_configuration_enabled', 'ViBoolean', enums.BoolEnableDisable, False, 'read-write', False),
+    1150344: AttributeInfo(1150344, 'p2p_endpoint_overflow', 'ViBoolean', None, False, 'read only', False),
+    1150345: AttributeInfo(1150345, 'p2p_fifo_endpoint_count', 'ViInt32', None, False, 'read only', False),
+    1150354: AttributeInfo(1150354, 'p2p_onboard_memory_enabled', 'ViBoolean', enums.BoolEnableDisable, False, 'read-write', False),
+    1150366: AttributeInfo(1150366, 'end_of_record_to_advance_trigger_holdoff', 'ViReal64', None, False, 'read-write', False),
+    1150367: AttributeInfo(1150367, 'sample_clock_timebase_multiplier', 'ViInt32', None, False, 'read-write', False),
+    1150373: AttributeInfo(1150373, 'stream_relative_to', 'ViInt32', enums.StreamingPositionType, False, 'read-write', False),
+    1150374: AttributeInfo(1150374, 'absolute_sample_clock_offset', 'ViReal64', None, False, 'read-write', False),
+    1150375: AttributeInfo(1150375, 'fpga_bitfile_path', 'ViString', None, False, 'read only', False),
+    1150376: AttributeInfo(1150376, 'interleaving_offset_correction_enabled', 'ViBoolean', None, False, 'read-write', False),
+    1150377: AttributeInfo(1150377, 'high_pass_filter_frequency', 'ViReal64', None, False, 'read-write', False),
+    1150380: AttributeInfo(1150380, 'samples_transferred_per_record', 'ViInt32', None, False, 'read only', False),
+    1151000: AttributeInfo(1151000, 'carrier_nco_center_frequency', 'ViReal64', None, True, 'read-write', False),
+    1151001: AttributeInfo(1151001, 'carrier_phase_offset', 'ViReal64', None, True, 'read-write', False),
+    1151002: AttributeInfo(1151002, 'mux_mode_register', 'ViInt32', None, False, 'read-write', False),
+    1151003: AttributeInfo(1151003, 'enable_ddc', 'ViBoolean', None, False, 'read-write', False),
+    1151010: AttributeInfo(1151010, 'cic_decimation', 'ViInt32', None, True, 'read-write', False),
+    1151011: AttributeInfo(1151011, 'cic_shift_gain', 'ViInt32', None, True, 'read-write', False),
+    1151020: AttributeInfo(1151020, 'discr._enable', 'ViBoolean', None, True, 'read-write', False),
+    1151021: AttributeInfo(1151021, 'discriminator_fir_decimation', 'ViInt32', None, True, 'read-write', False),
+    1151022: AttributeInfo(1151022, 'discriminator_fir_symmetry', 'ViInt32', enums.DiscriminatorFIRSymmetry, True, 'read-write', False),
+    1151023: AttributeInfo(1151023, 'discriminator_fir_symmetry_type', 'ViInt32', enums.DiscriminatorFIRSymmetryType, True, 'read-write', False),
+    1151024: AttributeInfo(1151024, 'discriminator_fir_taps', 'ViInt32', None, True, 'read-write', False),
+    1151025: AttributeInfo(1151025, 'discriminator_delay', 'ViInt32', None, True, 'read-write', False),
+    1151026: AttributeInfo(1151026, 'discriminator_fir_input_source', 'ViInt32', enums.DiscriminatorFIRInputSource, True, 'read-write', False),
+    1151027: AttributeInfo(1151027, 'discriminator_phase_multiplier', 'ViInt32', None, True, 'read-write', False),
+    1151030: AttributeInfo(1151030, 'prog._fir_filter_decimation', 'ViInt32', None, True, 'read-write', False),
+    1151031: AttributeInfo(1151031, 'prog._fir_filter_symmetry', 'ViInt32', enums.ProgFIRFilterSymmetry, True, 'read-write', False),
+    1151032: AttributeInfo(1151032, 'prog._fir_filter_symmetry_type', 'ViInt32', enums.ProgFIRFilterSymmetryType, True, 'read-write', False),
+    1151033: AttributeInfo(1151033, 'prog._fir_filter_taps', 'ViInt32', None, True, 'read-write', False),
+    1151034: AttributeInfo(1151034, 'prog._fir_filter_realcomplex', 'ViInt32', enums.ProgFIRFilterRealComplex, True, 'read-write', False),
+    1151040: AttributeInfo(1151040, 'agc_upper_gain_limit', 'ViReal64', None, True, 'read-write', False),
+    1151041: AttributeInfo(1151041, 'agc_lower_gain_limit', 'ViReal64', None, True, 'read-write', False),
+    1151042: AttributeInfo(1151042, 'agc_loop_gain_0_exponent', 'ViInt32', None, True, 'read-write', False),
+    1151043: AttributeInfo(1151043, 'agc_loop_gain_0_mantissa', 'ViInt32', None, True, 'read-write', False),
+    1151044: AttributeInfo(1151044, 'agc_loop_gain_1_exponent', 'ViInt32', None, True, 'read-write', False),
+    1151045: AttributeInfo(1151045, 'agc_loop_gain_1_mantissa', 'ViInt32', None, True, 'read-write', False),
+    1151046: AttributeInfo(1151046, 'agc_threshold', 'ViInt32', None, True, 'read-write', False),
+    1151047: AttributeInfo(1151047, 'agc_average_control', 'ViInt32', enums.AGCAverageControl, True, 'read-write', False),
+    1151050: AttributeInfo(1151050, 'halfband_filter_bypass', 'ViBoolean', None, True, 'read-write', False),
+    1151051: AttributeInfo(1151051, 'halfband_filter_1_enable', 'ViBoolean', None, True, 'read-write', False),
+    1151052: AttributeInfo(1151052, 'halfband_filter_2_enable', 'ViBoolean', None, True, 'read-write', False),
+    1151053: AttributeInfo(1151053, 'halfband_filter_3_enable', 'ViBoolean', None, True, 'read-write', False),
+    1151054: AttributeInfo(1151054, 'halfband_filter_4_enable', 'ViBoolean', None, True, 'read-write', False),
+    1151055: AttributeInfo(1151055, 'halfband_filter_5_enable', 'ViBoolean', None, True, 'read-write', False),
+    1151070: AttributeInfo(1151070, 'aout_parallel_output_source', 'ViInt32', enums.AOUTParallelOutputSource, True, 'read-write', False),
+    1151071: AttributeInfo(1151071, 'bout_parallel_output_source', 'ViInt32', enums.BOUTParallelOutputSource, True, 'read-write', False),
+    1151072: AttributeInfo(1151072, 'test_mode_sincos', 'ViBoolean', None, True, 'read-write', False),
+    1151073: AttributeInfo(1151073, 'coordinate_converter_input', 'ViInt32', enums.CoordinateConverterInput, True, 'read-write', False),
+    1151074: AttributeInfo(1151074, 'q_input_to_coord._converter', 'ViInt32', enums.QInputtoCoordConverter, True, 'read-write', False),
+    1151080: AttributeInfo(1151080, 'syncout_clk_select', 'ViInt32', enums.SyncoutCLKSelect, True, 'read-write', False),
+    1151120: AttributeInfo(1151120, 'timing_nco_phase_accum._load_on_update', 'ViBoolean', None, True, 'read-write', False),
+    1151121: AttributeInfo(1151121, 'timing_nco_clear_phase_accum.', 'ViBoolean', None, True, 'read-write', False),
+    1151122: AttributeInfo(1151122, 'timing_nco_enable_offset_freq.', 'ViBoolean', None, True, 'read-write', False),
+    1151123: AttributeInfo(1151123, 'timing_nco_freq._offset_bits', 'ViInt32', enums.TimingNCOFreqOffsetBits, True, 'read-write', False),
+    1151124: AttributeInfo(1151124, 'timing_nco_center_freq.', 'ViInt32', None, True, 'read-write', False),
+    1151125: AttributeInfo(1151125, 'timing_nco_phase_offset', 'ViInt32', None, True, 'read-write', False),
+    1151126: AttributeInfo(1151126, 'resampler_filter_mode', 'ViInt32', enums.ResamplerFilterMode, True, 'read-write', False),
+    1151127: AttributeInfo(1151127, 'resampler_bypass', 'ViBoolean', None, True, 'read-write', False),
+    1151128: AttributeInfo(1151128, 'resampler_output_pulse_delay', 'ViInt32', None, True, 'read-write', False),
+    1151129: AttributeInfo(1151129, 'resampler_nco_divide', 'ViInt32', None, True, 'read-write', False),
+    1151130: AttributeInfo(1151130, 'resampler_reference_divide', 'ViInt32', None, True, 'read-write', False),
+    1151300: AttributeInfo(1151300, 'enable_dither', 'ViBoolean', None, True, 'read-write', False),
+    1151301: AttributeInfo(1151301, 'combined_decimation', 'ViInt32', None, True, 'read only', False),
+    1151302: AttributeInfo(1151302, 'serial_dac_cal_voltage', 'ViReal64', None, False, 'read-write', False),
+    1151303: AttributeInfo(1151303, 'pll_lock_status', 'ViBoolean', None, False, 'read only', True),
+    1151304: AttributeInfo(1151304, 'delay_before_initiate', 'ViReal64', None, False, 'read-write', False),
+    1151305: AttributeInfo(1151305, 'ddc_direct_register_address', 'ViInt32', None, False, 'read-write', False),
+    1151306: AttributeInfo(1151306, 'ddc_direct_register_data', 'ViInt32', None, False, 'read-write', False),
+    1250001: AttributeInfo(1250001, 'vertical_range', 'ViReal64', None, True, 'read-write', False),
+    1250002: AttributeInfo(1250002, 'vertical_offset', 'ViReal64', None, True, 'read-write', False),
+    1250003: AttributeInfo(1250003, 'vertical_coupling', 'ViInt32', enums.VerticalCoupling, True, 'read-write', False),
+    1250004: AttributeInfo(1250004, 'probe_attenuation', 'ViReal64', None, True, 'read-write', False),
+    1250005: AttributeInfo(1250005, 'channel_enabled', 'ViBoolean', enums.BoolEnableDisableChan, True, 'read-write', False),
+    1250006: AttributeInfo(1250006, 'max_input_frequency', 'ViReal64', None, True, 'read-write', False),
+    1250007: AttributeInfo(1250007, 'horz_time_per_record', 'ViReal64', None, False, 'read-write', False),
+    1250008: AttributeInfo(1250008, 'horz_record_length', 'ViInt32', None, False, 'read only', False),
+    1250009: AttributeInfo(1250009, 'horz_min_num_pts', 'ViInt32', None, False, 'read-write', False),
+    1250010: AttributeInfo(1250010, 'horz_sample_rate', 'ViReal64', None, False, 'read only', False),
+    1250011: AttributeInfo(1250011, 'horz_record_ref_position', 'ViReal64', None, False, 'read-write', False),
+    1250012: AttributeInfo(1250012, 'trigger_type', 'ViInt32', enums.TriggerType, False, 'read-write', False),
+    1250013: AttributeInfo(1250013, 'trigger_source', 'ViString', None, False, 'read-write', False),
+    1250014: AttributeInfo(1250014, 'trigger_coupling', 'ViInt32', enums.TriggerCoupling, False, 'read-write', False),
+    1250015: AttributeInfo(1250015, 'trigger_delay_time', 'ViReal64', None, False, 'read-write', False),
+    1250016: AttributeInfo(1250016, 'trigger_holdoff', 'ViReal64', None, False, 'read-write', False),
+    1250017: AttributeInfo(1250017, 'trigger_level', 'ViReal64', None, False, 'read-write', False),
+    1250018: AttributeInfo(1250018, 'trigger_slope', 'ViInt32', enums.TriggerSlope, False, 'read-write', False),
+    1250101: AttributeInfo(1250101, 'acquisition_type', 'ViInt32', enums.AcquisitionType, False, 'read-write', False),
+    1250102: AttributeInfo(1250102, 'trigger_modifier', 'ViInt32', enums.TriggerModifier, False, 'read-write', False),
+    1250103: AttributeInfo(1250103, 'input_impedance', 'ViReal64', None, True, 'read-write', False),
+    1250106: AttributeInfo(1250106, 'sample_mode', 'ViInt32', None, False, 'read only', False),
+    1250109: AttributeInfo(1250109, 'acquisition_start_time', 'ViReal64', None, False, 'read-write', False),
+    1250201: AttributeInfo(1250201, 'tv_trigger_signal_format', 'ViInt32', enums.VideoSignalFormat, True, 'read-write', False),
+    1250204: AttributeInfo(1250204, 'tv_trigger_polarity', 'ViInt32', enums.VideoPolarity, False, 'read-write', False),
+    1250205: AttributeInfo(1250205, 'tv_trigger_event', 'ViInt32', enums.VideoTriggerEvent, False, 'read-write', False),
+    1250206: AttributeInfo(1250206, 'tv_trigger_line_number', 'ViInt32', None, False, 'read-write', False),
+}
+
+# Every attribute of NI-SCOPE, by python_name
+index_by_name = dict((a.python_name, a) for a in index.values())
+
+# ctypes type and conversion of the attribute types that _BulkAccessor can get and set
+_bulk_types = {
+    'ViBoolean': (visatype.ViBoolean, bool),
+    'ViInt32': (visatype.ViInt32, int),
+    'ViInt64': (visatype.ViInt64, int),
+    'ViReal64': (visatype.ViReal64, float),
+}
+
+# Session methods that get and set the attribute types that _BulkAccessor can't
+_accessor_methods = {
+    'ViString': ('_get_attribute_vi_string', '_set_attribute_vi_string'),
+}
+
+
+class _BulkAccessor(object):
+    '''Gets and sets attributes of one type, reusing the same ctypes objects for all of them'''
+
+    def __init__(self, session, attribute_type):
+        ctype, self.convert = _bulk_types[attribute_type]
+        self._session = session
+        self._get_function = getattr(session._library, 'niScope_GetAttribute' + attribute_type)
+        self._set_function = getattr(session._library, 'niScope_SetAttribute' + attribute_type)
+        self._vi_ctype = visatype.ViSession(session._vi)
+        self._attribute_id_ctype = visatype.ViAttr()
+        self._value_ctype = ctype()
+        self._value_reference = ctypes.pointer(self._value_ctype)
+
+    def get(self, attribute_id):
+        self._attribute_id_ctype.value = attribute_id
+        error_code = self._get_function(self._vi_ctype, self._session._repeated_capability_ctype, self._attribute_id_ctype, self._value_reference)
+        errors.handle_error(self._session, error_code, ignore_warnings=False, is_error_handling=False)
+        return self.convert(self._value_ctype.value)
+
+    def set(self, attribute_id, value):
+        self._attribute_id_ctype.value = attribute_id
+        self._value_ctype.value = value
+        error_code = self._set_function(self._vi_ctype, self._session._repeated_capability_ctype, self._attribute_id_ctype, self._value_ctype)
+        errors.handle_error(self._session, error_code, ignore_warnings=False, is_error_handling=False)
+
+
+class _MethodAccessor(object):
+    '''Gets and sets attributes of one type through the session methods, i.e. for strings'''
+
+    def __init__(self, session, attribute_type):
+        get_method, set_method = _accessor_methods[attribute_type]
+        self.get = getattr(session, get_method)
+        self.set = getattr(session, set_method)
+
+    def convert(self, value):
+        return value
+
+
+def _get_accessor(session, accessors, attribute_type):
+    accessor = accessors.get(attribute_type)
+    if accessor is None:
+        accessor = _BulkAccessor(session, attribute_type) if attribute_type in _bulk_types else _MethodAccessor(session, attribute_type)
+        accessors[attribute_type] = accessor
+    return accessor
+
+
+def get_values(session, infos, skip_errors=False):
+    '''Returns an OrderedDict of the values of the attributes in infos, by python_name
+
+    Uses and updates the attribute cache the same way the properties do. If skip_errors is True, attributes that the
+    driver returns an error for are left out instead of raising.
+    '''
+    cache = session._attribute_cache
+    repeated_capability = session._repeated_capability
+    accessors = {}
+    values = collections.OrderedDict()
+    for info in infos:
+        use_cache = cache.enabled and not info.volatile
+        cached = cache.values.get(info.attribute_id) if use_cache else None
+        if cached is not None and repeated_capability in cached:
+            value = cached[repeated_capability]
+        else:
+            try:
+                value = _get_accessor(session, accessors, info.type).get(info.attribute_id)
+            except errors.Error:
+                if skip_errors:
+                    continue
+                raise
+            if use_cache:
+                cache.values.setdefault(info.attribute_id, {})[repeated_capability] = value
+        values[info.python_name] = value if info.enum is None else enums._get_member(info.enum, value)
+    return values
+
+
+def set_values(session, infos_and_values):
+    '''Sets attributes from (info, value) pairs, in order
+
+    Values of enum attributes must be members of their enum. Updates the attribute cache the same way the properties do.
+    '''
+    cache = session._attribute_cache
+    accessors = {}
+    for info, value in infos_and_values:
+        if info.enum is not None:
+            if type(value) is not info.enum:
+                raise TypeError('{0} must be {1} not {2}'.format(info.python_name, info.enum.__name__, type(value).__name__))
+            value = value.value
+        accessor = _get_accessor(session, accessors, info.type)
+        accessor.set(info.attribute_id, value)
+        if cache.enabled and not info.volatile:
+            cache.values[info.attribute_id] = {session._repeated_capability: accessor.convert(value)}
+
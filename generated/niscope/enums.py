@@ -1,3 +1,4 @@
+# -*- coding: utf-8 -*-
 # This file was generated
 
 from enum import Enum
@@ -706,3 +707,61 @@ class VideoTriggerEvent(Enum):
     '''
     Trigger on a specific line of a video signal.  Valid values vary depending on the signal format configured.
     '''
+
+
+# Members of each enum by value. Looking a value from the driver up in these is much faster than calling the enum with it.
+_members_by_value = {
+    AGCAverageControl: dict((member.value, member) for member in AGCAverageControl),
+    AOUTParallelOutputSource: dict((member.value, member) for member in AOUTParallelOutputSource),
+    AcquisitionType: dict((member.value, member) for member in AcquisitionType),
+    AddressType: dict((member.value, member) for member in AddressType),
+    BOUTParallelOutputSource: dict((member.value, member) for member in BOUTParallelOutputSource),
+    BoolEnableDisable: dict((member.value, member) for member in BoolEnableDisable),
+    BoolEnableDisableChan: dict((member.value, member) for member in BoolEnableDisableChan),
+    BoolEnableDisableIQ: dict((member.value, member) for member in BoolEnableDisableIQ),
+    BoolEnableDisableRealtime: dict((member.value, member) for member in BoolEnableDisableRealtime),
+    BoolEnableDisableTIS: dict((member.value, member) for member in BoolEnableDisableTIS),
+    CoordinateConverterInput: dict((member.value, member) for member in CoordinateConverterInput),
+    DataJustificationMode: dict((member.value, member) for member in DataJustificationMode),
+    DataProcessingMode: dict((member.value, member) for member in DataProcessingMode),
+    DiscriminatorFIRInputSource: dict((member.value, member) for member in DiscriminatorFIRInputSource),
+    DiscriminatorFIRSymmetry: dict((member.value, member) for member in DiscriminatorFIRSymmetry),
+    DiscriminatorFIRSymmetryType: dict((member.value, member) for member in DiscriminatorFIRSymmetryType),
+    FIRFilterWindow: dict((member.value, member) for member in FIRFilterWindow),
+    FetchRelativeTo: dict((member.value, member) for member in FetchRelativeTo),
+    FilterType: dict((member.value, member) for member in FilterType),
+    FlexFIRAntialiasFilterType: dict((member.value, member) for member in FlexFIRAntialiasFilterType),
+    NotificationType: dict((member.value, member) for member in NotificationType),
+    OverflowErrorReporting: dict((member.value, member) for member in OverflowErrorReporting),
+    PercentageMethod: dict((member.value, member) for member in PercentageMethod),
+    ProgFIRFilterRealComplex: dict((member.value, member) for member in ProgFIRFilterRealComplex),
+    ProgFIRFilterSymmetry: dict((member.value, member) for member in ProgFIRFilterSymmetry),
+    ProgFIRFilterSymmetryType: dict((member.value, member) for member in ProgFIRFilterSymmetryType),
+    QInputtoCoordConverter: dict((member.value, member) for member in QInputtoCoordConverter),
+    RISMethod: dict((member.value, member) for member in RISMethod),
+    RefLevelUnits: dict((member.value, member) for member in RefLevelUnits),
+    RefTriggerDetectorLocation: dict((member.value, member) for member in RefTriggerDetectorLocation),
+    ResamplerFilterMode: dict((member.value, member) for member in ResamplerFilterMode),
+    StreamingPositionType: dict((member.value, member) for member in StreamingPositionType),
+    SyncoutCLKSelect: dict((member.value, member) for member in SyncoutCLKSelect),
+    TerminalConfiguration: dict((member.value, member) for member in TerminalConfiguration),
+    TimingNCOFreqOffsetBits: dict((member.value, member) for member in TimingNCOFreqOffsetBits),
+    TriggerCoupling: dict((member.value, member) for member in TriggerCoupling),
+    TriggerModifier: dict((member.value, member) for member in TriggerModifier),
+    TriggerSlope: dict((member.value, member) for member in TriggerSlope),
+    TriggerType: dict((member.value, member) for member in TriggerType),
+    TriggerWindowMode: dict((member.value, member) for member in TriggerWindowMode),
+    VerticalCoupling: dict((member.value, member) for member in VerticalCoupling),
+    VideoPolarity: dict((member.value, member) for member in VideoPolarity),
+    VideoSignalFormat: dict((member.value, member) for member in VideoSignalFormat),
+    VideoTriggerEvent: dict((member.value, member) for member in VideoTriggerEvent),
+}
+
+
+def _get_member(enum_type, value):
+    '''Returns the member of enum_type that has value, like enum_type(value)'''
+    try:
+        return _members_by_value[enum_type][value]
+    except KeyError:
+        # Raises ValueError, as the enum does for values it doesn't have
+        return enum_type(value)
@@ -1,13 +1,310 @@
 # -*- coding: utf-8 -*-
 # This file was generated
+import collections
 import ctypes
+import threading
 
+from niscope import _converters  # noqa: F401
+from niscope import _fetching
+from niscope import _streaming
 from niscope import attributes
+from niscope import call_stats
 from niscope import enums
 from niscope import errors
 from niscope import library_singleton
 from niscope import visatype
 
+from niscope import waveform_info  # noqa: F401
+
+# Size of the buffer that string IVI-dance methods try first, until they know the size they need
+_DEFAULT_IVI_DANCE_BUFFER_SIZE = 256
+
+# Size of the buffer that each string IVI-dance method needed last time, by C function name (and attribute ID). Shared
+# by all sessions.
+_ivi_dance_buffer_sizes = {}
+
+
+class _ScalarCtypes(threading.local):
+    '''ctypes objects for the scalar parameters of driver functions, which methods reuse instead of creating new ones on every call
+
+    Each thread has its own, so that calls on different threads don't share them.
+    '''
+
+    def __init__(self):
+        self.AcquisitionStatus_acquisition_status = visatype.ViInt32()
+        self.AcquisitionStatus_acquisition_status_pointer = ctypes.pointer(self.AcquisitionStatus_acquisition_status)
+        self.ActualMeasWfmSize_array_meas_function = visatype.ViInt32()
+        self.ActualMeasWfmSize_meas_waveform_size = visatype.ViInt32()
+        self.ActualMeasWfmSize_meas_waveform_size_pointer = ctypes.pointer(self.ActualMeasWfmSize_meas_waveform_size)
+        self.ActualNumWfms_num_wfms = visatype.ViInt32()
+        self.ActualNumWfms_num_wfms_pointer = ctypes.pointer(self.ActualNumWfms_num_wfms)
+        self.ActualRecordLength_record_length = visatype.ViInt32()
+        self.ActualRecordLength_record_length_pointer = ctypes.pointer(self.ActualRecordLength_record_length)
+        self.AddWaveformProcessing_meas_function = visatype.ViInt32()
+        self.AdjustSampleClockRelativeDelay_delay = visatype.ViReal64()
+        self.CalSelfCalibrate_option = visatype.ViInt32()
+        self.CheckAttributeViBoolean_attribute_id = visatype.ViAttr()
+        self.CheckAttributeViBoolean_value = visatype.ViBoolean()
+        self.CheckAttributeViInt32_attribute_id = visatype.ViAttr()
+        self.CheckAttributeViInt32_value = visatype.ViInt32()
+        self.CheckAttributeViInt64_attribute_id = visatype.ViAttr()
+        self.CheckAttributeViInt64_value = visatype.ViInt64()
+        self.CheckAttributeViReal64_attribute_id = visatype.ViAttr()
+        self.CheckAttributeViReal64_value = visatype.ViReal64()
+        self.CheckAttributeViSession_attribute_id = visatype.ViAttr()
+        self.CheckAttributeViString_attribute_id = visatype.ViAttr()
+        self.ClearWaveformMeasurementStats_clearable_measurement_function = visatype.ViInt32()
+        self.ConfigureAcquisitionRecord_acquisition_start_time = visatype.ViReal64()
+        self.ConfigureAcquisitionRecord_min_num_points = visatype.ViInt32()
+        self.ConfigureAcquisitionRecord_time_per_record = visatype.ViReal64()
+        self.ConfigureAcquisition_acquisition_type = visatype.ViInt32()
+        self.ConfigureChanCharacteristics_input_impedance = visatype.ViReal64()
+        self.ConfigureChanCharacteristics_max_input_frequency = visatype.ViReal64()
+        self.ConfigureChannel_coupling = visatype.ViInt32()
+        self.ConfigureChannel_enabled = visatype.ViBoolean()
+        self.ConfigureChannel_offset = visatype.ViReal64()
+        self.ConfigureChannel_probe_attenuation = visatype.ViReal64()
+        self.ConfigureChannel_range = visatype.ViReal64()
+        self.ConfigureClock_master_enabled = visatype.ViBoolean()
+        self.ConfigureEdgeTriggerSource_level = visatype.ViReal64()
+        self.ConfigureEdgeTriggerSource_slope = visatype.ViInt32()
+        self.ConfigureEqualizationFilterCoefficients_number_of_coefficients = visatype.ViInt32()
+        self.ConfigureHorizontalTiming_enforce_realtime = visatype.ViBoolean()
+        self.ConfigureHorizontalTiming_min_num_pts = visatype.ViInt32()
+        self.ConfigureHorizontalTiming_min_sample_rate = visatype.ViReal64()
+        self.ConfigureHorizontalTiming_num_records = visatype.ViInt32()
+        self.ConfigureHorizontalTiming_ref_position = visatype.ViReal64()
+        self.ConfigureRefLevels_high = visatype.ViReal64()
+        self.ConfigureRefLevels_low = visatype.ViReal64()
+        self.ConfigureRefLevels_mid = visatype.ViReal64()
+        self.ConfigureTVTriggerLineNumber_line_number = visatype.ViInt32()
+        self.ConfigureTVTriggerSource_event = visatype.ViInt32()
+        self.ConfigureTVTriggerSource_polarity = visatype.ViInt32()
+        self.ConfigureTVTriggerSource_signal_format = visatype.ViInt32()
+        self.ConfigureTriggerCoupling_coupling = visatype.ViInt32()
+        self.ConfigureTriggerDigital_delay = visatype.ViReal64()
+        self.ConfigureTriggerDigital_holdoff = visatype.ViReal64()
+        self.ConfigureTriggerDigital_slope = visatype.ViInt32()
+        self.ConfigureTriggerEdge_delay = visatype.ViReal64()
+        self.ConfigureTriggerEdge_holdoff = visatype.ViReal64()
+        self.ConfigureTriggerEdge_level = visatype.ViReal64()
+        self.ConfigureTriggerEdge_slope = visatype.ViInt32()
+        self.ConfigureTriggerEdge_trigger_coupling = visatype.ViInt32()
+        self.ConfigureTriggerHysteresis_delay = visatype.ViReal64()
+        self.ConfigureTriggerHysteresis_holdoff = visatype.ViReal64()
+        self.ConfigureTriggerHysteresis_hysteresis = visatype.ViReal64()
+        self.ConfigureTriggerHysteresis_level = visatype.ViReal64()
+        self.ConfigureTriggerHysteresis_slope = visatype.ViInt32()
+        self.ConfigureTriggerHysteresis_trigger_coupling = visatype.ViInt32()
+        self.ConfigureTriggerOutput_trigger_event = visatype.ViInt32()
+        self.ConfigureTriggerSoftware_delay = visatype.ViReal64()
+        self.ConfigureTriggerSoftware_holdoff = visatype.ViReal64()
+        self.ConfigureTriggerVideo_delay = visatype.ViReal64()
+        self.ConfigureTriggerVideo_enable_dc_restore = visatype.ViBoolean()
+        self.ConfigureTriggerVideo_event = visatype.ViInt32()
+        self.ConfigureTriggerVideo_holdoff = visatype.ViReal64()
+        self.ConfigureTriggerVideo_line_number = visatype.ViInt32()
+        self.ConfigureTriggerVideo_polarity = visatype.ViInt32()
+        self.ConfigureTriggerVideo_signal_format = visatype.ViInt32()
+        self.ConfigureTriggerVideo_trigger_coupling = visatype.ViInt32()
+        self.ConfigureTriggerWindow_delay = visatype.ViReal64()
+        self.ConfigureTriggerWindow_high_level = visatype.ViReal64()
+        self.ConfigureTriggerWindow_holdoff = visatype.ViReal64()
+        self.ConfigureTriggerWindow_low_level = visatype.ViReal64()
+        self.ConfigureTriggerWindow_trigger_coupling = visatype.ViInt32()
+        self.ConfigureTriggerWindow_window_mode = visatype.ViInt32()
+        self.ConfigureTrigger_holdoff = visatype.ViReal64()
+        self.ConfigureTrigger_trigger_type = visatype.ViInt32()
+        self.ConfigureVertical_coupling = visatype.ViInt32()
+        self.ConfigureVertical_enabled = visatype.ViBoolean()
+        self.ConfigureVertical_offset = visatype.ViReal64()
+        self.ConfigureVertical_probe_attenuation = visatype.ViReal64()
+        self.ConfigureVertical_range = visatype.ViReal64()
+        self.ExportSignal_signal = visatype.ViInt32()
+        self.FetchBinary16_num_samples = visatype.ViInt32()
+        self.FetchBinary16_timeout = visatype.ViReal64()
+        self.FetchBinary32_num_samples = visatype.ViInt32()
+        self.FetchBinary32_timeout = visatype.ViReal64()
+        self.FetchBinary8_num_samples = visatype.ViInt32()
+        self.FetchBinary8_timeout = visatype.ViReal64()
+        self.FetchMeasurementStats_scalar_meas_function = visatype.ViInt32()
+        self.FetchMeasurementStats_timeout = visatype.ViReal64()
+        self.FetchMeasurement_scalar_meas_function = visatype.ViInt32()
+        self.FetchMeasurement_timeout = visatype.ViReal64()
+        self.FetchWaveformMeasurement_meas_function = visatype.ViInt32()
+        self.FetchWaveformMeasurement_measurement = visatype.ViReal64()
+        self.FetchWaveformMeasurement_measurement_pointer = ctypes.pointer(self.FetchWaveformMeasurement_measurement)
+        self.FetchWaveform_actual_points = visatype.ViInt32()
+        self.FetchWaveform_actual_points_pointer = ctypes.pointer(self.FetchWaveform_actual_points)
+        self.FetchWaveform_initial_x = visatype.ViReal64()
+        self.FetchWaveform_initial_x_pointer = ctypes.pointer(self.FetchWaveform_initial_x)
+        self.FetchWaveform_x_increment = visatype.ViReal64()
+        self.FetchWaveform_x_increment_pointer = ctypes.pointer(self.FetchWaveform_x_increment)
+        self.Fetch_num_samples = visatype.ViInt32()
+        self.Fetch_timeout = visatype.ViReal64()
+        self.GetAttributeViBoolean_attribute_id = visatype.ViAttr()
+        self.GetAttributeViBoolean_value = visatype.ViBoolean()
+        self.GetAttributeViBoolean_value_pointer = ctypes.pointer(self.GetAttributeViBoolean_value)
+        self.GetAttributeViInt32_attribute_id = visatype.ViAttr()
+        self.GetAttributeViInt32_value = visatype.ViInt32()
+        self.GetAttributeViInt32_value_pointer = ctypes.pointer(self.GetAttributeViInt32_value)
+        self.GetAttributeViInt64_attribute_id = visatype.ViAttr()
+        self.GetAttributeViInt64_value = visatype.ViInt64()
+        self.GetAttributeViInt64_value_pointer = ctypes.pointer(self.GetAttributeViInt64_value)
+        self.GetAttributeViReal64_attribute_id = visatype.ViAttr()
+        self.GetAttributeViReal64_value = visatype.ViReal64()
+        self.GetAttributeViReal64_value_pointer = ctypes.pointer(self.GetAttributeViReal64_value)
+        self.GetAttributeViString_attribute_id = visatype.ViAttr()
+        self.GetChannelName_buffer_size = visatype.ViInt32()
+        self.GetChannelName_index = visatype.ViInt32()
+        self.GetEqualizationFilterCoefficients_number_of_coefficients = visatype.ViInt32()
+        self.GetErrorMessage_buffer__size = visatype.ViInt32()
+        self.GetErrorMessage_error_code = visatype.ViStatus()
+        self.GetError_error_code = visatype.ViStatus()
+        self.GetError_error_code_pointer = ctypes.pointer(self.GetError_error_code)
+        self.GetFrequencyResponse_buffer_size = visatype.ViInt32()
+        self.GetFrequencyResponse_number_of_frequencies = visatype.ViInt32()
+        self.GetFrequencyResponse_number_of_frequencies_pointer = ctypes.pointer(self.GetFrequencyResponse_number_of_frequencies)
+        self.GetStreamEndpointHandle_writer_handle = visatype.ViUInt32()
+        self.GetStreamEndpointHandle_writer_handle_pointer = ctypes.pointer(self.GetStreamEndpointHandle_writer_handle)
+        self.InitWithOptions_id_query = visatype.ViBoolean()
+        self.InitWithOptions_reset_device = visatype.ViBoolean()
+        self.InitWithOptions_vi = visatype.ViSession()
+        self.InitWithOptions_vi_pointer = ctypes.pointer(self.InitWithOptions_vi)
+        self.IsDeviceReady_device_ready = visatype.ViBoolean()
+        self.IsDeviceReady_device_ready_pointer = ctypes.pointer(self.IsDeviceReady_device_ready)
+        self.IsInvalidWfmElement_element_value = visatype.ViReal64()
+        self.IsInvalidWfmElement_is_invalid = visatype.ViBoolean()
+        self.IsInvalidWfmElement_is_invalid_pointer = ctypes.pointer(self.IsInvalidWfmElement_is_invalid)
+        self.ReadMeasurement_scalar_meas_function = visatype.ViInt32()
+        self.ReadMeasurement_timeout = visatype.ViReal64()
+        self.ReadWaveformMeasurement_max_time = visatype.ViInt32()
+        self.ReadWaveformMeasurement_meas_function = visatype.ViInt32()
+        self.ReadWaveformMeasurement_measurement = visatype.ViReal64()
+        self.ReadWaveformMeasurement_measurement_pointer = ctypes.pointer(self.ReadWaveformMeasurement_measurement)
+        self.ReadWaveform_actual_points = visatype.ViInt32()
+        self.ReadWaveform_actual_points_pointer = ctypes.pointer(self.ReadWaveform_actual_points)
+        self.ReadWaveform_initial_x = visatype.ViReal64()
+        self.ReadWaveform_initial_x_pointer = ctypes.pointer(self.ReadWaveform_initial_x)
+        self.ReadWaveform_max_time = visatype.ViInt32()
+        self.ReadWaveform_x_increment = visatype.ViReal64()
+        self.ReadWaveform_x_increment_pointer = ctypes.pointer(self.ReadWaveform_x_increment)
+        self.SampleRate_sample_rate = visatype.ViReal64()
+        self.SampleRate_sample_rate_pointer = ctypes.pointer(self.SampleRate_sample_rate)
+        self.SendSoftwareTriggerEdge_which_trigger = visatype.ViInt32()
+        self.SetAttributeViBoolean_attribute_id = visatype.ViAttr()
+        self.SetAttributeViBoolean_value = visatype.ViBoolean()
+        self.SetAttributeViInt32_attribute_id = visatype.ViAttr()
+        self.SetAttributeViInt32_value = visatype.ViInt32()
+        self.SetAttributeViInt64_attribute_id = visatype.ViAttr()
+        self.SetAttributeViInt64_value = visatype.ViInt64()
+        self.SetAttributeViReal64_attribute_id = visatype.ViAttr()
+        self.SetAttributeViReal64_value = visatype.ViReal64()
+        self.SetAttributeViString_attribute_id = visatype.ViAttr()
+        self.errorHandler_error_code = visatype.ViInt32()
+        self.self_test_self_test_result = visatype.ViInt16()
+        self.self_test_self_test_result_pointer = ctypes.pointer(self.self_test_self_test_result)
+
+
+_scalar_ctypes = _ScalarCtypes()
+
+# C function that each method calls, for call_stats
+_c_functions = {
+    '_abort': 'niScope_Abort',
+    '_close': 'niScope_close',
+    '_fetch': 'niScope_Fetch',
+    '_fetch_binary16': 'niScope_FetchBinary16',
+    '_fetch_binary16_into': 'niScope_FetchBinary16',
+    '_fetch_binary32': 'niScope_FetchBinary32',
+    '_fetch_binary32_into': 'niScope_FetchBinary32',
+    '_fetch_binary8': 'niScope_FetchBinary8',
+    '_fetch_binary8_into': 'niScope_FetchBinary8',
+    '_fetch_into': 'niScope_Fetch',
+    '_get_attribute_vi_boolean': 'niScope_GetAttributeViBoolean',
+    '_get_attribute_vi_int32': 'niScope_GetAttributeViInt32',
+    '_get_attribute_vi_int64': 'niScope_GetAttributeViInt64',
+    '_get_attribute_vi_real64': 'niScope_GetAttributeViReal64',
+    '_get_attribute_vi_string': 'niScope_GetAttributeViString',
+    '_get_error': 'niScope_GetError',
+    '_init_with_options': 'niScope_InitWithOptions',
+    '_initiate_acquisition': 'niScope_InitiateAcquisition',
+    '_set_attribute_vi_boolean': 'niScope_SetAttributeViBoolean',
+    '_set_attribute_vi_int32': 'niScope_SetAttributeViInt32',
+    '_set_attribute_vi_int64': 'niScope_SetAttributeViInt64',
+    '_set_attribute_vi_real64': 'niScope_SetAttributeViReal64',
+    '_set_attribute_vi_string': 'niScope_SetAttributeViString',
+    'acquisition_status': 'niScope_AcquisitionStatus',
+    'actual_meas_wfm_size': 'niScope_ActualMeasWfmSize',
+    'actual_num_wfms': 'niScope_ActualNumWfms',
+    'actual_record_length': 'niScope_ActualRecordLength',
+    'add_waveform_processing': 'niScope_AddWaveformProcessing',
+    'adjust_sample_clock_relative_delay': 'niScope_AdjustSampleClockRelativeDelay',
+    'auto_setup': 'niScope_AutoSetup',
+    'cal_self_calibrate': 'niScope_CalSelfCalibrate',
+    'check_attribute_vi_boolean': 'niScope_CheckAttributeViBoolean',
+    'check_attribute_vi_int32': 'niScope_CheckAttributeViInt32',
+    'check_attribute_vi_int64': 'niScope_CheckAttributeViInt64',
+    'check_attribute_vi_real64': 'niScope_CheckAttributeViReal64',
+    'check_attribute_vi_session': 'niScope_CheckAttributeViSession',
+    'check_attribute_vi_string': 'niScope_CheckAttributeViString',
+    'clear_waveform_measurement_stats': 'niScope_ClearWaveformMeasurementStats',
+    'clear_waveform_processing': 'niScope_ClearWaveformProcessing',
+    'commit': 'niScope_Commit',
+    'configure_acquisition': 'niScope_ConfigureAcquisition',
+    'configure_acquisition_record': 'niScope_ConfigureAcquisitionRecord',
+    'configure_chan_characteristics': 'niScope_ConfigureChanCharacteristics',
+    'configure_channel': 'niScope_ConfigureChannel',
+    'configure_clock': 'niScope_ConfigureClock',
+    'configure_edge_trigger_source': 'niScope_ConfigureEdgeTriggerSource',
+    'configure_equalization_filter_coefficients': 'niScope_ConfigureEqualizationFilterCoefficients',
+    'configure_horizontal_timing': 'niScope_ConfigureHorizontalTiming',
+    'configure_ref_levels': 'niScope_ConfigureRefLevels',
+    'configure_trigger': 'niScope_ConfigureTrigger',
+    'configure_trigger_coupling': 'niScope_ConfigureTriggerCoupling',
+    'configure_trigger_digital': 'niScope_ConfigureTriggerDigital',
+    'configure_trigger_edge': 'niScope_ConfigureTriggerEdge',
+    'configure_trigger_hysteresis': 'niScope_ConfigureTriggerHysteresis',
+    'configure_trigger_immediate': 'niScope_ConfigureTriggerImmediate',
+    'configure_trigger_output': 'niScope_ConfigureTriggerOutput',
+    'configure_trigger_software': 'niScope_ConfigureTriggerSoftware',
+    'configure_trigger_video': 'niScope_ConfigureTriggerVideo',
+    'configure_trigger_window': 'niScope_ConfigureTriggerWindow',
+    'configure_tv_trigger_line_number': 'niScope_ConfigureTVTriggerLineNumber',
+    'configure_tv_trigger_source': 'niScope_ConfigureTVTriggerSource',
+    'configure_vertical': 'niScope_ConfigureVertical',
+    'disable': 'niScope_Disable',
+    'error_handler': 'niScope_errorHandler',
+    'export_signal': 'niScope_ExportSignal',
+    'fetch_measurement': 'niScope_FetchMeasurement',
+    'fetch_measurement_stats': 'niScope_FetchMeasurementStats',
+    'fetch_waveform': 'niScope_FetchWaveform',
+    'fetch_waveform_into': 'niScope_FetchWaveform',
+    'fetch_waveform_measurement': 'niScope_FetchWaveformMeasurement',
+    'get_channel_name': 'niScope_GetChannelName',
+    'get_equalization_filter_coefficients': 'niScope_GetEqualizationFilterCoefficients',
+    'get_error_message': 'niScope_GetErrorMessage',
+    'get_frequency_response': 'niScope_GetFrequencyResponse',
+    'get_stream_endpoint_handle': 'niScope_GetStreamEndpointHandle',
+    'is_device_ready': 'niScope_IsDeviceReady',
+    'is_invalid_wfm_element': 'niScope_IsInvalidWfmElement',
+    'probe_compensation_signal_start': 'niScope_ProbeCompensationSignalStart',
+    'probe_compensation_signal_stop': 'niScope_ProbeCompensationSignalStop',
+    'read_measurement': 'niScope_ReadMeasurement',
+    'read_waveform': 'niScope_ReadWaveform',
+    'read_waveform_into': 'niScope_ReadWaveform',
+    'read_waveform_measurement': 'niScope_ReadWaveformMeasurement',
+    'reset': 'niScope_reset',
+    'reset_device': 'niScope_ResetDevice',
+    'reset_with_defaults': 'niScope_ResetWithDefaults',
+    'sample_rate': 'niScope_SampleRate',
+    'self_test': 'niScope_self_test',
+    'send_software_trigger_edge': 'niScope_SendSoftwareTriggerEdge',
+    'send_sw_trigger': 'niScope_SendSWTrigger',
+}
+
+# Maximum number of repeated capability views (i.e. session['0']) that a session keeps to return again
+_MAX_REPEATED_CAPABILITY_VIEWS = 256
+
 
 class _Acquisition(object):
     def __init__(self, session):
@@ -127,7 +424,7 @@ class _SessionBase(object):
     '''
     Specifies the source the digitizer monitors for an arm reference trigger.   When the arm reference trigger is received, the digitizer begins looking for a  reference (stop) trigger from the user-configured trigger source.
     '''
-    backlog = attributes.AttributeViReal64(1150084)
+    backlog = attributes.AttributeViReal64(1150084, volatile=True)
     '''
     Returns the number of samples (NISCOPE_ATTR_POINTS_DONE) that have been acquired but not fetched  for the record specified by NISCOPE_ATTR_FETCH_RECORD_NUMBER.
     '''
@@ -298,7 +595,7 @@ class _SessionBase(object):
     '''
     Indicates the device number associated with the current session.
     '''
-    device_temperature = attributes.AttributeViReal64(1150086)
+    device_temperature = attributes.AttributeViReal64(1150086, volatile=True)
     '''
     Returns the temperature of the device in degrees Celsius from the onboard sensor.
     '''
@@ -953,11 +1250,11 @@ class _SessionBase(object):
     Disabled (2)
     Default Value: Warning
     '''
-    pll_lock_status = attributes.AttributeViBoolean(1151303)
+    pll_lock_status = attributes.AttributeViBoolean(1151303, volatile=True)
     '''
     If TRUE, the PLL has remained locked to the external reference clock since it was last checked. If FALSE,  the PLL has become unlocked from the external reference clock since it was last checked.
     '''
-    points_done = attributes.AttributeViReal64(1150082)
+    points_done = attributes.AttributeViReal64(1150082, volatile=True)
     '''
     Actual number of samples acquired in the record specified by NISCOPE_ATTR_FETCH_RECORD_NUMBER from the NISCOPE_ATTR_FETCH_RELATIVE_TO and NISCOPE_ATTR_FETCH_OFFSET attributes.
     '''
@@ -1000,7 +1297,7 @@ class _SessionBase(object):
     Specifies the destination for the Ready for Start Event.   When this event is asserted, the digitizer is ready to receive a start trigger.
     Consult your device documentation for a specific list of valid destinations.
     '''
-    records_done = attributes.AttributeViInt32(1150083)
+    records_done = attributes.AttributeViInt32(1150083, volatile=True)
     '''
     Specifies the number of records that have been completely acquired.
     '''
@@ -1136,7 +1433,7 @@ class _SessionBase(object):
     '''
     A string that contains a comma-separated list of the instrument model numbers supported by this driver.
     '''
-    trigger_auto_triggered = attributes.AttributeViBoolean(1150278)
+    trigger_auto_triggered = attributes.AttributeViBoolean(1150278, volatile=True)
     '''
     Specifies if the last acquisition was auto triggered.   You can use the Auto Triggered attribute to find out if the last acquisition was triggered.
     '''
@@ -1307,37 +1604,129 @@ class _SessionBase(object):
         var = session['0,1'].vertical_range
     '''
 
-    def __init__(self, repeated_capability):
-        self._library = library_singleton.get()
+    def __init__(self, repeated_capability, attribute_cache, library, warning_policy, session_stats):
+        self._library = library
         self._repeated_capability = repeated_capability
+        self._attribute_cache = attribute_cache
+        self._warning_policy = warning_policy
+        self._session_stats = session_stats
         self._encoding = 'windows-1251'
+        # The driver does not modify it, so every call can pass the same buffer
+        self._repeated_capability_ctype = ctypes.create_string_buffer(repeated_capability.encode(self._encoding))
+        session_stats._add_session(self)
 
     def __setattr__(self, key, value):
-        if self._is_frozen and key not in dir(self):
+        if self._is_frozen and key not in self._get_attribute_names() and key not in self.__dict__:
             raise AttributeError("'{0}' object has no attribute '{1}'".format(type(self).__name__, key))
         object.__setattr__(self, key, value)
 
+    @property
+    def warning_policy(self):
+        '''warning_policy
+
+        How the session, and its repeated capabilities, report warnings from the driver. Change its mode to warn only
+        once per code, at most once per interval, or only count warnings:
+
+            session.warning_policy.mode = 'count'
+            ...
+            print(session.warning_policy.counts)
+
+        See errors.WarningPolicy.
+        '''
+        return self._warning_policy
+
+    @classmethod
+    def _get_attribute_names(cls):
+        '''_get_attribute_names
+
+        Returns a frozenset of the names of the properties and methods of the class, which can be set once the session
+        is frozen. It is computed once per class, because dir() is too slow to call every time a property is set.
+        '''
+        names = cls.__dict__.get('_attribute_names')
+        if names is None:
+            names = frozenset(dir(cls))
+            cls._attribute_names = names
+        return names
+
+    def _get_attribute_info(self, name_or_id):
+        try:
+            # type(u'') is unicode on Python 2
+            if isinstance(name_or_id, (str, type(u''))):
+                return attributes.index_by_name[name_or_id]
+            return attributes.index[name_or_id]
+        except KeyError:
+            raise ValueError('{0!r} is not an attribute of NI-SCOPE'.format(name_or_id))
+
+    def get_attributes(self, names_or_ids, channels=None):
+        '''get_attributes
+
+        Gets the values of many attributes in one call. It creates the ctypes objects once for each type of attribute,
+        instead of once for each attribute like the properties do.
+
+        Args:
+            names_or_ids (list of str or int): Python names (i.e. '_5102_adjust_pretrigger_samples') or IDs of the attributes
+
+            channels (str): Repeated capabilities (usually channels) to get the attributes for. If not specified, uses the
+                ones of this object, like the properties do.
+
+        Returns:
+            values (collections.OrderedDict): Value of each attribute, by Python name, in the same order as names_or_ids
+        '''
+        session = self if channels is None else _RepeatedCapability(self._vi, channels, self._attribute_cache, self._library, self._warning_policy, self._session_stats)
+        return attributes.get_values(session, [self._get_attribute_info(a) for a in names_or_ids])
+
+    def snapshot(self):
+        '''snapshot
+
+        Gets the values of all the read-write attributes, to restore them later with apply(). Attributes that the driver
+        returns an error for (i.e. not supported by the device) and volatile attributes are left out.
+
+        Use it on a repeated capability (i.e. session['0'].snapshot()) to get the values of specific channels.
+
+        Returns:
+            values (collections.OrderedDict): Value of each attribute, by Python name
+        '''
+        infos = [a for a in sorted(attributes.index.values()) if a.access == 'read-write' and not a.volatile]
+        return attributes.get_values(self, infos, skip_errors=True)
+
+    def apply(self, values):
+        '''apply
+
+        Sets many attributes, i.e. from snapshot(), in order. It first gets the values of the attributes, and only sets
+        the ones that are different.
+
+        Args:
+            values (dict): Value of each attribute, by Python name or ID. Values of enum attributes must be members of
+                their enum.
+
+        Returns:
+            names (list of str): Python names of the attributes that were set
+        '''
+        infos_and_values = [(self._get_attribute_info(a), v) for a, v in values.items()]
+        current_values = attributes.get_values(self, [info for info, _ in infos_and_values if info.access != 'write only'], skip_errors=True)
+        changes = [(info, v) for info, v in infos_and_values if info.python_name not in current_values or current_values[info.python_name] != v]
+        attributes.set_values(self, changes)
+        return [info.python_name for info, _ in changes]
+
+    def _set_attributes(self, values):
+        '''Sets attributes from (Python name or ID, value) pairs, in order, without getting them first like apply() does'''
+        attributes.set_values(self, [(self._get_attribute_info(a), v) for a, v in values])
+
     def _get_error_description(self, error_code):
         '''_get_error_description
 
         Returns the error description.
+
+        errors retrieves the description of warnings only when it is used, so the last error of the session may be another
+        one by then.
         '''
         try:
-            _, error_string = self._get_error()
-            return error_string
+            last_error_code, error_string = self._get_error()
+            if last_error_code == error_code:
+                return error_string
         except errors.Error:
             pass
-
-        try:
-            '''
-            It is expected for _get_error to raise when the session is invalid
-            (IVI spec requires GetError to fail).
-            Use _error_message instead. It doesn't require a session.
-            '''
-            error_string = self._error_message(error_code)
-            return error_string
-        except errors.Error:
-            return "Failed to retrieve error description."
+        return "Failed to retrieve error description."
 
     ''' These are code-generated '''
 
@@ -1360,10 +1749,10 @@ class _SessionBase(object):
                 operating in DDC mode (NI 5620/5621 only), this value is multiplied by
                 two.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        num_wfms_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niScope_ActualNumWfms(vi_ctype, channel_list_ctype, ctypes.pointer(num_wfms_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        num_wfms_ctype = _scalar_ctypes.ActualNumWfms_num_wfms  # case 13
+        error_code = self._library.niScope_ActualNumWfms(vi_ctype, channel_list_ctype, _scalar_ctypes.ActualNumWfms_num_wfms_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(num_wfms_ctype.value)
 
@@ -1393,9 +1782,10 @@ class _SessionBase(object):
                 measurement <REPLACE_DRIVER_SPECIFIC_URL_2(array_measurements_refs)>`__
                 to add.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        meas_function_ctype = visatype.ViInt32(meas_function)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        meas_function_ctype = _scalar_ctypes.AddWaveformProcessing_meas_function
+        meas_function_ctype.value = meas_function  # case 8
         error_code = self._library.niScope_AddWaveformProcessing(vi_ctype, channel_list_ctype, meas_function_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1430,9 +1820,10 @@ class _SessionBase(object):
                 operation or NISCOPE_VAL_CAL_RESTORE_EXTERNAL_CALIBRATION to
                 restore the previous calibration.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        option_ctype = visatype.ViInt32(option)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        option_ctype = _scalar_ctypes.CalSelfCalibrate_option
+        option_ctype.value = option  # case 8
         error_code = self._library.niScope_CalSelfCalibrate(vi_ctype, channel_list_ctype, option_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1456,10 +1847,12 @@ class _SessionBase(object):
                 not be valid depending on the current settings of the instrument
                 session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        value_ctype = visatype.ViBoolean(value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.CheckAttributeViBoolean_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        value_ctype = _scalar_ctypes.CheckAttributeViBoolean_value
+        value_ctype.value = value  # case 8
         error_code = self._library.niScope_CheckAttributeViBoolean(vi_ctype, channel_list_ctype, attribute_id_ctype, value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1483,10 +1876,12 @@ class _SessionBase(object):
                 not be valid depending on the current settings of the instrument
                 session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        value_ctype = visatype.ViInt32(value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.CheckAttributeViInt32_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        value_ctype = _scalar_ctypes.CheckAttributeViInt32_value
+        value_ctype.value = value  # case 8
         error_code = self._library.niScope_CheckAttributeViInt32(vi_ctype, channel_list_ctype, attribute_id_ctype, value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1510,10 +1905,12 @@ class _SessionBase(object):
                 not be valid depending on the current settings of the instrument
                 session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        value_ctype = visatype.ViInt64(value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.CheckAttributeViInt64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        value_ctype = _scalar_ctypes.CheckAttributeViInt64_value
+        value_ctype.value = value  # case 8
         error_code = self._library.niScope_CheckAttributeViInt64(vi_ctype, channel_list_ctype, attribute_id_ctype, value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1537,10 +1934,12 @@ class _SessionBase(object):
                 not be valid depending on the current settings of the instrument
                 session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        value_ctype = visatype.ViReal64(value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.CheckAttributeViReal64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        value_ctype = _scalar_ctypes.CheckAttributeViReal64_value
+        value_ctype.value = value  # case 8
         error_code = self._library.niScope_CheckAttributeViReal64(vi_ctype, channel_list_ctype, attribute_id_ctype, value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1561,10 +1960,11 @@ class _SessionBase(object):
         Args:
             attribute_id (int): The ID of an attribute.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        value_ctype = visatype.ViSession(self._value)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.CheckAttributeViSession_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        value_ctype = self._value_ctype  # case 1
         error_code = self._library.niScope_CheckAttributeViSession(vi_ctype, channel_list_ctype, attribute_id_ctype, value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1588,10 +1988,11 @@ class _SessionBase(object):
                 not be valid depending on the current settings of the instrument
                 session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        value_ctype = ctypes.create_string_buffer(value.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.CheckAttributeViString_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        value_ctype = value.encode(self._encoding)  # case 3
         error_code = self._library.niScope_CheckAttributeViString(vi_ctype, channel_list_ctype, attribute_id_ctype, value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1625,9 +2026,10 @@ class _SessionBase(object):
                 measurement <REPLACE_DRIVER_SPECIFIC_URL_2(array_measurements_refs)>`__
                 to clear the stats for.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        clearable_measurement_function_ctype = visatype.ViInt32(clearable_measurement_function)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        clearable_measurement_function_ctype = _scalar_ctypes.ClearWaveformMeasurementStats_clearable_measurement_function
+        clearable_measurement_function_ctype.value = clearable_measurement_function  # case 8
         error_code = self._library.niScope_ClearWaveformMeasurementStats(vi_ctype, channel_list_ctype, clearable_measurement_function_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1650,8 +2052,8 @@ class _SessionBase(object):
 
             session['0,1'].clear_waveform_processing()
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
         error_code = self._library.niScope_ClearWaveformProcessing(vi_ctype, channel_list_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1678,12 +2080,15 @@ class _SessionBase(object):
                 value to use the hardware default bandwidth. Pass –1 for this value to
                 achieve full bandwidth.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        input_impedance_ctype = visatype.ViReal64(input_impedance)  # case 8
-        max_input_frequency_ctype = visatype.ViReal64(max_input_frequency)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        input_impedance_ctype = _scalar_ctypes.ConfigureChanCharacteristics_input_impedance
+        input_impedance_ctype.value = input_impedance  # case 8
+        max_input_frequency_ctype = _scalar_ctypes.ConfigureChanCharacteristics_max_input_frequency
+        max_input_frequency_ctype.value = max_input_frequency  # case 8
         error_code = self._library.niScope_ConfigureChanCharacteristics(vi_ctype, channel_list_ctype, input_impedance_ctype, max_input_frequency_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_equalization_filter_coefficients(self, number_of_coefficients, coefficients):
@@ -1713,12 +2118,14 @@ class _SessionBase(object):
                 `EQUALIZATION_FILTER_ENABLED <cviNISCOPE_ATTR_EQUALIZATION_FILTER_ENABLED.html>`__
                 attribute must be set to TRUE to enable the filter.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        number_of_coefficients_ctype = visatype.ViInt32(number_of_coefficients)  # case 8
-        coefficients_ctype = (visatype.ViReal64 * len(coefficients))(*coefficients)  # case 4
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        number_of_coefficients_ctype = _scalar_ctypes.ConfigureEqualizationFilterCoefficients_number_of_coefficients
+        number_of_coefficients_ctype.value = number_of_coefficients  # case 8
+        coefficients_ctype = _converters.convert_to_ctypes_array(coefficients, visatype.ViReal64)  # case 4
         error_code = self._library.niScope_ConfigureEqualizationFilterCoefficients(vi_ctype, channel_list_ctype, number_of_coefficients_ctype, coefficients_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_vertical(self, range, offset, coupling, probe_attenuation, enabled):
@@ -1748,15 +2155,757 @@ class _SessionBase(object):
             enabled (bool): Specifies whether the channel is enabled for acquisition. Refer to
                 CHANNEL_ENABLED for more information.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        range_ctype = visatype.ViReal64(range)  # case 8
-        offset_ctype = visatype.ViReal64(offset)  # case 8
-        coupling_ctype = visatype.ViInt32(coupling)  # case 8
-        probe_attenuation_ctype = visatype.ViReal64(probe_attenuation)  # case 8
-        enabled_ctype = visatype.ViBoolean(enabled)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        range_ctype = _scalar_ctypes.ConfigureVertical_range
+        range_ctype.value = range  # case 8
+        offset_ctype = _scalar_ctypes.ConfigureVertical_offset
+        offset_ctype.value = offset  # case 8
+        coupling_ctype = _scalar_ctypes.ConfigureVertical_coupling
+        coupling_ctype.value = coupling  # case 8
+        probe_attenuation_ctype = _scalar_ctypes.ConfigureVertical_probe_attenuation
+        probe_attenuation_ctype.value = probe_attenuation  # case 8
+        enabled_ctype = _scalar_ctypes.ConfigureVertical_enabled
+        enabled_ctype.value = enabled  # case 8
         error_code = self._library.niScope_ConfigureVertical(vi_ctype, channel_list_ctype, range_ctype, offset_ctype, coupling_ctype, probe_attenuation_ctype, enabled_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
+        return
+
+    def _fetch(self, timeout, num_samples):
+        '''_fetch
+
+        Returns the waveform from a previously initiated acquisition that the
+        digitizer acquires for the specified channel. This function returns
+        scaled voltage waveforms.
+
+        This function may return multiple waveforms depending on the number of
+        channels, the acquisition type, and the number of records you specify.
+
+        Note:
+        You can use Read instead of this function. Read
+        starts an acquisition on all enabled channels, waits for the acquisition
+        to complete, and returns the waveform for the specified channel.
+
+        Some functionality, such as time stamping, is not supported in all
+        digitizers. Refer to `Features Supported by
+        Device <REPLACE_DRIVER_SPECIFIC_URL_1(features_supported_main)>`__ for
+        more information.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session['0,1']._fetch(timeout, num_samples)
+
+        Args:
+            timeout (float): The time to wait in seconds for data to be acquired; using 0 for this
+                parameter tells NI-SCOPE to fetch whatever is currently available. Using
+                -1 for this parameter implies infinite timeout.
+            num_samples (int): The maximum number of samples to fetch for each waveform. If the
+                acquisition finishes with fewer points than requested, some devices
+                return partial data if the acquisition finished, was aborted, or a
+                timeout of 0 was used. If it fails to complete within the timeout
+                period, the function returns an error.
+
+        Returns:
+            wfm (list of float): Returns an array whose length is the **numSamples** times number of
+                waveforms. Call ActualNumwfms to determine the number of
+                waveforms.
+
+                NI-SCOPE returns this data sequentially, so all record 0 waveforms are
+                first. For example, with a channel list of 0,1, you would have the
+                following index values:
+
+                index 0 = record 0, channel 0
+
+                index *x* = record 0, channel 1
+
+                index 2\ *x* = record 1, channel 0
+
+                index 3\ *x* = record 1, channel 1
+
+                Where *x* = the record length
+            wfm_info (list of WaveformInfo): Returns an array of structures with the following timing and scaling
+                information about each waveform:
+
+                -  **relativeInitialX**—the time (in seconds) from the trigger to the
+                   first sample in the fetched waveform
+                -  **absoluteInitialX**—timestamp (in seconds) of the first fetched
+                   sample. This timestamp is comparable between records and
+                   acquisitions; devices that do not support this parameter use 0 for
+                   this output.
+                -  **xIncrement**—the time between points in the acquired waveform in
+                   seconds
+                -  **actualSamples**—the actual number of samples fetched and placed in
+                   the waveform array
+                -  **gain**—the gain factor of the given channel; useful for scaling
+                   binary data with the following formula:
+
+                voltage = binary data × gain factor + offset
+
+                -  **offset**—the offset factor of the given channel; useful for scaling
+                   binary data with the following formula:
+
+                voltage = binary data × gain factor + offset
+
+                Call actual_num_wfms to determine the size of this array.
+        '''
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        timeout_ctype = _scalar_ctypes.Fetch_timeout
+        timeout_ctype.value = timeout  # case 8
+        num_samples_ctype = _scalar_ctypes.Fetch_num_samples
+        num_samples_ctype.value = num_samples  # case 8
+        wfm_ctype = (visatype.ViReal64 * (num_samples * self.actual_num_wfms()))()  # case 15
+        wfm_info_ctype = (waveform_info.niScope_wfmInfo * (self.actual_num_wfms()))()  # case 15
+        error_code = self._library.niScope_Fetch(vi_ctype, channel_list_ctype, timeout_ctype, num_samples_ctype, wfm_ctype, wfm_info_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return [float(wfm_ctype[i]) for i in range(len(wfm_ctype))], [waveform_info.WaveformInfo(wfm_info_ctype[i]) for i in range(len(wfm_info_ctype))]
+
+    def _fetch_into(self, timeout, num_samples, wfm, wfm_info):
+        '''_fetch_into
+
+        Same as _fetch, but the driver writes **wfm**, **wfm_info** directly into a buffer you allocate, such as a numpy.ndarray or array.array. Nothing is copied and no list is created.
+
+
+        Returns the waveform from a previously initiated acquisition that the
+        digitizer acquires for the specified channel. This function returns
+        scaled voltage waveforms.
+
+        This function may return multiple waveforms depending on the number of
+        channels, the acquisition type, and the number of records you specify.
+
+        Note:
+        You can use Read instead of this function. Read
+        starts an acquisition on all enabled channels, waits for the acquisition
+        to complete, and returns the waveform for the specified channel.
+
+        Some functionality, such as time stamping, is not supported in all
+        digitizers. Refer to `Features Supported by
+        Device <REPLACE_DRIVER_SPECIFIC_URL_1(features_supported_main)>`__ for
+        more information.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session['0,1']._fetch_into(timeout, num_samples, wfm, wfm_info)
+
+        Args:
+            timeout (float): The time to wait in seconds for data to be acquired; using 0 for this
+                parameter tells NI-SCOPE to fetch whatever is currently available. Using
+                -1 for this parameter implies infinite timeout.
+            num_samples (int): The maximum number of samples to fetch for each waveform. If the
+                acquisition finishes with fewer points than requested, some devices
+                return partial data if the acquisition finished, was aborted, or a
+                timeout of 0 was used. If it fails to complete within the timeout
+                period, the function returns an error.
+            wfm (writable buffer of float): Returns an array whose length is the **numSamples** times number of
+                waveforms. Call ActualNumwfms to determine the number of
+                waveforms.
+
+                NI-SCOPE returns this data sequentially, so all record 0 waveforms are
+                first. For example, with a channel list of 0,1, you would have the
+                following index values:
+
+                index 0 = record 0, channel 0
+
+                index *x* = record 0, channel 1
+
+                index 2\ *x* = record 1, channel 0
+
+                index 3\ *x* = record 1, channel 1
+
+                Where *x* = the record length
+            wfm_info (writable buffer of WaveformInfo): Returns an array of structures with the following timing and scaling
+                information about each waveform:
+
+                -  **relativeInitialX**—the time (in seconds) from the trigger to the
+                   first sample in the fetched waveform
+                -  **absoluteInitialX**—timestamp (in seconds) of the first fetched
+                   sample. This timestamp is comparable between records and
+                   acquisitions; devices that do not support this parameter use 0 for
+                   this output.
+                -  **xIncrement**—the time between points in the acquired waveform in
+                   seconds
+                -  **actualSamples**—the actual number of samples fetched and placed in
+                   the waveform array
+                -  **gain**—the gain factor of the given channel; useful for scaling
+                   binary data with the following formula:
+
+                voltage = binary data × gain factor + offset
+
+                -  **offset**—the offset factor of the given channel; useful for scaling
+                   binary data with the following formula:
+
+                voltage = binary data × gain factor + offset
+
+                Call actual_num_wfms to determine the size of this array.
+        '''
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        timeout_ctype = _scalar_ctypes.Fetch_timeout
+        timeout_ctype.value = timeout  # case 8
+        num_samples_ctype = _scalar_ctypes.Fetch_num_samples
+        num_samples_ctype.value = num_samples  # case 8
+        wfm_ctype = _converters.get_ctypes_array_for_buffer(wfm, visatype.ViReal64, 'wfm', num_samples * self.actual_num_wfms())  # case 14
+        wfm_info_ctype = _converters.get_ctypes_array_for_buffer(wfm_info, waveform_info.niScope_wfmInfo, 'wfm_info', self.actual_num_wfms())  # case 14
+        error_code = self._library.niScope_Fetch(vi_ctype, channel_list_ctype, timeout_ctype, num_samples_ctype, wfm_ctype, wfm_info_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def _fetch_binary16(self, timeout, num_samples):
+        '''_fetch_binary16
+
+        Retrieves data from a previously initiated acquisition and returns
+        binary 16-bit waveforms. This function may return multiple waveforms
+        depending on the number of channels, the acquisition type, and the
+        number of records you specify.
+
+        Refer to `Using Fetch
+        Functions <REPLACE_DRIVER_SPECIFIC_URL_1(using_fetch_functions)>`__ for
+        more information on using this function.
+
+        Note:
+        Some functionality, such as time stamping, is not supported in all
+        digitizers. Refer to `Features Supported by
+        Device <REPLACE_DRIVER_SPECIFIC_URL_1(features_supported_main)>`__ for
+        more information.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session['0,1']._fetch_binary16(timeout, num_samples)
+
+        Args:
+            timeout (float): The time to wait in seconds for data to be acquired; using 0 for this
+                parameter tells NI-SCOPE to fetch whatever is currently available. Using
+                -1 for this parameter implies infinite timeout.
+            num_samples (int): The maximum number of samples to fetch for each waveform. If the
+                acquisition finishes with fewer points than requested, some devices
+                return partial data if the acquisition finished, was aborted, or a
+                timeout of 0 was used. If it fails to complete within the timeout
+                period, the function returns an error.
+
+        Returns:
+            wfm (list of int): Returns an array whose length is the **numSamples** times number of
+                waveforms. Call ActualNumwfms to determine the number of
+                waveforms.
+
+                NI-SCOPE returns this data sequentially, so all record 0 waveforms are
+                first. For example, with a channel list of 0,1, you would have the
+                following index values:
+
+                index 0 = record 0, channel 0
+
+                index *x* = record 0, channel 1
+
+                index 2\ *x* = record 1, channel 0
+
+                index 3\ *x* = record 1, channel 1
+
+                Where *x* = the record length
+            wfm_info (list of WaveformInfo): Returns an array of structures with the following timing and scaling
+                information about each waveform:
+
+                -  **relativeInitialX**—the time (in seconds) from the trigger to the
+                   first sample in the fetched waveform
+                -  **absoluteInitialX**—timestamp (in seconds) of the first fetched
+                   sample. This timestamp is comparable between records and
+                   acquisitions; devices that do not support this parameter use 0 for
+                   this output.
+                -  **xIncrement**—the time between points in the acquired waveform in
+                   seconds
+                -  **actualSamples**—the actual number of samples fetched and placed in
+                   the waveform array
+                -  **gain**—the gain factor of the given channel; useful for scaling
+                   binary data with the following formula:
+
+                voltage = binary data × gain factor + offset
+
+                -  **offset**—the offset factor of the given channel; useful for scaling
+                   binary data with the following formula:
+
+                voltage = binary data × gain factor + offset
+
+                Call actual_num_wfms to determine the size of this array.
+        '''
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        timeout_ctype = _scalar_ctypes.FetchBinary16_timeout
+        timeout_ctype.value = timeout  # case 8
+        num_samples_ctype = _scalar_ctypes.FetchBinary16_num_samples
+        num_samples_ctype.value = num_samples  # case 8
+        wfm_ctype = (visatype.ViInt16 * (num_samples * self.actual_num_wfms()))()  # case 15
+        wfm_info_ctype = (waveform_info.niScope_wfmInfo * (self.actual_num_wfms()))()  # case 15
+        error_code = self._library.niScope_FetchBinary16(vi_ctype, channel_list_ctype, timeout_ctype, num_samples_ctype, wfm_ctype, wfm_info_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return [int(wfm_ctype[i]) for i in range(len(wfm_ctype))], [waveform_info.WaveformInfo(wfm_info_ctype[i]) for i in range(len(wfm_info_ctype))]
+
+    def _fetch_binary16_into(self, timeout, num_samples, wfm, wfm_info):
+        '''_fetch_binary16_into
+
+        Same as _fetch_binary16, but the driver writes **wfm**, **wfm_info** directly into a buffer you allocate, such as a numpy.ndarray or array.array. Nothing is copied and no list is created.
+
+
+        Retrieves data from a previously initiated acquisition and returns
+        binary 16-bit waveforms. This function may return multiple waveforms
+        depending on the number of channels, the acquisition type, and the
+        number of records you specify.
+
+        Refer to `Using Fetch
+        Functions <REPLACE_DRIVER_SPECIFIC_URL_1(using_fetch_functions)>`__ for
+        more information on using this function.
+
+        Note:
+        Some functionality, such as time stamping, is not supported in all
+        digitizers. Refer to `Features Supported by
+        Device <REPLACE_DRIVER_SPECIFIC_URL_1(features_supported_main)>`__ for
+        more information.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session['0,1']._fetch_binary16_into(timeout, num_samples, wfm, wfm_info)
+
+        Args:
+            timeout (float): The time to wait in seconds for data to be acquired; using 0 for this
+                parameter tells NI-SCOPE to fetch whatever is currently available. Using
+                -1 for this parameter implies infinite timeout.
+            num_samples (int): The maximum number of samples to fetch for each waveform. If the
+                acquisition finishes with fewer points than requested, some devices
+                return partial data if the acquisition finished, was aborted, or a
+                timeout of 0 was used. If it fails to complete within the timeout
+                period, the function returns an error.
+            wfm (writable buffer of int): Returns an array whose length is the **numSamples** times number of
+                waveforms. Call ActualNumwfms to determine the number of
+                waveforms.
+
+                NI-SCOPE returns this data sequentially, so all record 0 waveforms are
+                first. For example, with a channel list of 0,1, you would have the
+                following index values:
+
+                index 0 = record 0, channel 0
+
+                index *x* = record 0, channel 1
+
+                index 2\ *x* = record 1, channel 0
+
+                index 3\ *x* = record 1, channel 1
+
+                Where *x* = the record length
+            wfm_info (writable buffer of WaveformInfo): Returns an array of structures with the following timing and scaling
+                information about each waveform:
+
+                -  **relativeInitialX**—the time (in seconds) from the trigger to the
+                   first sample in the fetched waveform
+                -  **absoluteInitialX**—timestamp (in seconds) of the first fetched
+                   sample. This timestamp is comparable between records and
+                   acquisitions; devices that do not support this parameter use 0 for
+                   this output.
+                -  **xIncrement**—the time between points in the acquired waveform in
+                   seconds
+                -  **actualSamples**—the actual number of samples fetched and placed in
+                   the waveform array
+                -  **gain**—the gain factor of the given channel; useful for scaling
+                   binary data with the following formula:
+
+                voltage = binary data × gain factor + offset
+
+                -  **offset**—the offset factor of the given channel; useful for scaling
+                   binary data with the following formula:
+
+                voltage = binary data × gain factor + offset
+
+                Call actual_num_wfms to determine the size of this array.
+        '''
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        timeout_ctype = _scalar_ctypes.FetchBinary16_timeout
+        timeout_ctype.value = timeout  # case 8
+        num_samples_ctype = _scalar_ctypes.FetchBinary16_num_samples
+        num_samples_ctype.value = num_samples  # case 8
+        wfm_ctype = _converters.get_ctypes_array_for_buffer(wfm, visatype.ViInt16, 'wfm', num_samples * self.actual_num_wfms())  # case 14
+        wfm_info_ctype = _converters.get_ctypes_array_for_buffer(wfm_info, waveform_info.niScope_wfmInfo, 'wfm_info', self.actual_num_wfms())  # case 14
+        error_code = self._library.niScope_FetchBinary16(vi_ctype, channel_list_ctype, timeout_ctype, num_samples_ctype, wfm_ctype, wfm_info_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def _fetch_binary32(self, timeout, num_samples):
+        '''_fetch_binary32
+
+        Retrieves data from a previously initiated acquisition and returns
+        binary 32-bit waveforms. This function may return multiple waveforms
+        depending on the number of channels, the acquisition type, and the
+        number of records you specify.
+
+        Refer to `Using Fetch
+        Functions <REPLACE_DRIVER_SPECIFIC_URL_1(using_fetch_functions)>`__ for
+        more information on using this function.
+
+        Note:
+        Some functionality, such as time stamping, is not supported in all
+        digitizers. Refer to `Features Supported by
+        Device <REPLACE_DRIVER_SPECIFIC_URL_1(features_supported_main)>`__ for
+        more information.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session['0,1']._fetch_binary32(timeout, num_samples)
+
+        Args:
+            timeout (float): The time to wait in seconds for data to be acquired; using 0 for this
+                parameter tells NI-SCOPE to fetch whatever is currently available. Using
+                -1 for this parameter implies infinite timeout.
+            num_samples (int): The maximum number of samples to fetch for each waveform. If the
+                acquisition finishes with fewer points than requested, some devices
+                return partial data if the acquisition finished, was aborted, or a
+                timeout of 0 was used. If it fails to complete within the timeout
+                period, the function returns an error.
+
+        Returns:
+            wfm (list of int): Returns an array whose length is the **numSamples** times number of
+                waveforms. Call ActualNumwfms to determine the number of
+                waveforms.
+
+                NI-SCOPE returns this data sequentially, so all record 0 waveforms are
+                first. For example, with a channel list of 0,1, you would have the
+                following index values:
+
+                index 0 = record 0, channel 0
+
+                index *x* = record 0, channel 1
+
+                index 2\ *x* = record 1, channel 0
+
+                index 3\ *x* = record 1, channel 1
+
+                Where *x* = the record length
+            wfm_info (list of WaveformInfo): Returns an array of structures with the following timing and scaling
+                information about each waveform:
+
+                -  **relativeInitialX**—the time (in seconds) from the trigger to the
+                   first sample in the fetched waveform
+                -  **absoluteInitialX**—timestamp (in seconds) of the first fetched
+                   sample. This timestamp is comparable between records and
+                   acquisitions; devices that do not support this parameter use 0 for
+                   this output.
+                -  **xIncrement**—the time between points in the acquired waveform in
+                   seconds
+                -  **actualSamples**—the actual number of samples fetched and placed in
+                   the waveform array
+                -  **gain**—the gain factor of the given channel; useful for scaling
+                   binary data with the following formula:
+
+                voltage = binary data × gain factor + offset
+
+                -  **offset**—the offset factor of the given channel; useful for scaling
+                   binary data with the following formula:
+
+                voltage = binary data × gain factor + offset
+
+                Call actual_num_wfms to determine the size of this array.
+        '''
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        timeout_ctype = _scalar_ctypes.FetchBinary32_timeout
+        timeout_ctype.value = timeout  # case 8
+        num_samples_ctype = _scalar_ctypes.FetchBinary32_num_samples
+        num_samples_ctype.value = num_samples  # case 8
+        wfm_ctype = (visatype.ViInt32 * (num_samples * self.actual_num_wfms()))()  # case 15
+        wfm_info_ctype = (waveform_info.niScope_wfmInfo * (self.actual_num_wfms()))()  # case 15
+        error_code = self._library.niScope_FetchBinary32(vi_ctype, channel_list_ctype, timeout_ctype, num_samples_ctype, wfm_ctype, wfm_info_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return [int(wfm_ctype[i]) for i in range(len(wfm_ctype))], [waveform_info.WaveformInfo(wfm_info_ctype[i]) for i in range(len(wfm_info_ctype))]
+
+    def _fetch_binary32_into(self, timeout, num_samples, wfm, wfm_info):
+        '''_fetch_binary32_into
+
+        Same as _fetch_binary32, but the driver writes **wfm**, **wfm_info** directly into a buffer you allocate, such as a numpy.ndarray or array.array. Nothing is copied and no list is created.
+
+
+        Retrieves data from a previously initiated acquisition and returns
+        binary 32-bit waveforms. This function may return multiple waveforms
+        depending on the number of channels, the acquisition type, and the
+        number of records you specify.
+
+        Refer to `Using Fetch
+        Functions <REPLACE_DRIVER_SPECIFIC_URL_1(using_fetch_functions)>`__ for
+        more information on using this function.
+
+        Note:
+        Some functionality, such as time stamping, is not supported in all
+        digitizers. Refer to `Features Supported by
+        Device <REPLACE_DRIVER_SPECIFIC_URL_1(features_supported_main)>`__ for
+        more information.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session['0,1']._fetch_binary32_into(timeout, num_samples, wfm, wfm_info)
+
+        Args:
+            timeout (float): The time to wait in seconds for data to be acquired; using 0 for this
+                parameter tells NI-SCOPE to fetch whatever is currently available. Using
+                -1 for this parameter implies infinite timeout.
+            num_samples (int): The maximum number of samples to fetch for each waveform. If the
+                acquisition finishes with fewer points than requested, some devices
+                return partial data if the acquisition finished, was aborted, or a
+                timeout of 0 was used. If it fails to complete within the timeout
+                period, the function returns an error.
+            wfm (writable buffer of int): Returns an array whose length is the **numSamples** times number of
+                waveforms. Call ActualNumwfms to determine the number of
+                waveforms.
+
+                NI-SCOPE returns this data sequentially, so all record 0 waveforms are
+                first. For example, with a channel list of 0,1, you would have the
+                following index values:
+
+                index 0 = record 0, channel 0
+
+                index *x* = record 0, channel 1
+
+                index 2\ *x* = record 1, channel 0
+
+                index 3\ *x* = record 1, channel 1
+
+                Where *x* = the record length
+            wfm_info (writable buffer of WaveformInfo): Returns an array of structures with the following timing and scaling
+                information about each waveform:
+
+                -  **relativeInitialX**—the time (in seconds) from the trigger to the
+                   first sample in the fetched waveform
+                -  **absoluteInitialX**—timestamp (in seconds) of the first fetched
+                   sample. This timestamp is comparable between records and
+                   acquisitions; devices that do not support this parameter use 0 for
+                   this output.
+                -  **xIncrement**—the time between points in the acquired waveform in
+                   seconds
+                -  **actualSamples**—the actual number of samples fetched and placed in
+                   the waveform array
+                -  **gain**—the gain factor of the given channel; useful for scaling
+                   binary data with the following formula:
+
+                voltage = binary data × gain factor + offset
+
+                -  **offset**—the offset factor of the given channel; useful for scaling
+                   binary data with the following formula:
+
+                voltage = binary data × gain factor + offset
+
+                Call actual_num_wfms to determine the size of this array.
+        '''
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        timeout_ctype = _scalar_ctypes.FetchBinary32_timeout
+        timeout_ctype.value = timeout  # case 8
+        num_samples_ctype = _scalar_ctypes.FetchBinary32_num_samples
+        num_samples_ctype.value = num_samples  # case 8
+        wfm_ctype = _converters.get_ctypes_array_for_buffer(wfm, visatype.ViInt32, 'wfm', num_samples * self.actual_num_wfms())  # case 14
+        wfm_info_ctype = _converters.get_ctypes_array_for_buffer(wfm_info, waveform_info.niScope_wfmInfo, 'wfm_info', self.actual_num_wfms())  # case 14
+        error_code = self._library.niScope_FetchBinary32(vi_ctype, channel_list_ctype, timeout_ctype, num_samples_ctype, wfm_ctype, wfm_info_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return
+
+    def _fetch_binary8(self, timeout, num_samples):
+        '''_fetch_binary8
+
+        Retrieves data from a previously initiated acquisition and returns
+        binary 8-bit waveforms. This function may return multiple waveforms
+        depending on the number of channels, the acquisition type, and the
+        number of records you specify.
+
+        Refer to `Using Fetch
+        Functions <REPLACE_DRIVER_SPECIFIC_URL_1(using_fetch_functions)>`__ for
+        more information on using this function.
+
+        Note:
+        Some functionality, such as time stamping, is not supported in all
+        digitizers. Refer to `Features Supported by
+        Device <REPLACE_DRIVER_SPECIFIC_URL_1(features_supported_main)>`__ for
+        more information.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session['0,1']._fetch_binary8(timeout, num_samples)
+
+        Args:
+            timeout (float): The time to wait in seconds for data to be acquired; using 0 for this
+                parameter tells NI-SCOPE to fetch whatever is currently available. Using
+                -1 for this parameter implies infinite timeout.
+            num_samples (int): The maximum number of samples to fetch for each waveform. If the
+                acquisition finishes with fewer points than requested, some devices
+                return partial data if the acquisition finished, was aborted, or a
+                timeout of 0 was used. If it fails to complete within the timeout
+                period, the function returns an error.
+
+        Returns:
+            wfm (list of int): Returns an array whose length is the **numSamples** times number of
+                waveforms. Call ActualNumwfms to determine the number of
+                waveforms.
+
+                NI-SCOPE returns this data sequentially, so all record 0 waveforms are
+                first. For example, with a channel list of 0,1, you would have the
+                following index values:
+
+                index 0 = record 0, channel 0
+
+                index *x* = record 0, channel 1
+
+                index 2\ *x* = record 1, channel 0
+
+                index 3\ *x* = record 1, channel 1
+
+                Where *x* = the record length
+            wfm_info (list of WaveformInfo): Returns an array of structures with the following timing and scaling
+                information about each waveform:
+
+                -  **relativeInitialX**—the time (in seconds) from the trigger to the
+                   first sample in the fetched waveform
+                -  **absoluteInitialX**—timestamp (in seconds) of the first fetched
+                   sample. This timestamp is comparable between records and
+                   acquisitions; devices that do not support this parameter use 0 for
+                   this output.
+                -  **xIncrement**—the time between points in the acquired waveform in
+                   seconds
+                -  **actualSamples**—the actual number of samples fetched and placed in
+                   the waveform array
+                -  **gain**—the gain factor of the given channel; useful for scaling
+                   binary data with the following formula:
+
+                voltage = binary data × gain factor + offset
+
+                -  **offset**—the offset factor of the given channel; useful for scaling
+                   binary data with the following formula:
+
+                voltage = binary data × gain factor + offset
+
+                Call actual_num_wfms to determine the size of this array.
+        '''
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        timeout_ctype = _scalar_ctypes.FetchBinary8_timeout
+        timeout_ctype.value = timeout  # case 8
+        num_samples_ctype = _scalar_ctypes.FetchBinary8_num_samples
+        num_samples_ctype.value = num_samples  # case 8
+        wfm_ctype = (visatype.ViInt8 * (num_samples * self.actual_num_wfms()))()  # case 15
+        wfm_info_ctype = (waveform_info.niScope_wfmInfo * (self.actual_num_wfms()))()  # case 15
+        error_code = self._library.niScope_FetchBinary8(vi_ctype, channel_list_ctype, timeout_ctype, num_samples_ctype, wfm_ctype, wfm_info_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return [int(wfm_ctype[i]) for i in range(len(wfm_ctype))], [waveform_info.WaveformInfo(wfm_info_ctype[i]) for i in range(len(wfm_info_ctype))]
+
+    def _fetch_binary8_into(self, timeout, num_samples, wfm, wfm_info):
+        '''_fetch_binary8_into
+
+        Same as _fetch_binary8, but the driver writes **wfm**, **wfm_info** directly into a buffer you allocate, such as a numpy.ndarray or array.array. Nothing is copied and no list is created.
+
+
+        Retrieves data from a previously initiated acquisition and returns
+        binary 8-bit waveforms. This function may return multiple waveforms
+        depending on the number of channels, the acquisition type, and the
+        number of records you specify.
+
+        Refer to `Using Fetch
+        Functions <REPLACE_DRIVER_SPECIFIC_URL_1(using_fetch_functions)>`__ for
+        more information on using this function.
+
+        Note:
+        Some functionality, such as time stamping, is not supported in all
+        digitizers. Refer to `Features Supported by
+        Device <REPLACE_DRIVER_SPECIFIC_URL_1(features_supported_main)>`__ for
+        more information.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session['0,1']._fetch_binary8_into(timeout, num_samples, wfm, wfm_info)
+
+        Args:
+            timeout (float): The time to wait in seconds for data to be acquired; using 0 for this
+                parameter tells NI-SCOPE to fetch whatever is currently available. Using
+                -1 for this parameter implies infinite timeout.
+            num_samples (int): The maximum number of samples to fetch for each waveform. If the
+                acquisition finishes with fewer points than requested, some devices
+                return partial data if the acquisition finished, was aborted, or a
+                timeout of 0 was used. If it fails to complete within the timeout
+                period, the function returns an error.
+            wfm (writable buffer of int): Returns an array whose length is the **numSamples** times number of
+                waveforms. Call ActualNumwfms to determine the number of
+                waveforms.
+
+                NI-SCOPE returns this data sequentially, so all record 0 waveforms are
+                first. For example, with a channel list of 0,1, you would have the
+                following index values:
+
+                index 0 = record 0, channel 0
+
+                index *x* = record 0, channel 1
+
+                index 2\ *x* = record 1, channel 0
+
+                index 3\ *x* = record 1, channel 1
+
+                Where *x* = the record length
+            wfm_info (writable buffer of WaveformInfo): Returns an array of structures with the following timing and scaling
+                information about each waveform:
+
+                -  **relativeInitialX**—the time (in seconds) from the trigger to the
+                   first sample in the fetched waveform
+                -  **absoluteInitialX**—timestamp (in seconds) of the first fetched
+                   sample. This timestamp is comparable between records and
+                   acquisitions; devices that do not support this parameter use 0 for
+                   this output.
+                -  **xIncrement**—the time between points in the acquired waveform in
+                   seconds
+                -  **actualSamples**—the actual number of samples fetched and placed in
+                   the waveform array
+                -  **gain**—the gain factor of the given channel; useful for scaling
+                   binary data with the following formula:
+
+                voltage = binary data × gain factor + offset
+
+                -  **offset**—the offset factor of the given channel; useful for scaling
+                   binary data with the following formula:
+
+                voltage = binary data × gain factor + offset
+
+                Call actual_num_wfms to determine the size of this array.
+        '''
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        timeout_ctype = _scalar_ctypes.FetchBinary8_timeout
+        timeout_ctype.value = timeout  # case 8
+        num_samples_ctype = _scalar_ctypes.FetchBinary8_num_samples
+        num_samples_ctype.value = num_samples  # case 8
+        wfm_ctype = _converters.get_ctypes_array_for_buffer(wfm, visatype.ViInt8, 'wfm', num_samples * self.actual_num_wfms())  # case 14
+        wfm_info_ctype = _converters.get_ctypes_array_for_buffer(wfm_info, waveform_info.niScope_wfmInfo, 'wfm_info', self.actual_num_wfms())  # case 14
+        error_code = self._library.niScope_FetchBinary8(vi_ctype, channel_list_ctype, timeout_ctype, num_samples_ctype, wfm_ctype, wfm_info_ctype)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
     def fetch_measurement(self, timeout, scalar_meas_function):
@@ -1794,10 +2943,12 @@ class _SessionBase(object):
             result (list of float): Contains an array of all measurements acquired; call
                 actual_num_wfms to determine the array length.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        timeout_ctype = visatype.ViReal64(timeout)  # case 8
-        scalar_meas_function_ctype = visatype.ViInt32(scalar_meas_function)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        timeout_ctype = _scalar_ctypes.FetchMeasurement_timeout
+        timeout_ctype.value = timeout  # case 8
+        scalar_meas_function_ctype = _scalar_ctypes.FetchMeasurement_scalar_meas_function
+        scalar_meas_function_ctype.value = scalar_meas_function  # case 8
         result_ctype = (visatype.ViReal64 * 1)()  # case 10
         error_code = self._library.niScope_FetchMeasurement(vi_ctype, channel_list_ctype, timeout_ctype, scalar_meas_function_ctype, result_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
@@ -1860,10 +3011,12 @@ class _SessionBase(object):
             num_in_stats (list of int): Returns the number of times fetch_measurement_stats has been
                 called.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        timeout_ctype = visatype.ViReal64(timeout)  # case 8
-        scalar_meas_function_ctype = visatype.ViInt32(scalar_meas_function)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        timeout_ctype = _scalar_ctypes.FetchMeasurementStats_timeout
+        timeout_ctype.value = timeout  # case 8
+        scalar_meas_function_ctype = _scalar_ctypes.FetchMeasurementStats_scalar_meas_function
+        scalar_meas_function_ctype.value = scalar_meas_function  # case 8
         result_ctype = (visatype.ViReal64 * 1)()  # case 10
         mean_ctype = (visatype.ViReal64 * 1)()  # case 10
         stdev_ctype = (visatype.ViReal64 * 1)()  # case 10
@@ -1874,6 +3027,73 @@ class _SessionBase(object):
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return [float(result_ctype[i]) for i in range(1)], [float(mean_ctype[i]) for i in range(1)], [float(stdev_ctype[i]) for i in range(1)], [float(min_ctype[i]) for i in range(1)], [float(max_ctype[i]) for i in range(1)], [int(num_in_stats_ctype[i]) for i in range(1)]
 
+    def fetch_records(self, num_samples=-1, record_number=0, num_records=-1, timeout=5.0):
+        '''fetch_records
+
+        Fetches a range of records of every channel with a single call into the driver.
+
+        Returns a tuple of (waveforms, wfm_info):
+
+        -  **waveforms** is a C-contiguous numpy.ndarray of numpy.float64 with shape (channels, records, samples)
+        -  **wfm_info** is a numpy structured array with shape (channels, records) and fields absolute_initial_x,
+           relative_initial_x, x_increment, actual_samples, offset and gain, for each waveform in **waveforms**
+
+        Samples past actual_samples in a record are not valid.
+
+        Note:
+        This method requires numpy. It sets fetch_record_number and fetch_num_records. The samples of each record
+        are fetched from fetch_offset, relative to fetch_relative_to, which it leaves as they are.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session['0,1'].fetch_records(num_samples=-1, record_number=0, num_records=-1, timeout=5.0)
+
+        Args:
+            num_samples (int): Number of samples to fetch for each record. Use -1 to fetch horz_record_length samples.
+            record_number (int): Zero-based index of the first record to fetch.
+            num_records (int): Number of records to fetch. Use -1 to fetch all records from **record_number** to the last configured record.
+            timeout (float): The time to wait in seconds for data to be acquired; using 0 fetches whatever is currently available. Using -1 implies infinite timeout.
+        '''
+        return _fetching.fetch_records(self, num_samples, record_number, num_records, timeout)
+
+    def fetch_records_binary(self, num_samples=-1, record_number=0, num_records=-1, timeout=5.0):
+        '''fetch_records_binary
+
+        Same as fetch_records(), but fetches the raw, unscaled samples with the binary fetch function that matches
+        binary_sample_width, so the samples take 1, 2 or 4 bytes each instead of 8.
+
+        Returns a BinaryWaveforms object with:
+
+        -  **samples**: C-contiguous numpy.ndarray of numpy.int8, numpy.int16 or numpy.int32 with shape
+           (channels, records, samples). Use samples.tofile() to write them to disk at their native width.
+        -  **wfm_info**: numpy structured array with shape (channels, records), as returned by fetch_records()
+        -  **scaled**: view of **samples** in volts (voltage = sample × gain + offset). Nothing is converted until
+           it is indexed, and then only the selected samples are, i.e. waveforms.scaled[0, 10, :1000]
+
+        Note:
+        This method requires numpy. It sets fetch_record_number and fetch_num_records. The samples of each record
+        are fetched from fetch_offset, relative to fetch_relative_to, which it leaves as they are.
+
+        Tip:
+        This method requires repeated capabilities (usually channels). If called directly on the
+        niscope.Session object, then the method will use all repeated capabilities in the session.
+        You can specify a subset of repeated capabilities using the Python index notation on an
+        niscope.Session instance, and calling this method on the result.:
+
+            session['0,1'].fetch_records_binary(num_samples=-1, record_number=0, num_records=-1, timeout=5.0)
+
+        Args:
+            num_samples (int): Number of samples to fetch for each record. Use -1 to fetch horz_record_length samples.
+            record_number (int): Zero-based index of the first record to fetch.
+            num_records (int): Number of records to fetch. Use -1 to fetch all records from **record_number** to the last configured record.
+            timeout (float): The time to wait in seconds for data to be acquired; using 0 fetches whatever is currently available. Using -1 implies infinite timeout.
+        '''
+        return _fetching.fetch_records_binary(self, num_samples, record_number, num_records, timeout)
+
     def _get_attribute_vi_boolean(self, attribute_id):
         '''_get_attribute_vi_boolean
 
@@ -1901,11 +3121,12 @@ class _SessionBase(object):
             value (bool): Returns the current value of the attribute; pass the address of a
                 ViBoolean variable.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        value_ctype = visatype.ViBoolean()  # case 13
-        error_code = self._library.niScope_GetAttributeViBoolean(vi_ctype, channel_list_ctype, attribute_id_ctype, ctypes.pointer(value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViBoolean_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        value_ctype = _scalar_ctypes.GetAttributeViBoolean_value  # case 13
+        error_code = self._library.niScope_GetAttributeViBoolean(vi_ctype, channel_list_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViBoolean_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return bool(value_ctype.value)
 
@@ -1935,11 +3156,12 @@ class _SessionBase(object):
         Returns:
             value (int): Returns the current value of the attribute.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        value_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niScope_GetAttributeViInt32(vi_ctype, channel_list_ctype, attribute_id_ctype, ctypes.pointer(value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViInt32_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        value_ctype = _scalar_ctypes.GetAttributeViInt32_value  # case 13
+        error_code = self._library.niScope_GetAttributeViInt32(vi_ctype, channel_list_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViInt32_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(value_ctype.value)
 
@@ -1969,11 +3191,12 @@ class _SessionBase(object):
         Returns:
             value (int): Returns the current value of the attribute.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        value_ctype = visatype.ViInt64()  # case 13
-        error_code = self._library.niScope_GetAttributeViInt64(vi_ctype, channel_list_ctype, attribute_id_ctype, ctypes.pointer(value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViInt64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        value_ctype = _scalar_ctypes.GetAttributeViInt64_value  # case 13
+        error_code = self._library.niScope_GetAttributeViInt64(vi_ctype, channel_list_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViInt64_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(value_ctype.value)
 
@@ -2004,11 +3227,12 @@ class _SessionBase(object):
             value (float): Returns the current value of the attribute; pass the address of a
                 ViReal64 variable.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        value_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niScope_GetAttributeViReal64(vi_ctype, channel_list_ctype, attribute_id_ctype, ctypes.pointer(value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViReal64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        value_ctype = _scalar_ctypes.GetAttributeViReal64_value  # case 13
+        error_code = self._library.niScope_GetAttributeViReal64(vi_ctype, channel_list_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViReal64_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(value_ctype.value)
 
@@ -2047,16 +3271,23 @@ class _SessionBase(object):
             attribute_id (int): The ID of an attribute.
             buf_size (int): The number of bytes in the ViChar array you specify for **value**.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        buf_size_ctype = visatype.ViInt32()  # case 6
-        value_ctype = None  # case 11
-        error_code = self._library.niScope_GetAttributeViString(vi_ctype, channel_list_ctype, attribute_id_ctype, buf_size_ctype, value_ctype)
-        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
-        buf_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        value_ctype = (visatype.ViChar * buf_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViString_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        buf_size_ctype = visatype.ViInt32(_ivi_dance_buffer_sizes.get(('GetAttributeViString', attribute_id), _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        value_ctype = (visatype.ViChar * buf_size_ctype.value)()
         error_code = self._library.niScope_GetAttributeViString(vi_ctype, channel_list_ctype, attribute_id_ctype, buf_size_ctype, value_ctype)
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            buf_size_ctype = visatype.ViInt32(0)
+            value_ctype = None
+            error_code = self._library.niScope_GetAttributeViString(vi_ctype, channel_list_ctype, attribute_id_ctype, buf_size_ctype, value_ctype)
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+            buf_size_ctype = visatype.ViInt32(error_code)
+            value_ctype = (visatype.ViChar * buf_size_ctype.value)()
+            error_code = self._library.niScope_GetAttributeViString(vi_ctype, channel_list_ctype, attribute_id_ctype, buf_size_ctype, value_ctype)
+            _ivi_dance_buffer_sizes[('GetAttributeViString', attribute_id)] = buf_size_ctype.value
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return value_ctype.value.decode(self._encoding)
 
@@ -2087,9 +3318,10 @@ class _SessionBase(object):
                 `EQUALIZATION_NUM_COEFFICIENTS <cviNISCOPE_ATTR_EQUALIZATION_NUM_COEFFICIENTS.html>`__
                 attribute.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        number_of_coefficients_ctype = visatype.ViInt32(number_of_coefficients)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_ctype = self._repeated_capability_ctype  # case 2
+        number_of_coefficients_ctype = _scalar_ctypes.GetEqualizationFilterCoefficients_number_of_coefficients
+        number_of_coefficients_ctype.value = number_of_coefficients  # case 8
         coefficients_ctype = (visatype.ViReal64 * 1)()  # case 10
         error_code = self._library.niScope_GetEqualizationFilterCoefficients(vi_ctype, channel_ctype, number_of_coefficients_ctype, coefficients_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
@@ -2126,15 +3358,21 @@ class _SessionBase(object):
 
                 If you pass 0, you can pass VI_NULL for the **description** parameter.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        error_code_ctype = visatype.ViStatus()  # case 13
-        buffer_size_ctype = visatype.ViInt32()  # case 6
-        description_ctype = None  # case 11
-        error_code = self._library.niScope_GetError(vi_ctype, ctypes.pointer(error_code_ctype), buffer_size_ctype, description_ctype)
-        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=True)
-        buffer_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        description_ctype = (visatype.ViChar * buffer_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        error_code = self._library.niScope_GetError(vi_ctype, ctypes.pointer(error_code_ctype), buffer_size_ctype, description_ctype)
+        vi_ctype = self._vi_ctype  # case 1
+        error_code_ctype = _scalar_ctypes.GetError_error_code  # case 13
+        buffer_size_ctype = visatype.ViInt32(_ivi_dance_buffer_sizes.get('GetError', _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        description_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+        error_code = self._library.niScope_GetError(vi_ctype, _scalar_ctypes.GetError_error_code_pointer, buffer_size_ctype, description_ctype)
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            buffer_size_ctype = visatype.ViInt32(0)
+            description_ctype = None
+            error_code = self._library.niScope_GetError(vi_ctype, _scalar_ctypes.GetError_error_code_pointer, buffer_size_ctype, description_ctype)
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=True)
+            buffer_size_ctype = visatype.ViInt32(error_code)
+            description_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+            error_code = self._library.niScope_GetError(vi_ctype, _scalar_ctypes.GetError_error_code_pointer, buffer_size_ctype, description_ctype)
+            _ivi_dance_buffer_sizes['GetError'] = buffer_size_ctype.value
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=True)
         return int(error_code_ctype.value), description_ctype.value.decode(self._encoding)
 
@@ -2175,14 +3413,15 @@ class _SessionBase(object):
         Returns:
             number_of_frequencies (int): Returns the number of frequencies in the returned spectrum.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        buffer_size_ctype = visatype.ViInt32(buffer_size)  # case 8
-        frequencies_ctype = (visatype.ViReal64 * len(frequencies))(*frequencies)  # case 4
-        amplitudes_ctype = (visatype.ViReal64 * len(amplitudes))(*amplitudes)  # case 4
-        phases_ctype = (visatype.ViReal64 * len(phases))(*phases)  # case 4
-        number_of_frequencies_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niScope_GetFrequencyResponse(vi_ctype, channel_ctype, buffer_size_ctype, frequencies_ctype, amplitudes_ctype, phases_ctype, ctypes.pointer(number_of_frequencies_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_ctype = self._repeated_capability_ctype  # case 2
+        buffer_size_ctype = _scalar_ctypes.GetFrequencyResponse_buffer_size
+        buffer_size_ctype.value = buffer_size  # case 8
+        frequencies_ctype = _converters.convert_to_ctypes_array(frequencies, visatype.ViReal64)  # case 4
+        amplitudes_ctype = _converters.convert_to_ctypes_array(amplitudes, visatype.ViReal64)  # case 4
+        phases_ctype = _converters.convert_to_ctypes_array(phases, visatype.ViReal64)  # case 4
+        number_of_frequencies_ctype = _scalar_ctypes.GetFrequencyResponse_number_of_frequencies  # case 13
+        error_code = self._library.niScope_GetFrequencyResponse(vi_ctype, channel_ctype, buffer_size_ctype, frequencies_ctype, amplitudes_ctype, phases_ctype, _scalar_ctypes.GetFrequencyResponse_number_of_frequencies_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(number_of_frequencies_ctype.value)
 
@@ -2254,10 +3493,10 @@ class _SessionBase(object):
             device_ready (bool): Returns True if the device is ready to use, or False if the device is
                 still initializing.
         '''
-        resource_name_ctype = ctypes.create_string_buffer(resource_name.encode(self._encoding))  # case 3
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        device_ready_ctype = visatype.ViBoolean()  # case 13
-        error_code = self._library.niScope_IsDeviceReady(resource_name_ctype, channel_list_ctype, ctypes.pointer(device_ready_ctype))
+        resource_name_ctype = resource_name.encode(self._encoding)  # case 3
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        device_ready_ctype = _scalar_ctypes.IsDeviceReady_device_ready  # case 13
+        error_code = self._library.niScope_IsDeviceReady(resource_name_ctype, channel_list_ctype, _scalar_ctypes.IsDeviceReady_device_ready_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return bool(device_ready_ctype.value)
 
@@ -2299,10 +3538,12 @@ class _SessionBase(object):
             result (list of float): Contains an array of all measurements acquired. Call
                 actual_num_wfms to determine the array length.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        timeout_ctype = visatype.ViReal64(timeout)  # case 8
-        scalar_meas_function_ctype = visatype.ViInt32(scalar_meas_function)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        timeout_ctype = _scalar_ctypes.ReadMeasurement_timeout
+        timeout_ctype.value = timeout  # case 8
+        scalar_meas_function_ctype = _scalar_ctypes.ReadMeasurement_scalar_meas_function
+        scalar_meas_function_ctype.value = scalar_meas_function  # case 8
         result_ctype = (visatype.ViReal64 * 1)()  # case 10
         error_code = self._library.niScope_ReadMeasurement(vi_ctype, channel_list_ctype, timeout_ctype, scalar_meas_function_ctype, result_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
@@ -2347,10 +3588,12 @@ class _SessionBase(object):
             value (bool): The value that you want to set the attribute to. Some values might not
                 be valid depending on the current settings of the instrument session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        value_ctype = visatype.ViBoolean(value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViBoolean_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        value_ctype = _scalar_ctypes.SetAttributeViBoolean_value
+        value_ctype.value = value  # case 8
         error_code = self._library.niScope_SetAttributeViBoolean(vi_ctype, channel_list_ctype, attribute_id_ctype, value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2394,10 +3637,12 @@ class _SessionBase(object):
             value (int): The value that you want to set the attribute. Some values might not be
                 valid depending on the current settings of the instrument session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        value_ctype = visatype.ViInt32(value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViInt32_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        value_ctype = _scalar_ctypes.SetAttributeViInt32_value
+        value_ctype.value = value  # case 8
         error_code = self._library.niScope_SetAttributeViInt32(vi_ctype, channel_list_ctype, attribute_id_ctype, value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2441,10 +3686,12 @@ class _SessionBase(object):
             value (int): The value that you want to set the attribute. Some values might not be
                 valid depending on the current settings of the instrument session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        value_ctype = visatype.ViInt64(value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViInt64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        value_ctype = _scalar_ctypes.SetAttributeViInt64_value
+        value_ctype.value = value  # case 8
         error_code = self._library.niScope_SetAttributeViInt64(vi_ctype, channel_list_ctype, attribute_id_ctype, value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2488,10 +3735,12 @@ class _SessionBase(object):
             value (float): The value that you want to set the attribute to. Some values might not
                 be valid depending on the current settings of the instrument session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        value_ctype = visatype.ViReal64(value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViReal64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        value_ctype = _scalar_ctypes.SetAttributeViReal64_value
+        value_ctype.value = value  # case 8
         error_code = self._library.niScope_SetAttributeViReal64(vi_ctype, channel_list_ctype, attribute_id_ctype, value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2537,10 +3786,11 @@ class _SessionBase(object):
             value (string): The value that you want to set the attribute to. Some values might not
                 be valid depending on the current settings of the instrument session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_list_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        value_ctype = ctypes.create_string_buffer(value.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        channel_list_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViString_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        value_ctype = value.encode(self._encoding)  # case 3
         error_code = self._library.niScope_SetAttributeViString(vi_ctype, channel_list_ctype, attribute_id_ctype, value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2549,9 +3799,10 @@ class _SessionBase(object):
 class _RepeatedCapability(_SessionBase):
     '''Allows for setting/getting properties and calling methods for specific repeated capabilities (such as channels) on your session.'''
 
-    def __init__(self, vi, repeated_capability):
-        super(_RepeatedCapability, self).__init__(repeated_capability)
+    def __init__(self, vi, repeated_capability, attribute_cache, library, warning_policy, session_stats):
+        super(_RepeatedCapability, self).__init__(repeated_capability, attribute_cache, library, warning_policy, session_stats)
         self._vi = vi
+        self._vi_ctype = visatype.ViSession(vi)
         self._is_frozen = True
 
 
@@ -2559,9 +3810,16 @@ class Session(_SessionBase):
     '''An NI-SCOPE session to a National Instruments Digitizer.'''
 
     def __init__(self, resource_name, id_query, reset_device, option_string):
-        super(Session, self).__init__(repeated_capability='')
+        super(Session, self).__init__(repeated_capability='', attribute_cache=attributes.AttributeCache(), library=library_singleton.get(), warning_policy=errors.WarningPolicy(), session_stats=call_stats.SessionStats(_c_functions))
+        if call_stats.registry.enabled:
+            self._session_stats.enable()
+        self._repeated_capability_views = collections.OrderedDict()
+        self._repeated_capability_views_lock = threading.Lock()
         self._vi = 0  # This must be set before calling _init_with_options().
+        # Passed to every method, which would otherwise create it on every call
+        self._vi_ctype = visatype.ViSession(0)
         self._vi = self._init_with_options(resource_name, id_query, reset_device, option_string)
+        self._vi_ctype = visatype.ViSession(self._vi)
         self._is_frozen = True
 
     def __enter__(self):
@@ -2572,18 +3830,89 @@ class Session(_SessionBase):
 
     def __getitem__(self, repeated_capability):
         '''Set/get properties or call methods with a repeated capability (i.e. channels)'''
-        return _RepeatedCapability(self._vi, repeated_capability)
+        # The most recently used views are kept, so loops over channels don't create a view each time
+        with self._repeated_capability_views_lock:
+            view = self._repeated_capability_views.pop(repeated_capability, None)
+            if view is None:
+                view = _RepeatedCapability(self._vi, repeated_capability, self._attribute_cache, self._library, self._warning_policy, self._session_stats)
+                if len(self._repeated_capability_views) >= _MAX_REPEATED_CAPABILITY_VIEWS:
+                    self._repeated_capability_views.popitem(last=False)
+            self._repeated_capability_views[repeated_capability] = view
+        return view
 
     def initiate(self):
         return _Acquisition(self)
 
+    def enable_attribute_cache(self):
+        '''enable_attribute_cache
+
+        Caches the values of attributes in this session, and in its repeated capabilities, so that getting them again
+        doesn't call into the driver. Setting an attribute updates the cache. Methods that reset or configure the
+        session (i.e. reset(), commit() and configure methods) clear it.
+
+        Volatile attributes, whose values change on their own (i.e. status), are never cached.
+
+        Note:
+        Setting an attribute caches the value that was set. If the driver coerces it (i.e. up to a valid range), the
+        cache returns the value that was set until it is cleared. Calling enable_attribute_cache() again clears it.
+        '''
+        self._attribute_cache.clear()
+        self._attribute_cache.enabled = True
+
+    def disable_attribute_cache(self):
+        '''disable_attribute_cache
+
+        Stops caching the values of attributes, and clears the cache. See enable_attribute_cache().
+        '''
+        self._attribute_cache.enabled = False
+        self._attribute_cache.clear()
+
+    def enable_stats(self):
+        '''enable_stats
+
+        Starts recording statistics of the driver calls of this session, and of its repeated capabilities: for each C
+        function, the number of calls, their latencies, and how much of that time was spent in the driver and how much
+        in Python. Calling enable_stats() again clears them. See stats().
+
+        Methods are slower while stats are enabled. Set call_stats.registry.enabled to True to enable them for all new
+        sessions instead.
+        '''
+        self._session_stats.enable()
+
+    def disable_stats(self):
+        '''disable_stats
+
+        Stops recording statistics of the driver calls. stats() still returns the ones recorded. See enable_stats().
+        '''
+        self._session_stats.disable()
+
+    def stats(self):
+        '''stats
+
+        Returns the statistics of the driver calls recorded since enable_stats():
+
+            session.enable_stats()
+            ...
+            for function, s in session.stats().items():
+                print(function, s.calls, s.driver_time, s.python_time, s.percentile(99))
+
+        Returns:
+            stats (collections.OrderedDict): call_stats.FunctionStats by C function name, the one with the most total
+                time first
+        '''
+        return self._session_stats.stats()
+
     def close(self):
+        with self._repeated_capability_views_lock:
+            self._repeated_capability_views.clear()
         try:
             self._close()
         except errors.Error as e:
             self._vi = 0
+            self._vi_ctype = visatype.ViSession(0)
             raise
         self._vi = 0
+        self._vi_ctype = visatype.ViSession(0)
 
     ''' These are code-generated '''
 
@@ -2593,7 +3922,7 @@ class Session(_SessionBase):
         Aborts an acquisition and returns the digitizer to the Idle state. Call
         this function if the digitizer times out waiting for a trigger.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niScope_Abort(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2615,9 +3944,9 @@ class Session(_SessionBase):
 
                 NISCOPE_VAL_ACQ_STATUS_UNKNOWN
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        acquisition_status_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niScope_AcquisitionStatus(vi_ctype, ctypes.pointer(acquisition_status_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        acquisition_status_ctype = _scalar_ctypes.AcquisitionStatus_acquisition_status  # case 13
+        error_code = self._library.niScope_AcquisitionStatus(vi_ctype, _scalar_ctypes.AcquisitionStatus_acquisition_status_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(acquisition_status_ctype.value)
 
@@ -2635,10 +3964,11 @@ class Session(_SessionBase):
             meas_waveform_size (int): Returns the size (in number of samples) of the resulting analysis
                 waveform.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        array_meas_function_ctype = visatype.ViInt32(array_meas_function)  # case 8
-        meas_waveform_size_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niScope_ActualMeasWfmSize(vi_ctype, array_meas_function_ctype, ctypes.pointer(meas_waveform_size_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        array_meas_function_ctype = _scalar_ctypes.ActualMeasWfmSize_array_meas_function
+        array_meas_function_ctype.value = array_meas_function  # case 8
+        meas_waveform_size_ctype = _scalar_ctypes.ActualMeasWfmSize_meas_waveform_size  # case 13
+        error_code = self._library.niScope_ActualMeasWfmSize(vi_ctype, array_meas_function_ctype, _scalar_ctypes.ActualMeasWfmSize_meas_waveform_size_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(meas_waveform_size_ctype.value)
 
@@ -2656,9 +3986,9 @@ class Session(_SessionBase):
                 channel; NI-SCOPE returns the value held in the
                 HORZ_RECORD_LENGTH attribute.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        record_length_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niScope_ActualRecordLength(vi_ctype, ctypes.pointer(record_length_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        record_length_ctype = _scalar_ctypes.ActualRecordLength_record_length  # case 13
+        error_code = self._library.niScope_ActualRecordLength(vi_ctype, _scalar_ctypes.ActualRecordLength_record_length_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(record_length_ctype.value)
 
@@ -2674,8 +4004,9 @@ class Session(_SessionBase):
                 acquiring data. Refer to TRIGGER_DELAY_TIME for more
                 information.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        delay_ctype = visatype.ViReal64(delay)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        delay_ctype = _scalar_ctypes.AdjustSampleClockRelativeDelay_delay
+        delay_ctype.value = delay  # case 8
         error_code = self._library.niScope_AdjustSampleClockRelativeDelay(vi_ctype, delay_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2750,9 +4081,10 @@ class Session(_SessionBase):
         | Trigger output     |
         +--------------------+
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niScope_AutoSetup(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def commit(self):
@@ -2763,9 +4095,10 @@ class Session(_SessionBase):
         reflected in the hardware. This function is not supported for
         Traditional NI-DAQ (Legacy) devices.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niScope_Commit(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_acquisition(self, acquisition_type):
@@ -2792,10 +4125,12 @@ class Session(_SessionBase):
                 the NI 5142/5622, leave **acquisitionType** set to NISCOPE_VAL_NORMAL
                 and set DDC_ENABLED to True.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        acquisition_type_ctype = visatype.ViInt32(acquisition_type)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        acquisition_type_ctype = _scalar_ctypes.ConfigureAcquisition_acquisition_type
+        acquisition_type_ctype.value = acquisition_type  # case 8
         error_code = self._library.niScope_ConfigureAcquisition(vi_ctype, acquisition_type_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_acquisition_record(self, time_per_record, min_num_points, acquisition_start_time):
@@ -2819,12 +4154,16 @@ class Session(_SessionBase):
             acquisition_start_time (float): Specifies the position of the first point in the waveform record
                 relative to the trigger event.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        time_per_record_ctype = visatype.ViReal64(time_per_record)  # case 8
-        min_num_points_ctype = visatype.ViInt32(min_num_points)  # case 8
-        acquisition_start_time_ctype = visatype.ViReal64(acquisition_start_time)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        time_per_record_ctype = _scalar_ctypes.ConfigureAcquisitionRecord_time_per_record
+        time_per_record_ctype.value = time_per_record  # case 8
+        min_num_points_ctype = _scalar_ctypes.ConfigureAcquisitionRecord_min_num_points
+        min_num_points_ctype.value = min_num_points  # case 8
+        acquisition_start_time_ctype = _scalar_ctypes.ConfigureAcquisitionRecord_acquisition_start_time
+        acquisition_start_time_ctype.value = acquisition_start_time  # case 8
         error_code = self._library.niScope_ConfigureAcquisitionRecord(vi_ctype, time_per_record_ctype, min_num_points_ctype, acquisition_start_time_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_channel(self, channel, range, offset, coupling, probe_attenuation, enabled):
@@ -2882,15 +4221,21 @@ class Session(_SessionBase):
                 | NISCOPE_VAL_TRUE (1)—Acquire data on this channel
                 | NISCOPE_VAL_FALSE (0)—Do not acquire data on this channel
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_ctype = ctypes.create_string_buffer(channel.encode(self._encoding))  # case 3
-        range_ctype = visatype.ViReal64(range)  # case 8
-        offset_ctype = visatype.ViReal64(offset)  # case 8
-        coupling_ctype = visatype.ViInt32(coupling)  # case 8
-        probe_attenuation_ctype = visatype.ViReal64(probe_attenuation)  # case 8
-        enabled_ctype = visatype.ViBoolean(enabled)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_ctype = channel.encode(self._encoding)  # case 3
+        range_ctype = _scalar_ctypes.ConfigureChannel_range
+        range_ctype.value = range  # case 8
+        offset_ctype = _scalar_ctypes.ConfigureChannel_offset
+        offset_ctype.value = offset  # case 8
+        coupling_ctype = _scalar_ctypes.ConfigureChannel_coupling
+        coupling_ctype.value = coupling  # case 8
+        probe_attenuation_ctype = _scalar_ctypes.ConfigureChannel_probe_attenuation
+        probe_attenuation_ctype.value = probe_attenuation  # case 8
+        enabled_ctype = _scalar_ctypes.ConfigureChannel_enabled
+        enabled_ctype.value = enabled  # case 8
         error_code = self._library.niScope_ConfigureChannel(vi_ctype, channel_ctype, range_ctype, offset_ctype, coupling_ctype, probe_attenuation_ctype, enabled_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_clock(self, input_clock_source, output_clock_source, clock_sync_pulse_source, master_enabled):
@@ -2925,13 +4270,15 @@ class Session(_SessionBase):
 
                 Refer to MASTER_ENABLE for more information.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        input_clock_source_ctype = ctypes.create_string_buffer(input_clock_source.encode(self._encoding))  # case 3
-        output_clock_source_ctype = ctypes.create_string_buffer(output_clock_source.encode(self._encoding))  # case 3
-        clock_sync_pulse_source_ctype = ctypes.create_string_buffer(clock_sync_pulse_source.encode(self._encoding))  # case 3
-        master_enabled_ctype = visatype.ViBoolean(master_enabled)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        input_clock_source_ctype = input_clock_source.encode(self._encoding)  # case 3
+        output_clock_source_ctype = output_clock_source.encode(self._encoding)  # case 3
+        clock_sync_pulse_source_ctype = clock_sync_pulse_source.encode(self._encoding)  # case 3
+        master_enabled_ctype = _scalar_ctypes.ConfigureClock_master_enabled
+        master_enabled_ctype.value = master_enabled  # case 8
         error_code = self._library.niScope_ConfigureClock(vi_ctype, input_clock_source_ctype, output_clock_source_ctype, clock_sync_pulse_source_ctype, master_enabled_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_edge_trigger_source(self, source, level, slope):
@@ -2964,12 +4311,15 @@ class Session(_SessionBase):
                 the digitizer. Refer to TRIGGER_SLOPE for more
                 information.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        source_ctype = ctypes.create_string_buffer(source.encode(self._encoding))  # case 3
-        level_ctype = visatype.ViReal64(level)  # case 8
-        slope_ctype = visatype.ViInt32(slope)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        source_ctype = source.encode(self._encoding)  # case 3
+        level_ctype = _scalar_ctypes.ConfigureEdgeTriggerSource_level
+        level_ctype.value = level  # case 8
+        slope_ctype = _scalar_ctypes.ConfigureEdgeTriggerSource_slope
+        slope_ctype.value = slope  # case 8
         error_code = self._library.niScope_ConfigureEdgeTriggerSource(vi_ctype, source_ctype, level_ctype, slope_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_horizontal_timing(self, min_sample_rate, min_num_pts, ref_position, num_records, enforce_realtime):
@@ -3003,14 +4353,20 @@ class Session(_SessionBase):
 
                 VI_FALSE—Allow real-time and equivalent-time acquisitions
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        min_sample_rate_ctype = visatype.ViReal64(min_sample_rate)  # case 8
-        min_num_pts_ctype = visatype.ViInt32(min_num_pts)  # case 8
-        ref_position_ctype = visatype.ViReal64(ref_position)  # case 8
-        num_records_ctype = visatype.ViInt32(num_records)  # case 8
-        enforce_realtime_ctype = visatype.ViBoolean(enforce_realtime)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        min_sample_rate_ctype = _scalar_ctypes.ConfigureHorizontalTiming_min_sample_rate
+        min_sample_rate_ctype.value = min_sample_rate  # case 8
+        min_num_pts_ctype = _scalar_ctypes.ConfigureHorizontalTiming_min_num_pts
+        min_num_pts_ctype.value = min_num_pts  # case 8
+        ref_position_ctype = _scalar_ctypes.ConfigureHorizontalTiming_ref_position
+        ref_position_ctype.value = ref_position  # case 8
+        num_records_ctype = _scalar_ctypes.ConfigureHorizontalTiming_num_records
+        num_records_ctype.value = num_records  # case 8
+        enforce_realtime_ctype = _scalar_ctypes.ConfigureHorizontalTiming_enforce_realtime
+        enforce_realtime_ctype.value = enforce_realtime  # case 8
         error_code = self._library.niScope_ConfigureHorizontalTiming(vi_ctype, min_sample_rate_ctype, min_num_pts_ctype, ref_position_ctype, num_records_ctype, enforce_realtime_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_ref_levels(self, low, mid, high):
@@ -3059,12 +4415,16 @@ class Session(_SessionBase):
 
                 Default Value: 90.0
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        low_ctype = visatype.ViReal64(low)  # case 8
-        mid_ctype = visatype.ViReal64(mid)  # case 8
-        high_ctype = visatype.ViReal64(high)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        low_ctype = _scalar_ctypes.ConfigureRefLevels_low
+        low_ctype.value = low  # case 8
+        mid_ctype = _scalar_ctypes.ConfigureRefLevels_mid
+        mid_ctype.value = mid  # case 8
+        high_ctype = _scalar_ctypes.ConfigureRefLevels_high
+        high_ctype.value = high  # case 8
         error_code = self._library.niScope_ConfigureRefLevels(vi_ctype, low_ctype, mid_ctype, high_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_tv_trigger_line_number(self, line_number):
@@ -3100,10 +4460,12 @@ class Session(_SessionBase):
                 | 1080i,1080p               | 1 to 1,125   |
                 +---------------------------+--------------+
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        line_number_ctype = visatype.ViInt32(line_number)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        line_number_ctype = _scalar_ctypes.ConfigureTVTriggerLineNumber_line_number
+        line_number_ctype.value = line_number  # case 8
         error_code = self._library.niScope_ConfigureTVTriggerLineNumber(vi_ctype, line_number_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_tv_trigger_source(self, source, signal_format, event, polarity):
@@ -3155,13 +4517,17 @@ class Session(_SessionBase):
                 | NISCOPE_VAL_TV_POSITIVE (1)
                 | NISCOPE_VAL_TV_NEGATIVE (2)
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        source_ctype = ctypes.create_string_buffer(source.encode(self._encoding))  # case 3
-        signal_format_ctype = visatype.ViInt32(signal_format)  # case 8
-        event_ctype = visatype.ViInt32(event)  # case 8
-        polarity_ctype = visatype.ViInt32(polarity)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        source_ctype = source.encode(self._encoding)  # case 3
+        signal_format_ctype = _scalar_ctypes.ConfigureTVTriggerSource_signal_format
+        signal_format_ctype.value = signal_format  # case 8
+        event_ctype = _scalar_ctypes.ConfigureTVTriggerSource_event
+        event_ctype.value = event  # case 8
+        polarity_ctype = _scalar_ctypes.ConfigureTVTriggerSource_polarity
+        polarity_ctype.value = polarity  # case 8
         error_code = self._library.niScope_ConfigureTVTriggerSource(vi_ctype, source_ctype, signal_format_ctype, event_ctype, polarity_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_trigger(self, trigger_type, holdoff):
@@ -3188,11 +4554,14 @@ class Session(_SessionBase):
                 enabling NI-SCOPE to detect another trigger. Refer to
                 TRIGGER_HOLDOFF for more information.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        trigger_type_ctype = visatype.ViInt32(trigger_type)  # case 8
-        holdoff_ctype = visatype.ViReal64(holdoff)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        trigger_type_ctype = _scalar_ctypes.ConfigureTrigger_trigger_type
+        trigger_type_ctype.value = trigger_type  # case 8
+        holdoff_ctype = _scalar_ctypes.ConfigureTrigger_holdoff
+        holdoff_ctype.value = holdoff  # case 8
         error_code = self._library.niScope_ConfigureTrigger(vi_ctype, trigger_type_ctype, holdoff_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_trigger_coupling(self, coupling):
@@ -3219,10 +4588,12 @@ class Session(_SessionBase):
 
                 NISCOPE_VAL_AC_PLUS_HF_REJECT (1001)
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        coupling_ctype = visatype.ViInt32(coupling)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        coupling_ctype = _scalar_ctypes.ConfigureTriggerCoupling_coupling
+        coupling_ctype.value = coupling  # case 8
         error_code = self._library.niScope_ConfigureTriggerCoupling(vi_ctype, coupling_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_trigger_digital(self, trigger_source, slope, holdoff, delay):
@@ -3271,13 +4642,17 @@ class Session(_SessionBase):
                 acquiring data. Refer to TRIGGER_DELAY_TIME for more
                 information.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        trigger_source_ctype = ctypes.create_string_buffer(trigger_source.encode(self._encoding))  # case 3
-        slope_ctype = visatype.ViInt32(slope)  # case 8
-        holdoff_ctype = visatype.ViReal64(holdoff)  # case 8
-        delay_ctype = visatype.ViReal64(delay)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        trigger_source_ctype = trigger_source.encode(self._encoding)  # case 3
+        slope_ctype = _scalar_ctypes.ConfigureTriggerDigital_slope
+        slope_ctype.value = slope  # case 8
+        holdoff_ctype = _scalar_ctypes.ConfigureTriggerDigital_holdoff
+        holdoff_ctype.value = holdoff  # case 8
+        delay_ctype = _scalar_ctypes.ConfigureTriggerDigital_delay
+        delay_ctype.value = delay  # case 8
         error_code = self._library.niScope_ConfigureTriggerDigital(vi_ctype, trigger_source_ctype, slope_ctype, holdoff_ctype, delay_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_trigger_edge(self, trigger_source, level, slope, trigger_coupling, holdoff, delay):
@@ -3320,15 +4695,21 @@ class Session(_SessionBase):
                 acquiring data. Refer to TRIGGER_DELAY_TIME for more
                 information.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        trigger_source_ctype = ctypes.create_string_buffer(trigger_source.encode(self._encoding))  # case 3
-        level_ctype = visatype.ViReal64(level)  # case 8
-        slope_ctype = visatype.ViInt32(slope)  # case 8
-        trigger_coupling_ctype = visatype.ViInt32(trigger_coupling)  # case 8
-        holdoff_ctype = visatype.ViReal64(holdoff)  # case 8
-        delay_ctype = visatype.ViReal64(delay)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        trigger_source_ctype = trigger_source.encode(self._encoding)  # case 3
+        level_ctype = _scalar_ctypes.ConfigureTriggerEdge_level
+        level_ctype.value = level  # case 8
+        slope_ctype = _scalar_ctypes.ConfigureTriggerEdge_slope
+        slope_ctype.value = slope  # case 8
+        trigger_coupling_ctype = _scalar_ctypes.ConfigureTriggerEdge_trigger_coupling
+        trigger_coupling_ctype.value = trigger_coupling  # case 8
+        holdoff_ctype = _scalar_ctypes.ConfigureTriggerEdge_holdoff
+        holdoff_ctype.value = holdoff  # case 8
+        delay_ctype = _scalar_ctypes.ConfigureTriggerEdge_delay
+        delay_ctype.value = delay  # case 8
         error_code = self._library.niScope_ConfigureTriggerEdge(vi_ctype, trigger_source_ctype, level_ctype, slope_ctype, trigger_coupling_ctype, holdoff_ctype, delay_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_trigger_hysteresis(self, trigger_source, level, hysteresis, slope, trigger_coupling, holdoff, delay):
@@ -3380,16 +4761,23 @@ class Session(_SessionBase):
                 acquiring data. Refer to TRIGGER_DELAY_TIME for more
                 information.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        trigger_source_ctype = ctypes.create_string_buffer(trigger_source.encode(self._encoding))  # case 3
-        level_ctype = visatype.ViReal64(level)  # case 8
-        hysteresis_ctype = visatype.ViReal64(hysteresis)  # case 8
-        slope_ctype = visatype.ViInt32(slope)  # case 8
-        trigger_coupling_ctype = visatype.ViInt32(trigger_coupling)  # case 8
-        holdoff_ctype = visatype.ViReal64(holdoff)  # case 8
-        delay_ctype = visatype.ViReal64(delay)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        trigger_source_ctype = trigger_source.encode(self._encoding)  # case 3
+        level_ctype = _scalar_ctypes.ConfigureTriggerHysteresis_level
+        level_ctype.value = level  # case 8
+        hysteresis_ctype = _scalar_ctypes.ConfigureTriggerHysteresis_hysteresis
+        hysteresis_ctype.value = hysteresis  # case 8
+        slope_ctype = _scalar_ctypes.ConfigureTriggerHysteresis_slope
+        slope_ctype.value = slope  # case 8
+        trigger_coupling_ctype = _scalar_ctypes.ConfigureTriggerHysteresis_trigger_coupling
+        trigger_coupling_ctype.value = trigger_coupling  # case 8
+        holdoff_ctype = _scalar_ctypes.ConfigureTriggerHysteresis_holdoff
+        holdoff_ctype.value = holdoff  # case 8
+        delay_ctype = _scalar_ctypes.ConfigureTriggerHysteresis_delay
+        delay_ctype.value = delay  # case 8
         error_code = self._library.niScope_ConfigureTriggerHysteresis(vi_ctype, trigger_source_ctype, level_ctype, hysteresis_ctype, slope_ctype, trigger_coupling_ctype, holdoff_ctype, delay_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_trigger_immediate(self):
@@ -3402,9 +4790,10 @@ class Session(_SessionBase):
         specify the type of trigger that the digitizer waits for with a
         Configure Trigger function, such as configure_trigger_immediate.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niScope_ConfigureTriggerImmediate(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_trigger_output(self, trigger_event, trigger_output):
@@ -3441,11 +4830,13 @@ class Session(_SessionBase):
                 | NISCOPE_VAL_END_OF_ACQUISITION_EVENT
                 | NISCOPE_VAL_END_OF_RECORD_EVENT
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        trigger_event_ctype = visatype.ViInt32(trigger_event)  # case 8
-        trigger_output_ctype = ctypes.create_string_buffer(trigger_output.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        trigger_event_ctype = _scalar_ctypes.ConfigureTriggerOutput_trigger_event
+        trigger_event_ctype.value = trigger_event  # case 8
+        trigger_output_ctype = trigger_output.encode(self._encoding)  # case 3
         error_code = self._library.niScope_ConfigureTriggerOutput(vi_ctype, trigger_event_ctype, trigger_output_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_trigger_software(self, holdoff, delay):
@@ -3481,11 +4872,14 @@ class Session(_SessionBase):
                 acquiring data. Refer to TRIGGER_DELAY_TIME for more
                 information.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        holdoff_ctype = visatype.ViReal64(holdoff)  # case 8
-        delay_ctype = visatype.ViReal64(delay)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        holdoff_ctype = _scalar_ctypes.ConfigureTriggerSoftware_holdoff
+        holdoff_ctype.value = holdoff  # case 8
+        delay_ctype = _scalar_ctypes.ConfigureTriggerSoftware_delay
+        delay_ctype.value = delay  # case 8
         error_code = self._library.niScope_ConfigureTriggerSoftware(vi_ctype, holdoff_ctype, delay_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_trigger_video(self, trigger_source, enable_dc_restore, signal_format, event, line_number, polarity, trigger_coupling, holdoff, delay):
@@ -3542,18 +4936,27 @@ class Session(_SessionBase):
                 acquiring data. Refer to TRIGGER_DELAY_TIME for more
                 information.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        trigger_source_ctype = ctypes.create_string_buffer(trigger_source.encode(self._encoding))  # case 3
-        enable_dc_restore_ctype = visatype.ViBoolean(enable_dc_restore)  # case 8
-        signal_format_ctype = visatype.ViInt32(signal_format)  # case 8
-        event_ctype = visatype.ViInt32(event)  # case 8
-        line_number_ctype = visatype.ViInt32(line_number)  # case 8
-        polarity_ctype = visatype.ViInt32(polarity)  # case 8
-        trigger_coupling_ctype = visatype.ViInt32(trigger_coupling)  # case 8
-        holdoff_ctype = visatype.ViReal64(holdoff)  # case 8
-        delay_ctype = visatype.ViReal64(delay)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        trigger_source_ctype = trigger_source.encode(self._encoding)  # case 3
+        enable_dc_restore_ctype = _scalar_ctypes.ConfigureTriggerVideo_enable_dc_restore
+        enable_dc_restore_ctype.value = enable_dc_restore  # case 8
+        signal_format_ctype = _scalar_ctypes.ConfigureTriggerVideo_signal_format
+        signal_format_ctype.value = signal_format  # case 8
+        event_ctype = _scalar_ctypes.ConfigureTriggerVideo_event
+        event_ctype.value = event  # case 8
+        line_number_ctype = _scalar_ctypes.ConfigureTriggerVideo_line_number
+        line_number_ctype.value = line_number  # case 8
+        polarity_ctype = _scalar_ctypes.ConfigureTriggerVideo_polarity
+        polarity_ctype.value = polarity  # case 8
+        trigger_coupling_ctype = _scalar_ctypes.ConfigureTriggerVideo_trigger_coupling
+        trigger_coupling_ctype.value = trigger_coupling  # case 8
+        holdoff_ctype = _scalar_ctypes.ConfigureTriggerVideo_holdoff
+        holdoff_ctype.value = holdoff  # case 8
+        delay_ctype = _scalar_ctypes.ConfigureTriggerVideo_delay
+        delay_ctype.value = delay  # case 8
         error_code = self._library.niScope_ConfigureTriggerVideo(vi_ctype, trigger_source_ctype, enable_dc_restore_ctype, signal_format_ctype, event_ctype, line_number_ctype, polarity_ctype, trigger_coupling_ctype, holdoff_ctype, delay_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_trigger_window(self, trigger_source, low_level, high_level, window_mode, trigger_coupling, holdoff, delay):
@@ -3601,16 +5004,23 @@ class Session(_SessionBase):
                 acquiring data. Refer to TRIGGER_DELAY_TIME for more
                 information.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        trigger_source_ctype = ctypes.create_string_buffer(trigger_source.encode(self._encoding))  # case 3
-        low_level_ctype = visatype.ViReal64(low_level)  # case 8
-        high_level_ctype = visatype.ViReal64(high_level)  # case 8
-        window_mode_ctype = visatype.ViInt32(window_mode)  # case 8
-        trigger_coupling_ctype = visatype.ViInt32(trigger_coupling)  # case 8
-        holdoff_ctype = visatype.ViReal64(holdoff)  # case 8
-        delay_ctype = visatype.ViReal64(delay)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        trigger_source_ctype = trigger_source.encode(self._encoding)  # case 3
+        low_level_ctype = _scalar_ctypes.ConfigureTriggerWindow_low_level
+        low_level_ctype.value = low_level  # case 8
+        high_level_ctype = _scalar_ctypes.ConfigureTriggerWindow_high_level
+        high_level_ctype.value = high_level  # case 8
+        window_mode_ctype = _scalar_ctypes.ConfigureTriggerWindow_window_mode
+        window_mode_ctype.value = window_mode  # case 8
+        trigger_coupling_ctype = _scalar_ctypes.ConfigureTriggerWindow_trigger_coupling
+        trigger_coupling_ctype.value = trigger_coupling  # case 8
+        holdoff_ctype = _scalar_ctypes.ConfigureTriggerWindow_holdoff
+        holdoff_ctype.value = holdoff  # case 8
+        delay_ctype = _scalar_ctypes.ConfigureTriggerWindow_delay
+        delay_ctype.value = delay  # case 8
         error_code = self._library.niScope_ConfigureTriggerWindow(vi_ctype, trigger_source_ctype, low_level_ctype, high_level_ctype, window_mode_ctype, trigger_coupling_ctype, holdoff_ctype, delay_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def disable(self):
@@ -3619,7 +5029,7 @@ class Session(_SessionBase):
         Aborts any current operation, opens data channel relays, and releases
         RTSI and PFI lines.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niScope_Disable(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -3707,15 +5117,16 @@ class Session(_SessionBase):
                 | NISCOPE_VAL_CLK_OUT  | ("VAL_CLK_OUT")  |
                 +----------------------+------------------+
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        signal_ctype = visatype.ViInt32(signal)  # case 8
-        signal_identifier_ctype = ctypes.create_string_buffer(signal_identifier.encode(self._encoding))  # case 3
-        output_terminal_ctype = ctypes.create_string_buffer(output_terminal.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        signal_ctype = _scalar_ctypes.ExportSignal_signal
+        signal_ctype.value = signal  # case 8
+        signal_identifier_ctype = signal_identifier.encode(self._encoding)  # case 3
+        output_terminal_ctype = output_terminal.encode(self._encoding)  # case 3
         error_code = self._library.niScope_ExportSignal(vi_ctype, signal_ctype, signal_identifier_ctype, output_terminal_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
-    def fetch_waveform(self, channel, waveform_size):
+    def fetch_waveform(self, channel, waveform_size, array_type='list'):
         '''fetch_waveform
 
         Returns the waveform from a previously initiated acquisition that the
@@ -3745,9 +5156,10 @@ class Session(_SessionBase):
 
                 Default Value: "0"
             waveform_size (int): The number of elements to insert into the **waveform** array.
+            array_type (str): Selects how arrays are returned: 'list', 'array' for array.array or 'numpy' for numpy.ndarray. A numpy.ndarray shares memory with the buffer filled by the driver, so nothing is copied.
 
         Returns:
-            waveform (list of float): Returns the waveform that the digitizer acquires.
+            waveform (list, array.array or numpy.ndarray of float): Returns the waveform that the digitizer acquires.
 
                 Units: volts
 
@@ -3769,16 +5181,84 @@ class Session(_SessionBase):
 
                 Units: seconds
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_ctype = ctypes.create_string_buffer(channel.encode(self._encoding))  # case 3
-        waveform_size_ctype = visatype.ViInt32(waveform_size)  # case 8
-        waveform_ctype = (visatype.ViReal64 * 1)()  # case 10
-        actual_points_ctype = visatype.ViInt32()  # case 13
-        initial_x_ctype = visatype.ViReal64()  # case 13
-        x_increment_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niScope_FetchWaveform(vi_ctype, channel_ctype, waveform_size_ctype, waveform_ctype, ctypes.pointer(actual_points_ctype), ctypes.pointer(initial_x_ctype), ctypes.pointer(x_increment_ctype))
+        _converters.check_array_type(array_type)
+        vi_ctype = self._vi_ctype  # case 1
+        channel_ctype = channel.encode(self._encoding)  # case 3
+        waveform_size_ctype = visatype.ViInt32(waveform_size)  # case 7
+        waveform_ctype = (visatype.ViReal64 * waveform_size)()  # case 12
+        actual_points_ctype = _scalar_ctypes.FetchWaveform_actual_points  # case 13
+        initial_x_ctype = _scalar_ctypes.FetchWaveform_initial_x  # case 13
+        x_increment_ctype = _scalar_ctypes.FetchWaveform_x_increment  # case 13
+        error_code = self._library.niScope_FetchWaveform(vi_ctype, channel_ctype, waveform_size_ctype, waveform_ctype, _scalar_ctypes.FetchWaveform_actual_points_pointer, _scalar_ctypes.FetchWaveform_initial_x_pointer, _scalar_ctypes.FetchWaveform_x_increment_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return [float(waveform_ctype[i]) for i in range(1)], int(actual_points_ctype.value), float(initial_x_ctype.value), float(x_increment_ctype.value)
+        return _converters.convert_from_ctypes_array(waveform_ctype, waveform_size_ctype.value, float, array_type), int(actual_points_ctype.value), float(initial_x_ctype.value), float(x_increment_ctype.value)
+
+    def fetch_waveform_into(self, channel, waveform):
+        '''fetch_waveform_into
+
+        Same as fetch_waveform, but the driver writes **waveform** directly into a buffer you allocate, such as a numpy.ndarray or array.array. Nothing is copied and no list is created.
+
+
+        Returns the waveform from a previously initiated acquisition that the
+        digitizer acquires for the channel you specify.
+
+        _initiate_acquisition starts an acquisition on the channels that
+        you enable with configure_vertical. The digitizer acquires
+        waveforms for the enabled channels concurrently. You use
+        acquisition_status to determine when the acquisition is
+        complete. You must call this function separately for each enabled
+        channel to obtain the waveforms.
+
+        You can call read_waveform instead of
+        _initiate_acquisition. read_waveform starts an
+        acquisition on all enabled channels, waits for the acquisition to
+        complete, and returns the waveform for the channel you specify. Call
+        this function to obtain the waveforms for each of the remaining
+        channels.
+
+        Note:
+        This function is included for compliance with the IviScope Class
+        Specification.
+
+        Args:
+            channel (string): The channel to configure. For more information, refer to `channel String
+                Syntax <REPLACE_DRIVER_SPECIFIC_URL_2(scopefunc.chm','cvichannelstringsyntaxforc)>`__.
+
+                Default Value: "0"
+            waveform (writable buffer of float): Returns the waveform that the digitizer acquires.
+
+                Units: volts
+
+                | Notes:
+                | If the digitizer cannot sample a point in the waveform, this function
+                  returns an error.
+
+        Returns:
+            actual_points (int): Indicates the actual number of points the function placed in the
+                **waveform** array.
+            initial_x (float): Indicates the time of the first point in the **waveform** array relative
+                to the Reference Position.
+
+                Units: seconds
+
+                For example, if the digitizer acquires the first point in the
+                **waveform** array 1 second before the trigger, this parameter returns
+                the value –1.0. If the acquisition of the first point occurs at the same
+                time as the trigger, this parameter returns the value 0.0.
+            x_increment (float): Indicates the length of time between points in the **waveform** array.
+
+                Units: seconds
+        '''
+        vi_ctype = self._vi_ctype  # case 1
+        channel_ctype = channel.encode(self._encoding)  # case 3
+        waveform_size_ctype = visatype.ViInt32(len(waveform))  # case 5
+        waveform_ctype = _converters.get_ctypes_array_for_buffer(waveform, visatype.ViReal64, 'waveform')  # case 14
+        actual_points_ctype = _scalar_ctypes.FetchWaveform_actual_points  # case 13
+        initial_x_ctype = _scalar_ctypes.FetchWaveform_initial_x  # case 13
+        x_increment_ctype = _scalar_ctypes.FetchWaveform_x_increment  # case 13
+        error_code = self._library.niScope_FetchWaveform(vi_ctype, channel_ctype, waveform_size_ctype, waveform_ctype, _scalar_ctypes.FetchWaveform_actual_points_pointer, _scalar_ctypes.FetchWaveform_initial_x_pointer, _scalar_ctypes.FetchWaveform_x_increment_pointer)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return int(actual_points_ctype.value), float(initial_x_ctype.value), float(x_increment_ctype.value)
 
     def fetch_waveform_measurement(self, channel, meas_function):
         '''fetch_waveform_measurement
@@ -3812,11 +5292,12 @@ class Session(_SessionBase):
         Returns:
             measurement (float): The measured value.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_ctype = ctypes.create_string_buffer(channel.encode(self._encoding))  # case 3
-        meas_function_ctype = visatype.ViInt32(meas_function)  # case 8
-        measurement_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niScope_FetchWaveformMeasurement(vi_ctype, channel_ctype, meas_function_ctype, ctypes.pointer(measurement_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_ctype = channel.encode(self._encoding)  # case 3
+        meas_function_ctype = _scalar_ctypes.FetchWaveformMeasurement_meas_function
+        meas_function_ctype.value = meas_function  # case 8
+        measurement_ctype = _scalar_ctypes.FetchWaveformMeasurement_measurement  # case 13
+        error_code = self._library.niScope_FetchWaveformMeasurement(vi_ctype, channel_ctype, meas_function_ctype, _scalar_ctypes.FetchWaveformMeasurement_measurement_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(measurement_ctype.value)
 
@@ -3849,9 +5330,11 @@ class Session(_SessionBase):
             channel_string (string): Returns the channel string that is in the channel table at the index you
                 specify. Do not modify the contents of the channel string.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        index_ctype = visatype.ViInt32(index)  # case 8
-        buffer_size_ctype = visatype.ViInt32(buffer_size)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        index_ctype = _scalar_ctypes.GetChannelName_index
+        index_ctype.value = index  # case 8
+        buffer_size_ctype = _scalar_ctypes.GetChannelName_buffer_size
+        buffer_size_ctype.value = buffer_size  # case 8
         channel_string_ctype = (visatype.ViChar * 1)()  # case 10
         error_code = self._library.niScope_GetChannelName(vi_ctype, index_ctype, buffer_size_ctype, channel_string_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
@@ -3879,9 +5362,11 @@ class Session(_SessionBase):
             error_message (string): Returns a char buffer that will be populated with the error message. It
                 should be at least as large as the buffer size.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        error_code_ctype = visatype.ViStatus(error_code)  # case 8
-        buffer__size_ctype = visatype.ViInt32(buffer__size)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        error_code_ctype = _scalar_ctypes.GetErrorMessage_error_code
+        error_code_ctype.value = error_code  # case 8
+        buffer__size_ctype = _scalar_ctypes.GetErrorMessage_buffer__size
+        buffer__size_ctype.value = buffer__size  # case 8
         error_message_ctype = (visatype.ViChar * 1)()  # case 10
         error_code = self._library.niScope_GetErrorMessage(vi_ctype, error_code_ctype, buffer__size_ctype, error_message_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
@@ -3904,10 +5389,10 @@ class Session(_SessionBase):
             writer_handle (int): Returns a reference to a peer-to-peer writer FIFO that can be used to
                 create a peer-to-peer streaming session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        stream_name_ctype = ctypes.create_string_buffer(stream_name.encode(self._encoding))  # case 3
-        writer_handle_ctype = visatype.ViUInt32()  # case 13
-        error_code = self._library.niScope_GetStreamEndpointHandle(vi_ctype, stream_name_ctype, ctypes.pointer(writer_handle_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        stream_name_ctype = stream_name.encode(self._encoding)  # case 3
+        writer_handle_ctype = _scalar_ctypes.GetStreamEndpointHandle_writer_handle  # case 13
+        error_code = self._library.niScope_GetStreamEndpointHandle(vi_ctype, stream_name_ctype, _scalar_ctypes.GetStreamEndpointHandle_writer_handle_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(writer_handle_ctype.value)
 
@@ -4038,12 +5523,14 @@ class Session(_SessionBase):
             vi (int): Returns a session handle that you can use to identify the device in all
                 subsequent NI-SCOPE function calls.
         '''
-        resource_name_ctype = ctypes.create_string_buffer(resource_name.encode(self._encoding))  # case 3
-        id_query_ctype = visatype.ViBoolean(id_query)  # case 8
-        reset_device_ctype = visatype.ViBoolean(reset_device)  # case 8
-        option_string_ctype = ctypes.create_string_buffer(option_string.encode(self._encoding))  # case 3
-        vi_ctype = visatype.ViSession()  # case 13
-        error_code = self._library.niScope_InitWithOptions(resource_name_ctype, id_query_ctype, reset_device_ctype, option_string_ctype, ctypes.pointer(vi_ctype))
+        resource_name_ctype = resource_name.encode(self._encoding)  # case 3
+        id_query_ctype = _scalar_ctypes.InitWithOptions_id_query
+        id_query_ctype.value = id_query  # case 8
+        reset_device_ctype = _scalar_ctypes.InitWithOptions_reset_device
+        reset_device_ctype.value = reset_device  # case 8
+        option_string_ctype = option_string.encode(self._encoding)  # case 3
+        vi_ctype = _scalar_ctypes.InitWithOptions_vi  # case 13
+        error_code = self._library.niScope_InitWithOptions(resource_name_ctype, id_query_ctype, reset_device_ctype, option_string_ctype, _scalar_ctypes.InitWithOptions_vi_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(vi_ctype.value)
 
@@ -4056,7 +5543,7 @@ class Session(_SessionBase):
         waits for a trigger. The digitizer acquires a waveform for each channel
         you enable with configure_vertical.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niScope_InitiateAcquisition(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -4087,10 +5574,11 @@ class Session(_SessionBase):
                   sample the voltage.
                 | VI_FALSE—The element value is a valid voltage.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        element_value_ctype = visatype.ViReal64(element_value)  # case 8
-        is_invalid_ctype = visatype.ViBoolean()  # case 13
-        error_code = self._library.niScope_IsInvalidWfmElement(vi_ctype, element_value_ctype, ctypes.pointer(is_invalid_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        element_value_ctype = _scalar_ctypes.IsInvalidWfmElement_element_value
+        element_value_ctype.value = element_value  # case 8
+        is_invalid_ctype = _scalar_ctypes.IsInvalidWfmElement_is_invalid  # case 13
+        error_code = self._library.niScope_IsInvalidWfmElement(vi_ctype, element_value_ctype, _scalar_ctypes.IsInvalidWfmElement_is_invalid_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return bool(is_invalid_ctype.value)
 
@@ -4099,7 +5587,7 @@ class Session(_SessionBase):
 
         Starts the 1 kHz square wave output on PFI 1 for probe compensation.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niScope_ProbeCompensationSignalStart(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -4109,12 +5597,12 @@ class Session(_SessionBase):
 
         Stops the 1 kHz square wave output on PFI 1 for probe compensation.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niScope_ProbeCompensationSignalStop(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
-    def read_waveform(self, channel, waveform_size, max_time):
+    def read_waveform(self, channel, waveform_size, max_time, array_type='list'):
         '''read_waveform
 
         Initiates an acquisition on the channels that you enable with
@@ -4149,9 +5637,10 @@ class Session(_SessionBase):
                 | Other Defined Values
                 | NISCOPE_VAL_MAX_TIME_NONE
                 | NISCOPE_VAL_MAX_TIME_INFINITE
+            array_type (str): Selects how arrays are returned: 'list', 'array' for array.array or 'numpy' for numpy.ndarray. A numpy.ndarray shares memory with the buffer filled by the driver, so nothing is copied.
 
         Returns:
-            waveform (list of float): Returns the waveform that the digitizer acquires.
+            waveform (list, array.array or numpy.ndarray of float): Returns the waveform that the digitizer acquires.
                 Units: volts
             actual_points (int): Indicates the actual number of points the function placed in the
                 **waveform** array.
@@ -4168,17 +5657,88 @@ class Session(_SessionBase):
 
                 Units: seconds
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_ctype = ctypes.create_string_buffer(channel.encode(self._encoding))  # case 3
-        waveform_size_ctype = visatype.ViInt32(waveform_size)  # case 8
-        max_time_ctype = visatype.ViInt32(max_time)  # case 8
-        waveform_ctype = (visatype.ViReal64 * 1)()  # case 10
-        actual_points_ctype = visatype.ViInt32()  # case 13
-        initial_x_ctype = visatype.ViReal64()  # case 13
-        x_increment_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niScope_ReadWaveform(vi_ctype, channel_ctype, waveform_size_ctype, max_time_ctype, waveform_ctype, ctypes.pointer(actual_points_ctype), ctypes.pointer(initial_x_ctype), ctypes.pointer(x_increment_ctype))
+        _converters.check_array_type(array_type)
+        vi_ctype = self._vi_ctype  # case 1
+        channel_ctype = channel.encode(self._encoding)  # case 3
+        waveform_size_ctype = visatype.ViInt32(waveform_size)  # case 7
+        max_time_ctype = _scalar_ctypes.ReadWaveform_max_time
+        max_time_ctype.value = max_time  # case 8
+        waveform_ctype = (visatype.ViReal64 * waveform_size)()  # case 12
+        actual_points_ctype = _scalar_ctypes.ReadWaveform_actual_points  # case 13
+        initial_x_ctype = _scalar_ctypes.ReadWaveform_initial_x  # case 13
+        x_increment_ctype = _scalar_ctypes.ReadWaveform_x_increment  # case 13
+        error_code = self._library.niScope_ReadWaveform(vi_ctype, channel_ctype, waveform_size_ctype, max_time_ctype, waveform_ctype, _scalar_ctypes.ReadWaveform_actual_points_pointer, _scalar_ctypes.ReadWaveform_initial_x_pointer, _scalar_ctypes.ReadWaveform_x_increment_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return [float(waveform_ctype[i]) for i in range(1)], int(actual_points_ctype.value), float(initial_x_ctype.value), float(x_increment_ctype.value)
+        return _converters.convert_from_ctypes_array(waveform_ctype, waveform_size_ctype.value, float, array_type), int(actual_points_ctype.value), float(initial_x_ctype.value), float(x_increment_ctype.value)
+
+    def read_waveform_into(self, channel, max_time, waveform):
+        '''read_waveform_into
+
+        Same as read_waveform, but the driver writes **waveform** directly into a buffer you allocate, such as a numpy.ndarray or array.array. Nothing is copied and no list is created.
+
+
+        Initiates an acquisition on the channels that you enable with
+        configure_vertical. This function then waits for the acquisition
+        to complete and returns the waveform for the channel you specify. Call
+        fetch_waveform to obtain the waveforms for each of the remaining
+        enabled channels without initiating another acquisition.
+
+        Use actual_record_length to determine the required size for the
+        **waveform** array.
+
+        Note:
+        This function is included for compliance with the IviScope Class
+        Specification.
+
+        Args:
+            channel (string): The channel to configure. For more information, refer to `channel String
+                Syntax <REPLACE_DRIVER_SPECIFIC_URL_2(scopefunc.chm','cvichannelstringsyntaxforc)>`__.
+
+                Default Value: "0"
+            max_time (int): Pass the maximum length of time in which to allow the read waveform
+                operation to complete.
+
+                If the operation does not complete within this time interval, the
+                function returns the NISCOPE_ERROR_MAX_TIME_EXCEEDED error code.
+                When this occurs, you can call _abort to cancel the read
+                waveform operation and return the digitizer to the idle state.
+
+                Units: milliseconds
+
+                | Other Defined Values
+                | NISCOPE_VAL_MAX_TIME_NONE
+                | NISCOPE_VAL_MAX_TIME_INFINITE
+            waveform (writable buffer of float): Returns the waveform that the digitizer acquires.
+                Units: volts
+
+        Returns:
+            actual_points (int): Indicates the actual number of points the function placed in the
+                **waveform** array.
+            initial_x (float): Indicates the time of the first point in the **waveform** array relative
+                to the Reference Position.
+
+                Units: seconds
+
+                For example, if the digitizer acquires the first point in the
+                **waveform** array 1 second before the trigger, this parameter returns
+                the value –1.0. If the acquisition of the first point occurs at the same
+                time as the trigger, this parameter returns the value 0.0.
+            x_increment (float): Indicates the length of time between points in the **waveform** array.
+
+                Units: seconds
+        '''
+        vi_ctype = self._vi_ctype  # case 1
+        channel_ctype = channel.encode(self._encoding)  # case 3
+        waveform_size_ctype = visatype.ViInt32(len(waveform))  # case 5
+        max_time_ctype = _scalar_ctypes.ReadWaveform_max_time
+        max_time_ctype.value = max_time  # case 8
+        waveform_ctype = _converters.get_ctypes_array_for_buffer(waveform, visatype.ViReal64, 'waveform')  # case 14
+        actual_points_ctype = _scalar_ctypes.ReadWaveform_actual_points  # case 13
+        initial_x_ctype = _scalar_ctypes.ReadWaveform_initial_x  # case 13
+        x_increment_ctype = _scalar_ctypes.ReadWaveform_x_increment  # case 13
+        error_code = self._library.niScope_ReadWaveform(vi_ctype, channel_ctype, waveform_size_ctype, max_time_ctype, waveform_ctype, _scalar_ctypes.ReadWaveform_actual_points_pointer, _scalar_ctypes.ReadWaveform_initial_x_pointer, _scalar_ctypes.ReadWaveform_x_increment_pointer)
+        errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        return int(actual_points_ctype.value), float(initial_x_ctype.value), float(x_increment_ctype.value)
 
     def read_waveform_measurement(self, channel, meas_function, max_time):
         '''read_waveform_measurement
@@ -4227,12 +5787,14 @@ class Session(_SessionBase):
         Returns:
             measurement (float): The measured value.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_ctype = ctypes.create_string_buffer(channel.encode(self._encoding))  # case 3
-        meas_function_ctype = visatype.ViInt32(meas_function)  # case 8
-        max_time_ctype = visatype.ViInt32(max_time)  # case 8
-        measurement_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niScope_ReadWaveformMeasurement(vi_ctype, channel_ctype, meas_function_ctype, max_time_ctype, ctypes.pointer(measurement_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_ctype = channel.encode(self._encoding)  # case 3
+        meas_function_ctype = _scalar_ctypes.ReadWaveformMeasurement_meas_function
+        meas_function_ctype.value = meas_function  # case 8
+        max_time_ctype = _scalar_ctypes.ReadWaveformMeasurement_max_time
+        max_time_ctype.value = max_time  # case 8
+        measurement_ctype = _scalar_ctypes.ReadWaveformMeasurement_measurement  # case 13
+        error_code = self._library.niScope_ReadWaveformMeasurement(vi_ctype, channel_ctype, meas_function_ctype, max_time_ctype, _scalar_ctypes.ReadWaveformMeasurement_measurement_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(measurement_ctype.value)
 
@@ -4246,9 +5808,10 @@ class Session(_SessionBase):
 
         -  `Thermal Shutdown <digitizers.chm::/Thermal_Shutdown.html>`__
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niScope_ResetDevice(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def reset_with_defaults(self):
@@ -4258,9 +5821,10 @@ class Session(_SessionBase):
         state and applying any initial default settings from the IVI
         Configuration Store.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niScope_ResetWithDefaults(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def sample_rate(self):
@@ -4277,9 +5841,9 @@ class Session(_SessionBase):
                 acquires for each channel; the driver returns the value held in the
                 HORZ_SAMPLE_RATE attribute.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        sample_rate_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niScope_SampleRate(vi_ctype, ctypes.pointer(sample_rate_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        sample_rate_ctype = _scalar_ctypes.SampleRate_sample_rate  # case 13
+        error_code = self._library.niScope_SampleRate(vi_ctype, _scalar_ctypes.SampleRate_sample_rate_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(sample_rate_ctype.value)
 
@@ -4293,7 +5857,7 @@ class Session(_SessionBase):
         This function is included for compliance with the IviScope Class
         Specification. Consider using send_software_trigger_edge instead.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niScope_SendSWTrigger(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -4319,12 +5883,42 @@ class Session(_SessionBase):
                 | NISCOPE_VAL_SOFTWARE_TRIGGER_REFERENCE (2L)
                 | NISCOPE_VAL_SOFTWARE_TRIGGER_ADVANCE (3L)
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        which_trigger_ctype = visatype.ViInt32(which_trigger)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        which_trigger_ctype = _scalar_ctypes.SendSoftwareTriggerEdge_which_trigger
+        which_trigger_ctype.value = which_trigger  # case 8
         error_code = self._library.niScope_SendSoftwareTriggerEdge(vi_ctype, which_trigger_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
 
+    def stream(self, channels, chunk_size, record_number=0, num_records=-1, timeout=5.0):
+        '''stream
+
+        Generator that fetches an acquisition while it is still in progress, one chunk of each record at a time.
+
+        Each item is a StreamChunk named tuple of (record_number, offset, waveforms), where **offset** is the
+        index of the first sample of the chunk within the record and **waveforms** has one ctypes array of
+        visatype.ViReal64 per channel, in the order of **channels**. Use numpy.frombuffer() to wrap a waveform
+        without copying it.
+
+        Chunks are fetched into two sets of buffers allocated once, and used in turn, so a chunk stays valid
+        until the next one is requested. Copy the data to keep it longer.
+
+        The generator waits for each chunk by polling points_done, so it keeps up with acquisitions that
+        don't fit in onboard memory (allow_more_records_than_memory set to True), as long as the data is
+        fetched faster than the digitizer overwrites it.
+
+        Note:
+        This method sets fetch_relative_to, fetch_offset, fetch_record_number and fetch_num_records.
+
+        Args:
+            channels (string): Comma-separated list, or Python list, of the channels to fetch. Each entry must name a single channel.
+            chunk_size (int): Maximum number of samples to fetch per channel in each chunk.
+            record_number (int): Zero-based index of the first record to fetch.
+            num_records (int): Number of records to fetch. Use -1 to fetch all records from **record_number** to the last configured record.
+            timeout (float): Maximum time, in seconds, to wait for the samples of each chunk to be acquired.
+        '''
+        return _streaming.stream(self, channels, chunk_size, record_number, num_records, timeout)
+
     def _close(self):
         '''_close
 
@@ -4335,7 +5929,7 @@ class Session(_SessionBase):
         -  Destroys the IVI session and all of its attributes.
         -  Deallocates any memory resources used by the IVI session.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niScope_close(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -4367,8 +5961,9 @@ class Session(_SessionBase):
                 you must pass a ViChar array at least MAX_ERROR_DESCRIPTION bytes in
                 length.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        error_code_ctype = visatype.ViInt32(error_code)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        error_code_ctype = _scalar_ctypes.errorHandler_error_code
+        error_code_ctype.value = error_code  # case 8
         error_source_ctype = (visatype.ViChar * 1)()  # case 10
         error_description_ctype = (visatype.ViChar * 1)()  # case 10
         error_code = self._library.niScope_errorHandler(vi_ctype, error_code_ctype, error_source_ctype, error_description_ctype)
@@ -4382,9 +5977,10 @@ class Session(_SessionBase):
         reset to their `default
         states <REPLACE_DRIVER_SPECIFIC_URL_2(scopefunc.chm','cviattribute_defaults)>`__.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niScope_reset(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def self_test(self):
@@ -4405,11 +6001,12 @@ class Session(_SessionBase):
                 you must pass a ViChar array at least IVI_MAX_MESSAGE_BUF_SIZE bytes
                 in length.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        self_test_result_ctype = visatype.ViInt16()  # case 13
+        vi_ctype = self._vi_ctype  # case 1
+        self_test_result_ctype = _scalar_ctypes.self_test_self_test_result  # case 13
         self_test_message_ctype = (visatype.ViChar * 256)()  # case 10
-        error_code = self._library.niScope_self_test(vi_ctype, ctypes.pointer(self_test_result_ctype), self_test_message_ctype)
+        error_code = self._library.niScope_self_test(vi_ctype, _scalar_ctypes.self_test_self_test_result_pointer, self_test_message_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return int(self_test_result_ctype.value), self_test_message_ctype.value.decode(self._encoding)
 
 
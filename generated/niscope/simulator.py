@@ -0,0 +1,791 @@
+# This file was generated
+'''Simulated NI-SCOPE runtime, for testing and benchmarking without hardware.'''
+
+from niscope import _simulation
+
+
+# (name, direction, type, is_buffer, size mechanism, index of the size parameter, default value) of every parameter of every function
+_functions = {
+    'niScope_Abort': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niScope_AcquisitionStatus': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('acquisitionStatus', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niScope_ActualMeasWfmSize': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('arrayMeasFunction', 'in', 'ViInt32', False, None, None, None),
+        ('measWaveformSize', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niScope_ActualNumWfms': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('numWfms', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niScope_ActualRecordLength': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('recordLength', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niScope_AddWaveformProcessing': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('measFunction', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niScope_AdjustSampleClockRelativeDelay': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Delay', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_AutoSetup': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niScope_CalSelfCalibrate': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Option', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niScope_CheckAttributeViBoolean': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('Value', 'in', 'ViBoolean', False, None, None, None),
+    ),
+    'niScope_CheckAttributeViInt32': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('Value', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niScope_CheckAttributeViInt64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('Value', 'in', 'ViInt64', False, None, None, None),
+    ),
+    'niScope_CheckAttributeViReal64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('Value', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_CheckAttributeViSession': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('Value', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niScope_CheckAttributeViString': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('Value', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niScope_ClearWaveformMeasurementStats': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('clearableMeasurementFunction', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niScope_ClearWaveformProcessing': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niScope_Commit': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niScope_ConfigureAcquisition': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('acquisitionType', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niScope_ConfigureAcquisitionRecord': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('timePerRecord', 'in', 'ViReal64', False, None, None, None),
+        ('minNumPoints', 'in', 'ViInt32', False, None, None, None),
+        ('acquisitionStartTime', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_ConfigureChanCharacteristics': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('inputImpedance', 'in', 'ViReal64', False, None, None, None),
+        ('maxInputFrequency', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_ConfigureChannel': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Channel', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Range', 'in', 'ViReal64', False, None, None, None),
+        ('Offset', 'in', 'ViReal64', False, None, None, None),
+        ('Coupling', 'in', 'ViInt32', False, None, None, None),
+        ('probeAttenuation', 'in', 'ViReal64', False, None, None, None),
+        ('Enabled', 'in', 'ViBoolean', False, None, None, None),
+    ),
+    'niScope_ConfigureClock': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('inputClockSource', 'in', 'ViChar', True, 'fixed', None, None),
+        ('outputClockSource', 'in', 'ViChar', True, 'fixed', None, None),
+        ('clockSyncPulseSource', 'in', 'ViChar', True, 'fixed', None, None),
+        ('masterEnabled', 'in', 'ViBoolean', False, None, None, None),
+    ),
+    'niScope_ConfigureEdgeTriggerSource': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Source', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Level', 'in', 'ViReal64', False, None, None, None),
+        ('Slope', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niScope_ConfigureEqualizationFilterCoefficients': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('numberOfCoefficients', 'in', 'ViInt32', False, None, None, None),
+        ('Coefficients', 'in', 'ViReal64', True, 'fixed', None, None),
+    ),
+    'niScope_ConfigureHorizontalTiming': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('minSampleRate', 'in', 'ViReal64', False, None, None, None),
+        ('minNumPts', 'in', 'ViInt32', False, None, None, None),
+        ('refPosition', 'in', 'ViReal64', False, None, None, None),
+        ('numRecords', 'in', 'ViInt32', False, None, None, None),
+        ('enforceRealtime', 'in', 'ViBoolean', False, None, None, None),
+    ),
+    'niScope_ConfigureRefLevels': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Low', 'in', 'ViReal64', False, None, None, None),
+        ('Mid', 'in', 'ViReal64', False, None, None, None),
+        ('High', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_ConfigureTVTriggerLineNumber': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('lineNumber', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niScope_ConfigureTVTriggerSource': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Source', 'in', 'ViChar', True, 'fixed', None, None),
+        ('signalFormat', 'in', 'ViInt32', False, None, None, None),
+        ('Event', 'in', 'ViInt32', False, None, None, None),
+        ('Polarity', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niScope_ConfigureTrigger': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('triggerType', 'in', 'ViInt32', False, None, None, None),
+        ('Holdoff', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_ConfigureTriggerCoupling': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Coupling', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niScope_ConfigureTriggerDigital': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('triggerSource', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Slope', 'in', 'ViInt32', False, None, None, None),
+        ('Holdoff', 'in', 'ViReal64', False, None, None, None),
+        ('Delay', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_ConfigureTriggerEdge': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('triggerSource', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Level', 'in', 'ViReal64', False, None, None, None),
+        ('Slope', 'in', 'ViInt32', False, None, None, None),
+        ('triggerCoupling', 'in', 'ViInt32', False, None, None, None),
+        ('Holdoff', 'in', 'ViReal64', False, None, None, None),
+        ('Delay', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_ConfigureTriggerHysteresis': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('triggerSource', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Level', 'in', 'ViReal64', False, None, None, None),
+        ('Hysteresis', 'in', 'ViReal64', False, None, None, None),
+        ('Slope', 'in', 'ViInt32', False, None, None, None),
+        ('triggerCoupling', 'in', 'ViInt32', False, None, None, None),
+        ('Holdoff', 'in', 'ViReal64', False, None, None, None),
+        ('Delay', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_ConfigureTriggerImmediate': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niScope_ConfigureTriggerOutput': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('triggerEvent', 'in', 'ViInt32', False, None, None, None),
+        ('triggerOutput', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niScope_ConfigureTriggerSoftware': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Holdoff', 'in', 'ViReal64', False, None, None, None),
+        ('Delay', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_ConfigureTriggerVideo': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('triggerSource', 'in', 'ViChar', True, 'fixed', None, None),
+        ('enableDcRestore', 'in', 'ViBoolean', False, None, None, None),
+        ('signalFormat', 'in', 'ViInt32', False, None, None, None),
+        ('Event', 'in', 'ViInt32', False, None, None, None),
+        ('lineNumber', 'in', 'ViInt32', False, None, None, None),
+        ('Polarity', 'in', 'ViInt32', False, None, None, None),
+        ('triggerCoupling', 'in', 'ViInt32', False, None, None, None),
+        ('Holdoff', 'in', 'ViReal64', False, None, None, None),
+        ('Delay', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_ConfigureTriggerWindow': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('triggerSource', 'in', 'ViChar', True, 'fixed', None, None),
+        ('lowLevel', 'in', 'ViReal64', False, None, None, None),
+        ('highLevel', 'in', 'ViReal64', False, None, None, None),
+        ('windowMode', 'in', 'ViInt32', False, None, None, None),
+        ('triggerCoupling', 'in', 'ViInt32', False, None, None, None),
+        ('Holdoff', 'in', 'ViReal64', False, None, None, None),
+        ('Delay', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_ConfigureVertical': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Range', 'in', 'ViReal64', False, None, None, None),
+        ('Offset', 'in', 'ViReal64', False, None, None, None),
+        ('Coupling', 'in', 'ViInt32', False, None, None, None),
+        ('probeAttenuation', 'in', 'ViReal64', False, None, None, None),
+        ('Enabled', 'in', 'ViBoolean', False, None, None, None),
+    ),
+    'niScope_Disable': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niScope_ExportSignal': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Signal', 'in', 'ViInt32', False, None, None, None),
+        ('signalIdentifier', 'in', 'ViChar', True, 'fixed', None, None),
+        ('outputTerminal', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niScope_Fetch': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Timeout', 'in', 'ViReal64', False, None, None, None),
+        ('numSamples', 'in', 'ViInt32', False, None, None, None),
+        ('Wfm', 'out', 'ViReal64', True, 'python-code', None, None),
+        ('wfmInfo', 'out', 'niScope_wfmInfo', True, 'python-code', None, None),
+    ),
+    'niScope_FetchBinary16': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Timeout', 'in', 'ViReal64', False, None, None, None),
+        ('numSamples', 'in', 'ViInt32', False, None, None, None),
+        ('Wfm', 'out', 'ViInt16', True, 'python-code', None, None),
+        ('wfmInfo', 'out', 'niScope_wfmInfo', True, 'python-code', None, None),
+    ),
+    'niScope_FetchBinary32': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Timeout', 'in', 'ViReal64', False, None, None, None),
+        ('numSamples', 'in', 'ViInt32', False, None, None, None),
+        ('Wfm', 'out', 'ViInt32', True, 'python-code', None, None),
+        ('wfmInfo', 'out', 'niScope_wfmInfo', True, 'python-code', None, None),
+    ),
+    'niScope_FetchBinary8': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Timeout', 'in', 'ViReal64', False, None, None, None),
+        ('numSamples', 'in', 'ViInt32', False, None, None, None),
+        ('Wfm', 'out', 'ViInt8', True, 'python-code', None, None),
+        ('wfmInfo', 'out', 'niScope_wfmInfo', True, 'python-code', None, None),
+    ),
+    'niScope_FetchMeasurement': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Timeout', 'in', 'ViReal64', False, None, None, None),
+        ('scalarMeasFunction', 'in', 'ViInt32', False, None, None, None),
+        ('Result', 'out', 'ViReal64', True, 'fixed', None, None),
+    ),
+    'niScope_FetchMeasurementStats': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Timeout', 'in', 'ViReal64', False, None, None, None),
+        ('scalarMeasFunction', 'in', 'ViInt32', False, None, None, None),
+        ('Result', 'out', 'ViReal64', True, 'fixed', None, None),
+        ('Mean', 'out', 'ViReal64', True, 'fixed', None, None),
+        ('Stdev', 'out', 'ViReal64', True, 'fixed', None, None),
+        ('Min', 'out', 'ViReal64', True, 'fixed', None, None),
+        ('Max', 'out', 'ViReal64', True, 'fixed', None, None),
+        ('numInStats', 'out', 'ViInt32', True, 'fixed', None, None),
+    ),
+    'niScope_FetchWaveform': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Channel', 'in', 'ViChar', True, 'fixed', None, None),
+        ('waveformSize', 'in', 'ViInt32', False, None, None, None),
+        ('Waveform', 'out', 'ViReal64', True, 'passed-in', 2, None),
+        ('actualPoints', 'out', 'ViInt32', False, None, None, None),
+        ('initialX', 'out', 'ViReal64', False, None, None, None),
+        ('xIncrement', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_FetchWaveformMeasurement': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Channel', 'in', 'ViChar', True, 'fixed', None, None),
+        ('measFunction', 'in', 'ViInt32', False, None, None, None),
+        ('Measurement', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_GetAttributeViBoolean': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('Value', 'out', 'ViBoolean', False, None, None, None),
+    ),
+    'niScope_GetAttributeViInt32': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('Value', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niScope_GetAttributeViInt64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('Value', 'out', 'ViInt64', False, None, None, None),
+    ),
+    'niScope_GetAttributeViReal64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('Value', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_GetAttributeViString': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('bufSize', 'in', 'ViInt32', False, None, None, None),
+        ('Value', 'out', 'ViChar', True, 'ivi-dance', 3, None),
+    ),
+    'niScope_GetChannelName': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Index', 'in', 'ViInt32', False, None, None, None),
+        ('bufferSize', 'in', 'ViInt32', False, None, None, None),
+        ('channelString', 'out', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niScope_GetEqualizationFilterCoefficients': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channel', 'in', 'ViChar', True, 'fixed', None, None),
+        ('numberOfCoefficients', 'in', 'ViInt32', False, None, None, None),
+        ('Coefficients', 'out', 'ViReal64', True, 'fixed', None, None),
+    ),
+    'niScope_GetError': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('errorCode', 'out', 'ViStatus', False, None, None, None),
+        ('bufferSize', 'in', 'ViInt32', False, None, None, None),
+        ('Description', 'out', 'ViChar', True, 'ivi-dance', 2, None),
+    ),
+    'niScope_GetErrorMessage': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('errorCode', 'in', 'ViStatus', False, None, None, None),
+        ('Buffer_Size', 'in', 'ViInt32', False, None, None, None),
+        ('errorMessage', 'out', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niScope_GetFrequencyResponse': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channel', 'in', 'ViChar', True, 'fixed', None, None),
+        ('bufferSize', 'in', 'ViInt32', False, None, None, None),
+        ('frequencies', 'in', 'ViReal64', True, 'fixed', None, None),
+        ('amplitudes', 'in', 'ViReal64', True, 'fixed', None, None),
+        ('phases', 'in', 'ViReal64', True, 'fixed', None, None),
+        ('numberOfFrequencies', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niScope_GetStreamEndpointHandle': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('streamName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('writerHandle', 'out', 'ViUInt32', False, None, None, None),
+    ),
+    'niScope_InitWithOptions': (
+        ('resourceName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('idQuery', 'in', 'ViBoolean', False, None, None, None),
+        ('resetDevice', 'in', 'ViBoolean', False, None, None, None),
+        ('optionString', 'in', 'ViChar', True, 'fixed', None, None),
+        ('vi', 'out', 'ViSession', False, None, None, None),
+    ),
+    'niScope_InitiateAcquisition': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niScope_IsDeviceReady': (
+        ('resourceName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('deviceReady', 'out', 'ViBoolean', False, None, None, None),
+    ),
+    'niScope_IsInvalidWfmElement': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('elementValue', 'in', 'ViReal64', False, None, None, None),
+        ('isInvalid', 'out', 'ViBoolean', False, None, None, None),
+    ),
+    'niScope_ProbeCompensationSignalStart': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niScope_ProbeCompensationSignalStop': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niScope_ReadMeasurement': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Timeout', 'in', 'ViReal64', False, None, None, None),
+        ('scalarMeasFunction', 'in', 'ViInt32', False, None, None, None),
+        ('Result', 'out', 'ViReal64', True, 'fixed', None, None),
+    ),
+    'niScope_ReadWaveform': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Channel', 'in', 'ViChar', True, 'fixed', None, None),
+        ('waveformSize', 'in', 'ViInt32', False, None, None, None),
+        ('MaxTime', 'in', 'ViInt32', False, None, None, None),
+        ('Waveform', 'out', 'ViReal64', True, 'passed-in', 2, None),
+        ('actualPoints', 'out', 'ViInt32', False, None, None, None),
+        ('initialX', 'out', 'ViReal64', False, None, None, None),
+        ('xIncrement', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_ReadWaveformMeasurement': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Channel', 'in', 'ViChar', True, 'fixed', None, None),
+        ('measFunction', 'in', 'ViInt32', False, None, None, None),
+        ('maxTime', 'in', 'ViInt32', False, None, None, None),
+        ('Measurement', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_ResetDevice': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niScope_ResetWithDefaults': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niScope_SampleRate': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('sampleRate', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_SendSWTrigger': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niScope_SendSoftwareTriggerEdge': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('whichTrigger', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niScope_SetAttributeViBoolean': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('Value', 'in', 'ViBoolean', False, None, None, None),
+    ),
+    'niScope_SetAttributeViInt32': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('Value', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niScope_SetAttributeViInt64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('Value', 'in', 'ViInt64', False, None, None, None),
+    ),
+    'niScope_SetAttributeViReal64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('Value', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niScope_SetAttributeViString': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelList', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('Value', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niScope_close': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niScope_errorHandler': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('errorCode', 'in', 'ViInt32', False, None, None, None),
+        ('errorSource', 'out', 'ViChar', True, 'fixed', None, None),
+        ('errorDescription', 'out', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niScope_reset': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niScope_self_test': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('selfTestResult', 'out', 'ViInt16', False, None, None, None),
+        ('selfTestMessage', 'out', 'ViChar', True, 'fixed', None, None),
+    ),
+}
+
+# Value of every attribute until it is set
+_attributes = {
+    1050002: False,  # RANGE_CHECK
+    1050003: False,  # QUERY_INSTRUMENT_STATUS
+    1050004: False,  # CACHE
+    1050005: False,  # SIMULATE
+    1050006: False,  # RECORD_COERCIONS
+    1050007: '',  # DRIVER_SETUP
+    1050021: False,  # INTERCHANGE_CHECK
+    1050203: 0,  # CHANNEL_COUNT
+    1050302: '',  # SPECIFIC_DRIVER_PREFIX
+    1050304: '',  # IO_RESOURCE_DESCRIPTOR
+    1050305: '',  # LOGICAL_NAME
+    1050327: '',  # SUPPORTED_INSTRUMENT_MODELS
+    1050401: '',  # GROUP_CAPABILITIES
+    1050510: '',  # INSTRUMENT_FIRMWARE_REVISION
+    1050511: '',  # INSTRUMENT_MANUFACTURER
+    1050512: '',  # INSTRUMENT_MODEL
+    1050513: '',  # SPECIFIC_DRIVER_VENDOR
+    1050514: '',  # SPECIFIC_DRIVER_DESCRIPTION
+    1050515: 0,  # SPECIFIC_DRIVER_CLASS_SPEC_MAJOR_VERSION
+    1050516: 0,  # SPECIFIC_DRIVER_CLASS_SPEC_MINOR_VERSION
+    1050551: '',  # SPECIFIC_DRIVER_REVISION
+    1150001: 1,  # HORZ_NUM_RECORDS
+    1150002: '',  # INPUT_CLOCK_SOURCE
+    1150003: '',  # OUTPUT_CLOCK_SOURCE
+    1150004: 0,  # HORZ_ENFORCE_REALTIME
+    1150005: 16,  # BINARY_SAMPLE_WIDTH
+    1150006: 0.0,  # TRIGGER_HYSTERESIS
+    1150007: '',  # CLOCK_SYNC_PULSE_SOURCE
+    1150008: False,  # MASTER_ENABLE
+    1150009: 0.0,  # MIN_SAMPLE_RATE
+    1150012: 0,  # TRIGGER_WINDOW_MODE
+    1150013: 0.0,  # TRIGGER_WINDOW_LOW_LEVEL
+    1150014: 0.0,  # TRIGGER_WINDOW_HIGH_LEVEL
+    1150016: 0,  # MEAS_REF_LEVEL_UNITS
+    1150018: '',  # MEAS_OTHER_CHANNEL
+    1150019: 0.0,  # MEAS_HYSTERESIS_PERCENT
+    1150020: 0,  # MEAS_LAST_ACQ_HISTOGRAM_SIZE
+    1150021: 0,  # MEAS_VOLTAGE_HISTOGRAM_SIZE
+    1150022: 0.0,  # MEAS_VOLTAGE_HISTOGRAM_LOW_VOLTS
+    1150023: 0.0,  # MEAS_VOLTAGE_HISTOGRAM_HIGH_VOLTS
+    1150024: 0,  # MEAS_TIME_HISTOGRAM_SIZE
+    1150025: 0.0,  # MEAS_TIME_HISTOGRAM_LOW_VOLTS
+    1150026: 0.0,  # MEAS_TIME_HISTOGRAM_HIGH_VOLTS
+    1150027: 0.0,  # MEAS_TIME_HISTOGRAM_LOW_TIME
+    1150028: 0.0,  # MEAS_TIME_HISTOGRAM_HIGH_TIME
+    1150029: 0,  # MEAS_POLYNOMIAL_INTERPOLATION_ORDER
+    1150030: 0.0,  # MEAS_INTERPOLATION_SAMPLING_FACTOR
+    1150031: 0.0,  # MEAS_FILTER_CUTOFF_FREQ
+    1150032: 0.0,  # MEAS_FILTER_CENTER_FREQ
+    1150033: 0.0,  # MEAS_FILTER_RIPPLE
+    1150034: 0.0,  # MEAS_FILTER_TRANSIENT_WAVEFORM_PERCENT
+    1150035: 0,  # MEAS_FILTER_TYPE
+    1150036: 0,  # MEAS_FILTER_ORDER
+    1150037: 0,  # MEAS_FILTER_TAPS
+    1150038: 0.0,  # MEAS_CHAN_LOW_REF_LEVEL
+    1150039: 0.0,  # MEAS_CHAN_MID_REF_LEVEL
+    1150040: 0.0,  # MEAS_CHAN_HIGH_REF_LEVEL
+    1150041: 0.0,  # MEAS_FILTER_WIDTH
+    1150042: 0,  # MEAS_FIR_FILTER_WINDOW
+    1150043: 0.0,  # MEAS_ARRAY_GAIN
+    1150044: 0.0,  # MEAS_ARRAY_OFFSET
+    1150045: 0,  # MEAS_PERCENTAGE_METHOD
+    1150046: 0.0,  # SLAVE_TRIGGER_DELAY
+    1150047: 0.0,  # TRIGGER_TO_STAR_DELAY
+    1150048: 0.0,  # TRIGGER_TO_RTSI_DELAY
+    1150049: 0.0,  # TRIGGER_TO_PFI_DELAY
+    1150050: 0.0,  # TRIGGER_FROM_STAR_DELAY
+    1150051: 0.0,  # TRIGGER_FROM_RTSI_DELAY
+    1150052: 0.0,  # TRIGGER_FROM_PFI_DELAY
+    1150053: '',  # ACQ_ARM_SOURCE
+    1150065: '',  # RECORD_ARM_SOURCE
+    1150068: False,  # ALLOW_MORE_RECORDS_THAN_MEMORY
+    1150069: 0,  # ONBOARD_MEMORY_SIZE
+    1150070: 0,  # RIS_NUM_AVERAGES
+    1150071: 1,  # RIS_METHOD
+    1150072: False,  # FETCH_INTERLEAVED_DATA
+    1150073: 0.0,  # MAX_REAL_TIME_SAMPLING_RATE
+    1150074: 0.0,  # MAX_RIS_RATE
+    1150075: 0.0,  # TRIGGER_IMPEDANCE
+    1150076: 0,  # DEVICE_NUMBER
+    1150077: 388,  # FETCH_RELATIVE_TO
+    1150078: 0,  # FETCH_OFFSET
+    1150079: 0,  # FETCH_RECORD_NUMBER
+    1150080: 0,  # FETCH_NUM_RECORDS
+    1150081: 0,  # FETCH_MEAS_NUM_SAMPLES
+    1150082: 1000.0,  # POINTS_DONE
+    1150083: 0,  # RECORDS_DONE
+    1150084: 0.0,  # BACKLOG
+    1150085: False,  # 5102_ADJUST_PRETRIGGER_SAMPLES
+    1150086: 0.0,  # DEVICE_TEMPERATURE
+    1150087: '',  # SAMP_CLK_TIMEBASE_SRC
+    1150088: 0.0,  # SAMP_CLK_TIMEBASE_RATE
+    1150089: 0,  # SAMP_CLK_TIMEBASE_DIV
+    1150090: 0.0,  # REF_CLK_RATE
+    1150091: '',  # EXPORTED_SAMPLE_CLOCK_OUTPUT_TERMINAL
+    1150093: False,  # ENABLE_DC_RESTORE
+    1150094: '',  # ADV_TRIG_SRC
+    1150095: '',  # ARM_REF_TRIG_SRC
+    1150096: False,  # REF_TRIG_TDC_ENABLE
+    1150097: '',  # EXPORTED_START_TRIGGER_OUTPUT_TERMINAL
+    1150098: '',  # EXPORTED_REF_TRIGGER_OUTPUT_TERMINAL
+    1150099: '',  # END_OF_RECORD_EVENT_OUTPUT_TERMINAL
+    1150100: 0,  # POLL_INTERVAL
+    1150101: '',  # END_OF_ACQUISITION_EVENT_OUTPUT_TERMINAL
+    1150102: 0,  # RESOLUTION
+    1150103: 0.0,  # START_TO_REF_TRIGGER_HOLDOFF
+    1150104: '',  # SERIAL_NUMBER
+    1150105: 0,  # OSCILLATOR_PHASE_DAC_VALUE
+    1150106: False,  # RIS_IN_AUTO_SETUP_ENABLE
+    1150107: 0,  # CHANNEL_TERMINAL_CONFIGURATION
+    1150109: '',  # EXPORTED_ADVANCE_TRIGGER_OUTPUT_TERMINAL
+    1150110: '',  # READY_FOR_START_EVENT_OUTPUT_TERMINAL
+    1150111: '',  # READY_FOR_REF_EVENT_OUTPUT_TERMINAL
+    1150112: '',  # READY_FOR_ADVANCE_EVENT_OUTPUT_TERMINAL
+    1150128: 0,  # ENABLE_TIME_INTERLEAVED_SAMPLING
+    1150129: '',  # 5V_OUT_OUTPUT_TERMINAL
+    1150271: 0,  # FLEX_FIR_ANTIALIAS_FILTER_TYPE
+    1150278: False,  # TRIGGER_AUTO_TRIGGERED
+    1150279: 0.0,  # ACCESSORY_GAIN
+    1150280: 0.0,  # ACCESSORY_OFFSET
+    1150300: False,  # DDC_ENABLED
+    1150302: False,  # DDC_FREQUENCY_TRANSLATION_ENABLED
+    1150303: 0.0,  # DDC_CENTER_FREQUENCY
+    1150304: 0,  # DDC_DATA_PROCESSING_MODE
+    1150305: 0.0,  # DDC_FREQUENCY_TRANSLATION_PHASE_I
+    1150306: 0.0,  # DDC_FREQUENCY_TRANSLATION_PHASE_Q
+    1150307: 0.0,  # DIGITAL_GAIN
+    1150308: 0.0,  # DIGITAL_OFFSET
+    1150309: 0,  # OVERFLOW_ERROR_REPORTING
+    1150310: '',  # DDC_Q_SOURCE
+    1150311: 0,  # FETCH_INTERLEAVED_IQ_DATA
+    1150312: 0,  # EQUALIZATION_NUM_COEFFICIENTS
+    1150313: False,  # EQUALIZATION_FILTER_ENABLED
+    1150314: 0,  # REF_TRIGGER_DETECTOR_LOCATION
+    1150315: 0.0,  # REF_TRIGGER_MINIMUM_QUIET_TIME
+    1150316: 0,  # DATA_TRANSFER_BLOCK_SIZE
+    1150318: False,  # BANDPASS_FILTER_ENABLED
+    1150319: False,  # DITHER_ENABLED
+    1150320: False,  # FRACTIONAL_RESAMPLE_ENABLED
+    1150321: 0.0,  # DATA_TRANSFER_MAXIMUM_BANDWIDTH
+    1150322: 0,  # DATA_TRANSFER_PREFERRED_PACKET_SIZE
+    1150328: 0,  # P2P_SAMPLES_AVAIL_IN_ENDPOINT
+    1150329: 0,  # P2P_DATA_TRANS_PERMISSION_ADDR
+    1150330: 0,  # P2P_DATA_TRANS_PERMISSION_ADDR_TYPE
+    1150331: 0,  # P2P_DESTINATION_WINDOW_ADDR
+    1150332: 0,  # P2P_DESTINATION_WINDOW_ADDR_TYPE
+    1150333: 0,  # P2P_DESTINATION_WINDOW_SIZE
+    1150334: 0,  # P2P_NOTIFY_PUSH_MESSAGE_ON
+    1150335: 0,  # P2P_NOTIFY_MESSAGE_PUSH_ADDR
+    1150336: 0,  # P2P_NOTIFY_MESSAGE_PUSH_ADDR_TYPE
+    1150337: 0,  # P2P_NOTIFY_MESSAGE_PUSH_VALUE
+    1150338: 0,  # P2P_ENABLED
+    1150339: '',  # P2P_CHANNELS_TO_STREAM
+    1150340: 0,  # P2P_SAMPLES_TRANSFERRED
+    1150341: 0,  # P2P_MOST_SAMPLES_AVAIL_IN_ENDPOINT
+    1150342: 0,  # P2P_ENDPOINT_SIZE
+    1150343: 0,  # MANUAL_CONFIGURATION_ENABLED
+    1150344: False,  # P2P_ENDPOINT_OVERFLOW
+    1150345: 0,  # P2P_FIFO_ENDPOINT_COUNT
+    1150354: 0,  # P2P_ONBOARD_MEMORY_ENABLED
+    1150366: 0.0,  # END_OF_RECORD_TO_ADVANCE_TRIGGER_HOLDOFF
+    1150367: 0,  # SAMPLE_CLOCK_TIMEBASE_MULTIPLIER
+    1150373: 0,  # STREAM_RELATIVE_TO
+    1150374: 0.0,  # ABSOLUTE_SAMPLE_CLOCK_OFFSET
+    1150375: '',  # FPGA_BITFILE_PATH
+    1150376: False,  # INTERLEAVING_OFFSET_CORRECTION_ENABLED
+    1150377: 0.0,  # HIGH_PASS_FILTER_FREQUENCY
+    1150380: 0,  # SAMPLES_TRANSFERRED_PER_RECORD
+    1151000: 0.0,  # CARRIER_NCO_CENTER_FREQUENCY
+    1151001: 0.0,  # CARRIER_PHASE_OFFSET
+    1151002: 0,  # MUX_MODE_REGISTER
+    1151003: False,  # ENABLE_DDC
+    1151010: 0,  # CIC_DECIMATION
+    1151011: 0,  # CIC_SHIFT_GAIN
+    1151020: False,  # DISCR._ENABLE
+    1151021: 0,  # DISCRIMINATOR_FIR_DECIMATION
+    1151022: 0,  # DISCRIMINATOR_FIR_SYMMETRY
+    1151023: 0,  # DISCRIMINATOR_FIR_SYMMETRY_TYPE
+    1151024: 0,  # DISCRIMINATOR_FIR_TAPS
+    1151025: 0,  # DISCRIMINATOR_DELAY
+    1151026: 0,  # DISCRIMINATOR_FIR_INPUT_SOURCE
+    1151027: 0,  # DISCRIMINATOR_PHASE_MULTIPLIER
+    1151030: 0,  # PROG._FIR_FILTER_DECIMATION
+    1151031: 0,  # PROG._FIR_FILTER_SYMMETRY
+    1151032: 0,  # PROG._FIR_FILTER_SYMMETRY_TYPE
+    1151033: 0,  # PROG._FIR_FILTER_TAPS
+    1151034: 0,  # PROG._FIR_FILTER_REALCOMPLEX
+    1151040: 0.0,  # AGC_UPPER_GAIN_LIMIT
+    1151041: 0.0,  # AGC_LOWER_GAIN_LIMIT
+    1151042: 0,  # AGC_LOOP_GAIN_0_EXPONENT
+    1151043: 0,  # AGC_LOOP_GAIN_0_MANTISSA
+    1151044: 0,  # AGC_LOOP_GAIN_1_EXPONENT
+    1151045: 0,  # AGC_LOOP_GAIN_1_MANTISSA
+    1151046: 0,  # AGC_THRESHOLD
+    1151047: 0,  # AGC_AVERAGE_CONTROL
+    1151050: False,  # HALFBAND_FILTER_BYPASS
+    1151051: False,  # HALFBAND_FILTER_1_ENABLE
+    1151052: False,  # HALFBAND_FILTER_2_ENABLE
+    1151053: False,  # HALFBAND_FILTER_3_ENABLE
+    1151054: False,  # HALFBAND_FILTER_4_ENABLE
+    1151055: False,  # HALFBAND_FILTER_5_ENABLE
+    1151070: 0,  # AOUT_PARALLEL_OUTPUT_SOURCE
+    1151071: 1,  # BOUT_PARALLEL_OUTPUT_SOURCE
+    1151072: False,  # TEST_MODE_SINCOS
+    1151073: 0,  # COORDINATE_CONVERTER_INPUT
+    1151074: 0,  # Q_INPUT_TO_COORD._CONVERTER
+    1151080: 0,  # SYNCOUT_CLK_SELECT
+    1151120: False,  # TIMING_NCO_PHASE_ACCUM._LOAD_ON_UPDATE
+    1151121: False,  # TIMING_NCO_CLEAR_PHASE_ACCUM.
+    1151122: False,  # TIMING_NCO_ENABLE_OFFSET_FREQ.
+    1151123: 0,  # TIMING_NCO_FREQ._OFFSET_BITS
+    1151124: 0,  # TIMING_NCO_CENTER_FREQ.
+    1151125: 0,  # TIMING_NCO_PHASE_OFFSET
+    1151126: 1,  # RESAMPLER_FILTER_MODE
+    1151127: False,  # RESAMPLER_BYPASS
+    1151128: 0,  # RESAMPLER_OUTPUT_PULSE_DELAY
+    1151129: 0,  # RESAMPLER_NCO_DIVIDE
+    1151130: 0,  # RESAMPLER_REFERENCE_DIVIDE
+    1151300: False,  # ENABLE_DITHER
+    1151301: 0,  # COMBINED_DECIMATION
+    1151302: 0.0,  # SERIAL_DAC_CAL_VOLTAGE
+    1151303: False,  # PLL_LOCK_STATUS
+    1151304: 0.0,  # DELAY_BEFORE_INITIATE
+    1151305: 0,  # DDC_DIRECT_REGISTER_ADDRESS
+    1151306: 0,  # DDC_DIRECT_REGISTER_DATA
+    1250001: 0.0,  # VERTICAL_RANGE
+    1250002: 0.0,  # VERTICAL_OFFSET
+    1250003: 0,  # VERTICAL_COUPLING
+    1250004: 0.0,  # PROBE_ATTENUATION
+    1250005: 0,  # CHANNEL_ENABLED
+    1250006: 0.0,  # MAX_INPUT_FREQUENCY
+    1250007: 0.0,  # HORZ_TIME_PER_RECORD
+    1250008: 1000,  # HORZ_RECORD_LENGTH
+    1250009: 0,  # HORZ_MIN_NUM_PTS
+    1250010: 1000000.0,  # HORZ_SAMPLE_RATE
+    1250011: 0.0,  # HORZ_RECORD_REF_POSITION
+    1250012: 1,  # TRIGGER_TYPE
+    1250013: '',  # TRIGGER_SOURCE
+    1250014: 0,  # TRIGGER_COUPLING
+    1250015: 0.0,  # TRIGGER_DELAY_TIME
+    1250016: 0.0,  # TRIGGER_HOLDOFF
+    1250017: 0.0,  # TRIGGER_LEVEL
+    1250018: 0,  # TRIGGER_SLOPE
+    1250101: 0,  # ACQUISITION_TYPE
+    1250102: 1,  # TRIGGER_MODIFIER
+    1250103: 0.0,  # INPUT_IMPEDANCE
+    1250106: 0,  # SAMPLE_MODE
+    1250109: 0.0,  # ACQUISITION_START_TIME
+    1250201: 1,  # TV_TRIGGER_SIGNAL_FORMAT
+    1250204: 1,  # TV_TRIGGER_POLARITY
+    1250205: 1,  # TV_TRIGGER_EVENT
+    1250206: 0,  # TV_TRIGGER_LINE_NUMBER
+}
+
+# Values returned in output parameters, by function and parameter name. Output buffers that are not listed are
+# filled with synthetic data, and output counts (i.e. actualNumberOfPoints) return the number of elements written.
+_output_values = {
+    'ActualNumWfms': {'numWfms': 1},
+    'Fetch': {'wfmInfo': {'gain': 1.0, 'x_increment': 1e-06}},
+    'FetchBinary16': {'wfmInfo': {'gain': 3.0517578125e-05, 'x_increment': 1e-06}},
+    'FetchBinary32': {'wfmInfo': {'gain': 4.656612873077393e-10, 'x_increment': 1e-06}},
+    'FetchBinary8': {'wfmInfo': {'gain': 0.0078125, 'x_increment': 1e-06}},
+    'FetchWaveform': {'xIncrement': 1e-06},
+    'ReadWaveform': {'xIncrement': 1e-06},
+}
+
+
+class Simulator(_simulation.SimulatedLibrary):
+    '''Simulator
+
+    Pure-Python stand-in for the NI-SCOPE runtime. It keeps the value of attributes for each session and fills
+    output buffers with synthetic data. Pass an instance to library_singleton.set_backend() before creating sessions:
+
+        import niscope.simulator
+        niscope.library_singleton.set_backend(niscope.simulator.Simulator(latency=0.0001))
+
+    Args:
+        latency (float): Time, in seconds, that every function call sleeps for. Can be changed at any time.
+        array_size (int): Number of elements of output buffers that the driver sizes, i.e. with the IVI-dance
+        attribute_values (dict): Value of attributes, by attribute ID, until they are set
+        output_values (dict): Values returned in output parameters, by C function name without the prefix and
+            parameter name, i.e. {'ReadMultiPoint': {'readingArray': 1.5}}. A single value fills a whole buffer, and
+            a dict of field values fills every structure of a buffer of structures.
+    '''
+
+    def __init__(self, latency=0.0, array_size=1000, attribute_values=None, output_values=None):
+        super(Simulator, self).__init__('niScope_', _functions, _attributes, _output_values, latency, array_size, attribute_values, output_values)
@@ -102,6 +102,22 @@ class SideEffectsHelper(object):
         self._defaults['Disable']['return'] = 0
         self._defaults['ExportSignal'] = {}
         self._defaults['ExportSignal']['return'] = 0
+        self._defaults['Fetch'] = {}
+        self._defaults['Fetch']['return'] = 0
+        self._defaults['Fetch']['Wfm'] = None
+        self._defaults['Fetch']['wfmInfo'] = None
+        self._defaults['FetchBinary16'] = {}
+        self._defaults['FetchBinary16']['return'] = 0
+        self._defaults['FetchBinary16']['Wfm'] = None
+        self._defaults['FetchBinary16']['wfmInfo'] = None
+        self._defaults['FetchBinary32'] = {}
+        self._defaults['FetchBinary32']['return'] = 0
+        self._defaults['FetchBinary32']['Wfm'] = None
+        self._defaults['FetchBinary32']['wfmInfo'] = None
+        self._defaults['FetchBinary8'] = {}
+        self._defaults['FetchBinary8']['return'] = 0
+        self._defaults['FetchBinary8']['Wfm'] = None
+        self._defaults['FetchBinary8']['wfmInfo'] = None
         self._defaults['FetchMeasurement'] = {}
         self._defaults['FetchMeasurement']['return'] = 0
         self._defaults['FetchMeasurement']['Result'] = None
@@ -445,6 +461,90 @@ class SideEffectsHelper(object):
             return self._defaults['ExportSignal']['return']
         return self._defaults['ExportSignal']['return']
 
+    def niScope_Fetch(self, vi, channel_list, timeout, num_samples, wfm, wfm_info):  # noqa: N802
+        if self._defaults['Fetch']['return'] != 0:
+            return self._defaults['Fetch']['return']
+        if self._defaults['Fetch']['Wfm'] is None:
+            raise MockFunctionCallError("niScope_Fetch", param='Wfm')
+        a = self._defaults['Fetch']['Wfm']
+        import sys
+        if sys.version_info.major > 2 and type(a) is str:
+            a = a.encode('ascii')
+        for i in range(min(len(wfm), len(a))):
+            wfm[i] = a[i]
+        if self._defaults['Fetch']['wfmInfo'] is None:
+            raise MockFunctionCallError("niScope_Fetch", param='wfmInfo')
+        a = self._defaults['Fetch']['wfmInfo']
+        import sys
+        if sys.version_info.major > 2 and type(a) is str:
+            a = a.encode('ascii')
+        for i in range(min(len(wfm_info), len(a))):
+            wfm_info[i] = a[i]
+        return self._defaults['Fetch']['return']
+
+    def niScope_FetchBinary16(self, vi, channel_list, timeout, num_samples, wfm, wfm_info):  # noqa: N802
+        if self._defaults['FetchBinary16']['return'] != 0:
+            return self._defaults['FetchBinary16']['return']
+        if self._defaults['FetchBinary16']['Wfm'] is None:
+            raise MockFunctionCallError("niScope_FetchBinary16", param='Wfm')
+        a = self._defaults['FetchBinary16']['Wfm']
+        import sys
+        if sys.version_info.major > 2 and type(a) is str:
+            a = a.encode('ascii')
+        for i in range(min(len(wfm), len(a))):
+            wfm[i] = a[i]
+        if self._defaults['FetchBinary16']['wfmInfo'] is None:
+            raise MockFunctionCallError("niScope_FetchBinary16", param='wfmInfo')
+        a = self._defaults['FetchBinary16']['wfmInfo']
+        import sys
+        if sys.version_info.major > 2 and type(a) is str:
+            a = a.encode('ascii')
+        for i in range(min(len(wfm_info), len(a))):
+            wfm_info[i] = a[i]
+        return self._defaults['FetchBinary16']['return']
+
+    def niScope_FetchBinary32(self, vi, channel_list, timeout, num_samples, wfm, wfm_info):  # noqa: N802
+        if self._defaults['FetchBinary32']['return'] != 0:
+            return self._defaults['FetchBinary32']['return']
+        if self._defaults['FetchBinary32']['Wfm'] is None:
+            raise MockFunctionCallError("niScope_FetchBinary32", param='Wfm')
+        a = self._defaults['FetchBinary32']['Wfm']
+        import sys
+        if sys.version_info.major > 2 and type(a) is str:
+            a = a.encode('ascii')
+        for i in range(min(len(wfm), len(a))):
+            wfm[i] = a[i]
+        if self._defaults['FetchBinary32']['wfmInfo'] is None:
+            raise MockFunctionCallError("niScope_FetchBinary32", param='wfmInfo')
+        a = self._defaults['FetchBinary32']['wfmInfo']
+        import sys
+        if sys.version_info.major > 2 and type(a) is str:
+            a = a.encode('ascii')
+        for i in range(min(len(wfm_info), len(a))):
+            wfm_info[i] = a[i]
+        return self._defaults['FetchBinary32']['return']
+
+    def niScope_FetchBinary8(self, vi, channel_list, timeout, num_samples, wfm, wfm_info):  # noqa: N802
+        if self._defaults['FetchBinary8']['return'] != 0:
+            return self._defaults['FetchBinary8']['return']
+        if self._defaults['FetchBinary8']['Wfm'] is None:
+            raise MockFunctionCallError("niScope_FetchBinary8", param='Wfm')
+        a = self._defaults['FetchBinary8']['Wfm']
+        import sys
+        if sys.version_info.major > 2 and type(a) is str:
+            a = a.encode('ascii')
+        for i in range(min(len(wfm), len(a))):
+            wfm[i] = a[i]
+        if self._defaults['FetchBinary8']['wfmInfo'] is None:
+            raise MockFunctionCallError("niScope_FetchBinary8", param='wfmInfo')
+        a = self._defaults['FetchBinary8']['wfmInfo']
+        import sys
+        if sys.version_info.major > 2 and type(a) is str:
+            a = a.encode('ascii')
+        for i in range(min(len(wfm_info), len(a))):
+            wfm_info[i] = a[i]
+        return self._defaults['FetchBinary8']['return']
+
     def niScope_FetchMeasurement(self, vi, channel_list, timeout, scalar_meas_function, result):  # noqa: N802
         if self._defaults['FetchMeasurement']['return'] != 0:
             return self._defaults['FetchMeasurement']['return']
@@ -578,7 +678,7 @@ class SideEffectsHelper(object):
             return self._defaults['GetAttributeViString']['return']
         if self._defaults['GetAttributeViString']['Value'] is None:
             raise MockFunctionCallError("niScope_GetAttributeViString", param='Value')
-        if buf_size.value == 0:
+        if buf_size.value < len(self._defaults['GetAttributeViString']['Value']):
             return len(self._defaults['GetAttributeViString']['Value'])
         value.value = self._defaults['GetAttributeViString']['Value'].encode('ascii')
         return self._defaults['GetAttributeViString']['return']
@@ -617,7 +717,7 @@ class SideEffectsHelper(object):
         error_code.contents.value = self._defaults['GetError']['errorCode']
         if self._defaults['GetError']['Description'] is None:
             raise MockFunctionCallError("niScope_GetError", param='Description')
-        if buffer_size.value == 0:
+        if buffer_size.value < len(self._defaults['GetError']['Description']):
             return len(self._defaults['GetError']['Description'])
         description.value = self._defaults['GetError']['Description'].encode('ascii')
         return self._defaults['GetError']['return']
@@ -919,6 +1019,14 @@ class SideEffectsHelper(object):
         mock_library.niScope_Disable.return_value = 0
         mock_library.niScope_ExportSignal.side_effect = MockFunctionCallError("niScope_ExportSignal")
         mock_library.niScope_ExportSignal.return_value = 0
+        mock_library.niScope_Fetch.side_effect = MockFunctionCallError("niScope_Fetch")
+        mock_library.niScope_Fetch.return_value = 0
+        mock_library.niScope_FetchBinary16.side_effect = MockFunctionCallError("niScope_FetchBinary16")
+        mock_library.niScope_FetchBinary16.return_value = 0
+        mock_library.niScope_FetchBinary32.side_effect = MockFunctionCallError("niScope_FetchBinary32")
+        mock_library.niScope_FetchBinary32.return_value = 0
+        mock_library.niScope_FetchBinary8.side_effect = MockFunctionCallError("niScope_FetchBinary8")
+        mock_library.niScope_FetchBinary8.return_value = 0
         mock_library.niScope_FetchMeasurement.side_effect = MockFunctionCallError("niScope_FetchMeasurement")
         mock_library.niScope_FetchMeasurement.return_value = 0
         mock_library.niScope_FetchMeasurementStats.side_effect = MockFunctionCallError("niScope_FetchMeasurementStats")
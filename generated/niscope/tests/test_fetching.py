@@ -0,0 +1,108 @@
+import math
+import niscope
+import niscope.simulator
+import pytest
+
+from niscope import library_singleton
+
+numpy = pytest.importorskip('numpy')
+
+
+NUM_CHANNELS = 2
+NUM_SAMPLES = 10
+WFM_INFO = {'absolute_initial_x': 1.5, 'relative_initial_x': -0.5, 'x_increment': 0.001, 'actual_samples': NUM_SAMPLES, 'offset': 0.25, 'gain': 2.0}
+
+
+def get_simulator(num_records):
+    # The driver returns one waveform for each channel of each record
+    output_values = {'ActualNumWfms': {'numWfms': NUM_CHANNELS * num_records}}
+    for function in ('Fetch', 'FetchBinary8', 'FetchBinary16', 'FetchBinary32'):
+        output_values[function] = {'wfmInfo': WFM_INFO}
+    return niscope.simulator.Simulator(output_values=output_values)
+
+
+def get_expected_sample(channel, record, sample):
+    # The simulator fills the buffer of all waveforms, record after record, with one sine wave
+    return math.sin(2 * math.pi * ((record * NUM_CHANNELS + channel) * NUM_SAMPLES + sample) / 100)
+
+
+class TestFetchRecords(object):
+
+    def teardown_method(self, method):
+        library_singleton.set_backend(None)
+
+    def _open_session(self, num_records, horz_num_records=5):
+        library_singleton.set_backend(get_simulator(num_records))
+        session = niscope.Session('dev1', False, False, '')
+        session.horz_num_records = horz_num_records
+        session.horz_record_length = NUM_SAMPLES
+        return session
+
+    def test_records_of_each_channel(self):
+        with self._open_session(num_records=5) as session:
+            waveforms, wfm_info = session.fetch_records()
+            assert session.fetch_record_number == 0
+            assert session.fetch_num_records == 5
+        assert waveforms.shape == (NUM_CHANNELS, 5, NUM_SAMPLES)
+        assert waveforms.dtype == numpy.float64
+        assert waveforms.flags['C_CONTIGUOUS']
+        for channel, record, sample in [(0, 0, 0), (0, 0, 9), (1, 0, 3), (0, 1, 0), (1, 4, 9)]:
+            assert waveforms[channel, record, sample] == pytest.approx(get_expected_sample(channel, record, sample))
+
+    def test_wfm_info_of_each_record(self):
+        with self._open_session(num_records=5) as session:
+            _, wfm_info = session.fetch_records()
+        assert wfm_info.shape == (NUM_CHANNELS, 5)
+        assert list(wfm_info.dtype.names) == ['absolute_initial_x', 'relative_initial_x', 'x_increment', 'actual_samples', 'offset', 'gain']
+        for field, value in WFM_INFO.items():
+            assert (wfm_info[field] == value).all()
+
+    def test_later_batch_of_records(self):
+        with self._open_session(num_records=2) as session:
+            waveforms, _ = session.fetch_records(num_samples=4, record_number=2, num_records=2)
+            assert session.fetch_record_number == 2
+            assert session.fetch_num_records == 2
+        assert waveforms.shape == (NUM_CHANNELS, 2, 4)
+
+    def test_later_batch_up_to_the_last_record(self):
+        with self._open_session(num_records=3) as session:
+            waveforms, _ = session.fetch_records(record_number=2)
+            assert session.fetch_record_number == 2
+            assert session.fetch_num_records == 3
+        assert waveforms.shape == (NUM_CHANNELS, 3, NUM_SAMPLES)
+
+    def test_later_batches_keep_relative_to_and_offset(self):
+        with self._open_session(num_records=1) as session:
+            session.fetch_relative_to = niscope.FetchRelativeTo.TRIGGER
+            session.fetch_offset = -4
+            for record_number in range(5):
+                session.fetch_records(record_number=record_number, num_records=1)
+                assert session.fetch_record_number == record_number
+                assert session.fetch_relative_to == niscope.FetchRelativeTo.TRIGGER
+                assert session.fetch_offset == -4
+
+    def test_binary_records(self):
+        with self._open_session(num_records=5) as session:
+            session.binary_sample_width = 16
+            waveforms = session.fetch_records_binary()
+        assert waveforms.samples.shape == (NUM_CHANNELS, 5, NUM_SAMPLES)
+        assert waveforms.samples.dtype == numpy.int16
+        # The simulator fills integer buffers with a sawtooth starting at -128
+        assert waveforms.samples[0, 0, 0] == -128
+        assert waveforms.scaled[0, 0, 0] == -128 * 2.0 + 0.25
+        assert numpy.array_equal(numpy.asarray(waveforms.scaled), waveforms.samples * 2.0 + 0.25)
+
+    def test_no_records_to_fetch(self):
+        with self._open_session(num_records=1) as session:
+            with pytest.raises(ValueError):
+                session.fetch_records(record_number=5)
+            with pytest.raises(ValueError):
+                session.fetch_records(num_samples=0)
+            with pytest.raises(ValueError):
+                session.fetch_records(num_records=0)
+
+    def test_unsupported_binary_sample_width(self):
+        with self._open_session(num_records=1) as session:
+            session.binary_sample_width = 12
+            with pytest.raises(ValueError):
+                session.fetch_records_binary()
@@ -0,0 +1,92 @@
+import ctypes
+import niscope
+import niscope.simulator
+import pytest
+import threading
+import time
+
+from niscope import library_singleton
+
+
+POINTS_DONE = 1150082
+
+
+class TestStream(object):
+
+    def setup_method(self, method):
+        # Every sample is acquired already, until a test says otherwise
+        self.simulator = niscope.simulator.Simulator(attribute_values={POINTS_DONE: 1000.0})
+        library_singleton.set_backend(self.simulator)
+
+    def teardown_method(self, method):
+        library_singleton.set_backend(None)
+
+    def _open_session(self, record_length=250, num_records=2):
+        session = niscope.Session('dev1', False, False, '')
+        session.horz_record_length = record_length
+        session.horz_num_records = num_records
+        return session
+
+    def test_chunks_of_each_record(self):
+        with self._open_session() as session:
+            chunks = [(chunk.record_number, chunk.offset, [len(w) for w in chunk.waveforms]) for chunk in session.stream('0,1', 100)]
+        # The last chunk of each record has the rest of its samples
+        assert chunks == [
+            (0, 0, [100, 100]), (0, 100, [100, 100]), (0, 200, [50, 50]),
+            (1, 0, [100, 100]), (1, 100, [100, 100]), (1, 200, [50, 50]),
+        ]
+
+    def test_chunks_use_two_sets_of_buffers_in_turn(self):
+        with self._open_session() as session:
+            addresses = [ctypes.addressof(chunk.waveforms[0]) for chunk in session.stream('0', 100, num_records=1)]
+        assert addresses[0] != addresses[1]
+        assert addresses[2] == addresses[0]
+
+    def test_waveforms_are_filled(self):
+        with self._open_session(record_length=100, num_records=1) as session:
+            chunk = next(session.stream('0', 100))
+            waveform = list(chunk.waveforms[0])
+        # The simulator fills waveforms with a sine wave
+        assert waveform[0] == 0.0
+        assert waveform[1] == pytest.approx(0.0627905195)
+
+    def test_record_number_and_num_records(self):
+        with self._open_session(record_length=100, num_records=4) as session:
+            assert [chunk.record_number for chunk in session.stream('0', 100, record_number=1, num_records=2)] == [1, 2]
+            assert session.fetch_relative_to == niscope.FetchRelativeTo.START
+            assert session.fetch_num_records == 1
+
+    def test_waits_for_points_done(self):
+        self.simulator.set_attribute_value(POINTS_DONE, 0.0)
+        timer = threading.Timer(0.05, self.simulator.set_attribute_value, (POINTS_DONE, 1000.0))
+        with self._open_session(record_length=100, num_records=1) as session:
+            start = time.time()
+            timer.start()
+            chunks = list(session.stream('0', 100))
+            assert time.time() - start >= 0.05
+        assert len(chunks) == 1
+
+    def test_points_done_timeout(self):
+        self.simulator.set_attribute_value(POINTS_DONE, 50.0)
+        with self._open_session(record_length=100, num_records=1) as session:
+            with pytest.raises(niscope.Error) as e:
+                list(session.stream('0', 100, timeout=0.05))
+            assert e.value.code == -1074126845
+
+    def test_early_exit(self):
+        with self._open_session() as session:
+            chunks = session.stream('0', 100)
+            assert next(chunks).offset == 0
+            chunks.close()
+            with pytest.raises(StopIteration):
+                next(chunks)
+            # Nothing was fetched after the first chunk
+            assert session.fetch_offset == 0
+            assert session.fetch_record_number == 0
+
+    def test_invalid_arguments(self):
+        with self._open_session() as session:
+            with pytest.raises(ValueError):
+                next(session.stream('', 100))
+            with pytest.raises(ValueError):
+                next(session.stream('0', 0))
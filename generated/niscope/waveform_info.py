@@ -0,0 +1,54 @@
+import ctypes
+
+from niscope import visatype
+
+
+# This class is an internal implementation detail
+# ctypes definition
+# Name must match exactly what the name of the structure type is named in the C API.
+class niScope_wfmInfo(ctypes.Structure):  # noqa N801
+    _fields_ = [
+        ('absolute_initial_x', visatype.ViReal64),
+        ('relative_initial_x', visatype.ViReal64),
+        ('x_increment', visatype.ViReal64),
+        ('actual_samples', visatype.ViInt32),
+        ('offset', visatype.ViReal64),
+        ('gain', visatype.ViReal64),
+        ('reserved1', visatype.ViReal64),
+        ('reserved2', visatype.ViReal64),
+    ]
+
+    def __init__(self, data=None, absolute_initial_x=0.0, relative_initial_x=0.0, x_increment=0.0, actual_samples=0, offset=0.0, gain=0.0):
+        super(ctypes.Structure, self).__init__()
+        if data is not None:
+            self.absolute_initial_x = data.absolute_initial_x
+            self.relative_initial_x = data.relative_initial_x
+            self.x_increment = data.x_increment
+            self.actual_samples = data.actual_samples
+            self.offset = data.offset
+            self.gain = data.gain
+        else:
+            self.absolute_initial_x = absolute_initial_x
+            self.relative_initial_x = relative_initial_x
+            self.x_increment = x_increment
+            self.actual_samples = actual_samples
+            self.offset = offset
+            self.gain = gain
+
+
+class WaveformInfo(object):
+    def __init__(self, data=None, absolute_initial_x=0.0, relative_initial_x=0.0, x_increment=0.0, actual_samples=0, offset=0.0, gain=0.0):
+        if data is not None:
+            self.absolute_initial_x = data.absolute_initial_x
+            self.relative_initial_x = data.relative_initial_x
+            self.x_increment = data.x_increment
+            self.actual_samples = data.actual_samples
+            self.offset = data.offset
+            self.gain = data.gain
+        else:
+            self.absolute_initial_x = absolute_initial_x
+            self.relative_initial_x = relative_initial_x
+            self.x_increment = x_increment
+            self.actual_samples = actual_samples
+            self.offset = offset
+            self.gain = gain
@@ -1,8 +1,54 @@
 #!/usr/bin/python
 # This file was generated
 
-from niswitch.enums import *          # noqa: F403,F401,H303
-from niswitch.errors import Error     # noqa: F401
-from niswitch.errors import NiswitchWarning   # noqa: F401
-from niswitch.session import Session  # noqa: F401
+import sys
 
+# Modules are imported when one of their names is first used, so that importing the package is fast
+_lazy_names = {
+    'CabledModuleScanAdvancedBus': 'enums',
+    'CabledModuleTriggerBus': 'enums',
+    'Error': 'errors',
+    'HandshakingInitiation': 'enums',
+    'MasterSlaveScanAdvancedBus': 'enums',
+    'MasterSlaveTriggerBus': 'enums',
+    'NiswitchWarning': 'errors',
+    'PathCapability': 'enums',
+    'RelayAction': 'enums',
+    'RelayPosition': 'enums',
+    'ScanAdvancedOutput': 'enums',
+    'ScanAdvancedPolarity': 'enums',
+    'ScanMode': 'enums',
+    'Session': 'session',
+    'TriggerInput': 'enums',
+    'TriggerInputPolarity': 'enums',
+    'TriggerMode': 'enums',
+}
+
+__all__ = sorted(_lazy_names)
+
+if sys.version_info >= (3, 7):
+    import importlib
+    import importlib.util
+
+    def __getattr__(name):
+        if name in _lazy_names:
+            submodule = importlib.import_module('niswitch.' + _lazy_names[name])
+            # Next time, all the names of the module are found without calling __getattr__. This also replaces the
+            # module in the package with the name it exports, when they are the same.
+            for n in _lazy_names:
+                if _lazy_names[n] == _lazy_names[name]:
+                    globals()[n] = getattr(submodule, n)
+            return globals()[name]
+        # Modules of the package are attributes of it once imported, as they were when the package imported them all
+        if not name.startswith('__') and importlib.util.find_spec('niswitch.' + name) is not None:
+            return importlib.import_module('niswitch.' + name)
+        raise AttributeError("module 'niswitch' has no attribute '{0}'".format(name))
+
+    def __dir__():
+        return sorted(set(globals()) | set(_lazy_names))
+else:
+    # Module __getattr__ needs Python 3.7
+    from niswitch.enums import *          # noqa: F403,F401,H303
+    from niswitch.errors import Error     # noqa: F401
+    from niswitch.errors import NiswitchWarning   # noqa: F401
+    from niswitch.session import Session  # noqa: F401
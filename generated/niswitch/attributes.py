@@ -1,68 +1,132 @@
 # -*- coding: utf-8 -*-
 # This file was generated
+import collections
+import ctypes
+
+from niswitch import enums
+from niswitch import errors
+from niswitch import visatype
+
+
+class AttributeCache(object):
+    '''Values of the attributes of a session, by attribute ID and repeated capability.
+
+    Shared by a session and all its repeated capabilities. Disabled until the session enables it. generation counts how
+    many times it was cleared, so that others can tell when the values of attributes may have changed.
+    '''
+
+    def __init__(self):
+        self.enabled = False
+        self.values = {}
+        self.generation = 0
+
+    def clear(self):
+        self.values.clear()
+        self.generation += 1
 
 
 class Attribute(object):
     '''Base class for all typed attributes.'''
 
-    def __init__(self, attribute_id):
+    def __init__(self, attribute_id, volatile=False):
         self._attribute_id = attribute_id
+        self._volatile = volatile
+
+    def _convert(self, value):
+        '''Returns value as the type that the getter returns, so the cache returns the same thing the driver would'''
+        return value
+
+    def _get(self, session, getter):
+        cache = session._attribute_cache
+        if not cache.enabled or self._volatile:
+            return getter(self._attribute_id)
+        values = cache.values.get(self._attribute_id)
+        if values is not None and session._repeated_capability in values:
+            return values[session._repeated_capability]
+        value = getter(self._attribute_id)
+        cache.values.setdefault(self._attribute_id, {})[session._repeated_capability] = value
+        return value
+
+    def _set(self, session, setter, value):
+        setter(self._attribute_id, value)
+        cache = session._attribute_cache
+        if cache.enabled and not self._volatile:
+            # Write-through. Values cached for other repeated capabilities are dropped, since they may overlap
+            cache.values[self._attribute_id] = {session._repeated_capability: self._convert(value)}
 
 
 class AttributeViInt32(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_int32(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_int32)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_int32(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_int32, value)
+
+    def _convert(self, value):
+        return int(value)
 
 
 class AttributeViInt64(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_int64(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_int64)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_int64(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_int64, value)
+
+    def _convert(self, value):
+        return int(value)
 
 
 class AttributeViReal64(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_real64(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_real64)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_real64(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_real64, value)
+
+    def _convert(self, value):
+        return float(value)
 
 
 class AttributeViString(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_string(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_string)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_string(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_string, value)
 
 
 class AttributeViBoolean(Attribute):
 
     def __get__(self, session, session_type):
-        return session._get_attribute_vi_boolean(self._attribute_id)
+        return self._get(session, session._get_attribute_vi_boolean)
 
     def __set__(self, session, value):
-        session._set_attribute_vi_boolean(self._attribute_id, value)
+        self._set(session, session._set_attribute_vi_boolean, value)
+
+    def _convert(self, value):
+        return bool(value)
 
 
 class AttributeEnum(object):
 
-    def __init__(self, underlying_attribute_meta_class, enum_meta_class, attribute_id):
-        self._underlying_attribute = underlying_attribute_meta_class(attribute_id)
+    def __init__(self, underlying_attribute_meta_class, enum_meta_class, attribute_id, volatile=False):
+        self._underlying_attribute = underlying_attribute_meta_class(attribute_id, volatile)
         self._attribute_type = enum_meta_class
         self._attribute_id = attribute_id
+        self._members_by_value = enums._members_by_value[enum_meta_class]
 
     def __get__(self, session, session_type):
-        return self._attribute_type(self._underlying_attribute.__get__(session, session_type))
+        value = self._underlying_attribute.__get__(session, session_type)
+        try:
+            return self._members_by_value[value]
+        except KeyError:
+            # Raises ValueError, as the enum does for values it doesn't have
+            return self._attribute_type(value)
 
     def __set__(self, session, value):
         if type(value) is not self._attribute_type:
@@ -70,3 +134,182 @@ class AttributeEnum(object):
         return self._underlying_attribute.__set__(session, value.value)
 
 
+# (attribute_id, python_name, type, enum, channel_based, access, volatile) of an attribute. enum is the enum class or None,
+# channel_based is True if it can be used with repeated capabilities, and access is 'read-write', 'read only' or 'write only'.
+AttributeInfo = collections.namedtuple('AttributeInfo', ['attribute_id', 'python_name', 'type', 'enum', 'channel_based', 'access', 'volatile'])
+
+# Every attribute of NI-SWITCH, by attribute ID
+index = {
+    1050002: AttributeInfo(1050002, 'range_check', 'ViBoolean', None, False, 'read-write', False),
+    1050003: AttributeInfo(1050003, 'query_instrument_status', 'ViBoolean', None, False, 'read-write', False),
+    1050004: AttributeInfo(1050004, 'cache', 'ViBoolean', None, False, 'read-write', False),
+    1050005: AttributeInfo(1050005, 'simulate', 'ViBoolean', None, False, 'read-write', False),
+    1050006: AttributeInfo(1050006, 'record_coercions', 'ViBoolean', None, False, 'read-write', False),
+    1050007: AttributeInfo(1050007, 'driver_setup', 'ViString', None, False, 'read only', False),
+    1050021: AttributeInfo(1050021, 'interchange_check', 'ViBoolean', None, False, 'read-write', False),
+    1050203: AttributeInfo(1050203, 'channel_count', 'ViInt32', None, False, 'read only', False),
+    1050302: AttributeInfo(1050302, 'specific_driver_prefix', 'ViString', None, False, 'read only', False),
+    1050304: AttributeInfo(1050304, 'io_resource_descriptor', 'ViString', None, False, 'read only', False),
+    1050305: AttributeInfo(1050305, 'logical_name', 'ViString', None, False, 'read only', False),
+    1050327: AttributeInfo(1050327, 'supported_instrument_models', 'ViString', None, False, 'read only', False),
+    1050401: AttributeInfo(1050401, 'group_capabilities', 'ViString', None, False, 'read only', False),
+    1050510: AttributeInfo(1050510, 'instrument_firmware_revision', 'ViString', None, False, 'read only', False),
+    1050511: AttributeInfo(1050511, 'instrument_manufacturer', 'ViString', None, False, 'read only', False),
+    1050512: AttributeInfo(1050512, 'instrument_model', 'ViString', None, False, 'read only', False),
+    1050513: AttributeInfo(1050513, 'specific_driver_vendor', 'ViString', None, False, 'read only', False),
+    1050514: AttributeInfo(1050514, 'specific_driver_description', 'ViString', None, False, 'read only', False),
+    1050515: AttributeInfo(1050515, 'specific_driver_class_spec_major_version', 'ViInt32', None, False, 'read only', False),
+    1050516: AttributeInfo(1050516, 'specific_driver_class_spec_minor_version', 'ViInt32', None, False, 'read only', False),
+    1050551: AttributeInfo(1050551, 'specific_driver_revision', 'ViString', None, False, 'read only', False),
+    1150001: AttributeInfo(1150001, 'serial_number_i32', 'ViInt32', None, False, 'read only', False),
+    1150002: AttributeInfo(1150002, 'continuous_scan', 'ViBoolean', None, False, 'read-write', False),
+    1150004: AttributeInfo(1150004, 'is_waiting_for_trig', 'ViBoolean', None, False, 'read only', True),
+    1150005: AttributeInfo(1150005, 'trigger_mode', 'ViInt32', None, False, 'read-write', False),
+    1150006: AttributeInfo(1150006, 'master_slave_trigger_bus', 'ViInt32', None, False, 'read-write', False),
+    1150007: AttributeInfo(1150007, 'master_slave_scan_advanced_bus', 'ViInt32', None, False, 'read-write', False),
+    1150008: AttributeInfo(1150008, 'cabled_module_trigger_bus', 'ViInt32', None, False, 'read-write', False),
+    1150009: AttributeInfo(1150009, 'cabled_module_scan_advanced_bus', 'ViInt32', None, False, 'read-write', False),
+    1150010: AttributeInfo(1150010, 'trigger_input_polarity', 'ViInt32', enums.TriggerInputPolarity, False, 'read-write', False),
+    1150011: AttributeInfo(1150011, 'scan_advanced_polarity', 'ViInt32', enums.ScanAdvancedPolarity, False, 'read-write', False),
+    1150012: AttributeInfo(1150012, 'parsed_scan_list', 'ViString', None, False, 'read only', False),
+    1150013: AttributeInfo(1150013, 'handshaking_initiation', 'ViInt32', enums.HandshakingInitiation, False, 'read-write', False),
+    1150014: AttributeInfo(1150014, 'number_of_relays', 'ViInt32', None, False, 'read only', False),
+    1150015: AttributeInfo(1150015, 'serial_number', 'ViString', None, False, 'read only', False),
+    1150016: AttributeInfo(1150016, 'digital_filter_enable', 'ViBoolean', None, False, 'read-write', False),
+    1150017: AttributeInfo(1150017, 'power_down_latching_relays_after_debounce', 'ViBoolean', None, False, 'read-write', False),
+    1150018: AttributeInfo(1150018, 'analog_bus_sharing_enable', 'ViBoolean', None, True, 'read-write', False),
+    1150019: AttributeInfo(1150019, 'temperature', 'ViReal64', None, False, 'read only', True),
+    1250001: AttributeInfo(1250001, 'is_source_channel', 'ViBoolean', None, True, 'read-write', False),
+    1250002: AttributeInfo(1250002, 'is_debounced', 'ViBoolean', None, False, 'read only', True),
+    1250003: AttributeInfo(1250003, 'is_configuration_channel', 'ViBoolean', None, True, 'read-write', False),
+    1250004: AttributeInfo(1250004, 'settling_time', 'ViReal64', None, True, 'read-write', False),
+    1250005: AttributeInfo(1250005, 'bandwidth', 'ViReal64', None, True, 'read only', False),
+    1250006: AttributeInfo(1250006, 'max_dc_voltage', 'ViReal64', None, True, 'read only', False),
+    1250007: AttributeInfo(1250007, 'max_ac_voltage', 'ViReal64', None, True, 'read only', False),
+    1250008: AttributeInfo(1250008, 'max_switching_dc_current', 'ViReal64', None, True, 'read only', False),
+    1250009: AttributeInfo(1250009, 'max_switching_ac_current', 'ViReal64', None, True, 'read only', False),
+    1250010: AttributeInfo(1250010, 'max_carry_dc_current', 'ViReal64', None, True, 'read only', False),
+    1250011: AttributeInfo(1250011, 'max_carry_ac_current', 'ViReal64', None, True, 'read only', False),
+    1250012: AttributeInfo(1250012, 'max_switching_dc_power', 'ViReal64', None, True, 'read only', False),
+    1250013: AttributeInfo(1250013, 'max_switching_ac_power', 'ViReal64', None, True, 'read only', False),
+    1250014: AttributeInfo(1250014, 'max_carry_dc_power', 'ViReal64', None, True, 'read only', False),
+    1250015: AttributeInfo(1250015, 'max_carry_ac_power', 'ViReal64', None, True, 'read only', False),
+    1250016: AttributeInfo(1250016, 'characteristic_impedance', 'ViReal64', None, True, 'read only', False),
+    1250017: AttributeInfo(1250017, 'wire_mode', 'ViInt32', None, True, 'read only', False),
+    1250018: AttributeInfo(1250018, 'num_of_rows', 'ViInt32', None, False, 'read only', False),
+    1250019: AttributeInfo(1250019, 'num_of_columns', 'ViInt32', None, False, 'read only', False),
+    1250020: AttributeInfo(1250020, 'scan_list', 'ViString', None, False, 'read-write', False),
+    1250021: AttributeInfo(1250021, 'scan_mode', 'ViInt32', enums.ScanMode, False, 'read-write', False),
+    1250022: AttributeInfo(1250022, 'trigger_input', 'ViInt32', enums.TriggerInput, False, 'read-write', False),
+    1250023: AttributeInfo(1250023, 'scan_advanced_output', 'ViInt32', enums.ScanAdvancedOutput, False, 'read-write', False),
+    1250024: AttributeInfo(1250024, 'is_scanning', 'ViBoolean', None, False, 'read only', True),
+    1250025: AttributeInfo(1250025, 'scan_delay', 'ViReal64', None, False, 'read-write', False),
+}
+
+# Every attribute of NI-SWITCH, by python_name
+index_by_name = dict((a.python_name, a) for a in index.values())
+
+# ctypes type and conversion of the attribute types that _BulkAccessor can get and set
+_bulk_types = {
+    'ViBoolean': (visatype.ViBoolean, bool),
+    'ViInt32': (visatype.ViInt32, int),
+    'ViReal64': (visatype.ViReal64, float),
+}
+
+# Session methods that get and set the attribute types that _BulkAccessor can't
+_accessor_methods = {
+    'ViString': ('_get_attribute_vi_string', '_set_attribute_vi_string'),
+}
+
+
+class _BulkAccessor(object):
+    '''Gets and sets attributes of one type, reusing the same ctypes objects for all of them'''
+
+    def __init__(self, session, attribute_type):
+        ctype, self.convert = _bulk_types[attribute_type]
+        self._session = session
+        self._get_function = getattr(session._library, 'niSwitch_GetAttribute' + attribute_type)
+        self._set_function = getattr(session._library, 'niSwitch_SetAttribute' + attribute_type)
+        self._vi_ctype = visatype.ViSession(session._vi)
+        self._attribute_id_ctype = visatype.ViAttr()
+        self._value_ctype = ctype()
+        self._value_reference = ctypes.pointer(self._value_ctype)
+
+    def get(self, attribute_id):
+        self._attribute_id_ctype.value = attribute_id
+        error_code = self._get_function(self._vi_ctype, self._session._repeated_capability_ctype, self._attribute_id_ctype, self._value_reference)
+        errors.handle_error(self._session, error_code, ignore_warnings=False, is_error_handling=False)
+        return self.convert(self._value_ctype.value)
+
+    def set(self, attribute_id, value):
+        self._attribute_id_ctype.value = attribute_id
+        self._value_ctype.value = value
+        error_code = self._set_function(self._vi_ctype, self._session._repeated_capability_ctype, self._attribute_id_ctype, self._value_ctype)
+        errors.handle_error(self._session, error_code, ignore_warnings=False, is_error_handling=False)
+
+
+class _MethodAccessor(object):
+    '''Gets and sets attributes of one type through the session methods, i.e. for strings'''
+
+    def __init__(self, session, attribute_type):
+        get_method, set_method = _accessor_methods[attribute_type]
+        self.get = getattr(session, get_method)
+        self.set = getattr(session, set_method)
+
+    def convert(self, value):
+        return value
+
+
+def _get_accessor(session, accessors, attribute_type):
+    accessor = accessors.get(attribute_type)
+    if accessor is None:
+        accessor = _BulkAccessor(session, attribute_type) if attribute_type in _bulk_types else _MethodAccessor(session, attribute_type)
+        accessors[attribute_type] = accessor
+    return accessor
+
+
+def get_values(session, infos, skip_errors=False):
+    '''Returns an OrderedDict of the values of the attributes in infos, by python_name
+
+    Uses and updates the attribute cache the same way the properties do. If skip_errors is True, attributes that the
+    driver returns an error for are left out instead of raising.
+    '''
+    cache = session._attribute_cache
+    repeated_capability = session._repeated_capability
+    accessors = {}
+    values = collections.OrderedDict()
+    for info in infos:
+        use_cache = cache.enabled and not info.volatile
+        cached = cache.values.get(info.attribute_id) if use_cache else None
+        if cached is not None and repeated_capability in cached:
+            value = cached[repeated_capability]
+        else:
+            try:
+                value = _get_accessor(session, accessors, info.type).get(info.attribute_id)
+            except errors.Error:
+                if skip_errors:
+                    continue
+                raise
+            if use_cache:
+                cache.values.setdefault(info.attribute_id, {})[repeated_capability] = value
+        values[info.python_name] = value if info.enum is None else enums._get_member(info.enum, value)
+    return values
+
+
+def set_values(session, infos_and_values):
+    '''Sets attributes from (info, value) pairs, in order
+
+    Values of enum attributes must be members of their enum. Updates the attribute cache the same way the properties do.
+    '''
+    cache = session._attribute_cache
+    accessors = {}
+    for info, value in infos_and_values:
+        if info.enum is not None:
+            if type(value) is not info.enum:
+                raise TypeError('{0} must be {1} not {2}'.format(info.python_name, info.enum.__name__, type(value).__name__))
+            value = value.value
+        accessor = _get_accessor(session, accessors, info.type)
+        accessor.set(info.attribute_id, value)
+        if cache.enabled and not info.volatile:
+            cache.values[info.attribute_id] = {session._repeated_capability: accessor.convert(value)}
+
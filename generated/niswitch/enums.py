@@ -1,3 +1,4 @@
+# -*- coding: utf-8 -*-
 # This file was generated
 
 from enum import Enum
@@ -619,3 +620,31 @@ class TriggerMode(Enum):
     SINGLE = 0
     MASTER = 1
     SLAVE = 2
+
+
+# Members of each enum by value. Looking a value from the driver up in these is much faster than calling the enum with it.
+_members_by_value = {
+    CabledModuleScanAdvancedBus: dict((member.value, member) for member in CabledModuleScanAdvancedBus),
+    CabledModuleTriggerBus: dict((member.value, member) for member in CabledModuleTriggerBus),
+    HandshakingInitiation: dict((member.value, member) for member in HandshakingInitiation),
+    MasterSlaveScanAdvancedBus: dict((member.value, member) for member in MasterSlaveScanAdvancedBus),
+    MasterSlaveTriggerBus: dict((member.value, member) for member in MasterSlaveTriggerBus),
+    PathCapability: dict((member.value, member) for member in PathCapability),
+    RelayAction: dict((member.value, member) for member in RelayAction),
+    RelayPosition: dict((member.value, member) for member in RelayPosition),
+    ScanAdvancedOutput: dict((member.value, member) for member in ScanAdvancedOutput),
+    ScanAdvancedPolarity: dict((member.value, member) for member in ScanAdvancedPolarity),
+    ScanMode: dict((member.value, member) for member in ScanMode),
+    TriggerInput: dict((member.value, member) for member in TriggerInput),
+    TriggerInputPolarity: dict((member.value, member) for member in TriggerInputPolarity),
+    TriggerMode: dict((member.value, member) for member in TriggerMode),
+}
+
+
+def _get_member(enum_type, value):
+    '''Returns the member of enum_type that has value, like enum_type(value)'''
+    try:
+        return _members_by_value[enum_type][value]
+    except KeyError:
+        # Raises ValueError, as the enum does for values it doesn't have
+        return enum_type(value)
@@ -1,13 +1,136 @@
 # -*- coding: utf-8 -*-
 # This file was generated
+import collections
 import ctypes
+import threading
 
+from niswitch import _converters  # noqa: F401
 from niswitch import attributes
+from niswitch import call_stats
 from niswitch import enums
 from niswitch import errors
 from niswitch import library_singleton
 from niswitch import visatype
 
+# Size of the buffer that string IVI-dance methods try first, until they know the size they need
+_DEFAULT_IVI_DANCE_BUFFER_SIZE = 256
+
+# Size of the buffer that each string IVI-dance method needed last time, by C function name (and attribute ID). Shared
+# by all sessions.
+_ivi_dance_buffer_sizes = {}
+
+# Messages of the most recently used error and warning codes, from _error_message(). Shared by all sessions.
+_MAX_ERROR_MESSAGES = 64
+_error_messages = collections.OrderedDict()
+_error_messages_lock = threading.Lock()
+
+
+class _ScalarCtypes(threading.local):
+    '''ctypes objects for the scalar parameters of driver functions, which methods reuse instead of creating new ones on every call
+
+    Each thread has its own, so that calls on different threads don't share them.
+    '''
+
+    def __init__(self):
+        self.CanConnect_path_capability = visatype.ViInt32()
+        self.CanConnect_path_capability_pointer = ctypes.pointer(self.CanConnect_path_capability)
+        self.ConfigureScanList_scan_mode = visatype.ViInt32()
+        self.ConfigureScanTrigger_scan_advanced_output = visatype.ViInt32()
+        self.ConfigureScanTrigger_scan_delay = visatype.ViReal64()
+        self.ConfigureScanTrigger_trigger_input = visatype.ViInt32()
+        self.GetAttributeViBoolean_attribute_id = visatype.ViAttr()
+        self.GetAttributeViBoolean_attribute_value = visatype.ViBoolean()
+        self.GetAttributeViBoolean_attribute_value_pointer = ctypes.pointer(self.GetAttributeViBoolean_attribute_value)
+        self.GetAttributeViInt32_attribute_id = visatype.ViAttr()
+        self.GetAttributeViInt32_attribute_value = visatype.ViInt32()
+        self.GetAttributeViInt32_attribute_value_pointer = ctypes.pointer(self.GetAttributeViInt32_attribute_value)
+        self.GetAttributeViReal64_attribute_id = visatype.ViAttr()
+        self.GetAttributeViReal64_attribute_value = visatype.ViReal64()
+        self.GetAttributeViReal64_attribute_value_pointer = ctypes.pointer(self.GetAttributeViReal64_attribute_value)
+        self.GetAttributeViString_attribute_id = visatype.ViAttr()
+        self.GetChannelName_index = visatype.ViInt32()
+        self.GetError_code = visatype.ViStatus()
+        self.GetError_code_pointer = ctypes.pointer(self.GetError_code)
+        self.GetRelayCount_relay_count = visatype.ViInt32()
+        self.GetRelayCount_relay_count_pointer = ctypes.pointer(self.GetRelayCount_relay_count)
+        self.GetRelayName_index = visatype.ViInt32()
+        self.GetRelayPosition_relay_position = visatype.ViInt32()
+        self.GetRelayPosition_relay_position_pointer = ctypes.pointer(self.GetRelayPosition_relay_position)
+        self.InitWithTopology_reset_device = visatype.ViBoolean()
+        self.InitWithTopology_simulate = visatype.ViBoolean()
+        self.InitWithTopology_vi = visatype.ViSession()
+        self.InitWithTopology_vi_pointer = ctypes.pointer(self.InitWithTopology_vi)
+        self.RelayControl_relay_action = visatype.ViInt32()
+        self.RouteScanAdvancedOutput_invert = visatype.ViBoolean()
+        self.RouteScanAdvancedOutput_scan_advanced_output_bus_line = visatype.ViInt32()
+        self.RouteScanAdvancedOutput_scan_advanced_output_connector = visatype.ViInt32()
+        self.RouteTriggerInput_invert = visatype.ViBoolean()
+        self.RouteTriggerInput_trigger_input_bus_line = visatype.ViInt32()
+        self.RouteTriggerInput_trigger_input_connector = visatype.ViInt32()
+        self.SetAttributeViBoolean_attribute_id = visatype.ViAttr()
+        self.SetAttributeViBoolean_attribute_value = visatype.ViBoolean()
+        self.SetAttributeViInt32_attribute_id = visatype.ViAttr()
+        self.SetAttributeViInt32_attribute_value = visatype.ViInt32()
+        self.SetAttributeViReal64_attribute_id = visatype.ViAttr()
+        self.SetAttributeViReal64_attribute_value = visatype.ViReal64()
+        self.SetAttributeViString_attribute_id = visatype.ViAttr()
+        self.SetContinuousScan_continuous_scan = visatype.ViBoolean()
+        self.WaitForDebounce_maximum_time_ms = visatype.ViInt32()
+        self.WaitForScanComplete_maximum_time_ms = visatype.ViInt32()
+        self.error_message_error_code = visatype.ViStatus()
+        self.self_test_self_test_result = visatype.ViInt16()
+        self.self_test_self_test_result_pointer = ctypes.pointer(self.self_test_self_test_result)
+
+
+_scalar_ctypes = _ScalarCtypes()
+
+# C function that each method calls, for call_stats
+_c_functions = {
+    '_abort_scan': 'niSwitch_AbortScan',
+    '_close': 'niSwitch_close',
+    '_error_message': 'niSwitch_error_message',
+    '_get_attribute_vi_boolean': 'niSwitch_GetAttributeViBoolean',
+    '_get_attribute_vi_int32': 'niSwitch_GetAttributeViInt32',
+    '_get_attribute_vi_real64': 'niSwitch_GetAttributeViReal64',
+    '_get_attribute_vi_string': 'niSwitch_GetAttributeViString',
+    '_get_error': 'niSwitch_GetError',
+    '_initiate_scan': 'niSwitch_InitiateScan',
+    '_set_attribute_vi_boolean': 'niSwitch_SetAttributeViBoolean',
+    '_set_attribute_vi_int32': 'niSwitch_SetAttributeViInt32',
+    '_set_attribute_vi_real64': 'niSwitch_SetAttributeViReal64',
+    '_set_attribute_vi_string': 'niSwitch_SetAttributeViString',
+    'can_connect': 'niSwitch_CanConnect',
+    'commit': 'niSwitch_Commit',
+    'configure_scan_list': 'niSwitch_ConfigureScanList',
+    'configure_scan_trigger': 'niSwitch_ConfigureScanTrigger',
+    'connect': 'niSwitch_Connect',
+    'connect_multiple': 'niSwitch_ConnectMultiple',
+    'disable': 'niSwitch_Disable',
+    'disconnect': 'niSwitch_Disconnect',
+    'disconnect_all': 'niSwitch_DisconnectAll',
+    'disconnect_multiple': 'niSwitch_DisconnectMultiple',
+    'get_channel_name': 'niSwitch_GetChannelName',
+    'get_path': 'niSwitch_GetPath',
+    'get_relay_count': 'niSwitch_GetRelayCount',
+    'get_relay_name': 'niSwitch_GetRelayName',
+    'get_relay_position': 'niSwitch_GetRelayPosition',
+    'init_with_topology': 'niSwitch_InitWithTopology',
+    'relay_control': 'niSwitch_RelayControl',
+    'reset': 'niSwitch_reset',
+    'reset_with_defaults': 'niSwitch_ResetWithDefaults',
+    'route_scan_advanced_output': 'niSwitch_RouteScanAdvancedOutput',
+    'route_trigger_input': 'niSwitch_RouteTriggerInput',
+    'self_test': 'niSwitch_self_test',
+    'send_software_trigger': 'niSwitch_SendSoftwareTrigger',
+    'set_continuous_scan': 'niSwitch_SetContinuousScan',
+    'set_path': 'niSwitch_SetPath',
+    'wait_for_debounce': 'niSwitch_WaitForDebounce',
+    'wait_for_scan_complete': 'niSwitch_WaitForScanComplete',
+}
+
+# Maximum number of repeated capability views (i.e. session['0']) that a session keeps to return again
+_MAX_REPEATED_CAPABILITY_VIEWS = 256
+
 
 class _Scan(object):
     def __init__(self, session):
@@ -142,11 +265,11 @@ class _SessionBase(object):
         session['0,1'].is_configuration_channel = var
         var = session['0,1'].is_configuration_channel
     '''
-    is_debounced = attributes.AttributeViBoolean(1250002)
+    is_debounced = attributes.AttributeViBoolean(1250002, volatile=True)
     '''
     This attribute indicates whether the entire switch device has settled  since the last switching command.  A value of VI_TRUE indicates that all  signals going through the switch device are valid.
     '''
-    is_scanning = attributes.AttributeViBoolean(1250024)
+    is_scanning = attributes.AttributeViBoolean(1250024, volatile=True)
     '''
     If VI_TRUE, the switch module is currently scanning through the scan list  (i.e. it is not in the Idle state). If VI_FALSE, the switch module is not  currently scanning through the scan list (i.e. it is in the Idle state).
     '''
@@ -163,7 +286,7 @@ class _SessionBase(object):
         session['0,1'].is_source_channel = var
         var = session['0,1'].is_source_channel
     '''
-    is_waiting_for_trig = attributes.AttributeViBoolean(1150004)
+    is_waiting_for_trig = attributes.AttributeViBoolean(1150004, volatile=True)
     '''
     In a scan list, a semi-colon (;) is used to indicate that at that point in  the scan list, the scan engine should pause until a trigger is received  from the trigger input.  If that trigger is user generated through either  a hardware pulse or the Send SW Trigger operation, it is necessary for the  user to know  when the scan engine has reached such a state.
     '''
@@ -430,7 +553,7 @@ class _SessionBase(object):
     '''
     Contains a comma-separated list of supported instrument models.
     '''
-    temperature = attributes.AttributeViReal64(1150019)
+    temperature = attributes.AttributeViReal64(1150019, volatile=True)
     '''
     This attribute returns the temperature as read by the Switch module.     The units are degrees Celsius.
     '''
@@ -461,26 +584,129 @@ class _SessionBase(object):
         var = session['0,1'].wire_mode
     '''
 
-    def __init__(self, repeated_capability):
-        self._library = library_singleton.get()
+    def __init__(self, repeated_capability, attribute_cache, library, warning_policy, session_stats):
+        self._library = library
         self._repeated_capability = repeated_capability
+        self._attribute_cache = attribute_cache
+        self._warning_policy = warning_policy
+        self._session_stats = session_stats
         self._encoding = 'windows-1251'
+        # The driver does not modify it, so every call can pass the same buffer
+        self._repeated_capability_ctype = ctypes.create_string_buffer(repeated_capability.encode(self._encoding))
+        session_stats._add_session(self)
 
     def __setattr__(self, key, value):
-        if self._is_frozen and key not in dir(self):
+        if self._is_frozen and key not in self._get_attribute_names() and key not in self.__dict__:
             raise AttributeError("'{0}' object has no attribute '{1}'".format(type(self).__name__, key))
         object.__setattr__(self, key, value)
 
+    @property
+    def warning_policy(self):
+        '''warning_policy
+
+        How the session, and its repeated capabilities, report warnings from the driver. Change its mode to warn only
+        once per code, at most once per interval, or only count warnings:
+
+            session.warning_policy.mode = 'count'
+            ...
+            print(session.warning_policy.counts)
+
+        See errors.WarningPolicy.
+        '''
+        return self._warning_policy
+
+    @classmethod
+    def _get_attribute_names(cls):
+        '''_get_attribute_names
+
+        Returns a frozenset of the names of the properties and methods of the class, which can be set once the session
+        is frozen. It is computed once per class, because dir() is too slow to call every time a property is set.
+        '''
+        names = cls.__dict__.get('_attribute_names')
+        if names is None:
+            names = frozenset(dir(cls))
+            cls._attribute_names = names
+        return names
+
+    def _get_attribute_info(self, name_or_id):
+        try:
+            # type(u'') is unicode on Python 2
+            if isinstance(name_or_id, (str, type(u''))):
+                return attributes.index_by_name[name_or_id]
+            return attributes.index[name_or_id]
+        except KeyError:
+            raise ValueError('{0!r} is not an attribute of NI-SWITCH'.format(name_or_id))
+
+    def get_attributes(self, names_or_ids, channels=None):
+        '''get_attributes
+
+        Gets the values of many attributes in one call. It creates the ctypes objects once for each type of attribute,
+        instead of once for each attribute like the properties do.
+
+        Args:
+            names_or_ids (list of str or int): Python names (i.e. 'analog_bus_sharing_enable') or IDs of the attributes
+
+            channels (str): Repeated capabilities (usually channels) to get the attributes for. If not specified, uses the
+                ones of this object, like the properties do.
+
+        Returns:
+            values (collections.OrderedDict): Value of each attribute, by Python name, in the same order as names_or_ids
+        '''
+        session = self if channels is None else _RepeatedCapability(self._vi, channels, self._attribute_cache, self._library, self._warning_policy, self._session_stats)
+        return attributes.get_values(session, [self._get_attribute_info(a) for a in names_or_ids])
+
+    def snapshot(self):
+        '''snapshot
+
+        Gets the values of all the read-write attributes, to restore them later with apply(). Attributes that the driver
+        returns an error for (i.e. not supported by the device) and volatile attributes are left out.
+
+        Use it on a repeated capability (i.e. session['0'].snapshot()) to get the values of specific channels.
+
+        Returns:
+            values (collections.OrderedDict): Value of each attribute, by Python name
+        '''
+        infos = [a for a in sorted(attributes.index.values()) if a.access == 'read-write' and not a.volatile]
+        return attributes.get_values(self, infos, skip_errors=True)
+
+    def apply(self, values):
+        '''apply
+
+        Sets many attributes, i.e. from snapshot(), in order. It first gets the values of the attributes, and only sets
+        the ones that are different.
+
+        Args:
+            values (dict): Value of each attribute, by Python name or ID. Values of enum attributes must be members of
+                their enum.
+
+        Returns:
+            names (list of str): Python names of the attributes that were set
+        '''
+        infos_and_values = [(self._get_attribute_info(a), v) for a, v in values.items()]
+        current_values = attributes.get_values(self, [info for info, _ in infos_and_values if info.access != 'write only'], skip_errors=True)
+        changes = [(info, v) for info, v in infos_and_values if info.python_name not in current_values or current_values[info.python_name] != v]
+        attributes.set_values(self, changes)
+        return [info.python_name for info, _ in changes]
+
+    def _set_attributes(self, values):
+        '''Sets attributes from (Python name or ID, value) pairs, in order, without getting them first like apply() does'''
+        attributes.set_values(self, [(self._get_attribute_info(a), v) for a, v in values])
+
     def _get_error_description(self, error_code):
         '''_get_error_description
 
         Returns the error description.
+
+        errors retrieves descriptions only when they are used, when the last error of the session may be another one.
+        Those get the message for their code instead.
         '''
-        try:
-            _, error_string = self._get_error()
-            return error_string
-        except errors.Error:
-            pass
+        if error_code < 0:
+            try:
+                last_error_code, error_string = self._get_error()
+                if last_error_code == error_code:
+                    return error_string
+            except errors.Error:
+                pass
 
         try:
             '''
@@ -488,11 +714,27 @@ class _SessionBase(object):
             (IVI spec requires GetError to fail).
             Use _error_message instead. It doesn't require a session.
             '''
-            error_string = self._error_message(error_code)
-            return error_string
+            return self._get_error_message(error_code)
         except errors.Error:
             return "Failed to retrieve error description."
 
+    def _get_error_message(self, error_code):
+        '''_get_error_message
+
+        Returns _error_message(error_code), from the messages of the most recently used codes if it is there.
+        '''
+        with _error_messages_lock:
+            error_string = _error_messages.pop(error_code, None)
+            if error_string is not None:
+                _error_messages[error_code] = error_string
+                return error_string
+        error_string = self._error_message(error_code)
+        with _error_messages_lock:
+            _error_messages[error_code] = error_string
+            if len(_error_messages) > _MAX_ERROR_MESSAGES:
+                _error_messages.popitem(last=False)
+        return error_string
+
     ''' These are code-generated '''
 
     def _get_attribute_vi_boolean(self, attribute_id):
@@ -540,11 +782,12 @@ class _SessionBase(object):
                 list of the constants by pressing on this control. Select a value by
                 double-clicking on it or by selecting it and then pressing .
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViBoolean()  # case 13
-        error_code = self._library.niSwitch_GetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViBoolean_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetAttributeViBoolean_attribute_value  # case 13
+        error_code = self._library.niSwitch_GetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViBoolean_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return bool(attribute_value_ctype.value)
 
@@ -593,11 +836,12 @@ class _SessionBase(object):
                 list of the constants by pressing on this control. Select a value by
                 double-clicking on it or by selecting it and then pressing .
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niSwitch_GetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViInt32_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetAttributeViInt32_attribute_value  # case 13
+        error_code = self._library.niSwitch_GetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViInt32_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(attribute_value_ctype.value)
 
@@ -646,11 +890,12 @@ class _SessionBase(object):
                 list of the constants by pressing on this control. Select a value by
                 double-clicking on it or by selecting it and then pressing .
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViReal64()  # case 13
-        error_code = self._library.niSwitch_GetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, ctypes.pointer(attribute_value_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViReal64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.GetAttributeViReal64_attribute_value  # case 13
+        error_code = self._library.niSwitch_GetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, _scalar_ctypes.GetAttributeViReal64_attribute_value_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return float(attribute_value_ctype.value)
 
@@ -714,16 +959,23 @@ class _SessionBase(object):
                 number of bytes in the value. If you pass 0, you can pass VI_NULL for
                 the Attribute Value buffer parameter. Default Value:512
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        array_size_ctype = visatype.ViInt32()  # case 6
-        attribute_value_ctype = None  # case 11
-        error_code = self._library.niSwitch_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, array_size_ctype, attribute_value_ctype)
-        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
-        array_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        attribute_value_ctype = (visatype.ViChar * array_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.GetAttributeViString_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        array_size_ctype = visatype.ViInt32(_ivi_dance_buffer_sizes.get(('GetAttributeViString', attribute_id), _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        attribute_value_ctype = (visatype.ViChar * array_size_ctype.value)()
         error_code = self._library.niSwitch_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, array_size_ctype, attribute_value_ctype)
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            array_size_ctype = visatype.ViInt32(0)
+            attribute_value_ctype = None
+            error_code = self._library.niSwitch_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, array_size_ctype, attribute_value_ctype)
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+            array_size_ctype = visatype.ViInt32(error_code)
+            attribute_value_ctype = (visatype.ViChar * array_size_ctype.value)()
+            error_code = self._library.niSwitch_GetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, array_size_ctype, attribute_value_ctype)
+            _ivi_dance_buffer_sizes[('GetAttributeViString', attribute_id)] = array_size_ctype.value
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return attribute_value_ctype.value.decode(self._encoding)
 
@@ -762,15 +1014,21 @@ class _SessionBase(object):
             code (int): Returns the error code for the session or execution thread. If you pass
                 0 for the Buffer Size, you can pass VI_NULL for this parameter.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        code_ctype = visatype.ViStatus()  # case 13
-        buffer_size_ctype = visatype.ViInt32()  # case 6
-        description_ctype = None  # case 11
-        error_code = self._library.niSwitch_GetError(vi_ctype, ctypes.pointer(code_ctype), buffer_size_ctype, description_ctype)
-        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=True)
-        buffer_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        description_ctype = (visatype.ViChar * buffer_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        error_code = self._library.niSwitch_GetError(vi_ctype, ctypes.pointer(code_ctype), buffer_size_ctype, description_ctype)
+        vi_ctype = self._vi_ctype  # case 1
+        code_ctype = _scalar_ctypes.GetError_code  # case 13
+        buffer_size_ctype = visatype.ViInt32(_ivi_dance_buffer_sizes.get('GetError', _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        description_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+        error_code = self._library.niSwitch_GetError(vi_ctype, _scalar_ctypes.GetError_code_pointer, buffer_size_ctype, description_ctype)
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            buffer_size_ctype = visatype.ViInt32(0)
+            description_ctype = None
+            error_code = self._library.niSwitch_GetError(vi_ctype, _scalar_ctypes.GetError_code_pointer, buffer_size_ctype, description_ctype)
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=True)
+            buffer_size_ctype = visatype.ViInt32(error_code)
+            description_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+            error_code = self._library.niSwitch_GetError(vi_ctype, _scalar_ctypes.GetError_code_pointer, buffer_size_ctype, description_ctype)
+            _ivi_dance_buffer_sizes['GetError'] = buffer_size_ctype.value
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=True)
         return int(code_ctype.value), description_ctype.value.decode(self._encoding)
 
@@ -831,10 +1089,12 @@ class _SessionBase(object):
                 then pressing . Note: Some of the values might not be valid depending on
                 the current settings of the instrument session. Default Value: none
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViBoolean(attribute_value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViBoolean_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.SetAttributeViBoolean_attribute_value
+        attribute_value_ctype.value = attribute_value  # case 8
         error_code = self._library.niSwitch_SetAttributeViBoolean(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -896,10 +1156,12 @@ class _SessionBase(object):
                 then pressing . Note: Some of the values might not be valid depending on
                 the current settings of the instrument session. Default Value: none
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViInt32(attribute_value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViInt32_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.SetAttributeViInt32_attribute_value
+        attribute_value_ctype.value = attribute_value  # case 8
         error_code = self._library.niSwitch_SetAttributeViInt32(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -961,10 +1223,12 @@ class _SessionBase(object):
                 then pressing . Note: Some of the values might not be valid depending on
                 the current settings of the instrument session. Default Value: none
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = visatype.ViReal64(attribute_value)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViReal64_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = _scalar_ctypes.SetAttributeViReal64_attribute_value
+        attribute_value_ctype.value = attribute_value  # case 8
         error_code = self._library.niSwitch_SetAttributeViReal64(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1026,10 +1290,11 @@ class _SessionBase(object):
                 then pressing . Note: Some of the values might not be valid depending on
                 the current settings of the instrument session. Default Value: none
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel_name_ctype = ctypes.create_string_buffer(self._repeated_capability.encode(self._encoding))  # case 2
-        attribute_id_ctype = visatype.ViAttr(attribute_id)  # case 8
-        attribute_value_ctype = ctypes.create_string_buffer(attribute_value.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        channel_name_ctype = self._repeated_capability_ctype  # case 2
+        attribute_id_ctype = _scalar_ctypes.SetAttributeViString_attribute_id
+        attribute_id_ctype.value = attribute_id  # case 8
+        attribute_value_ctype = attribute_value.encode(self._encoding)  # case 3
         error_code = self._library.niSwitch_SetAttributeViString(vi_ctype, channel_name_ctype, attribute_id_ctype, attribute_value_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1050,8 +1315,9 @@ class _SessionBase(object):
             error_message (string): The error information formatted into a string. You must pass a ViChar
                 array with at least 256 bytes.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        error_code_ctype = visatype.ViStatus(error_code)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        error_code_ctype = _scalar_ctypes.error_message_error_code
+        error_code_ctype.value = error_code  # case 8
         error_message_ctype = (visatype.ViChar * 256)()  # case 10
         error_code = self._library.niSwitch_error_message(vi_ctype, error_code_ctype, error_message_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=True)
@@ -1061,9 +1327,10 @@ class _SessionBase(object):
 class _RepeatedCapability(_SessionBase):
     '''Allows for setting/getting properties and calling methods for specific repeated capabilities (such as channels) on your session.'''
 
-    def __init__(self, vi, repeated_capability):
-        super(_RepeatedCapability, self).__init__(repeated_capability)
+    def __init__(self, vi, repeated_capability, attribute_cache, library, warning_policy, session_stats):
+        super(_RepeatedCapability, self).__init__(repeated_capability, attribute_cache, library, warning_policy, session_stats)
         self._vi = vi
+        self._vi_ctype = visatype.ViSession(vi)
         self._is_frozen = True
 
 
@@ -1071,9 +1338,16 @@ class Session(_SessionBase):
     '''An NI-SWITCH session to a National Instruments Switch Module'''
 
     def __init__(self, resource_name, topology='Configured Topology', simulate=False, reset_device=False):
-        super(Session, self).__init__(repeated_capability='')
+        super(Session, self).__init__(repeated_capability='', attribute_cache=attributes.AttributeCache(), library=library_singleton.get(), warning_policy=errors.WarningPolicy(), session_stats=call_stats.SessionStats(_c_functions))
+        if call_stats.registry.enabled:
+            self._session_stats.enable()
+        self._repeated_capability_views = collections.OrderedDict()
+        self._repeated_capability_views_lock = threading.Lock()
         self._vi = 0  # This must be set before calling init_with_topology().
+        # Passed to every method, which would otherwise create it on every call
+        self._vi_ctype = visatype.ViSession(0)
         self._vi = self.init_with_topology(resource_name, topology, simulate, reset_device)
+        self._vi_ctype = visatype.ViSession(self._vi)
         self._is_frozen = True
 
     def __enter__(self):
@@ -1084,18 +1358,89 @@ class Session(_SessionBase):
 
     def __getitem__(self, repeated_capability):
         '''Set/get properties or call methods with a repeated capability (i.e. channels)'''
-        return _RepeatedCapability(self._vi, repeated_capability)
+        # The most recently used views are kept, so loops over channels don't create a view each time
+        with self._repeated_capability_views_lock:
+            view = self._repeated_capability_views.pop(repeated_capability, None)
+            if view is None:
+                view = _RepeatedCapability(self._vi, repeated_capability, self._attribute_cache, self._library, self._warning_policy, self._session_stats)
+                if len(self._repeated_capability_views) >= _MAX_REPEATED_CAPABILITY_VIEWS:
+                    self._repeated_capability_views.popitem(last=False)
+            self._repeated_capability_views[repeated_capability] = view
+        return view
 
     def initiate(self):
         return _Scan(self)
 
+    def enable_attribute_cache(self):
+        '''enable_attribute_cache
+
+        Caches the values of attributes in this session, and in its repeated capabilities, so that getting them again
+        doesn't call into the driver. Setting an attribute updates the cache. Methods that reset or configure the
+        session (i.e. reset(), commit() and configure methods) clear it.
+
+        Volatile attributes, whose values change on their own (i.e. status), are never cached.
+
+        Note:
+        Setting an attribute caches the value that was set. If the driver coerces it (i.e. up to a valid range), the
+        cache returns the value that was set until it is cleared. Calling enable_attribute_cache() again clears it.
+        '''
+        self._attribute_cache.clear()
+        self._attribute_cache.enabled = True
+
+    def disable_attribute_cache(self):
+        '''disable_attribute_cache
+
+        Stops caching the values of attributes, and clears the cache. See enable_attribute_cache().
+        '''
+        self._attribute_cache.enabled = False
+        self._attribute_cache.clear()
+
+    def enable_stats(self):
+        '''enable_stats
+
+        Starts recording statistics of the driver calls of this session, and of its repeated capabilities: for each C
+        function, the number of calls, their latencies, and how much of that time was spent in the driver and how much
+        in Python. Calling enable_stats() again clears them. See stats().
+
+        Methods are slower while stats are enabled. Set call_stats.registry.enabled to True to enable them for all new
+        sessions instead.
+        '''
+        self._session_stats.enable()
+
+    def disable_stats(self):
+        '''disable_stats
+
+        Stops recording statistics of the driver calls. stats() still returns the ones recorded. See enable_stats().
+        '''
+        self._session_stats.disable()
+
+    def stats(self):
+        '''stats
+
+        Returns the statistics of the driver calls recorded since enable_stats():
+
+            session.enable_stats()
+            ...
+            for function, s in session.stats().items():
+                print(function, s.calls, s.driver_time, s.python_time, s.percentile(99))
+
+        Returns:
+            stats (collections.OrderedDict): call_stats.FunctionStats by C function name, the one with the most total
+                time first
+        '''
+        return self._session_stats.stats()
+
     def close(self):
+        with self._repeated_capability_views_lock:
+            self._repeated_capability_views.clear()
         try:
             self._close()
         except errors.Error as e:
             self._vi = 0
+            self._vi_ctype = visatype.ViSession(0)
             raise
         self._vi = 0
+        self._vi_ctype = visatype.ViSession(0)
 
     ''' These are code-generated '''
 
@@ -1106,7 +1451,7 @@ class Session(_SessionBase):
         _initiate_scan. If the switch module is not scanning,
         NISWITCH_ERROR_NO_SCAN_IN_PROGRESS error is returned.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niSwitch_AbortScan(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1151,13 +1496,13 @@ class Session(_SessionBase):
                 create a path between the two channels because one of the channels is a
                 configuration channel and thus unavailable for external connections.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel1_ctype = ctypes.create_string_buffer(channel1.encode(self._encoding))  # case 3
-        channel2_ctype = ctypes.create_string_buffer(channel2.encode(self._encoding))  # case 3
-        path_capability_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niSwitch_CanConnect(vi_ctype, channel1_ctype, channel2_ctype, ctypes.pointer(path_capability_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        channel1_ctype = channel1.encode(self._encoding)  # case 3
+        channel2_ctype = channel2.encode(self._encoding)  # case 3
+        path_capability_ctype = _scalar_ctypes.CanConnect_path_capability  # case 13
+        error_code = self._library.niSwitch_CanConnect(vi_ctype, channel1_ctype, channel2_ctype, _scalar_ctypes.CanConnect_path_capability_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return enums.PathCapability(path_capability_ctype.value)
+        return enums._get_member(enums.PathCapability, path_capability_ctype.value)
 
     def commit(self):
         '''commit
@@ -1167,9 +1512,10 @@ class Session(_SessionBase):
         _initiate_scan. Use commit to arm triggers in a given
         order or to control when expensive hardware operations are performed.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niSwitch_Commit(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_scan_list(self, scanlist, scan_mode=enums.ScanMode.BREAK_BEFORE_MAKE):
@@ -1196,11 +1542,13 @@ class Session(_SessionBase):
         '''
         if type(scan_mode) is not enums.ScanMode:
             raise TypeError('Parameter mode must be of type ' + str(enums.ScanMode))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        scanlist_ctype = ctypes.create_string_buffer(scanlist.encode(self._encoding))  # case 3
-        scan_mode_ctype = visatype.ViInt32(scan_mode.value)  # case 9
+        vi_ctype = self._vi_ctype  # case 1
+        scanlist_ctype = scanlist.encode(self._encoding)  # case 3
+        scan_mode_ctype = _scalar_ctypes.ConfigureScanList_scan_mode
+        scan_mode_ctype.value = scan_mode.value  # case 9
         error_code = self._library.niSwitch_ConfigureScanList(vi_ctype, scanlist_ctype, scan_mode_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def configure_scan_trigger(self, trigger_input, scan_advanced_output, scan_delay=0.0):
@@ -1240,12 +1588,16 @@ class Session(_SessionBase):
             raise TypeError('Parameter mode must be of type ' + str(enums.TriggerInput))
         if type(scan_advanced_output) is not enums.ScanAdvancedOutput:
             raise TypeError('Parameter mode must be of type ' + str(enums.ScanAdvancedOutput))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        scan_delay_ctype = visatype.ViReal64(scan_delay)  # case 8
-        trigger_input_ctype = visatype.ViInt32(trigger_input.value)  # case 9
-        scan_advanced_output_ctype = visatype.ViInt32(scan_advanced_output.value)  # case 9
+        vi_ctype = self._vi_ctype  # case 1
+        scan_delay_ctype = _scalar_ctypes.ConfigureScanTrigger_scan_delay
+        scan_delay_ctype.value = scan_delay  # case 8
+        trigger_input_ctype = _scalar_ctypes.ConfigureScanTrigger_trigger_input
+        trigger_input_ctype.value = trigger_input.value  # case 9
+        scan_advanced_output_ctype = _scalar_ctypes.ConfigureScanTrigger_scan_advanced_output
+        scan_advanced_output_ctype.value = scan_advanced_output.value  # case 9
         error_code = self._library.niSwitch_ConfigureScanTrigger(vi_ctype, scan_delay_ctype, trigger_input_ctype, scan_advanced_output_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def connect(self, channel1, channel2):
@@ -1280,9 +1632,9 @@ class Session(_SessionBase):
                 valid channel names for the switch module. Examples of valid channel
                 names: ch0, com0, ab0, r1, c2, cjtemp Default value: None
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel1_ctype = ctypes.create_string_buffer(channel1.encode(self._encoding))  # case 3
-        channel2_ctype = ctypes.create_string_buffer(channel2.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        channel1_ctype = channel1.encode(self._encoding)  # case 3
+        channel2_ctype = channel2.encode(self._encoding)  # case 3
         error_code = self._library.niSwitch_Connect(vi_ctype, channel1_ctype, channel2_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1320,8 +1672,8 @@ class Session(_SessionBase):
                 of a valid connection list: c0 -> r1, [c2 -> r2 -> c3] In this example,
                 r2 is a configuration channel. Default value: None
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        connection_list_ctype = ctypes.create_string_buffer(connection_list.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        connection_list_ctype = connection_list.encode(self._encoding)  # case 3
         error_code = self._library.niSwitch_ConnectMultiple(vi_ctype, connection_list_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1333,7 +1685,7 @@ class Session(_SessionBase):
         impact on the system to which it is connected. All channels are
         disconnected and any scan in progress is aborted.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niSwitch_Disable(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1356,9 +1708,9 @@ class Session(_SessionBase):
                 valid channel names for the switch module. Examples of valid channel
                 names: ch0, com0, ab0, r1, c2, cjtemp Default value: None
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel1_ctype = ctypes.create_string_buffer(channel1.encode(self._encoding))  # case 3
-        channel2_ctype = ctypes.create_string_buffer(channel2.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        channel1_ctype = channel1.encode(self._encoding)  # case 3
+        channel2_ctype = channel2.encode(self._encoding)  # case 3
         error_code = self._library.niSwitch_Disconnect(vi_ctype, channel1_ctype, channel2_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1369,7 +1721,7 @@ class Session(_SessionBase):
         Breaks all existing paths. If the switch module cannot break all paths,
         NISWITCH_WARN_PATH_REMAINS warning is returned.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niSwitch_DisconnectAll(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1392,8 +1744,8 @@ class Session(_SessionBase):
                 r2 -> c3] In this example, r2 is a configuration channel. Default value:
                 None
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        disconnection_list_ctype = ctypes.create_string_buffer(disconnection_list.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        disconnection_list_ctype = disconnection_list.encode(self._encoding)  # case 3
         error_code = self._library.niSwitch_DisconnectMultiple(vi_ctype, disconnection_list_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1421,15 +1773,22 @@ class Session(_SessionBase):
                 bytes in the value. If you pass 0, you can pass VI_NULL for the
                 Coercion Record buffer parameter. Default Value: None
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        index_ctype = visatype.ViInt32(index)  # case 8
-        buffer_size_ctype = visatype.ViInt32()  # case 6
-        channel_name_buffer_ctype = None  # case 11
-        error_code = self._library.niSwitch_GetChannelName(vi_ctype, index_ctype, buffer_size_ctype, channel_name_buffer_ctype)
-        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
-        buffer_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        channel_name_buffer_ctype = (visatype.ViChar * buffer_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
+        vi_ctype = self._vi_ctype  # case 1
+        index_ctype = _scalar_ctypes.GetChannelName_index
+        index_ctype.value = index  # case 8
+        buffer_size_ctype = visatype.ViInt32(_ivi_dance_buffer_sizes.get('GetChannelName', _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        channel_name_buffer_ctype = (visatype.ViChar * buffer_size_ctype.value)()
         error_code = self._library.niSwitch_GetChannelName(vi_ctype, index_ctype, buffer_size_ctype, channel_name_buffer_ctype)
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            buffer_size_ctype = visatype.ViInt32(0)
+            channel_name_buffer_ctype = None
+            error_code = self._library.niSwitch_GetChannelName(vi_ctype, index_ctype, buffer_size_ctype, channel_name_buffer_ctype)
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+            buffer_size_ctype = visatype.ViInt32(error_code)
+            channel_name_buffer_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+            error_code = self._library.niSwitch_GetChannelName(vi_ctype, index_ctype, buffer_size_ctype, channel_name_buffer_ctype)
+            _ivi_dance_buffer_sizes['GetChannelName'] = buffer_size_ctype.value
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return channel_name_buffer_ctype.value.decode(self._encoding)
 
@@ -1469,16 +1828,22 @@ class Session(_SessionBase):
                 allocate the buffer of the appropriate size before calling this function
                 again.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        channel1_ctype = ctypes.create_string_buffer(channel1.encode(self._encoding))  # case 3
-        channel2_ctype = ctypes.create_string_buffer(channel2.encode(self._encoding))  # case 3
-        buffer_size_ctype = visatype.ViInt32()  # case 6
-        path_ctype = None  # case 11
-        error_code = self._library.niSwitch_GetPath(vi_ctype, channel1_ctype, channel2_ctype, buffer_size_ctype, path_ctype)
-        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
-        buffer_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        path_ctype = (visatype.ViChar * buffer_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
+        vi_ctype = self._vi_ctype  # case 1
+        channel1_ctype = channel1.encode(self._encoding)  # case 3
+        channel2_ctype = channel2.encode(self._encoding)  # case 3
+        buffer_size_ctype = visatype.ViInt32(_ivi_dance_buffer_sizes.get('GetPath', _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        path_ctype = (visatype.ViChar * buffer_size_ctype.value)()
         error_code = self._library.niSwitch_GetPath(vi_ctype, channel1_ctype, channel2_ctype, buffer_size_ctype, path_ctype)
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            buffer_size_ctype = visatype.ViInt32(0)
+            path_ctype = None
+            error_code = self._library.niSwitch_GetPath(vi_ctype, channel1_ctype, channel2_ctype, buffer_size_ctype, path_ctype)
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+            buffer_size_ctype = visatype.ViInt32(error_code)
+            path_ctype = (visatype.ViChar * buffer_size_ctype.value)()
+            error_code = self._library.niSwitch_GetPath(vi_ctype, channel1_ctype, channel2_ctype, buffer_size_ctype, path_ctype)
+            _ivi_dance_buffer_sizes['GetPath'] = buffer_size_ctype.value
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return path_ctype.value.decode(self._encoding)
 
@@ -1499,10 +1864,10 @@ class Session(_SessionBase):
         Returns:
             relay_count (int): The number of relay cycles.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        relay_name_ctype = ctypes.create_string_buffer(relay_name.encode(self._encoding))  # case 3
-        relay_count_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niSwitch_GetRelayCount(vi_ctype, relay_name_ctype, ctypes.pointer(relay_count_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        relay_name_ctype = relay_name.encode(self._encoding)  # case 3
+        relay_count_ctype = _scalar_ctypes.GetRelayCount_relay_count  # case 13
+        error_code = self._library.niSwitch_GetRelayCount(vi_ctype, relay_name_ctype, _scalar_ctypes.GetRelayCount_relay_count_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(relay_count_ctype.value)
 
@@ -1529,15 +1894,22 @@ class Session(_SessionBase):
                 bytes in the value. If you pass 0, you can pass VI_NULL for the
                 Coercion Record buffer parameter. Default Value: None
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        index_ctype = visatype.ViInt32(index)  # case 8
-        relay_name_buffer_size_ctype = visatype.ViInt32()  # case 6
-        relay_name_buffer_ctype = None  # case 11
-        error_code = self._library.niSwitch_GetRelayName(vi_ctype, index_ctype, relay_name_buffer_size_ctype, relay_name_buffer_ctype)
-        errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
-        relay_name_buffer_size_ctype = visatype.ViInt32(error_code)  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
-        relay_name_buffer_ctype = (visatype.ViChar * relay_name_buffer_size_ctype.value)()  # TODO(marcoskirsch): use get_ctype_variable_declaration_snippet()
+        vi_ctype = self._vi_ctype  # case 1
+        index_ctype = _scalar_ctypes.GetRelayName_index
+        index_ctype.value = index  # case 8
+        relay_name_buffer_size_ctype = visatype.ViInt32(_ivi_dance_buffer_sizes.get('GetRelayName', _DEFAULT_IVI_DANCE_BUFFER_SIZE))
+        relay_name_buffer_ctype = (visatype.ViChar * relay_name_buffer_size_ctype.value)()
         error_code = self._library.niSwitch_GetRelayName(vi_ctype, index_ctype, relay_name_buffer_size_ctype, relay_name_buffer_ctype)
+        if error_code > 0:
+            # The string was truncated and the driver returned the size it needs, or it returned a warning: do the IVI-dance
+            relay_name_buffer_size_ctype = visatype.ViInt32(0)
+            relay_name_buffer_ctype = None
+            error_code = self._library.niSwitch_GetRelayName(vi_ctype, index_ctype, relay_name_buffer_size_ctype, relay_name_buffer_ctype)
+            errors.handle_error(self, error_code, ignore_warnings=True, is_error_handling=False)
+            relay_name_buffer_size_ctype = visatype.ViInt32(error_code)
+            relay_name_buffer_ctype = (visatype.ViChar * relay_name_buffer_size_ctype.value)()
+            error_code = self._library.niSwitch_GetRelayName(vi_ctype, index_ctype, relay_name_buffer_size_ctype, relay_name_buffer_ctype)
+            _ivi_dance_buffer_sizes['GetRelayName'] = relay_name_buffer_size_ctype.value
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return relay_name_buffer_ctype.value.decode(self._encoding)
 
@@ -1556,12 +1928,12 @@ class Session(_SessionBase):
             relay_position (enums.RelayPosition): Indicates whether the relay is open or closed. NISWITCH_VAL_OPEN 10
                 NIWITCH_VAL_CLOSED 11
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        relay_name_ctype = ctypes.create_string_buffer(relay_name.encode(self._encoding))  # case 3
-        relay_position_ctype = visatype.ViInt32()  # case 13
-        error_code = self._library.niSwitch_GetRelayPosition(vi_ctype, relay_name_ctype, ctypes.pointer(relay_position_ctype))
+        vi_ctype = self._vi_ctype  # case 1
+        relay_name_ctype = relay_name.encode(self._encoding)  # case 3
+        relay_position_ctype = _scalar_ctypes.GetRelayPosition_relay_position  # case 13
+        error_code = self._library.niSwitch_GetRelayPosition(vi_ctype, relay_name_ctype, _scalar_ctypes.GetRelayPosition_relay_position_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
-        return enums.RelayPosition(relay_position_ctype.value)
+        return enums._get_member(enums.RelayPosition, relay_position_ctype.value)
 
     def init_with_topology(self, resource_name, topology='Configured Topology', simulate=False, reset_device=False):
         '''init_with_topology
@@ -1795,12 +2167,14 @@ class Session(_SessionBase):
                 init_with_topology, InitWithOptions, or init
                 and used for all subsequent NI-SWITCH calls.
         '''
-        resource_name_ctype = ctypes.create_string_buffer(resource_name.encode(self._encoding))  # case 3
-        topology_ctype = ctypes.create_string_buffer(topology.encode(self._encoding))  # case 3
-        simulate_ctype = visatype.ViBoolean(simulate)  # case 8
-        reset_device_ctype = visatype.ViBoolean(reset_device)  # case 8
-        vi_ctype = visatype.ViSession()  # case 13
-        error_code = self._library.niSwitch_InitWithTopology(resource_name_ctype, topology_ctype, simulate_ctype, reset_device_ctype, ctypes.pointer(vi_ctype))
+        resource_name_ctype = resource_name.encode(self._encoding)  # case 3
+        topology_ctype = topology.encode(self._encoding)  # case 3
+        simulate_ctype = _scalar_ctypes.InitWithTopology_simulate
+        simulate_ctype.value = simulate  # case 8
+        reset_device_ctype = _scalar_ctypes.InitWithTopology_reset_device
+        reset_device_ctype.value = reset_device  # case 8
+        vi_ctype = _scalar_ctypes.InitWithTopology_vi  # case 13
+        error_code = self._library.niSwitch_InitWithTopology(resource_name_ctype, topology_ctype, simulate_ctype, reset_device_ctype, _scalar_ctypes.InitWithTopology_vi_pointer)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return int(vi_ctype.value)
 
@@ -1816,7 +2190,7 @@ class Session(_SessionBase):
         scanning operation, To stop the scanning operation, call
         _abort_scan.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niSwitch_InitiateScan(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1841,9 +2215,10 @@ class Session(_SessionBase):
         '''
         if type(relay_action) is not enums.RelayAction:
             raise TypeError('Parameter mode must be of type ' + str(enums.RelayAction))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        relay_name_ctype = ctypes.create_string_buffer(relay_name.encode(self._encoding))  # case 3
-        relay_action_ctype = visatype.ViInt32(relay_action.value)  # case 9
+        vi_ctype = self._vi_ctype  # case 1
+        relay_name_ctype = relay_name.encode(self._encoding)  # case 3
+        relay_action_ctype = _scalar_ctypes.RelayControl_relay_action
+        relay_action_ctype.value = relay_action.value  # case 9
         error_code = self._library.niSwitch_RelayControl(vi_ctype, relay_name_ctype, relay_action_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1856,9 +2231,10 @@ class Session(_SessionBase):
         created without a logical name, this function is equivalent to
         reset.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niSwitch_ResetWithDefaults(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def route_scan_advanced_output(self, scan_advanced_output_connector, scan_advanced_output_bus_line, invert=False):
@@ -1884,10 +2260,13 @@ class Session(_SessionBase):
             raise TypeError('Parameter mode must be of type ' + str(enums.ScanAdvancedOutput))
         if type(scan_advanced_output_bus_line) is not enums.ScanAdvancedOutput:
             raise TypeError('Parameter mode must be of type ' + str(enums.ScanAdvancedOutput))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        scan_advanced_output_connector_ctype = visatype.ViInt32(scan_advanced_output_connector.value)  # case 9
-        scan_advanced_output_bus_line_ctype = visatype.ViInt32(scan_advanced_output_bus_line.value)  # case 9
-        invert_ctype = visatype.ViBoolean(invert)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        scan_advanced_output_connector_ctype = _scalar_ctypes.RouteScanAdvancedOutput_scan_advanced_output_connector
+        scan_advanced_output_connector_ctype.value = scan_advanced_output_connector.value  # case 9
+        scan_advanced_output_bus_line_ctype = _scalar_ctypes.RouteScanAdvancedOutput_scan_advanced_output_bus_line
+        scan_advanced_output_bus_line_ctype.value = scan_advanced_output_bus_line.value  # case 9
+        invert_ctype = _scalar_ctypes.RouteScanAdvancedOutput_invert
+        invert_ctype.value = invert  # case 8
         error_code = self._library.niSwitch_RouteScanAdvancedOutput(vi_ctype, scan_advanced_output_connector_ctype, scan_advanced_output_bus_line_ctype, invert_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1916,10 +2295,13 @@ class Session(_SessionBase):
             raise TypeError('Parameter mode must be of type ' + str(enums.TriggerInput))
         if type(trigger_input_bus_line) is not enums.TriggerInput:
             raise TypeError('Parameter mode must be of type ' + str(enums.TriggerInput))
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        trigger_input_connector_ctype = visatype.ViInt32(trigger_input_connector.value)  # case 9
-        trigger_input_bus_line_ctype = visatype.ViInt32(trigger_input_bus_line.value)  # case 9
-        invert_ctype = visatype.ViBoolean(invert)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        trigger_input_connector_ctype = _scalar_ctypes.RouteTriggerInput_trigger_input_connector
+        trigger_input_connector_ctype.value = trigger_input_connector.value  # case 9
+        trigger_input_bus_line_ctype = _scalar_ctypes.RouteTriggerInput_trigger_input_bus_line
+        trigger_input_bus_line_ctype.value = trigger_input_bus_line.value  # case 9
+        invert_ctype = _scalar_ctypes.RouteTriggerInput_invert
+        invert_ctype.value = invert  # case 8
         error_code = self._library.niSwitch_RouteTriggerInput(vi_ctype, trigger_input_connector_ctype, trigger_input_bus_line_ctype, invert_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1934,7 +2316,7 @@ class Session(_SessionBase):
         a semi-colon (wait for trigger) until send_software_trigger is
         called.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niSwitch_SendSoftwareTrigger(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1950,8 +2332,9 @@ class Session(_SessionBase):
                 If VI_FALSE, the scan stops after one pass through the scan list.
                 Default value: VI_FALSE
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        continuous_scan_ctype = visatype.ViBoolean(continuous_scan)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        continuous_scan_ctype = _scalar_ctypes.SetContinuousScan_continuous_scan
+        continuous_scan_ctype.value = continuous_scan  # case 8
         error_code = self._library.niSwitch_SetContinuousScan(vi_ctype, continuous_scan_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1972,8 +2355,8 @@ class Session(_SessionBase):
                 configuration channel. Default value: None Obtain the path list for a
                 previously created path with get_path.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        path_list_ctype = ctypes.create_string_buffer(path_list.encode(self._encoding))  # case 3
+        vi_ctype = self._vi_ctype  # case 1
+        path_list_ctype = path_list.encode(self._encoding)  # case 3
         error_code = self._library.niSwitch_SetPath(vi_ctype, path_list_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -1992,8 +2375,9 @@ class Session(_SessionBase):
                 before all relays active or deactivate, a timeout error is returned.
                 Default Value:5000 ms
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        maximum_time_ms_ctype = visatype.ViInt32(maximum_time_ms)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        maximum_time_ms_ctype = _scalar_ctypes.WaitForDebounce_maximum_time_ms
+        maximum_time_ms_ctype.value = maximum_time_ms  # case 8
         error_code = self._library.niSwitch_WaitForDebounce(vi_ctype, maximum_time_ms_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2013,8 +2397,9 @@ class Session(_SessionBase):
                 NISWITCH_ERROR_MAX_TIME_EXCEEDED error is returned. Default
                 Value:5000 ms
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        maximum_time_ms_ctype = visatype.ViInt32(maximum_time_ms)  # case 8
+        vi_ctype = self._vi_ctype  # case 1
+        maximum_time_ms_ctype = _scalar_ctypes.WaitForScanComplete_maximum_time_ms
+        maximum_time_ms_ctype.value = maximum_time_ms  # case 8
         error_code = self._library.niSwitch_WaitForScanComplete(vi_ctype, maximum_time_ms_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2028,7 +2413,7 @@ class Session(_SessionBase):
         _close, you cannot use the instrument driver again until you
         call init or InitWithOptions.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niSwitch_close(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
         return
@@ -2040,9 +2425,10 @@ class Session(_SessionBase):
         at initialization. Configuration channel and source channel settings
         remain unchanged.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
+        vi_ctype = self._vi_ctype  # case 1
         error_code = self._library.niSwitch_reset(vi_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return
 
     def self_test(self):
@@ -2055,11 +2441,12 @@ class Session(_SessionBase):
             self_test_message (string): Self-test response string from the switch device. You must pass a ViChar
                 array with at least 256 bytes.
         '''
-        vi_ctype = visatype.ViSession(self._vi)  # case 1
-        self_test_result_ctype = visatype.ViInt16()  # case 13
+        vi_ctype = self._vi_ctype  # case 1
+        self_test_result_ctype = _scalar_ctypes.self_test_self_test_result  # case 13
         self_test_message_ctype = (visatype.ViChar * 256)()  # case 10
-        error_code = self._library.niSwitch_self_test(vi_ctype, ctypes.pointer(self_test_result_ctype), self_test_message_ctype)
+        error_code = self._library.niSwitch_self_test(vi_ctype, _scalar_ctypes.self_test_self_test_result_pointer, self_test_message_ctype)
         errors.handle_error(self, error_code, ignore_warnings=False, is_error_handling=False)
+        self._attribute_cache.clear()
         return int(self_test_result_ctype.value), self_test_message_ctype.value.decode(self._encoding)
 
 
@@ -0,0 +1,300 @@
+# This file was generated
+'''Simulated NI-SWITCH runtime, for testing and benchmarking without hardware.'''
+
+from niswitch import _simulation
+
+
+# (name, direction, type, is_buffer, size mechanism, index of the size parameter, default value) of every parameter of every function
+_functions = {
+    'niSwitch_AbortScan': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niSwitch_CanConnect': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channel1', 'in', 'ViChar', True, 'fixed', None, None),
+        ('channel2', 'in', 'ViChar', True, 'fixed', None, None),
+        ('pathCapability', 'out', 'ViInt32', False, None, None, 1),
+    ),
+    'niSwitch_Commit': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niSwitch_ConfigureScanList': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Scanlist', 'in', 'ViChar', True, 'fixed', None, None),
+        ('scanMode', 'in', 'ViInt32', False, None, None, 0),
+    ),
+    'niSwitch_ConfigureScanTrigger': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('scanDelay', 'in', 'ViReal64', False, None, None, None),
+        ('triggerInput', 'in', 'ViInt32', False, None, None, 1),
+        ('scanAdvancedOutput', 'in', 'ViInt32', False, None, None, 0),
+    ),
+    'niSwitch_Connect': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channel1', 'in', 'ViChar', True, 'fixed', None, None),
+        ('channel2', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niSwitch_ConnectMultiple': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('connectionList', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niSwitch_Disable': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niSwitch_Disconnect': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channel1', 'in', 'ViChar', True, 'fixed', None, None),
+        ('channel2', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niSwitch_DisconnectAll': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niSwitch_DisconnectMultiple': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('disconnectionList', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niSwitch_GetAttributeViBoolean': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'out', 'ViBoolean', False, None, None, None),
+    ),
+    'niSwitch_GetAttributeViInt32': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niSwitch_GetAttributeViReal64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'out', 'ViReal64', False, None, None, None),
+    ),
+    'niSwitch_GetAttributeViString': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('arraySize', 'in', 'ViInt32', False, None, None, None),
+        ('attributeValue', 'out', 'ViChar', True, 'ivi-dance', 3, None),
+    ),
+    'niSwitch_GetChannelName': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Index', 'in', 'ViInt32', False, None, None, None),
+        ('bufferSize', 'in', 'ViInt32', False, None, None, None),
+        ('channelNameBuffer', 'out', 'ViChar', True, 'ivi-dance', 2, None),
+    ),
+    'niSwitch_GetError': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Code', 'out', 'ViStatus', False, None, None, None),
+        ('BufferSize', 'in', 'ViInt32', False, None, None, None),
+        ('Description', 'out', 'ViChar', True, 'ivi-dance', 2, None),
+    ),
+    'niSwitch_GetPath': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channel1', 'in', 'ViChar', True, 'fixed', None, None),
+        ('channel2', 'in', 'ViChar', True, 'fixed', None, None),
+        ('bufferSize', 'in', 'ViInt32', False, None, None, None),
+        ('Path', 'out', 'ViChar', True, 'ivi-dance', 3, None),
+    ),
+    'niSwitch_GetRelayCount': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('relayName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('relayCount', 'out', 'ViInt32', False, None, None, None),
+    ),
+    'niSwitch_GetRelayName': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('Index', 'in', 'ViInt32', False, None, None, None),
+        ('relayNameBufferSize', 'in', 'ViInt32', False, None, None, None),
+        ('relayNameBuffer', 'out', 'ViChar', True, 'ivi-dance', 2, None),
+    ),
+    'niSwitch_GetRelayPosition': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('relayName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('relayPosition', 'out', 'ViInt32', False, None, None, 10),
+    ),
+    'niSwitch_InitWithTopology': (
+        ('resourceName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Topology', 'in', 'ViChar', True, 'fixed', None, None),
+        ('Simulate', 'in', 'ViBoolean', False, None, None, None),
+        ('resetDevice', 'in', 'ViBoolean', False, None, None, None),
+        ('vi', 'out', 'ViSession', False, None, None, None),
+    ),
+    'niSwitch_InitiateScan': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niSwitch_RelayControl': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('relayName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('relayAction', 'in', 'ViInt32', False, None, None, 20),
+    ),
+    'niSwitch_ResetWithDefaults': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niSwitch_RouteScanAdvancedOutput': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('scanAdvancedOutputConnector', 'in', 'ViInt32', False, None, None, 0),
+        ('scanAdvancedOutputBusLine', 'in', 'ViInt32', False, None, None, 0),
+        ('Invert', 'in', 'ViBoolean', False, None, None, None),
+    ),
+    'niSwitch_RouteTriggerInput': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('triggerInputConnector', 'in', 'ViInt32', False, None, None, 1),
+        ('triggerInputBusLine', 'in', 'ViInt32', False, None, None, 1),
+        ('Invert', 'in', 'ViBoolean', False, None, None, None),
+    ),
+    'niSwitch_SendSoftwareTrigger': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niSwitch_SetAttributeViBoolean': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViBoolean', False, None, None, None),
+    ),
+    'niSwitch_SetAttributeViInt32': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niSwitch_SetAttributeViReal64': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViReal64', False, None, None, None),
+    ),
+    'niSwitch_SetAttributeViString': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('channelName', 'in', 'ViChar', True, 'fixed', None, None),
+        ('attributeId', 'in', 'ViAttr', False, None, None, None),
+        ('attributeValue', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niSwitch_SetContinuousScan': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('continuousScan', 'in', 'ViBoolean', False, None, None, None),
+    ),
+    'niSwitch_SetPath': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('pathList', 'in', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niSwitch_WaitForDebounce': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('maximumTimeMs', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niSwitch_WaitForScanComplete': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('maximumTimeMs', 'in', 'ViInt32', False, None, None, None),
+    ),
+    'niSwitch_close': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niSwitch_error_message': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('errorCode', 'in', 'ViStatus', False, None, None, None),
+        ('errorMessage', 'out', 'ViChar', True, 'fixed', None, None),
+    ),
+    'niSwitch_reset': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+    ),
+    'niSwitch_self_test': (
+        ('vi', 'in', 'ViSession', False, None, None, None),
+        ('selfTestResult', 'out', 'ViInt16', False, None, None, None),
+        ('selfTestMessage', 'out', 'ViChar', True, 'fixed', None, None),
+    ),
+}
+
+# Value of every attribute until it is set
+_attributes = {
+    1050002: False,  # RANGE_CHECK
+    1050003: False,  # QUERY_INSTRUMENT_STATUS
+    1050004: False,  # CACHE
+    1050005: False,  # SIMULATE
+    1050006: False,  # RECORD_COERCIONS
+    1050007: '',  # DRIVER_SETUP
+    1050021: False,  # INTERCHANGE_CHECK
+    1050203: 0,  # CHANNEL_COUNT
+    1050302: '',  # SPECIFIC_DRIVER_PREFIX
+    1050304: '',  # IO_RESOURCE_DESCRIPTOR
+    1050305: '',  # LOGICAL_NAME
+    1050327: '',  # SUPPORTED_INSTRUMENT_MODELS
+    1050401: '',  # GROUP_CAPABILITIES
+    1050510: '',  # INSTRUMENT_FIRMWARE_REVISION
+    1050511: '',  # INSTRUMENT_MANUFACTURER
+    1050512: '',  # INSTRUMENT_MODEL
+    1050513: '',  # SPECIFIC_DRIVER_VENDOR
+    1050514: '',  # SPECIFIC_DRIVER_DESCRIPTION
+    1050515: 0,  # SPECIFIC_DRIVER_CLASS_SPEC_MAJOR_VERSION
+    1050516: 0,  # SPECIFIC_DRIVER_CLASS_SPEC_MINOR_VERSION
+    1050551: '',  # SPECIFIC_DRIVER_REVISION
+    1150001: 0,  # SERIAL_NUMBER_I32
+    1150002: False,  # CONTINUOUS_SCAN
+    1150004: False,  # IS_WAITING_FOR_TRIG
+    1150005: 0,  # TRIGGER_MODE
+    1150006: 0,  # MASTER_SLAVE_TRIGGER_BUS
+    1150007: 0,  # MASTER_SLAVE_SCAN_ADVANCED_BUS
+    1150008: 0,  # CABLED_MODULE_TRIGGER_BUS
+    1150009: 0,  # CABLED_MODULE_SCAN_ADVANCED_BUS
+    1150010: 0,  # TRIGGER_INPUT_POLARITY
+    1150011: 0,  # SCAN_ADVANCED_POLARITY
+    1150012: '',  # PARSED_SCAN_LIST
+    1150013: 0,  # HANDSHAKING_INITIATION
+    1150014: 0,  # NUMBER_OF_RELAYS
+    1150015: '',  # SERIAL_NUMBER
+    1150016: False,  # DIGITAL_FILTER_ENABLE
+    1150017: False,  # POWER_DOWN_LATCHING_RELAYS_AFTER_DEBOUNCE
+    1150018: False,  # ANALOG_BUS_SHARING_ENABLE
+    1150019: 0.0,  # TEMPERATURE
+    1250001: False,  # IS_SOURCE_CHANNEL
+    1250002: False,  # IS_DEBOUNCED
+    1250003: False,  # IS_CONFIGURATION_CHANNEL
+    1250004: 0.0,  # SETTLING_TIME
+    1250005: 0.0,  # BANDWIDTH
+    1250006: 0.0,  # MAX_DC_VOLTAGE
+    1250007: 0.0,  # MAX_AC_VOLTAGE
+    1250008: 0.0,  # MAX_SWITCHING_DC_CURRENT
+    1250009: 0.0,  # MAX_SWITCHING_AC_CURRENT
+    1250010: 0.0,  # MAX_CARRY_DC_CURRENT
+    1250011: 0.0,  # MAX_CARRY_AC_CURRENT
+    1250012: 0.0,  # MAX_SWITCHING_DC_POWER
+    1250013: 0.0,  # MAX_SWITCHING_AC_POWER
+    1250014: 0.0,  # MAX_CARRY_DC_POWER
+    1250015: 0.0,  # MAX_CARRY_AC_POWER
+    1250016: 0.0,  # CHARACTERISTIC_IMPEDANCE
+    1250017: 0,  # WIRE_MODE
+    1250018: 0,  # NUM_OF_ROWS
+    1250019: 0,  # NUM_OF_COLUMNS
+    1250020: '',  # SCAN_LIST
+    1250021: 0,  # SCAN_MODE
+    1250022: 1,  # TRIGGER_INPUT
+    1250023: 0,  # SCAN_ADVANCED_OUTPUT
+    1250024: False,  # IS_SCANNING
+    1250025: 0.0,  # SCAN_DELAY
+}
+
+# Values returned in output parameters, by function and parameter name. Output buffers that are not listed are
+# filled with synthetic data, and output counts (i.e. actualNumberOfPoints) return the number of elements written.
+_output_values = {
+}
+
+
+class Simulator(_simulation.SimulatedLibrary):
+    '''Simulator
+
+    Pure-Python stand-in for the NI-SWITCH runtime. It keeps the value of attributes for each session and fills
+    output buffers with synthetic data. Pass an instance to library_singleton.set_backend() before creating sessions:
+
+        import niswitch.simulator
+        niswitch.library_singleton.set_backend(niswitch.simulator.Simulator(latency=0.0001))
+
+    Args:
+        latency (float): Time, in seconds, that every function call sleeps for. Can be changed at any time.
+        array_size (int): Number of elements of output buffers that the driver sizes, i.e. with the IVI-dance
+        attribute_values (dict): Value of attributes, by attribute ID, until they are set
+        output_values (dict): Values returned in output parameters, by C function name without the prefix and
+            parameter name, i.e. {'ReadMultiPoint': {'readingArray': 1.5}}. A single value fills a whole buffer, and
+            a dict of field values fills every structure of a buffer of structures.
+    '''
+
+    def __init__(self, latency=0.0, array_size=1000, attribute_values=None, output_values=None):
+        super(Simulator, self).__init__('niSwitch_', _functions, _attributes, _output_values, latency, array_size, attribute_values, output_values)
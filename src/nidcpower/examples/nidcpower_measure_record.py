@@ -25,10 +25,9 @@ with nidcpower.Session(args.name, channels=args.channels) as session:
     row_format = '{0:3d}:   {1:8.6f}   {2:8.6f}   {3}'
     samples_acquired = 0
     with session.initiate():
-        while samples_acquired < args.length:
-            voltage_measurements, current_measurements, in_compliance, actual_count = session.fetch_multiple(session.fetch_backlog)
-            assert len(voltage_measurements) == len(current_measurements) == len(in_compliance) == actual_count
-            for i in range(actual_count):
+        # Measurements are fetched as they are taken, until the record of each channel is complete
+        for chunk in session.stream_measurements(args.channels):
+            for voltage, current, in_compliance in zip(chunk.voltage_measurements, chunk.current_measurements, chunk.in_compliance):
                 samples_acquired += 1
-                print(row_format.format(samples_acquired, voltage_measurements[i], current_measurements[i], in_compliance[i]))
+                print(row_format.format(samples_acquired, voltage, current, bool(in_compliance)))
 
@@ -6,4 +6,10 @@
 attributes_codegen_method = {
 }
 
-
+# Attributes whose value changes without the application setting it, i.e. status. They are never cached.
+attributes_volatile = {
+    1150056: { "volatile": True },  # FETCH_BACKLOG
+    1150001: { "volatile": True },  # POWER_SOURCE_IN_USE
+    1150002: { "volatile": True },  # AUXILIARY_POWER_SOURCE_AVAILABLE
+    1150105: { "volatile": True },  # INTERLOCK_INPUT_OPEN
+}
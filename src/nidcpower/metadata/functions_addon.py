@@ -73,6 +73,172 @@ functions_buffer_info = {
                                                       6: { 'size': {'mechanism':'passed-in', 'value':'Count'}, }, }, },
 }
 
+# Output buffers whose Session method gets an 'array_type' keyword argument, to return them as list, array.array or numpy.ndarray.
+# The value is the default for that keyword argument.
+functions_array_type = {
+    'FetchMultiple':                { 'parameters': { 4: { 'array_type': 'list', },
+                                                      5: { 'array_type': 'list', }, }, },
+}
+
+# Output buffers that also get a "_into" method, which fills a buffer allocated by the caller (i.e. numpy.ndarray) in place
+functions_into_method = {
+    'FetchMultiple':                { 'parameters': { 4: { 'into_method': True, },
+                                                      5: { 'into_method': True, },
+                                                      6: { 'into_method': True, }, }, },
+}
+
+# Session methods implemented in Python, with no C function behind them. 'python_implementation' names the
+# function, in a module from python_implementation/, that the Session method calls.
+python_only_functions = {
+    'FetchMultipleColumns': {
+        'codegen_method': 'public',
+        'python_implementation': '_fetching.fetch_multiple_columns',
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'Identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'channelName',
+                'type': 'ViChar[]',
+                'documentation': {
+                    'description': 'The channel to fetch the measurements of.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'Count',
+                'type': 'ViInt32',
+                'documentation': {
+                    'description': 'Specifies the number of measurements to fetch.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'Timeout',
+                'type': 'ViReal64',
+                'default_value': 1.0,
+                'documentation': {
+                    'description': 'Specifies the maximum time allowed for this function to complete, in seconds.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'out',
+                'type': 'ViReal64',
+                'python_type': 'dict',
+                'default_value': None,
+                'documentation': {
+                    'description': 'Arrays to fetch into, with the same keys and dtypes as the returned ones, of at least **count** elements. By default, new arrays are allocated.',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+Same as fetch_multiple, but returns the measurements as columns of numpy arrays instead of lists,
+so no Python object is created for each measurement.
+
+Returns an OrderedDict of numpy.ndarray of the measurements actually fetched:
+
+-  **voltage**, of numpy.float64
+-  **current**, of numpy.float64
+-  **in_compliance**, of numpy.bool_
+
+The driver fills the voltage and current arrays in place. Pass **out**, i.e. the dict returned by a
+previous call, to fetch into the same arrays again instead of allocating new ones. The returned arrays
+are then views of those. **in_compliance** in **out** may also be of numpy.uint16, nonzero where the
+output was in compliance, which the driver fills in place as well instead of it being converted.
+''',
+            'note': '''
+This method requires numpy.
+''',
+        },
+    },
+    'StreamMeasurements': {
+        'codegen_method': 'public',
+        'python_implementation': '_streaming.stream_measurements',
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'Identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'channels',
+                'type': 'ViString',
+                'documentation': {
+                    'description': 'Comma-separated list, or Python list, of the channels to fetch. Each entry must name a single channel.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'chunkSize',
+                'type': 'ViInt32',
+                'default_value': 1000,
+                'documentation': {
+                    'description': 'Maximum number of measurements in each chunk.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'Timeout',
+                'type': 'ViReal64',
+                'default_value': 5.0,
+                'documentation': {
+                    'description': 'Maximum time, in seconds, to wait for new measurements on any of the channels.',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+Generator that fetches the measure records of channels while they are being acquired, in chunks of the
+measurements available so far.
+
+It reads fetch_backlog of each channel in turn, and fetches that many measurements, up to
+**chunk_size**, with fetch_multiple_into(). It stops once measure_record_length measurements of every
+channel are fetched, or never for channels whose measure_record_length_is_finite is False, until the
+caller stops iterating.
+
+Each item is a MeasurementChunk named tuple of (channel, offset, timestamps, voltage_measurements,
+current_measurements, in_compliance), where **offset** is the index of the first measurement of the
+chunk within the record of the channel. The other fields have the same length.
+**voltage_measurements** and **current_measurements** are ctypes arrays of visatype.ViReal64, and
+**in_compliance** is a ctypes array of visatype.ViBoolean, nonzero where the output was in compliance.
+Use numpy.frombuffer() to wrap them without copying them. **timestamps** is a sequence of the time of
+each measurement, in seconds from the first one, computed from measure_record_delta_time when indexed.
+Its **offset** and **delta_time** attributes give all of them at once, i.e.
+(offset + numpy.arange(len(timestamps))) * delta_time.
+
+Each channel has its own buffers, allocated once, so a chunk stays valid until the next chunk of the
+same channel is requested. Copy the data to keep it longer.
+''',
+            'note': '''
+Initiate first, i.e. in a 'with session.initiate():' block.
+''',
+        },
+    },
+}
+
 # These are functions we mark as "error_handling":True. The generator uses this information to
 # change how error handling is done within those functions themselves - basically, if an error occurs,
 # dont try to handle it, since the functions are only used within the context of error handling.
@@ -8,6 +8,11 @@ MODULE_FILES_TO_COPY := $(DEFAULT_PY_FILES_TO_COPY)
 
 RST_FILES_TO_GENERATE := $(DEFAULT_RST_FILES_TO_GENERATE)
 
+# Add Session methods implemented in Python to copy
+PYTHON_IMPLEMENTATION_TO_COPY += \
+    _fetching.py \
+    _streaming.py \
+
 
 include $(BUILD_HELPER_DIR)/rules.mak
 
@@ -0,0 +1,107 @@
+'''Fetching of the measure records of channels while they are being acquired.'''
+
+import collections
+import time
+
+from nidcpower import _converters
+from nidcpower import errors
+from nidcpower import visatype
+
+
+# IVI_ERROR_MAX_TIME_EXCEEDED, the same error the driver returns when a fetch times out
+_MAX_TIME_EXCEEDED = -1074126845
+
+# Seconds to wait between polls of fetch_backlog while no channel has measurements
+_POLL_INTERVAL = 0.001
+
+MeasurementChunk = collections.namedtuple('MeasurementChunk', ['channel', 'offset', 'timestamps', 'voltage_measurements', 'current_measurements', 'in_compliance'])
+
+
+class _Timestamps(object):
+    '''Time of each measurement of a chunk, in seconds from the first measurement of the record
+
+    Computed from offset and delta_time when indexed, so fetching a chunk doesn't compute any.
+    '''
+
+    __slots__ = ('offset', 'delta_time', '_count')
+
+    def __init__(self, offset, delta_time, count):
+        self.offset = offset
+        self.delta_time = delta_time
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if index < 0 or index >= self._count:
+            raise IndexError('timestamp index out of range')
+        return (self.offset + index) * self.delta_time
+
+    def __iter__(self):
+        return (self[i] for i in range(self._count))
+
+    def __repr__(self):
+        return '{0}.{1}(offset={2}, delta_time={3}, count={4})'.format(__name__, self.__class__.__name__, self.offset, self.delta_time, self._count)
+
+
+def _get_channel_names(channels):
+    if isinstance(channels, (list, tuple)):
+        return [str(c) for c in channels]
+    return [c.strip() for c in channels.split(',') if len(c.strip()) > 0]
+
+
+class _ChannelStream(object):
+    '''Where the stream of one channel is, and the buffers its chunks are fetched into'''
+
+    def __init__(self, session, name, chunk_size):
+        self.name = name
+        self.session = session[name]
+        self.offset = 0
+        # None for continuous measure records
+        self.remaining = self.session.measure_record_length if self.session.measure_record_length_is_finite else None
+        self.delta_time = self.session.measure_record_delta_time
+        self.voltage_measurements = (visatype.ViReal64 * chunk_size)()
+        self.current_measurements = (visatype.ViReal64 * chunk_size)()
+        self.in_compliance = (visatype.ViBoolean * chunk_size)()
+
+
+def stream_measurements(session, channels, chunk_size=1000, timeout=5.0):
+    '''Generator behind nidcpower.Session.stream_measurements(). See the Session method for documentation.'''
+    channel_names = _get_channel_names(channels)
+    if len(channel_names) == 0:
+        raise ValueError('channels must name at least one channel')
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be greater than 0, not {0}'.format(chunk_size))
+
+    streams = [_ChannelStream(session, name, chunk_size) for name in channel_names]
+    deadline = time.time() + timeout
+    while True:
+        streams = [s for s in streams if s.remaining is None or s.remaining > 0]
+        if len(streams) == 0:
+            return
+        fetched = False
+        for s in streams:
+            count = min(s.session.fetch_backlog, chunk_size)
+            if s.remaining is not None:
+                count = min(count, s.remaining)
+            if count == 0:
+                continue
+            buffers = [_converters.get_ctypes_array_head(b, count) for b in (s.voltage_measurements, s.current_measurements, s.in_compliance)]
+            count = s.session.fetch_multiple_into(buffers[0], buffers[1], buffers[2], timeout)
+            voltage_measurements, current_measurements, in_compliance = [_converters.get_ctypes_array_head(b, count) for b in buffers]
+            yield MeasurementChunk(s.name, s.offset, _Timestamps(s.offset, s.delta_time, count), voltage_measurements, current_measurements, in_compliance)
+            s.offset += count
+            if s.remaining is not None:
+                s.remaining -= count
+            fetched = True
+        if fetched:
+            deadline = time.time() + timeout
+        elif time.time() > deadline:
+            raise errors.Error(_MAX_TIME_EXCEEDED, 'Maximum time exceeded before the operation completed.')
+        else:
+            time.sleep(_POLL_INTERVAL)
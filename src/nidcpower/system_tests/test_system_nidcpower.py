@@ -158,6 +158,51 @@ def test_fetch_multiple():
             assert current_measurements[1] == 0.00001
 
 
+def test_fetch_multiple_columns(single_channel_session):
+    numpy = pytest.importorskip('numpy')
+    single_channel_session.source_mode = nidcpower.SourceMode.SINGLE_POINT
+    single_channel_session.configure_aperture_time(0, nidcpower.ApertureTimeUnits.SECONDS)
+    single_channel_session.voltage_level = 1
+    single_channel_session.measure_when = nidcpower.MeasureWhen.AUTOMATICALLY_AFTER_SOURCE_COMPLETE
+    with single_channel_session.initiate():
+        columns = single_channel_session.fetch_multiple_columns(10)
+        assert list(columns) == ['voltage', 'current', 'in_compliance']
+        assert columns['voltage'].dtype == numpy.float64
+        assert columns['in_compliance'].dtype == numpy.bool_
+        assert len(columns['current']) == 10
+        assert columns['voltage'][1] == 1.0
+        assert columns['current'][1] == 0.00001
+        voltage = columns['voltage']
+        columns = single_channel_session.fetch_multiple_columns(5, out=columns)
+        assert len(columns['voltage']) == 5
+        assert numpy.shares_memory(columns['voltage'], voltage)
+        in_compliance = numpy.ones(5, numpy.uint16)
+        columns = single_channel_session.fetch_multiple_columns(5, out={'voltage': voltage, 'current': columns['current'], 'in_compliance': in_compliance})
+        assert columns['in_compliance'].dtype == numpy.uint16
+        assert numpy.shares_memory(columns['in_compliance'], in_compliance)
+
+
+def test_stream_measurements(single_channel_session):
+    single_channel_session.source_mode = nidcpower.SourceMode.SINGLE_POINT
+    single_channel_session.configure_aperture_time(0, nidcpower.ApertureTimeUnits.SECONDS)
+    single_channel_session.voltage_level = 1
+    single_channel_session.measure_when = nidcpower.MeasureWhen.AUTOMATICALLY_AFTER_SOURCE_COMPLETE
+    single_channel_session.measure_record_length = 25
+    single_channel_session.measure_record_length_is_finite = True
+    measurement_count = 0
+    with single_channel_session.initiate():
+        # Chunks point into buffers that the next chunk reuses, so each one is checked before fetching the next
+        for chunk in single_channel_session.stream_measurements('0', chunk_size=10):
+            assert chunk.offset == measurement_count
+            assert len(chunk.voltage_measurements) <= 10
+            if chunk.offset == 0:
+                assert chunk.timestamps[0] == 0.0
+            measurement_count += len(chunk.voltage_measurements)
+            last_voltage_measurement = chunk.voltage_measurements[-1]
+    assert measurement_count == 25
+    assert last_voltage_measurement == 1.0
+
+
 '''
 TODO: (Jaleel) Python Crashes when running these examples : Issue#444
 def test_measure_multiple(session):
@@ -0,0 +1,106 @@
+import ctypes
+import itertools
+import nidcpower
+import nidcpower.simulator
+import pytest
+import threading
+import time
+
+from nidcpower import library_singleton
+
+
+FETCH_BACKLOG = 1150056
+
+
+class TestStreamMeasurements(object):
+
+    def setup_method(self, method):
+        # Every measurement is acquired already, until a test says otherwise
+        self.simulator = nidcpower.simulator.Simulator(attribute_values={FETCH_BACKLOG: 1000})
+        library_singleton.set_backend(self.simulator)
+
+    def teardown_method(self, method):
+        library_singleton.set_backend(None)
+
+    def _open_session(self, record_length=25, delta_time=0.5):
+        session = nidcpower.Session('dev1', '0,1')
+        session.measure_record_length = record_length
+        session.measure_record_length_is_finite = True
+        session.measure_record_delta_time = delta_time
+        return session
+
+    def test_chunks_of_each_channel(self):
+        with self._open_session() as session:
+            chunks = [(chunk.channel, chunk.offset, len(chunk.voltage_measurements), len(chunk.current_measurements), len(chunk.in_compliance)) for chunk in session.stream_measurements('0,1', chunk_size=10)]
+        # Channels take turns, and the last chunk of each has the rest of its measurements
+        assert chunks == [
+            ('0', 0, 10, 10, 10), ('1', 0, 10, 10, 10),
+            ('0', 10, 10, 10, 10), ('1', 10, 10, 10, 10),
+            ('0', 20, 5, 5, 5), ('1', 20, 5, 5, 5),
+        ]
+
+    def test_chunks_reuse_the_buffers_of_the_channel(self):
+        with self._open_session() as session:
+            addresses = [(chunk.channel, ctypes.addressof(chunk.voltage_measurements)) for chunk in session.stream_measurements(['0', '1'], chunk_size=10)]
+        assert addresses[0] != addresses[1]
+        assert addresses[2] == addresses[4] == addresses[0]
+        assert addresses[3] == addresses[5] == addresses[1]
+
+    def test_measurements_are_ctypes_arrays(self):
+        with self._open_session() as session:
+            chunk = next(session.stream_measurements('0', chunk_size=10))
+        assert isinstance(chunk.voltage_measurements, ctypes.Array)
+        assert chunk.voltage_measurements._type_ == nidcpower.visatype.ViReal64
+        assert chunk.in_compliance._type_ == nidcpower.visatype.ViBoolean
+        assert not any(chunk.in_compliance)
+
+    def test_timestamps(self):
+        with self._open_session() as session:
+            chunk = list(session.stream_measurements('0', chunk_size=10))[-1]
+        timestamps = chunk.timestamps
+        assert len(timestamps) == 5
+        assert list(timestamps) == [10.0, 10.5, 11.0, 11.5, 12.0]
+        assert timestamps[-1] == 12.0
+        assert timestamps[1:3] == [10.5, 11.0]
+        assert (timestamps.offset, timestamps.delta_time) == (20, 0.5)
+        with pytest.raises(IndexError):
+            timestamps[5]
+
+    def test_continuous_measure_record(self):
+        with self._open_session() as session:
+            session.measure_record_length_is_finite = False
+            chunks = session.stream_measurements('0', chunk_size=10)
+            assert [chunk.offset for chunk in itertools.islice(chunks, 5)] == [0, 10, 20, 30, 40]
+            chunks.close()
+
+    def test_waits_for_fetch_backlog(self):
+        self.simulator.set_attribute_value(FETCH_BACKLOG, 0)
+        timer = threading.Timer(0.05, self.simulator.set_attribute_value, (FETCH_BACKLOG, 1000))
+        with self._open_session(record_length=10) as session:
+            start = time.time()
+            timer.start()
+            chunks = list(session.stream_measurements('0', chunk_size=10))
+            assert time.time() - start >= 0.05
+        assert len(chunks) == 1
+
+    def test_fetch_backlog_timeout(self):
+        self.simulator.set_attribute_value(FETCH_BACKLOG, 0)
+        with self._open_session() as session:
+            with pytest.raises(nidcpower.Error) as e:
+                list(session.stream_measurements('0', chunk_size=10, timeout=0.05))
+            assert e.value.code == -1074126845
+
+    def test_early_exit(self):
+        with self._open_session() as session:
+            chunks = session.stream_measurements('0', chunk_size=10)
+            assert next(chunks).offset == 0
+            chunks.close()
+            with pytest.raises(StopIteration):
+                next(chunks)
+
+    def test_invalid_arguments(self):
+        with self._open_session() as session:
+            with pytest.raises(ValueError):
+                next(session.stream_measurements(''))
+            with pytest.raises(ValueError):
+                next(session.stream_measurements('0', chunk_size=0))
@@ -15,6 +15,10 @@ args = parser.parse_args()
 with nidmm.Session(args.name) as session:
     session.configure_measurement_digits(nidmm.Function[args.function], args.range, args.digits)
     session.configure_multi_point(args.triggers, args.samples)
-    measurements, numberOfMeasurements = session.read_multi_point(array_size=args.samples)
-    print('Number of measurements: ', numberOfMeasurements)
+    measurements = []
+    with session.initiate():
+        # Readings are fetched as the DMM takes them, instead of once the acquisition is done
+        for readings in session.stream_readings(chunk_size=args.samples):
+            measurements.extend(readings)
+    print('Number of measurements: ', len(measurements))
     print('Measurements: ', measurements)
@@ -35,4 +35,8 @@ attributes_codegen_method = {
     1150031: { "codegen_method": "no" },  # SAMPLE_DELAY_MODE
 }
 
-
+# Attributes whose value changes without the application setting it, i.e. status. They are never cached.
+attributes_volatile = {
+    1250331: { "volatile": True },  # AUTO_RANGE_VALUE
+    1150044: { "volatile": True },  # FREQUENCY_VOLTAGE_AUTO_RANGE_VALUE
+}
@@ -79,6 +79,147 @@ functions_buffer_info = {
     'error_message':                { 'parameters': { 2: { 'size': {'mechanism':'fixed', 'value':256}, }, }, }, # From documentation
 }
 
+# Output buffers whose Session method gets an 'array_type' keyword argument, to return them as list, array.array or numpy.ndarray.
+# The value is the default for that keyword argument.
+functions_array_type = {
+    'ReadMultiPoint':               { 'parameters': { 3: { 'array_type': 'list', }, }, },
+    'FetchMultiPoint':              { 'parameters': { 3: { 'array_type': 'list', }, }, },
+    'FetchWaveform':                { 'parameters': { 3: { 'array_type': 'list', }, }, },
+    'ReadWaveform':                 { 'parameters': { 3: { 'array_type': 'list', }, }, },
+}
+
+# Output buffers that also get a "_into" method, which fills a buffer allocated by the caller (i.e. numpy.ndarray) in place
+functions_into_method = {
+    'FetchMultiPoint':              { 'parameters': { 3: { 'into_method': True, }, }, },
+    'FetchWaveform':                { 'parameters': { 3: { 'into_method': True, }, }, },
+}
+
+# Session methods implemented in Python, with no C function behind them. 'python_implementation' names the
+# function, in a module from python_implementation/, that the Session method calls.
+python_only_functions = {
+    'StreamReadings': {
+        'codegen_method': 'public',
+        'python_implementation': '_streaming.stream_readings',
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'Identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'chunkSize',
+                'type': 'ViInt32',
+                'documentation': {
+                    'description': 'Maximum number of readings in each chunk.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'Timeout',
+                'type': 'ViReal64',
+                'default_value': 5.0,
+                'documentation': {
+                    'description': 'Maximum time, in seconds, to wait for readings to be available for each chunk.',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+Generator that fetches the readings of a multipoint acquisition while it is in progress, in chunks of
+the readings available so far.
+
+It calls read_status() to get the acquisition backlog, and fetches that many readings, up to
+**chunk_size**, with fetch_multi_point_into(). It stops once **trigger_count** x **sample_count**
+readings are fetched, or never for continuous acquisitions (either of them set to 0), until the caller
+stops iterating.
+
+Each chunk is a ctypes array of visatype.ViReal64. Use numpy.frombuffer() to wrap it without copying it.
+Chunks are fetched into the same buffer, allocated once, so a chunk stays valid until the next one is requested.
+Copy the data to keep it longer.
+''',
+            'note': '''
+Initiate the acquisition first, i.e. in a 'with session.initiate():' block.
+''',
+        },
+    },
+    'StreamWaveform': {
+        'codegen_method': 'public',
+        'python_implementation': '_streaming.stream_waveform',
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'Identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'chunkSize',
+                'type': 'ViInt32',
+                'documentation': {
+                    'description': 'Number of samples in each chunk. The last chunk of a finite acquisition can have fewer.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'queueSize',
+                'type': 'ViInt32',
+                'default_value': 4,
+                'documentation': {
+                    'description': 'Maximum number of chunks fetched ahead of the caller.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'Timeout',
+                'type': 'ViReal64',
+                'default_value': 5.0,
+                'documentation': {
+                    'description': 'Maximum time, in seconds, to wait for the samples of each chunk to be acquired.',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+Generator that fetches a waveform acquisition while it is in progress, in chunks of **chunk_size**
+samples.
+
+Each item is a WaveformChunk named tuple of (offset, start_time, sample_interval, samples), where
+**offset** is the index of the first sample of the chunk in the acquisition, **start_time** is its
+time in seconds from the first sample, **sample_interval** is 1 / waveform_rate and **samples** is a
+ctypes array of visatype.ViReal64. Each chunk has its own array, so chunks stay valid after the next
+one is requested. Use numpy.frombuffer() to wrap it without copying it.
+
+A thread fetches each chunk as soon as read_status() reports enough samples, and puts it in a queue
+of at most **queue_size** chunks. When the caller falls behind and the queue is full, the thread
+waits instead of fetching more, so memory doesn't grow. The samples then wait in the memory of the
+DMM, and the driver returns an error if they are overwritten, which the generator raises.
+
+It stops after **trigger_count** x waveform_points samples, or never for continuous acquisitions
+(**trigger_count** set to 0), until the caller stops iterating.
+''',
+            'note': '''
+Initiate the acquisition first, i.e. in a 'with session.initiate():' block.
+''',
+        },
+    },
+}
+
 # These are functions we mark as "error_handling":True. The generator uses this information to
 # change how error handling is done within those functions themselves - basically, if an error occurs,
 # dont try to handle it, since the functions are only used within the context of error handling.
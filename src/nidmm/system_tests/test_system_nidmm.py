@@ -31,6 +31,24 @@ def test_multi_point_acquisition(session):
     assert numberOfMeasurements == 8
 
 
+def test_stream_readings(session):
+    session.configure_multi_point(4, 2)
+    session.configure_measurement_digits(nidmm.Function.DC_VOLTS, 1, 5.5)
+    with session.initiate():
+        chunks = [list(readings) for readings in session.stream_readings(chunk_size=3)]
+    assert all(0 < len(chunk) <= 3 for chunk in chunks)
+    assert sum(len(chunk) for chunk in chunks) == 8
+
+
+def test_stream_waveform(session):
+    session.configure_waveform_acquisition(nidmm.Function.WAVEFORM_VOLTAGE, 10, 1800000, 50)
+    with session.initiate():
+        chunks = list(session.stream_waveform(chunk_size=20, queue_size=1))
+    assert [len(chunk.samples) for chunk in chunks] == [20, 20, 10]
+    assert [chunk.offset for chunk in chunks] == [0, 20, 40]
+    assert chunks[1].start_time == pytest.approx(20 * chunks[1].sample_interval)
+
+
 # Attribute tests
 def test_vi_boolean_attribute(session):
     assert session.interchange_check is False
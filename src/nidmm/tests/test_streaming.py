@@ -0,0 +1,126 @@
+import ctypes
+import itertools
+import nidmm
+import nidmm.simulator
+import pytest
+import threading
+
+from nidmm import library_singleton
+
+
+def get_simulator(backlog):
+    return nidmm.simulator.Simulator(output_values={'ReadStatus': {'acquisitionBacklog': backlog}})
+
+
+class TestStreamReadings(object):
+
+    def teardown_method(self, method):
+        library_singleton.set_backend(None)
+
+    def _open_session(self, backlog=1000, trigger_count=2, sample_count=5):
+        library_singleton.set_backend(get_simulator(backlog))
+        session = nidmm.Session('dev1')
+        session.trigger_count = trigger_count
+        session.sample_count = sample_count
+        return session
+
+    def test_chunks_of_the_readings(self):
+        with self._open_session() as session:
+            assert [len(readings) for readings in session.stream_readings(4)] == [4, 4, 2]
+
+    def test_chunks_of_the_backlog(self):
+        with self._open_session(backlog=3) as session:
+            assert [len(readings) for readings in session.stream_readings(4)] == [3, 3, 3, 1]
+
+    def test_chunks_reuse_one_buffer(self):
+        with self._open_session() as session:
+            addresses = [ctypes.addressof(readings) for readings in session.stream_readings(4)]
+        assert addresses[0] == addresses[1] == addresses[2]
+
+    def test_readings_are_filled(self):
+        with self._open_session() as session:
+            readings = next(session.stream_readings(4))
+            assert readings._type_ == nidmm.visatype.ViReal64
+            # The simulator fills readings with a sine wave
+            assert readings[0] == 0.0
+            assert readings[1] == pytest.approx(0.0627905195)
+
+    def test_continuous_acquisition(self):
+        with self._open_session(trigger_count=0) as session:
+            chunks = session.stream_readings(4)
+            assert [len(readings) for readings in itertools.islice(chunks, 5)] == [4] * 5
+            chunks.close()
+
+    def test_backlog_timeout(self):
+        with self._open_session(backlog=0) as session:
+            with pytest.raises(nidmm.Error) as e:
+                list(session.stream_readings(4, timeout=0.05))
+            assert e.value.code == -1074126845
+
+    def test_early_exit(self):
+        with self._open_session() as session:
+            chunks = session.stream_readings(4)
+            assert len(next(chunks)) == 4
+            chunks.close()
+            with pytest.raises(StopIteration):
+                next(chunks)
+
+    def test_invalid_chunk_size(self):
+        with self._open_session() as session:
+            with pytest.raises(ValueError):
+                next(session.stream_readings(0))
+
+
+def is_fetcher_alive():
+    return any(t.name == 'nidmm stream_waveform' for t in threading.enumerate())
+
+
+class TestStreamWaveform(object):
+
+    def teardown_method(self, method):
+        library_singleton.set_backend(None)
+
+    def _open_session(self, backlog=1000, trigger_count=1, waveform_points=50):
+        library_singleton.set_backend(get_simulator(backlog))
+        session = nidmm.Session('dev1')
+        session.trigger_count = trigger_count
+        session.waveform_points = waveform_points
+        session.waveform_rate = 1000.0
+        return session
+
+    def test_chunks_of_the_waveform(self):
+        with self._open_session() as session:
+            chunks = list(session.stream_waveform(20, queue_size=1))
+        assert [len(chunk.samples) for chunk in chunks] == [20, 20, 10]
+        assert [chunk.offset for chunk in chunks] == [0, 20, 40]
+        assert [chunk.start_time for chunk in chunks] == pytest.approx([0.0, 0.02, 0.04])
+        assert all(chunk.sample_interval == 0.001 for chunk in chunks)
+        assert not is_fetcher_alive()
+
+    def test_chunks_have_their_own_samples(self):
+        with self._open_session() as session:
+            chunks = list(session.stream_waveform(20))
+        assert chunks[0].samples._type_ == nidmm.visatype.ViReal64
+        assert len(set(ctypes.addressof(chunk.samples) for chunk in chunks)) == 3
+        # The simulator fills waveforms with a sine wave
+        assert chunks[0].samples[1] == pytest.approx(0.0627905195)
+
+    def test_exception_on_fetch_thread_raised_to_caller(self):
+        with self._open_session(backlog=0) as session:
+            chunks = session.stream_waveform(20, timeout=0.05)
+            with pytest.raises(nidmm.Error) as e:
+                next(chunks)
+            assert e.value.code == -1074126845
+            assert not is_fetcher_alive()
+
+    def test_fetch_thread_joined_on_early_exit(self):
+        # The fetch thread waits for room in a full queue of a continuous acquisition
+        with self._open_session(trigger_count=0) as session:
+            chunks = session.stream_waveform(20, queue_size=1)
+            assert next(chunks).offset == 0
+            assert is_fetcher_alive()
+            chunks.close()
+            assert not is_fetcher_alive()
+            with pytest.raises(StopIteration):
+                next(chunks)
+
@@ -6,4 +6,7 @@
 attributes_codegen_method = {
 }
 
-
+# Attributes whose value changes without the application setting it, i.e. status. They are never cached.
+attributes_volatile = {
+    1000006: { "volatile": True },  # READ_WRITE_INT64, to test attributes that are never cached
+}
@@ -47,6 +47,22 @@ functions_buffer_info = {
     'GetArrayUsingIVIDance':                 { 'parameters': { 2: { 'size': {'mechanism':'ivi-dance', 'value':'arraySize'}, }, }, },
 }
 
+# Output buffers that also get a "_into" method, which fills a buffer allocated by the caller (i.e. numpy.ndarray) in place
+functions_into_method = {
+    'ReadMultiPoint':                        { 'parameters': { 3: { 'into_method': True, }, }, },
+}
+
+# Output buffers whose Session method gets an 'array_type' keyword argument, to return them as list, array.array or numpy.ndarray.
+# The value is the default for that keyword argument.
+functions_array_type = {
+    'ReadMultiPoint':                        { 'parameters': { 3: { 'array_type': 'list', }, }, },
+}
+
+# Functions that clear the attribute cache of the session. By default, reset and configuration functions do.
+functions_invalidates_attribute_cache = {
+    'SimpleFunction':               { 'invalidates_attribute_cache': True, },  # To test clearing the attribute cache
+}
+
 # These are functions we mark as "error_handling":True. The generator uses this information to
 # change how error handling is done within those functions themselves - basically, if an error occurs,
 # dont try to handle it, since the functions are only used within the context of error handling.
@@ -48,4 +48,15 @@ attributes_codegen_method = {
     1150408: { "codegen_method": "no" },  # P2P_DATA_TRANSFER_PERMISSION_INITIAL_CREDITS - P2P Attribute
 }
 
-
+# Attributes whose value changes without the application setting it, i.e. status. They are never cached.
+attributes_volatile = {
+    1150344: { "volatile": True },  # ALL_MARKER_EVENTS_LIVE_STATUS
+    1150349: { "volatile": True },  # ALL_MARKER_EVENTS_LATCHED_STATUS
+    1150351: { "volatile": True },  # DONE_EVENT_LATCHED_STATUS
+    1150350: { "volatile": True },  # MARKER_EVENT_LATCHED_STATUS
+    1150345: { "volatile": True },  # MARKER_EVENT_LIVE_STATUS
+    1150269: { "volatile": True },  # OSP_OVERFLOW_STATUS
+    1150348: { "volatile": True },  # READY_FOR_START_EVENT_LIVE_STATUS
+    1150352: { "volatile": True },  # STARTED_EVENT_LATCHED_STATUS
+    1150325: { "volatile": True },  # STREAMING_SPACE_AVAILABLE_IN_WAVEFORM
+}
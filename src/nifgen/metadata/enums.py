@@ -612,6 +612,26 @@ waveforms in complex combinations.
                 'value': 102,
 'documentation': {
 'description': 'When the operation is ready to start, the Ready for Start  event level is low.',
+},
+            },
+        ],
+    },
+    'RelativeTo': {
+        'values': [
+            {
+                'name': 'START',
+                'prefix': 'WAVEFORM_POSITION_',
+                'value': 0,
+'documentation': {
+'description': 'Use the start of the waveform as the reference position.',
+},
+            },
+            {
+                'name': 'CURRENT',
+                'prefix': 'WAVEFORM_POSITION_',
+                'value': 1,
+'documentation': {
+'description': 'Use the current position within the waveform as the reference position.',
 },
             },
         ],
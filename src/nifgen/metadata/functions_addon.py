@@ -94,6 +94,123 @@ functions_buffer_info = {
     'CreateFreqList':                       { 'parameters': { 3: { 'size': {'mechanism':'len', 'value':'frequencyListLength'}, }, }, },  # TODO(marcoskirsch): Suffers from #515
 }
 
+# Session methods implemented in Python, with no C function behind them. 'python_implementation' names the
+# function, in a module from python_implementation/, that the Session method calls.
+python_only_functions = {
+    'CreateWaveformStreamer': {
+        'codegen_method': 'public',
+        'python_implementation': '_streaming.create_waveform_streamer',
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'Identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'channelName',
+                'type': 'ViConstString',
+                'documentation': {
+                    'description': 'Specifies the channel onto which to stream the waveform.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'blocks',
+                'type': 'ViInt16',
+                'python_type': 'iterable',
+                'documentation': {
+                    'description': '''
+Iterable, i.e. a generator, of the blocks of samples to write. Each block is a 1-dimensional numpy.ndarray
+or array.array of int16 or float64 samples, or bytes of int16 samples in native byte order. All blocks
+must have the same sample type. They can have any length.
+''',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'waveformSize',
+                'type': 'ViInt32',
+                'documentation': {
+                    'description': 'Number of samples of the streaming waveform allocated in onboard memory. Must be a multiple of **write_size**.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'writeSize',
+                'type': 'ViInt32',
+                'documentation': {
+                    'description': 'Number of samples written with each call to write_waveform or write_binary16_waveform.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'queueSize',
+                'type': 'ViInt32',
+                'default_value': 4,
+                'documentation': {
+                    'description': 'Maximum number of writes of **write_size** samples read from **blocks** ahead of the device.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'Timeout',
+                'type': 'ViReal64',
+                'default_value': 10.0,
+                'documentation': {
+                    'description': 'Maximum time, in seconds, to wait for space in the streaming waveform.',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+Returns a WaveformStreamer that plays back blocks of samples that do not fit in onboard memory, i.e.
+a recording of several GB read from a file, by streaming them through a waveform of **waveform_size**
+samples.
+
+It allocates the waveform with allocate_waveform, and sets streaming_waveform_handle to it. The
+handle is in the **waveform_handle** of the WaveformStreamer: configure the arbitrary waveform with
+it, i.e. with configure_arb_waveform.
+
+Its start() method starts two threads, and returns once the waveform is full. One thread reads
+**blocks** and cuts them into pieces of **write_size** samples, in a queue of at most **queue_size**
+pieces. The other one waits until streaming_space_available_in_waveform has room for the next piece,
+and writes it with write_binary16_waveform, for int16 samples, or write_waveform, for float64 samples.
+It calls set_waveform_next_write_position to write again from the start of the waveform once the end
+is reached. So the iterator is only read as fast as the device generates the samples.
+
+Initiate the generation after start(), then call wait() to wait until every block is written. It
+raises the exception that stopped the threads, i.e. an error of the driver or of **blocks**. stop()
+stops the threads early. A WaveformStreamer is also a context manager that starts it, and stops it
+on exit.
+
+.. code:: python
+
+    streamer = session.create_waveform_streamer(read_blocks('recording.bin'), 1048576, 262144)
+    session.configure_arb_waveform(streamer.waveform_handle, 1.0, 0.0)
+    with streamer:
+        with session.initiate():
+            streamer.wait()
+''',
+            'note': '''
+Blocks are written some time after they are read from **blocks**. Yield a new array for each block,
+rather than filling the same one again.
+''',
+        },
+    },
+}
+
 # These are functions we mark as "error_handling":True. The generator uses this information to
 # change how error handling is done within those functions themselves - basically, if an error occurs,
 # dont try to handle it, since the functions are only used within the context of error handling.
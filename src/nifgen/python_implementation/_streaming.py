@@ -0,0 +1,245 @@
+'''Streaming of sample blocks to the streaming waveform while it is being generated.'''
+
+import array
+import threading
+import time
+
+from nifgen import enums
+from nifgen import errors
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+
+# NIFGEN_ERROR_MAX_TIME_EXCEEDED, the same error the driver returns when a write times out
+_MAX_TIME_EXCEEDED = -1074126845
+
+# Seconds to wait between reads of streaming_space_available_in_waveform while there is not enough space
+_POLL_INTERVAL = 0.001
+
+# Put in the queue of pieces after the last one
+_END = object()
+
+
+def _get_format(samples):
+    '''Returns 'h' for blocks of int16 samples and 'd' for blocks of float64 samples'''
+    if isinstance(samples, array.array):
+        sample_format = samples.typecode
+    else:
+        try:
+            view = memoryview(samples)
+        except TypeError:
+            raise TypeError('Each block must be a numpy.ndarray, array.array or bytes, not {0}'.format(type(samples).__name__))
+        if view.ndim != 1:
+            raise TypeError('Each block must be 1-dimensional, not {0}-dimensional'.format(view.ndim))
+        sample_format = view.format.lstrip('@=<')
+    if sample_format not in ('h', 'd'):
+        raise TypeError('Each block must have samples of int16 or float64, not format \'{0}\''.format(sample_format))
+    return sample_format
+
+
+def _to_bytes(samples):
+    try:
+        return samples.tobytes()
+    except AttributeError:
+        # array.array on Python 2
+        return samples.tostring()
+
+
+def _extend(pending, samples):
+    '''Appends the samples, of the same format, to the array.array pending'''
+    data = _to_bytes(samples)
+    try:
+        pending.frombytes(data)
+    except AttributeError:
+        # Python 2
+        pending.fromstring(data)
+
+
+def _get_samples(block):
+    '''Returns the format and the samples of block, with bytes converted to an array.array of int16'''
+    if isinstance(block, (bytes, bytearray)):
+        if len(block) % 2 != 0:
+            raise ValueError('Blocks of bytes must have an even length, as they are read as int16 samples, not {0}'.format(len(block)))
+        samples = array.array('h')
+        _extend(samples, memoryview(block))
+        return 'h', samples
+    return _get_format(block), block
+
+
+def _put(pieces, item, stop):
+    '''Puts item in the queue once there is room, unless stop is set first. Returns whether it was put.'''
+    while not stop.is_set():
+        try:
+            pieces.put(item, timeout=_POLL_INTERVAL * 10)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _get(pieces, stop):
+    '''Gets the next item of the queue, or returns _END if stop is set first'''
+    while not stop.is_set():
+        try:
+            return pieces.get(timeout=_POLL_INTERVAL * 10)
+        except queue.Empty:
+            pass
+    return _END
+
+
+class WaveformStreamer(object):
+    '''Writes the sample blocks of an iterator to the streaming waveform of a session, from background threads
+
+    Returned by nifgen.Session.create_waveform_streamer(). See the Session method for documentation.
+    '''
+
+    def __init__(self, session, blocks, waveform_size, write_size, queue_size=4, timeout=10.0):
+        if write_size <= 0:
+            raise ValueError('write_size must be greater than 0, not {0}'.format(write_size))
+        if waveform_size <= 0 or waveform_size % write_size != 0:
+            raise ValueError('waveform_size must be a multiple of write_size ({0}), not {1}'.format(write_size, waveform_size))
+        if queue_size <= 0:
+            raise ValueError('queue_size must be greater than 0, not {0}'.format(queue_size))
+        self._session = session
+        self._blocks = iter(blocks)
+        self._write_size = write_size
+        self._timeout = timeout
+        self._pieces = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+        # Set once the waveform is full, or the writing thread is done
+        self._primed = threading.Event()
+        self._error = None
+        self._threads = []
+        self.waveform_size = waveform_size
+        self.samples_written = 0
+        self.waveform_handle = session.allocate_waveform(waveform_size)
+        session.streaming_waveform_handle = self.waveform_handle
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _read_blocks(self):
+        '''Runs on the reading thread: puts pieces of write_size samples, then _END or the exception that stopped it, in the queue'''
+        try:
+            sample_format = None
+            pending = None
+            for block in self._blocks:
+                block_format, samples = _get_samples(block)
+                if sample_format is None:
+                    sample_format = block_format
+                    pending = array.array(sample_format)
+                elif block_format != sample_format:
+                    raise TypeError('All blocks must have samples of the same type, \'{0}\', not \'{1}\''.format(sample_format, block_format))
+                start = 0
+                if len(pending) > 0:
+                    start = min(self._write_size - len(pending), len(samples))
+                    _extend(pending, samples[:start])
+                    if len(pending) == self._write_size:
+                        if not _put(self._pieces, (sample_format, pending), self._stop):
+                            return
+                        pending = array.array(sample_format)
+                while len(samples) - start >= self._write_size:
+                    if not _put(self._pieces, (sample_format, samples[start:start + self._write_size]), self._stop):
+                        return
+                    start += self._write_size
+                if start < len(samples):
+                    _extend(pending, samples[start:])
+            if pending is not None and len(pending) > 0:
+                if not _put(self._pieces, (sample_format, pending), self._stop):
+                    return
+            _put(self._pieces, _END, self._stop)
+        except Exception as e:
+            _put(self._pieces, e, self._stop)
+
+    def _wait_for_space(self, count):
+        '''Waits until count samples can be written. Returns False if stop was set first.'''
+        deadline = time.time() + self._timeout
+        while self._session.streaming_space_available_in_waveform < count:
+            if self._stop.is_set():
+                return False
+            if time.time() > deadline:
+                raise errors.Error(_MAX_TIME_EXCEEDED, 'Maximum time exceeded before the operation completed.')
+            time.sleep(_POLL_INTERVAL)
+        return True
+
+    def _write_pieces(self):
+        '''Runs on the writing thread: writes the pieces of the queue once there is space for them'''
+        try:
+            position = 0
+            while True:
+                item = _get(self._pieces, self._stop)
+                if item is _END:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                sample_format, samples = item
+                # The waveform is empty until it is first filled
+                if self.samples_written + len(samples) > self.waveform_size and not self._wait_for_space(len(samples)):
+                    return
+                # The driver does not wrap writes around the end of the waveform
+                if position + len(samples) > self.waveform_size:
+                    self._session.set_waveform_next_write_position(self.waveform_handle, enums.RelativeTo.START, 0)
+                    position = 0
+                if sample_format == 'h':
+                    self._session.write_binary16_waveform(self.waveform_handle, samples)
+                else:
+                    self._session.write_waveform(self.waveform_handle, samples)
+                position += len(samples)
+                self.samples_written += len(samples)
+                if self.samples_written >= self.waveform_size:
+                    self._primed.set()
+        except Exception as e:
+            self._error = e
+            # Also stops the reading thread
+            self._stop.set()
+        finally:
+            self._primed.set()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def start(self):
+        '''Starts the threads, and returns once the waveform is full or every block is written
+
+        Initiate generation after start() returns, within **timeout** seconds.
+        '''
+        if len(self._threads) > 0:
+            raise RuntimeError('The waveform streamer is already started')
+        self._threads = [threading.Thread(target=self._read_blocks), threading.Thread(target=self._write_pieces)]
+        for thread in self._threads:
+            thread.daemon = True
+            thread.start()
+        self._primed.wait()
+        self._raise_error()
+        return self
+
+    def wait(self, timeout=None):
+        '''Waits until every block is written, and raises the error that stopped the threads, if any
+
+        Raises the driver's maximum time exceeded error if they are not done within **timeout** seconds.
+        '''
+        if len(self._threads) == 0:
+            raise RuntimeError('The waveform streamer is not started')
+        writer = self._threads[1]
+        writer.join(timeout)
+        if writer.is_alive():
+            raise errors.Error(_MAX_TIME_EXCEEDED, 'Maximum time exceeded before the operation completed.')
+        self._raise_error()
+
+    def stop(self):
+        '''Stops writing blocks, and waits for the threads to stop'''
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+
+
+def create_waveform_streamer(session, blocks, waveform_size, write_size, queue_size=4, timeout=10.0):
+    '''Behind nifgen.Session.create_waveform_streamer(). See the Session method for documentation.'''
+    return WaveformStreamer(session, blocks, waveform_size, write_size, queue_size, timeout)
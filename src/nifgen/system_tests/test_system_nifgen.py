@@ -1,3 +1,4 @@
+import array
 import nifgen
 import pytest
 
@@ -89,6 +90,21 @@ def test_configure_arb_waveform(session):
     session.configure_arb_waveform(session.create_waveform_f64(waveform_data), 1.0, 0.0)
 
 
+def test_create_waveform_streamer(session):
+    channel = session['0']
+    session.output_mode = nifgen.OutputMode.ARB
+    # Blocks that are not a multiple of the size of the writes
+    blocks = (array.array('h', [i] * 1500) for i in range(4))
+    streamer = channel.create_waveform_streamer(blocks, 4000, 1000)
+    assert channel.streaming_waveform_handle == streamer.waveform_handle
+    channel.configure_arb_waveform(streamer.waveform_handle, 1.0, 0.0)
+    with streamer:
+        assert streamer.samples_written == 4000
+        with session.initiate():
+            streamer.wait(10.0)
+    assert streamer.samples_written == 6000
+
+
 def test_disable(session):
     channel = session['0']
     assert channel.output_enabled is True
@@ -0,0 +1,64 @@
+import array
+import nifgen
+import nifgen.simulator
+import pytest
+
+from nifgen import library_singleton
+
+
+STREAMING_SPACE_AVAILABLE_IN_WAVEFORM = 1150325
+
+
+def get_blocks():
+    # Blocks that are not a multiple of the size of the writes
+    return (array.array('h', [i] * 1500) for i in range(4))
+
+
+class TestWaveformStreamer(object):
+
+    def setup_method(self, method):
+        # The waveform has no space until the test frees some
+        self.simulator = nifgen.simulator.Simulator(attribute_values={STREAMING_SPACE_AVAILABLE_IN_WAVEFORM: 0})
+        library_singleton.set_backend(self.simulator)
+
+    def teardown_method(self, method):
+        library_singleton.set_backend(None)
+
+    def test_waveform_filled_before_start_returns(self):
+        with nifgen.Session('dev1') as session:
+            streamer = session.create_waveform_streamer(get_blocks(), 4000, 1000, timeout=1.0)
+            assert session.streaming_waveform_handle == streamer.waveform_handle
+            with streamer:
+                assert streamer.samples_written == 4000
+
+    def test_blocks_written_once_there_is_space(self):
+        with nifgen.Session('dev1') as session:
+            with session.create_waveform_streamer(get_blocks(), 4000, 1000, timeout=1.0) as streamer:
+                self.simulator.set_attribute_value(STREAMING_SPACE_AVAILABLE_IN_WAVEFORM, 4000)
+                streamer.wait(1.0)
+                assert streamer.samples_written == 6000
+
+    def test_space_read_again_with_attribute_cache(self):
+        with nifgen.Session('dev1') as session:
+            session.enable_attribute_cache()
+            with session.create_waveform_streamer(get_blocks(), 4000, 1000, timeout=1.0) as streamer:
+                assert session.streaming_space_available_in_waveform == 0
+                self.simulator.set_attribute_value(STREAMING_SPACE_AVAILABLE_IN_WAVEFORM, 4000)
+                streamer.wait(1.0)
+                assert streamer.samples_written == 6000
+
+    def test_timeout_waiting_for_space(self):
+        with nifgen.Session('dev1') as session:
+            with session.create_waveform_streamer(get_blocks(), 4000, 1000, timeout=0.1) as streamer:
+                with pytest.raises(nifgen.Error) as e:
+                    streamer.wait(1.0)
+                assert e.value.code == -1074126845
+                assert streamer.samples_written == 4000
+
+    def test_blocks_of_different_types(self):
+        blocks = [array.array('h', [0] * 1000), array.array('d', [0.0] * 1000)]
+        with nifgen.Session('dev1') as session:
+            streamer = session.create_waveform_streamer(blocks, 4000, 1000, timeout=1.0)
+            with pytest.raises(TypeError):
+                with streamer:
+                    pass
@@ -4,7 +4,8 @@ include $(BUILD_HELPER_DIR)/tools.mak
 # We want everything but enums.py
 MODULE_FILES_TO_GENERATE := $(filter-out enums.py attributes.py,$(DEFAULT_PY_FILES_TO_GENERATE))
 
-MODULE_FILES_TO_COPY := $(DEFAULT_PY_FILES_TO_COPY)
+# NI-ModInst has no attributes to transition between states with
+MODULE_FILES_TO_COPY := $(filter-out state_transitions.py,$(DEFAULT_PY_FILES_TO_COPY))
 
 RST_FILES_TO_GENERATE := $(filter-out enums.rst,$(DEFAULT_RST_FILES_TO_GENERATE))
 
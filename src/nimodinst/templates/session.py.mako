@@ -8,15 +8,52 @@
 
     module_name       = config['module_name']
     c_function_prefix = config['c_function_prefix']
+    docstrings        = template_parameters['docstrings']
 
     functions = helper.filter_codegen_functions(functions)
 %>\
 
 import ctypes
+import threading
+from ${module_name} import call_stats
 from ${module_name} import errors
 from ${module_name} import library_singleton
 from ${module_name} import visatype
 
+<%
+reused_ctypes = []
+for f in functions.values():
+    for p in f['parameters']:
+        if p['reused_ctype'] is not None:
+            reused_ctypes.append((p['reused_ctype'], p['ctypes_type'], p['direction']))
+%>\
+% if len(reused_ctypes) > 0:
+
+class _ScalarCtypes(threading.local):
+    '''ctypes objects for the scalar parameters of driver functions, which methods reuse instead of creating new ones on every call
+
+    Each thread has its own, so that calls on different threads don't share them.
+    '''
+
+    def __init__(self):
+%   for name, ctypes_type, direction in sorted(reused_ctypes):
+        self.${name} = visatype.${ctypes_type}()
+%     if direction == 'out':
+        self.${name}_pointer = ctypes.pointer(self.${name})
+%     endif
+%   endfor
+
+
+_scalar_ctypes = _ScalarCtypes()
+
+% endif
+# C function that each method calls, for call_stats
+_c_functions = {
+% for func_name in sorted(functions):
+    '${functions[func_name]['python_name']}': '${c_function_prefix}${func_name}',
+% endfor
+}
+
 
 class AttributeViInt32(object):
 
@@ -49,7 +86,7 @@ class Device(object):
         self._index = index
 % for attribute in helper.sorted_attrs(attributes):
         self.${attributes[attribute]['name'].lower()} = Attribute${attributes[attribute]['type']}(owner, ${attribute}, index=index)
-%   if 'documentation' in attributes[attribute]:
+%   if docstrings and 'documentation' in attributes[attribute]:
         '''
         ${helper.get_documentation_for_node_docstring(attributes[attribute], config, indent=4)}
         '''
@@ -77,11 +114,18 @@ class Session(object):
 
     def __init__(self, driver):
         self._${config['session_handle_parameter_name']} = 0
+        self._${config['session_handle_parameter_name']}_ctype = visatype.ViSession(self._${config['session_handle_parameter_name']})
         self._item_count = 0
         self._current_item = 0
         self._encoding = 'windows-1251'
         self._library = library_singleton.get()
+        self._warning_policy = errors.WarningPolicy()
+        self._session_stats = call_stats.SessionStats(_c_functions)
+        self._session_stats._add_session(self)
+        if call_stats.registry.enabled:
+            self._session_stats.enable()
         self._${config['session_handle_parameter_name']}, self._item_count = self._open_installed_devices_session(driver)
+        self._${config['session_handle_parameter_name']}_ctype = visatype.ViSession(self._${config['session_handle_parameter_name']})
 
         self._is_frozen = True
 
@@ -93,6 +137,23 @@ class Session(object):
     def __getitem__(self, index):
         return Device(self, index)
 
+    @property
+    def warning_policy(self):
+        '''How this session reports warnings from the driver. See errors.WarningPolicy.'''
+        return self._warning_policy
+
+    def enable_stats(self):
+        '''Starts recording statistics of the driver calls of this session, and clears them. See stats().'''
+        self._session_stats.enable()
+
+    def disable_stats(self):
+        '''Stops recording statistics of the driver calls. stats() still returns the ones recorded.'''
+        self._session_stats.disable()
+
+    def stats(self):
+        '''Returns the statistics of the driver calls, as an OrderedDict of call_stats.FunctionStats by C function name. See call_stats.'''
+        return self._session_stats.stats()
+
     def __enter__(self):
         return self
 
@@ -146,6 +207,7 @@ class Session(object):
         if(self._${config['session_handle_parameter_name']} != 0):
             self._close_installed_devices_session()
             self._${config['session_handle_parameter_name']} = 0
+            self._${config['session_handle_parameter_name']}_ctype = visatype.ViSession(self._${config['session_handle_parameter_name']})
 
     ''' These are code-generated '''
 % for func_name in sorted(functions):
@@ -160,10 +222,12 @@ class Session(object):
     len_size_parameter = helper.find_size_parameter(len_parameter, parameters)
 %>
     def ${f['python_name']}(${helper.get_params_snippet(f, helper.ParameterUsageOptions.SESSION_METHOD_DECLARATION)}):
+% if docstrings:
         '''${f['python_name']}
 
         ${helper.get_function_docstring(f['name'], config, indent=8)}
         '''
+% endif
 % for parameter in enum_input_parameters:
         ${helper.get_enum_type_check_snippet(parameter, indent=12)}
 % endfor
@@ -112,4 +112,12 @@ attributes_codegen_method = {
     1150380: { "codegen_method": "no" },  # SAMPLES_TRANSFERRED_PER_RECORD - P2P Attribute
 }
 
-
+# Attributes whose value changes without the application setting it, i.e. status. They are never cached.
+attributes_volatile = {
+    1150082: { "volatile": True },  # POINTS_DONE
+    1150083: { "volatile": True },  # RECORDS_DONE
+    1150084: { "volatile": True },  # BACKLOG
+    1150086: { "volatile": True },  # DEVICE_TEMPERATURE
+    1151303: { "volatile": True },  # PLL_LOCK_STATUS
+    1150278: { "volatile": True },  # TRIGGER_AUTO_TRIGGERED
+}
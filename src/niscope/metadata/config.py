@@ -22,6 +22,26 @@ config = {
         'abort_function': 'Abort',
     },
     'init_function': 'InitWithOptions',
-    'custom_types': [],
+    'custom_types': [
+        {'file_name': 'waveform_info', 'python_name': 'WaveformInfo', 'ctypes_type': 'niScope_wfmInfo', },
+    ],
+    'simulator': {
+        'attribute_values': {
+            'BINARY_SAMPLE_WIDTH': 16,
+            'HORZ_NUM_RECORDS': 1,
+            'HORZ_RECORD_LENGTH': 1000,
+            'HORZ_SAMPLE_RATE': 1000000.0,
+            'POINTS_DONE': 1000.0,
+        },
+        'output_values': {
+            'ActualNumWfms': {'numWfms': 1},
+            'Fetch': {'wfmInfo': {'gain': 1.0, 'x_increment': 1e-06}},
+            'FetchBinary16': {'wfmInfo': {'gain': 1.0 / 32768, 'x_increment': 1e-06}},
+            'FetchBinary32': {'wfmInfo': {'gain': 1.0 / 2147483648, 'x_increment': 1e-06}},
+            'FetchBinary8': {'wfmInfo': {'gain': 1.0 / 128, 'x_increment': 1e-06}},
+            'FetchWaveform': {'xIncrement': 1e-06},
+            'ReadWaveform': {'xIncrement': 1e-06},
+        },
+    },
 }
 
@@ -29,11 +29,11 @@ functions_codegen_method = {
     'SampleMode':                      { 'codegen_method': 'no',       },  # Equivalent attribute is available
     'GetNormalizationCoefficients':    { 'codegen_method': 'no',       },  # Has void param
     'GetScalingCoefficients':          { 'codegen_method': 'no',       },  # Has void param
-    'Fetch':                           { 'codegen_method': 'no',       },  # Has niScope_wfmInfo param #543
+    'Fetch':                           { 'codegen_method': 'private',  },  # Used by fetch_records()
     'FetchArrayMeasurement':           { 'codegen_method': 'no',       },  # Has niScope_wfmInfo param #543
-    'FetchBinary16':                   { 'codegen_method': 'no',       },  # Has niScope_wfmInfo param #543
-    'FetchBinary32':                   { 'codegen_method': 'no',       },  # Has niScope_wfmInfo param #543
-    'FetchBinary8':                    { 'codegen_method': 'no',       },  # Has niScope_wfmInfo param #543
+    'FetchBinary16':                   { 'codegen_method': 'private',  },  # Used by fetch_records_binary()
+    'FetchBinary32':                   { 'codegen_method': 'private',  },  # Used by fetch_records_binary()
+    'FetchBinary8':                    { 'codegen_method': 'private',  },  # Used by fetch_records_binary()
     'FetchComplex':                    { 'codegen_method': 'no',       },  # Has niScope_wfmInfo param #543
     'FetchComplexBinary16':            { 'codegen_method': 'no',       },  # Has niScope_wfmInfo param #543
     'Read':                            { 'codegen_method': 'no',       },  # Has niScope_wfmInfo param #543
@@ -51,6 +51,287 @@ functions_buffer_info = {
     'GetAttributeViString':         { 'parameters': { 4: { 'size': {'mechanism':'ivi-dance', 'value':'bufSize'}, }, }, },
     'GetCalUserDefinedInfo':        { 'parameters': { 1: { 'size': {'mechanism':'fixed', 'value':256}, }, }, }, # From LabVIEW VI, even though niDMM_GetCalUserDefinedInfoMaxSize() exists.
     'error_message':                { 'parameters': { 2: { 'size': {'mechanism':'fixed', 'value':256}, }, }, }, # From documentation
+    'FetchWaveform':                { 'parameters': { 3: { 'size': {'mechanism':'passed-in', 'value':'waveformSize'}, }, }, },
+    'ReadWaveform':                 { 'parameters': { 4: { 'size': {'mechanism':'passed-in', 'value':'waveformSize'}, }, }, },
+    'Fetch':                        { 'parameters': { 4: { 'size': {'mechanism':'python-code', 'value':'num_samples * self.actual_num_wfms()'}, },
+                                                      5: { 'size': {'mechanism':'python-code', 'value':'self.actual_num_wfms()'}, }, }, },
+    'FetchBinary(8|16|32)':         { 'parameters': { 4: { 'size': {'mechanism':'python-code', 'value':'num_samples * self.actual_num_wfms()'}, },
+                                                      5: { 'size': {'mechanism':'python-code', 'value':'self.actual_num_wfms()'}, }, }, },
+}
+
+# Parameters whose type in the C header can't be used as is
+functions_types = {
+    'Fetch':                        { 'parameters': { 5: { 'type': 'niScope_wfmInfo[]', }, }, },
+    'FetchBinary(8|16|32)':         { 'parameters': { 5: { 'type': 'niScope_wfmInfo[]', }, }, },
+}
+
+# Output buffers that also get a "_into" method, which fills a buffer allocated by the caller (i.e. numpy.ndarray) in place
+functions_into_method = {
+    'FetchWaveform':                { 'parameters': { 3: { 'into_method': True, }, }, },
+    'ReadWaveform':                 { 'parameters': { 4: { 'into_method': True, }, }, },
+    'Fetch':                        { 'parameters': { 4: { 'into_method': True, }, 5: { 'into_method': True, }, }, },
+    'FetchBinary(8|16|32)':         { 'parameters': { 4: { 'into_method': True, }, 5: { 'into_method': True, }, }, },
+}
+
+# Output buffers whose Session method gets an 'array_type' keyword argument, to return them as list, array.array or numpy.ndarray.
+# The value is the default for that keyword argument.
+functions_array_type = {
+    'FetchWaveform':                { 'parameters': { 3: { 'array_type': 'list', }, }, },
+    'ReadWaveform':                 { 'parameters': { 4: { 'array_type': 'list', }, }, },
+}
+
+# Session methods implemented in Python, with no C function behind them. 'python_implementation' names the
+# function, in a module from python_implementation/, that the Session method calls.
+python_only_functions = {
+    'Stream': {
+        'codegen_method': 'public',
+        'python_implementation': '_streaming.stream',
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'Identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'channels',
+                'type': 'ViString',
+                'documentation': {
+                    'description': 'Comma-separated list, or Python list, of the channels to fetch. Each entry must name a single channel.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'chunkSize',
+                'type': 'ViInt32',
+                'documentation': {
+                    'description': 'Maximum number of samples to fetch per channel in each chunk.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'recordNumber',
+                'type': 'ViInt32',
+                'default_value': 0,
+                'documentation': {
+                    'description': 'Zero-based index of the first record to fetch.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'numRecords',
+                'type': 'ViInt32',
+                'default_value': -1,
+                'documentation': {
+                    'description': 'Number of records to fetch. Use -1 to fetch all records from **record_number** to the last configured record.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'Timeout',
+                'type': 'ViReal64',
+                'default_value': 5.0,
+                'documentation': {
+                    'description': 'Maximum time, in seconds, to wait for the samples of each chunk to be acquired.',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+Generator that fetches an acquisition while it is still in progress, one chunk of each record at a time.
+
+Each item is a StreamChunk named tuple of (record_number, offset, waveforms), where **offset** is the
+index of the first sample of the chunk within the record and **waveforms** has one ctypes array of
+visatype.ViReal64 per channel, in the order of **channels**. Use numpy.frombuffer() to wrap a waveform
+without copying it.
+
+Chunks are fetched into two sets of buffers allocated once, and used in turn, so a chunk stays valid
+until the next one is requested. Copy the data to keep it longer.
+
+The generator waits for each chunk by polling points_done, so it keeps up with acquisitions that
+don't fit in onboard memory (allow_more_records_than_memory set to True), as long as the data is
+fetched faster than the digitizer overwrites it.
+''',
+            'note': '''
+This method sets fetch_relative_to, fetch_offset, fetch_record_number and fetch_num_records.
+''',
+        },
+    },
+    'FetchRecords': {
+        'codegen_method': 'public',
+        'python_implementation': '_fetching.fetch_records',
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'Identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'channelList',
+                'type': 'ViChar[]',
+                'documentation': {
+                    'description': 'The channels to fetch. By default, all enabled channels are fetched.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'numSamples',
+                'type': 'ViInt32',
+                'default_value': -1,
+                'documentation': {
+                    'description': 'Number of samples to fetch for each record. Use -1 to fetch horz_record_length samples.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'recordNumber',
+                'type': 'ViInt32',
+                'default_value': 0,
+                'documentation': {
+                    'description': 'Zero-based index of the first record to fetch.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'numRecords',
+                'type': 'ViInt32',
+                'default_value': -1,
+                'documentation': {
+                    'description': 'Number of records to fetch. Use -1 to fetch all records from **record_number** to the last configured record.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'Timeout',
+                'type': 'ViReal64',
+                'default_value': 5.0,
+                'documentation': {
+                    'description': 'The time to wait in seconds for data to be acquired; using 0 fetches whatever is currently available. Using -1 implies infinite timeout.',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+Fetches a range of records of every channel with a single call into the driver.
+
+Returns a tuple of (waveforms, wfm_info):
+
+-  **waveforms** is a C-contiguous numpy.ndarray of numpy.float64 with shape (channels, records, samples)
+-  **wfm_info** is a numpy structured array with shape (channels, records) and fields absolute_initial_x,
+   relative_initial_x, x_increment, actual_samples, offset and gain, for each waveform in **waveforms**
+
+Samples past actual_samples in a record are not valid.
+''',
+            'note': '''
+This method requires numpy. It sets fetch_record_number and fetch_num_records. The samples of each record
+are fetched from fetch_offset, relative to fetch_relative_to, which it leaves as they are.
+''',
+        },
+    },
+    'FetchRecordsBinary': {
+        'codegen_method': 'public',
+        'python_implementation': '_fetching.fetch_records_binary',
+        'returns': 'ViStatus',
+        'parameters': [
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'vi',
+                'type': 'ViSession',
+                'documentation': {
+                    'description': 'Identifies a particular instrument session.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'channelList',
+                'type': 'ViChar[]',
+                'documentation': {
+                    'description': 'The channels to fetch. By default, all enabled channels are fetched.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'numSamples',
+                'type': 'ViInt32',
+                'default_value': -1,
+                'documentation': {
+                    'description': 'Number of samples to fetch for each record. Use -1 to fetch horz_record_length samples.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'recordNumber',
+                'type': 'ViInt32',
+                'default_value': 0,
+                'documentation': {
+                    'description': 'Zero-based index of the first record to fetch.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'numRecords',
+                'type': 'ViInt32',
+                'default_value': -1,
+                'documentation': {
+                    'description': 'Number of records to fetch. Use -1 to fetch all records from **record_number** to the last configured record.',
+                },
+            },
+            {
+                'direction': 'in',
+                'enum': None,
+                'name': 'Timeout',
+                'type': 'ViReal64',
+                'default_value': 5.0,
+                'documentation': {
+                    'description': 'The time to wait in seconds for data to be acquired; using 0 fetches whatever is currently available. Using -1 implies infinite timeout.',
+                },
+            },
+        ],
+        'documentation': {
+            'description': '''
+Same as fetch_records(), but fetches the raw, unscaled samples with the binary fetch function that matches
+binary_sample_width, so the samples take 1, 2 or 4 bytes each instead of 8.
+
+Returns a BinaryWaveforms object with:
+
+-  **samples**: C-contiguous numpy.ndarray of numpy.int8, numpy.int16 or numpy.int32 with shape
+   (channels, records, samples). Use samples.tofile() to write them to disk at their native width.
+-  **wfm_info**: numpy structured array with shape (channels, records), as returned by fetch_records()
+-  **scaled**: view of **samples** in volts (voltage = sample × gain + offset). Nothing is converted until
+   it is indexed, and then only the selected samples are, i.e. waveforms.scaled[0, 10, :1000]
+''',
+            'note': '''
+This method requires numpy. It sets fetch_record_number and fetch_num_records. The samples of each record
+are fetched from fetch_offset, relative to fetch_relative_to, which it leaves as they are.
+''',
+        },
+    },
 }
 
 # These are functions we mark as "error_handling":True. The generator uses this information to
@@ -8,6 +8,15 @@ MODULE_FILES_TO_COPY := $(DEFAULT_PY_FILES_TO_COPY)
 
 RST_FILES_TO_GENERATE := $(DEFAULT_RST_FILES_TO_GENERATE)
 
+# Add custom types to copy
+CUSTOM_TYPES_TO_COPY += \
+    waveform_info.py \
+
+# Add Session methods implemented in Python to copy
+PYTHON_IMPLEMENTATION_TO_COPY += \
+    _fetching.py \
+    _streaming.py \
+
 
 include $(BUILD_HELPER_DIR)/rules.mak
 
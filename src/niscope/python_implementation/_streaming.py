@@ -0,0 +1,67 @@
+'''Continuous fetching of an acquisition that is still in progress, one chunk of each record at a time.'''
+
+import collections
+import time
+
+from niscope import _converters
+from niscope import enums
+from niscope import errors
+from niscope import visatype
+
+
+# IVI_ERROR_MAX_TIME_EXCEEDED, the same error the driver returns when a fetch times out
+_MAX_TIME_EXCEEDED = -1074126845
+
+# Seconds to wait between polls of points_done
+_POLL_INTERVAL = 0.001
+
+StreamChunk = collections.namedtuple('StreamChunk', ['record_number', 'offset', 'waveforms'])
+
+
+def _get_channel_names(channels):
+    if isinstance(channels, (list, tuple)):
+        return [str(c) for c in channels]
+    return [c.strip() for c in channels.split(',') if len(c.strip()) > 0]
+
+
+def _wait_for_points(session, points, timeout):
+    '''Waits until the digitizer has acquired points samples from the current fetch position'''
+    deadline = time.time() + timeout
+    while session.points_done < points:
+        if time.time() > deadline:
+            raise errors.Error(_MAX_TIME_EXCEEDED, 'Maximum time exceeded before the operation completed.')
+        time.sleep(_POLL_INTERVAL)
+
+
+def stream(session, channels, chunk_size, record_number=0, num_records=-1, timeout=5.0):
+    '''Generator behind niscope.Session.stream(). See the Session method for documentation.'''
+    channel_names = _get_channel_names(channels)
+    if len(channel_names) == 0:
+        raise ValueError('channels must name at least one channel')
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be greater than 0, not {0}'.format(chunk_size))
+
+    record_length = session.horz_record_length
+    if num_records == -1:
+        num_records = session.horz_num_records - record_number
+
+    # Two sets of buffers: the driver fills one while the caller is still looking at the other
+    buffers = [[(visatype.ViReal64 * chunk_size)() for _ in channel_names] for _ in range(2)]
+    current = 0
+
+    # Fetch each record on its own, from an explicit offset, so every channel is fetched from the same position
+    session.fetch_relative_to = enums.FetchRelativeTo.START
+    session.fetch_num_records = 1
+    for record in range(record_number, record_number + num_records):
+        session.fetch_record_number = record
+        offset = 0
+        while offset < record_length:
+            points = min(chunk_size, record_length - offset)
+            session.fetch_offset = offset
+            _wait_for_points(session, points, timeout)
+            waveforms = [_converters.get_ctypes_array_head(buffer, points) for buffer in buffers[current]]
+            for channel, waveform in zip(channel_names, waveforms):
+                session.fetch_waveform_into(channel, waveform)
+            yield StreamChunk(record, offset, waveforms)
+            offset += points
+            current = 1 - current
@@ -12,3 +12,13 @@ def session():
 def test_load_session(session):
     pass
 
+
+def test_fetch_records_binary_scaled_with_numpy_indices(session):
+    numpy = pytest.importorskip('numpy')
+    session.horz_record_length = 100
+    session.horz_num_records = 2
+    with session.initiate():
+        waveforms = session.fetch_records_binary()
+    channel, record, sample = numpy.int64(1), numpy.int64(1), numpy.int32(10)
+    assert numpy.array_equal(waveforms.scaled[channel, record], waveforms.scaled[1, 1])
+    assert waveforms.scaled[channel, record, sample] == waveforms.scaled[1, 1, 10]
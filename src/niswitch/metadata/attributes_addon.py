@@ -24,4 +24,10 @@ attributes_codegen_method = {
     1150001: { "codegen_method": "no" },  # SERIAL_NUMBER_I32
 }
 
-
+# Attributes whose value changes without the application setting it, i.e. status. They are never cached.
+attributes_volatile = {
+    1250002: { "volatile": True },  # IS_DEBOUNCED
+    1250024: { "volatile": True },  # IS_SCANNING
+    1150004: { "volatile": True },  # IS_WAITING_FOR_TRIG
+    1150019: { "volatile": True },  # TEMPERATURE
+}
@@ -0,0 +1,62 @@
+# !python
+
+import argparse
+import importlib
+import os
+import sys
+import timeit
+
+# Benchmarks run against the code-generated modules without requiring them to be installed
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'generated'))
+
+
+# For each driver: how to open a session, and a property to set
+_PROPERTIES = {
+    'nidcpower': (lambda nidcpower: nidcpower.Session('dev'), 'voltage_level', 1.0),
+    'nidmm': (lambda nidmm: nidmm.Session('dev'), 'range', 10.0),
+    'nifake': (lambda nifake: nifake.Session('dev'), 'read_write_double', 1.0),
+    'nifgen': (lambda nifgen: nifgen.Session('dev'), 'func_amplitude', 1.0),
+    'niscope': (lambda niscope: niscope.Session('dev', False, False, ''), 'horz_record_length', 1000),
+    'niswitch': (lambda niswitch: niswitch.Session('dev'), 'settling_time', 0.01),
+}
+
+
+def _dir_guarded_setattr(self, key, value):
+    '''Reference implementation of Session.__setattr__, as it was before the names were precomputed'''
+    if self._is_frozen and key not in dir(self):
+        raise AttributeError("'{0}' object has no attribute '{1}'".format(type(self).__name__, key))
+    object.__setattr__(self, key, value)
+
+
+def _sets_per_second(session, name, value, number):
+    seconds = min(timeit.repeat(lambda: setattr(session, name, value), number=number, repeat=3))
+    return number / seconds
+
+
+def main():
+    usage = """
+Measures how many times per second a property can be set on a session of each driver, against the simulated driver
+runtime. 'dir() guard' is the same session with the __setattr__ that called dir() on every set.
+"""
+    parser = argparse.ArgumentParser(description=usage)
+    parser.add_argument("--driver", action="append", dest="drivers", choices=sorted(_PROPERTIES), help="Driver to benchmark. Can be repeated. Default: all")
+    parser.add_argument("--number", action="store", dest="number", type=int, default=20000, help="Number of sets per measurement")
+    args = parser.parse_args()
+
+    print('{0:<12}{1:<24}{2:>12}{3:>16}{4:>10}'.format('driver', 'property', 'sets/s', 'dir() guard', 'speedup'))
+    for driver in args.drivers or sorted(_PROPERTIES):
+        module = importlib.import_module(driver)
+        simulator = importlib.import_module(driver + '.simulator')
+        module.library_singleton.set_backend(simulator.Simulator())
+        open_session, name, value = _PROPERTIES[driver]
+        with open_session(module) as session:
+            sets_per_second = _sets_per_second(session, name, value, args.number)
+            # Swap the class of the session for a subclass with the reference __setattr__
+            session.__class__ = type('DirGuardedSession', (type(session),), {'__setattr__': _dir_guarded_setattr})
+            reference = _sets_per_second(session, name, value, args.number)
+            session.__class__ = module.Session
+        print('{0:<12}{1:<24}{2:>12.0f}{3:>16.0f}{4:>9.1f}x'.format(driver, name, sets_per_second, reference, sets_per_second / reference))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+# !python
+
+import argparse
+import importlib
+import os
+import sys
+import timeit
+
+_GENERATED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'generated')
+
+# Methods of NI-FAKE that marshal scalar parameters in different ways
+_CALLS = [
+    ('simple_function()', lambda session: session.simple_function()),
+    ('one_input_function(1)', lambda session: session.one_input_function(1)),
+    ('get_a_number()', lambda session: session.get_a_number()),
+    ('read(1)', lambda session: session.read(1)),
+    ('get_enum_value()', lambda session: session.get_enum_value()),
+    ("['0'].read_write_integer", lambda session: session['0'].read_write_integer),
+]
+
+
+def _microseconds_per_call(session, call, number):
+    seconds = min(timeit.repeat(lambda: call(session), number=number, repeat=5))
+    return seconds / number * 1e6
+
+
+def main():
+    usage = """
+Measures the time of each NI-FAKE method call against the simulated driver runtime, i.e. the Python overhead of a call.
+Run it with --generated-dir pointing to another copy of the generated modules to compare.
+"""
+    parser = argparse.ArgumentParser(description=usage)
+    parser.add_argument("--generated-dir", action="store", dest="generated_dir", default=_GENERATED_DIR, help="Directory of the driver packages")
+    parser.add_argument("--number", action="store", dest="number", type=int, default=20000, help="Number of calls per measurement")
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.generated_dir)
+    nifake = importlib.import_module('nifake')
+    simulator = importlib.import_module('nifake.simulator')
+    nifake.library_singleton.set_backend(simulator.Simulator())
+
+    print('{0:<28}{1:>14}'.format('call', 'us per call'))
+    with nifake.Session('dev') as session:
+        for name, call in _CALLS:
+            print('{0:<28}{1:>14.2f}'.format(name, _microseconds_per_call(session, call, args.number)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+# !python
+
+import argparse
+import os
+import subprocess
+import sys
+
+_GENERATED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'generated')
+
+_DRIVERS = ['nidcpower', 'nidmm', 'nifgen', 'nimodinst', 'niscope', 'niswitch']
+
+# Each measurement runs in a new interpreter, so that nothing is imported yet
+_MEASURE = '''
+import sys
+import time
+clock = getattr(time, 'perf_counter', time.time)
+start = clock()
+import {driver}
+imported = clock()
+{driver}.Session
+print(imported - start, clock() - start, len([m for m in sys.modules if m.startswith('{driver}')]))
+'''
+
+
+def _measure(driver, generated_dir, repeat):
+    results = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', _MEASURE.format(driver=driver)], cwd=generated_dir)
+        import_time, session_time, modules = output.split()
+        results.append((float(import_time), float(session_time), int(modules)))
+    # The fastest run is the one least disturbed by the rest of the system
+    return min(results)
+
+
+def main():
+    usage = """
+Measures the time to import each driver package, and to import it and get Session, in a new interpreter each time.
+Run it against modules generated with 'make NO_DOCSTRINGS=1' to compare.
+"""
+    parser = argparse.ArgumentParser(description=usage)
+    parser.add_argument("--driver", action="append", dest="drivers", choices=_DRIVERS, help="Driver to benchmark. Can be repeated. Default: all")
+    parser.add_argument("--generated-dir", action="store", dest="generated_dir", default=_GENERATED_DIR, help="Directory of the driver packages")
+    parser.add_argument("--repeat", action="store", dest="repeat", type=int, default=10, help="Number of measurements of each driver")
+    args = parser.parse_args()
+
+    print('{0:<12}{1:>14}{2:>10}{3:>22}'.format('driver', 'import (ms)', 'modules', 'import + Session (ms)'))
+    for driver in args.drivers or _DRIVERS:
+        import_time, session_time, modules = _measure(driver, args.generated_dir, args.repeat)
+        print('{0:<12}{1:>14.2f}{2:>10}{3:>22.2f}'.format(driver, import_time * 1000, modules, session_time * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+# !python
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+# Benchmarks run against the code-generated modules without requiring them to be installed
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'generated'))
+
+import nifake  # noqa: E402
+from nifake import library  # noqa: E402
+
+
+# Python 2.7 has no perf_counter
+_clock = getattr(time, 'perf_counter', time.time)
+
+
+class _FakeCFunc(object):
+    '''Stands in for a ctypes function pointer. Sleeping releases the GIL like a real driver call does.'''
+
+    def __init__(self, latency):
+        self.argtypes = None
+        self.restype = None
+        self._latency = latency
+
+    def __call__(self, *args):
+        if self._latency > 0:
+            time.sleep(self._latency)
+        return 0
+
+
+class _FakeCtypesLibrary(object):
+    '''Stands in for ctypes.CDLL.'''
+
+    def __init__(self, latency):
+        self._latency = latency
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return _FakeCFunc(self._latency)
+
+
+class _LockedLibrary(library.Library):
+    '''Reference implementation that takes the lock on every call, as library.Library used to.'''
+
+    def niFake_SimpleFunction(self, vi):  # noqa: N802
+        with self._func_lock:
+            if self.niFake_SimpleFunction_cfunc is None:
+                self.niFake_SimpleFunction_cfunc = self._library.niFake_SimpleFunction
+                self.niFake_SimpleFunction_cfunc.argtypes = [nifake.visatype.ViSession]
+                self.niFake_SimpleFunction_cfunc.restype = nifake.visatype.ViStatus
+        return self.niFake_SimpleFunction_cfunc(vi)
+
+
+def _calls_per_second(lib, number_of_threads, duration):
+    vi_ctype = nifake.visatype.ViSession(1)
+    counts = [0] * number_of_threads
+    start = threading.Event()
+    stop = threading.Event()
+
+    def worker(index):
+        start.wait()
+        count = 0
+        while not stop.is_set():
+            lib.niFake_SimpleFunction(vi_ctype)
+            count += 1
+        counts[index] = count
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(number_of_threads)]
+    for t in threads:
+        t.start()
+    start_time = _clock()
+    start.set()
+    time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    return sum(counts) / (_clock() - start_time)
+
+
+def main():
+    usage = """
+Measures library.Library call throughput (calls/sec) against NI-FAKE as the number of threads increases.
+"""
+    parser = argparse.ArgumentParser(description=usage)
+    parser.add_argument("--threads", action="store", dest="threads", default='1,2,4,8,16', help="Comma-separated list of thread counts")
+    parser.add_argument("--duration", action="store", dest="duration", type=float, default=1.0, help="Seconds to run each configuration")
+    parser.add_argument("--latency-us", action="store", dest="latency_us", type=float, default=50.0, help="Simulated time spent inside the driver, in microseconds")
+    args = parser.parse_args()
+
+    latency = args.latency_us / 1e6
+    print('{0:>8} {1:>16} {2:>16}'.format('threads', 'locked calls/s', 'lock-free calls/s'))
+    for number_of_threads in [int(t) for t in args.threads.split(',')]:
+        locked = _calls_per_second(_LockedLibrary(_FakeCtypesLibrary(latency)), number_of_threads, args.duration)
+        lock_free = _calls_per_second(library.Library(_FakeCtypesLibrary(latency)), number_of_threads, args.duration)
+        print('{0:>8} {1:>16.0f} {2:>16.0f}'.format(number_of_threads, locked, lock_free))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+# !python
+
+import argparse
+import importlib
+import os
+import sys
+import threading
+import time
+
+# Benchmarks run against the code-generated modules without requiring them to be installed
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'generated'))
+
+
+# Python 2.7 has no perf_counter
+_clock = getattr(time, 'perf_counter', time.time)
+
+_CHANNELS = [str(i) for i in range(64)]
+
+# For each driver: how to open a session, and the operations to measure
+_OPERATIONS = {
+    'nidcpower': (
+        lambda nidcpower: nidcpower.Session('dev'),
+        [
+            ('attribute set', lambda session: setattr(session, 'voltage_level', 1.0)),
+            ('channel attribute set', lambda session: setattr(session['0'], 'voltage_level', 1.0)),
+            ('64 channels attribute set', lambda session: [setattr(session[c], 'voltage_level', 1.0) for c in _CHANNELS]),
+        ],
+    ),
+    'nidmm': (
+        lambda nidmm: nidmm.Session('dev'),
+        [
+            ('attribute get', lambda session: session.range),
+            ('attribute set', lambda session: setattr(session, 'range', 10.0)),
+            ('read', lambda session: session.read()),
+            ('read_multi_point(1000)', lambda session: session.read_multi_point(1000)),
+            ('read_multi_point(1000, numpy)', lambda session: session.read_multi_point(1000, array_type='numpy')),
+        ],
+    ),
+    'niscope': (
+        lambda niscope: niscope.Session('dev', False, False, ''),
+        [
+            ('attribute get', lambda session: session.horz_record_length),
+            ('attribute set', lambda session: setattr(session, 'horz_record_length', 1000)),
+            ('fetch_waveform(1000)', lambda session: session.fetch_waveform('0', 1000)),
+            ('fetch_waveform(1000, numpy)', lambda session: session.fetch_waveform('0', 1000, array_type='numpy')),
+            ('fetch_records()', lambda session: session.fetch_records()),
+        ],
+    ),
+}
+
+
+def _operations_per_second(session, operation, number_of_threads, duration):
+    counts = [0] * number_of_threads
+    start = threading.Event()
+    stop = threading.Event()
+
+    def worker(index):
+        start.wait()
+        count = 0
+        while not stop.is_set():
+            operation(session)
+            count += 1
+        counts[index] = count
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(number_of_threads)]
+    for t in threads:
+        t.start()
+    start_time = _clock()
+    start.set()
+    time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    return sum(counts) / (_clock() - start_time)
+
+
+def main():
+    usage = """
+Measures the throughput (operations/sec) of Session methods against the simulated driver runtime, as the number of threads increases.
+With no latency, this is the overhead of the Python API.
+"""
+    parser = argparse.ArgumentParser(description=usage)
+    parser.add_argument("--driver", action="store", dest="driver", default='nidmm', choices=sorted(_OPERATIONS), help="Driver to benchmark")
+    parser.add_argument("--threads", action="store", dest="threads", default='1,2,4', help="Comma-separated list of thread counts")
+    parser.add_argument("--duration", action="store", dest="duration", type=float, default=1.0, help="Seconds to run each configuration")
+    parser.add_argument("--latency-us", action="store", dest="latency_us", type=float, default=0.0, help="Simulated time spent inside the driver, in microseconds")
+    args = parser.parse_args()
+
+    module = importlib.import_module(args.driver)
+    simulator = importlib.import_module(args.driver + '.simulator')
+    module.library_singleton.set_backend(simulator.Simulator(latency=args.latency_us / 1e6))
+    open_session, operations = _OPERATIONS[args.driver]
+    thread_counts = [int(t) for t in args.threads.split(',')]
+
+    with open_session(module) as session:
+        print('{0:<32}'.format('operations/s') + ''.join(['{0:>12}'.format('{0} threads'.format(n)) for n in thread_counts]))
+        for name, operation in operations:
+            results = [_operations_per_second(session, operation, n, args.duration) for n in thread_counts]
+            print('{0:<32}'.format(name) + ''.join(['{0:>12.0f}'.format(r) for r in results]))
+
+
+if __name__ == '__main__':
+    main()